@@ -4,7 +4,7 @@ from setuptools import setup, find_packages
 with open("README.md") as readme_file:
     readme = readme_file.read()
 
-requirements = ["sympy", "pycosat", "nltk", "pyphen"]
+requirements = ["sympy", "pycosat", "nltk", "pyphen", "numpy"]
 
 setup_requirements = [
     "pytest-runner",
@@ -40,6 +40,7 @@ setup(
     license="MIT license",
     long_description=readme,
     include_package_data=True,
+    package_data={"tomriddle": ["data/*.frag"]},
     keywords="tomriddle",
     name="tomriddle",
     packages=find_packages(include=["tomriddle", "tomriddle.*"]),
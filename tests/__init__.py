@@ -1 +1,8 @@
 """Unit test package for tomriddle."""
+
+from collections import Counter
+
+from tomriddle import Fragments
+
+# toy fragments over a, b and c, with counts to rank riddles by
+TOY = Fragments(Counter(ab=5, ba=1, bc=3), Counter(), (Counter(), Counter()))
@@ -0,0 +1,56 @@
+import asyncio
+from itertools import permutations
+
+import pytest
+
+from tomriddle import ariddler, riddler
+
+from tests import TOY
+
+
+async def _collect(agen, limit=None):
+    got = []
+    async for riddle in agen:
+        got.append(riddle)
+        if len(got) == limit:
+            break
+    return got
+
+
+def test_same_as_riddler():
+
+    got = asyncio.run(_collect(ariddler("aabbc", TOY, prefetch=2)))
+    assert got == list(riddler("aabbc", TOY))
+
+    got = asyncio.run(_collect(ariddler("hello", None, engine="search")))
+    assert got == sorted(set(map("".join, permutations("hello"))))
+
+
+def test_stop_early():
+
+    got = asyncio.run(_collect(ariddler("abcdefghijklmnop", None), limit=3))
+    assert len(got) == 3
+
+
+def test_errors():
+
+    with pytest.raises(ValueError):
+        asyncio.run(_collect(ariddler("abc", None, engine="magic")))
+
+
+def test_timeout():
+
+    # nothing's that fast
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_collect(ariddler("abcdefghijklmnop", None, timeout=0)))
+
+
+def test_concurrent():
+    async def both():
+        return await asyncio.gather(
+            _collect(ariddler("abc", None)), _collect(ariddler("ab", None))
+        )
+
+    three, two = asyncio.run(both())
+    assert sorted(three) == sorted(map("".join, permutations("abc")))
+    assert sorted(two) == ["ab", "ba"]
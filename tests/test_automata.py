@@ -0,0 +1,42 @@
+from collections import Counter
+
+from tomriddle import Fragments
+from tomriddle.automata import clusters, ngrams, ngram_counts
+
+
+def accepts(automaton, string):
+    state = automaton.start
+    for char in string:
+        state = automaton.transitions.get((state, char))
+        if state is None:
+            return False
+    return state in automaton.accepting
+
+
+def test_clusters():
+
+    a = clusters(max_consonants=2, max_vowels=1)
+    assert accepts(a, "tomriddle") is False  # ddl
+    assert accepts(a, "tomrid")
+    assert accepts(a, "baba")
+    assert not accepts(a, "baab")
+    assert not accepts(a, "b4")
+
+
+def test_ngrams():
+
+    f = Fragments(Counter(ab=2, ba=1), Counter(), (Counter(), Counter(bb=1)))
+    assert ngram_counts(f) == Counter(ab=2, ba=1, bb=1)
+
+    a = ngrams(f)
+    assert accepts(a, "abba")
+    assert accepts(a, "")
+    assert not accepts(a, "aab")
+
+    a = ngrams(f, min_count=2)
+    assert accepts(a, "ab")
+    assert not accepts(a, "aba")
+
+    a = ngrams(f, n=3)
+    assert accepts(a, "aa")  # nothing to check yet
+    assert not accepts(a, "aba")
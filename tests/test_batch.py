@@ -0,0 +1,80 @@
+import io
+import json
+
+from tomriddle.batch import read_requests, solve, run, DEFAULTS
+from tomriddle.cli import tomriddle
+
+from tests import TOY
+
+
+def test_read_requests():
+
+    lines = io.StringIO('hello\n\n{"answer": "abc", "limit": 2, "id": 3}\n')
+    assert list(read_requests(lines)) == [
+        {"answer": "hello"},
+        {"answer": "abc", "limit": 2, "id": 3},
+    ]
+
+
+def test_bad_line():
+
+    lines = 'aabbc\n{"answer": "abab",\nbc\n'
+    requests = list(read_requests(io.StringIO(lines)))
+    assert requests[1]["line"] == 2
+    assert "bad json" in requests[1]["error"]
+
+    # the rest of the batch still gets done
+    out = io.StringIO()
+    assert 3 == run(io.StringIO(lines), out, TOY, DEFAULTS)
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["answer"] for r in results] == ["aabbc", None, "bc"]
+    assert results[1]["line"] == 2
+    assert results[1]["riddles"] == []
+    assert results[2]["riddles"] == ["bc"]
+
+
+def test_solve():
+
+    result = solve({"answer": "aabbc", "id": "x"}, TOY)
+    assert result["id"] == "x"
+    assert sorted(result["riddles"]) == ["ababc", "abcab", "abcba", "baabc", "bcaba"]
+    assert result["stopped"] is None
+
+    result = solve({"answer": "aabbc", "limit": 2}, TOY)
+    assert len(result["riddles"]) == 2
+    assert result["stopped"] == "limit"
+
+    result = solve({"answer": "aabbc", "deadline": 0}, TOY)
+    assert result["riddles"] == []
+    assert result["stopped"] == "deadline"
+
+    result = solve({"answer": "abc", "engine": "magic"}, TOY)
+    assert "ValueError" in result["error"]
+
+
+def test_run():
+
+    lines = "aabbc\n" + json.dumps({"answer": "abab", "constraints": ["bb"]}) + "\n"
+    out = io.StringIO()
+    assert 2 == run(io.StringIO(lines), out, TOY, DEFAULTS)
+
+    results = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert [r["answer"] for r in results] == ["aabbc", "abab"]
+    assert results[1]["riddles"] == ["abba"]
+
+    # same thing from a pool of workers, in the same order
+    out2 = io.StringIO()
+    run(io.StringIO(lines * 3), out2, TOY, DEFAULTS, workers=2, chunk=1)
+    results2 = [json.loads(line) for line in out2.getvalue().splitlines()]
+    assert [r["riddles"] for r in results2] == [r["riddles"] for r in results] * 3
+
+
+def test_cli():
+
+    args = tomriddle(args=["batch", "answers.txt", "-n", "3", "-j", "0"], dry=True)
+    assert args.file == "answers.txt"
+    assert args.limit == 3
+    assert args.workers == 0
+
+    args = tomriddle(args=["batch"], dry=True)
+    assert args.file is None
@@ -0,0 +1,130 @@
+import threading
+import time
+from itertools import permutations
+
+from tomriddle import riddler, Fragments
+from tomriddle.budget import Budget, LITERAL_BYTES
+
+
+def test_budget():
+
+    budget = Budget(solutions=2, memory=10 * LITERAL_BYTES)
+    assert not budget.clocked
+    assert budget.remaining() is None
+
+    budget.spend_solution()
+    assert not budget.exhausted()
+    budget.spend_memory(11)
+    assert budget.exhausted()
+    assert budget.reason == "memory"
+
+    # the first reason sticks
+    budget.spend_solution()
+    assert budget.reason == "memory"
+
+    assert budget.start().reason is None
+    assert Budget(solutions=0).reason == "limit"
+
+
+def test_clocks():
+
+    budget = Budget(deadline=10, timeout=0.05)
+    assert budget.clocked
+    assert 0 < budget.remaining() <= 0.05
+
+    time.sleep(0.06)
+    assert budget.exhausted()
+    assert budget.reason == "timeout"
+
+    budget = Budget(deadline=0)
+    assert budget.exhausted()
+    assert budget.reason == "deadline"
+
+
+def test_cancel():
+
+    cancel = threading.Event()
+    budget = Budget(cancel=cancel)
+    assert not budget.exhausted()
+    cancel.set()
+    assert budget.exhausted()
+    assert budget.reason == "cancelled"
+
+
+def test_riddler_limit():
+
+    for engine in ["sat", "search"]:
+        budget = Budget(solutions=3)
+        assert len(list(riddler("hello", None, engine=engine, budget=budget))) == 3
+        assert budget.reason == "limit"
+
+    # plenty
+    budget = Budget(solutions=100)
+    assert len(list(riddler("hello", None, budget=budget))) == 60
+    assert budget.reason is None
+
+
+def test_riddler_clocked():
+
+    # with a clock, sat finds the same riddles
+    budget = Budget(deadline=60)
+    got = sorted(riddler("hello", None, budget=budget))
+    assert got == sorted(set(map("".join, permutations("hello"))))
+    assert budget.reason is None
+
+    for engine in ["sat", "search"]:
+        budget = Budget(deadline=0)
+        assert [] == list(riddler("abcdefghijklmnop", None, budget=budget))
+        assert budget.reason == "deadline"
+
+    # a stuck search is cut off: every letter is a fragment, except "p"
+    fragments = Fragments(list("abcdefghijklmno"), [], [])
+    budget = Budget(timeout=0.2)
+    started = time.monotonic()
+    got = list(riddler("abcdefghijklmnop", fragments, engine="search", budget=budget))
+    assert got == []
+    assert budget.reason == "timeout"
+    assert time.monotonic() - started < 5
+
+
+def test_riddler_memory():
+
+    # pycosat blocks each riddle with every variable, see how many that is
+    # (it's counted once the next one is asked for)
+    budget = Budget()
+    riddles = riddler("hello", None, budget=budget)
+    next(riddles), next(riddles)
+    per_riddle = budget.blocking
+    assert per_riddle >= 20  # 4 letters by 5 positions
+
+    budget = Budget(memory=(2 * per_riddle + 1) * LITERAL_BYTES)
+    assert len(list(riddler("hello", None, budget=budget))) == 3
+    assert budget.reason == "memory"
+
+    # a clock doesn't change how they're blocked
+    budget = Budget(deadline=60, memory=(2 * per_riddle + 1) * LITERAL_BYTES)
+    assert len(list(riddler("hello", None, budget=budget))) == 3
+    assert budget.reason == "memory"
+
+
+def test_riddler_clocked_rate():
+
+    # a clock used to mean solving from scratch for every riddle, it
+    # shouldn't cost much more than no clock at all
+    def rate(budget):
+        started = time.monotonic()
+        found = 0
+        for _ in riddler("abcdefg", None, budget=budget):
+            found += 1
+            if time.monotonic() - started > 1:
+                break
+        return found
+
+    assert rate(Budget(deadline=60)) > rate(None) / 3
+
+
+def test_riddler_ranked():
+
+    budget = Budget(solutions=2)
+    assert len(list(riddler("hello", None, ranked=True, budget=budget))) == 2
+    assert budget.reason == "limit"
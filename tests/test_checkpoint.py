@@ -0,0 +1,117 @@
+from itertools import islice, permutations
+
+import pytest
+
+from tomriddle import riddler
+from tomriddle.checkpoint import Checkpoint, digest
+from tomriddle.search import search
+
+everything = sorted(set(map("".join, permutations("hello"))))
+
+
+def test_save_load(tmp_path):
+
+    path = tmp_path / "hello.ckpt"
+    checkpoint = Checkpoint(path).open(digest("hello"), "hello")
+    checkpoint.finish_cube("he")
+    checkpoint.add("hello")
+    checkpoint.add("lehol")
+    checkpoint.save()
+
+    resumed = Checkpoint(path).open(digest("hello"), "hello")
+    assert resumed.cubes == {"he"}
+    assert resumed.riddles == ["hello", "lehol"]
+    assert not resumed.done
+    assert resumed.emitted("helol")
+    assert resumed.emitted("lehol")
+    assert not resumed.emitted("olleh")
+
+    # finishing a cube forgets its riddles
+    resumed.finish_cube("le")
+    assert resumed.riddles == ["hello"]
+    assert resumed.emitted("lehol")
+
+    with pytest.raises(ValueError):
+        Checkpoint(path).open(digest("world"), "world")
+
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        Checkpoint(path).open(digest("hello"), "hello")
+
+
+def test_latest_only(tmp_path):
+
+    path = tmp_path / "hello.ckpt"
+    checkpoint = Checkpoint(path).open(digest("hello"), "hello", latest_only=True)
+    checkpoint.add("ehllo")
+    checkpoint.add("hello")
+    checkpoint.save()
+
+    resumed = Checkpoint(path).open(digest("hello"), "hello", latest_only=True)
+    assert resumed.latest() == "hello"
+    assert resumed.emitted("ehllo")
+    assert not resumed.emitted("holle")
+
+
+def test_search_after():
+
+    assert list(search("hello")) == everything
+    assert (
+        list(search("hello", after="hello"))
+        == everything[everything.index("hello") + 1 :]
+    )
+    assert list(search("hello", after=everything[-1])) == []
+
+
+def resume(path, **kwargs):
+    """Riddles from three goes at it: 10, then 5 and a break, then the rest"""
+
+    first = list(riddler("hello", None, checkpoint=path, limit=10, **kwargs))
+    second = list(islice(riddler("hello", None, checkpoint=path, **kwargs), 5))
+    rest = list(riddler("hello", None, checkpoint=path, **kwargs))
+    return first, second, rest
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(engine="search"),
+        dict(engine="sat"),
+        dict(engine="search", workers=2),
+        dict(engine="sat", workers=2),
+    ],
+)
+def test_riddler_resume(tmp_path, kwargs):
+
+    path = tmp_path / "hello.ckpt"
+    first, second, rest = resume(path, **kwargs)
+    assert len(first) == 10
+    assert len(second) == 5
+    assert sorted(first + second + rest) == everything
+
+    # it's all been said
+    checkpoint = Checkpoint(path)
+    assert list(riddler("hello", None, checkpoint=checkpoint, **kwargs)) == []
+    assert checkpoint.done
+
+
+def test_riddler_resume_ranked(tmp_path):
+
+    path = tmp_path / "hello.ckpt"
+    first = list(islice(riddler("hello", None, top_k=10, checkpoint=path), 4))
+    rest = list(riddler("hello", None, top_k=10, checkpoint=path))
+    assert first + rest == list(riddler("hello", None, top_k=10))
+
+    # a different top_k is a different set of riddles
+    with pytest.raises(ValueError):
+        list(riddler("hello", None, top_k=20, checkpoint=path))
+
+
+def test_riddler_other_riddles(tmp_path):
+
+    path = tmp_path / "hello.ckpt"
+    list(riddler("hello", None, engine="search", checkpoint=path, limit=3))
+    with pytest.raises(ValueError):
+        list(riddler("world", None, engine="search", checkpoint=path))
+    with pytest.raises(ValueError):
+        list(riddler("hello", None, engine="sat", checkpoint=path))
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from tomriddle.cli import tomriddle
 
 
@@ -5,3 +8,71 @@ def test_noconstraints():
     args = tomriddle(args=["foobarbaz", "-s", "baz", "qux"], dry=True)
     assert args.answer == "foobarbaz"
     assert args.substr == ["baz", "qux"]
+    assert args.top is None
+    assert args.engine == "sat"
+
+
+def test_corpus():
+    args = tomriddle(args=["foobarbaz"], dry=True)
+    assert args.corpus is None
+    assert args.min_count == 0
+
+    args = tomriddle(args=["foobarbaz", "--corpus", "hp.txt", "-m", "5"], dry=True)
+    assert args.corpus == "hp.txt"
+    assert args.min_count == 5
+
+
+def test_top():
+    args = tomriddle(args=["foobarbaz", "-k", "5"], dry=True)
+    assert args.top == 5
+    assert args.frontier is None
+
+    args = tomriddle(args=["foobarbaz", "-k", "5", "--frontier", "0"], dry=True)
+    assert args.frontier == 0
+
+
+def test_engine():
+    args = tomriddle(args=["foobarbaz", "-e", "search"], dry=True)
+    assert args.engine == "search"
+
+
+def test_workers():
+    args = tomriddle(args=["foobarbaz", "-j", "4", "-n", "10"], dry=True)
+    assert args.workers == 4
+    assert args.limit == 10
+
+
+def test_solver():
+    args = tomriddle(args=["foobarbaz", "--solver", "kissat -q"], dry=True)
+    assert args.solver == "kissat -q"
+
+
+def test_checkpoint():
+    args = tomriddle(args=["foobarbaz", "-c", "foo.ckpt", "--every", "5"], dry=True)
+    assert args.checkpoint == "foo.ckpt"
+    assert args.every == 5
+
+
+def test_import_budget():
+    """The cli gets run a lot, starting it shouldn't drag in the heavy stuff"""
+
+    heavy = ["sympy", "numpy", "pycosat", "pyphen", "nltk", "IPython"]
+
+    script = "; ".join(
+        [
+            "import sys, time",
+            "before = time.perf_counter()",
+            "import tomriddle.cli",
+            "print(time.perf_counter() - before)",
+            f"print(' '.join(m for m in {heavy!r} if m in sys.modules))",
+        ]
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    duration, loaded = out.stdout.split("\n")[:2]
+
+    assert loaded == ""
+
+    # it's about 40ms on a laptop, this is plenty of slack for a slow CI box
+    assert float(duration) < 1
@@ -1,3 +1,4 @@
+import pytest
 from tomriddle import cnf
 from time import time
 from sympy import symbols
@@ -124,7 +125,7 @@ def test_setproduct_moar():
     }
 
 
-def dnf_equivalence(expr, symbs):
+def dnf_equivalence(expr, symbs, tseitin=False):
 
     mapper = satbridge.SymbolMapper(symbs)
 
@@ -136,7 +137,7 @@ def dnf_equivalence(expr, symbs):
 
     # convert with something I made up
     def experiment(expr):
-        return cnf.from_dnf(expr, mapper)
+        return cnf.from_dnf(expr, mapper, tseitin=tseitin)
 
     def get_solns(func):
 
@@ -147,7 +148,8 @@ def dnf_equivalence(expr, symbs):
         # find solutions
         solutions = []
         for sat_out in itersolve(cnf_clauses):
-            true_only = list(filter(lambda x: x > 0, sat_out))
+            # ignore tseitin's aux variables
+            true_only = list(filter(lambda x: 0 < x <= len(symbs), sat_out))
             if true_only:
                 expr_out = cnf.AND(list(map(mapper.to_symb, true_only)))
                 solutions.append(expr_out)
@@ -203,6 +205,42 @@ def test_dnf_c():
     dnf_equivalence(expr, symbs)
 
 
+def test_dnf_tseitin():
+
+    symbs = symbols("a,b,c,d,e,f,g")
+    a, b, c, d, e, f, g = symbs
+    expr = a | (b & ~c) | (a & c) | (d & ~e & ~f & g) | ~g
+
+    dnf_equivalence(expr, symbs, tseitin=True)
+
+
+def test_dnf_tseitin_is_linear():
+
+    # 12 terms of 3, distributing them would be 3**12 clauses
+    symbs = symbols(" ".join(f"x{i}" for i in range(36)))
+    mapper = satbridge.SymbolMapper(symbs)
+    terms = [[mapper.to_int(s) for s in symbs[i : i + 3]] for i in range(0, 36, 3)]
+
+    sat_in = cnf.from_dnf(terms, mapper=mapper, tseitin=True)
+    assert 12 * 4 + 1 == len(sat_in)
+
+
+@pytest.mark.parametrize("encoding", ["pairwise", "seqcounter", "totalizer", "sortnet"])
+def test_min_n_true_encodings(encoding):
+
+    symbs = symbols("a,b,c,d,e,f,g")
+    for n in range(1, len(symbs) + 1):
+        mapper = satbridge.SymbolMapper(symbs)
+        sat_in = cnf.min_n_true(symbs, n, mapper=mapper, encoding=encoding)
+        solutions = list(itersolve(sat_in))
+
+        expect_num = sum(
+            len(list(combinations(symbs, i))) for i in range(n, len(symbs) + 1)
+        )
+        assert expect_num == len(solutions)
+        assert all(t >= n for t in count_true(solutions, len(symbs)))
+
+
 def test_bcd():
 
     # how many ways for 3 consecurive of these to be true?
@@ -211,13 +249,116 @@ def test_bcd():
     a, b, c, d, e, f, g, h, i, j, k, l, m, n, o, p, q, r, s, t = symbs
 
     straight_expr = (a & b & c) | (b & c & d) | (c & d & e) | (d & e & f) | (g & h & i)
-    straight = cnf.from_dnf(straight_expr, mapper=mapper)
-
     max3 = cnf.max_n_true(symbs, 3, mapper=mapper)
 
-    sat_in = straight + max3
-    solutions = list(itersolve(sat_in))
+    for tseitin in [False, True]:
+        straight = cnf.from_dnf(straight_expr, mapper=mapper, tseitin=tseitin)
+
+        sat_in = straight + max3
+        solutions = list(itersolve(sat_in))
+
+        nofalse = sorted([list(filter(lambda x: 0 < x <= 20, y)) for y in solutions])
+        assert 5 == len(nofalse)
+        print(nofalse)
+
+
+def count_true(solutions, num_vars):
+    """how many of the first num_vars are true in each solution"""
+    return [len([x for x in sol[:num_vars] if x > 0]) for sol in solutions]
+
+
+@pytest.mark.parametrize("encoding", ["pairwise", "seqcounter", "totalizer", "sortnet"])
+def test_max_n_true_encodings(encoding):
+
+    # n == len(symbs) would be no clauses at all, and nothing for pycosat to do
+    symbs = symbols("a,b,c,d,e,f,g")
+    for n in range(len(symbs)):
+        mapper = satbridge.SymbolMapper(symbs)
+        sat_in = cnf.max_n_true(symbs, n, mapper=mapper, encoding=encoding)
+        solutions = list(itersolve(sat_in))
+
+        # aux variables are determined by the inputs, so no repeats
+        expect_num = sum(len(list(combinations(symbs, i))) for i in range(n + 1))
+        assert expect_num == len(solutions)
+        assert all(t <= n for t in count_true(solutions, len(symbs)))
+
+
+@pytest.mark.parametrize("encoding", ["pairwise", "seqcounter", "totalizer", "sortnet"])
+def test_exactly_n_true_encodings(encoding):
+
+    symbs = symbols("a,b,c,d,e,f")
+    for n in range(len(symbs) + 1):
+        mapper = satbridge.SymbolMapper(symbs)
+        sat_in = cnf.exactly_n_true(symbs, n, mapper=mapper, encoding=encoding)
+        solutions = list(itersolve(sat_in))
+
+        assert len(list(combinations(symbs, n))) == len(solutions)
+        assert all(t == n for t in count_true(solutions, len(symbs)))
+
+
+def test_auto_encoding_is_small():
+
+    # riddler's case: at most 16 of 256
+    symbs = symbols(" ".join(f"x{i}" for i in range(256)))
+    mapper = satbridge.SymbolMapper(symbs)
+
+    sat_in = cnf.max_n_true(symbs, 16, mapper=mapper)
+    assert len(sat_in) < 50000
+
+
+def test_ints_need_a_mapper_for_aux():
+
+    with pytest.raises(TypeError):
+        cnf.max_n_true([1, 2, 3, 4], 2, encoding="totalizer")
+
+    # but pairwise doesn't
+    assert [[-1, -2, -3], [-1, -2, -4], [-1, -3, -4], [-2, -3, -4]] == cnf.max_n_true(
+        [1, 2, 3, 4], 2
+    )
+
+
+def test_cover():
+
+    # three positions, each can be a or b
+    grid = [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}]
+    pool = satbridge.VarPool(top=6)
+    onehot = []
+    for cell in grid:
+        onehot.extend(cnf.exactly_n_true(list(cell.values()), 1, mapper=pool))
+
+    sat_in = onehot + cnf.cover(["ab", "bb"], grid, pool)
+    words = []
+    for solution in itersolve(sat_in):
+        true = set(x for x in solution if x > 0)
+        words.append("".join(c for cell in grid for c, v in cell.items() if v in true))
+
+    # ab + bb, and bb + bb (overlapping), once each
+    assert sorted(words) == ["abb", "bbb"]
+
+
+def test_pronounce():
+
+    # no two b's in a row
+    transitions = {("a", "a"): "a", ("a", "b"): "b", ("b", "a"): "a"}
+    automaton = cnf.Automaton("a", {"a", "b"}, transitions)
+
+    grid = [{"a": 1, "b": 2}, {"a": 3, "b": 4}, {"a": 5, "b": 6}]
+    pool = satbridge.VarPool(top=6)
+    onehot = []
+    for cell in grid:
+        onehot.extend(cnf.exactly_n_true(list(cell.values()), 1, mapper=pool))
+
+    sat_in = onehot + cnf.pronounce(automaton, grid, pool)
+    words = []
+    for solution in itersolve(sat_in):
+        true = set(x for x in solution if x > 0)
+        words.append("".join(c for cell in grid for c, v in cell.items() if v in true))
+
+    # each once, the states don't make duplicates
+    assert sorted(words) == ["aaa", "aab", "aba", "baa", "bab"]
 
-    nofalse = sorted([list(filter(lambda x: x > 0, y)) for y in solutions])
-    assert 5 == len(nofalse)
-    print(nofalse)
+    # and must end in "a"
+    automaton = cnf.Automaton("a", {"a"}, transitions)
+    pool = satbridge.VarPool(top=6)
+    sat_in = onehot + cnf.pronounce(automaton, grid, pool)
+    assert len(list(itersolve(sat_in))) == 3
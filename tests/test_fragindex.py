@@ -0,0 +1,35 @@
+from tomriddle.fragindex import FragmentIndex
+from tomriddle.fragments import Fragments, get_default_fragments
+
+
+def test_feasible():
+
+    index = FragmentIndex({"lor": 5, "mort": 9, "moor": 20, "zap": 50, "été": 1})
+
+    # "moor" needs two o's, "zap" a z, "été" letters outside the alphabet
+    assert index.feasible("tomriddle") == ["mort", "lor"]
+    assert index.feasible("iamlordvoldemort") == ["moor", "mort", "lor"]
+
+
+def test_min_count():
+
+    index = FragmentIndex({"lor": 5, "mort": 9, "moor": 20})
+    assert index.feasible("iamlordvoldemort", min_count=9) == ["moor", "mort"]
+
+
+def test_tables_merge():
+
+    f = Fragments(["lor", "ord", "vol"], {"iam": 3, "lor": 3}, (["dem"], []))
+    index = FragmentIndex.from_fragments(f)
+
+    assert len(index) == 5
+    assert index.feasible("iamlor") == ["lor", "iam"]
+
+
+def test_default_fragments():
+
+    index = FragmentIndex.from_fragments(get_default_fragments())
+    found = index.feasible("iamlordvoldemort", min_count=10)
+
+    assert "vol" in found
+    assert all(set(f) <= set("iamlordvoldemort") for f in found)
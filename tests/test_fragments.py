@@ -0,0 +1,148 @@
+import io
+
+from tomriddle import fragments
+from tomriddle.fragments import clean, clean_text, get_fragments_from
+
+TEXT = """
+I am Lord Voldemort!  Is a go-to, and goto is not a word... or is it?
+Tom Marvolo Riddle, être ou ne pas être: c'est la question.
+"""
+
+
+def slow_clean(in_word):
+    return "".join(c.lower() for c in in_word if c.isalpha())
+
+
+def test_clean():
+
+    for word in TEXT.split() + ["", "123", "Ça", "naïve", "DON'T"]:
+        assert clean(word) == slow_clean(word)
+
+
+def test_clean_text():
+
+    expect = [w for w in map(slow_clean, TEXT.split()) if w]
+    assert clean_text(TEXT) == expect
+
+
+def test_gen_twoshort():
+
+    # counts start at one, not two
+    assert fragments.gen_twoshort(["i", "am", "i", "am"]) == {"iam": 2, "ami": 1}
+
+
+def test_gen_startend():
+
+    begins, ends = fragments.gen_startend(["gist", "ants"])
+    assert begins == {"gis": 1, "ant": 1}
+    assert ends == {"ist": 1, "nts": 1}
+
+
+def test_streaming_matches_whole(monkeypatch):
+
+    # tiny chunks, so words and pairs straddle the boundaries
+    monkeypatch.setattr(fragments, "CHUNK_CHARS", 7)
+    words = clean_text(TEXT * 3)
+
+    streamed = get_fragments_from(io.StringIO(TEXT * 3), workers=1)
+
+    assert streamed.syllables == fragments.gen_syllables(words)
+    assert streamed.twoshort == fragments.gen_twoshort(words)
+    assert streamed.startend == fragments.gen_startend(words)
+
+
+def test_parallel_matches_serial():
+
+    chunks = list(fragments._chunked(clean_text(TEXT * 20), 5))
+
+    serial = fragments.count_fragments(chunks, workers=1)
+    parallel = fragments.count_fragments(chunks, workers=2)
+
+    assert serial == parallel
+
+
+def test_gen_syllables_hyphenates_once(monkeypatch):
+
+    calls = []
+    real = fragments._hyphenate.__wrapped__
+
+    def counting(word):
+        calls.append(word)
+        return real(word)
+
+    monkeypatch.setattr(fragments, "_hyphenate", counting)
+
+    words = ["riddle", "the", "the", "the", "riddle"]
+    counts = fragments.gen_syllables(words)
+
+    assert sorted(calls) == ["riddle", "the"]
+    assert counts["the"] == 3
+
+
+def test_hyphenation_cache(tmp_path):
+
+    path = tmp_path / "hyphens.tsv"
+    cache = fragments.HyphenationCache(path)
+    first = fragments.gen_syllables(["voldemort", "riddle"], hyphenation_cache=cache)
+    cache.save()
+
+    # a new cache from the same file knows the words already
+    cache = fragments.HyphenationCache(path)
+    assert set(cache) == {"voldemort", "riddle"}
+
+    # so it's what's used, even if it disagrees with pyphen
+    cache["riddle"] = ("rid", "dle")
+    again = fragments.gen_syllables(["voldemort", "riddle"], hyphenation_cache=cache)
+    assert again["rid"] == 1
+    assert again["vol"] == first["vol"]
+
+
+def test_hyphenation_cache_doesnt_leak(tmp_path):
+
+    cache = fragments.HyphenationCache(tmp_path / "hyphens.tsv")
+    cache["riddle"] = ("rid", "dle")
+    fragments.count_fragments([["riddle"]], workers=1, hyphenation_cache=cache)
+
+    # the next call, without the cache, goes back to pyphen
+    assert fragments._known == {}
+    assert "rid" not in fragments.gen_syllables(["riddle"])
+
+
+def test_parallel_learns_hyphenations(tmp_path):
+
+    chunks = list(fragments._chunked(clean_text(TEXT), 5))
+    cache = fragments.HyphenationCache(tmp_path / "hyphens.tsv")
+
+    fragments.count_fragments(chunks, workers=2, hyphenation_cache=cache)
+    assert "voldemort" in cache
+
+
+def test_update_matches_rebuild():
+
+    first, second = "i am lord volde", "mort is a go to"
+    whole = get_fragments_from(io.StringIO(first + " " + second), workers=1)
+
+    updater = fragments.FragmentUpdater(workers=1)
+    updater.update(io.StringIO(first))
+    updated = updater.update([second])
+
+    # including "am" + "i" style pairs across the batches ("volde" + "mort" isn't)
+    assert updated == whole
+    assert updater.previous == "to"
+
+
+def test_update_fragments_saved(tmp_path):
+
+    old = get_fragments_from(io.StringIO("i am lord voldemort"), workers=1)
+    fragments.save_fragments(old, tmp_path)
+    existing = fragments.get_default_fragments(tmp_path)
+
+    new = fragments.update_fragments(
+        existing, ["is a riddle"], previous="voldemort", workers=1
+    )
+    fragments.save_fragments(new, tmp_path)
+    reloaded = fragments.get_default_fragments(tmp_path)
+
+    assert reloaded.twoshort["isa"] == 1
+    assert reloaded.syllables["vol"] == old.syllables["vol"]
+    assert dict(reloaded.startend[0].items()) == new.startend[0]
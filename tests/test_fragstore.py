@@ -0,0 +1,69 @@
+import pickle
+
+import pytest
+
+from tomriddle import fragstore
+from tomriddle.fragments import get_default_fragments
+
+
+def test_roundtrip(tmp_path):
+
+    counts = {"wump": 3, "wroth": 1, "wynd": 7, "ant": 2, "être": 4}
+    path = tmp_path / "t.frag"
+    fragstore.write_table(path, counts)
+
+    table = fragstore.FragmentTable(path)
+    assert len(table) == len(counts)
+    assert dict(table.items()) == counts
+    assert table["wynd"] == 7
+    assert "wump" in table
+    assert "wum" not in table
+    with pytest.raises(KeyError):
+        table["nope"]
+
+
+def test_prefixed(tmp_path):
+
+    counts = {"wr": 1, "wro": 2, "wroth": 3, "wrong": 4, "wu": 5, "a": 6}
+    path = tmp_path / "t.frag"
+    fragstore.write_table(path, counts)
+
+    table = fragstore.FragmentTable(path)
+    assert list(table.prefixed("wro")) == [("wro", 2), ("wrong", 4), ("wroth", 3)]
+    assert list(table.prefixed("z")) == []
+
+
+def test_empty(tmp_path):
+
+    path = tmp_path / "t.frag"
+    fragstore.write_table(path, {})
+
+    table = fragstore.FragmentTable(path)
+    assert len(table) == 0
+    assert "a" not in table
+
+
+def test_not_a_table(tmp_path):
+
+    path = tmp_path / "t.frag"
+    path.write_bytes(b"{'json': 'maybe'}")
+    with pytest.raises(ValueError):
+        fragstore.FragmentTable(path)
+
+
+def test_pickle_reopens(tmp_path):
+
+    path = tmp_path / "t.frag"
+    fragstore.write_table(path, {"iam": 2})
+
+    table = pickle.loads(pickle.dumps(fragstore.FragmentTable(path)))
+    assert table["iam"] == 2
+
+
+def test_default_fragments():
+
+    syllables, twoshort, (begins, ends) = get_default_fragments()
+    assert syllables["wrong"] > 0
+    assert "iam" in twoshort
+    assert min(twoshort.values()) == 1
+    assert begins["aaro"] > 0
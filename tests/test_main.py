@@ -1,8 +1,13 @@
 import pytest
 from tomriddle import riddler
-from tomriddle import Fragments
+from tomriddle import Fragments, get_default_fragments
+from tomriddle.satbridge import PycosatBackend
 
 from itertools import permutations
+import time
+import tracemalloc
+
+from tests import TOY
 
 
 def test_permute():
@@ -24,6 +29,111 @@ def test_permute():
     assert expect_riddles == got_riddles
 
 
+def test_permute_repeated_letters():
+    """Swapping identical letters shouldn't make a new riddle"""
+
+    answer = "hello"
+
+    expect_riddles = sorted(set(["".join(x) for x in permutations(answer)]))
+    got_riddles = sorted(riddler(answer, None))
+
+    assert expect_riddles == got_riddles
+
+
+def test_fragments_cover():
+
+    f = Fragments(["ab", "ba"], [], [])
+    riddles = sorted(riddler("aabb", f))
+
+    # "aabb" isn't covered: the first a and the last b aren't in a fragment
+    assert riddles == ["abab", "abba", "baab", "baba"]
+
+
+def test_fragments_default():
+
+    f = get_default_fragments()
+    riddle = next(riddler("tommarvoloriddle", f, min_count=5))
+    assert sorted(riddle) == sorted("tommarvoloriddle")
+
+
+def test_substr():
+
+    riddles = sorted(riddler("abcd", None, constraints=["c", "ab"]))
+    assert riddles == ["cabd", "cdab", "dcab"]
+
+
+def test_substr_overlap():
+
+    # "ab" then "ba" needs two b's, sharing one doesn't count
+    assert [] == list(riddler("aba", None, constraints=["ab", "ba"]))
+    assert ["abba"] == list(riddler("abba", None, constraints=["ab", "ba"]))
+
+
+def test_substr_fragments():
+
+    f = Fragments(["ab", "ba"], [], [])
+    riddles = sorted(riddler("aabb", f, constraints=["ba", "ab"]))
+    assert riddles == ["baab"]
+
+
+def test_pronounce():
+
+    from tomriddle.automata import clusters
+
+    riddles = sorted(riddler("abcd", None, pronounce=clusters(max_consonants=2)))
+
+    # "a" is the only vowel, it has to break up bcd
+    expect = sorted("".join(p) for p in permutations("abcd") if p.index("a") in (1, 2))
+    assert riddles == expect
+
+
+def test_ranked():
+
+    # the same riddles as the sat solver finds, but best first
+    riddles = list(riddler("aabbc", TOY, ranked=True))
+    assert sorted(riddles) == sorted(riddler("aabbc", TOY))
+    assert riddles == ["abcab", "abcba", "ababc", "bcaba", "baabc"]
+
+    assert list(riddler("aabbc", TOY, top_k=2)) == riddles[:2]
+    assert list(riddler("aabbc", TOY, top_k=1, constraints=["ba"])) == ["abcba"]
+
+
+def test_ranked_long():
+
+    # the frontier is bounded by default, so a long answer's best riddles
+    # come out quickly, in little memory
+    next(riddler("ab", None, top_k=1))
+    start = time.monotonic()
+    assert next(riddler("iamlordvoldemort", None, top_k=1))
+    assert time.monotonic() - start < 5
+
+    tracemalloc.start()
+    try:
+        assert next(riddler("qwertyuiopasdfgh", None, top_k=1))
+        assert tracemalloc.get_traced_memory()[1] < 20 * 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def test_engines():
+
+    for answer, constraints in [("aabbc", []), ("aabbcc", ["ba"]), ("abcab", ["c"])]:
+        sat = sorted(riddler(answer, TOY, constraints=constraints))
+        search = sorted(riddler(answer, TOY, constraints=constraints, engine="search"))
+        assert sat == search
+
+    with pytest.raises(ValueError):
+        next(riddler("abc", None, engine="magic"))
+
+
+def test_backend():
+
+    backend = PycosatBackend()
+    riddles = sorted(riddler("hello", None, backend=backend))
+    assert riddles == sorted(set(map("".join, permutations("hello"))))
+    assert backend.stats["solutions"] == len(riddles)
+
+
 def test_permute_long():
 
     answer = "iamlo"
@@ -40,7 +150,6 @@ def test_permute_too_long():
     print(riddle)
 
 
-@pytest.mark.skip(reason="functionality not yet implemented")
 def test_voldemort():
 
     f = Fragments(["lor", "ord", "vol", "dem", "mort"], ["iam"], [])
@@ -50,7 +159,7 @@ def test_voldemort():
     assert a in list(riddler(q, f))
 
 
-@pytest.mark.skip(reason="functionality not yet implemented")
+@pytest.mark.skip(reason="works, but enumerates 40320 riddles: a few minutes")
 def test_superfoo():
 
     f = Fragments(
@@ -61,10 +170,10 @@ def test_superfoo():
     q = "aaaabbbeeefinoooprrrsssttuuzz"
     a = "superfooisnotabarbutbazzesare"
 
-    assert a in list(riddler(f, q))
+    assert a in list(riddler(q, f))
 
 
-@pytest.mark.skip(reason="functionality not yet implemented")
+@pytest.mark.skip(reason="works, but enumerates 20160 riddles: a few minutes")
 def test_superfoo_constraint():
 
     f = Fragments(
@@ -75,7 +184,7 @@ def test_superfoo_constraint():
     a2 = "bazzesaresuperfoobutabarisnot"
 
     # must contain "baz" and "foo" in that order
-    answers = list(riddler(f, q), constraint=["baz", "foo"])
+    answers = list(riddler(q, f, constraints=["baz", "foo"]))
     assert a2 in answers
     assert a1 not in answers
 
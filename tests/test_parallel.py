@@ -0,0 +1,56 @@
+from itertools import permutations
+import time
+
+from tomriddle import riddler
+from tomriddle.parallel import prefixes, cubes, CUBES_PER_WORKER
+
+from tests import TOY
+
+
+def test_prefixes():
+
+    assert prefixes("hello", 0) == [""]
+    assert prefixes("hello", 1) == ["e", "h", "l", "o"]
+    assert "ll" in prefixes("hello", 2)
+    assert "ee" not in prefixes("hello", 2)
+
+    # they split up the permutations exactly
+    everything = set(map("".join, permutations("hello")))
+    for depth in range(6):
+        split = [p for p in everything if p[:depth] in prefixes("hello", depth)]
+        assert len(split) == len(everything)
+
+
+def test_cubes():
+
+    assert len(cubes("abcdefgh", 1)) >= CUBES_PER_WORKER
+    assert cubes("ab", 100) == ["ab", "ba"]
+
+
+def test_workers():
+
+    for engine in ["sat", "search"]:
+        serial = list(riddler("aabbcc", TOY, engine=engine))
+        parallel = list(riddler("aabbcc", TOY, engine=engine, workers=2))
+        assert sorted(serial) == sorted(parallel)
+
+
+def test_ordered_limit():
+
+    serial = list(riddler("abcde", None, engine="search", limit=30))
+    parallel = riddler("abcde", None, engine="search", workers=2, ordered=True)
+    assert serial == list(parallel)[:30]
+
+    parallel = riddler("abcde", None, workers=2, ordered=True, limit=30)
+    assert len(list(parallel)) == 30
+
+
+def test_streams():
+
+    # a cube's riddles come out as they're found, and closing early stops
+    # the workers rather than waiting for them
+    start = time.monotonic()
+    riddles = riddler("iamlordvoldemort", None, engine="search", workers=2)
+    assert next(riddles)
+    riddles.close()
+    assert time.monotonic() - start < 5
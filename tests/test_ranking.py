@@ -0,0 +1,76 @@
+from itertools import permutations
+
+from tomriddle.automata import clusters
+from tomriddle.ranking import NgramScorer, ranked
+from tomriddle.search import search
+
+from tests import TOY
+
+
+def test_scorer():
+
+    scorer = NgramScorer(TOY, n=2)
+    assert scorer.score("abc") > scorer.score("acb")
+    assert scorer.score("abc") == scorer("", "a") + scorer("a", "b") + scorer("b", "c")
+
+    # nothing scores better than its bound
+    best = scorer.best("abc")
+    for riddle in map("".join, permutations("abc")):
+        for i, char in enumerate(riddle):
+            assert scorer(riddle[:i], char) <= best[char]
+
+
+def test_ranked_in_order():
+
+    scorer = NgramScorer(TOY, n=2)
+    got = list(ranked("aabbc", scorer, frontier=None))
+
+    riddles = [riddle for riddle, _ in got]
+    assert sorted(riddles) == sorted(set(map("".join, permutations("aabbc"))))
+
+    scores = [score for _, score in got]
+    assert scores == sorted(scores, reverse=True)
+    assert scores == [scorer.score(riddle) for riddle in riddles]
+
+
+def test_ranked_top_k():
+
+    scorer = NgramScorer(TOY, n=2)
+    everything = list(ranked("aabbc", scorer, frontier=None))
+    assert list(ranked("aabbc", scorer, top_k=3)) == everything[:3]
+
+    # a tiny frontier is opt-in, it skips some, but what's left is in order
+    some = list(ranked("aabbc", scorer, frontier=2))
+    assert [s for _, s in some] == sorted([s for _, s in some], reverse=True)
+
+
+def test_ranked_prune():
+
+    scorer = NgramScorer(TOY, n=2)
+    automaton = clusters(max_consonants=1, max_vowels=1)
+    got = [r for r, _ in ranked("abab", scorer, automaton=automaton)]
+    assert sorted(got) == ["abab", "baba"]
+
+    got = [r for r, _ in ranked("abab", scorer, accept=lambda r: r[0] == "a")]
+    assert sorted(got) == ["aabb", "abab", "abba"]
+
+
+def test_ranked_constraints():
+
+    scorer = NgramScorer(TOY, n=2)
+    everything = [r for r, _ in ranked("aabbc", scorer)]
+
+    # same riddles as search, still best first
+    fragments = ["ab", "ba", "bc", "ca"]
+    substrings = ["b", "ca"]
+    got = list(ranked("aabbc", scorer, fragments=fragments))
+    assert 0 < len(got) < len(everything)
+    assert sorted(r for r, _ in got) == sorted(search("aabbc", fragments))
+    assert [s for _, s in got] == sorted([s for _, s in got], reverse=True)
+
+    got = [r for r, _ in ranked("aabbc", scorer, substrings=substrings)]
+    assert sorted(got) == sorted(search("aabbc", substrings=substrings))
+
+    # impossible ones are pruned before they're spelled out
+    assert list(ranked("abcdefghijk", scorer, substrings=["ab", "ba"])) == []
+    assert list(ranked("aabbc", scorer, fragments=["zz"])) == []
@@ -1,6 +1,12 @@
+import io
+import sys
+import time
+
 from tomriddle import satbridge
 from tomriddle import cnf
+from tomriddle.budget import Budget
 from sympy import symbols, Symbol
+import pycosat
 
 
 def test_tofrom_expr():
@@ -85,3 +91,204 @@ def test_to_symb():
     symbs = satbridge.str_to_symb("HELLO")
 
     assert expect == symbs
+
+
+def test_itersolve_projected():
+
+    # a or b, with a loose aux variable c that pycosat would enumerate too
+    clauses = [[1, 2], [-3, 1, 2]]
+    assert 6 == len(list(pycosat.itersolve(clauses)))
+
+    solutions = list(satbridge.itersolve_projected(clauses, [1, 2]))
+    assert sorted(solutions) == [[-1, 2], [1, -2], [1, 2]]
+
+
+def test_itersolve_projected_onehot():
+
+    # exactly one of 1, 2, 3 and a loose aux variable 4
+    symbs = symbols("a,b,c")
+    mapper = satbridge.SymbolMapper(symbs)
+    clauses = cnf.exactly_n_true([1, 2, 3], 1, mapper=mapper) + [[4, -4]]
+
+    solutions = list(satbridge.itersolve_projected(clauses, [1, 2, 3], onehot=True))
+    assert sorted(solutions) == [[-1, -2, 3], [-1, 2, -3], [1, -2, -3]]
+
+
+def test_itersolve_projected_determined():
+
+    # d <-> a & b, so d adds nothing new
+    symbs = symbols("a,b")
+    mapper = satbridge.SymbolMapper(symbs)
+    clauses = cnf.from_dnf([[1, 2], [-1, -2]], mapper=mapper, tseitin=True)
+
+    solutions = satbridge.itersolve_projected(clauses, [1, 2], determined=True)
+    assert sorted(solutions) == [[-1, -2], [1, 2]]
+
+
+def test_decoder():
+
+    # variable -> (position, char), 5 isn't a cell (aux, say)
+    decoder = satbridge.Decoder({1: (0, "a"), 2: (1, "a"), 3: (0, "b"), 4: (1, "b")})
+
+    assert decoder.decode([-1, 2, 3, -4, 5]) == "ba"
+    assert decoder.decode([1, -2, -3, 4, -5]) == "ab"
+
+
+def test_flat_roundtrip():
+
+    clauses = [[1, -2], [3], [-4, 5, 6]]
+    flat = satbridge.to_flat(clauses)
+
+    assert list(flat) == [1, -2, 0, 3, 0, -4, 5, 6, 0]
+    assert satbridge.from_flat(flat) == [(1, -2), (3,), (-4, 5, 6)]
+
+
+def test_ints_skip_sympy():
+
+    # cnf takes plain ints and VarPools without going anywhere near sympy
+    pool = satbridge.VarPool(top=6)
+    clauses = cnf.exactly_n_true(range(1, 7), 3, mapper=pool, encoding="totalizer")
+
+    assert pool.top > 6
+    assert all(type(x) == int for clause in clauses for x in clause)
+
+
+def test_to_str_double_digits():
+
+    # "10" sorts before "2" as a string, make sure it's not treated like one
+    word = "abcdefghijkl"
+    symbs = satbridge.str_to_symb(word)
+
+    # reversed: letter i goes at index len - 1 - i
+    n = len(word)
+    sat_out = []
+    for j in range(n):
+        for i in range(n):
+            var = j * n + i + 1
+            sat_out.append(var if i == n - 1 - j else -var)
+
+    assert satbridge.satout_to_str(sat_out, symbs) == word[::-1]
+
+
+def test_decode_many():
+
+    decoder = satbridge.Decoder({1: (0, "a"), 2: (1, "a"), 3: (0, "b"), 4: (1, "b")})
+
+    models = [[-1, 2, 3, -4, 5], [1, -2, -3, 4, -5]]
+    assert decoder.decode_many(models) == ["ba", "ab"]
+    assert decoder.decode_many([]) == []
+
+
+def test_dimacs_roundtrip():
+
+    clauses = [[1, -2], [3], [-1, 2, -3]]
+    out = io.StringIO()
+    satbridge.write_dimacs(clauses, out, comments=["hi"])
+    assert out.getvalue() == "c hi\np cnf 3 3\n1 -2 0\n3 0\n-1 2 -3 0\n"
+
+    out.seek(0)
+    assert list(satbridge.read_dimacs(out)) == clauses
+
+    # flat arrays work too
+    out = io.StringIO()
+    satbridge.write_dimacs(satbridge.to_flat(clauses), out, top=5)
+    assert out.getvalue().split("\n")[0] == "p cnf 5 3"
+
+    # so do generators, counted on the way through
+    out = io.StringIO()
+    satbridge.write_dimacs((c for c in clauses), out, comments=["hi"])
+    assert out.getvalue() == "c hi\np cnf 3 3\n1 -2 0\n3 0\n-1 2 -3 0\n"
+
+    out = io.StringIO()
+    satbridge.write_dimacs(iter(clauses), out, top=4, count=3)
+    assert out.getvalue().startswith("p cnf 4 3\n1 -2 0\n")
+
+
+def test_read_dimacs_messy():
+
+    text = "c comment\np cnf 3 2\n1 -2\n 3 0 -1\n0\n%\n0\n"
+    assert list(satbridge.read_dimacs(io.StringIO(text))) == [[1, -2, 3], [-1]]
+
+
+def test_pycosat_backend():
+
+    backend = satbridge.PycosatBackend()
+    clauses = [[1, 2], [-1, -2]]
+    assert backend.solve(clauses) in ([1, -2], [-1, 2])
+    assert backend.solve(clauses, assumptions=[-1]) == [-1, 2]
+    assert backend.solve(clauses, assumptions=[1, 2]) == "UNSAT"
+    assert sorted(backend.itersolve(clauses)) == [[-1, 2], [1, -2]]
+
+    assert backend.stats["calls"] == 6
+    assert backend.stats["solutions"] == 4
+
+
+def test_pycosat_backend_clocked():
+
+    backend = satbridge.PycosatBackend()
+    clauses = [[1, 2], [-1, -2]]
+    got = backend.itersolve(clauses, remaining=lambda: 10)
+    assert sorted(got) == [[-1, 2], [1, -2]]
+
+    # 11 pigeons don't fit in 10 holes, but pycosat takes minutes to see
+    # that, so it's stopped when the clock runs out
+    def hole(pigeon, h):
+        return pigeon * 10 + h + 1
+
+    clauses = [[hole(p, h) for h in range(10)] for p in range(11)]
+    for h in range(10):
+        for p in range(11):
+            clauses.extend([-hole(p, h), -hole(q, h)] for q in range(p))
+
+    started = time.monotonic()
+    assert list(backend.itersolve(clauses, remaining=lambda: 0.2)) == []
+    assert time.monotonic() - started < 5
+
+    budget = Budget(timeout=0.2)
+    projected = satbridge.itersolve_projected(
+        clauses, range(1, 111), determined=True, budget=budget
+    )
+    assert list(projected) == []
+    assert budget.reason == "timeout"
+
+
+def _fake_solver(tmp_path):
+    """A solver binary that's really pycosat, but talks like a competition one"""
+
+    script = tmp_path / "solver.py"
+    script.write_text(
+        "import sys, pycosat\n"
+        "lits = open(sys.argv[1]).read().split('\\n', 1)[1].split()\n"
+        "clauses = [[]]\n"
+        "for lit in map(int, lits):\n"
+        "    clauses[-1].append(lit) if lit else clauses.append([])\n"
+        "solution = pycosat.solve(clauses[:-1])\n"
+        "if solution == 'UNSAT':\n"
+        "    print('s UNSATISFIABLE')\n"
+        "else:\n"
+        "    print('s SATISFIABLE')\n"
+        "    print('v', *solution, 0)\n"
+    )
+    return satbridge.SubprocessBackend([sys.executable, str(script)])
+
+
+def test_subprocess_backend(tmp_path):
+
+    backend = _fake_solver(tmp_path)
+    clauses = [[1, 2], [-1, -2]]
+    assert backend.solve(clauses, assumptions=[-1]) == [-1, 2]
+    assert backend.solve(clauses, assumptions=[1, 2]) == "UNSAT"
+    assert sorted(backend.itersolve(clauses)) == [[-1, 2], [1, -2]]
+
+    got = satbridge.itersolve_projected(clauses, [1], backend=backend)
+    assert sorted(got) == [[-1], [1]]
+
+    # each solve gets what's left on the clock
+    timeouts = []
+
+    def remaining():
+        timeouts.append(5.0)
+        return 5.0
+
+    assert len(list(backend.itersolve(clauses, remaining=remaining))) == 2
+    assert timeouts == [5.0] * 3
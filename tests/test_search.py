@@ -0,0 +1,56 @@
+from itertools import permutations
+import time
+
+from tomriddle.automata import clusters
+from tomriddle.search import build_trie, search, END
+
+
+def test_trie():
+
+    trie = build_trie(["ab", "abc", "b"])
+    assert END in trie["a"]["b"]
+    assert END in trie["a"]["b"]["c"]
+    assert END not in trie["a"]
+    assert set(trie) == {"a", "b"}
+
+
+def test_permutations():
+
+    expect = sorted(set(map("".join, permutations("hello"))))
+    assert sorted(search("hello")) == expect
+
+
+def test_lazy():
+
+    # doesn't make them all first
+    riddles = search("abcdefghijklmnopqrstuvwxyz")
+    assert next(riddles) == "abcdefghijklmnopqrstuvwxyz"
+
+
+def test_cover():
+
+    # like test_cnf.test_cover
+    assert sorted(search("abb", ["ab", "bb"])) == ["abb"]
+    assert sorted(search("aabb", ["ab", "ba"])) == ["abab", "abba", "baab", "baba"]
+
+
+def test_in_order():
+
+    assert sorted(search("abcd", substrings=["c", "ab"])) == ["cabd", "cdab", "dcab"]
+    assert [] == list(search("aba", substrings=["ab", "ba"]))
+    assert ["abba"] == list(search("abba", substrings=["ab", "ba"]))
+
+
+def test_impossible_substrings():
+
+    # "ab" then "ba" needs two of each, the letters left say so right away
+    started = time.monotonic()
+    assert list(search("abcdefghij", substrings=["ab", "ba"])) == []
+    assert list(search("abcdefghij", substrings=["cz"])) == []
+    assert time.monotonic() - started < 1
+
+
+def test_automaton():
+
+    got = sorted(search("abab", automaton=clusters(max_consonants=1, max_vowels=1)))
+    assert got == ["abab", "baba"]
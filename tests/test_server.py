@@ -0,0 +1,96 @@
+import asyncio
+import json
+import time
+
+from tomriddle import Fragments
+from tomriddle.cli import tomriddle
+from tomriddle.server import Server
+
+from tests import TOY
+
+
+async def _talk(requests, until, fragments=TOY):
+    """Send requests, and read replies until the ids in until are done"""
+
+    server = Server(fragments, workers=2)
+    await server.start(port=0)
+    port = server.server.sockets[0].getsockname()[1]
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for request in requests:
+            writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+
+        replies = []
+        waiting = set(until)
+        while waiting:
+            reply = json.loads(await reader.readline())
+            replies.append(reply)
+            if "done" in reply or "error" in reply:
+                waiting.discard(reply["id"])
+        writer.close()
+        return replies
+    finally:
+        server.close()
+
+
+def test_stream():
+
+    requests = [
+        {"id": 1, "answer": "aabbc"},
+        {"id": 2, "answer": "abab", "limit": 3, "engine": "search"},
+    ]
+    replies = asyncio.run(_talk(requests, [1, 2]))
+
+    one = [r["riddle"] for r in replies if r["id"] == 1 and "riddle" in r]
+    assert sorted(one) == ["ababc", "abcab", "abcba", "baabc", "bcaba"]
+    assert {"id": 1, "done": True, "count": 5, "stopped": None} in replies
+
+    two = [r["riddle"] for r in replies if r["id"] == 2 and "riddle" in r]
+    assert two == ["abab", "abba", "baab"]
+    assert {"id": 2, "done": True, "count": 3, "stopped": "limit"} in replies
+
+
+def test_cancel_and_errors():
+
+    requests = [
+        {"id": "big", "answer": "abcdefghijklmnop", "limit": None},
+        {"id": "big", "cancel": True},
+        {"id": "bad", "answer": "abc", "engine": "magic"},
+    ]
+    replies = asyncio.run(_talk(requests, ["big", "bad"]))
+
+    done = [r for r in replies if r["id"] == "big" and "done" in r]
+    assert done[0]["stopped"] == "cancelled"
+    assert [r["id"] for r in replies if "error" in r] == ["bad"]
+
+
+def test_cancel_mid_riddle():
+
+    # a search that never finds anything: every letter is a fragment but "p"
+    stuck = Fragments(list("abcdefghijklmno"), [], [])
+    requests = [
+        {"id": "stuck", "answer": "abcdefghijklmnop", "engine": "search"},
+        {"id": "stuck", "cancel": True},
+    ]
+    started = time.monotonic()
+    replies = asyncio.run(_talk(requests, ["stuck"], stuck))
+    assert replies == [
+        {"id": "stuck", "done": True, "count": 0, "stopped": "cancelled"}
+    ]
+    assert time.monotonic() - started < 5
+
+
+def test_needs_id():
+
+    requests = [{"answer": "abc"}, {"id": 1, "answer": "ab"}]
+    replies = asyncio.run(_talk(requests, [None, 1]))
+    assert {"id": None, "error": "every query needs an id"} in replies
+    assert {"id": 1, "done": True, "count": 2, "stopped": None} in replies
+
+
+def test_cli():
+
+    args = tomriddle(args=["serve", "-p", "1234"], dry=True)
+    assert args.port == 1234
+    assert args.unix is None
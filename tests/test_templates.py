@@ -0,0 +1,61 @@
+from itertools import permutations
+
+from pycosat import itersolve
+
+from tomriddle import templates
+
+
+def test_signature():
+
+    assert templates.signature("iamlordvoldemort") == templates.signature(
+        "tommarvoloriddle"
+    )
+    assert templates.signature("hello") == (2, 1, 1, 1)
+    assert templates.letter_counts("hello")[0] == ("l", 2)
+
+
+def test_template_permutes():
+
+    signature = templates.signature("hello")
+    template = templates.build(signature)
+    grid = len(signature) * sum(signature)
+
+    solutions = list(itersolve(template.clauses))
+    assert len(set(permutations("hello"))) == len(solutions)
+
+    # aux variables (if any) come after the grid
+    assert all(len(sol) == template.top for sol in solutions)
+    assert template.top >= grid
+
+
+def test_template_memory_cache():
+
+    templates.permutation.cache_clear()
+    first = templates.permutation((2, 1))
+    second = templates.permutation((2, 1))
+
+    assert first is second
+    assert 1 == templates.permutation.cache_info().hits
+
+
+def test_template_disk_cache(tmp_path):
+
+    signature = (3, 2, 2, 1)
+    built = templates.permutation(signature, cache_dir=str(tmp_path))
+    assert list(tmp_path.iterdir())
+
+    # skip memory, read from disk
+    templates.permutation.cache_clear()
+    loaded = templates._load(templates._path(tmp_path, signature))
+    assert built == loaded
+
+
+def test_template_stale_file(tmp_path):
+
+    path = templates._path(tmp_path, (1, 1))
+    path.write_bytes(b"not a template")
+    assert templates._load(path) is None
+
+    assert templates.permutation((1, 1), cache_dir=str(tmp_path)) == templates.build(
+        (1, 1)
+    )
@@ -5,6 +5,7 @@ __email__ = "MatrixManAtYrService@users.noreply.github.com"
 __version__ = "0.1.0"
 
 from .tomriddle import main, riddler
+from .aio import ariddler
 from .fragments import (
     gen_default_fragments,
     get_default_fragments,
@@ -0,0 +1,92 @@
+"""
+riddler for asyncio code: the solving happens off the event loop, so
+waiting for the next riddle doesn't hold up everything else.
+"""
+
+import threading
+
+from tomriddle.tomriddle import riddler
+
+# how many riddles to find before anybody asks for them
+PREFETCH = 16
+
+# the producer puts this on the queue when it's out of riddles
+_END = object()
+
+
+class _Failed:
+    """The producer puts one of these on the queue if riddler raised"""
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+async def ariddler(
+    answer, fragments, prefetch=PREFETCH, timeout=None, executor=None, **kwargs
+):
+    """
+    Like riddler (which gets answer, fragments and kwargs), but an async
+    generator.
+
+    Riddles are found in a thread of their own (or on executor, if given)
+    and queued up, at most prefetch of them ahead of whoever's iterating.
+    Pass workers= to have riddler solve in a pool of processes, the thread
+    just passes their riddles along then.
+
+    If the next riddle takes more than timeout seconds, TimeoutError is
+    raised.  Stopping early (break, cancel, timeout) tells the thread to
+    stop too, once it's done with the riddle it's working on.
+    """
+
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    room = threading.Semaphore(prefetch)
+    stop = threading.Event()
+
+    def put(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # the loop is gone
+            stop.set()
+
+    def produce():
+        try:
+            riddles = riddler(answer, fragments, **kwargs)
+            while True:
+                room.acquire()
+                if stop.is_set():
+                    return
+                riddle = next(riddles, _END)
+                put(riddle)
+                if riddle is _END:
+                    return
+        except Exception as ex:
+            put(_Failed(ex))
+
+    if executor is None:
+        threading.Thread(target=produce, daemon=True).start()
+    else:
+        loop.run_in_executor(executor, produce)
+
+    try:
+        while True:
+            if timeout is None:
+                item = await queue.get()
+            else:
+                item = await asyncio.wait_for(queue.get(), timeout)
+
+            if item is _END:
+                return
+            if isinstance(item, _Failed):
+                raise item.exception
+
+            room.release()
+            yield item
+    finally:
+        stop.set()
+
+        # in case it's waiting for room
+        room.release()
@@ -0,0 +1,88 @@
+"""
+Automata that describe pronounceable-ish strings, for use with
+cnf.pronounce (or riddler's pronounce kwarg).
+"""
+
+from collections import Counter
+
+from tomriddle.cnf import Automaton
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+VOWELS = "aeiouy"
+
+
+def clusters(max_consonants=3, max_vowels=2, vowels=VOWELS, alphabet=ALPHABET):
+    """
+    Rejects runs of more than max_consonants consonants or more than
+    max_vowels vowels in a row, so no "tmmrv" or "ooeia".
+
+    States are (is_vowel, run_length), every state accepts.
+    """
+
+    start = (None, 0)
+    states = [start]
+    states += [(False, n) for n in range(1, max_consonants + 1)]
+    states += [(True, n) for n in range(1, max_vowels + 1)]
+
+    transitions = {}
+    for state in states:
+        kind, run = state
+        for char in alphabet:
+            is_vowel = char in vowels
+            limit = max_vowels if is_vowel else max_consonants
+            nxt = (is_vowel, run + 1 if kind == is_vowel else 1)
+            if nxt[1] <= limit:
+                transitions[(state, char)] = nxt
+
+    return Automaton(start, frozenset(states), transitions)
+
+
+def ngram_counts(fragments, n=2):
+    """
+    Count the n-grams inside each fragment in a Fragments, weighted by how
+    often the fragment was seen.
+    """
+
+    begins, ends = fragments.startend
+
+    counts = Counter()
+    for table in (fragments.syllables, fragments.twoshort, begins, ends):
+        for fragment, count in table.items():
+            for i in range(len(fragment) - n + 1):
+                counts[fragment[i : i + n]] += count
+    return counts
+
+
+def ngrams(fragments, n=2, min_count=1, alphabet=ALPHABET):
+    """
+    Only allows strings whose every n-gram has been seen at least
+    min_count times in the fragment tables.
+
+    States are the last n - 1 chars.  Until there are that many, anything
+    goes.  Every state accepts.  Pass a smaller alphabet (like the answer's
+    letters) to keep the automaton small.
+    """
+
+    counts = ngram_counts(fragments, n)
+    seen = {gram for gram, count in counts.items() if count >= min_count}
+    alphabet = sorted(set(alphabet))
+
+    transitions = {}
+    states = {""}
+    frontier = [""]
+    while frontier:
+        state = frontier.pop()
+        for char in alphabet:
+            if len(state) < n - 1:
+                nxt = state + char
+            elif state + char in seen:
+                nxt = (state + char)[1:]
+            else:
+                continue
+
+            transitions[(state, char)] = nxt
+            if nxt not in states:
+                states.add(nxt)
+                frontier.append(nxt)
+
+    return Automaton("", frozenset(states), transitions)
@@ -0,0 +1,221 @@
+"""
+Lots of answers in one process: read them one per line (or as JSON
+objects, one per line), and write a JSON line of riddles for each.
+
+The fragments are loaded once, and riddler keeps what it builds from
+them (see tomriddle._warm), as do the templates (see templates.py), so
+each answer only pays for its own solving.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+import shlex
+import sys
+import time
+
+from tomriddle import satbridge
+from tomriddle.budget import Budget
+from tomriddle.fragments import get_default_fragments
+from tomriddle.tomriddle import riddler
+
+# the riddler options a request line can set, and their defaults
+DEFAULTS = {
+    "constraints": [],
+    "min_count": 0,
+    "limit": 10,
+    "deadline": None,
+    "timeout": None,
+    "memory": None,
+    "engine": "sat",
+}
+
+
+def read_requests(in_file):
+    """
+    Yield a dict for each answer in an open file.  Lines are either just
+    the answer, or JSON like:
+
+        {"answer": "iamlordvoldemort", "limit": 5, "id": 7}
+
+    blank lines are skipped.  A line that isn't JSON gets a dict with its
+    line number and an error instead, solve passes that along, so the rest
+    of the batch carries on.
+    """
+
+    for number, line in enumerate(in_file, 1):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                request = json.loads(line)
+            except ValueError as ex:
+                request = {"line": number, "error": f"bad json: {ex}"}
+            yield request
+        else:
+            yield {"answer": line}
+
+
+def solve(request, fragments, defaults=DEFAULTS, backend=None):
+    """
+    Riddles for one request, as a dict that's ready to be a JSON line.
+
+    limit, deadline, timeout and memory make a budget.Budget for riddler.
+    "stopped" says which of them ended it, or is null if that was all of
+    them.
+    """
+
+    result = {"answer": request.get("answer")}
+
+    # a line that read_requests couldn't read
+    if "error" in request:
+        result.update(request, riddles=[], stopped=None, seconds=0)
+        return result
+
+    options = dict(defaults)
+    options.update(request)
+
+    if "id" in request:
+        result["id"] = request["id"]
+
+    start = time.perf_counter()
+    budget = _budget(options)
+    riddles = []
+    try:
+        found = riddler(
+            options["answer"],
+            fragments,
+            constraints=options["constraints"],
+            min_count=options["min_count"],
+            engine=options["engine"],
+            backend=backend,
+            budget=budget,
+        )
+        riddles.extend(found)
+    except Exception as ex:
+        result["error"] = f"{type(ex).__name__}: {ex}"
+
+    result["riddles"] = riddles
+    result["stopped"] = budget.reason
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def _budget(options, cancel=None):
+    return Budget(
+        solutions=options["limit"],
+        deadline=options["deadline"],
+        timeout=options["timeout"],
+        memory=options["memory"],
+        cancel=cancel,
+    )
+
+
+# each worker's fragments and options, see _init_worker
+_worker = {}
+
+
+def _init_worker(fragments, defaults, backend):
+    _worker.update(fragments=fragments, defaults=defaults, backend=backend)
+
+
+def _solve_chunk(requests):
+    return [
+        solve(request, _worker["fragments"], _worker["defaults"], _worker["backend"])
+        for request in requests
+    ]
+
+
+def run(
+    in_file,
+    out_file,
+    fragments=None,
+    defaults=DEFAULTS,
+    workers=1,
+    chunk=32,
+    backend=None,
+):
+    """
+    Solve every request in in_file, and write a JSON line for each to
+    out_file, in the same order.  Returns how many there were.
+
+    fragments are the default ones if None.  defaults fills in whatever
+    a request leaves out.
+
+    With more than one worker (None means one per cpu) requests go to a
+    pool of processes, chunk at a time, and each process keeps its own
+    warm state.  Only a few chunks are in flight at once.
+    """
+
+    if fragments is None:
+        fragments = get_default_fragments()
+
+    requests = read_requests(in_file)
+    count = 0
+
+    def write(result):
+        nonlocal count
+        out_file.write(json.dumps(result) + "\n")
+        out_file.flush()
+        count += 1
+
+    if workers == 1:
+        # already warm
+        for request in requests:
+            write(solve(request, fragments, defaults, backend))
+        return count
+
+    def chunks():
+        batch = []
+        for request in requests:
+            batch.append(request)
+            if len(batch) == chunk:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(fragments, defaults, backend)
+    ) as pool:
+        in_flight = deque()
+        for batch in chunks():
+            in_flight.append(pool.submit(_solve_chunk, batch))
+            if len(in_flight) > 2 * workers:
+                for result in in_flight.popleft().result():
+                    write(result)
+        while in_flight:
+            for result in in_flight.popleft().result():
+                write(result)
+
+    return count
+
+
+def main(args):
+    """For cli.tomriddle's batch subcommand"""
+
+    defaults = dict(DEFAULTS)
+    defaults.update(
+        limit=args.limit,
+        deadline=args.deadline,
+        timeout=args.timeout,
+        memory=args.memory and args.memory * 2**20,
+        min_count=args.min_count,
+        engine=args.engine,
+    )
+
+    backend = None
+    if args.solver:
+        backend = satbridge.SubprocessBackend(shlex.split(args.solver))
+
+    in_file = sys.stdin if args.file in (None, "-") else open(args.file, "r")
+    out_file = sys.stdout if args.out in (None, "-") else open(args.out, "w")
+    try:
+        run(in_file, out_file, None, defaults, args.workers or None, backend=backend)
+    finally:
+        for f in (in_file, out_file):
+            if f not in (sys.stdin, sys.stdout):
+                f.close()
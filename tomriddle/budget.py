@@ -0,0 +1,94 @@
+"""
+Limits on how long riddler looks for riddles, and how much it keeps while
+it's looking.
+"""
+
+import time
+
+# a guess at what a literal in a blocking clause costs, in bytes: an int
+# and its slot in a list
+LITERAL_BYTES = 36
+
+
+class Budget:
+    """
+    Pass one to riddler to stop it early:
+
+        solutions: this many riddles and no more
+        deadline: seconds, all told
+        timeout: seconds to find each riddle
+        memory: bytes, roughly, for the clauses that block old solutions
+        cancel: a threading.Event, set it from anywhere to stop
+
+    The memory cap is soft, it's an estimate from how many literals have
+    been spent blocking solutions, which is what grows as enumeration goes
+    on.
+
+    When it runs out, reason says which one did it: "limit", "deadline",
+    "timeout", "memory" or "cancelled".  It's None if riddler ran out of riddles first.
+    """
+
+    def __init__(
+        self, solutions=None, deadline=None, timeout=None, memory=None, cancel=None
+    ):
+        self.solutions = solutions
+        self.deadline = deadline
+        self.timeout = timeout
+        self.memory = memory
+        self.cancel = cancel
+        self.start()
+
+    def start(self):
+        """Reset the clocks and counts, riddler does this when it starts"""
+
+        self.started = self.last = time.monotonic()
+        self.found = 0
+        self.blocking = 0
+        self.reason = None
+        if self.solutions is not None and self.solutions <= 0:
+            self.reason = "limit"
+        return self
+
+    @property
+    def clocked(self):
+        """Whether there's a time limit"""
+        return self.deadline is not None or self.timeout is not None
+
+    def spend_solution(self):
+        """Count a riddle, and start its successor's clock"""
+
+        self.found += 1
+        self.last = time.monotonic()
+        if self.solutions is not None and self.found >= self.solutions:
+            self.reason = self.reason or "limit"
+
+    def spend_memory(self, literals):
+        """Count the literals in some new blocking clauses"""
+
+        self.blocking += literals
+        if self.memory is not None and self.blocking * LITERAL_BYTES > self.memory:
+            self.reason = self.reason or "memory"
+
+    def remaining(self):
+        """Seconds until a clock runs out, or None if there's no clock"""
+
+        now = time.monotonic()
+        left = []
+        if self.deadline is not None:
+            left.append(self.started + self.deadline - now)
+        if self.timeout is not None:
+            left.append(self.last + self.timeout - now)
+        return min(left) if left else None
+
+    def exhausted(self):
+        """True once any part of the budget is spent"""
+
+        if self.reason is None and self.cancel is not None and self.cancel.is_set():
+            self.reason = "cancelled"
+        if self.reason is None and self.clocked:
+            now = time.monotonic()
+            if self.deadline is not None and now >= self.started + self.deadline:
+                self.reason = "deadline"
+            elif self.timeout is not None and now >= self.last + self.timeout:
+                self.reason = "timeout"
+        return self.reason is not None
@@ -0,0 +1,187 @@
+"""
+Save how far riddler has got, so that a long enumeration can pick up
+where it left off instead of starting over (and without repeating the
+riddles it already gave you).
+
+What's saved depends on how riddler was looking:
+
+    sat: every riddle so far, they become blocking clauses on resume
+    search: just the last riddle, it goes in alphabetical order
+    more than one worker: the cubes that are done, and the riddles
+        from the ones that aren't
+    ranked: every riddle so far, they're skipped on resume
+
+The file starts with a header (see _HEADER), then it's zlib'd: the
+answer's distinct letters, then each cube (a length byte, then letters)
+and each riddle as one byte per letter, an index into those distinct
+letters.  So a million riddles of a 16 letter answer is 16MB before
+compression, and a lot less after.
+"""
+
+from hashlib import sha256
+from pathlib import Path
+import os
+import struct
+import time
+import zlib
+
+_MAGIC = b"TRCP"
+_VERSION = 1
+
+# magic, version, flags, instance digest, letters size, riddle length,
+# cubes, riddles
+_HEADER = struct.Struct("<4sBB32sHHII")
+
+# set once every riddle is out
+_DONE = 1
+
+
+def digest(*parts):
+    """Identify a riddler instance, so a checkpoint isn't used for another"""
+
+    h = sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
+
+
+class Checkpoint:
+    """
+    Pass one (or just a path) to riddler as checkpoint=, it's saved every
+    `every` seconds, and when riddler stops.  If the file is already
+    there riddler resumes from it.  done is True once every riddle has been
+    found, riddler yields nothing after that.
+    """
+
+    def __init__(self, path, every=60.0):
+        self.path = Path(path)
+        self.every = every
+
+        self.digest = None
+        self.chars = ""
+        self.length = 0
+        self.latest_only = False
+        self.cubes = set()
+        self.riddles = []
+        self.seen = set()
+        self.done = False
+        self.saved = time.monotonic()
+
+    def open(self, digest, letters, latest_only=False):
+        """
+        Start (or resume) checkpointing the instance with this digest.  If
+        latest_only, riddles come out in order and only the last one is
+        kept.  ValueError if the file is for a different instance.
+        """
+
+        self.digest = digest
+        self.chars = "".join(sorted(set(letters)))
+        self.length = len(letters)
+        self.latest_only = latest_only
+        self.cubes = set()
+        self.riddles = []
+        self.done = False
+
+        if self.path.exists():
+            self._load()
+
+        self.seen = set() if latest_only else set(self.riddles)
+        self.saved = time.monotonic()
+        return self
+
+    def _load(self):
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{self.path} isn't a checkpoint")
+        magic, version, flags, digest, size, length, cubes, riddles = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{self.path} isn't a checkpoint (or it's too old)")
+        if digest != self.digest:
+            raise ValueError(f"{self.path} is a checkpoint for some other riddles")
+
+        body = zlib.decompress(data[_HEADER.size :])
+        chars = body[:size].decode("utf-8")
+        at = size
+
+        for _ in range(cubes):
+            end = at + 1 + body[at]
+            self.cubes.add("".join(chars[i] for i in body[at + 1 : end]))
+            at = end
+
+        for _ in range(riddles):
+            self.riddles.append("".join(chars[i] for i in body[at : at + length]))
+            at += length
+
+        self.done = bool(flags & _DONE)
+
+    def save(self):
+        """Write it out, atomically"""
+
+        index = {char: i for i, char in enumerate(self.chars)}
+
+        def encode(word):
+            return bytes(index[char] for char in word)
+
+        chars = self.chars.encode("utf-8")
+        body = [chars]
+        for cube in sorted(self.cubes):
+            body.append(bytes([len(cube)]) + encode(cube))
+        body.extend(map(encode, self.riddles))
+
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _DONE if self.done else 0,
+            self.digest,
+            len(chars),
+            self.length,
+            len(self.cubes),
+            len(self.riddles),
+        )
+
+        # write then rename, so a crash never leaves half a checkpoint
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(b"".join(body)))
+        os.replace(tmp, self.path)
+        self.saved = time.monotonic()
+
+    def emitted(self, riddle):
+        """Whether riddle came out before"""
+
+        if self.cubes and riddle.startswith(tuple(self.cubes)):
+            return True
+        if self.latest_only:
+            return bool(self.riddles) and riddle <= self.riddles[-1]
+        return riddle in self.seen
+
+    def latest(self):
+        """The last riddle, if they're in order"""
+        return self.riddles[-1] if self.latest_only and self.riddles else None
+
+    def add(self, riddle):
+        """Remember a riddle, and save if it's been a while"""
+
+        if self.latest_only:
+            self.riddles[:] = [riddle]
+        else:
+            self.riddles.append(riddle)
+            self.seen.add(riddle)
+
+        if time.monotonic() - self.saved >= self.every:
+            self.save()
+
+    def finish_cube(self, prefix):
+        """Every riddle that starts with prefix is out"""
+
+        self.cubes.add(prefix)
+        self.riddles = [r for r in self.riddles if not r.startswith(prefix)]
+        self.seen = set(self.riddles)
@@ -4,9 +4,44 @@ from .tomriddle import main
 
 
 def tomriddle(args=None, dry=False):
+
+    argv = args or sys.argv[1:]
+    if argv[:1] == ["batch"]:
+        return batch(argv[1:], dry)
+    if argv[:1] == ["serve"]:
+        return serve(argv[1:], dry)
+
     parser = argparse.ArgumentParser()
     parser.add_argument("answer")
     parser.add_argument("-s", "--substr", nargs="+", default=[])
+    parser.add_argument(
+        "--corpus", default=None, help="text to learn fragments from, not the default"
+    )
+    parser.add_argument("-m", "--min-count", type=int, default=0)
+    parser.add_argument(
+        "-k", "--top", type=int, default=None, help="best riddles first, only this many"
+    )
+    parser.add_argument(
+        "--frontier",
+        type=int,
+        default=None,
+        help="partial riddles -k keeps looking at, 0 for all (exact, but slow)",
+    )
+    parser.add_argument("-e", "--engine", choices=["sat", "search"], default="sat")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1, help="0 for one per cpu"
+    )
+    parser.add_argument("-n", "--limit", type=int, default=None)
+    _budget_arguments(parser)
+    parser.add_argument(
+        "--solver", default=None, help="a DIMACS solver command, instead of pycosat"
+    )
+    parser.add_argument(
+        "-c", "--checkpoint", default=None, help="save progress here, resume from it"
+    )
+    parser.add_argument(
+        "--every", type=float, default=60.0, help="seconds between checkpoints"
+    )
 
     if args:
         args = parser.parse_args(args)
@@ -19,5 +54,61 @@ def tomriddle(args=None, dry=False):
         return args
 
 
+def _budget_arguments(parser):
+    parser.add_argument(
+        "-d", "--deadline", type=float, default=None, help="seconds per answer"
+    )
+    parser.add_argument(
+        "-t", "--timeout", type=float, default=None, help="seconds per riddle"
+    )
+    parser.add_argument(
+        "--memory", type=float, default=None, help="MB, roughly, for solving"
+    )
+
+
+def batch(args, dry=False):
+    """tomriddle batch [FILE]: many answers, one JSON line of riddles each"""
+
+    parser = argparse.ArgumentParser(prog="tomriddle batch")
+    parser.add_argument("file", nargs="?", default=None, help="answers, or stdin")
+    parser.add_argument("-o", "--out", default=None, help="JSON lines, or stdout")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="per answer")
+    _budget_arguments(parser)
+    parser.add_argument("-m", "--min-count", type=int, default=0)
+    parser.add_argument("-e", "--engine", choices=["sat", "search"], default="sat")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=1, help="0 for one per cpu"
+    )
+    parser.add_argument(
+        "--solver", default=None, help="a DIMACS solver command, instead of pycosat"
+    )
+    args = parser.parse_args(args)
+
+    if not dry:
+        from .batch import main as batch_main
+
+        batch_main(args)
+    else:
+        return args
+
+
+def serve(args, dry=False):
+    """tomriddle serve: answer JSON line queries on a socket, see server.py"""
+
+    parser = argparse.ArgumentParser(prog="tomriddle serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=7979)
+    parser.add_argument("-u", "--unix", default=None, help="a socket path, not TCP")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="threads")
+    args = parser.parse_args(args)
+
+    if not dry:
+        from .server import main as server_main
+
+        server_main(args)
+    else:
+        return args
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -1,11 +1,19 @@
+from array import array
+from collections import namedtuple
 from itertools import product, combinations
 from functools import reduce
 import operator
-import sympy.logic.boolalg as form
-from sympy import Symbol, Not, And, Or
 
 from tomriddle import satbridge
 
+# sympy is only imported if you hand these functions sympy expressions,
+# plain ints (or array('i')) never touch it
+
+# A deterministic finite automaton over chars.  transitions is a dict like
+# {(state, char): next_state}, a missing transition means "rejected".
+# See automata.py for some ready-made ones.
+Automaton = namedtuple("Automaton", "start accepting transitions")
+
 
 def AND(exprs):
     return reduce(operator.and_, exprs)
@@ -14,6 +22,8 @@ def AND(exprs):
 def OR(exprs, convert=False):
 
     if convert:
+        import sympy.logic.boolalg as form
+
         # this will be slow for many clauses
         # https://cs.stackexchange.com/a/41071/97082
         return form.to_cnf(reduce(operator.or_, exprs), simplify=True, force=True)
@@ -31,19 +41,30 @@ def _to_list(it, mapper):
         if m is None:
             raise TypeError("A mapper kwarg is required")
 
+    # the fast path: already ints
+    if type(it) in [array, range]:
+        return list(it)
+
     if type(it) in [list, tuple]:
 
+        if not it:
+            return list(it)
+
         list_of = type(it[0])
-        if list_of == "int":
-            return it
+        if list_of == int:
+            return list(it)
+
+        from sympy import Symbol, Not
 
-        elif list_of in [Symbol, Not]:
+        if list_of in [Symbol, Not]:
             require(mapper)
             return [mapper.to_int(x) for x in it]
 
         else:
             raise TypeError(f"Not sure what to do with a list of {list_of}")
 
+    from sympy import And, Or
+
     if type(it) == And:
 
         require(mapper)
@@ -57,40 +78,425 @@ def _to_list(it, mapper):
     raise TypeError(f"Whats a {type(it)}?")
 
 
-def max_n_true(variables, n, mapper=None):
+def _choose(n, k):
+    """n choose k, without overflowing into silly numbers"""
+    if k < 0 or k > n:
+        return 0
+    k = min(k, n - k)
+    total = 1
+    for i in range(k):
+        total = total * (n - i) // (i + 1)
+    return total
+
+
+def _require_pool(mapper, encoding):
+    if mapper is None or not hasattr(mapper, "fresh"):
+        raise TypeError(
+            f"The {encoding} encoding needs a mapper to get fresh variables"
+        )
+
+
+def _pairwise(lits, k):
+    """
+    Forbid every way for k + 1 of the literals to be true at once.
+    No auxiliary variables, but the clause count is combinatorial.
+    """
+    return [[-x for x in microstate] for microstate in combinations(lits, k + 1)]
+
+
+# The auxiliary encodings below all build a unary counter: a list of outputs
+# where out[j - 1] is true iff at least j of the inputs are true.  The aux
+# variables are defined in both directions, so they're fully determined by the
+# inputs.  That costs a few extra clauses, but it means that the solver finds
+# exactly one model per assignment of the inputs--no duplicate solutions.
+#
+# None stands in for a constant False (e.g. "at least 3 of these 2 inputs").
+
+
+def _or(a, b, pool, clauses):
+    """Return a literal equivalent to a | b"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    r = pool.fresh()
+    clauses.extend([[-a, r], [-b, r], [-r, a, b]])
+    return r
+
+
+def _and(a, b, pool, clauses):
+    """Return a literal equivalent to a & b"""
+    if a is None or b is None:
+        return None
+    r = pool.fresh()
+    clauses.extend([[-r, a], [-r, b], [-a, -b, r]])
+    return r
+
+
+def _seqcounter(lits, upto, pool, clauses):
+    """
+    Sequential counter (Sinz 2005): a register of partial counts per input.
+    About 6 * len(lits) * upto clauses.
+    """
+    register = []
+    for x in lits:
+        nxt = []
+        for j in range(upto):
+            prev_j = register[j] if j < len(register) else None
+            if j == 0:
+                # at least one so far: seen one before, or this is one
+                nxt.append(_or(prev_j, x, pool, clauses))
+            else:
+                # at least j + 1 so far: had them already, or had j and this
+                carry = _and(x, register[j - 1], pool, clauses) if register else None
+                nxt.append(_or(prev_j, carry, pool, clauses))
+        register = nxt
+    return register
+
+
+def _totalizer(lits, upto, pool, clauses):
+    """
+    Totalizer (Bailleux & Boufkhad 2003): a binary tree of unary adders.
+    Each node only counts as high as it needs to.
+    """
+    if len(lits) == 1:
+        return list(lits[:upto])
+
+    half = len(lits) // 2
+    left = _totalizer(lits[:half], upto, pool, clauses)
+    right = _totalizer(lits[half:], upto, pool, clauses)
+
+    def get(outs, j):
+        # at least 0 is always true, more than we have is always false
+        if j == 0:
+            return True
+        return outs[j - 1] if j <= len(outs) else None
+
+    out = []
+    for j in range(1, min(len(left) + len(right), upto) + 1):
+        r = pool.fresh()
+
+        # i from the left and j - i from the right makes j
+        for i in range(j + 1):
+            a, b = get(left, i), get(right, j - i)
+            if a is not None and b is not None:
+                clauses.append([-x for x in (a, b) if x is not True] + [r])
+
+        # but if the left has at most i and the right at most j - i - 1, it doesn't
+        for i in range(j):
+            a, b = get(left, i + 1), get(right, j - i)
+            clauses.append([-r] + [x for x in (a, b) if x is not None])
+
+        out.append(r)
+    return out
+
+
+def _sortnet(lits, upto, pool, clauses):
+    """
+    Odd-even merge sorting network (Batcher), read as a unary counter.
+    Each comparator is two aux variables and six clauses, there are
+    O(n log^2 n) of them and they don't care how big k is.
+    """
+
+    def compare(a, b):
+        return _or(a, b, pool, clauses), _and(a, b, pool, clauses)
+
+    def merge(seq, lo, n, step):
+        double = step * 2
+        if double < n:
+            merge(seq, lo, n, double)
+            merge(seq, lo + step, n, double)
+            for i in range(lo + step, lo + n - step, double):
+                seq[i], seq[i + step] = compare(seq[i], seq[i + step])
+        else:
+            seq[lo], seq[lo + step] = compare(seq[lo], seq[lo + step])
+
+    def sort(seq, lo, n):
+        if n > 1:
+            half = n // 2
+            sort(seq, lo, half)
+            sort(seq, lo + half, half)
+            merge(seq, lo, n, 1)
+
+    # pad with constant False up to a power of two, constants are free
+    size = 1
+    while size < len(lits):
+        size *= 2
+    seq = list(lits) + [None] * (size - len(lits))
+    sort(seq, 0, size)
+    return seq[:upto]
+
+
+encodings = {
+    "seqcounter": _seqcounter,
+    "totalizer": _totalizer,
+    "sortnet": _sortnet,
+}
+
+
+def _pick_encoding(m, upto, mapper):
+    """Guess the encoding that makes the fewest clauses."""
+
+    pairwise = _choose(m, upto)
+    if mapper is None or not hasattr(mapper, "fresh"):
+        return "pairwise"
+
+    log_m = max(1, (m - 1).bit_length())
+    estimates = {
+        "pairwise": pairwise,
+        "seqcounter": 6 * m * upto,
+        "totalizer": 3 * m * log_m * upto,
+        "sortnet": 3 * m * log_m * log_m,
+    }
+    return min(estimates, key=estimates.get)
+
+
+def _counter(lits, upto, mapper, encoding, clauses):
+    if encoding == "auto":
+        encoding = _pick_encoding(len(lits), upto, mapper)
+    if encoding == "pairwise":
+        return None
+    _require_pool(mapper, encoding)
+    try:
+        build = encodings[encoding]
+    except KeyError:
+        raise ValueError(f"Unknown cardinality encoding: {encoding}")
+    return build(lits, upto, mapper, clauses)
+
+
+def _at_most(lits, k, mapper, encoding):
+    if k >= len(lits):
+        return []
+    if k < 0:
+        return [[]]
+    if k == 0:
+        return [[-x] for x in lits]
+
+    clauses = []
+    out = _counter(lits, k + 1, mapper, encoding, clauses)
+    if out is None:
+        return _pairwise(lits, k)
+    clauses.append([-out[k]])
+    return clauses
+
+
+def _at_least(lits, k, mapper, encoding):
+    if k <= 0:
+        return []
+    if k > len(lits):
+        return [[]]
+    if k == 1:
+        return [list(lits)]
+
+    # at least k true is at most m - k false, count whichever is smaller
+    if len(lits) - k < k:
+        return _at_most([-x for x in lits], len(lits) - k, mapper, encoding)
+
+    clauses = []
+    out = _counter(lits, k, mapper, encoding, clauses)
+    if out is None:
+        return _at_most([-x for x in lits], len(lits) - k, mapper, "pairwise")
+    clauses.append([out[k - 1]])
+    return clauses
+
+
+def max_n_true(variables, n, mapper=None, encoding="auto"):
     """
     Takes an iterable of symbols, returns a CNF clause which allows
     at most n of them to be true at once.
+
+    Encodings other than "pairwise" introduce auxiliary variables, which
+    they get from mapper.fresh().  Pass one of cnf.encodings by name to
+    choose, or let "auto" pick the one that makes the fewest clauses.
     """
 
     # make sat-friendly (if not already)
     payload = _to_list(variables, mapper)
-
-    # make a cnf expr forbidding any of the ways to have too many
-    clauses = []
-    for microstate in combinations(payload, n + 1):
-        clause = list(map(lambda x: -x, microstate))
-        clauses.append(clause)
-    return clauses
+    return _at_most(payload, n, mapper, encoding)
 
 
-def min_n_true(variables, n, mapper=None):
+def min_n_true(variables, n, mapper=None, encoding="auto"):
     """
     Takes an iterable of ints, or an iterable of Symbols and a mapper.
     Returns a CNF expression that requires n of them to be true at once.
+
+    See max_n_true for the encoding kwarg.
     """
 
     # make sat-friendly (if not already)
     payload = _to_list(variables, mapper)
+    return _at_least(payload, n, mapper, encoding)
 
-    # make a dnf expr: OR(AND(),AND(),...,AND())
-    # which lists the way for there to be enough true variables
+
+def exactly_n_true(variables, n, mapper=None, encoding="auto"):
+    """
+    Like max_n_true and min_n_true together, but when an auxiliary
+    encoding is used they share a single counter.
+    """
+
+    payload = _to_list(variables, mapper)
+    if n < 0 or n > len(payload):
+        return [[]]
+    if n == 0:
+        return [[-x] for x in payload]
+    if n == len(payload):
+        return [[x] for x in payload]
+
+    clauses = []
+    out = _counter(payload, n + 1, mapper, encoding, clauses)
+    if out is None:
+        return _at_most(payload, n, mapper, "pairwise") + _at_least(
+            payload, n, mapper, "pairwise"
+        )
+    clauses.extend([[out[n - 1]], [-out[n]]])
+    return clauses
+
+
+# A grid is a list with one {char: variable} dict per position, the variable
+# being true iff that char goes at that position (like riddler's grid).
+
+
+def placements(words, grid, mapper):
+    """
+    For each word, and each start position where it fits, make a variable
+    that's true iff the word is spelled out at that start.  They're
+    defined in both directions, so they're determined by the grid.
+
+    Returns ({(word, start): variable}, clauses).  Words with a char that
+    the grid can't have at some position just aren't placed there.
+    """
+
+    placed = {}
+    clauses = []
+    for word in words:
+        for start in range(len(grid) - len(word) + 1):
+            try:
+                cells = [grid[start + i][c] for i, c in enumerate(word)]
+            except KeyError:
+                continue
+
+            if len(cells) == 1:
+                placed[(word, start)] = cells[0]
+                continue
+
+            # p <-> (cell & cell & ...)
+            p = mapper.fresh()
+            clauses.extend([[-p, x] for x in cells])
+            clauses.append([p] + [-x for x in cells])
+            placed[(word, start)] = p
+
+    return placed, clauses
+
+
+def cover(words, grid, mapper):
+    """
+    Require that every position of the grid is inside some placement of
+    one of the words (they can overlap).  Linear in the number of
+    placements times word length.
+    """
+
+    placed, clauses = placements(words, grid, mapper)
+
+    covering = [[] for _ in grid]
+    for (word, start), p in placed.items():
+        for i in range(len(word)):
+            covering[start + i].append(p)
+
+    # an empty clause here means nothing fits at that position: unsat
+    clauses.extend(covering)
+    return clauses
+
+
+def in_order(words, grid, mapper):
+    """
+    Require that the words are all spelled out in the grid, in the given
+    order, without overlapping (other stuff can go between them).
+
+    done[k][e] is true iff words[0..k] can be placed in order with words[k]
+    ending at or before position e.  It's a chain:
+
+        done[k][e] <-> done[k][e - 1] | (words[k] ends at e & done[k - 1][e - len])
+
+    so it's O(len(grid) * len(words)) aux variables, all determined by the
+    grid, plus whatever placements needs.
+    """
+
+    placed, clauses = placements(words, grid, mapper)
+
+    previous = None
+    for k, word in enumerate(words):
+        done = []
+        for end in range(len(grid)):
+            start = end - len(word) + 1
+            here = placed.get((word, start)) if start >= 0 else None
+
+            # the words before this one have to be done by the time it starts
+            if here is not None and k > 0:
+                before = previous[start - 1] if start > 0 else None
+                here = _and(here, before, mapper, clauses)
+
+            earlier = done[end - 1] if end > 0 else None
+            done.append(_or(earlier, here, mapper, clauses))
+        previous = done
+
+    if words:
+        # an empty clause if the last word can't be finished at all
+        last = previous[-1] if previous else None
+        clauses.append([] if last is None else [last])
+
+    return clauses
+
+
+def pronounce(automaton, grid, mapper):
+    """
+    Require that the grid spells something the automaton accepts.
+
+    The automaton is unrolled over the positions: state[t][q] is true iff
+    the automaton is in state q after reading t chars.  Each (state, char)
+    pair either implies the next state or is forbidden, and at most one
+    state is true per step, so the states are determined by the grid.
+    That's O(len(grid) * states * chars) clauses, fewer in practice since
+    only states that are reachable with the grid's chars get variables.
+
+    If automaton is None, automata.clusters() is used.
+    """
+
+    if automaton is None:
+        from tomriddle.automata import clusters
+
+        automaton = clusters()
+
+    start, accepting, transitions = automaton
+
+    # None means "certainly in this state", there's no choice at the start
+    states = {start: None}
     clauses = []
-    for microstate in combinations(payload, n):
-        clauses.append(list(microstate))
+    for cells in grid:
+        following = {}
+        for state, var in states.items():
+            for char, cell in cells.items():
+                nxt = transitions.get((state, char))
+                if nxt is None:
+                    # can't read char in this state
+                    clauses.append([-x for x in (var, cell) if x is not None])
+                    continue
+
+                if nxt not in following:
+                    following[nxt] = mapper.fresh()
+                clauses.append(
+                    [-x for x in (var, cell) if x is not None] + [following[nxt]]
+                )
+
+        # exactly one letter goes here, so this makes the states a function
+        clauses.extend(max_n_true(list(following.values()), 1, mapper=mapper))
+        states = following
+
+    # end up somewhere good
+    for state, var in states.items():
+        if state not in accepting:
+            clauses.append([] if var is None else [-var])
 
-    # convert it to cnf: AND(OR(),OR(),...,OR())
-    return from_dnf(clauses)
+    return clauses
 
 
 def _next_set(args):
@@ -131,7 +537,33 @@ def _setproduct(argsets):
                 yield frozenset({element}).union(factor)
 
 
-def from_dnf(dnf_clauses, mapper=None):
+def _tseitin(terms, mapper):
+    """
+    One aux variable per term, defined as the AND of that term, and then
+    a single clause requiring one of them.  Linear in the size of the DNF.
+    """
+
+    _require_pool(mapper, "tseitin")
+
+    clauses = []
+    some_term = []
+    for term in terms:
+        term = list(dict.fromkeys(term))
+        if len(term) == 1:
+            some_term.append(term[0])
+            continue
+
+        # t <-> (a & b & ...)
+        t = mapper.fresh()
+        clauses.extend([[-t, x] for x in term])
+        clauses.append([t] + [-x for x in term])
+        some_term.append(t)
+
+    clauses.append(some_term)
+    return clauses
+
+
+def from_dnf(dnf_clauses, mapper=None, tseitin=False):
     """
     Takes a DNF expression and returns a CNF expression
 
@@ -140,6 +572,11 @@ def from_dnf(dnf_clauses, mapper=None):
 
     For large expression the pre-deduplicated step becomes intractiable
     around four or five symbols, maybe this can be optimized.
+
+    With tseitin=True, it doesn't distribute at all.  Instead each term
+    gets an auxiliary variable from mapper.fresh() so the output grows
+    linearly with the input.  The aux variables are fully determined by
+    the originals, so the set of solutions (ignoring them) is the same.
     """
 
     if type(dnf_clauses) != list:
@@ -147,4 +584,7 @@ def from_dnf(dnf_clauses, mapper=None):
     else:
         clauses = dnf_clauses
 
+    if tseitin:
+        return _tseitin(clauses, mapper)
+
     return [list(x) for x in _setproduct(clauses)]
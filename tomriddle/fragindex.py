@@ -0,0 +1,108 @@
+"""
+Only fragments whose letters are a sub-multiset of the answer's letters
+can show up in a riddle for it.  This indexes fragments by their letter
+counts so that finding those is a couple of vectorized comparisons rather
+than a scan in python.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# a letter outside the alphabet sets this bit, and no answer has it set
+_OTHER = 1 << len(ALPHABET)
+
+
+def letter_counts(string):
+    """Returns (bitmask, counts) where counts has one entry per letter"""
+
+    counts = np.zeros(len(ALPHABET), dtype=np.uint8)
+    mask = 0
+    for char in string:
+        i = ord(char) - ord("a")
+        if 0 <= i < len(ALPHABET):
+            counts[i] = min(int(counts[i]) + 1, 255)
+            mask |= 1 << i
+        else:
+            mask |= _OTHER
+    return mask, counts
+
+
+class FragmentIndex:
+    """
+    Takes fragment tables, either {fragment: count} mappings or plain
+    lists of fragments (which count once each).  A fragment in more than
+    one table gets the sum of its counts.
+    """
+
+    def __init__(self, *tables):
+        merged = {}
+        for table in tables:
+            if isinstance(table, Mapping):
+                for fragment, count in table.items():
+                    merged[fragment] = merged.get(fragment, 0) + count
+            else:
+                for fragment in table:
+                    merged[fragment] = merged.get(fragment, 0) + 1
+
+        self.fragments = list(merged)
+        self.frequencies = np.fromiter(
+            merged.values(), dtype=np.int64, count=len(merged)
+        )
+
+        # which letters each fragment has, and how many of each
+        # (all at once: one long array of code points, tagged by fragment)
+        size = len(ALPHABET) + 1
+        lengths = np.fromiter(map(len, self.fragments), dtype=np.int64)
+        rows = np.repeat(np.arange(len(self.fragments)), lengths)
+        codes = np.frombuffer(
+            "".join(self.fragments).encode("utf-32-le"), dtype=np.uint32
+        )
+
+        # the last column counts letters outside the alphabet
+        columns = codes.astype(np.int64) - ord("a")
+        columns[(columns < 0) | (columns >= len(ALPHABET))] = len(ALPHABET)
+        cells = np.bincount(rows * size + columns, minlength=len(self.fragments) * size)
+        cells = cells.reshape(len(self.fragments), size)
+
+        self.letters = np.minimum(cells[:, :-1], 255).astype(np.uint8)
+        bits = np.uint32(1) << np.arange(size, dtype=np.uint32)
+        self.masks = ((cells > 0) * bits).sum(axis=1).astype(np.uint32)
+
+    @classmethod
+    def from_fragments(cls, fragments):
+        """Index every table in a Fragments"""
+
+        tables = [fragments.syllables, fragments.twoshort]
+        startend = fragments.startend
+        if isinstance(startend, tuple):
+            tables.extend(startend)
+        else:
+            tables.append(startend)
+        return cls(*tables)
+
+    def __len__(self):
+        return len(self.fragments)
+
+    def feasible(self, answer, min_count=0):
+        """
+        The fragments that could be made from the letters in answer (which
+        should already be clean), and that have been seen at least
+        min_count times.  Most frequent first.
+        """
+
+        mask, counts = letter_counts(answer)
+
+        # cheap: no letters that the answer doesn't have at all
+        candidates = np.nonzero((self.masks & ~np.uint32(mask)) == 0)[0]
+        if min_count:
+            candidates = candidates[self.frequencies[candidates] >= min_count]
+
+        # then: no more of any letter than the answer has
+        fits = (self.letters[candidates] <= counts).all(axis=1)
+        candidates = candidates[fits]
+
+        order = np.argsort(-self.frequencies[candidates], kind="stable")
+        return [self.fragments[i] for i in candidates[order]]
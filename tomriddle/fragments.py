@@ -1,15 +1,46 @@
 from pathlib import Path
-from collections import namedtuple
-from textwrap import dedent
-import json
+from collections import namedtuple, Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
+import os
+import re
 
-import pyphen
+from tomriddle.fragstore import FragmentTable, write_table
+
+# pyphen and nltk are imported when they're needed, not when this module is
+
+# where gen_default_fragments writes the tables, and get_default_fragments
+# finds them
+DATA_DIR = Path(__file__).parent / "data"
 
 Fragments = namedtuple("Fragments", "syllables twoshort startend")
 
 
+# how many words each worker gets at once
+CHUNK_WORDS = 100000
+
+# how much text to read at once
+CHUNK_CHARS = 1 << 20
+
+# delete the ascii characters that clean would skip
+_ASCII_JUNK = "".join(chr(c) for c in range(128) if not chr(c).isalpha())
+_DROP_JUNK = str.maketrans("", "", _ASCII_JUNK)
+
+# same, but keep whitespace so a chunk of text can still be split into words
+_DROP_JUNK_KEEP_SPACE = str.maketrans(
+    "", "", "".join(c for c in _ASCII_JUNK if not c.isspace())
+)
+
+
 def clean(in_word):
     """cast to lowercase alpha-only."""
+
+    # ascii is the usual case, translate does it without a python loop
+    word = in_word.translate(_DROP_JUNK)
+    if word.isascii():
+        return word.lower()
+
     chars = []
     for c in in_word:
         if c.isalpha():
@@ -17,94 +48,381 @@ def clean(in_word):
     return "".join(chars)
 
 
-def gen_default_fragments():
+def clean_text(text):
+    """Split a chunk of text into cleaned words, dropping empty ones."""
+
+    words = []
+    for in_word in text.translate(_DROP_JUNK_KEEP_SPACE).split():
+        word = in_word.lower() if in_word.isascii() else clean(in_word)
+        if word:
+            words.append(word)
+    return words
+
+
+def gen_default_fragments(hyphenation_cache=None):
     """
-    Writes syllabary_g.py, startend_g.py, and twoword_g.py for later import.
+    Writes syllables.frag, twoshort.frag, begins.frag and ends.frag into
+    DATA_DIR for later use (see fragstore.py for the format).
 
     Not called during normal usage, but used to generate hard-coded
     lists that are imported if the user doesn't supply a corpus of their
+
+    Pass a HyphenationCache to skip re-hyphenating words it has seen
+    before (and save() it afterwards).
     """
 
-    # get corpora
+    # get corpora (nltk reads these lazily)
     import nltk
 
     nltk.download("brown")
-    in_words = list(nltk.corpus.brown.words())
     nltk.download("gutenberg")
-    in_words += list(nltk.corpus.gutenberg.words())
+    in_words = chain(nltk.corpus.brown.words(), nltk.corpus.gutenberg.words())
 
     # clean words
-    words = []
-    for in_word in in_words:
-        word = clean(in_word)
-        if word:
-            words.append(word)
+    words = filter(None, map(clean, in_words))
+
+    # write tables
+    chunks = _chunked(words, CHUNK_WORDS)
+    fragments = count_fragments(chunks, hyphenation_cache=hyphenation_cache)
+    save_fragments(fragments, DATA_DIR)
+
 
-    # write modules
-    for generated_module, func in {
-        "syllables": gen_syllables,
-        "twoshort": gen_twoshort,
-        "startend": gen_startend,
+def save_fragments(fragments, data_dir=DATA_DIR):
+    """Write fragments where get_default_fragments(data_dir) will find them"""
+
+    begins, ends = fragments.startend
+    for name, table in {
+        "syllables": fragments.syllables,
+        "twoshort": fragments.twoshort,
+        "begins": begins,
+        "ends": ends,
     }.items():
-        fname = Path(__file__).parent / f"{generated_module}_g.py"
-        content = json.dumps(func(words), sort_keys=True)
-        with open(fname, "w") as f:
-            f.write(
-                dedent(
-                    f'''
-            import json
+        write_table(Path(data_dir) / f"{name}.frag", table)
 
-            def syllables():
-                """{func.__doc__}"""
-                return json.loads(\'\'\'
-                    {content}
-                 \'\'\')
-            '''
-                )
-            )
 
+def get_default_fragments(data_dir=DATA_DIR):
+    """
+    reads fragments from the files created by the function above.
 
-def get_default_fragments():
-    """reads fragments from the files created by the function above."""
-    import syllables_g as syl
-    import twoshort_g as two
-    import startend_g as se
+    They're memory-mapped, so this is cheap, and lookups only read what
+    they need.
 
-    syllables = syl.get()
-    twoshort = two.get()
-    startend = se.get()
+    The shipped ends.frag was written back when word endings weren't
+    counted, so it's empty until gen_default_fragments is run again.
+    """
 
-    return Fragments(syllables, twoshort, startend)
+    def table(name):
+        return FragmentTable(Path(data_dir) / f"{name}.frag")
 
+    return Fragments(
+        table("syllables"), table("twoshort"), (table("begins"), table("ends"))
+    )
 
-def get_fragments_from(open_file):
-    """reads fragments from a user-supplied file."""
 
-    lines = open_file.read.splitlines()
-    words = []
-    for in_word in lines.split(" "):
-        word = clean(in_word)
-        if word:
-            words.append(word)
+def get_fragments_from(open_file, workers=None, hyphenation_cache=None):
+    """
+    reads fragments from a user-supplied file.
+
+    The file is read a chunk at a time, so it can be bigger than memory.
+    See count_fragments for workers and hyphenation_cache.
+    """
+
+    return count_fragments(
+        read_words(open_file), workers=workers, hyphenation_cache=hyphenation_cache
+    )
+
+
+def read_words(text_stream):
+    """
+    Takes an open file, or an iterable of strings, and yields lists of
+    clean words.  A word that's split between two reads (or strings) is
+    put back together.
+    """
+
+    if hasattr(text_stream, "read"):
+        open_file = text_stream
+        text_stream = iter(lambda: open_file.read(CHUNK_CHARS), "")
+
+    carry = ""
+    for text in text_stream:
+
+        # the last word might continue into the next chunk
+        text = carry + text
+        cut = _LAST_WORD.search(text).start()
+        carry = text[cut:]
+        yield clean_text(text[:cut])
+
+    yield clean_text(carry)
+
+
+class FragmentUpdater:
+    """
+    Keeps running fragment counts, and adds new text to them without
+    recounting the old.  Start it from existing tables (say, the ones from
+    get_default_fragments) and call update() with each new batch.
+
+    twoshort counts pairs of adjacent words, so the updater remembers the
+    last word it saw: the pair made by one batch's last word and the next
+    batch's first word is counted too.  Pass previous to pick up from a
+    batch that some other updater counted.
+    """
+
+    def __init__(
+        self, existing=None, previous=None, workers=None, hyphenation_cache=None
+    ):
+        self.previous = previous
+        self.workers = workers
+        self.hyphenation_cache = hyphenation_cache
+
+        self.fragments = Fragments(Counter(), Counter(), (Counter(), Counter()))
+        if existing is not None:
+            self._merge(existing)
+
+    def _merge(self, fragments):
+        begins, ends = fragments.startend
+        self.fragments.syllables.update(dict(fragments.syllables.items()))
+        self.fragments.twoshort.update(dict(fragments.twoshort.items()))
+        self.fragments.startend[0].update(dict(begins.items()))
+        self.fragments.startend[1].update(dict(ends.items()))
+
+    def update(self, new_text_stream):
+        """
+        Count an open file (or iterable of strings) and add it to the
+        totals, which are returned as Fragments.
+        """
+
+        start = self.previous
+
+        def track(chunks):
+            for chunk in chunks:
+                if chunk:
+                    self.previous = chunk[-1]
+                yield chunk
+
+        new = count_fragments(
+            track(read_words(new_text_stream)),
+            workers=self.workers,
+            hyphenation_cache=self.hyphenation_cache,
+            previous=start,
+        )
+        self._merge(new)
+        return self.fragments
+
+
+def update_fragments(existing, new_text_stream, previous=None, **kwargs):
+    """
+    Returns existing fragments plus the counts from some new text.  See
+    FragmentUpdater, which is handier for more than one batch.
+    """
+
+    updater = FragmentUpdater(existing, previous=previous, **kwargs)
+    return updater.update(new_text_stream)
+
+
+_LAST_WORD = re.compile(r"\S*\Z")
+
+
+def _chunked(words, size):
+    """Group an iterable of words into lists of (at most) size words."""
+    words = iter(words)
+    while True:
+        chunk = list(islice(words, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _count_chunk(args, known=None):
+    """
+    Count all three tables for one chunk of words in a single pass.
+
+    previous is the word before the chunk (or None), so that twoshort
+    sees the pair that straddles the chunk boundary.  known is the
+    hyphenations that are already known, a pool worker has its own copy
+    in _known.
+
+    Also returns the hyphenations that weren't already known, so the
+    caller can hang on to them (see HyphenationCache).
+    """
+
+    words, previous = args
+    if known is None:
+        known = _known
+
+    twoshort = Counter()
+    for word in words:
+        if previous is not None:
+            _add_twoshort(twoshort, previous, word)
+        previous = word
+
+    # the rest doesn't care about order, so only look at each word once
+    word_counts = Counter(words)
+
+    syllables = Counter()
+    learned = {}
+    _count_syllables(syllables, word_counts, known, learned)
+
+    begins = Counter()
+    ends = Counter()
+    for word, count in word_counts.items():
+        _add_startend(begins, ends, word, count)
+
+    return syllables, twoshort, begins, ends, learned
+
+
+def _init_worker(known):
+    """Only in pool workers, so _known never outlives a pool"""
+    _known.update(known)
+
+
+def count_fragments(chunks, workers=None, hyphenation_cache=None, previous=None):
+    """
+    Takes an iterable of lists of clean words (consecutive chunks of one
+    corpus) and counts syllables, twoshort and startend in one pass.
+
+    Chunks are farmed out to a pool of workers processes (os.cpu_count()
+    if None), and their counts are merged as they come back.  Only a few
+    chunks are in flight at once, so memory stays bounded no matter how
+    big the corpus is.  workers=1 does it all in this process.
+
+    If a HyphenationCache is given, words it knows aren't hyphenated
+    again, and the ones it didn't know are added to it.
+
+    previous is the word before the first chunk, if there was one.
+    """
+
+    totals = Fragments(Counter(), Counter(), (Counter(), Counter()))
+    known = dict(hyphenation_cache or {})
+
+    def merge(counts):
+        syllables, twoshort, begins, ends, learned = counts
+        totals.syllables.update(syllables)
+        totals.twoshort.update(twoshort)
+        totals.startend[0].update(begins)
+        totals.startend[1].update(ends)
+        if hyphenation_cache is not None:
+            hyphenation_cache.update(learned)
+
+    def jobs(previous):
+        for chunk in chunks:
+            if chunk:
+                yield chunk, previous
+                previous = chunk[-1]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for job in jobs(previous):
+            merge(_count_chunk(job, known))
+        return totals
+
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(known,)
+    ) as pool:
+        in_flight = deque()
+        for job in jobs(previous):
+            in_flight.append(pool.submit(_count_chunk, job))
+            if len(in_flight) > 2 * workers:
+                merge(in_flight.popleft().result())
+        while in_flight:
+            merge(in_flight.popleft().result())
+
+    return totals
+
+
+# syllables have one of these
+VOWELS = frozenset("aeiouy")
 
-    syllables = gen_syllables(words)
-    twoshort = gen_twoshort(words)
-    startend = gen_startend(words)
+# how many hyphenations to remember, corpora are zipfian so this covers
+# most of the words that actually show up
+HYPHENATE_MEMO = 1 << 17
 
-    return Fragments(syllables, twoshort, startend)
+# a pool worker's copy of the hyphenations from a HyphenationCache, see
+# count_fragments
+_known = {}
 
 
-def gen_syllables(corpus):
+@lru_cache(maxsize=None)
+def _hyphenator():
+    import pyphen
+
+    return pyphen.Pyphen(lang="nl_NL")
+
+
+@lru_cache(maxsize=HYPHENATE_MEMO)
+def _hyphenate(word):
+    """Split a word into syllables, returns a tuple"""
+    return tuple(_hyphenator().inserted(word).split("-"))
+
+
+class HyphenationCache(dict):
+    """
+    A {word: syllables} dict that lives in a file between corpus rebuilds,
+    one word per line like: word<tab>syl-la-bles
+
+    Pass it to gen_syllables or count_fragments, then save() it.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    word, _, hyphenated = line.rstrip("\n").partition("\t")
+                    self[word] = tuple(hyphenated.split("-"))
+        except FileNotFoundError:
+            pass
+
+    def save(self):
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for word, syllables in self.items():
+                f.write(f"{word}\t{'-'.join(syllables)}\n")
+        os.replace(tmp, self.path)
+
+
+def _count_syllables(counts, word_counts, known, learned=None):
+    """
+    Hyphenate each distinct word once (unless it's known), and count its
+    syllables as many times as the word appears.  New hyphenations go in
+    learned.
+    """
+
+    for word, count in word_counts.items():
+        try:
+            syllables = known[word]
+        except KeyError:
+            syllables = _hyphenate(word)
+            if learned is not None:
+                learned[word] = syllables
+
+        for syl in syllables:
+            if not VOWELS.isdisjoint(syl):
+                counts[syl] = counts.get(syl, 0) + count
+
+
+def _add_startend(begins, ends, word, count=1):
+    for num in (3, 4):
+        if len(word) > num:
+            begins[word[:num]] = begins.get(word[:num], 0) + count
+            ends[word[-num:]] = ends.get(word[-num:], 0) + count
+
+
+def _add_twoshort(counts, word, nextword):
+    if 2 < len(word) + len(nextword) < 6:
+        twoshort = "".join([word, nextword])
+        counts[twoshort] = counts.get(twoshort, 0) + 1
+
+
+def gen_syllables(corpus, hyphenation_cache=None):
     """Short pronouncable fragments like wump, wroth, or wynd."""
 
-    lookup = pyphen.Pyphen(lang="nl_NL")
     syllable_counts = {}
-    for word in corpus:
-        syllables = lookup.inserted(word).split("-")
-        for syl in syllables:
-            if set(syl).intersection(set("aeiouy")):
-                syllable_counts.setdefault(syl, 0)
-                syllable_counts[syl] += 1
+    learned = {}
+    known = hyphenation_cache if hyphenation_cache is not None else {}
+    _count_syllables(syllable_counts, Counter(corpus), known, learned)
+    if hyphenation_cache is not None:
+        hyphenation_cache.update(learned)
 
     return syllable_counts
 
@@ -117,20 +435,8 @@ def gen_startend(corpus):
 
     begins = {}
     ends = {}
-
-    def add(store, partial_word):
-        """register the partial word and keep a count."""
-        store.setdefault(partial_word, 0)
-        store[partial_word] += 1
-
-    def scan(num):
-        """walk the corpus, gather partial words."""
-        for word in corpus:
-            if len(word) > num:
-                add(begins, word[:num])
-
-    scan(3)
-    scan(4)
+    for word in corpus:
+        _add_startend(begins, ends, word)
 
     return (begins, ends)
 
@@ -140,13 +446,10 @@ def gen_twoshort(corpus):
     isa, iam, goto."""
     twoshort_count = {}
     for word, nextword in zip(corpus, corpus[1:]):
-        if 2 < len(word) + len(nextword) < 6:
-            twoshort = "".join([word, nextword])
-            twoshort_count.setdefault(twoshort, 1)
-            twoshort_count[twoshort] += 1
+        _add_twoshort(twoshort_count, word, nextword)
 
     return twoshort_count
 
 
 if __name__ == "__main__":
-    gen_default_fragments()
\ No newline at end of file
+    gen_default_fragments()
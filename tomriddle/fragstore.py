@@ -0,0 +1,146 @@
+"""
+A compact on-disk format for fragment tables (string -> count).
+
+The generated tables used to be json strings in python modules, which
+meant parsing all of it into dicts before looking anything up.  These
+files are opened with mmap instead, so a lookup only touches the pages it
+needs and processes reading the same file share them.
+
+Layout, all integers little-endian:
+
+    magic       4 bytes, b"TRFT"
+    version     uint32
+    n           uint32, number of strings
+    blob_size   uint32, bytes of string data
+    offsets     (n + 1) int32, where each string starts in the blob
+    counts      n int32
+    blob        utf-8 strings, sorted bytewise, back to back
+"""
+
+from collections.abc import Mapping
+from pathlib import Path
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b"TRFT"
+VERSION = 1
+_HEADER = struct.Struct("<4sIII")
+
+
+def write_table(path, counts):
+    """Write a {string: count} mapping to path in the format above."""
+
+    keys = sorted(counts, key=lambda k: k.encode("utf-8"))
+    encoded = [k.encode("utf-8") for k in keys]
+
+    offsets = array("i", [0])
+    for e in encoded:
+        offsets.append(offsets[-1] + len(e))
+    values = array("i", [counts[k] for k in keys])
+    if sys.byteorder != "little":
+        offsets.byteswap()
+        values.byteswap()
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(keys), offsets[-1]))
+        f.write(offsets.tobytes())
+        f.write(values.tobytes())
+        for e in encoded:
+            f.write(e)
+    os.replace(tmp, path)
+
+
+class FragmentTable(Mapping):
+    """
+    A read-only {string: count} mapping backed by a file written by
+    write_table.  Nothing is parsed up front, lookups are binary searches
+    over the mapped file.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, n, blob_size = _HEADER.unpack(self._map[: _HEADER.size])
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} isn't a version {VERSION} fragment table")
+        self._n = n
+
+        start = _HEADER.size
+        end = start + 4 * (n + 1)
+        view = memoryview(self._map)
+        if sys.byteorder == "little":
+            self._offsets = view[start:end].cast("i")
+            self._counts = view[end : end + 4 * n].cast("i")
+        else:
+            # can't cast to the wrong endianness, so these get copied
+            self._offsets = array("i", view[start:end])
+            self._offsets.byteswap()
+            self._counts = array("i", view[end : end + 4 * n])
+            self._counts.byteswap()
+        self._blob = view[end + 4 * n : end + 4 * n + blob_size]
+
+    def __reduce__(self):
+        # worker processes reopen the file (and share its pages)
+        return (FragmentTable, (self.path,))
+
+    def _bytes(self, i):
+        return self._blob[self._offsets[i] : self._offsets[i + 1]].tobytes()
+
+    def key(self, i):
+        """The i'th string, in sorted order"""
+        return self._bytes(i).decode("utf-8")
+
+    def _bisect(self, target):
+        """Index of the first string that isn't less than target (bytes)"""
+
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __getitem__(self, key):
+        target = key.encode("utf-8")
+        i = self._bisect(target)
+        if i < self._n and self._bytes(i) == target:
+            return self._counts[i]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except (KeyError, AttributeError):
+            return False
+        return True
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self.key(i)
+
+    def items(self):
+        for i in range(self._n):
+            yield self.key(i), self._counts[i]
+
+    def prefixed(self, prefix):
+        """Iterate (string, count) for the strings that start with prefix"""
+
+        target = prefix.encode("utf-8")
+        for i in range(self._bisect(target), self._n):
+            found = self._bytes(i)
+            if not found.startswith(target):
+                return
+            yield found.decode("utf-8"), self._counts[i]
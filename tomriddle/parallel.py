@@ -0,0 +1,287 @@
+"""
+Cube-and-conquer: split the riddles up by how they start (the cubes), and
+have a pool of worker processes each find the riddles in a few cubes.
+Cubes don't overlap, so there's no need to de-duplicate.
+
+Workers send their riddles back through a queue as they find them, a few
+at a time, so the first ones turn up long before a big cube is done.
+"""
+
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+import multiprocessing
+import os
+import queue
+import time
+
+# enough cubes that no worker sits idle while another finishes a big one
+CUBES_PER_WORKER = 8
+
+# the deepest prefix a cube is made of
+MAX_DEPTH = 4
+
+# workers send riddles back this many at a time, or sooner if they're slow
+# to come
+BATCH = 64
+BATCH_SECONDS = 0.1
+
+# how many batches can wait in the queue before the workers hold off
+QUEUE_PER_WORKER = 4
+
+# the search engine checks for a stop this often (in steps)
+STOP_EVERY = 256
+
+# this worker's copy of the problem, a function from prefix to riddles that
+# gives up once _stop is set, and where its riddles go
+_problem = None
+_results = None
+_stop = None
+
+
+def prefixes(letters, depth):
+    """Every distinct way to spell the first depth letters, in order"""
+
+    left = Counter(letters)
+    chars = sorted(left)
+
+    def extend(prefix):
+        if len(prefix) == depth:
+            yield prefix
+            return
+        for char in chars:
+            if left[char]:
+                left[char] -= 1
+                yield from extend(prefix + char)
+                left[char] += 1
+
+    return list(extend(""))
+
+
+def cubes(letters, workers):
+    """Prefixes, just long enough that there are plenty for the workers"""
+
+    depth = 0
+    found = [""]
+    while len(found) < CUBES_PER_WORKER * workers and depth < len(letters):
+        depth += 1
+        found = prefixes(letters, depth)
+        if depth == MAX_DEPTH:
+            break
+    return found
+
+
+def _init_worker(
+    engine, letters, fragments, substrings, min_count, pronounce, backend, results, stop
+):
+    """Build the problem once per worker, not once per cube"""
+
+    global _problem, _results, _stop
+
+    from tomriddle import tomriddle
+    from tomriddle.budget import Budget
+
+    _results, _stop = results, stop
+
+    # if the pool is shut down early, whatever's still on its way can be
+    # dropped, rather than keeping the worker from exiting
+    results.cancel_join_thread()
+
+    if engine == "sat":
+        instance = tomriddle._sat_instance(
+            letters, fragments, substrings, min_count, pronounce
+        )
+
+        def _problem(prefix):
+            # checked between riddles
+            return tomriddle._sat(instance, prefix, backend, Budget(cancel=stop))
+
+    else:
+        from tomriddle.search import search
+
+        candidates = None
+        if fragments is not None:
+            candidates = tomriddle._candidates(letters, fragments, min_count)
+
+        def _problem(prefix):
+            steps = count()
+
+            def stopped():
+                return next(steps) % STOP_EVERY == 0 and stop.is_set()
+
+            return search(letters, candidates, substrings, pronounce, prefix, stopped)
+
+
+def _put(message):
+    """Send message back, unless told to stop first.  Whether it was sent."""
+
+    while not _stop.is_set():
+        try:
+            _results.put(message, timeout=BATCH_SECONDS)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _conquer(prefix, limit):
+    """
+    Send back ("riddles", prefix, [riddle, ...]) for all of a cube's
+    riddles, or the first limit of them, a batch at a time.  Then ("done",
+    prefix, whether those were all of them), unless told to stop first.
+    """
+
+    batch = []
+    sent = time.monotonic()
+    found = 0
+    for riddle in islice(_problem(prefix), limit):
+        batch.append(riddle)
+        found += 1
+        if len(batch) == BATCH or time.monotonic() - sent > BATCH_SECONDS:
+            if not _put(("riddles", prefix, batch)):
+                return
+            batch = []
+            sent = time.monotonic()
+
+    if _stop.is_set():
+        # cut short, and nobody's waiting for the rest
+        return
+    if batch and not _put(("riddles", prefix, batch)):
+        return
+    _put(("done", prefix, limit is None or found < limit))
+
+
+def _receive(results, running):
+    """The next message from the workers, or a worker's exception"""
+
+    while True:
+        try:
+            return results.get(timeout=BATCH_SECONDS)
+        except queue.Empty:
+            for future in running.values():
+                if future.done():
+                    future.result()
+
+
+def conquer(
+    engine,
+    letters,
+    fragments,
+    substrings,
+    min_count,
+    pronounce,
+    workers=None,
+    limit=None,
+    ordered=False,
+    backend=None,
+    done=(),
+    seen=frozenset(),
+    finished=None,
+):
+    """
+    Yield riddles from a pool of workers (os.cpu_count() if None), as they
+    find them.
+
+    If ordered, the cubes' riddles come out in the order of their prefixes,
+    otherwise in whatever order they turn up.  After limit riddles, or if
+    whoever's iterating stops early, the running workers are told to stop
+    and the cubes that haven't started are cancelled.  Only a few cubes are
+    in flight at once, and the queue of riddles on their way back is
+    bounded, so memory stays in check.  Except with ordered: the riddles of
+    cubes that get ahead of their turn are held on to until then.
+
+    Each worker gets its own copy of backend, so its stats stay there.
+
+    To carry on from an earlier run (see checkpoint.py): cubes that start
+    with one of the done prefixes are skipped, and riddles that are in
+    seen, or start with a done prefix, are dropped.  finished is called
+    with each cube's prefix once all of its riddles have been yielded.
+    """
+
+    if limit is not None and limit <= 0:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    done = tuple(done)
+    todo = [prefix for prefix in cubes(letters, workers) if not prefix.startswith(done)]
+
+    # a cube's riddles that are already out don't count towards its limit
+    already = Counter()
+    if seen and todo:
+        depth = len(todo[0])
+        already.update(riddle[:depth] for riddle in seen)
+    todo = deque(todo)
+
+    context = multiprocessing.get_context()
+    results = context.Queue(QUEUE_PER_WORKER * workers)
+    stop = context.Event()
+    problem = (engine, letters, fragments, substrings, min_count, pronounce, backend)
+
+    # {prefix: future} for the cubes in flight, in the order they started
+    running = {}
+    # with ordered, {prefix: riddles} for cubes that are ahead of their turn,
+    # and {prefix: complete} for the ones that are done
+    waiting = {}
+    complete = {}
+    found = 0
+
+    def keep(riddles):
+        nonlocal found
+        for riddle in riddles:
+            if riddle not in seen and not riddle.startswith(done):
+                yield riddle
+                found += 1
+                if found == limit:
+                    return
+
+    def retire(prefix, whole):
+        del running[prefix]
+        if whole and finished is not None:
+            finished(prefix)
+
+    pool = ProcessPoolExecutor(
+        workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=problem + (results, stop),
+    )
+    try:
+        while todo or running:
+            while todo and len(running) < 2 * workers:
+                prefix = todo.popleft()
+                cube_limit = limit and limit + already[prefix]
+                running[prefix] = pool.submit(_conquer, prefix, cube_limit)
+
+            kind, prefix, payload = _receive(results, running)
+            head = next(iter(running))
+
+            if kind == "riddles":
+                if ordered and prefix != head:
+                    waiting.setdefault(prefix, []).extend(payload)
+                    continue
+                yield from keep(payload)
+                if found == limit:
+                    return
+
+            elif not ordered:
+                retire(prefix, payload)
+
+            else:
+                complete[prefix] = payload
+                # the cube whose turn it is might be done, and the next few
+                while running and head in complete:
+                    yield from keep(waiting.pop(head, ()))
+                    if found == limit:
+                        return
+                    retire(head, complete.pop(head))
+                    if running:
+                        head = next(iter(running))
+                        yield from keep(waiting.pop(head, ()))
+                        if found == limit:
+                            return
+    finally:
+        # tell running workers to give up, rather than wait for them to finish
+        stop.set()
+        for future in running.values():
+            future.cancel()
+        pool.shutdown(wait=True)
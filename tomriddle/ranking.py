@@ -0,0 +1,209 @@
+"""
+Best-first riddle generation: partial riddles are scored with n-gram
+log-probabilities from the fragment tables, and the most promising one is
+extended first, so riddles come out best-first instead of in whatever
+order the SAT solver finds them.
+"""
+
+from collections import Counter
+from heapq import heappush, heappop, nsmallest
+from itertools import count
+from math import log
+
+from tomriddle.automata import ALPHABET, ngram_counts
+from tomriddle.search import build_trie, _needs, _step_cover, _step_order
+
+# ranked() keeps this many partial riddles by default, so memory stays in
+# check for long answers, at the cost of skipping some riddles
+FRONTIER = 1000
+
+# ... or this many per riddle asked for, if that's more
+FRONTIER_PER_RIDDLE = 10
+
+
+class NgramScorer:
+    """
+    Log-probability of a char given the few chars before it, with add-one
+    smoothing, learned from the n-grams inside a Fragments' tables.
+
+    At the start of a riddle there's less context, so it falls back to the
+    shorter n-grams.
+    """
+
+    def __init__(self, fragments, n=3, alphabet=ALPHABET):
+        self.n = n
+
+        # counts[m] holds the m-grams, counts[0] the total number of chars
+        self.counts = [None] + [ngram_counts(fragments, m) for m in range(1, n + 1)]
+        self.counts[0] = Counter({"": sum(self.counts[1].values())})
+        self.alphabet = set(alphabet) | set(self.counts[1])
+
+    def best(self, letters):
+        """
+        The best each of these letters could possibly score, if the chars
+        before it are some of these letters too.
+        """
+
+        letters = set(letters)
+        size = len(self.alphabet)
+        best = {char: log(1 / size) for char in letters}
+        for m in range(1, self.n + 1):
+            for gram, seen in self.counts[m].items():
+                if letters.issuperset(gram):
+                    given = self.counts[m - 1][gram[:-1]]
+                    score = log((seen + 1) / (given + size))
+                    best[gram[-1]] = max(best[gram[-1]], score)
+        return best
+
+    def __call__(self, context, char):
+        """Score char, which follows context."""
+
+        context = context[len(context) - self.n + 1 :] if self.n > 1 else ""
+        seen = self.counts[len(context) + 1].get(context + char, 0)
+        given = self.counts[len(context)].get(context, 0)
+        return log((seen + 1) / (given + len(self.alphabet)))
+
+    def score(self, riddle):
+        """Score a whole (or partial) riddle."""
+        return sum(self(riddle[:i], char) for i, char in enumerate(riddle))
+
+
+def frontier_for(top_k):
+    """ranked()'s default frontier, for top_k riddles (or None for all)"""
+
+    if top_k is None:
+        return FRONTIER
+    return max(FRONTIER, FRONTIER_PER_RIDDLE * top_k)
+
+
+def ranked(
+    letters,
+    scorer,
+    top_k=None,
+    automaton=None,
+    accept=None,
+    frontier="auto",
+    stop=None,
+    fragments=None,
+    substrings=(),
+):
+    """
+    Yield (riddle, score) for permutations of letters, highest score first.
+
+    The search is A*: a partial riddle's priority is its score so far plus
+    the best its remaining letters could possibly score, so complete
+    riddles come off the heap in order.  Only the queue of partial riddles
+    is held in memory, never the solutions.
+
+    top_k stops after that many riddles.  automaton (a cnf.Automaton),
+    fragments and substrings are like search.search's, and prefixes that
+    can't satisfy them are pruned as the riddles are spelled out.  accept
+    is called on each complete riddle, only the ones it returns True for
+    are yielded.
+
+    frontier bounds the queue: the worst partial riddles are dropped when
+    it gets twice that long.  "auto" (the default) is frontier_for(top_k).
+    That's lossy: riddles that would have come from the dropped ones are
+    skipped, possibly including some of the best ones, and top_k is only
+    approximate.  What does come out is still in order.  frontier=None
+    keeps every partial riddle, so the results are exact, but for long
+    answers that takes a lot of memory, and a long time to get to the
+    first riddle.
+
+    stop is called before each step, the search ends once it returns True.
+    """
+
+    if top_k is not None and top_k <= 0:
+        return
+    if frontier == "auto":
+        frontier = frontier_for(top_k)
+
+    chars = sorted(set(letters))
+    index = {char: i for i, char in enumerate(chars)}
+    remaining = Counter(letters)
+    left = tuple(remaining[char] for char in chars)
+    best = scorer.best(chars)
+    bound = sum(best[char] for char in letters)
+
+    trie = build_trie(fragments) if fragments is not None else None
+    substrings = list(substrings)
+    needs = _needs(substrings)
+
+    def short(needed, left):
+        """Whether the letters left can't supply what's needed"""
+        return any(c not in index or left[index[c]] < n for c, n in needed)
+
+    if substrings and short(needs[0][0], left):
+        return
+
+    start = automaton.start if automaton is not None else None
+
+    # (-(score + bound), tiebreak, score, bound, riddle, left, state, cover,
+    # order), cover is (active, covered) and order is (k, partial), see search
+    tiebreak = count()
+    heap = [(-bound, next(tiebreak), 0.0, bound, "", left, start, ({}, 0), (0, (0,)))]
+
+    found = 0
+    while heap:
+        if stop is not None and stop():
+            return
+
+        _, _, score, bound, riddle, left, state, cover, order = heappop(heap)
+        position = len(riddle)
+
+        if position == len(letters):
+            finished = trie is None or cover[1] == position
+            finished = finished and order[0] == len(substrings)
+            if finished and (accept is None or accept(riddle)):
+                if automaton is None or state in automaton.accepting:
+                    yield riddle, score
+                    found += 1
+                    if found == top_k:
+                        return
+            continue
+
+        for i, char in enumerate(chars):
+            if not left[i]:
+                continue
+
+            next_state = None
+            if automaton is not None:
+                next_state = automaton.transitions.get((state, char))
+                if next_state is None:
+                    continue
+
+            next_left = left[:i] + (left[i] - 1,) + left[i + 1 :]
+
+            next_cover = cover
+            if trie is not None:
+                next_cover = _step_cover(trie, *cover, position, char)
+                if next_cover[0] is None:
+                    continue
+
+            next_order = order
+            if order[0] < len(substrings):
+                next_order = _step_order(substrings, *order, char)
+                k, partial = next_order
+                if k < len(substrings) and short(needs[k][max(partial)], next_left):
+                    continue
+
+            next_score = score + scorer(riddle, char)
+            next_bound = bound - best[char]
+            heappush(
+                heap,
+                (
+                    -(next_score + next_bound),
+                    next(tiebreak),
+                    next_score,
+                    next_bound,
+                    riddle + char,
+                    next_left,
+                    next_state,
+                    next_cover,
+                    next_order,
+                ),
+            )
+
+        if frontier is not None and len(heap) > 2 * frontier:
+            # a sorted list is a heap
+            heap = nsmallest(frontier, heap)
@@ -1,13 +1,18 @@
 import json
+import os
 import re
-
-from sympy.logic.boolalg import is_cnf, to_cnf
-from sympy.parsing.sympy_parser import parse_expr
-from sympy import Symbol, Not
+import subprocess
+import tempfile
+import time
+from array import array
 
 from collections import namedtuple
 from tomriddle import cnf
 
+# sympy, numpy and pycosat are imported by the functions that need them.
+# riddler's hot path deals in plain ints and shouldn't pay for sympy, and
+# nobody should pay for any of them just to start the cli
+
 
 # used to transform strings like
 #     x & (y | z)
@@ -17,21 +22,47 @@ from tomriddle import cnf
 syntax_map = {"(": "[", ")": "]", "|": ",", "&": ",", "~": "-"}
 
 
-class SymbolMapper:
+class VarPool:
+    """
+    Hands out integers for variables that have no Symbol, starting after
+    the ones that are already spoken for.
+    """
+
+    def __init__(self, top=0):
+        self.top = top
+
+    def fresh(self):
+        """Allocate a variable, returns its integer"""
+        self.top += 1
+        return self.top
+
+
+class SymbolMapper(VarPool):
     """
     Initialize this with a list of all your symbols.
     It translates between sympy Symbols strings and integers
+
+    It also hands out fresh integers for auxiliary variables, which are
+    numbered after the symbols and have no Symbol of their own.
     """
 
     def __init__(self, symbs):
+        super().__init__(top=len(symbs))
         self.symbols = symbs
         self.symbstr2symb = {str(s): s for s in symbs}
         self.symbstr2symb.update({str(~s): ~s for s in symbs})
         self.symbstr2int = {str(s): i + 1 for i, s in enumerate(symbs)}
         self.symbstr2int.update({str(~s): -(i + 1) for i, s in enumerate(symbs)})
 
+        # symbols hash fine on their own, no need to format them as strings
+        self.symb2int = {s: i + 1 for i, s in enumerate(symbs)}
+        self.symb2int.update({~s: -(i + 1) for i, s in enumerate(symbs)})
+
     def to_int(self, symb):
-        return self.symbstr2int[str(symb)]
+        try:
+            return self.symb2int[symb]
+        except KeyError:
+            return self.symbstr2int[str(symb)]
 
     def to_symb(self, it):
 
@@ -48,12 +79,405 @@ class SymbolMapper:
         return self.symbstr2symb[string]
 
 
+class Decoder:
+    """
+    Turns models into riddle strings.  Initialize it with a dict like
+    {variable: (position, char)} for the variables that spell things out,
+    any other variables (aux, say) are ignored.
+
+    decode takes one model at a time with a plain python loop, which is
+    what riddler does.  decode_many does a batch of them with numpy, its
+    tables are built the first time it's called.
+    """
+
+    def __init__(self, cells):
+        self.top = max(cells, default=0)
+        self.length = 1 + max((pos for pos, _ in cells.values()), default=-1)
+
+        # indexed by variable, -1 for variables that aren't cells
+        self.positions = array("i", [-1] * (self.top + 1))
+        self.chars = [""] * (self.top + 1)
+        for var, (pos, char) in cells.items():
+            self.positions[var] = pos
+            self.chars[var] = char
+
+        # numpy versions of those, see _tables
+        self._np_positions = self._np_codes = None
+
+    @classmethod
+    def from_symbols(cls, symbols):
+        """For symbols named like str_to_symb names them"""
+
+        regexpr = re.compile(r"^([0-9]+)\.([^.]+)\.([0-9]+)$")
+        cells = {}
+        for i, symb in enumerate(symbols):
+            match = regexpr.match(str(symb))
+            cells[i + 1] = (int(match.group(3)), match.group(2))
+        return cls(cells)
+
+    def decode(self, model):
+        """Given a list of ints (like pycosat gives), make a string"""
+
+        out = [""] * self.length
+        top, positions, chars = self.top, self.positions, self.chars
+        for lit in model:
+            if 0 < lit <= top:
+                pos = positions[lit]
+                if pos >= 0:
+                    out[pos] = chars[lit]
+        return "".join(out)
+
+    def _tables(self):
+        """positions, and each cell's char as a code point, as numpy arrays"""
+
+        import numpy as np
+
+        if self._np_positions is None:
+            self._np_positions = np.asarray(self.positions, dtype=np.int32)
+            self._np_codes = np.array(
+                [ord(char) if char else 0 for char in self.chars], dtype=np.uint32
+            )
+        return self._np_positions, self._np_codes
+
+    def decode_many(self, models):
+        """
+        Like decode, but for a batch of same-length models (a list of
+        lists, or a 2d array), returns a list of strings.
+        """
+
+        import numpy as np
+
+        models = np.asarray(models, dtype=np.int64)
+        if models.size == 0:
+            return []
+
+        positions, codes = self._tables()
+
+        # variable 0 doesn't exist, so it's never a cell
+        lits = np.where((models > 0) & (models <= self.top), models, 0)
+        pos = positions[lits]
+        rows, cols = np.nonzero(pos >= 0)
+
+        out = np.zeros((len(models), self.length), dtype=np.uint32)
+        out[rows, pos[rows, cols]] = codes[lits[rows, cols]]
+
+        text = out.tobytes().decode("utf-32-le")
+        step = self.length
+        return [text[i : i + step] for i in range(0, len(text), step)]
+
+
+def to_flat(clauses):
+    """
+    Pack a list of clauses into a single array of 32 bit ints, each
+    clause terminated by a zero (like DIMACS, without the text).
+    """
+
+    flat = array("i")
+    for clause in clauses:
+        flat.extend(clause)
+        flat.append(0)
+    return flat
+
+
+def from_flat(flat):
+    """Unpack the output of to_flat into a list of tuples"""
+
+    clauses = []
+    clause = []
+    for lit in flat:
+        if lit:
+            clause.append(lit)
+        else:
+            clauses.append(tuple(clause))
+            clause = []
+    return clauses
+
+
+def write_dimacs(clauses, out, top=None, comments=(), count=None):
+    """
+    Write clauses to an open text file in DIMACS cnf format.
+
+    The header needs the number of variables and clauses up front.  Pass
+    top (the highest variable) to skip a pass over a list, or an array
+    from to_flat.  Clauses can also be any iterable, like a generator: if
+    top and count (how many clauses) aren't both given, they're written to
+    a temporary file first and counted on the way.  The clauses go out in
+    batches, not as one big string.
+    """
+
+    if isinstance(clauses, array):
+        clauses = from_flat(clauses)
+
+    if count is None and hasattr(clauses, "__len__"):
+        count = len(clauses)
+        if top is None:
+            top = max((abs(lit) for clause in clauses for lit in clause), default=0)
+
+    if top is None or count is None:
+        import shutil
+        import tempfile
+
+        with tempfile.TemporaryFile("w+") as body:
+            count, top = _write_clauses(clauses, body)
+            _write_header(out, top, count, comments)
+            body.seek(0)
+            shutil.copyfileobj(body, out)
+        return
+
+    _write_header(out, top, count, comments)
+    _write_clauses(clauses, out)
+
+
+def _write_header(out, top, count, comments):
+    for comment in comments:
+        out.write(f"c {comment}\n")
+    out.write(f"p cnf {top} {count}\n")
+
+
+def _write_clauses(clauses, out):
+    """Write the clause lines, returns how many there were and the top var"""
+
+    count = top = 0
+    batch = []
+    for clause in clauses:
+        batch.append(" ".join(map(str, clause)) + " 0\n")
+        top = max(top, max(map(abs, clause), default=0))
+        count += 1
+        if len(batch) == 10000:
+            out.write("".join(batch))
+            batch = []
+    out.write("".join(batch))
+    return count, top
+
+
+def read_dimacs(in_file):
+    """
+    Yield the clauses (lists of ints) in an open DIMACS cnf file, a line
+    at a time.  Comments and the header are skipped, and clauses can
+    span lines.
+    """
+
+    clause = []
+    for line in in_file:
+        line = line.strip()
+        if not line or line[0] in "cp":
+            continue
+        if line[0] == "%":
+            # some benchmark sets end like this
+            break
+        for lit in map(int, line.split()):
+            if lit:
+                clause.append(lit)
+            else:
+                yield clause
+                clause = []
+    if clause:
+        yield clause
+
+
+class PycosatBackend:
+    """
+    Solves with pycosat, in process.  Backends return what pycosat does: a
+    list of ints, "UNSAT" or "UNKNOWN".
+
+    pycosat has no assumptions, so they're added as unit clauses (and it
+    has to start from scratch anyway).  stats keeps count of calls,
+    solutions and seconds spent solving.
+    """
+
+    name = "pycosat"
+
+    def __init__(self, prop_limit=0):
+        self.prop_limit = prop_limit
+        self.stats = {"calls": 0, "solutions": 0, "seconds": 0.0}
+
+    def _with(self, clauses, assumptions):
+        if not assumptions:
+            return clauses
+        return list(clauses) + [[lit] for lit in assumptions]
+
+    def solve(self, clauses, assumptions=(), prop_limit=None, timeout=None):
+        """
+        prop_limit overrides the one this was made with.  pycosat can't
+        watch a clock, so timeout is ignored, use prop_limit to keep it
+        short.
+        """
+
+        import pycosat
+
+        if prop_limit is None:
+            prop_limit = self.prop_limit
+
+        start = time.perf_counter()
+        solution = pycosat.solve(
+            self._with(clauses, assumptions), prop_limit=prop_limit
+        )
+        self._count(start, type(solution) == list)
+        return solution
+
+    def itersolve(self, clauses, assumptions=(), remaining=None):
+        """
+        Every solution, each one blocked by negating all of it.  pycosat
+        keeps what it learned from one to the next.
+
+        remaining (if given) is called before each solution, it says how
+        many seconds are left to find it.  pycosat can't be interrupted,
+        so then it runs in a child process, which is stopped if the time
+        runs out first.
+        """
+
+        clauses = self._with(clauses, assumptions)
+        if remaining is not None:
+            yield from self._itersolve_clocked(clauses, remaining)
+            return
+
+        import pycosat
+
+        solutions = pycosat.itersolve(clauses, prop_limit=self.prop_limit)
+        while True:
+            start = time.perf_counter()
+            solution = next(solutions, None)
+            self._count(start, solution is not None)
+            if solution is None:
+                return
+            yield solution
+
+    def _itersolve_clocked(self, clauses, remaining):
+        """itersolve, in a child process that's stopped when time's up"""
+
+        import multiprocessing
+
+        receive, send = multiprocessing.Pipe(duplex=False)
+        child = multiprocessing.Process(
+            target=_send_solutions,
+            args=(clauses, self.prop_limit, send),
+            daemon=True,
+        )
+        child.start()
+        send.close()
+        try:
+            while True:
+                start = time.perf_counter()
+                left = remaining()
+                solution = None
+                if receive.poll(None if left is None else max(left, 0)):
+                    solution = receive.recv()
+                self._count(start, solution is not None)
+                if solution is None:
+                    return
+                yield solution
+        finally:
+            child.terminate()
+            child.join()
+            receive.close()
+
+    def _count(self, start, solved):
+        self.stats["calls"] += 1
+        self.stats["solutions"] += solved
+        self.stats["seconds"] += time.perf_counter() - start
+
+
+def _send_solutions(clauses, prop_limit, send):
+    """pycosat.itersolve in a child process, None when it's done"""
+
+    import pycosat
+
+    for solution in pycosat.itersolve(clauses, prop_limit=prop_limit):
+        send.send(solution)
+    send.send(None)
+
+
+class SubprocessBackend(PycosatBackend):
+    """
+    Solves with some other solver binary, like kissat or cadical.  It's
+    given a DIMACS file as its last argument, and is expected to answer
+    like the SAT competition asks: an "s SATISFIABLE" line, and the model
+    on "v" lines.
+
+    Each call is a fresh process, so itersolve adds a blocking clause and
+    starts over for each solution.
+    """
+
+    def __init__(self, command, timeout=None):
+        super().__init__()
+        self.command = [command] if type(command) == str else list(command)
+        self.name = os.path.basename(self.command[0])
+        self.timeout = timeout
+
+    def solve(self, clauses, assumptions=(), prop_limit=None, timeout=None):
+        """timeout overrides the one this was made with, prop_limit is ignored"""
+
+        start = time.perf_counter()
+        clauses = self._with(clauses, assumptions)
+        if timeout is None:
+            timeout = self.timeout
+
+        fd, path = tempfile.mkstemp(suffix=".cnf")
+        try:
+            with os.fdopen(fd, "w") as f:
+                write_dimacs(clauses, f)
+            try:
+                done = subprocess.run(
+                    self.command + [path],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+                solution = _parse_solver_output(done.stdout)
+            except subprocess.TimeoutExpired:
+                solution = "UNKNOWN"
+        finally:
+            os.unlink(path)
+
+        self._count(start, type(solution) == list)
+        return solution
+
+    def itersolve(self, clauses, assumptions=(), remaining=None):
+        """
+        Every solution, starting over for each.  remaining (if given) is
+        called before each solve, it says how many seconds that solve gets.
+        """
+
+        clauses = self._with(clauses, assumptions)
+        clauses = list(clauses)
+        while True:
+            timeout = remaining() if remaining is not None else None
+            solution = self.solve(clauses, timeout=timeout)
+            if type(solution) != list:
+                return
+            yield solution
+            if not solution:
+                return
+            clauses.append([-lit for lit in solution])
+
+
+def _parse_solver_output(text):
+    """Read a competition-style answer, pycosat-style"""
+
+    status = "UNKNOWN"
+    model = []
+    for line in text.splitlines():
+        if line.startswith("s "):
+            status = line[2:].strip()
+        elif line.startswith("v "):
+            model.extend(int(lit) for lit in line[2:].split() if lit != "0")
+
+    if status == "SATISFIABLE":
+        return sorted(model, key=abs)
+    elif status == "UNSATISFIABLE":
+        return "UNSAT"
+    return "UNKNOWN"
+
+
 def expr_to_satfmt(expr, mapper, convert_cnf=True):
     """
     Takes a sympy formula in CNF, return a list of lists of integers for
     use with pycosat
     """
 
+    from sympy.logic.boolalg import is_cnf, to_cnf
+    from sympy import Symbol, Not
+
     # ensure CNF
     cnf_expr = None
     if convert_cnf and not is_cnf(expr):
@@ -124,29 +548,16 @@ def satout_to_str(int_list, symbols):
       -21, -22, -23,  24, -25, ]
 
     Produce strings like "OHELL"
-    """
-
-    # gather symbols and indices
-    idx2str = []
-    regexpr = re.compile(r"^([0-9])+\.([^.]+)\.([0-9]+)$")
-    for true_symb_num in filter(lambda x: x > 0, int_list):
-
-        # parse symbol string
-        symb_idx = true_symb_num - 1
-        symb_str = str(symbols[symb_idx])
-        match = regexpr.match(symb_str)
 
-        # register mapping
-        string = match.group(2)
-        idx = match.group(3)
-        idx2str.append((idx, string))
+    symbols can also be a Decoder, which saves building one per call.
+    """
 
-    # make a string
-    out = []
-    for _, string in sorted(idx2str):
-        out.append(string)
+    if isinstance(symbols, Decoder):
+        decoder = symbols
+    else:
+        decoder = Decoder.from_symbols(symbols)
 
-    return "".join(out)
+    return decoder.decode(int_list)
 
 
 def str_to_symb(string):
@@ -162,6 +573,8 @@ def str_to_symb(string):
     See satout_to_str for naming rationale.
     """
 
+    from sympy import Symbol
+
     # get frequency by character and by index
     c_freq = {}
     i_freq = {}
@@ -185,3 +598,93 @@ def str_to_symb(string):
             symbs.append(s)
 
     return symbs
+
+
+def itersolve_projected(
+    clauses, project, onehot=False, determined=False, backend=None, budget=None
+):
+    """
+    Like pycosat.itersolve, but solutions are only told apart by the
+    variables in project, and only those variables are returned.
+
+    pycosat blocks each solution by negating all of it, so two solutions
+    which differ only in their auxiliary variables both show up.  Here
+    each solution is blocked by a clause over just the projected
+    variables instead.
+
+    If the projected variables are one-hot (like riddler's grid, one true
+    letter per position) then the true ones determine the rest, so
+    onehot=True blocks on those alone.  That's n literals per blocking
+    clause instead of n * d.
+
+    pycosat can't add clauses between solutions, so blocking them here
+    means solving from scratch each time.  If the caller knows that every
+    other variable is determined by the projected ones (like the ones cnf
+    makes), pass determined=True: pycosat's own blocking can't repeat a
+    projection then, and it gets to keep what it learned between solutions.
+
+    backend is a PycosatBackend (the default) or something like it.
+
+    budget is a budget.Budget.  Its memory counts the blocking clauses,
+    and it's checked between solutions.  If it has a clock, the backend is
+    told what's left of it.  PycosatBackend.itersolve (so determined=True)
+    and SubprocessBackend give up on a solution that takes too long, but
+    PycosatBackend.solve can't.
+    """
+
+    if backend is None:
+        backend = PycosatBackend()
+
+    # pycosat lists variables in order, so a leading range is just a slice
+    if type(project) == range and project.start == 1 and project.step == 1:
+
+        def projection(solution):
+            return solution[: project.stop - 1]
+
+    else:
+        wanted = set(abs(x) for x in project)
+
+        def projection(solution):
+            return [x for x in solution if abs(x) in wanted]
+
+    remaining = budget.remaining if budget is not None else None
+
+    if determined:
+        for solution in backend.itersolve(clauses, remaining=remaining):
+            yield projection(solution)
+
+            # pycosat blocks the whole solution
+            if budget is not None:
+                budget.spend_memory(len(solution))
+                if budget.exhausted():
+                    return
+
+        # the backend gave up because the time ran out, say so
+        if budget is not None:
+            budget.exhausted()
+        return
+
+    clauses = list(clauses)
+    while True:
+        solution = backend.solve(clauses, timeout=remaining and remaining())
+        if solution in ("UNSAT", "UNKNOWN"):
+            if budget is not None:
+                budget.exhausted()
+            return
+
+        projected = projection(solution)
+        yield projected
+
+        if onehot:
+            blocking = [-x for x in projected if x > 0]
+        else:
+            blocking = [-x for x in projected]
+        if not blocking:
+            # nothing left to tell solutions apart by
+            return
+        clauses.append(blocking)
+
+        if budget is not None:
+            budget.spend_memory(len(blocking))
+            if budget.exhausted():
+                return
@@ -0,0 +1,191 @@
+"""
+A plain backtracking search engine, riddler(engine="search") uses it.
+
+It walks the answer's letters depth-first, one riddle position at a time,
+and gives up on a prefix as soon as it can't be finished.  No clauses,
+no solver, so it starts right away.
+"""
+
+from collections import Counter
+
+# marks a trie node where a fragment ends
+END = ""
+
+
+def build_trie(words):
+    """A prefix trie of nested dicts, {char: node}, ending nodes have END"""
+
+    root = {}
+    for word in words:
+        node = root
+        for char in word:
+            node = node.setdefault(char, {})
+        node[END] = True
+    return root
+
+
+def search(
+    letters,
+    fragments=None,
+    substrings=(),
+    automaton=None,
+    prefix="",
+    stop=None,
+    after=None,
+):
+    """
+    Yield each distinct permutation of letters that starts with prefix,
+    lazily.
+
+    If fragments (a list of strings) is given, every letter of the riddle
+    has to be part of some fragment, like cnf.cover.  substrings have to
+    show up in order without overlapping, like cnf.in_order.  automaton (a
+    cnf.Automaton) has to accept the riddle, like cnf.pronounce.
+
+    stop is called at every step, the search ends once it returns True.
+
+    Riddles come out in alphabetical order.  If after (a riddle) is given,
+    only the ones that come after it do, and the search skips straight
+    there rather than walking everything before it.
+    """
+
+    chars = sorted(set(letters))
+    left = Counter(letters)
+    riddle = []
+    trie = build_trie(fragments) if fragments is not None else None
+    substrings = list(substrings)
+    start = automaton.start if automaton is not None else None
+    needs = _needs(substrings)
+
+    # active: the fragments that are spelled so far, see _step_cover
+    # covered: the first position that no fragment covers yet
+    # k: how many substrings are done, partial: how far into the next one
+    # tight: the riddle so far is the start of after
+    def walk(active, covered, k, partial, state, tight):
+
+        if stop is not None and stop():
+            return
+
+        position = len(riddle)
+        if position == len(letters):
+            if tight:
+                return
+            if (trie is None or covered == position) and k == len(substrings):
+                if automaton is None or state in automaton.accepting:
+                    yield "".join(riddle)
+            return
+
+        for char in prefix[position] if position < len(prefix) else chars:
+            if not left[char]:
+                continue
+            if tight and char < after[position]:
+                continue
+
+            next_state = state
+            if automaton is not None:
+                next_state = automaton.transitions.get((state, char))
+                if next_state is None:
+                    continue
+
+            next_covered = covered
+            next_active = None
+            if trie is not None:
+                next_active, next_covered = _step_cover(
+                    trie, active, covered, position, char
+                )
+                if next_active is None:
+                    continue
+
+            next_k, next_partial = k, partial
+            if k < len(substrings):
+                next_k, next_partial = _step_order(substrings, k, partial, char)
+
+                # not enough room left for the rest of the substrings
+                room = len(letters) - position - 1
+                need = sum(map(len, substrings[next_k:])) - max(next_partial)
+                if room < need:
+                    continue
+
+                # or not the right letters left for them
+                if next_k < len(substrings):
+                    needed = needs[next_k][max(next_partial)]
+                    if any(left[c] - (c == char) < n for c, n in needed):
+                        continue
+
+            left[char] -= 1
+            riddle.append(char)
+            yield from walk(
+                next_active,
+                next_covered,
+                next_k,
+                next_partial,
+                next_state,
+                tight and char == after[position],
+            )
+            riddle.pop()
+            left[char] += 1
+
+    yield from walk({}, 0, 0, (0,), start, after is not None)
+
+
+def _needs(substrings):
+    """
+    needs[k][p]: the letters it takes to finish substrings[k] from p
+    letters in, and then all the ones after it, as (char, count) pairs.
+    """
+
+    needs = []
+    rest = Counter()
+    for word in reversed(substrings):
+        needs.append(
+            [tuple((rest + Counter(word[p:])).items()) for p in range(len(word))]
+        )
+        rest += Counter(word)
+    return needs[::-1]
+
+
+def _step_cover(trie, active, covered, position, char):
+    """
+    Put char at position, returns the new active matches and first
+    uncovered position, or (None, None) if that position can't ever be
+    covered now.
+
+    active is {id(node): (node, begin)}, only the earliest begin matters
+    since the same node means the same future.
+    """
+
+    # every match can go on, and a new one could start here
+    next_active = {}
+    for node, begin in list(active.values()) + [(trie, position)]:
+        child = node.get(char)
+        if child is None:
+            continue
+
+        if id(child) not in next_active or next_active[id(child)][1] > begin:
+            next_active[id(child)] = (child, begin)
+
+        # a whole fragment, covering begin..position
+        if END in child and begin <= covered:
+            covered = position + 1
+
+    # something still has to cover the first uncovered position
+    if covered <= position and not any(
+        begin <= covered for _, begin in next_active.values()
+    ):
+        return None, None
+
+    return next_active, covered
+
+
+def _step_order(substrings, k, partial, char):
+    """
+    Put char next, returns the new (k, partial).  partial holds how much
+    of substrings[k] each of the possible matches in progress has.
+    """
+
+    word = substrings[k]
+    grown = {n + 1 for n in partial if word[n] == char}
+    if len(word) in grown:
+        # done with this one, the next can't overlap it
+        return k + 1, (0,)
+    return k, tuple(sorted(grown | {0}))
@@ -0,0 +1,178 @@
+"""
+A long-running riddle server, for tools that want riddles on demand
+without paying to start up each time.
+
+It speaks JSON, one object per line.  Ask for riddles with an id of your
+choosing, plus anything a batch.py request line can have:
+
+    {"id": 1, "answer": "iamlordvoldemort", "limit": 5}
+
+and they come back one at a time, as they're found, then a summary:
+
+    {"id": 1, "riddle": "tommarvoloriddle"}
+    ...
+    {"id": 1, "done": true, "count": 5, "stopped": "limit"}
+
+Every query needs an id, and no two running at once can share one.
+
+Stop early with {"id": 1, "cancel": true}, which ends in a summary that
+says "stopped": "cancelled".  Anything that goes wrong comes back as
+{"id": 1, "error": "..."}, and that's the last you'll hear of that id.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+
+from tomriddle.batch import DEFAULTS, _budget
+from tomriddle.fragments import get_default_fragments
+from tomriddle.tomriddle import riddler, _candidates
+
+PORT = 7979
+
+# next() gives this back when a riddler is out of riddles
+_END = object()
+
+
+class Server:
+    """
+    Keeps the fragments (and what riddler builds from them) loaded, and
+    solves in a pool of threads so one slow query can't hold up the rest.
+
+    Each query moves along one riddle at a time.  Cancelling sets its
+    budget's cancel event, so the search engine stops right away, even in
+    the middle of looking for a riddle.  The sat engine stops once the
+    riddle it's working on turns up.
+    """
+
+    def __init__(self, fragments=None, workers=None, defaults=DEFAULTS):
+        if fragments is None:
+            fragments = get_default_fragments()
+        self.fragments = fragments
+        self.defaults = defaults
+        self.pool = ThreadPoolExecutor(workers)
+
+        # warm up, so the first query isn't slow
+        _candidates("", fragments, 0)
+
+    async def start(self, host="127.0.0.1", port=PORT, path=None):
+        """Listen on a unix socket at path if given, otherwise on TCP"""
+
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    def close(self):
+        self.server.close()
+        self.pool.shutdown(wait=False)
+
+    async def handle(self, reader, writer):
+        """One connection, with however many queries it wants at once"""
+
+        # {id: (task, cancel event)}
+        queries = {}
+
+        async def send(message):
+            writer.write((json.dumps(message) + "\n").encode("utf-8"))
+            await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except ValueError as ex:
+                    await send({"id": None, "error": f"bad json: {ex}"})
+                    continue
+
+                key = request.get("id")
+                if key is None:
+                    await send({"id": None, "error": "every query needs an id"})
+                elif request.get("cancel"):
+                    if key in queries:
+                        queries[key][1].set()
+                elif key in queries:
+                    await send({"id": key, "error": "that id is already running"})
+                else:
+                    cancel = threading.Event()
+                    task = asyncio.ensure_future(self.query(request, send, cancel))
+                    queries[key] = (task, cancel)
+                    task.add_done_callback(lambda _, key=key: queries.pop(key, None))
+        except ConnectionError:
+            pass
+        finally:
+            # nobody's listening any more, don't bother finishing
+            for task, cancel in list(queries.values()):
+                cancel.set()
+                task.cancel()
+            writer.close()
+
+    async def query(self, request, send, cancel=None):
+        """
+        Stream the riddles for one request, until it's done or cancel (a
+        threading.Event) is set.
+        """
+
+        key = request.get("id")
+        options = dict(self.defaults)
+        options.update(request)
+        loop = asyncio.get_running_loop()
+
+        count = 0
+        stopped = None
+        budget = _budget(options, cancel)
+        try:
+            riddles = riddler(
+                options["answer"],
+                self.fragments,
+                constraints=options["constraints"],
+                min_count=options["min_count"],
+                engine=options["engine"],
+                budget=budget,
+            )
+            while True:
+                # riddler keeps to the budget (and notices a cancel) on its own
+                riddle = await loop.run_in_executor(self.pool, next, riddles, _END)
+                if riddle is _END:
+                    stopped = budget.reason
+                    break
+                await send({"id": key, "riddle": riddle})
+                count += 1
+        except Exception as ex:
+            await send({"id": key, "error": f"{type(ex).__name__}: {ex}"})
+            return
+
+        try:
+            await send({"id": key, "done": True, "count": count, "stopped": stopped})
+        except ConnectionError:
+            pass
+
+
+async def serve(fragments=None, host="127.0.0.1", port=PORT, path=None, workers=None):
+    """Run a Server until cancelled"""
+
+    server = Server(fragments, workers)
+    await server.start(host, port, path)
+    try:
+        await server.server.serve_forever()
+    finally:
+        server.close()
+
+
+def main(args):
+    """For cli.tomriddle's serve subcommand"""
+
+    try:
+        asyncio.run(
+            serve(host=args.host, port=args.port, path=args.unix, workers=args.workers)
+        )
+    except KeyboardInterrupt:
+        pass
@@ -1,11 +0,0 @@
-
-        import json
-
-        def syllables():
-            """
-Three or four letter strings that start or end words like ant-, aard-,
--azy, or -gist.
-"""
-            return json.loads('''
-                [{"aaa": 2, "aaae": 1, "aaaw": 1, "aaj": 1, "aar": 361, "aaro": 361, "aau": 1, "aba": 149, "abac": 5, "abad": 1, "abaf": 2, "abag": 1, "aban": 89, "abar": 6, "abas": 26, "abat": 19, "abb": 100, "abba": 4, "abbe": 78, "abbo": 5, "abbr": 7, "abd": 38, "abda": 1, "abde": 1, "abdi": 8, "abdo": 21, "abdu": 1, "abe": 98, "abea": 1, "abed": 16, "abel": 12, "aber": 17, "abet": 4, "abey": 6, "abh": 71, "abho": 71, "abi": 562, "abia": 37, "abid": 167, "abie": 13, "abig": 19, "abih": 19, "abij": 25, "abil": 131, "abim": 68, "abin": 17, "abir": 11, "abis": 39, "abit": 3, "abiu": 3, "abj": 16, "abje": 15, "abju": 1, "abl": 634, "abla": 11, "able": 4, "ablu": 2, "abn": 76, "abne": 65, "abno": 11, "abo": 5759, "aboa": 54, "abod": 86, "abol": 42, "abom": 200, "aboo": 3, "abor": 43, "abou": 4477, "abov": 854, "abr": 661, "abra": 330, "abre": 13, "abri": 8, "abro": 177, "abru": 132, "abs": 861, "absa": 108, "absc": 4, "abse": 248, "absi": 3, "abso": 289, "abst": 134, "absu": 75, "abu": 227, "abun": 166, "abus": 59, "abut": 1, "aby": 36, "abyd": 1, "abys": 35, "aca": 107, "acac": 4, "acad": 96, "acal": 5, "acan": 1, "acap": 1, "acc": 3461, "acca": 8, "acce": 747, "acch": 1, "acci": 167, "accl": 20, "acco": 2096, "accr": 33, "accu": 389, "ace": 23, "acel": 1, "acer": 1, "acet": 14, "ach": 373, "acha": 23, "achb": 7, "ache": 19, "achi": 293, "achm": 1, "acho": 5, "achs": 8, "achz": 4, "aci": 24, "acid": 10, "ack": 179, "acke": 1, "ackn": 178, "acm": 1, "aco": 27, "acol": 1, "acom": 2, "acon": 1, "acor": 16, "acou": 7, "acq": 543, "acqu": 543, "acr": 631, "acre": 62, "acri": 4, "acro": 535, "acry": 11, "act": 1695, "acte": 50, "acti": 998, "acto": 77, "actr": 19, "actu": 415, "acu": 33, "acum": 2, "acus": 1, "acut": 30, "ada": 371, "adad": 1, "adag": 8, "adai": 14, "adal": 1, "adam": 80, "adap": 53, "adb": 2, "adbe": 2, "adc": 1, "adco": 1, "add": 1150, "adda": 5, "adde": 462, "addi": 404, "addl": 1, "addo": 2, "addr": 258, "addu": 1, "ade": 122, "adel": 13, "aden": 6, "adep": 4, "adeq": 96, "ader": 1, "adh": 58, "adhe": 58, "adi": 51, "adie": 27, "adin": 2, "adio": 12, "adip": 1, "adir": 4, "adit": 1, "adj": 225, "adja": 15, "adje": 9, "adjo": 46, "adju": 155, "adl": 12, "adla": 8, "adle": 3, "adli": 1, "adm": 1011, "adma": 10, "adme": 3, "admi": 967, "admo": 31, "adn": 5, "adna": 3, "ado": 321, "adob": 5, "adol": 46, "adon": 46, "adop": 125, "ador": 98, "adow": 1, "adr": 38, "adra": 6, "adre": 2, "adri": 24, "adro": 6, "ads": 4, "adso": 4, "adu": 178, "adua": 9, "adue": 1, "adui": 8, "adul": 151, "adum": 2, "adus": 2, "adv": 1313, "adva": 617, "adve": 337, "advi": 321, "advo": 38, "adz": 1, "aec": 1, "aeg": 17, "aega": 1, "aege": 15, "aegi": 1, "aen": 6, "aene": 5, "aeno": 1, "aeo": 1, "aer": 77, "aera": 30, "aere": 4, "aeri": 10, "aero": 24, "aes": 42, "aesc": 6, "aeso": 1, "aest": 35, "aet": 2, "aete": 1, "aetn": 1, "afa": 74, "afar": 1, "afe": 3, "afea": 2, "aff": 1357, "affa": 271, "affe": 520, "affg": 1, "affi": 103, "affl": 247, "affo": 165, "affr": 50, "afg": 5, "afgh": 5, "afi": 6, "afic": 1, "afie": 1, "afin": 1, "afir": 3, "afl": 31, "afla": 4, "aflc": 5, "aflo": 22, "afo": 51, "afoa": 1, "afoo": 6, "afor": 43, "afou": 1, "afr": 679, "afra": 556, "afre": 10, "afri": 108, "afro": 5, "afs": 4, "afst": 4, "aft": 4333, "afte": 4330, "afth": 2, "aftu": 1, "afv": 1, "afva": 1, "aga": 5749, "agab": 2, "agag": 5, "agai": 5718, "agam": 3, "agap": 2, "agas": 1, "agat": 7, "agay": 1, "age": 450, "agea": 2, "aged": 1, "agel": 2, "agen": 264, "ageo": 5, "agg": 108, "aggi": 4, "aggl": 18, "aggr": 86, "agh": 7, "agha": 7, "agi": 115, "agil": 10, "agin": 4, "agit": 98, "agl": 3, "agle": 1, "aglo": 2, "agn": 15, "agne": 7, "agno": 7, "agnu": 1, "ago": 83, "agoe": 1, "agon": 82, "agr": 672, "agra": 10, "agre": 575, "agri": 83, "agro": 3, "agu": 7, "aha": 729, "ahab": 1, "ahar": 2, "ahas": 35, "ahav": 3, "ahaz": 37, "ahb": 1, "ahba": 1, "ahe": 171, "ahea": 168, "ahi": 157, "ahia": 7, "ahie": 6, "ahih": 2, "ahij": 20, "ahik": 20, "ahil": 5, "ahim": 36, "ahin": 8, "ahir": 7, "ahis": 5, "ahit": 35, "ahl": 3, "ahla": 3, "ahm": 7, "ahma": 3, "ahme": 3, "ahmi": 1, "aho": 41, "ahoa": 1, "ahoh": 5, "ahol": 26, "ahr": 1, "ahre": 1, "ahu": 3, "ahum": 1, "ahuz": 2, "aia": 7, "aial": 1, "aiat": 1, "aic": 1, "aich": 1, "aid": 70, "aide": 22, "aidi": 7, "aidt": 1, "aie": 1, "aij": 8, "aija": 7, "aik": 2, "aike": 1, "aiki": 1, "ail": 34, "aile": 14, "aili": 2, "ailm": 16, "aim": 82, "aima": 1, "aime": 37, "aimi": 6, "aiml": 11, "ain": 55, "ains": 2, "ainu": 1, "air": 244, "airb": 7, "airc": 75, "aird": 2, "aire": 5, "airf": 14, "airi": 9, "airl": 19, "airm": 6, "airp": 45, "airs": 4, "airt": 3, "airw": 6, "ais": 12, "aisl": 12, "aja": 10, "ajal": 3, "aka": 1, "ake": 1, "aker": 1, "aki": 18, "akim": 1, "akit": 1, "akk": 8, "akku": 8, "akr": 3, "akra": 2, "akro": 1, "ala": 421, "alaa": 1, "alab": 43, "alac": 21, "alad": 4, "alai": 1, "alam": 9, "alan": 2, "alar": 200, "alas": 28, "alb": 105, "alba": 31, "albe": 41, "albi": 7, "albo": 1, "albr": 6, "albu": 18, "alc": 44, "alca": 1, "alch": 4, "alci": 5, "alco": 34, "ald": 14, "alde": 10, "aldr": 3, "ale": 243, "alea": 1, "alec": 7, "aleh": 12, "alei": 1, "alem": 5, "alep": 2, "aler": 67, "ales": 1, "alew": 1, "alex": 90, "alf": 64, "alfo": 1, "alfr": 62, "alg": 35, "alga": 8, "alge": 16, "algi": 4, "algo": 4, "algu": 3, "alh": 2, "alha": 2, "ali": 922, "alia": 6, "alib": 9, "alic": 421, "alie": 89, "alig": 30, "alij": 1, "alik": 100, "alim": 7, "aliq": 1, "alis": 1, "aliu": 8, "aliv": 244, "alix": 1, "aliz": 1, "alk": 12, "alka": 10, "alky": 2, "all": 1139, "alla": 24, "allc": 3, "alle": 161, "allf": 1, "allg": 1, "alli": 156, "allk": 1, "alll": 1, "allm": 1, "alln": 7, "allo": 654, "allp": 4, "allr": 1, "alls": 9, "allt": 4, "allu": 84, "allv": 1, "allw": 8, "alm": 1377, "alma": 11, "almi": 106, "almo": 1234, "alms": 1, "almu": 3, "alo": 1761, "aloe": 7, "alof": 87, "alok": 1, "alon": 1548, "aloo": 17, "alor": 2, "alot": 1, "alou": 94, "alow": 1, "alp": 52, "alpa": 1, "alpe": 8, "alph": 34, "alpi": 2, "alr": 587, "alra": 1, "alre": 586, "als": 3263, "alsa": 4, "alsi": 1, "also": 3, "alt": 1311, "alta": 471, "alte": 283, "alth": 367, "alti": 12, "alto": 172, "altr": 2, "alu": 35, "alum": 28, "alun": 1, "alus": 5, "alv": 30, "alva": 5, "alve": 15, "alvi": 8, "alw": 1502, "alwa": 1500, "alwi": 2, "ama": 371, "amad": 7, "amai": 6, "amal": 54, "aman": 3, "amar": 21, "amas": 26, "amat": 41, "amaz": 206, "amb": 324, "amba": 58, "ambe": 28, "ambi": 184, "ambl": 5, "ambr": 12, "ambu": 37, "ame": 1289, "amea": 2, "amel": 6, "amen": 91, "amer": 1078, "amet": 7, "ami": 281, "amia": 89, "amic": 10, "amid": 26, "amie": 1, "amig": 2, "amin": 7, "amis": 27, "amit": 11, "amm": 194, "amma": 1, "ammi": 37, "ammo": 132, "ammu": 19, "amn": 28, "amno": 28, "amo": 2313, "amon": 1874, "amor": 125, "amou": 267, "amp": 142, "amph": 10, "ampl": 124, "amps": 1, "ampu": 7, "amr": 21, "amra": 20, "ams": 6, "amst": 6, "amu": 175, "amuc": 1, "amul": 2, "amus": 172, "amz": 2, "ana": 540, "anab": 3, "anac": 30, "anae": 2, "anag": 1, "anah": 2, "anai": 2, "anak": 9, "anal": 258, "anam": 3, "anan": 15, "anap": 2, "anar": 123, "anas": 8, "anat": 57, "anc": 350, "ance": 50, "anch": 97, "anci": 202, "anck": 1, "and": 184, "ande": 35, "andi": 2, "ando": 20, "andr": 90, "andy": 4, "ane": 53, "anec": 20, "anem": 7, "anes": 4, "anet": 2, "ang": 1514, "ange": 990, "angi": 17, "angl": 161, "ango": 4, "angr": 256, "angs": 2, "angu": 84, "anh": 5, "anha": 1, "anhe": 1, "anhw": 1, "anhy": 2, "ani": 339, "ania": 1, "anil": 1, "anim": 315, "anio": 13, "anis": 6, "anit": 2, "ank": 48, "anka": 1, "anke": 2, "ankl": 45, "ann": 1153, "anna": 24, "anne": 13, "anni": 64, "anno": 297, "annu": 145, "ano": 2278, "anod": 78, "anoi": 180, "anom": 11, "anon": 24, "anor": 2, "anot": 1946, "anou": 1, "anoy": 1, "ans": 1696, "anse": 2, "ansl": 1, "anso": 1, "ansu": 1, "answ": 1691, "ant": 726, "anta": 37, "ante": 50, "anth": 44, "anti": 461, "antl": 5, "anto": 103, "antw": 1, "anu": 2, "anv": 13, "anvi": 13, "anx": 297, "anxi": 297, "any": 1289, "anyb": 159, "anyh": 53, "anyl": 1, "anym": 6, "anyo": 221, "anyp": 1, "anyr": 6, "anyt": 676, "anyw": 165, "anz": 1, "anzi": 1, "aon": 1, "aoni": 1, "aor": 4, "aort": 4, "aou": 1, "aoue": 1, "apa": 279, "apac": 13, "apal": 2, "apar": 255, "apat": 9, "ape": 32, "apea": 1, "apel": 1, "apen": 1, "aper": 15, "aph": 18, "apha": 4, "aphe": 9, "aphi": 2, "aphr": 2, "aphs": 1, "api": 16, "apic": 1, "apie": 13, "apis": 2, "apl": 4, "apla": 1, "aplo": 3, "apo": 301, "apoc": 14, "apog": 2, "apol": 138, "apop": 6, "apos": 119, "apot": 22, "app": 4080, "appa": 419, "appe": 1570, "apph": 1, "appi": 2, "appl": 664, "appo": 349, "appr": 1074, "appu": 1, "apr": 121, "apri": 90, "apro": 31, "aps": 1, "apse": 1, "apt": 14, "apte": 1, "apti": 7, "aptl": 5, "aptn": 1, "aqu": 38, "aqua": 6, "aque": 15, "aqui": 17, "ara": 95, "arab": 49, "arai": 1, "aram": 1, "aran": 1, "arap": 2, "arar": 3, "arat": 1, "arau": 9, "arb": 90, "arba": 3, "arbe": 1, "arbi": 55, "arbo": 21, "arbu": 7, "arc": 609, "arca": 8, "arch": 511, "arci": 1, "arcl": 1, "arct": 24, "arcu": 1, "ard": 55, "arde": 27, "ardi": 1, "ardm": 1, "ardo": 21, "ardu": 5, "are": 655, "area": 243, "arel": 3, "aren": 53, "areo": 3, "areq": 1, "aret": 2, "arg": 319, "arga": 3, "arge": 9, "argi": 14, "argo": 18, "argu": 272, "argy": 1, "arh": 2, "arha": 2, "ari": 472, "aria": 6, "aric": 5, "arid": 4, "arie": 12, "arig": 17, "arim": 7, "ario": 9, "aris": 369, "arit": 22, "ariu": 1, "ariz": 9, "ark": 33, "arka": 30, "arki": 3, "arl": 46, "arle": 42, "arli": 4, "arm": 1117, "arma": 27, "armb": 1, "armc": 8, "arme": 186, "armf": 2, "armh": 5, "armi": 124, "arml": 3, "armo": 89, "armp": 4, "armr": 1, "arms": 7, "army": 5, "arn": 62, "arna": 1, "arnh": 4, "arni": 1, "arno": 55, "aro": 1110, "aroa": 1, "arod": 2, "aroe": 17, "arom": 19, "aroo": 1, "aros": 230, "arou": 838, "aroy": 1, "arp": 18, "arpa": 4, "arpe": 2, "arph": 12, "arr": 988, "arra": 351, "arre": 86, "arri": 373, "arro": 176, "arru": 1, "ars": 24, "arsa": 7, "arse": 11, "arsh": 1, "arsi": 2, "arso": 2, "art": 987, "arta": 15, "arte": 92, "artf": 15, "arth": 227, "arti": 521, "artk": 1, "artl": 14, "arts": 1, "artu": 3, "aru": 7, "arub": 1, "arum": 1, "arun": 5, "arv": 5, "arva": 4, "arve": 1, "ary": 5, "aryl": 4, "arz": 1, "asa": 62, "asah": 20, "asai": 6, "asap": 34, "asar": 2, "asb": 2, "asbe": 2, "asc": 223, "asca": 2, "asce": 193, "asch": 1, "asci": 2, "ascr": 24, "asd": 1, "asdi": 1, "ase": 6, "asen": 3, "asep": 1, "ash": 501, "asha": 234, "ashb": 6, "ashc": 3, "ashd": 26, "ashe": 138, "ashi": 2, "ashk": 10, "ashl": 1, "ashm": 2, "ashn": 2, "asho": 47, "ashp": 1, "ashr": 1, "asht": 22, "ashu": 4, "ashv": 1, "asi": 390, "asia": 25, "asid": 269, "asie": 1, "asil": 1, "asim": 1, "asin": 2, "asit": 1, "ask": 1195, "aska": 7, "aske": 1014, "aski": 141, "asl": 114, "asla": 8, "asle": 104, "aslo": 2, "asm": 3, "asma": 1, "asmo": 1, "asn": 2, "asna": 2, "aso": 1, "asoc": 1, "asp": 275, "aspa": 5, "aspe": 183, "asph": 10, "aspi": 70, "aspr": 2, "asr": 3, "asri": 3, "ass": 2508, "assa": 143, "asse": 597, "assh": 9, "assi": 544, "assn": 1, "asso": 320, "assu": 726, "assw": 3, "assy": 155, "ast": 441, "asta": 4, "aste": 39, "asth": 3, "asti": 5, "astl": 4, "asto": 275, "astr": 108, "astu": 2, "astw": 1, "asu": 35, "asun": 33, "asup": 2, "asw": 1, "aswe": 1, "asy": 50, "asyl": 40, "asym": 7, "asyn": 3, "ata": 13, "atab": 1, "atal": 1, "atar": 8, "atav": 1, "atb": 1, "atba": 1, "ate": 7, "atel": 1, "ater": 1, "ath": 201, "atha": 34, "athe": 90, "athi": 8, "athl": 61, "athw": 8, "atk": 3, "atki": 3, "atl": 140, "atla": 139, "atle": 1, "atm": 142, "atmo": 142, "ato": 246, "atom": 91, "aton": 100, "atr": 22, "atre": 2, "atro": 20, "att": 2582, "atta": 618, "atte": 1262, "atti": 240, "attl": 1, "atto": 175, "attr": 271, "attu": 6, "atty": 2, "atu": 1, "atun": 1, "atw": 2, "atwe": 1, "atwi": 1, "aty": 1, "atyp": 1, "aua": 4, "auan": 1, "auar": 3, "aub": 9, "aube": 1, "aubr": 1, "aubu": 6, "auc": 11, "auct": 11, "aud": 273, "auda": 20, "audi": 239, "audr": 9, "audu": 5, "aue": 2, "auen": 1, "auer": 1, "aug": 194, "auge": 5, "augh": 48, "augm": 31, "augu": 110, "auj": 1, "aujo": 1, "aul": 1, "aun": 134, "aunt": 20, "auo": 10, "auoi": 2, "auou": 3, "auoy": 5, "aur": 29, "aura": 4, "aure": 9, "auro": 14, "auru": 1, "aus": 107, "ausc": 1, "auso": 1, "ausp": 13, "aust": 92, "aut": 879, "auth": 494, "auti": 15, "auto": 269, "autr": 2, "autu": 76, "aux": 13, "auxi": 13, "ava": 363, "avai": 311, "aval": 3, "avan": 8, "avar": 16, "avas": 22, "avat": 3, "ave": 363, "aven": 134, "aver": 224, "avi": 24, "avia": 10, "avid": 2, "avig": 2, "avil": 1, "avim": 1, "avit": 4, "avo": 243, "avoc": 19, "avoi": 209, "avou": 2, "avow": 9, "awa": 3025, "awai": 54, "awak": 195, "awar": 289, "awas": 1, "away": 1, "awe": 18, "awei": 1, "awes": 5, "awf": 107, "awfu": 107, "awh": 27, "awhe": 1, "awhi": 26, "awi": 1, "awin": 1, "awk": 58, "awkw": 58, "awl": 1, "awn": 3, "awni": 3, "awo": 34, "awok": 29, "awr": 5, "axe": 24, "axem": 1, "axi": 58, "axia": 3, "axio": 7, "axl": 13, "axle": 4, "ayd": 2, "aye": 3, "ayea": 1, "ayey": 1, "ayg": 1, "aygr": 1, "ayl": 2, "ayle": 2, "aym": 4, "ayr": 36, "ayre": 2, "ayri": 1, "ays": 1, "ayss": 1, "ayu": 1, "aza": 69, "azal": 7, "azan": 1, "azar": 55, "azaz": 4, "azb": 1, "azbu": 1, "aze": 16, "azek": 7, "azer": 1, "azg": 4, "azga": 4, "azi": 3, "azie": 1, "azim": 1, "aziz": 1, "azm": 11, "azma": 8, "azmo": 3, "azn": 1, "azno": 1, "azo": 10, "azor": 6, "azot": 2, "azr": 9, "azri": 9, "azu": 16, "azub": 4, "azur": 9, "azus": 1, "azz": 5, "azza": 4, "azzu": 1, "baa": 175, "baal": 67, "baan": 12, "baar": 1, "baas": 29, "bab": 575, "baba": 1, "babb": 14, "babc": 1, "babe": 41, "babi": 26, "babo": 3, "baby": 324, "bac": 2564, "bacc": 6, "bach": 26, "baci": 2, "back": 396, "baco": 15, "bact": 23, "bad": 135, "bade": 4, "badf": 1, "badg": 28, "badi": 3, "badl": 49, "badm": 2, "badn": 11, "badr": 1, "badu": 1, "bae": 5, "baf": 49, "baff": 49, "bag": 46, "baga": 1, "bagd": 1, "bagg": 19, "bagl": 1, "bagp": 1, "bah": 9, "baha": 2, "bahi": 1, "bahu": 5, "bai": 44, "bail": 20, "bain": 1, "bair": 4, "bait": 7, "baj": 2, "baja": 1, "baji": 1, "bak": 167, "bakb": 6, "bake": 118, "bakh": 1, "baki": 14, "bakl": 1, "bal": 1028, "bala": 298, "balc": 34, "bald": 25, "bale": 27, "bali": 6, "balk": 17, "ball": 256, "balm": 12, "bals": 2, "balt": 36, "balu": 6, "balz": 2, "bam": 11, "bama": 1, "bamb": 6, "bamo": 3, "ban": 942, "bana": 7, "banb": 1, "banc": 6, "band": 146, "bane": 1, "banf": 1, "bang": 54, "bani": 54, "banj": 4, "bank": 149, "bann": 64, "banq": 85, "bans": 4, "bant": 16, "bany": 4, "bap": 173, "bapt": 172, "bar": 1750, "bara": 30, "barb": 245, "barc": 33, "bard": 24, "bare": 74, "barf": 1, "barg": 82, "barh": 1, "bari": 12, "barj": 2, "bark": 28, "barl": 54, "barm": 1, "barn": 114, "baro": 64, "barq": 1, "barr": 256, "bars": 6, "bart": 158, "baru": 26, "barz": 12, "bas": 1286, "basa": 1, "basc": 3, "base": 289, "bash": 91, "basi": 428, "bask": 202, "basl": 3, "basm": 1, "baso": 25, "basr": 5, "bass": 8, "bast": 43, "bat": 1141, "bata": 3, "batc": 10, "bate": 165, "bath": 152, "bati": 10, "bato": 13, "batt": 607, "batw": 1, "bau": 13, "baub": 2, "baud": 2, "baue": 2, "bauh": 1, "baul": 4, "bav": 5, "bava": 5, "baw": 23, "bawd": 4, "bawh": 1, "bawl": 12, "bay": 58, "baya": 3, "baye": 7, "bayf": 1, "bayi": 1, "bayl": 5, "bayo": 27, "bayr": 4, "baz": 11, "baza": 9, "bazl": 2, "bbc": 1, "bde": 2, "bdel": 2, "bdf": 1, "bdi": 22, "bdik": 22, "bea": 3233, "beac": 157, "bead": 22, "beak": 10, "beal": 14, "beam": 99, "bean": 19, "bear": 513, "beas": 473, "beat": 181, "beau": 776, "beav": 16, "beb": 7, "beba": 6, "bebo": 1, "bec": 4332, "beca": 3319, "becc": 2, "bech": 9, "beck": 60, "beco": 941, "bed": 242, "beda": 7, "bedb": 1, "bedc": 12, "bedd": 8, "bede": 3, "bedf": 32, "bedg": 1, "bedh": 1, "bedl": 3, "bedo": 1, "bedp": 1, "bedr": 74, "beds": 22, "bedt": 7, "bedw": 2, "bee": 6262, "beeb": 12, "beec": 12, "beef": 12, "beeh": 10, "beel": 14, "been": 31, "beep": 3, "beer": 60, "bees": 5, "beet": 39, "beev": 8, "bef": 4588, "befa": 49, "befe": 18, "befi": 8, "befo": 4501, "befr": 8, "befu": 4, "beg": 2558, "bega": 1302, "bege": 37, "begg": 155, "begi": 826, "begl": 2, "bego": 47, "begr": 4, "begu": 182, "beh": 2794, "beha": 360, "behe": 149, "behi": 741, "beho": 1540, "behr": 3, "behy": 1, "bei": 2436, "beid": 1, "beig": 2, "bein": 2428, "beir": 1, "beis": 1, "bej": 1, "beju": 1, "bek": 2, "beka": 1, "bekk": 1, "bel": 2933, "bela": 21, "belc": 15, "beld": 1, "bele": 32, "belf": 5, "belg": 40, "beli": 1521, "bell": 225, "belm": 5, "belo": 807, "bels": 14, "belt": 27, "belu": 3, "belv": 4, "belz": 2, "bem": 11, "bema": 2, "bemo": 9, "ben": 1308, "bena": 44, "benc": 114, "bend": 61, "bene": 479, "beng": 10, "benh": 28, "beni": 25, "benj": 199, "benn": 13, "beno": 2, "bens": 18, "bent": 8, "benu": 6, "benw": 70, "beny": 1, "benz": 5, "beo": 26, "beow": 15, "bep": 1, "bepa": 1, "beq": 32, "bequ": 32, "ber": 419, "bera": 8, "berb": 1, "berc": 1, "bere": 42, "berg": 24, "beri": 18, "berk": 24, "berl": 89, "berm": 18, "bern": 33, "bero": 5, "berr": 82, "bert": 40, "bery": 12, "bes": 1911, "besa": 2, "bese": 113, "besh": 1, "besi": 603, "besm": 8, "beso": 56, "besp": 28, "bess": 4, "best": 151, "bet": 3401, "beta": 9, "bete": 3, "beth": 290, "beti": 21, "beto": 19, "betr": 147, "bets": 8, "bett": 1347, "betw": 1544, "beu": 1, "beul": 1, "bev": 41, "beve": 33, "bevo": 1, "bew": 156, "bewa": 75, "bewe": 1, "bewh": 1, "bewi": 75, "bewr": 4, "bex": 1, "bexa": 1, "bey": 534, "beye": 2, "beyo": 532, "bez": 20, "beza": 12, "beze": 8, "bho": 1, "bia": 19, "bian": 2, "bias": 3, "bib": 126, "bibb": 1, "bibl": 124, "bic": 34, "bica": 2, "bice": 4, "bich": 9, "bick": 8, "bico": 1, "bicy": 9, "bid": 79, "bidd": 52, "bide": 1, "bidk": 1, "bids": 1, "bie": 17, "bien": 11, "bier": 1, "biet": 1, "bif": 5, "biff": 1, "bifo": 3, "bifu": 1, "big": 135, "biga": 4, "bigb": 2, "bigc": 1, "bigd": 1, "bigg": 99, "bigl": 2, "bign": 5, "bigo": 8, "bigs": 2, "bigt": 5, "bigv": 6, "bij": 1, "bijo": 1, "bik": 1, "biki": 1, "bil": 609, "bila": 2, "bilb": 1, "bild": 81, "bile": 2, "bilg": 6, "bilh": 16, "bili": 9, "bilk": 2, "bill": 277, "bilo": 1, "bils": 2, "bim": 6, "bime": 1, "bimh": 1, "bimi": 1, "bimo": 3, "bin": 194, "bina": 1, "bind": 49, "bine": 2, "bing": 2, "binn": 23, "bino": 38, "binu": 1, "bio": 74, "bioa": 2, "bioc": 3, "biod": 1, "biog": 23, "biol": 35, "biom": 3, "biop": 6, "bios": 1, "bip": 7, "bipa": 2, "bipe": 3, "bipl": 2, "bir": 684, "bira": 1, "birc": 11, "bird": 197, "bire": 3, "birg": 2, "birk": 3, "birm": 17, "birn": 4, "birs": 1, "birt": 261, "birz": 1, "bis": 96, "bisc": 26, "bise": 1, "bish": 52, "bism": 3, "biso": 7, "bisq": 6, "biss": 1, "bit": 370, "bitc": 7, "bite": 15, "bith": 4, "biti": 20, "bitl": 1, "bitt": 263, "bitu": 2, "biv": 13, "bivo": 13, "biw": 9, "biz": 14, "biza": 8, "bize": 4, "bizj": 1, "bizt": 1, "bje": 1, "bjer": 1, "bla": 1716, "blab": 5, "blac": 936, "blad": 96, "blai": 7, "blak": 13, "blam": 133, "blan": 214, "blar": 3, "blas": 209, "blat": 14, "blau": 3, "blaz": 81, "bld": 3, "ble": 1099, "blea": 71, "bleb": 1, "blec": 1, "blee": 64, "blem": 69, "blen": 56, "bles": 764, "blev": 3, "bli": 483, "blig": 12, "blim": 1, "blin": 357, "blip": 1, "blis": 85, "blit": 19, "bliz": 8, "bll": 4, "bllc": 4, "blo": 1878, "bloa": 13, "bloc": 205, "bloi": 1, "blok": 2, "blom": 2, "blon": 39, "bloo": 1102, "blos": 74, "blot": 26, "blou": 9, "blow": 180, "blu": 763, "blub": 36, "bluc": 1, "blud": 5, "blue": 59, "bluf": 20, "blui": 5, "blum": 5, "blun": 83, "blur": 17, "blus": 95, "blut": 2, "blv": 4, "bly": 1, "blyt": 1, "bme": 2, "bmew": 2, "boa": 1395, "boad": 3, "boan": 1, "boar": 517, "boas": 102, "boat": 268, "bob": 78, "bobb": 75, "boc": 6, "boch": 4, "bock": 1, "bod": 1286, "bodd": 3, "bode": 3, "bodh": 1, "bodi": 219, "bodk": 2, "bodl": 1, "body": 18, "boe": 5, "boeh": 1, "boei": 3, "boeo": 1, "bog": 32, "boga": 1, "bogb": 5, "boge": 11, "bogg": 6, "bogi": 1, "bogu": 3, "boh": 10, "boha": 3, "bohe": 5, "bohl": 1, "boi": 138, "boie": 1, "boil": 83, "bois": 16, "boit": 2, "bok": 1, "bol": 301, "bola": 1, "bold": 77, "bole": 2, "bolg": 2, "boli": 10, "bolk": 2, "boll": 1, "bolo": 3, "bols": 17, "bolt": 42, "bom": 157, "bomb": 105, "bon": 709, "bona": 7, "bond": 184, "bone": 209, "bonf": 8, "bong": 1, "bonh": 4, "boni": 6, "bonj": 1, "bonn": 41, "bono": 1, "bont": 2, "bonu": 2, "bonz": 3, "boo": 1162, "boob": 14, "boog": 2, "booi": 1, "book": 263, "boom": 16, "boon": 4, "boor": 5, "boos": 23, "boot": 122, "booz": 5, "bor": 1110, "bora": 3, "bord": 308, "bore": 37, "borg": 3, "bori": 19, "borl": 1, "born": 132, "boro": 9, "borr": 83, "bos": 242, "bosc": 4, "bosi": 7, "bosk": 1, "bosl": 2, "boso": 103, "bosp": 6, "boss": 13, "bost": 77, "bosu": 1, "bot": 2337, "bota": 8, "botc": 5, "both": 58, "boto": 1, "bott": 460, "botu": 2, "bou": 847, "boua": 1, "bouc": 3, "boud": 1, "bouf": 3, "boug": 213, "boul": 81, "boun": 475, "bouq": 9, "bour": 28, "bout": 13, "bouv": 3, "bov": 3, "bovi": 3, "bow": 481, "bowa": 1, "bowd": 6, "bowe": 242, "bowi": 26, "bowl": 46, "bowm": 4, "bows": 22, "bowt": 1, "box": 53, "boxc": 8, "boxe": 38, "boxf": 1, "boxi": 2, "boxs": 1, "boxw": 1, "boy": 370, "boya": 1, "boyc": 10, "boye": 3, "boyf": 1, "boyh": 10, "boyi": 14, "boyl": 5, "boym": 3, "boyn": 1, "boys": 1, "boz": 11, "boze": 1, "bozk": 1, "bozr": 9, "bpl": 1, "bpla": 1, "bra": 1604, "brac": 110, "brad": 23, "brag": 20, "brah": 67, "brai": 227, "brak": 92, "bram": 9, "bran": 570, "braq": 14, "bras": 220, "brat": 3, "brau": 16, "brav": 145, "braw": 30, "bray": 3, "braz": 36, "bre": 3011, "brea": 2115, "brec": 1, "bree": 179, "breg": 1, "brel": 1, "brem": 5, "bren": 17, "bres": 12, "bret": 591, "breu": 2, "brev": 17, "brew": 16, "bri": 3206, "bria": 31, "brib": 28, "bric": 66, "brid": 351, "brie": 201, "brig": 530, "bril": 103, "brim": 34, "brin": 1493, "bris": 94, "brit": 234, "bro": 5052, "broa": 455, "brob": 10, "broc": 14, "brod": 11, "broe": 1, "brog": 4, "broi": 29, "brok": 716, "brom": 6, "bron": 99, "broo": 273, "brot": 1069, "brou": 1500, "brow": 772, "brox": 2, "broy": 1, "bru": 611, "bruc": 14, "brue": 1, "bruh": 1, "brui": 86, "brum": 20, "brun": 37, "brus": 130, "brut": 274, "brux": 1, "bry": 22, "brya": 16, "bryc": 2, "bryn": 1, "brys": 1, "btu": 2, "btus": 1, "bua": 1, "buaf": 1, "bub": 80, "bubb": 77, "bube": 3, "buc": 176, "bucc": 1, "buce": 1, "buch": 10, "buck": 134, "buco": 1, "bud": 181, "buda": 8, "budd": 57, "budg": 88, "budi": 1, "budl": 1, "budw": 1, "budz": 1, "bue": 5, "buel": 2, "buen": 3, "buf": 92, "buff": 83, "bug": 47, "buga": 1, "bugb": 1, "buge": 1, "bugg": 14, "bugl": 22, "bui": 1182, "buic": 3, "buil": 1179, "buk": 7, "bukk": 7, "bul": 701, "bulb": 9, "bulg": 20, "bulk": 36, "bull": 335, "bulr": 6, "bult": 11, "bulw": 51, "bum": 57, "bumb": 14, "bumm": 1, "bump": 32, "bun": 212, "buna": 1, "bunc": 54, "bund": 57, "bung": 18, "bunk": 24, "bunn": 4, "bunt": 7, "buny": 4, "buo": 50, "buoy": 32, "bur": 2147, "bura": 1, "burb": 2, "burc": 4, "burd": 181, "bure": 64, "burf": 1, "burg": 60, "buri": 237, "burk": 17, "burl": 24, "burm": 25, "burn": 853, "burr": 14, "burs": 319, "burt": 24, "bury": 19, "bus": 1457, "busb": 2, "busc": 2, "buse": 7, "bush": 63, "busi": 873, "busk": 2, "buss": 4, "bust": 297, "busy": 6, "but": 363, "buta": 1, "butc": 61, "butl": 65, "butt": 209, "buty": 10, "bux": 5, "buxo": 3, "buxt": 2, "buy": 75, "buye": 23, "buyi": 40, "buz": 46, "buzi": 2, "buzz": 25, "bye": 1, "byer": 1, "byf": 1, "byg": 4, "bygo": 4, "byi": 1, "byin": 1, "byl": 4, "byla": 2, "byli": 1, "bylo": 1, "byp": 19, "bypa": 9, "bypr": 10, "byr": 54, "byrd": 3, "byrl": 2, "byrn": 9, "byro": 30, "byrt": 1, "bys": 5, "byst": 5, "byt": 2, "byth": 1, "byw": 11, "bywa": 3, "bywo": 8, "byz": 9, "byza": 9, "cab": 249, "caba": 16, "cabb": 10, "cabd": 1, "cabi": 164, "cabl": 25, "cabm": 13, "cabo": 4, "cabr": 4, "cabu": 2, "cac": 17, "caca": 1, "cach": 7, "cack": 6, "caco": 2, "cact": 1, "cad": 75, "cada": 5, "cadd": 2, "cade": 16, "cadi": 16, "cadm": 3, "cadr": 3, "cadw": 3, "cae": 338, "caec": 1, "caes": 296, "caet": 2, "caf": 59, "cafe": 24, "caff": 1, "cafr": 1, "cag": 46, "caga": 1, "cage": 9, "cah": 2, "cahi": 1, "caho": 1, "cai": 66, "caia": 9, "cain": 9, "cair": 9, "caiu": 14, "caj": 1, "cajo": 1, "cak": 105, "cake": 46, "caki": 1, "cal": 3723, "cala": 57, "calc": 151, "cald": 25, "cale": 89, "calf": 3, "calh": 20, "cali": 157, "calk": 3, "call": 1917, "calm": 137, "caln": 4, "calo": 17, "calp": 10, "calt": 2, "calu": 10, "calv": 46, "caly": 1, "cam": 4823, "cama": 6, "camb": 31, "camd": 32, "came": 180, "cami": 22, "camo": 7, "camp": 340, "camu": 4, "can": 2389, "cana": 270, "canc": 52, "cand": 335, "cane": 7, "cani": 5, "cank": 13, "cann": 1200, "cano": 67, "cans": 86, "cant": 39, "canu": 1, "canv": 62, "cany": 19, "cao": 1, "caou": 1, "cap": 2263, "capa": 273, "cape": 49, "caph": 6, "capi": 239, "capo": 9, "capp": 19, "capr": 29, "caps": 33, "capt": 1495, "capu": 1, "car": 3820, "cara": 26, "carb": 83, "carc": 82, "card": 109, "care": 661, "carg": 16, "cari": 35, "cark": 2, "carl": 126, "carm": 67, "carn": 62, "caro": 109, "carp": 183, "carr": 1288, "cars": 21, "cart": 79, "caru": 4, "carv": 93, "carw": 3, "cary": 2, "cas": 2365, "casa": 5, "casb": 4, "casc": 11, "case": 263, "cash": 5, "casi": 8, "cask": 61, "casl": 2, "casp": 2, "cass": 203, "cast": 274, "casu": 70, "cat": 1138, "cata": 103, "catc": 277, "cate": 115, "catf": 2, "cath": 277, "cati": 1, "catk": 7, "catl": 4, "cato": 1, "cats": 11, "catt": 282, "cau": 1537, "cauc": 11, "caud": 1, "caue": 1, "cauf": 1, "caug": 342, "caui": 1, "caul": 18, "caus": 1009, "caut": 141, "cav": 183, "cava": 52, "cave": 43, "cavi": 29, "cavo": 4, "caw": 24, "cawd": 22, "cawi": 2, "cay": 2, "caye": 2, "ccn": 1, "cdc": 2, "cea": 318, "cear": 1, "ceas": 314, "cec": 183, "ceci": 183, "ced": 106, "ceda": 101, "cedr": 4, "cedv": 1, "cee": 2, "ceec": 2, "cei": 58, "ceil": 57, "cel": 441, "cele": 161, "celi": 6, "cell": 163, "cels": 1, "celt": 14, "cem": 39, "cema": 1, "ceme": 38, "cen": 1318, "cenc": 3, "ceni": 1, "cenn": 2, "ceno": 1, "cens": 84, "cent": 1066, "cep": 9, "ceph": 7, "cept": 1, "cer": 1682, "cera": 13, "cerb": 1, "cere": 132, "ceri": 3, "cerm": 1, "cert": 1515, "ceru": 5, "cerv": 5, "ces": 13, "cesa": 1, "cesi": 3, "cess": 4, "cest": 3, "cet": 28, "ceta": 6, "cete": 5, "ceto": 11, "cetu": 3, "cey": 7, "ceyl": 7, "cez": 4, "ceza": 4, "cha": 6261, "chab": 6, "chac": 8, "chad": 3, "chaf": 31, "chag": 6, "chah": 1, "chai": 553, "chal": 208, "cham": 409, "chan": 1677, "chao": 64, "chap": 550, "char": 2307, "chas": 252, "chat": 87, "chau": 32, "chav": 7, "chaw": 1, "chay": 1, "che": 1475, "chea": 115, "cheb": 8, "chec": 211, "ched": 6, "chee": 488, "chef": 1, "cheh": 1, "chek": 2, "chel": 7, "chem": 125, "chen": 14, "chep": 5, "cher": 249, "ches": 171, "chev": 9, "chew": 35, "chey": 5, "chez": 1, "chi": 5075, "chia": 7, "chib": 1, "chic": 230, "chid": 14, "chie": 632, "chig": 2, "chil": 3651, "chim": 110, "chin": 218, "chio": 2, "chip": 30, "chir": 9, "chis": 28, "chit": 6, "chiu": 2, "chiv": 19, "chl": 45, "chlo": 45, "chm": 1, "cho": 1183, "choa": 3, "choc": 38, "chod": 2, "choi": 251, "chok": 65, "chol": 36, "chom": 2, "choo": 227, "chop": 30, "chor": 138, "chos": 351, "chou": 3, "chow": 16, "choy": 4, "choz": 1, "chr": 1300, "chre": 1, "chri": 1167, "chro": 121, "chry": 11, "chu": 1176, "chub": 2, "chuc": 54, "chuf": 2, "chug": 2, "chum": 3, "chun": 9, "chur": 1048, "chus": 44, "chut": 5, "chuz": 1, "cia": 2, "ciar": 1, "cib": 2, "cibi": 1, "cibu": 1, "cic": 26, "cica": 3, "cice": 21, "cici": 1, "cico": 1, "cid": 11, "cide": 11, "cie": 6, "ciec": 1, "ciel": 5, "cig": 98, "ciga": 98, "cil": 13, "cili": 13, "cim": 4, "cima": 2, "cimb": 1, "cimo": 1, "cin": 74, "cinc": 15, "cind": 12, "cine": 10, "cinn": 32, "cinq": 3, "cip": 13, "ciph": 11, "cipo": 1, "cipr": 1, "cir": 893, "circ": 893, "cis": 13, "cist": 13, "cit": 2330, "cita": 13, "cite": 38, "citi": 784, "cito": 2, "citr": 7, "city": 31, "ciu": 5, "ciud": 3, "ciui": 2, "civ": 386, "civi": 386, "cla": 1714, "clac": 1, "clad": 1, "clai": 377, "clam": 80, "clan": 37, "clap": 62, "clar": 131, "clas": 561, "clat": 22, "clau": 58, "clav": 14, "claw": 20, "clay": 36, "cle": 1714, "clea": 1323, "cleb": 1, "clee": 4, "clef": 20, "clem": 23, "clen": 17, "cleo": 6, "cler": 152, "clev": 162, "clew": 2, "cli": 556, "clib": 3, "clic": 32, "clie": 37, "clif": 80, "clim": 231, "clin": 125, "clip": 25, "cliq": 3, "clit": 5, "cliv": 1, "clo": 2475, "cloa": 37, "clob": 3, "cloc": 149, "clod": 18, "clog": 9, "cloi": 5, "clok": 3, "clom": 2, "clon": 1, "cloo": 1, "clos": 1047, "clot": 576, "clou": 515, "clov": 54, "clow": 34, "cloy": 4, "clu": 457, "club": 48, "cluc": 10, "clue": 10, "clum": 45, "clun": 29, "clur": 2, "clus": 74, "clut": 48, "cly": 4, "clyd": 2, "clyf": 1, "clym": 1, "cmd": 1, "cmo": 4, "cni": 1, "cnid": 1, "coa": 894, "coac": 98, "coag": 2, "coah": 6, "coal": 68, "coar": 48, "coas": 297, "coat": 106, "coau": 1, "coax": 10, "cob": 63, "coba": 3, "cobb": 11, "cobh": 3, "cobl": 3, "cobr": 3, "cobw": 5, "coc": 189, "coca": 3, "cocc": 2, "coch": 8, "cock": 100, "coco": 29, "coct": 2, "cocy": 1, "cod": 80, "codd": 5, "code": 21, "codf": 2, "codi": 7, "coe": 40, "coed": 3, "coef": 6, "coen": 1, "coer": 11, "coet": 1, "coeu": 1, "coev": 1, "coex": 15, "cof": 208, "cofa": 1, "coff": 207, "cog": 32, "coge": 7, "cogg": 1, "cogi": 6, "cogn": 17, "coh": 45, "cohe": 37, "cohn": 1, "coho": 3, "coi": 192, "coif": 1, "coig": 1, "coil": 35, "coin": 102, "cok": 6, "coke": 1, "col": 2929, "cola": 2, "colc": 5, "cold": 68, "cole": 31, "colf": 1, "colh": 2, "coli": 6, "coll": 924, "colm": 13, "coln": 5, "colo": 1106, "colq": 2, "colt": 16, "colu": 182, "colv": 1, "colz": 1, "com": 15515, "coma": 3, "comb": 325, "come": 891, "comf": 617, "comi": 748, "comm": 4086, "comp": 4413, "comr": 141, "coms": 2, "comt": 1, "comu": 3, "con": 15518, "cona": 13, "conc": 2249, "cond": 937, "cone": 15, "conf": 1659, "cong": 884, "coni": 22, "conj": 135, "conl": 1, "conn": 377, "cono": 2, "conp": 1, "conq": 115, "conr": 12, "cons": 3900, "cont": 3850, "conu": 20, "conv": 1299, "conw": 1, "cony": 3, "coo": 881, "cooc": 3, "cooe": 1, "cooi": 1, "cook": 94, "cool": 201, "coom": 9, "coon": 3, "coop": 163, "coor": 61, "coos": 4, "cooz": 1, "cop": 301, "copa": 1, "cope": 42, "copi": 67, "copl": 3, "copo": 2, "copp": 41, "copr": 2, "cops": 1, "copt": 1, "copu": 4, "copy": 17, "coq": 2, "coqu": 2, "cor": 1996, "cora": 21, "corb": 2, "corc": 2, "cord": 100, "core": 6, "cori": 25, "cork": 58, "corl": 2, "corm": 5, "corn": 458, "coro": 38, "corp": 386, "corr": 554, "cors": 12, "cort": 24, "cory": 1, "cos": 666, "cosa": 1, "cose": 1, "cosi": 11, "cosm": 58, "cosp": 3, "coss": 8, "cost": 305, "cot": 253, "cote": 4, "coti": 3, "cotm": 1, "cott": 241, "coty": 1, "cou": 10382, "couc": 50, "coud": 1, "coue": 4, "coug": 31, "coul": 5479, "coun": 2458, "coup": 286, "cour": 1860, "cous": 206, "cout": 1, "couv": 1, "cov": 1116, "cove": 1111, "covi": 2, "cow": 181, "cowa": 73, "cowb": 26, "cowd": 6, "cowe": 6, "cowh": 8, "cowl": 5, "cowm": 3, "cowo": 4, "cowp": 11, "cowr": 1, "cows": 8, "cox": 15, "coxc": 8, "coxe": 5, "coy": 10, "coyi": 1, "coyl": 1, "coyn": 3, "coyo": 5, "coz": 9, "cozb": 2, "coze": 5, "cozi": 1, "cpl": 8, "cpla": 8, "cra": 812, "crab": 20, "crac": 149, "crad": 31, "craf": 141, "crag": 13, "crai": 4, "cram": 18, "cran": 51, "crap": 8, "cras": 88, "crat": 21, "crau": 4, "crav": 24, "craw": 100, "cray": 6, "craz": 82, "cre": 1713, "crea": 961, "crec": 1, "cred": 226, "cree": 165, "crei": 3, "crem": 2, "creo": 2, "crep": 38, "cres": 73, "cret": 12, "crev": 4, "crew": 27, "cri": 1975, "crib": 4, "cric": 21, "crid": 1, "crie": 1225, "crik": 1, "crim": 247, "crin": 14, "crip": 24, "cris": 155, "crit": 268, "cro": 1595, "croa": 12, "croc": 17, "crof": 83, "croi": 1, "crok": 5, "crom": 38, "cron": 10, "croo": 75, "crop": 49, "croq": 11, "cros": 516, "crot": 13, "crou": 56, "crow": 619, "croy": 2, "croz": 4, "crs": 1, "crsp": 1, "cru": 601, "cruc": 115, "crud": 30, "crue": 178, "crui": 71, "crum": 44, "crun": 11, "crup": 3, "crus": 119, "crut": 15, "cry": 195, "crye": 8, "cryi": 92, "cryo": 1, "cryp": 7, "crys": 86, "ctc": 5, "cub": 398, "cuba": 28, "cubb": 1, "cube": 5, "cubi": 302, "cuc": 19, "cuck": 6, "cucu": 13, "cud": 9, "cudd": 1, "cudg": 6, "cudk": 1, "cudm": 1, "cue": 4, "cuep": 1, "cuf": 16, "cuff": 13, "cui": 2, "cuir": 1, "cuis": 1, "cuk": 1, "cuky": 1, "cul": 238, "culb": 1, "cull": 6, "culm": 21, "culp": 7, "cult": 187, "culv": 3, "cum": 61, "cuma": 1, "cumb": 34, "cumh": 1, "cumi": 1, "cumm": 5, "cumn": 1, "cumu": 17, "cun": 112, "cuna": 6, "cunn": 106, "cup": 71, "cupb": 19, "cupf": 3, "cupi": 2, "cupl": 1, "cupo": 2, "cupp": 7, "cur": 1650, "cura": 28, "curb": 14, "curd": 6, "cure": 29, "curi": 456, "curl": 80, "curr": 245, "curs": 349, "curt": 153, "curv": 135, "curz": 8, "cus": 341, "cusc": 1, "cush": 44, "cuss": 1, "cust": 285, "cut": 273, "cuta": 1, "cutb": 1, "cutd": 1, "cute": 1, "cutg": 1, "cuth": 1, "cutl": 45, "cuto": 3, "cutp": 1, "cutt": 167, "cuv": 11, "cuvi": 11, "cyc": 59, "cycl": 59, "cyg": 1, "cygn": 1, "cyl": 46, "cyli": 46, "cym": 31, "cymb": 30, "cyn": 34, "cyne": 3, "cyni": 25, "cynn": 4, "cynt": 2, "cyp": 24, "cyph": 3, "cypr": 21, "cyr": 37, "cyre": 9, "cyri": 1, "cyru": 27, "cys": 3, "cyst": 3, "cyt": 6, "cyth": 1, "cyto": 5, "cza": 18, "czar": 7, "cze": 6, "czec": 5, "czer": 1, "c\u00e6s": 2, "c\u00e6sa": 2, "dab": 23, "daba": 1, "dabb": 14, "dabe": 2, "dabh": 1, "dabo": 2, "dac": 5, "dach": 1, "dack": 1, "dacr": 1, "dact": 2, "dad": 13, "dada": 2, "dadd": 7, "dade": 1, "dae": 5, "daf": 6, "daff": 3, "dag": 115, "dagd": 15, "dage": 1, "dagg": 84, "dago": 15, "dah": 1, "daho": 1, "dai": 343, "dail": 253, "dain": 30, "dair": 31, "dais": 27, "dak": 12, "dako": 12, "dal": 166, "dala": 1, "dalb": 4, "dale": 5, "dali": 1, "dall": 84, "dalm": 2, "dalp": 1, "dalr": 42, "dalt": 5, "dalz": 1, "dam": 463, "dama": 143, "dame": 7, "dami": 1, "damm": 10, "damn": 99, "damo": 4, "damp": 14, "dams": 54, "dan": 1160, "dana": 6, "danb": 1, "danc": 528, "dand": 37, "dane": 7, "dang": 398, "dani": 127, "danj": 1, "dank": 1, "dann": 10, "dans": 2, "dant": 9, "danu": 6, "danv": 1, "danz": 1, "dap": 14, "daph": 2, "dapp": 12, "dar": 1757, "darb": 2, "dard": 7, "dare": 113, "darg": 1, "dari": 79, "dark": 480, "darl": 45, "darm": 1, "darn": 7, "darr": 2, "dart": 140, "darw": 10, "das": 417, "dash": 367, "dat": 374, "data": 3, "date": 61, "dath": 10, "dati": 5, "datu": 1, "dau": 1016, "daub": 10, "daug": 986, "daum": 1, "daun": 15, "daup": 3, "dav": 1256, "dava": 1, "dave": 7, "davi": 1212, "davy": 1, "daw": 114, "dawd": 5, "dawl": 5, "dawn": 23, "daws": 2, "day": 1808, "daya": 2, "dayb": 24, "dayd": 3, "daye": 20, "dayl": 54, "days": 5, "dayt": 26, "dayw": 3, "daz": 68, "daze": 17, "dazz": 50, "dea": 4170, "deac": 21, "dead": 111, "deae": 10, "deaf": 19, "deal": 274, "dean": 4, "dear": 138, "deat": 1312, "deau": 2, "deb": 255, "deba": 82, "debe": 8, "debi": 21, "debo": 23, "debr": 19, "debt": 37, "debu": 25, "dec": 2476, "deca": 167, "decc": 3, "dece": 463, "deci": 657, "deck": 48, "decl": 634, "deco": 102, "decr": 152, "ded": 183, "deda": 12, "dedi": 99, "dedu": 72, "dee": 1059, "deed": 108, "deeg": 24, "deem": 52, "deep": 261, "deer": 46, "def": 1226, "defa": 12, "defe": 611, "defi": 499, "defl": 2, "defo": 31, "defr": 20, "deft": 3, "defu": 4, "defy": 8, "deg": 448, "dega": 2, "dege": 8, "degl": 1, "degr": 437, "deh": 10, "deha": 2, "dehu": 6, "dehy": 2, "dei": 60, "deie": 2, "deif": 12, "deig": 10, "deio": 6, "deis": 2, "deit": 28, "dej": 21, "deje": 14, "dek": 9, "deka": 8, "deko": 1, "del": 2120, "dela": 219, "dele": 56, "delh": 6, "deli": 1732, "dell": 13, "delm": 1, "delo": 6, "delp": 17, "delr": 1, "delt": 13, "delu": 44, "delv": 5, "dem": 840, "dema": 329, "deme": 25, "demi": 12, "demo": 438, "dems": 1, "demu": 17, "demy": 11, "den": 677, "dend": 1, "deni": 155, "denm": 32, "denn": 7, "deno": 123, "dens": 84, "dent": 60, "denu": 8, "denv": 19, "deny": 34, "deo": 3, "deod": 2, "dep": 1679, "depa": 802, "depe": 373, "depi": 26, "depl": 40, "depo": 75, "depp": 2, "depr": 166, "dept": 139, "depu": 51, "deq": 2, "dequ": 2, "der": 198, "dera": 8, "derb": 12, "dere": 4, "deri": 154, "derm": 1, "dern": 1, "dero": 3, "derr": 6, "derv": 5, "derw": 1, "des": 4227, "desa": 10, "desc": 683, "dese": 419, "desh": 1, "desi": 1107, "desk": 7, "desl": 2, "desm": 4, "deso": 253, "desp": 618, "dess": 15, "dest": 1012, "desu": 4, "desy": 1, "det": 1227, "deta": 317, "dete": 855, "deto": 17, "detr": 38, "deu": 37, "deuc": 6, "deue": 4, "deui": 10, "deuo": 4, "deut": 8, "dev": 1751, "deva": 12, "deve": 750, "devi": 582, "devo": 407, "dew": 40, "dewa": 1, "dewd": 10, "dewe": 5, "dewi": 1, "dewy": 1, "dex": 33, "dexa": 2, "dexe": 1, "dext": 30, "dha": 1, "dhar": 1, "dho": 1, "dhot": 1, "dia": 419, "diab": 17, "diac": 1, "diad": 10, "diag": 84, "dial": 69, "diam": 117, "dian": 62, "diap": 18, "diar": 23, "dias": 1, "diat": 5, "dib": 14, "dibl": 2, "dibo": 11, "dibr": 1, "dic": 313, "dice": 2, "dich": 2, "dick": 34, "dico": 6, "dict": 146, "did": 756, "dida": 1, "didd": 6, "dide": 1, "didn": 401, "dids": 160, "didy": 3, "die": 531, "died": 1, "dieg": 5, "dieh": 2, "dien": 1, "dies": 3, "diet": 56, "dieu": 2, "dif": 1627, "diff": 1627, "dig": 262, "digb": 8, "dige": 27, "digg": 73, "digi": 10, "dign": 134, "digr": 7, "dii": 6, "diio": 5, "diis": 1, "dij": 1, "dijo": 1, "dik": 2, "dikl": 2, "dil": 204, "dila": 38, "dile": 32, "dili": 83, "dill": 15, "dilt": 1, "dilu": 21, "dilw": 1, "dily": 1, "dim": 213, "dima": 8, "dime": 85, "dimi": 67, "diml": 27, "dimm": 8, "dimn": 6, "dimo": 3, "dimp": 3, "din": 527, "dina": 23, "dine": 32, "ding": 14, "dinh": 2, "dini": 70, "dinn": 317, "dino": 2, "dins": 1, "dint": 1, "dio": 30, "dioc": 14, "diod": 1, "dion": 7, "dior": 2, "diot": 1, "diox": 3, "dip": 118, "diph": 1, "dipl": 68, "dipo": 6, "dipp": 35, "dips": 1, "dipy": 3, "dir": 1294, "dire": 1106, "dirg": 15, "diri": 1, "dirk": 3, "diro": 1, "dirt": 77, "dis": 6401, "disa": 615, "disb": 32, "disc": 1686, "disd": 51, "dise": 185, "disf": 16, "disg": 151, "dish": 113, "disi": 62, "disj": 7, "disk": 6, "disl": 116, "dism": 220, "disn": 1, "diso": 126, "disp": 834, "disq": 19, "disr": 66, "diss": 233, "dist": 1774, "disu": 8, "dit": 48, "ditc": 36, "dite": 1, "ditm": 3, "ditt": 8, "diu": 33, "diue": 15, "diui": 8, "diur": 10, "div": 1100, "diva": 10, "dive": 220, "divi": 774, "divo": 54, "divu": 8, "dix": 57, "dixi": 5, "dixo": 52, "diz": 17, "diza": 1, "dizz": 16, "dja": 8, "djak": 1, "djan": 7, "dli": 3, "dlin": 3, "dni": 3, "dnie": 2, "dnig": 1, "doa": 23, "doat": 20, "dob": 4, "dobb": 2, "dobe": 1, "dobl": 1, "doc": 571, "doch": 9, "doci": 8, "dock": 18, "doct": 440, "docu": 61, "dod": 65, "doda": 4, "dodd": 1, "dodg": 39, "dodi": 1, "dodo": 1, "doe": 1432, "doer": 14, "does": 190, "doet": 96, "dof": 3, "doff": 2, "dofr": 1, "dog": 188, "dogb": 1, "doge": 1, "dogg": 18, "dogh": 1, "dogl": 1, "dogm": 25, "dogo": 3, "dogp": 1, "dogt": 10, "dogu": 1, "dogw": 1, "doh": 1, "dohn": 1, "doi": 506, "doin": 498, "doit": 5, "dol": 271, "dola": 2, "dolc": 6, "dold": 1, "dole": 11, "doll": 188, "dolm": 1, "dolo": 25, "dolp": 17, "dolt": 2, "dom": 478, "doma": 21, "dome": 137, "domi": 278, "domo": 2, "don": 2317, "dona": 69, "dond": 1, "doni": 1, "donk": 20, "donn": 22, "dono": 18, "dont": 1, "donw": 49, "doo": 1469, "dood": 1, "dook": 3, "dool": 13, "doom": 32, "door": 297, "dop": 7, "dope": 2, "doph": 2, "dopp": 1, "dor": 108, "dora": 7, "dorc": 5, "dore": 2, "dori": 15, "dork": 1, "dorm": 51, "doro": 3, "dors": 18, "dos": 144, "dosa": 8, "dose": 17, "dosi": 1, "dost": 3, "dot": 343, "dote": 11, "doth": 4, "doti": 6, "dott": 18, "dou": 1094, "doub": 1006, "douc": 4, "doug": 74, "dour": 1, "dous": 4, "dov": 54, "dove": 25, "dow": 4079, "dowa": 5, "dowe": 12, "dowg": 1, "dowj": 1, "dowl": 1, "down": 338, "dowr": 7, "dox": 3, "doxi": 1, "doxo": 2, "doy": 6, "doyl": 6, "doz": 102, "doze": 92, "dozi": 4, "dra": 1502, "drab": 3, "drac": 3, "draf": 46, "drag": 161, "drah": 1, "drai": 66, "drak": 10, "dram": 159, "dran": 58, "drap": 42, "dras": 21, "drau": 31, "drav": 13, "draw": 593, "dray": 1, "drd": 3, "dre": 1660, "drea": 886, "dred": 1, "dreg": 8, "drei": 4, "dren": 13, "dres": 428, "drew": 2, "drex": 11, "drey": 9, "dri": 1744, "drib": 4, "drie": 108, "drif": 91, "dril": 60, "drin": 768, "drip": 37, "driu": 8, "driv": 647, "driz": 12, "dro": 902, "droi": 1, "drol": 12, "drom": 14, "dron": 11, "droo": 45, "drop": 381, "dros": 16, "drou": 27, "drov": 131, "drow": 112, "dru": 459, "drub": 1, "drud": 5, "drug": 90, "drui": 4, "drum": 72, "drun": 211, "drur": 5, "drus": 1, "drut": 1, "dry": 65, "drya": 3, "dryd": 3, "drye": 5, "dryf": 3, "dryg": 1, "dryi": 31, "dryl": 8, "dryn": 6, "drys": 1, "dryw": 4, "dua": 17, "dual": 6, "duan": 1, "dub": 61, "dubb": 4, "dubi": 24, "dubl": 17, "dubo": 16, "duc": 130, "duca": 3, "duce": 1, "duch": 43, "duck": 31, "ducl": 7, "ducr": 13, "duct": 8, "dud": 5, "dudg": 1, "dudl": 1, "duds": 1, "due": 79, "duel": 23, "dues": 4, "duet": 2, "duf": 13, "duff": 9, "dufr": 2, "dug": 12, "duga": 2, "dugd": 1, "dugg": 1, "dugo": 8, "duh": 1, "duha": 1, "duk": 127, "duke": 23, "dul": 185, "dulc": 9, "dull": 28, "duln": 5, "dum": 142, "duma": 5, "dumb": 15, "dumf": 1, "dumm": 6, "dumo": 10, "dump": 26, "dun": 164, "dunb": 4, "dunc": 28, "dund": 2, "dune": 10, "dunf": 1, "dung": 38, "dunk": 6, "dunl": 1, "dunn": 7, "duns": 23, "duo": 11, "duod": 11, "dup": 50, "dupe": 7, "dupl": 29, "dupo": 6, "duq": 1, "duqu": 1, "dur": 813, "dura": 58, "dure": 7, "duri": 707, "durk": 5, "durl": 1, "duro": 1, "durr": 1, "durs": 31, "durw": 1, "dus": 338, "dusk": 19, "duss": 4, "dust": 50, "dut": 306, "dutc": 49, "dute": 1, "duti": 75, "dutt": 2, "duv": 2, "duve": 1, "duvo": 1, "duy": 1, "duyv": 1, "dvo": 1, "dvor": 1, "dwa": 22, "dwar": 22, "dwe": 896, "dwel": 896, "dwi": 25, "dwig": 12, "dwin": 13, "dwo": 1, "dwy": 4, "dwye": 4, "dye": 32, "dyei": 1, "dyer": 1, "dyes": 2, "dyi": 114, "dyin": 114, "dyk": 1, "dyl": 11, "dyla": 11, "dyn": 79, "dyna": 78, "dyno": 1, "dyo": 1, "dyq": 1, "dyqu": 1, "dyr": 1, "dys": 29, "dyse": 1, "dysp": 9, "dyst": 19, "eac": 1688, "ead": 1, "eade": 1, "eag": 377, "eage": 299, "eagl": 78, "eal": 1, "eali": 1, "ear": 3577, "eard": 1, "eare": 18, "eari": 2, "earl": 873, "earm": 2, "earn": 288, "earp": 1, "earr": 20, "ears": 4, "eart": 1987, "eas": 1460, "ease": 21, "easi": 361, "east": 168, "easy": 5, "eat": 385, "eata": 5, "eate": 220, "eati": 134, "eato": 2, "eav": 4, "eave": 2, "eba": 8, "ebb": 9, "ebbe": 2, "ebbi": 4, "ebc": 2, "ebcd": 2, "ebe": 33, "ebed": 6, "eben": 3, "ebi": 3, "ebia": 3, "ebo": 56, "ebon": 9, "eboo": 46, "ebr": 2, "ebro": 2, "ebu": 4, "ebul": 4, "ecb": 1, "ecba": 1, "ecc": 57, "ecce": 41, "ecch": 1, "eccl": 15, "ech": 92, "eche": 3, "echo": 62, "eck": 5, "ecka": 1, "ecke": 4, "ecl": 30, "ecla": 7, "ecle": 4, "ecli": 19, "eco": 416, "ecol": 3, "econ": 413, "ecs": 52, "ecst": 52, "ecu": 34, "ecua": 2, "ecum": 32, "eda": 1, "edd": 58, "eddi": 44, "eddy": 8, "ede": 88, "edem": 3, "eden": 2, "edg": 319, "edga": 4, "edge": 77, "edgi": 8, "edgw": 1, "edi": 316, "edib": 5, "edic": 6, "edif": 37, "edin": 1, "edis": 4, "edit": 261, "edm": 41, "edmo": 2, "edmu": 39, "edn": 3, "edo": 105, "edom": 19, "edr": 8, "edre": 8, "edt": 1, "edti": 1, "edu": 415, "edua": 1, "educ": 414, "edw": 342, "edwa": 328, "edwi": 14, "edy": 16, "edyt": 16, "eea": 1, "eeae": 1, "eef": 1, "eefa": 1, "eel": 6, "een": 1, "eer": 7, "eeri": 7, "eff": 1244, "effa": 5, "effe": 746, "effi": 119, "effl": 26, "effo": 316, "effr": 3, "effu": 29, "ega": 2, "egal": 2, "ege": 1, "eger": 1, "egg": 69, "egge": 1, "eggh": 2, "eggs": 2, "egi": 2, "egil": 1, "egin": 1, "egl": 16, "egla": 3, "eglo": 13, "ego": 18, "egoa": 1, "egoc": 1, "egot": 14, "egr": 6, "egre": 6, "egy": 799, "egyp": 799, "ehl": 1, "ehle": 1, "ehr": 1, "ehre": 1, "ehu": 10, "eic": 20, "eich": 20, "eid": 30, "eide": 2, "eido": 28, "eie": 3, "eiel": 1, "eif": 1, "eiff": 1, "eig": 525, "eigh": 525, "eil": 29, "eile": 29, "ein": 10, "eins": 8, "eir": 2, "eis": 63, "eise": 62, "eisl": 1, "eit": 665, "eith": 665, "eja": 16, "ejac": 16, "eje": 7, "ejec": 7, "eka": 1, "ekat": 1, "ekb": 1, "ekbe": 1, "eke": 3, "ekr": 24, "ekro": 24, "eks": 27, "ekst": 27, "ekw": 1, "ekwa": 1, "ela": 204, "elab": 66, "elad": 1, "elai": 23, "elam": 2, "elap": 13, "elas": 31, "elat": 22, "elb": 70, "elbe": 1, "elbo": 63, "elbr": 1, "elbu": 1, "eld": 367, "elda": 4, "elde": 361, "eldo": 2, "ele": 1434, "elea": 97, "elec": 643, "elee": 1, "eleg": 148, "elel": 1, "elem": 259, "elen": 4, "elep": 97, "eleu": 4, "elev": 171, "elf": 3, "elfi": 3, "elg": 1, "elgi": 1, "elh": 4, "elha": 4, "eli": 1364, "elia": 101, "elic": 10, "elid": 1, "elie": 26, "elig": 43, "elih": 13, "elij": 86, "elik": 1, "elim": 83, "elin": 688, "elio": 14, "elip": 26, "elis": 97, "elit": 13, "eliu": 2, "elix": 1, "eliz": 151, "elk": 25, "elka": 21, "elkh": 1, "elko": 1, "ell": 351, "ella": 3, "elle": 13, "elli": 328, "ells": 1, "ellw": 1, "elm": 18, "elma": 5, "elme": 6, "elmi": 1, "elmo": 1, "eln": 8, "elna": 8, "elo": 75, "eloc": 1, "eloi": 1, "elon": 11, "elop": 6, "eloq": 43, "elot": 3, "elp": 5, "elpa": 5, "els": 851, "else": 94, "elsi": 7, "elso": 3, "elt": 414, "elte": 3, "elto": 411, "elu": 59, "elua": 4, "eluc": 8, "elud": 30, "elue": 1, "elus": 9, "elut": 5, "eluz": 1, "elv": 12, "elve": 9, "elvi": 3, "ely": 8, "elym": 1, "elys": 7, "elz": 4, "elza": 4, "ema": 41, "emac": 5, "emai": 3, "eman": 31, "emas": 2, "emb": 408, "emba": 170, "embe": 22, "embi": 2, "embl": 23, "embo": 60, "embr": 131, "emc": 1, "emce": 1, "eme": 223, "emen": 1, "emer": 217, "emet": 5, "emi": 122, "emig": 12, "emil": 9, "emim": 2, "emin": 50, "emis": 36, "emit": 6, "emm": 894, "emma": 5, "emme": 12, "emmo": 1, "emo": 252, "emol": 1, "emor": 14, "emot": 237, "emp": 1083, "empa": 1, "empe": 100, "emph": 145, "empi": 106, "empl": 439, "empo": 5, "empr": 6, "empt": 263, "empy": 18, "ems": 1, "emse": 1, "emu": 25, "emul": 25, "ena": 137, "enab": 80, "enac": 36, "enam": 15, "enc": 638, "enca": 66, "ence": 2, "ench": 56, "enci": 13, "encl": 62, "enco": 400, "encr": 27, "encu": 8, "ency": 4, "end": 962, "enda": 16, "ende": 308, "endg": 1, "endi": 57, "endl": 101, "endo": 52, "endp": 3, "endt": 1, "endu": 252, "endw": 2, "ene": 854, "enea": 1, "eneg": 1, "enem": 666, "ener": 186, "enf": 84, "enfa": 1, "enfe": 4, "enfi": 1, "enfl": 1, "enfo": 74, "enfr": 3, "eng": 1546, "enga": 462, "enge": 23, "engi": 244, "engl": 739, "engr": 67, "engu": 10, "enh": 22, "enha": 20, "enhu": 2, "eni": 15, "enig": 14, "enio": 1, "enj": 383, "enjo": 383, "enk": 2, "enki": 2, "enl": 148, "enla": 72, "enli": 76, "enm": 23, "enme": 2, "enmi": 21, "enn": 14, "enna": 1, "enni": 1, "enno": 2, "ennu": 8, "eno": 1384, "enoc": 13, "enor": 121, "enos": 1, "enou": 1238, "enq": 135, "enqu": 135, "enr": 83, "enra": 21, "enri": 31, "enro": 31, "ens": 189, "ensa": 7, "ensc": 39, "ense": 22, "ensh": 6, "ensi": 29, "ensl": 12, "ensn": 2, "enso": 2, "ensu": 70, "ent": 2512, "enta": 50, "ente": 1296, "enth": 119, "enti": 668, "ento": 7, "entr": 366, "entw": 5, "enu": 19, "enui": 4, "enum": 8, "enun": 3, "enur": 1, "env": 292, "enve": 78, "envi": 131, "envo": 4, "envy": 11, "enw": 3, "enwi": 2, "enwr": 1, "enz": 22, "enzy": 21, "eos": 1, "eosi": 1, "epa": 51, "epae": 1, "epam": 33, "epap": 5, "epau": 12, "eph": 350, "epha": 42, "ephe": 41, "ephl": 2, "epho": 52, "ephp": 1, "ephr": 212, "epi": 199, "epic": 35, "epid": 20, "epig": 9, "epil": 7, "epip": 10, "epis": 70, "epit": 26, "epo": 10, "epoc": 8, "epox": 2, "epp": 2, "eppi": 1, "eppl": 1, "eps": 8, "epsi": 1, "epso": 6, "epst": 1, "eqn": 1, "equ": 1042, "equa": 674, "eque": 2, "equi": 366, "era": 34, "erad": 5, "eran": 1, "erar": 2, "eras": 15, "erb": 1, "erbl": 1, "erc": 1, "erco": 1, "erd": 4, "erdm": 1, "erdo": 2, "ere": 113, "ereb": 2, "erec": 101, "erel": 2, "erem": 1, "erew": 7, "erf": 1, "erfl": 1, "erg": 3, "ergo": 1, "erh": 3, "erha": 3, "eri": 29, "eric": 5, "erik": 9, "erit": 1, "erl": 1, "erle": 1, "erm": 5, "erma": 2, "ermi": 3, "ern": 36, "erna": 2, "erne": 10, "erni": 19, "erns": 5, "ero": 32, "erod": 4, "erom": 10, "eros": 6, "erot": 10, "erp": 1, "erpo": 1, "err": 241, "erra": 56, "erre": 23, "erri": 5, "erro": 153, "erru": 1, "ers": 17, "ersa": 2, "ersh": 1, "ersk": 5, "ersp": 1, "ert": 1, "erth": 1, "eru": 37, "erud": 8, "erup": 29, "erv": 2, "ervi": 2, "erw": 5, "erwa": 1, "erwe": 1, "erwh": 2, "erwi": 1, "ery": 3, "erys": 2, "eryt": 1, "esa": 126, "esai": 21, "esar": 3, "esc": 470, "esca": 423, "esch": 13, "esco": 27, "escr": 2, "escu": 5, "ese": 1, "esh": 30, "eshb": 4, "eshc": 6, "eshe": 2, "eshk": 1, "eshl": 1, "esht": 16, "esi": 1, "esil": 1, "esk": 5, "eski": 5, "esl": 1, "esm": 2, "esma": 2, "esn": 1, "esna": 1, "eso": 4, "esot": 4, "esp": 380, "espa": 3, "espe": 336, "espi": 14, "espl": 3, "espo": 14, "espr": 6, "espy": 1, "esq": 5, "esqu": 5, "esr": 3, "esro": 3, "ess": 262, "essa": 39, "esse": 221, "est": 971, "esta": 575, "este": 102, "esth": 73, "esti": 202, "esto": 1, "estr": 16, "estu": 2, "eta": 6, "etai": 1, "etc": 12, "etce": 9, "etch": 3, "ete": 241, "eter": 237, "etex": 3, "eth": 208, "etha": 17, "ethb": 1, "ethe": 53, "ethi": 113, "ethn": 16, "etho": 4, "ethy": 4, "eti": 6, "etiq": 6, "etn": 2, "eto": 31, "eton": 1, "etr": 3, "etru": 2, "ett": 3, "etto": 1, "etu": 2, "etud": 2, "ety": 2, "etym": 2, "eub": 2, "eubo": 1, "eubu": 1, "euc": 6, "euca": 1, "eucl": 5, "eue": 156, "euen": 4, "euer": 58, "eug": 44, "euge": 44, "eui": 11, "euid": 1, "euil": 10, "eul": 6, "eula": 1, "eulo": 5, "eum": 1, "eumm": 1, "eun": 28, "euni": 1, "eunu": 27, "euo": 1, "euod": 1, "eup": 31, "euph": 31, "eur": 264, "eura": 2, "euri": 3, "euro": 255, "euru": 1, "eury": 3, "eus": 10, "eust": 10, "eut": 2, "eute": 1, "euty": 1, "eva": 303, "evac": 9, "evad": 14, "eval": 68, "evan": 51, "evap": 9, "evas": 11, "eve": 11267, "eveg": 1, "evel": 4, "even": 1098, "ever": 4513, "evi": 1432, "evic": 2, "evid": 450, "evil": 66, "evin": 31, "evo": 82, "evoc": 5, "evok": 22, "evol": 55, "evz": 1, "evzo": 1, "ewe": 7, "exa": 1323, "exac": 439, "exag": 47, "exal": 141, "exam": 668, "exas": 28, "exb": 2, "exba": 1, "exbo": 1, "exc": 2396, "exca": 7, "exce": 1421, "exch": 124, "exci": 245, "excl": 393, "exco": 8, "excr": 9, "excu": 189, "exe": 671, "exea": 1, "exec": 235, "exeg": 3, "exem": 34, "exer": 298, "exet": 16, "exeu": 82, "exf": 1, "exfi": 1, "exg": 2, "exga": 1, "exgo": 1, "exh": 261, "exha": 90, "exhi": 129, "exho": 39, "exhu": 3, "exi": 551, "exig": 5, "exil": 22, "exis": 438, "exit": 5, "exj": 2, "exja": 1, "exju": 1, "exl": 2, "exli": 2, "exm": 20, "exma": 2, "exmo": 15, "exmr": 2, "exmu": 1, "exn": 1, "exna": 1, "exo": 32, "exod": 5, "exog": 3, "exon": 5, "exor": 9, "exot": 10, "exp": 3797, "expa": 193, "expe": 1997, "expi": 35, "expl": 733, "expo": 227, "expr": 602, "expu": 9, "exq": 55, "exqu": 55, "exs": 2, "exsc": 1, "exsi": 1, "ext": 1317, "exta": 16, "exte": 551, "exti": 38, "exto": 33, "extr": 679, "exu": 66, "exub": 14, "exud": 8, "exul": 43, "exur": 1, "exy": 1, "exya": 1, "eye": 2026, "eyeb": 46, "eyed": 1, "eyef": 2, "eyeg": 4, "eyei": 40, "eyel": 35, "eyem": 1, "eyep": 1, "eyes": 18, "eyet": 2, "eyeu": 2, "eyew": 4, "eyi": 2, "eyin": 2, "eyk": 1, "eyl": 1, "eyr": 12, "eyre": 7, "eyri": 4, "eyt": 2, "eyth": 2, "eza": 1, "ezb": 3, "ezba": 1, "ezbo": 2, "eze": 19, "ezek": 8, "ezi": 7, "ezio": 7, "ezn": 1, "ezni": 1, "ezr": 31, "ezra": 1, "ezz": 16, "fab": 134, "fabe": 7, "fabi": 4, "fabl": 47, "fabr": 64, "fabu": 12, "fac": 3457, "faca": 23, "face": 418, "faci": 181, "facs": 3, "fact": 420, "facu": 91, "fad": 111, "fadd": 1, "fade": 70, "fadi": 20, "fae": 3, "faer": 3, "fag": 21, "faga": 1, "fage": 6, "fagg": 12, "fagi": 1, "fago": 1, "fah": 2, "fahe": 1, "fahr": 1, "fai": 2375, "faie": 2, "fail": 313, "fain": 219, "fair": 526, "fait": 718, "fak": 17, "fake": 5, "faki": 1, "fal": 1484, "falc": 24, "fale": 1, "fall": 538, "falm": 1, "faln": 3, "fals": 256, "falt": 23, "fam": 1663, "fame": 12, "fami": 1393, "famo": 182, "fan": 606, "fana": 23, "fanc": 358, "fane": 1, "fanf": 1, "fang": 6, "fann": 76, "fans": 37, "fant": 75, "far": 1057, "fara": 1, "farc": 14, "fard": 2, "fare": 86, "farf": 5, "farg": 2, "fari": 5, "farl": 1, "farm": 376, "farn": 5, "faro": 7, "farr": 40, "fars": 1, "fart": 253, "farv": 1, "farw": 5, "fas": 954, "fasc": 69, "fash": 269, "fast": 207, "fat": 3602, "fata": 86, "fatb": 1, "fate": 24, "fatf": 2, "fath": 3245, "fati": 48, "fatl": 6, "fatn": 19, "fats": 2, "fatt": 27, "fatu": 3, "fau": 253, "fauc": 2, "faul": 223, "faun": 3, "fauo": 13, "faus": 11, "faut": 1, "fav": 615, "favo": 609, "favr": 6, "faw": 20, "fawc": 1, "fawk": 4, "fawn": 12, "fay": 7, "faye": 4, "fayl": 1, "faz": 2, "fazi": 1, "fda": 1, "fea": 1935, "feal": 4, "fear": 547, "feas": 245, "feat": 315, "feau": 1, "feb": 68, "febr": 68, "fec": 3, "fecu": 3, "fed": 304, "feda": 27, "fede": 274, "fedo": 2, "fee": 2836, "feeb": 68, "feed": 115, "feeg": 3, "feej": 1, "feel": 841, "feen": 1, "feep": 2, "feet": 2, "feg": 1, "fege": 1, "fei": 31, "feig": 27, "fein": 3, "fej": 3, "feje": 3, "fel": 2311, "fele": 1, "feli": 152, "fell": 546, "felo": 14, "fels": 1, "fem": 190, "fema": 154, "femi": 30, "femm": 6, "fen": 164, "fenc": 145, "fend": 6, "fenn": 5, "fens": 1, "fenu": 1, "fenw": 2, "fer": 325, "ferb": 1, "ferd": 4, "ferg": 11, "feri": 1, "ferl": 1, "ferm": 15, "fern": 8, "fero": 16, "ferr": 186, "fert": 43, "feru": 2, "ferv": 35, "fes": 95, "feso": 1, "fest": 93, "fet": 179, "fetc": 140, "fete": 5, "feti": 10, "feto": 2, "fett": 19, "feu": 34, "feuc": 2, "feud": 21, "feue": 2, "feui": 5, "feuo": 1, "fev": 91, "feve": 91, "few": 45, "fewe": 44, "fewn": 1, "fey": 1, "feye": 1, "ffo": 1, "ffor": 1, "ffr": 1, "ffre": 1, "fia": 22, "fian": 2, "fias": 4, "fiat": 2, "fib": 90, "fibe": 60, "fibr": 30, "fic": 81, "fich": 3, "fick": 8, "fict": 70, "fid": 38, "fidd": 10, "fide": 22, "fidg": 5, "fie": 1359, "fied": 10, "fief": 1, "fiel": 992, "fien": 55, "fier": 300, "fies": 1, "fif": 628, "fife": 1, "fiff": 1, "fift": 616, "fig": 1285, "figa": 1, "figg": 4, "figh": 596, "figm": 2, "figo": 2, "figu": 620, "fik": 2, "fil": 1184, "fila": 9, "filb": 3, "filc": 1, "fild": 1, "file": 61, "fili": 55, "fill": 494, "film": 41, "filt": 90, "fin": 3751, "fina": 750, "finb": 2, "finc": 1, "find": 360, "fine": 103, "fing": 343, "fini": 376, "fink": 1, "finl": 4, "finn": 13, "fino": 1, "fins": 32, "fio": 5, "fior": 5, "fir": 5243, "fire": 218, "firi": 27, "firk": 2, "firm": 213, "firs": 3500, "firt": 1, "firz": 1, "fis": 956, "fisc": 120, "fish": 386, "fisk": 5, "fiss": 12, "fist": 28, "fit": 192, "fitc": 5, "fitf": 18, "fitl": 7, "fitn": 12, "fitt": 105, "fitz": 8, "fiu": 2, "fiv": 901, "five": 34, "fix": 321, "fixa": 1, "fixe": 281, "fixi": 27, "fixt": 7, "fiz": 2, "fizz": 2, "fjo": 2, "fjor": 2, "fla": 1437, "flab": 2, "flac": 1, "flag": 55, "flai": 19, "flak": 23, "flam": 403, "flan": 75, "flap": 39, "flar": 26, "flas": 276, "flat": 194, "flau": 24, "flav": 34, "flaw": 6, "flax": 8, "flay": 1, "fle": 1294, "flea": 18, "flec": 4, "fled": 10, "flee": 125, "flei": 7, "flem": 8, "fles": 581, "flet": 7, "flex": 58, "fli": 344, "flic": 24, "flie": 57, "flig": 147, "flim": 3, "flin": 56, "flip": 13, "flir": 13, "flit": 17, "fln": 1, "flo": 1825, "floa": 160, "floc": 245, "floe": 4, "flog": 15, "flon": 1, "floo": 463, "flop": 9, "flor": 95, "flot": 5, "flou": 174, "flow": 510, "floy": 4, "flu": 417, "flub": 1, "fluc": 8, "flue": 14, "fluf": 5, "flug": 1, "flui": 65, "fluk": 49, "flum": 5, "flun": 87, "fluo": 23, "flur": 11, "flus": 53, "flut": 60, "flux": 4, "fly": 215, "flya": 1, "flyb": 1, "flyd": 1, "flye": 11, "flyi": 172, "flyn": 3, "flyw": 1, "fma": 1, "fmaj": 1, "foa": 151, "foal": 3, "foam": 64, "fob": 2, "fobb": 2, "foc": 75, "foca": 9, "focu": 65, "fod": 2, "fodd": 2, "foe": 48, "foet": 2, "fog": 42, "foge": 2, "fogg": 13, "foi": 58, "foib": 12, "foil": 11, "foin": 1, "fois": 1, "fok": 1, "foki": 1, "fol": 1863, "fold": 109, "fole": 1, "folg": 2, "foli": 38, "folk": 85, "foll": 1536, "fols": 1, "fom": 11, "fome": 3, "fomo": 8, "fon": 213, "fond": 37, "fonn": 1, "font": 5, "foo": 1424, "food": 59, "fool": 291, "foor": 6, "foot": 220, "fop": 4, "fopp": 4, "for": 8294, "fora": 55, "forb": 241, "forc": 813, "ford": 6, "fore": 1172, "forf": 17, "forg": 984, "fori": 1, "fork": 32, "forl": 24, "form": 1257, "forn": 45, "forr": 8, "fors": 210, "fort": 2181, "foru": 12, "forw": 459, "fos": 68, "fosd": 13, "foss": 21, "fost": 31, "fou": 3866, "foug": 161, "foul": 31, "foun": 2231, "four": 397, "fov": 1, "fovu": 1, "fow": 139, "fowl": 81, "fox": 15, "foxe": 9, "foxh": 3, "foxt": 1, "foy": 10, "foye": 3, "foyl": 6, "foys": 1, "fpl": 6, "fpla": 6, "fra": 1508, "frac": 59, "frag": 106, "frai": 29, "fram": 207, "fran": 1008, "frao": 1, "frat": 16, "frau": 47, "fray": 10, "fraz": 1, "fre": 2347, "frea": 13, "frec": 16, "fred": 177, "free": 447, "frei": 58, "frel": 5, "fren": 308, "freq": 296, "fres": 353, "fret": 21, "freu": 14, "frey": 3, "fri": 2362, "fria": 8, "fric": 26, "frid": 73, "frie": 1871, "frig": 282, "fril": 5, "frin": 48, "fris": 8, "frit": 16, "friv": 22, "friz": 3, "fro": 14314, "frob": 1, "froc": 33, "frod": 12, "frog": 27, "froh": 1, "froi": 3, "frol": 14, "from": 30, "fron": 495, "fror": 1, "fros": 62, "frot": 12, "frow": 85, "froz": 66, "fru": 600, "fruc": 3, "frug": 9, "frui": 545, "frus": 43, "fry": 4, "fryi": 4, "fsu": 1, "fsup": 1, "fuc": 16, "fuch": 5, "fuck": 7, "fud": 13, "fudd": 1, "fudo": 5, "fue": 34, "fueg": 1, "fuel": 6, "fug": 31, "fuga": 1, "fugi": 28, "fugu": 2, "fuh": 3, "fuhr": 3, "fui": 1, "fuj": 3, "fuji": 2, "ful": 1568, "fulb": 2, "fulf": 186, "fulg": 1, "fulh": 3, "fulk": 3, "full": 273, "fulm": 2, "fuln": 32, "fult": 17, "fum": 42, "fumb": 20, "fume": 14, "fumi": 5, "fun": 642, "funa": 1, "func": 216, "fund": 188, "fune": 64, "funf": 1, "fung": 6, "funl": 2, "funn": 89, "funs": 2, "fur": 1065, "furb": 8, "furh": 1, "furi": 102, "furl": 17, "furn": 285, "furo": 4, "furp": 1, "furr": 27, "furt": 475, "fus": 70, "fuse": 13, "fusi": 22, "fuss": 7, "fust": 2, "fut": 412, "futh": 1, "futi": 17, "futo": 1, "futu": 393, "fuz": 13, "fuzz": 10, "fyo": 1, "fyod": 1, "gaa": 14, "gaaf": 1, "gaas": 4, "gab": 88, "gaba": 1, "gabb": 6, "gabl": 14, "gabr": 64, "gad": 39, "gada": 3, "gadd": 4, "gadf": 3, "gadg": 12, "gadi": 15, "gae": 8, "gaei": 1, "gael": 3, "gaet": 1, "gaf": 5, "gaff": 3, "gag": 21, "gaga": 2, "gage": 3, "gagg": 7, "gagi": 1, "gagl": 1, "gagw": 1, "gah": 4, "gaha": 3, "gai": 448, "gaie": 39, "gail": 16, "gain": 202, "gait": 5, "gaiu": 5, "gal": 483, "gala": 32, "galb": 1, "gale": 11, "gali": 86, "gall": 257, "galo": 2, "galt": 2, "galv": 12, "galw": 4, "gam": 369, "gama": 7, "gamb": 45, "game": 82, "gami": 9, "gamm": 9, "gamu": 6, "gan": 99, "gana": 1, "gand": 3, "gane": 1, "gang": 34, "gann": 9, "gans": 6, "gant": 7, "gao": 7, "gaol": 1, "gap": 44, "gape": 14, "gapi": 13, "gar": 1144, "gara": 31, "garb": 12, "garc": 3, "gard": 651, "gare": 3, "garg": 7, "gari": 25, "garl": 33, "garm": 222, "garn": 24, "garr": 80, "gars": 10, "gart": 27, "garv": 2, "garz": 1, "gas": 129, "gasc": 3, "gase": 13, "gasf": 1, "gasg": 1, "gash": 8, "gask": 6, "gasl": 4, "gaso": 13, "gasp": 39, "gass": 8, "gast": 12, "gat": 1386, "gata": 3, "gate": 232, "gath": 701, "gatl": 2, "gato": 2, "gats": 1, "gau": 86, "gauc": 4, "gaud": 11, "gaue": 2, "gaug": 19, "gaul": 7, "gaun": 20, "gaus": 4, "gaut": 1, "gauz": 3, "gav": 1263, "gave": 38, "gavi": 25, "gavo": 1, "gaw": 4, "gawd": 2, "gawk": 1, "gay": 26, "gaye": 14, "gayh": 2, "gayl": 7, "gayn": 3, "gaz": 207, "gaza": 1, "gaze": 63, "gazi": 57, "gazz": 2, "gea": 34, "gear": 7, "geat": 1, "geb": 17, "geba": 2, "gebe": 2, "gebi": 1, "ged": 48, "geda": 32, "gedd": 1, "gede": 8, "gedo": 7, "gee": 18, "geei": 1, "geel": 8, "geer": 1, "gees": 7, "geg": 1, "gege": 1, "geh": 18, "geha": 12, "gehe": 1, "gehr": 5, "gei": 2, "geig": 1, "geis": 1, "gel": 10, "gela": 1, "geld": 7, "geli": 1, "gell": 1, "gem": 23, "gema": 6, "geme": 1, "gemi": 4, "geml": 1, "gemm": 1, "gen": 2986, "gend": 20, "gene": 1732, "geni": 85, "genl": 1, "genn": 5, "geno": 1, "genr": 3, "gent": 1047, "genu": 70, "geo": 360, "geoc": 5, "geod": 1, "geog": 46, "geol": 30, "geom": 31, "geop": 2, "geor": 245, "ger": 423, "gera": 31, "gerb": 1, "gere": 1, "gerg": 1, "gerh": 1, "geri": 5, "germ": 291, "gero": 6, "gerr": 4, "gers": 48, "gert": 18, "geru": 2, "gery": 1, "ges": 141, "gesa": 2, "gesh": 19, "gesn": 1, "gest": 118, "gesu": 1, "get": 403, "geta": 1, "geth": 4, "gett": 309, "getz": 1, "geu": 2, "geue": 1, "geul": 1, "gev": 1, "gevu": 1, "gey": 4, "geys": 4, "gez": 14, "geze": 13, "gezr": 1, "gha": 32, "ghad": 1, "ghan": 4, "ghas": 24, "ghau": 1, "ghaz": 2, "ghe": 19, "ghen": 2, "gher": 1, "ghet": 16, "ghi": 1, "ghib": 1, "gho": 217, "ghor": 3, "ghos": 211, "ghou": 3, "gia": 141, "giac": 2, "gian": 135, "giao": 3, "gib": 158, "giba": 2, "gibb": 34, "gibe": 101, "gibl": 2, "gibr": 7, "gibs": 11, "gid": 67, "gidd": 20, "gide": 44, "gidg": 1, "gido": 1, "gie": 2, "gif": 260, "giff": 19, "gift": 116, "gig": 67, "giga": 52, "gige": 1, "gigg": 13, "gih": 6, "giho": 6, "gil": 270, "gila": 1, "gilb": 47, "gild": 16, "gile": 128, "gilg": 41, "gilk": 1, "gill": 9, "gilm": 4, "gilo": 4, "gilr": 1, "gim": 7, "gimb": 3, "gimc": 1, "gimm": 1, "gimp": 1, "gimz": 1, "gin": 98, "gina": 2, "ging": 74, "gink": 1, "ginm": 2, "ginn": 11, "gins": 1, "gio": 7, "gioc": 1, "gior": 3, "giov": 3, "gip": 43, "gips": 43, "gir": 928, "gira": 2, "gird": 102, "girg": 7, "girl": 261, "girt": 7, "gis": 9, "gise": 5, "giso": 1, "gisp": 1, "git": 13, "gitt": 13, "giu": 170, "giub": 1, "giue": 40, "giui": 6, "giul": 1, "gius": 4, "giv": 4121, "give": 1583, "givi": 319, "giz": 4, "gize": 2, "gizo": 1, "gizz": 1, "gla": 1293, "glac": 7, "glad": 122, "glam": 25, "glan": 257, "glar": 63, "glas": 378, "glau": 1, "glay": 1, "glaz": 35, "gle": 143, "glea": 82, "gleb": 1, "gled": 1, "glee": 7, "glei": 1, "glen": 28, "gli": 297, "glib": 5, "glid": 62, "glim": 97, "glin": 17, "glis": 56, "glit": 57, "glo": 1259, "gloa": 7, "glob": 127, "gloc": 1, "glom": 3, "gloo": 109, "glor": 798, "glos": 18, "glot": 5, "glou": 8, "glov": 69, "glow": 62, "gloz": 2, "glu": 71, "glue": 26, "glum": 3, "glut": 23, "gly": 15, "glyc": 15, "gna": 47, "gnar": 5, "gnas": 18, "gnaw": 16, "gne": 1, "gnei": 1, "gno": 5, "gnom": 5, "goa": 291, "goad": 8, "goal": 43, "goar": 1, "goat": 109, "gob": 29, "gobb": 12, "gobe": 3, "gobl": 14, "god": 638, "goda": 1, "godb": 1, "godc": 1, "godd": 100, "godf": 3, "godg": 3, "godh": 13, "godk": 4, "godl": 49, "godm": 12, "godo": 5, "gods": 2, "godu": 1, "godw": 5, "goe": 470, "goer": 2, "goes": 49, "goet": 141, "gog": 52, "gogg": 9, "gogo": 40, "goi": 1249, "goin": 1224, "goit": 8, "gol": 1050, "gola": 4, "golc": 1, "gold": 267, "golf": 11, "golg": 5, "goli": 8, "goll": 3, "golo": 2, "gom": 37, "gomb": 1, "gome": 8, "gomo": 27, "gomp": 1, "gon": 956, "gonc": 1, "gond": 1, "gone": 5, "gonf": 1, "gong": 4, "gonn": 18, "gont": 2, "gonz": 16, "goo": 4134, "good": 395, "gooe": 1, "goof": 1, "gool": 1, "gooo": 1, "goos": 30, "gop": 1, "goph": 1, "gor": 161, "gorb": 7, "gord": 24, "gore": 6, "gorg": 56, "gorh": 5, "gori": 2, "gork": 1, "gors": 4, "gort": 37, "gos": 193, "gosa": 1, "gosh": 16, "gosl": 1, "gosp": 133, "goss": 38, "got": 84, "goth": 15, "goto": 1, "gott": 66, "gou": 67, "goue": 6, "goug": 11, "goul": 12, "goun": 1, "gour": 20, "gout": 6, "gouv": 2, "gov": 867, "gove": 867, "gow": 72, "gowa": 1, "gowl": 3, "gown": 16, "goy": 1, "goye": 1, "goz": 5, "goza": 5, "gra": 3459, "graa": 2, "grab": 35, "grac": 497, "grad": 303, "graf": 25, "grah": 17, "grai": 104, "gram": 55, "gran": 731, "grap": 169, "gras": 411, "grat": 319, "grau": 31, "grav": 519, "gray": 17, "graz": 40, "gre": 6368, "grea": 4515, "grec": 26, "gree": 998, "greg": 154, "gren": 17, "gres": 51, "gret": 1, "grev": 22, "grew": 1, "grey": 48, "gri": 694, "grid": 2, "grie": 261, "grif": 29, "grig": 14, "gril": 21, "grim": 58, "grin": 122, "grip": 45, "gris": 16, "grit": 8, "griz": 10, "gro": 2949, "groa": 67, "groc": 19, "grog": 6, "groi": 5, "grok": 8, "gron": 4, "groo": 36, "grop": 43, "gros": 128, "grot": 43, "grou": 1437, "grov": 139, "grow": 770, "gru": 132, "grub": 8, "grud": 29, "grue": 11, "gruf": 16, "grul": 1, "grum": 26, "grun": 28, "gruo": 1, "grup": 5, "gry": 56, "gryp": 56, "grz": 1, "grze": 1, "gta": 1, "gtax": 1, "gua": 311, "guad": 1, "guan": 1, "guar": 291, "guat": 4, "gub": 7, "gube": 7, "gud": 4, "gudg": 4, "gue": 469, "guer": 48, "gues": 420, "guev": 1, "guf": 3, "guff": 3, "gug": 2, "gugg": 1, "gugl": 1, "gui": 757, "guia": 3, "guid": 235, "guif": 3, "guig": 1, "guil": 275, "guim": 1, "guin": 186, "guis": 13, "guit": 29, "guiz": 1, "gul": 101, "gulc": 1, "gule": 1, "gulf": 5, "gull": 29, "gulp": 6, "gum": 18, "gumc": 1, "gumm": 6, "gump": 1, "gun": 159, "gunb": 1, "gunf": 10, "guni": 1, "gunm": 7, "gunn": 15, "gunp": 14, "guns": 6, "gunt": 1, "gunw": 31, "gur": 22, "gurb": 1, "gurg": 12, "guri": 2, "gurk": 1, "gurl": 1, "gurr": 1, "gurs": 3, "gus": 47, "gush": 16, "guss": 1, "gust": 17, "gut": 73, "gute": 33, "gutf": 1, "guth": 3, "gutt": 22, "gutz": 1, "guy": 23, "guz": 2, "guzz": 2, "gwe": 1, "gwi": 1, "gwin": 1, "gwy": 1, "gwyn": 1, "gya": 1, "gyan": 1, "gym": 29, "gymn": 27, "gyn": 4, "gyne": 4, "gyp": 8, "gypl": 1, "gyps": 7, "gyr": 46, "gyra": 5, "gyro": 15, "gyu": 1, "gyue": 1, "haa": 4, "haae": 1, "haah": 1, "haar": 1, "haas": 1, "hab": 332, "haba": 6, "habe": 10, "habi": 309, "habl": 2, "habo": 3, "habs": 1, "hac": 39, "hach": 7, "hack": 28, "had": 219, "hada": 43, "hadd": 3, "hadi": 3, "hadl": 1, "hadn": 99, "hado": 4, "hadr": 2, "hads": 36, "hae": 3, "haec": 1, "haes": 1, "haf": 8, "hafi": 2, "hafl": 1, "haft": 3, "hag": 72, "haga": 19, "hage": 2, "hagg": 38, "hagn": 1, "hagu": 10, "hai": 793, "haij": 2, "hail": 67, "hain": 2, "hair": 128, "hait": 1, "haj": 1, "haji": 1, "hak": 5, "hakk": 2, "haku": 2, "hal": 1905, "hala": 5, "halc": 3, "hald": 1, "hale": 2, "half": 206, "halh": 1, "hali": 5, "halk": 1, "hall": 116, "halm": 1, "halo": 3, "halt": 36, "halv": 6, "haly": 4, "ham": 528, "hama": 92, "hamb": 12, "hame": 2, "hami": 29, "haml": 126, "hamm": 181, "hamo": 16, "hamp": 37, "hamr": 11, "hams": 1, "hamu": 8, "han": 5648, "hana": 60, "hanc": 6, "hand": 2122, "hane": 22, "hanf": 16, "hang": 229, "hani": 1, "hank": 4, "hann": 21, "hano": 97, "hans": 23, "hanu": 12, "hanw": 1, "hap": 1814, "hapg": 2, "haph": 7, "hapl": 54, "happ": 1750, "haq": 1, "haqv": 1, "har": 3708, "hara": 46, "harb": 96, "harc": 6, "hard": 813, "hare": 18, "harf": 1, "harg": 1, "harh": 4, "hari": 13, "hark": 3, "harl": 95, "harm": 140, "harn": 28, "haro": 44, "harp": 343, "harr": 676, "hars": 50, "hart": 193, "haru": 6, "harv": 270, "has": 1681, "hasa": 1, "hase": 1, "hash": 34, "hask": 3, "hasn": 20, "hasp": 1, "hasr": 1, "hass": 4, "hast": 371, "hasu": 1, "hat": 3248, "hata": 4, "hatb": 2, "hatc": 76, "hate": 200, "hatf": 3, "hath": 3, "hati": 15, "hatl": 2, "hatr": 58, "hatt": 77, "hau": 646, "haug": 54, "haui": 9, "haul": 34, "haum": 2, "haun": 65, "hauo": 2, "haup": 2, "haur": 2, "haus": 2, "haut": 6, "hav": 15210, "hava": 15, "have": 103, "havi": 1019, "havo": 14, "haw": 142, "hawa": 26, "hawi": 1, "hawk": 57, "haws": 9, "hawt": 16, "hay": 77, "hayd": 5, "haye": 6, "hayf": 1, "hayi": 1, "hayl": 3, "hayn": 1, "hays": 5, "hayt": 45, "hayw": 3, "haz": 175, "haza": 103, "haze": 18, "hazi": 2, "hazl": 5, "hazo": 19, "hea": 12192, "head": 693, "heal": 483, "heap": 50, "hear": 4796, "heat": 274, "heau": 104, "heav": 2149, "heb": 174, "hebe": 23, "hebr": 151, "hec": 25, "heca": 5, "hecc": 2, "heck": 1, "hecl": 2, "hect": 10, "hecu": 4, "hed": 114, "hedd": 1, "hedg": 103, "hedi": 2, "hedo": 4, "hedw": 4, "hee": 403, "heed": 39, "heel": 69, "heen": 1, "heer": 143, "heev": 2, "hef": 6, "heff": 2, "heft": 3, "heg": 14, "hega": 3, "hege": 10, "hei": 386, "heid": 22, "heif": 21, "heig": 237, "heil": 7, "hein": 11, "heir": 23, "heis": 8, "heit": 1, "hel": 2335, "hela": 4, "helb": 2, "held": 2, "hele": 29, "heli": 48, "helk": 4, "hell": 43, "helm": 52, "helo": 5, "help": 406, "hels": 1, "helt": 2, "helv": 37, "hem": 138, "hema": 20, "hemd": 1, "heme": 1, "hemi": 28, "heml": 12, "hemm": 6, "hemo": 16, "hemp": 20, "hemu": 5, "hen": 638, "hena": 4, "henc": 331, "hend": 11, "heng": 10, "henh": 1, "henl": 2, "heno": 2, "henp": 1, "henr": 262, "hens": 1, "heo": 1, "heor": 1, "hep": 18, "hepa": 3, "heph": 13, "hepk": 1, "hept": 1, "her": 4778, "hera": 37, "herb": 54, "herc": 29, "herd": 83, "here": 218, "herf": 6, "herg": 1, "heri": 54, "herm": 84, "hern": 6, "hero": 232, "herp": 4, "herr": 23, "hers": 1102, "hert": 8, "herz": 2, "hes": 211, "hese": 2, "hesh": 39, "hesi": 142, "hesp": 19, "hess": 5, "hest": 3, "het": 57, "hete": 10, "heth": 2, "hetm": 20, "heto": 1, "hett": 10, "heu": 4, "heus": 1, "heut": 1, "heuv": 2, "hev": 3, "hevi": 3, "hew": 52, "hewe": 28, "hewi": 1, "hewl": 2, "hex": 8, "hexa": 7, "hexe": 1, "hey": 16, "heyd": 9, "heyr": 2, "heyw": 5, "hez": 154, "heze": 129, "hezi": 3, "hezr": 22, "hia": 2, "hiaw": 2, "hib": 8, "hiba": 5, "hibe": 2, "hibl": 1, "hic": 20, "hicc": 2, "hick": 17, "hid": 425, "hidd": 104, "hide": 98, "hidi": 54, "hie": 37, "hier": 34, "hif": 2, "hifa": 1, "hig": 2554, "higg": 3, "high": 1070, "higr": 1, "hij": 6, "hija": 6, "hik": 11, "hike": 5, "hiki": 2, "hil": 720, "hila": 23, "hild": 1, "hile": 1, "hilk": 34, "hill": 268, "hilp": 4, "hilt": 8, "hilu": 5, "him": 2357, "hima": 4, "himm": 4, "hims": 2349, "hin": 353, "hinc": 1, "hind": 90, "hing": 24, "hink": 1, "hinn": 14, "hino": 2, "hins": 1, "hint": 106, "hip": 33, "hipe": 1, "hipl": 1, "hipp": 10, "hips": 1, "hir": 205, "hira": 28, "hirc": 1, "hire": 84, "hiri": 6, "hiro": 11, "hirs": 34, "his": 717, "hisp": 1, "hiss": 42, "hist": 631, "hit": 356, "hita": 2, "hitc": 15, "hith": 217, "hitl": 17, "hitr": 2, "hitt": 75, "hiv": 34, "hive": 1, "hivi": 25, "hiz": 2, "hizk": 2, "hjc": 1, "hjck": 1, "hmp": 1, "hoa": 96, "hoag": 3, "hoap": 1, "hoar": 61, "hoas": 1, "hoaw": 1, "hoax": 1, "hob": 42, "hoba": 4, "hobb": 28, "hobd": 1, "hobg": 1, "hobo": 5, "hoc": 5, "hock": 5, "hod": 39, "hoda": 4, "hode": 2, "hodg": 26, "hodi": 6, "hodo": 1, "hoe": 8, "hoed": 1, "hoev": 3, "hof": 5, "hoff": 5, "hog": 28, "hoga": 14, "hoge": 1, "hogg": 1, "hogl": 4, "hogm": 1, "hogs": 3, "hoh": 10, "hoha": 1, "hohl": 9, "hoi": 66, "hoij": 6, "hoip": 1, "hois": 59, "hok": 4, "hoka": 1, "hol": 2500, "hola": 1, "holb": 3, "hold": 400, "hole": 79, "holi": 124, "holl": 157, "holm": 40, "holo": 10, "holp": 5, "hols": 14, "holt": 2, "holy": 9, "holz": 1, "hom": 1528, "homa": 15, "home": 242, "homi": 10, "homo": 30, "hon": 1200, "hona": 2, "honb": 2, "hond": 1, "hone": 443, "honi": 4, "honk": 2, "hono": 726, "hons": 1, "hony": 1, "hoo": 261, "hooc": 1, "hood": 22, "hoof": 23, "hoog": 2, "hook": 52, "hool": 1, "hoop": 23, "hoor": 3, "hoos": 5, "hoot": 5, "hoov": 10, "hop": 1416, "hope": 421, "hoph": 5, "hopi": 56, "hopk": 28, "hopp": 43, "hops": 2, "hor": 1549, "hora": 51, "hord": 7, "hore": 18, "horh": 2, "hori": 119, "horm": 24, "horn": 115, "horo": 12, "horr": 279, "hors": 798, "hort": 1, "hos": 997, "hosa": 15, "hose": 13, "hosh": 16, "hosi": 2, "hosm": 1, "hosp": 210, "hoss": 5, "host": 406, "hot": 232, "hotb": 2, "hotc": 1, "hotd": 1, "hote": 188, "hoth": 9, "hotl": 4, "hotr": 1, "hots": 3, "hott": 21, "hotw": 2, "hou": 5265, "houd": 1, "houe": 2, "houg": 18, "houn": 21, "hour": 437, "hous": 4174, "hout": 2, "hov": 66, "hova": 1, "hovd": 1, "hove": 59, "how": 1475, "howa": 34, "howb": 64, "howd": 3, "howe": 1230, "howl": 51, "howo": 2, "howr": 2, "hows": 14, "howt": 2, "hox": 1, "hoy": 6, "hoyd": 1, "hoyl": 1, "hro": 2, "hrot": 2, "htm": 1, "htt": 4, "hua": 2, "huan": 1, "hub": 17, "huba": 1, "hubb": 7, "hube": 4, "hubi": 1, "hubr": 1, "huc": 5, "huck": 4, "hud": 99, "hudd": 24, "huds": 75, "hue": 21, "huf": 16, "huff": 2, "hug": 261, "huge": 9, "hugg": 19, "hugh": 32, "hugo": 1, "hugu": 1, "huh": 3, "huhm": 2, "huhu": 1, "hui": 1, "huit": 1, "huk": 2, "hukk": 1, "huko": 1, "hul": 76, "huld": 2, "hulk": 5, "hull": 16, "hult": 1, "hum": 1237, "huma": 672, "humb": 165, "hume": 2, "humi": 77, "huml": 1, "humm": 27, "humo": 231, "hump": 26, "humt": 1, "hun": 1758, "hunc": 16, "hund": 1061, "hung": 194, "hunk": 6, "hunt": 247, "huo": 1, "huos": 1, "hup": 6, "huph": 2, "hupp": 4, "hur": 631, "hura": 13, "hurd": 6, "hurl": 38, "huro": 9, "hurr": 354, "hurt": 32, "hus": 699, "husb": 558, "hush": 35, "husk": 24, "huss": 19, "hust": 14, "husw": 3, "hut": 39, "hutc": 7, "hutm": 2, "hutt": 18, "hux": 8, "huxl": 8, "huz": 39, "huzz": 39, "hva": 3, "hval": 2, "hwa": 6, "hwan": 4, "hwas": 1, "hya": 9, "hyac": 4, "hyal": 3, "hyan": 2, "hyb": 1, "hybr": 1, "hyd": 92, "hyda": 1, "hyde": 1, "hydr": 86, "hye": 5, "hyen": 4, "hyg": 14, "hygi": 14, "hyl": 1, "hyla": 1, "hym": 68, "hyme": 24, "hymn": 26, "hyms": 1, "hyn": 1, "hynd": 1, "hyp": 204, "hype": 23, "hyph": 2, "hypn": 7, "hypo": 170, "hyr": 2, "hyrc": 1, "hys": 50, "hyss": 12, "hyst": 38, "hyt": 1, "iad": 2, "iade": 1, "ian": 1, "iang": 1, "iaw": 1, "iawe": 1, "ibb": 1, "ibbo": 1, "ibe": 1, "iber": 1, "ibh": 3, "ibha": 3, "ibi": 6, "ibib": 2, "ibl": 3, "ible": 3, "ibn": 2, "ibne": 1, "ibni": 1, "ibr": 5, "ibra": 4, "ibs": 3, "ibse": 3, "ibz": 2, "ibza": 2, "ica": 1, "icb": 7, "icbm": 4, "ice": 38, "iceb": 14, "icec": 3, "icef": 4, "icel": 15, "ich": 2, "icha": 2, "ici": 9, "icic": 6, "icil": 1, "icin": 2, "ico": 7, "icon": 7, "ida": 6, "idah": 4, "idal": 1, "idb": 1, "idba": 1, "idd": 14, "ide": 1163, "idea": 336, "iden": 286, "ideo": 39, "idi": 68, "idio": 68, "idj": 3, "idl": 152, "idle": 33, "idli": 3, "ido": 188, "idol": 140, "idu": 5, "idum": 5, "idy": 7, "idyl": 7, "iea": 5, "ieal": 5, "iee": 1, "ieer": 1, "iel": 1, "iell": 1, "iem": 1, "iemm": 1, "iep": 3, "ieph": 3, "ier": 3, "ieru": 3, "ies": 4, "iest": 1, "iew": 2, "iewe": 2, "ifa": 2, "ifai": 2, "ifn": 1, "iga": 2, "igb": 3, "igd": 1, "igda": 1, "ige": 1, "igea": 1, "igl": 1, "igle": 1, "ign": 272, "igna": 1, "igne": 1, "igni": 14, "igno": 256, "igo": 4, "igom": 1, "ihm": 1, "ihms": 1, "iib": 1, "iibe": 1, "iig": 3, "iigg": 3, "iij": 1, "iiji": 1, "ija": 1, "ije": 2, "ijea": 2, "ijo": 3, "ike": 2, "ikey": 1, "ikk": 3, "ikke": 3, "ikl": 1, "ila": 1, "ile": 2, "ileu": 1, "ili": 19, "ilia": 18, "iliu": 1, "ilk": 1, "ill": 469, "illa": 2, "illc": 3, "ille": 25, "illf": 2, "illi": 82, "illn": 59, "illo": 2, "illp": 1, "ills": 4, "illu": 275, "illy": 2, "ilo": 1, "ilon": 1, "ily": 1, "ilyu": 1, "ima": 923, "imag": 922, "imau": 1, "imb": 47, "imba": 5, "imbe": 15, "imbi": 7, "imbl": 2, "imbo": 7, "imbr": 5, "imbu": 6, "imc": 2, "imco": 2, "ime": 1, "imed": 1, "imi": 70, "imit": 70, "iml": 4, "imla": 2, "imm": 1021, "imma": 29, "imme": 745, "immi": 51, "immo": 175, "immu": 21, "imn": 3, "imna": 2, "imp": 3007, "impa": 412, "impe": 287, "impi": 29, "impl": 202, "impo": 1147, "impr": 763, "impu": 165, "imr": 3, "imra": 1, "ina": 207, "inab": 21, "inac": 41, "inad": 53, "inal": 3, "inan": 7, "inap": 10, "inar": 6, "inas": 18, "inat": 11, "inau": 37, "inb": 11, "inbo": 9, "inbr": 2, "inc": 2930, "inca": 81, "ince": 266, "inch": 123, "inci": 149, "incl": 738, "inco": 465, "incr": 905, "incu": 84, "ind": 3879, "inde": 1502, "indi": 1641, "indo": 67, "indu": 667, "indw": 2, "ine": 312, "ineb": 2, "inef": 37, "inel": 12, "inep": 5, "ineq": 7, "iner": 17, "ines": 11, "inev": 121, "inex": 100, "inf": 1622, "infa": 160, "infe": 232, "infi": 230, "infl": 408, "info": 541, "infr": 31, "infu": 20, "ing": 134, "inga": 7, "ingb": 1, "inge": 62, "ingi": 2, "ingl": 10, "ingo": 1, "ingr": 48, "ingu": 2, "inh": 830, "inha": 365, "inhe": 395, "inhi": 33, "inho": 8, "inhu": 29, "ini": 515, "inim": 13, "inio": 1, "iniq": 339, "init": 162, "inj": 214, "inje": 21, "inju": 193, "ink": 13, "inkh": 3, "inki": 1, "inkl": 3, "inks": 2, "inl": 63, "inla": 51, "inle": 10, "inlo": 1, "inm": 25, "inma": 13, "inmi": 1, "inmo": 11, "inn": 481, "inna": 6, "inne": 130, "inni": 16, "innk": 12, "inno": 254, "innu": 49, "ino": 34, "inob": 3, "inoc": 3, "inof": 6, "inop": 2, "inor": 20, "inp": 28, "inpe": 1, "inpl": 1, "inpo": 1, "inpu": 25, "inq": 288, "inqu": 288, "inr": 10, "inro": 10, "ins": 3305, "insa": 60, "insc": 44, "inse": 181, "insh": 5, "insi": 529, "inso": 91, "insp": 166, "inst": 1952, "insu": 277, "int": 10388, "inta": 35, "inte": 3779, "inti": 160, "into": 72, "intr": 411, "intu": 42, "inu": 43, "inue": 8, "inui": 6, "inun": 4, "inur": 24, "inut": 1, "inv": 1487, "inva": 186, "inve": 493, "invi": 386, "invo": 415, "invu": 7, "inw": 105, "inwa": 101, "inwo": 2, "inwr": 2, "ioc": 10, "ioco": 1, "iocs": 6, "iocu": 1, "iod": 45, "iodi": 40, "iodo": 5, "ioh": 1, "ion": 33, "ioni": 20, "iono": 3, "ios": 1, "ioso": 1, "iot": 4, "iou": 6, "ioue": 1, "ioui": 1, "iour": 2, "iow": 10, "iowa": 1, "iowl": 1, "ioy": 18, "ioye": 3, "ioyf": 3, "ioyn": 10, "iph": 1, "iphe": 1, "ips": 1, "ira": 16, "iraq": 2, "iras": 1, "irat": 2, "ire": 72, "iref": 1, "irel": 51, "iren": 17, "iret": 3, "iri": 57, "irid": 1, "irij": 2, "irin": 2, "iris": 49, "irk": 9, "irks": 8, "irku": 1, "irm": 1, "irn": 1, "irna": 1, "iro": 430, "iron": 100, "iroq": 4, "irp": 1, "irpe": 1, "irr": 337, "irra": 51, "irre": 200, "irri": 84, "irru": 2, "irs": 5, "irsa": 4, "irsh": 1, "irv": 5, "irvi": 5, "irw": 1, "irwi": 1, "isa": 278, "isaa": 147, "isab": 95, "isai": 36, "isc": 12, "isca": 12, "isf": 4, "isfa": 4, "ish": 113, "isha": 1, "ishb": 16, "ishi": 3, "ishm": 79, "isho": 1, "ishp": 1, "isht": 3, "ishu": 3, "isi": 9, "isid": 3, "isin": 3, "isl": 474, "isla": 370, "isle": 67, "isli": 1, "ism": 2, "isma": 2, "isn": 97, "iso": 110, "isoc": 3, "isod": 1, "isol": 92, "isom": 1, "isop": 2, "isot": 11, "isp": 1, "ispa": 1, "isr": 2652, "isra": 2652, "iss": 432, "issa": 44, "issh": 3, "issu": 385, "ist": 23, "ista": 5, "isth": 4, "isti": 13, "istv": 1, "isu": 2, "isua": 1, "ita": 173, "ital": 172, "itas": 1, "itc": 17, "itch": 9, "ite": 153, "item": 88, "iter": 1, "ith": 43, "itha": 24, "ithi": 3, "ithm": 1, "ithn": 1, "ithr": 11, "ithu": 3, "iti": 4, "itin": 4, "itl": 18, "ito": 1, "itoi": 1, "its": 682, "itse": 682, "itt": 9, "itta": 9, "itu": 1, "itur": 1, "itw": 2, "itwi": 2, "iud": 25, "iudg": 23, "iudi": 2, "iug": 2, "iugg": 1, "iugl": 1, "iul": 5, "iuli": 5, "ium": 2, "iump": 2, "ius": 17, "iust": 9, "iut": 1, "iutt": 1, "iuv": 1, "iuva": 1, "iuy": 1, "iuyc": 1, "iva": 7, "ive": 2, "ivi": 2, "ivie": 2, "ivl": 1, "ivli": 1, "ivo": 93, "ivor": 93, "ivy": 1, "ivyc": 1, "ixi": 1, "ixio": 1, "iza": 6, "izaa": 6, "ize": 2, "izeh": 2, "izh": 11, "izha": 11, "izr": 4, "izra": 3, "izv": 1, "izve": 1, "jaa": 21, "jaak": 2, "jaal": 6, "jaan": 1, "jaar": 1, "jaas": 2, "jaaz": 9, "jab": 56, "jaba": 1, "jabb": 15, "jabe": 28, "jabi": 8, "jabn": 3, "jac": 825, "jacc": 1, "jach": 10, "jaci": 3, "jack": 253, "jaco": 397, "jacq": 13, "jacu": 1, "jad": 11, "jada": 1, "jadd": 3, "jade": 3, "jado": 1, "jae": 7, "jaeg": 1, "jaf": 3, "jaff": 3, "jag": 32, "jaga": 2, "jage": 1, "jagg": 20, "jagu": 6, "jah": 39, "jaha": 23, "jahd": 3, "jahl": 3, "jahm": 1, "jahv": 2, "jahz": 6, "jai": 51, "jail": 11, "jair": 3, "jak": 12, "jaka": 2, "jake": 2, "jaki": 2, "jal": 3, "jala": 1, "jalo": 2, "jam": 248, "jama": 5, "jamb": 3, "jame": 212, "jami": 7, "jaml": 1, "jamm": 16, "jan": 458, "jane": 3, "jang": 5, "jani": 20, "jann": 6, "jano": 3, "jans": 6, "janu": 76, "jap": 149, "japa": 121, "japh": 22, "japo": 1, "jar": 52, "jara": 2, "jard": 1, "jare": 9, "jarg": 7, "jarh": 2, "jari": 3, "jarm": 7, "jaro": 2, "jarr": 11, "jarv": 1, "jas": 44, "jash": 11, "jasi": 1, "jaso": 10, "jasp": 11, "jast": 11, "jat": 5, "jath": 1, "jatt": 4, "jau": 5, "jaun": 5, "jav": 34, "java": 10, "jave": 13, "jaw": 67, "jawa": 1, "jawb": 4, "jawe": 2, "jay": 4, "jayc": 4, "jaz": 113, "jaze": 11, "jazi": 1, "jazz": 2, "jea": 160, "jeal": 128, "jean": 7, "jear": 1, "jeat": 1, "jeb": 47, "jebe": 1, "jebu": 45, "jec": 12, "jeca": 1, "jech": 3, "jeco": 8, "jed": 37, "jeda": 13, "jede": 1, "jedi": 8, "jedu": 14, "jee": 30, "jeep": 1, "jeer": 7, "jees": 1, "jeez": 2, "jef": 41, "jeff": 38, "jeg": 1, "jega": 1, "jeh": 384, "jeha": 2, "jehd": 2, "jehe": 1, "jehi": 20, "jeho": 291, "jehu": 9, "jei": 11, "jeie": 11, "jej": 3, "jeju": 3, "jek": 6, "jeka": 5, "jeku": 1, "jel": 27, "jelk": 7, "jell": 20, "jem": 9, "jeme": 1, "jemi": 5, "jemm": 1, "jemu": 2, "jen": 282, "jenk": 16, "jenn": 260, "jens": 4, "jeo": 26, "jeop": 26, "jep": 46, "jeph": 46, "jer": 1343, "jera": 12, "jere": 171, "jeri": 79, "jerk": 38, "jero": 131, "jerr": 21, "jers": 33, "jeru": 846, "jerv": 1, "jes": 1259, "jesa": 2, "jesh": 50, "jesi": 3, "jess": 83, "jest": 20, "jesu": 1062, "jet": 54, "jetb": 1, "jeth": 21, "jetl": 1, "jett": 8, "jetu": 3, "jeu": 11, "jeue": 1, "jeun": 1, "jeus": 8, "jew": 470, "jewa": 1, "jewb": 2, "jewe": 70, "jewh": 1, "jewi": 78, "jewr": 3, "jez": 83, "jeza": 2, "jeze": 27, "jezi": 2, "jezl": 1, "jezo": 1, "jezr": 50, "jib": 5, "jibe": 2, "jibs": 1, "jid": 2, "jidg": 1, "jidl": 1, "jif": 7, "jiff": 6, "jig": 4, "jigg": 2, "jil": 3, "jilt": 3, "jim": 30, "jimb": 1, "jime": 1, "jimi": 1, "jimm": 20, "jimn": 3, "jin": 18, "jing": 16, "jinn": 1, "jip": 3, "jiph": 3, "jis": 13, "jit": 4, "jitt": 4, "jiu": 1, "jiuj": 1, "jiv": 1, "jivi": 1, "joa": 230, "joah": 1, "joan": 6, "joaq": 1, "joas": 49, "joat": 2, "job": 84, "joba": 9, "jobb": 1, "jobl": 4, "jobs": 2, "joc": 29, "joch": 2, "jock": 6, "joco": 1, "jocu": 19, "jod": 1, "joe": 48, "joel": 3, "joez": 1, "jog": 7, "jogb": 2, "jogg": 2, "jogl": 1, "joh": 1048, "joha": 31, "john": 166, "joi": 588, "joia": 13, "join": 373, "jois": 6, "jok": 119, "jokd": 1, "joke": 27, "joki": 11, "jokm": 1, "jokn": 4, "joks": 4, "jokt": 8, "jol": 81, "joll": 73, "jolt": 2, "jon": 356, "jona": 267, "jone": 86, "jonq": 2, "joo": 2, "joos": 2, "jop": 22, "jopl": 1, "jopp": 21, "jor": 245, "jora": 31, "jord": 208, "jorg": 4, "jori": 1, "jork": 1, "jos": 630, "josa": 3, "jose": 325, "josh": 228, "josi": 60, "joss": 5, "jost": 5, "jot": 31, "jotb": 4, "joth": 24, "jott": 3, "jou": 376, "jour": 364, "jous": 3, "jouv": 4, "jov": 32, "jovi": 5, "jow": 6, "jowl": 4, "joy": 210, "joyc": 21, "joye": 2, "joyf": 68, "joyi": 1, "joyl": 2, "joyo": 45, "joyr": 2, "joz": 15, "joza": 15, "jua": 26, "juan": 16, "jub": 48, "juba": 13, "jubi": 34, "juc": 2, "juca": 1, "juci": 1, "jud": 2315, "juda": 900, "jude": 4, "judg": 1339, "judi": 45, "juds": 4, "jue": 11, "juet": 3, "jug": 12, "jugg": 12, "jui": 33, "juic": 33, "juj": 1, "juk": 2, "jul": 141, "jule": 5, "juli": 60, "july": 1, "jum": 221, "jumb": 12, "jump": 135, "jun": 332, "junc": 25, "jung": 41, "juni": 125, "junk": 8, "junt": 3, "jup": 24, "jupi": 24, "jur": 169, "jura": 2, "juri": 50, "juro": 13, "jury": 5, "jus": 2769, "jush": 1, "juss": 1, "just": 559, "jut": 5, "juti": 1, "jutt": 4, "juv": 22, "juve": 22, "jux": 5, "juxt": 5, "kab": 5, "kaba": 1, "kabo": 1, "kabz": 3, "kad": 38, "kadd": 1, "kade": 28, "kadm": 9, "kaf": 5, "kafk": 5, "kag": 1, "kaga": 1, "kah": 10, "kahl": 8, "kahn": 1, "kai": 7, "kais": 7, "kaj": 1, "kaja": 1, "kak": 1, "kaku": 1, "kal": 12, "kala": 1, "kale": 5, "kall": 1, "kalm": 2, "kalo": 1, "kam": 7, "kamc": 1, "kame": 1, "kami": 4, "kamt": 1, "kan": 70, "kana": 18, "kand": 1, "kang": 2, "kani": 1, "kank": 1, "kann": 1, "kans": 39, "kant": 1, "kanu": 1, "kap": 8, "kapl": 1, "kapn": 1, "kapo": 1, "kapp": 5, "kaq": 1, "kaqu": 1, "kar": 59, "kara": 4, "kare": 17, "kari": 5, "kark": 2, "karl": 3, "karn": 10, "karo": 2, "karp": 1, "kars": 3, "kart": 2, "kas": 12, "kasa": 7, "kash": 1, "kask": 1, "kass": 1, "kast": 1, "kat": 112, "kata": 24, "kate": 4, "kath": 20, "kati": 17, "kato": 1, "katt": 1, "katy": 3, "kau": 4, "kaub": 1, "kauf": 3, "kav": 1, "kaw": 1, "kawe": 1, "kay": 13, "kaya": 12, "kaz": 3, "kaza": 1, "kazb": 1, "kazo": 1, "kea": 13, "kean": 2, "kear": 9, "keat": 2, "keb": 1, "kebo": 1, "ked": 39, "keda": 12, "kedd": 1, "kede": 18, "kedg": 6, "kedr": 1, "kedz": 1, "kee": 1492, "keee": 1, "keeg": 3, "keel": 26, "keen": 29, "keep": 365, "keer": 2, "kees": 1, "keg": 4, "kegf": 1, "kegh": 2, "keh": 13, "kehe": 2, "kei": 45, "keil": 18, "kein": 1, "keit": 25, "keiz": 1, "kek": 1, "keki": 1, "kel": 99, "kela": 1, "keli": 3, "kell": 77, "kelp": 1, "kels": 12, "kelt": 1, "kem": 14, "kemb": 7, "kemc": 1, "kemp": 2, "kemu": 3, "ken": 300, "kena": 14, "kene": 4, "keni": 16, "kenn": 206, "kens": 7, "kent": 27, "keny": 2, "kenz": 1, "kep": 626, "kepl": 1, "ker": 50, "kerb": 1, "kerc": 5, "kere": 1, "keri": 3, "kern": 12, "kero": 8, "kerr": 3, "kers": 1, "kery": 3, "kes": 1, "kest": 1, "ket": 37, "ketc": 2, "keto": 7, "kett": 24, "ketu": 4, "key": 75, "keyb": 5, "keye": 4, "keyh": 9, "keyn": 6, "keyp": 1, "keys": 5, "kez": 3, "kezi": 2, "kezz": 1, "kha": 11, "khaj": 3, "khak": 2, "khan": 1, "khar": 1, "khas": 1, "khi": 1, "khiv": 1, "khm": 1, "khme": 1, "khr": 85, "khru": 85, "kia": 1, "kian": 1, "kib": 8, "kibb": 1, "kibr": 5, "kibz": 1, "kic": 138, "kick": 82, "kid": 141, "kidd": 8, "kidi": 1, "kidn": 43, "kidr": 11, "kie": 3, "kief": 3, "kik": 6, "kike": 1, "kiki": 1, "kiku": 3, "kil": 735, "kilh": 1, "kili": 2, "kill": 392, "kilo": 19, "kilt": 1, "kim": 15, "kimb": 6, "kimm": 4, "kimo": 1, "kimp": 4, "kin": 5575, "kina": 1, "kind": 515, "kine": 14, "king": 944, "kinn": 1, "kinr": 1, "kins": 43, "kio": 2, "kios": 1, "kiow": 1, "kip": 4, "kipl": 4, "kir": 76, "kirb": 12, "kirh": 5, "kiri": 5, "kirj": 37, "kirk": 5, "kiro": 10, "kis": 210, "kish": 8, "kiso": 1, "kiss": 110, "kit": 213, "kitc": 145, "kite": 2, "kith": 2, "kitr": 1, "kitt": 51, "kiv": 1, "kiw": 2, "kiwa": 2, "kiy": 1, "kiyi": 1, "kiz": 5, "kizz": 5, "kla": 7, "klau": 3, "klax": 1, "kle": 7, "klee": 3, "klei": 3, "klem": 1, "kli": 3, "klim": 1, "klin": 2, "klo": 1, "klom": 1, "klu": 4, "kluc": 1, "kna": 48, "knac": 9, "knap": 7, "knau": 15, "knav": 17, "kne": 1459, "knea": 9, "knec": 1, "knee": 191, "knel": 23, "knep": 1, "knew": 11, "kni": 713, "knic": 3, "knif": 168, "knig": 451, "knil": 1, "knit": 32, "kniu": 1, "kniv": 32, "kno": 6177, "knob": 8, "knoc": 188, "knol": 6, "knop": 9, "knot": 36, "know": 2137, "knox": 1, "knu": 19, "knuc": 19, "koa": 1, "kob": 3, "koba": 1, "kobo": 2, "koc": 3, "koch": 2, "kod": 13, "koda": 3, "kodi": 3, "kody": 7, "koe": 6, "koeh": 3, "koen": 3, "kof": 1, "kofa": 1, "koh": 83, "koha": 47, "kohn": 35, "koi": 2, "koin": 2, "kok": 1, "koko": 1, "kol": 11, "kola": 2, "kolk": 4, "kolp": 2, "kom": 3, "komb": 1, "koml": 1, "komu": 1, "kon": 20, "kong": 1, "koni": 4, "konr": 1, "kons": 1, "konz": 1, "koo": 6, "kook": 1, "kool": 1, "koon": 2, "koos": 1, "kop": 1, "kops": 1, "kor": 77, "kora": 31, "kore": 28, "korh": 4, "korm": 1, "korn": 8, "korr": 1, "kos": 12, "kosh": 2, "kosm": 7, "koss": 3, "kot": 1, "koto": 1, "kou": 4, "kous": 4, "kow": 19, "kowa": 19, "koz": 1, "kozi": 1, "kqe": 1, "kra": 13, "krae": 1, "kraf": 1, "krak": 5, "kram": 1, "krap": 1, "kras": 1, "krau": 3, "kre": 17, "krei": 1, "krem": 14, "kret": 2, "kri": 31, "krim": 9, "kris": 5, "kro": 12, "kroe": 1, "krog": 7, "krom": 1, "kron": 3, "kru": 19, "krug": 8, "krum": 2, "krup": 1, "krus": 3, "krut": 5, "kry": 4, "krys": 4, "krz": 1, "krzy": 1, "ksa": 2, "ksu": 1, "ksuu": 1, "kub": 1, "kube": 1, "kuh": 1, "kul": 4, "kult": 4, "kun": 4, "kunk": 4, "kup": 1, "kupc": 1, "kur": 3, "kuri": 1, "kus": 1, "kush": 1, "kwa": 3, "kwam": 1, "kwan": 1, "kwas": 1, "kwh": 3, "kyn": 2, "kyo": 8, "kyot": 7, "kyoz": 1, "kyt": 1, "kyte": 1, "laa": 8, "laad": 8, "lab": 641, "laba": 60, "labe": 46, "labi": 4, "labo": 506, "labr": 5, "labu": 7, "laby": 13, "lac": 357, "lace": 17, "lach": 25, "laci": 3, "lack": 111, "laco": 8, "lacq": 5, "lact": 6, "lacu": 1, "lad": 1245, "ladd": 50, "lade": 29, "ladg": 2, "ladi": 238, "ladl": 4, "lady": 35, "lae": 98, "laen": 1, "laer": 36, "laf": 14, "lafa": 13, "lag": 45, "lage": 3, "lagg": 6, "lago": 20, "lagr": 1, "lagu": 9, "lah": 7, "laha": 3, "lahm": 2, "laho": 1, "lai": 503, "laic": 1, "laid": 4, "lain": 1, "lair": 1, "lais": 12, "lait": 4, "lak": 164, "lake": 55, "laku": 1, "lal": 21, "lala": 21, "lam": 689, "lama": 4, "lamb": 116, "lame": 139, "lami": 6, "lamm": 4, "lamo": 2, "lamp": 79, "lan": 3533, "lanc": 96, "land": 617, "lane": 24, "lang": 324, "lani": 1, "lank": 4, "lans": 1, "lant": 63, "lany": 2, "lanz": 2, "lao": 79, "laod": 9, "laot": 6, "lap": 68, "lape": 4, "lapi": 2, "lapl": 5, "lapp": 20, "laps": 24, "lapw": 3, "lar": 1300, "lara": 4, "larb": 10, "larc": 7, "lard": 5, "lare": 2, "larg": 1176, "lari": 1, "lark": 47, "larn": 2, "laro": 2, "larr": 10, "lars": 6, "larv": 7, "las": 2196, "lasa": 2, "lasc": 11, "lase": 1, "lash": 40, "lass": 16, "last": 98, "lasw": 1, "lat": 1470, "latc": 19, "late": 636, "lath": 11, "lati": 118, "latt": 250, "lau": 962, "lauc": 5, "laud": 16, "laug": 738, "laui": 1, "laun": 94, "laur": 101, "laus": 1, "laut": 3, "lav": 91, "lava": 12, "lave": 31, "lavi": 24, "lavo": 1, "law": 556, "lawa": 1, "lawb": 1, "lawe": 2, "lawf": 51, "lawg": 9, "lawl": 20, "lawm": 12, "lawn": 10, "lawr": 116, "laws": 8, "lawu": 1, "lawy": 108, "lax": 3, "laxa": 1, "laxn": 2, "lay": 171, "laye": 66, "layi": 58, "laym": 11, "layo": 12, "lays": 4, "layt": 1, "layu": 1, "laz": 88, "laza": 24, "lazi": 10, "lazy": 2, "lazz": 1, "lbd": 1, "lbda": 1, "lbp": 1, "lbpl": 1, "lea": 4589, "leac": 2, "lead": 569, "leaf": 15, "leag": 137, "leak": 26, "leal": 1, "leam": 1, "lean": 232, "leap": 154, "lear": 588, "leas": 918, "leat": 62, "leau": 67, "leav": 1252, "leb": 80, "leba": 77, "lebb": 1, "lebe": 1, "lebo": 1, "lec": 73, "leca": 1, "lech": 4, "leck": 1, "lecl": 1, "lect": 66, "led": 45, "ledd": 5, "ledf": 1, "ledg": 32, "ledo": 4, "ledy": 3, "lee": 77, "leec": 2, "leed": 4, "leek": 1, "leer": 11, "lees": 10, "leew": 32, "lef": 1527, "left": 24, "leg": 632, "lega": 125, "lege": 79, "legg": 19, "legi": 229, "legs": 1, "legu": 3, "leh": 8, "leha": 2, "lehm": 2, "lehn": 1, "lei": 89, "leib": 1, "leic": 10, "leid": 1, "leig": 5, "leil": 1, "leis": 69, "leit": 2, "lel": 2, "lela": 2, "lem": 54, "lema": 1, "lemm": 9, "lemn": 1, "lemo": 40, "lemu": 3, "len": 673, "lend": 25, "leng": 481, "leni": 18, "lenn": 2, "leno": 29, "lens": 5, "lent": 8, "leny": 2, "leo": 160, "leon": 134, "leop": 21, "lep": 82, "lepe": 26, "lepi": 8, "lepr": 47, "ler": 3, "lern": 1, "lero": 2, "les": 1533, "lesb": 1, "lesc": 1, "lesh": 2, "lesi": 2, "lesl": 2, "leso": 3, "less": 260, "lest": 14, "let": 972, "letc": 22, "letd": 1, "leth": 21, "leti": 2, "lets": 1, "lett": 833, "letu": 1, "leu": 13, "leuc": 1, "leue": 1, "leui": 4, "leuk": 3, "leum": 1, "leuw": 1, "leuy": 1, "lev": 963, "leva": 2, "leve": 427, "levi": 448, "lew": 100, "lewd": 21, "lewe": 2, "lewi": 68, "lex": 22, "lexi": 22, "ley": 16, "leyd": 4, "leys": 6, "leyt": 6, "lia": 81, "liab": 39, "liai": 7, "liar": 18, "lib": 614, "libb": 1, "libe": 426, "libi": 4, "libn": 25, "libr": 148, "liby": 10, "lic": 124, "lice": 70, "lich": 4, "lick": 22, "lict": 1, "lid": 15, "lide": 1, "lidl": 1, "lie": 363, "liea": 1, "lieb": 2, "lied": 2, "lief": 1, "lieg": 7, "lien": 1, "lier": 10, "lies": 8, "liet": 59, "lieu": 54, "liev": 2, "lif": 2766, "life": 68, "lifs": 1, "lift": 366, "lig": 1722, "liga": 15, "ligg": 1, "ligh": 1698, "lign": 5, "ligu": 2, "lik": 5646, "like": 852, "likh": 1, "liki": 32, "lil": 112, "lila": 33, "lili": 27, "lill": 26, "lilt": 3, "lim": 512, "limb": 89, "lime": 8, "limi": 308, "limo": 5, "limp": 27, "lin": 1466, "linc": 56, "lind": 63, "line": 523, "ling": 115, "lini": 8, "link": 56, "linn": 6, "lino": 1, "lins": 1, "lint": 6, "linu": 2, "linv": 1, "lio": 289, "lion": 77, "lip": 339, "lipc": 2, "lipl": 1, "lipo": 1, "lipp": 17, "lips": 5, "lipt": 5, "liq": 167, "liqu": 167, "lir": 2, "lirr": 2, "lis": 744, "lisb": 4, "lisl": 1, "lisp": 4, "liss": 2, "list": 546, "lit": 4340, "lite": 340, "lith": 15, "liti": 23, "litl": 1, "lito": 3, "litt": 3952, "litu": 3, "liu": 74, "liue": 23, "liui": 7, "liv": 2278, "liva": 2, "live": 901, "livi": 641, "livr": 3, "livs": 2, "liz": 36, "liza": 16, "lizz": 20, "lla": 3, "llam": 3, "lle": 3, "llew": 3, "llo": 14, "lloy": 14, "loa": 350, "load": 96, "loaf": 8, "loam": 1, "loan": 37, "loat": 41, "loav": 40, "lob": 74, "loba": 1, "lobb": 27, "lobe": 7, "lobl": 1, "lobs": 26, "lobt": 1, "lobu": 5, "loc": 847, "loca": 518, "loch": 1, "lock": 211, "loco": 9, "locu": 42, "lod": 188, "lode": 3, "lodg": 178, "lodl": 2, "lodo": 1, "loe": 9, "loes": 5, "loew": 2, "lof": 74, "loft": 65, "log": 123, "loga": 5, "logg": 17, "logh": 1, "logi": 85, "logj": 1, "loh": 1, "lohm": 1, "loi": 99, "loin": 79, "loir": 2, "loit": 11, "lol": 16, "loll": 4, "lolo": 9, "lom": 7, "lomb": 5, "lon": 3732, "lond": 271, "lone": 100, "long": 815, "lons": 4, "lont": 1, "loo": 4542, "look": 2545, "loom": 28, "loon": 1, "loop": 22, "loos": 307, "loot": 6, "lop": 15, "lopa": 2, "lope": 6, "lopp": 1, "lops": 2, "loq": 4, "loqu": 4, "lor": 8849, "lora": 1, "lorc": 2, "lord": 131, "lore": 5, "lorl": 1, "lorr": 2, "loru": 2, "los": 1041, "lose": 27, "losi": 52, "loss": 55, "lot": 120, "lota": 7, "loth": 12, "loti": 11, "lott": 4, "lotu": 3, "lou": 933, "louc": 1, "loud": 97, "loue": 30, "loui": 399, "loun": 40, "lour": 4, "lous": 20, "louv": 4, "lov": 2309, "lova": 3, "love": 850, "lovi": 104, "low": 549, "lowb": 2, "lowc": 10, "lowd": 6, "lowe": 446, "lowf": 3, "lowg": 2, "lowh": 1, "lowi": 4, "lowk": 2, "lowl": 43, "lowm": 2, "lown": 3, "lowp": 6, "lows": 2, "lowt": 3, "lowv": 1, "loww": 4, "loy": 65, "loya": 65, "loz": 1, "loze": 1, "ltu": 3, "ltur": 3, "lua": 2, "luan": 2, "lub": 35, "lubb": 7, "lube": 2, "lubi": 3, "lubl": 17, "lubr": 6, "luc": 686, "luca": 3, "lucc": 1, "luce": 1, "luci": 144, "luck": 120, "lucr": 16, "lucy": 1, "lud": 43, "ludg": 14, "ludi": 21, "ludl": 1, "ludm": 1, "ludw": 6, "lue": 4, "luec": 1, "lueg": 2, "luet": 1, "luf": 5, "luff": 1, "luft": 1, "lug": 26, "luge": 1, "lugg": 24, "lugu": 1, "luh": 2, "luhi": 2, "lui": 12, "luis": 3, "luk": 15, "luke": 8, "luku": 1, "lul": 35, "lull": 19, "lum": 149, "lumb": 51, "lume": 3, "lumi": 32, "lumm": 2, "lump": 21, "lumu": 15, "lun": 251, "luna": 59, "lunc": 86, "lund": 2, "lung": 77, "luni": 4, "lup": 2, "lupe": 2, "lur": 105, "lura": 1, "lurc": 18, "lure": 6, "luri": 12, "lurk": 44, "lus": 146, "lusc": 4, "lush": 1, "lusi": 1, "lust": 93, "lut": 16, "luth": 12, "luti": 1, "lutt": 1, "luv": 1, "luva": 1, "lux": 78, "luxe": 4, "luxu": 74, "luz": 1, "luzo": 1, "lvi": 1, "lvin": 1, "lya": 3, "lyab": 1, "lyar": 1, "lyb": 1, "lybi": 1, "lyc": 13, "lyca": 2, "lyci": 2, "lyd": 8, "lydd": 3, "lydi": 5, "lye": 12, "lyes": 2, "lyf": 9, "lyfo": 9, "lyi": 185, "lyin": 184, "lyk": 2, "lyki": 2, "lyl": 1, "lym": 74, "lyma": 1, "lymb": 1, "lymi": 1, "lymp": 4, "lyn": 11, "lync": 2, "lynd": 3, "lyo": 13, "lyon": 4, "lyop": 1, "lyr": 49, "lyri": 47, "lys": 11, "lysa": 1, "lysi": 3, "lyst": 6, "lyt": 6, "lytt": 6, "maa": 71, "maac": 31, "maad": 2, "maal": 1, "maar": 1, "maas": 26, "maat": 1, "maaz": 2, "mab": 5, "mabe": 5, "mac": 1227, "maca": 18, "macb": 72, "macc": 3, "macd": 33, "mace": 36, "macg": 1, "mach": 350, "maci": 428, "mack": 27, "macl": 3, "macm": 1, "macn": 27, "maco": 5, "macp": 4, "macr": 15, "macw": 2, "mad": 4267, "mada": 124, "madd": 51, "made": 45, "madh": 10, "madi": 25, "madl": 12, "madm": 26, "madn": 78, "mado": 7, "madr": 18, "mads": 1, "madw": 1, "mae": 17, "maec": 1, "mael": 5, "maeo": 2, "maes": 7, "maet": 1, "maf": 2, "mafe": 2, "mag": 645, "maga": 76, "magb": 1, "magd": 22, "mage": 5, "magg": 39, "magi": 156, "magn": 308, "mago": 11, "magp": 13, "magu": 6, "magw": 6, "magy": 1, "mah": 115, "maha": 47, "mahe": 2, "mahj": 1, "mahl": 28, "mahm": 2, "maho": 17, "mahu": 1, "mahz": 16, "mai": 1053, "maid": 116, "maie": 27, "mail": 45, "maim": 13, "main": 378, "mais": 2, "mait": 5, "maiz": 7, "maj": 493, "majd": 11, "maje": 122, "majo": 359, "maju": 1, "mak": 4305, "maka": 1, "make": 643, "makh": 2, "maki": 598, "makk": 9, "makt": 1, "mal": 511, "mala": 54, "malc": 47, "mald": 1, "male": 81, "malf": 9, "mali": 93, "malk": 1, "mall": 25, "malm": 3, "maln": 5, "malo": 7, "malp": 2, "malr": 21, "malt": 14, "malv": 8, "mam": 199, "mama": 3, "mamb": 1, "mamm": 123, "mamr": 10, "man": 5343, "mana": 572, "manc": 55, "mand": 49, "mane": 38, "manf": 4, "mang": 11, "manh": 83, "mani": 205, "manj": 1, "mank": 130, "manl": 42, "manm": 9, "mann": 901, "mano": 48, "manp": 14, "manr": 1, "mans": 68, "mant": 105, "manu": 197, "manv": 1, "manx": 12, "many": 8, "manz": 2, "mao": 9, "maoc": 1, "maon": 1, "map": 82, "mapl": 47, "mapp": 18, "maq": 1, "maqu": 1, "mar": 4541, "mara": 12, "marb": 67, "marc": 392, "mard": 3, "mare": 17, "marg": 201, "mari": 908, "marj": 1, "mark": 643, "marl": 30, "marm": 13, "maro": 11, "marq": 81, "marr": 863, "mars": 109, "mart": 266, "maru": 5, "marv": 138, "marx": 8, "mary": 43, "mas": 1395, "masa": 4, "masc": 25, "mase": 1, "mash": 5, "mask": 30, "maso": 65, "masq": 16, "masr": 2, "mass": 218, "mast": 650, "masu": 1, "mat": 2217, "mata": 2, "matc": 230, "mate": 507, "math": 69, "mati": 21, "matl": 1, "matr": 49, "mats": 49, "matt": 1038, "matu": 103, "mau": 116, "mauc": 2, "maud": 24, "maug": 2, "maul": 4, "maur": 68, "maus": 2, "mauv": 4, "mav": 6, "mave": 4, "mavi": 2, "maw": 5, "mawe": 1, "mawk": 1, "max": 141, "maxe": 1, "maxi": 125, "maxw": 13, "may": 393, "maya": 1, "mayb": 149, "maye": 134, "mayf": 7, "mayh": 12, "mayn": 3, "mayo": 62, "mays": 3, "maz": 35, "maza": 2, "maze": 10, "mazi": 1, "mazo": 1, "mazu": 2, "mazz": 1, "mca": 6, "mcal": 2, "mcau": 4, "mcb": 11, "mcbr": 11, "mcc": 55, "mcca": 13, "mccl": 19, "mcco": 14, "mccr": 3, "mccu": 6, "mcd": 4, "mcda": 2, "mcde": 1, "mcdo": 1, "mce": 4, "mcea": 1, "mcel": 2, "mcen": 1, "mcf": 15, "mcfa": 1, "mcfe": 14, "mcg": 7, "mcge": 3, "mcgh": 1, "mcgl": 1, "mcgo": 1, "mcgr": 1, "mci": 5, "mcin": 2, "mciv": 3, "mck": 21, "mcke": 8, "mcki": 13, "mcl": 8, "mcla": 1, "mcle": 4, "mcli": 3, "mcn": 11, "mcna": 8, "mcne": 3, "mcp": 2, "mcph": 2, "mcq": 1, "mcqu": 1, "mcr": 1, "mcro": 1, "mcs": 5, "mcse": 3, "mcso": 2, "mcw": 1, "mcwh": 1, "mdi": 2, "mdia": 2, "mea": 3601, "mead": 92, "meag": 14, "meal": 55, "mean": 1504, "mear": 2, "meas": 683, "meat": 29, "meb": 1, "mebu": 1, "mec": 180, "mecc": 5, "mech": 173, "mecu": 2, "med": 575, "meda": 25, "medc": 1, "medd": 26, "mede": 22, "medf": 4, "medi": 491, "medl": 2, "medm": 1, "medo": 1, "medu": 1, "mee": 1057, "meeh": 1, "meek": 47, "meer": 10, "meet": 436, "meg": 39, "mega": 26, "megi": 12, "megl": 1, "meh": 14, "mehe": 3, "mehi": 4, "meho": 2, "mehu": 5, "mei": 6, "mein": 2, "meis": 3, "mej": 1, "meja": 1, "mek": 4, "meko": 4, "mel": 391, "mela": 88, "melb": 3, "melc": 17, "mele": 6, "meli": 13, "mell": 15, "melo": 95, "melp": 1, "mels": 1, "melt": 93, "melv": 8, "melz": 6, "mem": 962, "memb": 612, "meme": 4, "memi": 1, "memn": 3, "memo": 325, "memp": 12, "memu": 3, "men": 656, "mena": 54, "menc": 5, "mend": 32, "mene": 2, "menf": 2, "meni": 5, "menl": 1, "menn": 4, "meno": 1, "menp": 2, "mens": 22, "ment": 457, "menu": 4, "meo": 2, "meon": 2, "mep": 21, "meph": 21, "mer": 1816, "mera": 52, "merc": 775, "mere": 343, "merg": 67, "meri": 168, "merl": 7, "merm": 10, "mern": 1, "mero": 7, "merr": 138, "mert": 1, "merv": 2, "mes": 549, "mese": 2, "mesh": 65, "mesm": 2, "meso": 17, "mess": 422, "mest": 1, "met": 775, "meta": 181, "mete": 88, "meth": 401, "meti": 9, "metl": 2, "metr": 70, "mett": 16, "meu": 2, "meun": 1, "meur": 1, "mew": 3, "mewe": 1, "mex": 72, "mexi": 72, "mey": 22, "meye": 9, "meyl": 1, "meyn": 12, "mez": 3, "meza": 2, "mezz": 1, "mgl": 3, "mglb": 1, "mglh": 2, "mia": 33, "miam": 28, "mian": 2, "miao": 1, "mias": 2, "mib": 7, "mibh": 2, "mibs": 3, "mibz": 2, "mic": 422, "mica": 51, "mice": 11, "mich": 201, "mick": 37, "micr": 96, "mid": 1280, "mida": 7, "midc": 2, "midd": 519, "midf": 3, "midg": 5, "midi": 67, "midj": 4, "midl": 1, "midm": 2, "midn": 107, "mido": 2, "midp": 1, "midr": 2, "mids": 496, "midt": 8, "midv": 1, "midw": 49, "mie": 2, "mif": 1, "miff": 1, "mig": 3222, "migd": 6, "migh": 3181, "migl": 1, "mign": 1, "migr": 28, "migu": 4, "mij": 7, "mija": 2, "mijb": 5, "mik": 107, "mike": 8, "mikh": 1, "mikl": 4, "mikn": 2, "miko": 1, "mil": 1740, "mila": 4, "milb": 1, "milc": 20, "mild": 65, "mile": 330, "milh": 2, "mili": 293, "milk": 31, "mill": 533, "milm": 2, "milo": 2, "milq": 2, "mils": 9, "milt": 27, "milw": 10, "mim": 37, "mime": 16, "mimi": 20, "min": 4064, "mina": 6, "minb": 1, "minc": 29, "mind": 249, "mine": 103, "ming": 83, "mini": 501, "mink": 1, "minn": 38, "mino": 99, "mins": 13, "mint": 3, "minu": 721, "mip": 1, "miph": 1, "mir": 308, "mira": 124, "mire": 1, "miri": 51, "mirm": 1, "mirr": 56, "mirs": 1, "mirt": 47, "mis": 3183, "misa": 13, "misb": 7, "misc": 188, "misd": 12, "mise": 209, "misf": 48, "misg": 18, "mish": 28, "misi": 12, "misj": 3, "misl": 27, "mism": 2, "misn": 3, "miso": 1, "misp": 13, "misq": 1, "misr": 12, "miss": 495, "mist": 530, "misu": 47, "misw": 1, "mit": 85, "mitc": 30, "mite": 5, "mith": 7, "miti": 9, "mitr": 19, "mitt": 4, "mity": 6, "miu": 1, "miuc": 1, "mix": 187, "mixe": 108, "mixi": 18, "mixt": 58, "miy": 2, "miya": 2, "miz": 68, "miza": 1, "mize": 8, "mizp": 47, "mizr": 5, "mizz": 7, "mll": 1, "mls": 1, "mme": 5, "mmm": 1, "mmw": 1, "mmwi": 1, "mna": 1, "mnas": 1, "moa": 224, "moab": 29, "moad": 1, "moan": 15, "moap": 1, "moat": 2, "mob": 169, "mobb": 2, "mobc": 1, "mobi": 70, "mobs": 1, "mobu": 2, "moc": 199, "mocc": 8, "mock": 96, "mod": 811, "moda": 4, "mode": 706, "modi": 57, "modu": 14, "mof": 1, "moff": 1, "mog": 8, "moga": 1, "mogu": 7, "moh": 6, "moha": 5, "mohr": 1, "moi": 72, "moid": 1, "moie": 1, "moin": 1, "moir": 1, "mois": 67, "moit": 1, "mol": 264, "mola": 12, "mold": 36, "mole": 55, "moli": 12, "moll": 21, "molo": 16, "molt": 43, "molu": 3, "molv": 3, "mom": 1233, "momb": 1, "mome": 1223, "momm": 5, "momo": 3, "mon": 2512, "mona": 51, "monc": 2, "mond": 104, "mone": 757, "monf": 2, "mong": 9, "moni": 30, "monk": 75, "monm": 5, "mono": 129, "monr": 13, "mons": 204, "mont": 1031, "monu": 59, "monw": 1, "moo": 571, "mood": 49, "mooe": 1, "mooi": 1, "moon": 113, "moor": 48, "moos": 6, "moot": 1, "moou": 2, "mop": 10, "mope": 1, "mopi": 1, "mopp": 7, "mor": 9040, "mora": 280, "morb": 28, "morc": 2, "mord": 62, "more": 353, "morg": 85, "mori": 21, "morl": 3, "morm": 2, "morn": 1117, "moro": 15, "morp": 27, "morq": 1, "morr": 323, "mors": 59, "mort": 332, "mos": 3768, "mosa": 9, "mosc": 55, "mose": 876, "mosl": 5, "mosq": 20, "moss": 13, "most": 73, "mot": 2188, "mote": 35, "moth": 1568, "moti": 384, "motl": 10, "moto": 144, "mott": 25, "mou": 2398, "moue": 5, "moug": 2, "moui": 2, "moul": 58, "moun": 1107, "mour": 202, "mous": 169, "mout": 837, "mouv": 1, "mov": 1292, "mova": 21, "move": 688, "movi": 279, "mow": 23, "mowe": 15, "mowi": 1, "mows": 1, "moz": 11, "moza": 6, "mra": 4, "mrad": 1, "mse": 1, "mub": 1, "muba": 1, "muc": 3268, "much": 8, "muci": 1, "muck": 4, "muco": 5, "mucu": 2, "mud": 37, "mudb": 1, "mudc": 1, "mudd": 30, "mudg": 1, "muds": 2, "mudu": 1, "mudw": 1, "mue": 4, "muez": 4, "muf": 45, "muff": 41, "muft": 2, "mug": 7, "mugg": 3, "muh": 1, "muha": 1, "mui": 1, "mul": 659, "mula": 2, "mulb": 8, "mulc": 8, "mule": 19, "mull": 34, "mult": 562, "mum": 34, "mumb": 20, "mumf": 1, "mumm": 12, "mun": 77, "munc": 6, "mund": 8, "mung": 5, "muni": 56, "muno": 1, "munr": 1, "muo": 1, "muon": 1, "mup": 1, "mupp": 1, "mur": 545, "mura": 3, "murd": 317, "mure": 2, "murk": 15, "murm": 124, "murp": 8, "murr": 15, "murt": 52, "murv": 1, "mus": 4625, "musc": 173, "muse": 64, "musg": 171, "mush": 25, "musi": 646, "musk": 45, "musl": 12, "musm": 5, "musn": 1, "muss": 15, "must": 88, "mut": 278, "muta": 6, "mute": 14, "muti": 33, "mutt": 105, "mutu": 94, "muz": 23, "muza": 1, "muzy": 1, "muzz": 20, "myc": 5, "myce": 3, "myco": 2, "mye": 5, "myel": 2, "myer": 3, "myl": 2, "myla": 2, "myn": 4, "mynh": 3, "myo": 10, "myoc": 4, "myof": 3, "myop": 2, "myos": 1, "myr": 120, "myra": 6, "myri": 43, "myro": 1, "myrr": 24, "myrt": 18, "mys": 1240, "myse": 925, "mysi": 2, "myst": 313, "myt": 82, "myth": 40, "mytt": 1, "naa": 38, "naam": 27, "naar": 6, "naas": 4, "nab": 49, "naba": 22, "nabb": 3, "nabi": 1, "nabo": 23, "nac": 5, "nach": 5, "nad": 42, "nada": 20, "nadi": 22, "nae": 2, "naeb": 2, "nag": 23, "naga": 4, "nage": 1, "nagg": 11, "nagl": 1, "nagr": 6, "nah": 54, "naha": 23, "nahb": 1, "nahc": 1, "naho": 17, "nahs": 9, "nahu": 2, "nai": 143, "nail": 72, "naio": 6, "nair": 5, "naiv": 27, "nak": 229, "naka": 4, "nake": 222, "nako": 1, "nakt": 2, "nam": 2381, "name": 582, "nami": 11, "nan": 158, "nanc": 22, "nank": 1, "nano": 1, "nant": 133, "nao": 23, "naom": 23, "nap": 141, "naph": 55, "napk": 16, "napl": 43, "napo": 19, "napp": 4, "napt": 1, "nar": 309, "narb": 1, "narc": 14, "nare": 3, "narr": 269, "narw": 13, "nas": 62, "nasa": 6, "nasc": 2, "nash": 7, "nass": 18, "nast": 16, "nat": 2929, "nata": 5, "natc": 4, "nate": 2, "nath": 60, "nati": 1559, "nato": 1, "natr": 1, "natt": 1, "natu": 1265, "nau": 57, "naug": 37, "naui": 1, "naus": 6, "naut": 10, "nav": 164, "nava": 43, "nave": 11, "navi": 25, "navo": 4, "navv": 3, "navy": 13, "naw": 2, "nawt": 1, "nax": 1, "naxo": 1, "naz": 74, "naza": 47, "nazi": 14, "nbc": 1, "nbct": 1, "nct": 3, "ndi": 1, "ndim": 1, "ndo": 1, "ndol": 1, "nea": 1515, "nean": 1, "neap": 12, "near": 588, "neat": 42, "neb": 172, "neba": 32, "nebr": 10, "nebu": 116, "nec": 957, "nece": 607, "nech": 3, "neck": 58, "necr": 8, "nect": 12, "ned": 1, "neda": 1, "nee": 1322, "need": 649, "neer": 28, "nees": 2, "neg": 495, "nega": 77, "negl": 135, "nego": 59, "negr": 223, "negu": 1, "neh": 22, "nehe": 12, "nehr": 6, "nehu": 3, "nei": 1806, "neie": 1, "neig": 534, "neil": 7, "neim": 4, "neis": 3, "neit": 1254, "nek": 5, "neke": 1, "neko": 4, "nel": 36, "nell": 6, "nels": 29, "nem": 9, "neme": 4, "nemi": 1, "nemu": 4, "nen": 2, "nenn": 2, "neo": 37, "neoc": 10, "neod": 1, "neoe": 1, "neoj": 1, "neol": 1, "neon": 4, "neop": 2, "neor": 1, "neos": 2, "nep": 80, "nepa": 1, "neph": 72, "nept": 7, "ner": 187, "nere": 1, "nerg": 4, "neri": 12, "nern": 2, "neru": 3, "nerv": 157, "nes": 115, "nesc": 1, "nesk": 2, "nest": 41, "net": 200, "neth": 84, "netl": 1, "neto": 13, "nett": 17, "netw": 64, "neu": 171, "neub": 1, "neue": 54, "neum": 1, "neur": 36, "neus": 2, "neut": 77, "nev": 2792, "neva": 13, "neve": 2778, "nevs": 1, "new": 697, "newa": 9, "newb": 23, "newc": 17, "newe": 78, "newf": 10, "newh": 1, "newi": 25, "newl": 61, "newm": 10, "newn": 3, "newp": 29, "newr": 1, "news": 176, "newt": 17, "neww": 1, "newy": 1, "nex": 961, "next": 2, "ney": 6, "neyt": 6, "nez": 3, "nezi": 3, "nga": 1, "ngan": 1, "nia": 11, "niag": 11, "nib": 22, "nibb": 17, "nibe": 2, "nibh": 1, "nibs": 1, "nic": 333, "nica": 3, "nicc": 1, "nice": 46, "nich": 22, "nick": 34, "nico": 30, "nie": 48, "nieb": 2, "niec": 38, "niem": 3, "niep": 1, "niet": 4, "nig": 2210, "nige": 7, "nigg": 38, "nigh": 1971, "nign": 1, "nigr": 1, "nih": 6, "nihi": 6, "nij": 1, "niji": 1, "nik": 15, "nike": 1, "niki": 7, "nikk": 1, "niko": 6, "nil": 30, "nill": 1, "nilp": 12, "nils": 2, "nilu": 1, "nim": 38, "nimb": 25, "nimp": 1, "nimr": 7, "nims": 5, "nin": 465, "ninc": 1, "nine": 202, "ninn": 1, "nint": 62, "nio": 2, "niob": 2, "nip": 17, "nipe": 1, "niph": 4, "nipp": 11, "nir": 2, "nirv": 1, "nirw": 1, "nis": 15, "nisa": 2, "nisc": 4, "nisf": 1, "nish": 4, "nisr": 3, "nit": 26, "nitr": 24, "niv": 4, "nive": 1, "nivi": 3, "nix": 26, "nixo": 26, "nju": 1, "njus": 1, "nkr": 2, "nkru": 2, "nlr": 3, "nlrd": 2, "nni": 2, "nnig": 2, "nnu": 1, "nnuo": 1, "noa": 68, "noad": 2, "nob": 607, "noba": 4, "nobe": 7, "nobi": 12, "nobl": 281, "nobo": 302, "noc": 16, "noca": 1, "noce": 2, "noci": 2, "noct": 11, "nod": 125, "noda": 1, "nodd": 109, "node": 3, "nodr": 1, "nodu": 2, "noe": 9, "nog": 16, "noga": 6, "nogo": 10, "noh": 3, "noha": 1, "nohi": 2, "noi": 352, "noir": 1, "nois": 349, "nol": 6, "nola": 1, "nole": 1, "noll": 1, "nom": 73, "noma": 6, "nome": 8, "nomi": 59, "non": 1166, "nona": 9, "nonb": 2, "nonc": 48, "nond": 17, "none": 21, "nonf": 14, "nong": 3, "nonh": 1, "noni": 9, "nonj": 6, "nonl": 5, "nonm": 10, "nonn": 3, "nono": 7, "nonp": 28, "nonr": 17, "nons": 135, "nont": 6, "nonv": 21, "nonw": 7, "noo": 129, "nook": 5, "noon": 21, "noos": 5, "nop": 9, "noph": 1, "nor": 1041, "nora": 3, "norb": 7, "nord": 6, "nore": 3, "norf": 4, "norl": 53, "norm": 243, "norr": 3, "nors": 1, "nort": 680, "noru": 1, "norw": 26, "nos": 278, "nose": 29, "nosi": 2, "nosk": 1, "nost": 52, "not": 3080, "nota": 53, "notc": 27, "note": 217, "noth": 1901, "noti": 526, "notk": 1, "notl": 1, "noto": 18, "notq": 1, "notr": 8, "nots": 3, "nott": 20, "notu": 1, "notw": 53, "noty": 1, "nou": 115, "noug": 49, "noun": 3, "nour": 58, "nouv": 2, "nov": 253, "nova": 3, "nove": 235, "novi": 10, "novo": 2, "now": 77, "nowa": 25, "nowf": 1, "nowh": 47, "nowi": 3, "nowm": 1, "nox": 5, "noxi": 5, "noy": 11, "noya": 1, "noye": 1, "noyo": 1, "noys": 8, "noz": 9, "nozz": 9, "nrl": 1, "nrld": 1, "ntr": 1, "ntri": 1, "nua": 4, "nuan": 4, "nub": 2, "nubb": 1, "nubi": 1, "nuc": 149, "nucl": 149, "nud": 34, "nude": 2, "nudg": 7, "nudi": 4, "nue": 5, "nuec": 1, "nuf": 3, "nug": 7, "nuge": 6, "nugg": 1, "nui": 9, "nuis": 7, "nul": 20, "null": 6, "num": 1260, "numb": 1126, "nume": 125, "numi": 4, "nun": 13, "nunc": 1, "nune": 1, "nunn": 5, "nuo": 1, "nuov": 1, "nup": 10, "nupe": 1, "nupt": 9, "nur": 164, "nurs": 154, "nurt": 9, "nut": 89, "nutc": 3, "nuth": 1, "nutl": 1, "nutm": 6, "nutr": 26, "nuts": 3, "nutt": 2, "nuz": 2, "nuzz": 2, "nyb": 2, "nybe": 2, "nyl": 1, "nylo": 1, "nym": 13, "nymp": 13, "nys": 1, "nyse": 1, "oaf": 1, "oah": 1, "oak": 78, "oake": 12, "oakl": 42, "oakm": 1, "oaku": 5, "oakw": 5, "oar": 81, "oars": 33, "oas": 3, "oase": 2, "oasi": 1, "oat": 140, "oath": 22, "oatm": 1, "oatn": 2, "oats": 1, "oba": 56, "obad": 21, "oban": 34, "obd": 6, "obdu": 6, "obe": 391, "obed": 130, "obei": 10, "obel": 8, "ober": 5, "obes": 6, "obey": 98, "obi": 9, "obie": 4, "obit": 3, "obj": 667, "obje": 667, "obl": 500, "obla": 40, "obli": 445, "oblo": 15, "obn": 7, "obno": 7, "obo": 7, "oboi": 1, "obom": 1, "obot": 4, "obr": 2, "obri": 2, "obs": 899, "obsc": 89, "obse": 726, "obsi": 1, "obso": 10, "obst": 73, "obt": 293, "obta": 283, "obtr": 9, "obtu": 1, "obv": 259, "obve": 1, "obvi": 258, "oca": 2, "ocar": 1, "ocas": 1, "occ": 1001, "occa": 410, "occh": 1, "occi": 7, "occl": 7, "occu": 576, "oce": 216, "ocea": 215, "ocel": 1, "och": 4, "oche": 1, "ocho": 1, "ochr": 2, "ocl": 42, "oclo": 42, "oco": 7, "ocon": 7, "ocr": 5, "ocra": 5, "oct": 140, "octa": 50, "octe": 1, "octh": 1, "octi": 4, "octo": 66, "ocu": 3, "ocul": 3, "ocz": 2, "ocza": 2, "odd": 90, "odde": 12, "oddi": 9, "oddl": 34, "odds": 1, "ode": 12, "odel": 1, "oder": 1, "odes": 1, "odi": 26, "odil": 1, "odio": 19, "odiu": 2, "odo": 82, "odon": 3, "odor": 24, "odou": 18, "odw": 4, "odwy": 4, "ody": 14, "odys": 14, "oec": 6, "oech": 1, "oed": 24, "oedi": 24, "oer": 21, "oeri": 1, "oers": 20, "oet": 1, "oeu": 2, "oeuv": 2, "off": 3276, "offa": 5, "offb": 6, "offc": 1, "offd": 3, "offe": 2145, "offf": 3, "offh": 1, "offi": 1035, "offk": 1, "offl": 1, "offr": 2, "offs": 71, "offt": 1, "offu": 1, "oft": 835, "ofte": 829, "oftn": 1, "oftr": 1, "oftt": 4, "oga": 1, "ogar": 1, "ogd": 3, "ogde": 3, "ogl": 3, "ogle": 3, "ogr": 6, "ogre": 1, "oha": 3, "ohar": 1, "ohe": 1, "ohi": 56, "ohio": 1, "ohm": 1, "ohmi": 1, "oht": 1, "ohth": 1, "oil": 54, "oilb": 3, "oilc": 3, "oile": 7, "oilf": 1, "oilh": 2, "oilm": 1, "oilp": 1, "oils": 5, "oilw": 1, "oin": 38, "oint": 38, "ois": 1, "oist": 1, "oit": 1, "oiti": 1, "oka": 23, "okad": 1, "okam": 2, "oke": 1, "okee": 1, "oki": 1, "okin": 1, "okl": 18, "okla": 15, "oko": 2, "okon": 1, "okot": 1, "ola": 3, "olas": 1, "olat": 1, "old": 192, "olda": 1, "olde": 161, "oldf": 7, "oldg": 1, "oldi": 1, "oldl": 1, "oldn": 1, "olds": 6, "oldt": 7, "ole": 9, "olea": 2, "oleo": 5, "oler": 1, "olf": 2, "olfa": 2, "olg": 13, "olgi": 7, "oli": 107, "oliv": 106, "olm": 1, "olms": 1, "oln": 1, "olne": 1, "olo": 1, "olog": 1, "ols": 3, "olse": 1, "olso": 2, "olv": 1, "olve": 1, "oly": 21, "olym": 21, "oma": 15, "omah": 2, "omb": 1, "omba": 1, "ome": 30, "omeg": 5, "omel": 4, "omen": 4, "omer": 1, "omi": 78, "omin": 28, "omis": 10, "omit": 34, "omm": 1, "ommi": 1, "omn": 63, "omne": 7, "omni": 56, "omr": 18, "oms": 1, "ona": 16, "onag": 1, "onan": 3, "onc": 1440, "once": 6, "onco": 2, "one": 511, "onea": 6, "onec": 1, "oned": 4, "onee": 2, "onef": 10, "oneg": 2, "oneh": 10, "onei": 11, "onek": 1, "onel": 27, "onem": 6, "onen": 5, "oneo": 2, "onep": 1, "oneq": 2, "oner": 4, "ones": 38, "onet": 31, "oneu": 1, "onew": 2, "oney": 1, "oni": 25, "onio": 25, "onl": 4263, "onle": 4, "onli": 1, "onlo": 4, "onr": 5, "onru": 5, "ons": 62, "onse": 52, "onsi": 2, "onsl": 6, "onst": 1, "onsu": 1, "ont": 86, "onta": 10, "onth": 6, "onto": 10, "onu": 2, "onw": 36, "onwa": 36, "ony": 12, "onyc": 1, "oom": 1, "ooma": 1, "oon": 1, "ooo": 1, "oop": 2, "oops": 1, "oos": 1, "oot": 4, "ooti": 4, "ooz": 10, "ooze": 3, "opa": 18, "opac": 2, "opal": 2, "opaq": 11, "ope": 2357, "opel": 2, "open": 850, "oper": 618, "oph": 120, "ophe": 35, "ophi": 18, "ophn": 1, "ophr": 8, "opht": 2, "opi": 444, "opia": 3, "opin": 421, "opiu": 20, "opo": 2, "opor": 1, "opos": 1, "opp": 912, "oppe": 1, "oppi": 2, "oppo": 730, "oppr": 179, "opt": 126, "opte": 2, "opti": 124, "opu": 8, "opul": 5, "ora": 174, "orac": 36, "oral": 2, "oran": 53, "orat": 55, "orb": 67, "orbe": 3, "orbi": 42, "orc": 150, "orch": 146, "orcu": 3, "ord": 1313, "orda": 83, "orde": 958, "ordi": 267, "ordn": 1, "ordu": 1, "ore": 46, "orea": 1, "oreg": 22, "ores": 4, "orew": 1, "org": 466, "orga": 453, "orgi": 11, "orgo": 1, "ori": 457, "oria": 1, "orie": 82, "orif": 3, "orig": 338, "orin": 1, "orio": 26, "oris": 4, "oriz": 1, "ork": 1, "orkn": 1, "orl": 64, "orla": 2, "orle": 53, "orli": 6, "orlo": 2, "orm": 5, "ormo": 2, "orms": 2, "ormu": 1, "orn": 95, "orna": 90, "orne": 4, "ornr": 1, "oro": 4, "oron": 3, "orot": 1, "orp": 50, "orpa": 2, "orph": 48, "ors": 3, "orse": 2, "ort": 73, "orte": 2, "orth": 71, "oru": 1, "orv": 12, "orvi": 12, "orw": 5, "orwe": 5, "orz": 1, "orza": 1, "osa": 7, "osag": 1, "osak": 6, "osb": 3, "osbe": 1, "osbo": 2, "osc": 20, "osca": 11, "osce": 1, "osci": 8, "ose": 1, "osh": 4, "oshe": 2, "oshk": 2, "osi": 7, "osie": 1, "osip": 1, "osir": 2, "osit": 2, "osk": 1, "oska": 1, "osl": 5, "osm": 4, "osmi": 1, "osmo": 3, "oso": 2, "osp": 2, "ospr": 2, "osr": 7, "osra": 1, "osri": 6, "oss": 14, "osse": 3, "ossi": 10, "ost": 45, "osta": 1, "oste": 31, "osti": 1, "ostl": 5, "ostr": 7, "osu": 2, "osul": 2, "osw": 1, "oswe": 1, "oth": 5241, "othe": 5223, "othn": 8, "otho": 10, "oti": 3, "ott": 96, "otta": 5, "otte": 67, "otto": 9, "otw": 6, "otwa": 6, "ouc": 8, "ouch": 8, "oue": 32, "ouer": 10, "oug": 464, "ough": 464, "oul": 9, "oun": 14, "ounc": 14, "our": 298, "oura": 2, "ours": 204, "ous": 10, "oust": 3, "out": 1231, "outa": 1, "outb": 40, "outc": 60, "outd": 50, "oute": 76, "outf": 38, "outg": 30, "outh": 3, "outi": 5, "outl": 171, "outm": 14, "outn": 5, "outo": 28, "outp": 53, "outr": 79, "outs": 446, "outt": 2, "outv": 2, "outw": 111, "outy": 1, "ouz": 1, "ova": 17, "oval": 2, "ovat": 2, "ove": 4940, "oven": 2, "over": 1115, "ovi": 1, "ovif": 1, "ovu": 1, "owe": 86, "owen": 1, "owes": 5, "owet": 1, "owi": 39, "owin": 39, "owl": 16, "owli": 1, "own": 314, "owne": 221, "owni": 13, "owns": 1, "oxa": 3, "oxal": 3, "oxc": 2, "oxca": 2, "oxe": 126, "oxen": 1, "oxey": 1, "oxf": 43, "oxfo": 43, "oxi": 29, "oxid": 29, "oxn": 1, "oxna": 1, "oxu": 1, "oxy": 53, "oxyg": 49, "oxyh": 1, "oxyt": 3, "oya": 5, "oyab": 4, "oyaj": 1, "oys": 26, "oyst": 26, "oza": 6, "ozag": 5, "ozar": 1, "oze": 2, "ozi": 2, "ozia": 2, "ozn": 2, "ozni": 1, "ozo": 5, "ozon": 4, "ozz": 1, "ozzi": 1, "paa": 1, "paar": 1, "pab": 4, "pabl": 1, "pabo": 1, "pac": 487, "pace": 54, "pach": 4, "paci": 130, "pack": 146, "paco": 1, "pact": 2, "pad": 74, "pada": 12, "padd": 41, "padl": 6, "pado": 3, "padr": 4, "pae": 5, "paea": 4, "paes": 1, "pag": 238, "paga": 43, "page": 77, "pagi": 7, "pagl": 1, "pagn": 3, "pago": 7, "pah": 6, "paha": 6, "pai": 1353, "paid": 2, "pail": 7, "pain": 564, "paio": 1, "pair": 38, "paj": 4, "paja": 4, "pak": 10, "paki": 10, "pal": 937, "pala": 215, "pale": 42, "palf": 35, "pali": 17, "pall": 50, "palm": 205, "palo": 2, "palp": 29, "pals": 23, "palt": 9, "pam": 52, "pama": 1, "pame": 20, "pami": 1, "paml": 1, "pamp": 28, "pan": 422, "pana": 15, "panc": 6, "pand": 14, "pane": 113, "pang": 25, "panh": 1, "pani": 43, "panj": 1, "pank": 2, "pann": 11, "pano": 15, "pans": 20, "pant": 114, "pany": 2, "panz": 3, "pao": 3, "pap": 595, "papa": 28, "pape": 414, "paph": 2, "papi": 6, "papp": 3, "papr": 2, "paq": 1, "paqu": 1, "par": 5753, "para": 546, "parb": 3, "parc": 97, "pard": 155, "pare": 237, "pari": 154, "park": 184, "parl": 150, "parm": 8, "parn": 2, "paro": 40, "parq": 1, "parr": 32, "pars": 74, "part": 2515, "paru": 1, "parv": 4, "pas": 3726, "pasa": 8, "pasc": 7, "pasd": 1, "pase": 3, "pash": 17, "pasl": 2, "pass": 1672, "past": 218, "pat": 1433, "pata": 10, "patc": 117, "pate": 94, "path": 176, "pati": 387, "patm": 2, "patr": 195, "pats": 1, "patt": 280, "pau": 607, "pauc": 1, "paul": 36, "paum": 20, "paun": 6, "paup": 3, "paur": 1, "paus": 253, "pav": 105, "pave": 76, "pavi": 21, "pavl": 4, "paw": 40, "pawc": 2, "pawe": 1, "pawi": 2, "pawn": 8, "paws": 3, "pawt": 7, "pax": 11, "paxa": 1, "paxo": 3, "paxt": 7, "pay": 259, "paya": 4, "payc": 2, "payd": 3, "paye": 7, "payi": 60, "paym": 115, "payn": 21, "payo": 1, "payr": 16, "pays": 1, "pea": 1225, "peab": 3, "peac": 971, "peak": 42, "peal": 19, "pean": 11, "pear": 58, "peas": 46, "peat": 1, "peaz": 1, "peb": 15, "pebb": 14, "pebw": 1, "pec": 229, "peca": 3, "pecc": 3, "peck": 13, "peco": 2, "pect": 5, "pecu": 195, "ped": 117, "peda": 24, "pedd": 33, "pede": 38, "pedi": 11, "pedl": 3, "pedr": 8, "pee": 212, "peeb": 1, "peec": 11, "peek": 3, "peel": 25, "peep": 26, "peer": 101, "peet": 1, "peeu": 2, "peev": 4, "peew": 1, "peg": 36, "pega": 1, "pegb": 8, "pegg": 21, "pegl": 1, "pei": 1, "peip": 1, "pek": 20, "peka": 14, "peke": 2, "peki": 2, "peko": 2, "pel": 162, "pela": 9, "pele": 92, "pelh": 5, "peli": 10, "pell": 6, "pelo": 4, "pelt": 18, "pelv": 5, "pem": 11, "pemb": 10, "pemm": 1, "pen": 670, "pena": 57, "penc": 87, "pend": 76, "pene": 92, "peng": 2, "peni": 32, "penk": 2, "penm": 1, "penn": 196, "peno": 1, "penr": 1, "pens": 57, "pent": 21, "penu": 16, "peo": 3728, "peon": 5, "peop": 3717, "pep": 46, "pepi": 1, "pepp": 39, "pept": 6, "peq": 173, "pequ": 173, "per": 6571, "pera": 42, "perc": 502, "perd": 19, "pere": 42, "perf": 1216, "perg": 8, "perh": 940, "peri": 781, "perj": 6, "perk": 5, "perl": 6, "perm": 397, "pern": 12, "pero": 2, "perp": 198, "perq": 2, "perr": 101, "pers": 2006, "pert": 128, "peru": 24, "perv": 110, "pery": 2, "pes": 105, "pesa": 2, "pesc": 3, "pess": 21, "pest": 73, "pet": 468, "peta": 5, "pete": 267, "peth": 7, "peti": 92, "petr": 16, "pets": 1, "pett": 42, "petu": 6, "peu": 3, "peug": 1, "peul": 1, "pew": 14, "pewt": 12, "pez": 3, "pezz": 3, "pfa": 5, "pfaf": 4, "pfe": 1, "pfen": 1, "pff": 1, "pfff": 1, "pfo": 3, "pfoh": 3, "pha": 603, "phae": 1, "phag": 1, "phal": 17, "phan": 62, "phar": 417, "phas": 105, "phe": 99, "phea": 9, "pheb": 1, "phed": 6, "phel": 2, "phen": 81, "phi": 935, "phia": 1, "phic": 3, "phid": 1, "phil": 830, "phin": 27, "phip": 2, "phl": 4, "phle": 3, "phlo": 1, "pho": 303, "phob": 1, "phoe": 14, "phon": 115, "phos": 32, "phot": 121, "phou": 5, "phr": 136, "phra": 113, "phre": 20, "phry": 3, "pht": 1, "phth": 1, "phu": 5, "phur": 2, "phuv": 1, "phy": 332, "phyf": 4, "phyg": 1, "phyl": 4, "phys": 323, "pia": 132, "pian": 105, "pias": 1, "piaz": 26, "pib": 1, "pibe": 1, "pic": 832, "pica": 18, "picc": 12, "pick": 247, "picn": 25, "pico": 1, "pict": 423, "pid": 6, "pidd": 4, "pidg": 2, "pie": 923, "pieb": 2, "piec": 574, "pied": 163, "piep": 14, "pier": 120, "piet": 19, "piez": 4, "pig": 111, "pigd": 2, "pige": 75, "pigg": 3, "pigi": 1, "pigl": 1, "pigm": 15, "pigp": 1, "pigs": 1, "pih": 4, "piha": 4, "pik": 60, "pike": 4, "pil": 584, "pila": 61, "pild": 1, "pile": 55, "pilf": 5, "pilg": 49, "pili": 8, "pill": 226, "pilo": 109, "pilt": 1, "pim": 20, "pime": 7, "pimp": 10, "pin": 377, "pina": 3, "pinb": 1, "pinc": 45, "pind": 12, "pine": 43, "ping": 2, "pinh": 2, "pini": 15, "pink": 10, "pinm": 1, "pinn": 27, "pino": 3, "pinp": 8, "pins": 2, "pint": 2, "pio": 127, "pion": 93, "piou": 34, "pip": 175, "pipe": 50, "pipg": 1, "pipi": 13, "pipp": 1, "piq": 11, "piqu": 11, "pir": 62, "pira": 54, "piri": 1, "piro": 7, "pis": 107, "pisc": 2, "pisg": 5, "pisi": 2, "pism": 1, "piso": 1, "pisp": 1, "piss": 6, "pist": 86, "pit": 655, "pitc": 293, "pite": 9, "pitf": 6, "pith": 4, "piti": 76, "pitn": 1, "pitr": 3, "pitt": 53, "pitu": 11, "pity": 12, "piu": 2, "piv": 12, "pivo": 12, "piw": 1, "piwe": 1, "pix": 1, "pixi": 1, "piz": 6, "piza": 2, "pizz": 4, "pla": 6872, "plac": 2954, "plag": 179, "plai": 555, "plan": 1243, "plaq": 6, "plas": 133, "plat": 300, "plau": 14, "play": 677, "plaz": 5, "ple": 2042, "plea": 1735, "pleb": 9, "pled": 55, "plee": 1, "plei": 6, "plen": 198, "plet": 1, "pleu": 12, "plex": 1, "pli": 44, "plia": 6, "plie": 5, "plig": 22, "plin": 10, "plit": 1, "plo": 220, "plod": 11, "plop": 1, "plot": 38, "plou": 59, "plow": 43, "plu": 492, "pluc": 117, "plug": 9, "plum": 128, "plun": 96, "plur": 4, "plus": 6, "plut": 5, "ply": 39, "plyi": 4, "plym": 25, "plyw": 9, "pne": 3, "pneu": 3, "poa": 3, "poac": 2, "poar": 1, "pob": 2, "pobo": 2, "poc": 238, "poca": 3, "poch": 2, "pock": 230, "poco": 1, "pod": 31, "podg": 24, "podi": 1, "podo": 1, "poe": 698, "poem": 159, "poep": 1, "poes": 3, "poet": 266, "pog": 3, "pogr": 2, "pogu": 1, "poh": 16, "pohl": 5, "poi": 1393, "poig": 13, "poin": 1238, "poir": 2, "pois": 127, "poit": 5, "pok": 45, "poke": 26, "poki": 7, "pol": 1865, "pola": 93, "pold": 1, "pole": 35, "poli": 1343, "polk": 3, "poll": 118, "polo": 60, "polt": 6, "poly": 110, "pom": 146, "poma": 2, "pome": 34, "pomf": 44, "pomh": 2, "pomm": 8, "pomo": 3, "pomp": 31, "pon": 260, "ponc": 8, "pond": 96, "pone": 1, "poni": 14, "ponk": 1, "pono": 1, "pont": 37, "pony": 1, "poo": 1388, "pooc": 1, "pood": 2, "pooh": 4, "pool": 53, "poor": 80, "pop": 495, "popa": 1, "pope": 4, "popi": 7, "popl": 8, "popp": 22, "pops": 1, "popu": 382, "por": 855, "pora": 1, "porc": 107, "pore": 6, "porg": 1, "pori": 7, "pork": 3, "porn": 6, "poro": 16, "porp": 34, "porr": 3, "port": 557, "poru": 2, "pos": 2605, "pose": 13, "posh": 1, "posi": 517, "poss": 1559, "post": 317, "pot": 353, "pota": 51, "potb": 3, "pote": 154, "poth": 1, "poti": 8, "potl": 2, "poto": 8, "potp": 1, "pots": 7, "pott": 69, "pou": 569, "pouc": 7, "poug": 2, "poui": 1, "poul": 24, "poun": 203, "poup": 1, "pour": 210, "pous": 4, "pout": 2, "pov": 63, "pove": 63, "pow": 1417, "powd": 84, "powe": 1319, "powi": 1, "powo": 1, "powr": 11, "poy": 21, "poyn": 5, "poys": 16, "poz": 5, "pozz": 5, "pra": 2072, "prab": 2, "prac": 463, "prad": 1, "prae": 3, "prag": 10, "prai": 610, "pram": 1, "pran": 14, "prat": 36, "prav": 1, "praw": 1, "pray": 389, "pre": 7401, "prea": 251, "preb": 1, "prec": 707, "pred": 162, "pree": 13, "pref": 237, "preg": 22, "preh": 9, "prei": 2, "prej": 60, "prel": 66, "prem": 117, "pren": 9, "preo": 25, "prep": 708, "prer": 7, "pres": 3480, "pret": 611, "preu": 10, "prev": 768, "prew": 8, "prex": 1, "prey": 2, "pri": 4316, "pria": 7, "pric": 374, "prid": 223, "prie": 1213, "prig": 1, "prim": 361, "prin": 1171, "prio": 87, "prip": 1, "pris": 312, "priu": 6, "priv": 436, "priz": 116, "pro": 11921, "proa": 1, "prob": 1201, "proc": 1104, "prod": 927, "proe": 2, "prof": 993, "prog": 815, "proh": 41, "proi": 1, "proj": 305, "prok": 39, "prol": 105, "prom": 930, "pron": 176, "proo": 169, "prop": 2121, "pror": 1, "pros": 478, "prot": 503, "prou": 309, "prov": 1578, "prow": 38, "prox": 21, "proy": 1, "pru": 141, "prud": 108, "prun": 17, "prur": 3, "prus": 12, "prut": 1, "pry": 22, "prye": 1, "pryi": 7, "pryn": 2, "pryt": 12, "psa": 67, "psal": 67, "pse": 28, "pseu": 28, "psh": 8, "psha": 8, "psi": 5, "psit": 5, "psy": 163, "psyc": 160, "psyl": 3, "pte": 1, "pter": 1, "pto": 29, "ptol": 29, "pua": 4, "pual": 1, "pub": 999, "pube": 4, "publ": 994, "puc": 7, "pucc": 3, "puck": 4, "pud": 28, "pudd": 27, "pude": 1, "pue": 26, "puer": 26, "puf": 57, "puff": 37, "pug": 15, "puge": 2, "pugi": 3, "pugn": 4, "puh": 1, "puhi": 1, "pui": 9, "puis": 9, "puk": 1, "pul": 619, "pula": 1, "puli": 3, "pull": 289, "pulm": 28, "pulo": 2, "pulp": 34, "puls": 74, "pult": 1, "pulv": 7, "pum": 68, "pumb": 3, "pumm": 1, "pump": 43, "pun": 295, "punc": 72, "pund": 2, "pung": 6, "puni": 192, "punk": 1, "punn": 2, "puno": 2, "puns": 1, "punt": 1, "pup": 108, "pupa": 2, "pupe": 3, "pupi": 62, "pupp": 39, "pur": 1848, "purc": 172, "purd": 13, "pure": 63, "purg": 62, "puri": 118, "purl": 9, "purp": 696, "purr": 5, "purs": 457, "purt": 3, "puru": 1, "purv": 7, "pus": 272, "push": 184, "pusi": 1, "puss": 7, "put": 299, "puta": 2, "pute": 1, "puti": 1, "putn": 21, "puto": 1, "putr": 7, "putt": 204, "putu": 1, "puz": 127, "puze": 1, "puzz": 126, "pye": 1, "pyg": 2, "pyga": 1, "pygm": 1, "pyh": 1, "pyhr": 1, "pyj": 3, "pyja": 3, "pyk": 2, "pykn": 2, "pyn": 1, "pynt": 1, "pyo": 2, "pyoc": 1, "pyor": 1, "pyr": 50, "pyra": 24, "pyre": 7, "pyro": 6, "pyrr": 12, "pys": 1, "pysc": 1, "pyt": 20, "pyth": 20, "qua": 1049, "quac": 26, "quad": 45, "quaf": 3, "quag": 1, "quah": 2, "quai": 38, "quak": 56, "qual": 314, "quan": 97, "quar": 428, "quas": 11, "quat": 4, "quav": 5, "quay": 17, "que": 1706, "quea": 1, "queb": 5, "quee": 687, "quel": 18, "quem": 2, "quen": 40, "quer": 21, "ques": 929, "quet": 2, "queu": 1, "qui": 2683, "quib": 3, "quic": 557, "quid": 1, "quie": 437, "quil": 25, "quin": 69, "quip": 1, "quir": 21, "quit": 1438, "quiv": 44, "quix": 7, "quiz": 9, "quo": 96, "quog": 1, "quoh": 10, "quoi": 4, "quot": 78, "quy": 2, "quyn": 2, "raa": 8, "raam": 7, "rab": 182, "raba": 2, "rabb": 149, "rabe": 3, "rabi": 5, "rabm": 2, "rabs": 19, "rac": 551, "racc": 2, "race": 73, "rach": 101, "raci": 62, "rack": 30, "racq": 1, "rad": 481, "rada": 27, "radd": 1, "rade": 1, "radh": 1, "radi": 428, "radn": 22, "rae": 1, "raes": 1, "raf": 25, "rafa": 1, "rafe": 1, "raff": 1, "raft": 16, "rag": 226, "raga": 2, "rage": 20, "ragg": 39, "ragi": 27, "ragu": 1, "rah": 12, "raha": 11, "rahe": 1, "rai": 1227, "raid": 10, "rail": 174, "raim": 62, "rain": 82, "rais": 574, "raj": 1, "raja": 1, "rak": 41, "rake": 13, "raki": 5, "rakk": 2, "ral": 58, "rale": 1, "rall": 29, "ralp": 23, "ram": 283, "rama": 54, "ramb": 21, "rame": 41, "rami": 12, "ramm": 10, "ramo": 27, "ramp": 22, "rams": 12, "ran": 822, "rana": 1, "ranc": 64, "rand": 168, "rang": 290, "rank": 109, "rans": 43, "rant": 2, "rany": 1, "rao": 2, "raou": 2, "rap": 391, "rapa": 4, "rape": 3, "raph": 20, "rapi": 261, "rapo": 1, "rapp": 29, "raps": 2, "rapt": 38, "rapu": 1, "rar": 139, "rare": 51, "rari": 7, "rarm": 1, "ras": 91, "rasc": 19, "rase": 1, "rash": 8, "raso": 1, "rasp": 38, "rast": 1, "rat": 1962, "rata": 2, "ratc": 29, "rate": 120, "ratf": 1, "rath": 1186, "rati": 232, "ratl": 1, "rato": 4, "ratt": 73, "rau": 21, "rauc": 10, "raue": 7, "raui": 2, "raus": 2, "rav": 75, "rava": 2, "rave": 40, "ravi": 32, "raw": 14, "rawb": 1, "rawh": 1, "rawl": 7, "rawn": 1, "raws": 3, "ray": 97, "rayb": 48, "raye": 2, "raym": 19, "rayn": 2, "rayt": 1, "raz": 37, "raze": 1, "razi": 1, "razo": 34, "rbe": 1, "rber": 1, "rbi": 1, "rca": 2, "rcap": 1, "rcav": 1, "rdw": 4, "rea": 5991, "reac": 914, "read": 1121, "reaf": 9, "reag": 4, "reai": 4, "reak": 1, "real": 1480, "ream": 7, "rean": 2, "reap": 76, "rear": 53, "reas": 1156, "reav": 3, "reaw": 1, "reb": 423, "rebe": 262, "rebi": 3, "rebo": 14, "rebu": 137, "rec": 3845, "reca": 151, "rece": 1607, "rech": 24, "reci": 83, "reck": 138, "recl": 37, "reco": 1582, "recr": 111, "rect": 63, "recu": 47, "red": 660, "reda": 4, "redb": 6, "redc": 17, "redd": 53, "rede": 220, "redf": 1, "redh": 14, "redi": 9, "redl": 4, "redn": 7, "redo": 22, "redp": 1, "redr": 14, "reds": 2, "redt": 4, "redu": 265, "redv": 1, "redw": 10, "ree": 186, "reec": 2, "reed": 21, "reef": 7, "reek": 5, "reel": 31, "reem": 4, "reen": 14, "rees": 6, "reev": 6, "reex": 10, "ref": 1393, "refa": 1, "refe": 273, "refi": 62, "refl": 322, "refo": 88, "refr": 181, "refu": 466, "reg": 1472, "rega": 587, "rege": 18, "regi": 416, "regr": 144, "regu": 306, "reh": 135, "reha": 33, "rehe": 30, "reho": 64, "rehu": 8, "rei": 594, "reic": 9, "reif": 1, "reig": 453, "reil": 2, "reim": 10, "rein": 87, "reio": 4, "reip": 1, "reis": 3, "reit": 16, "rej": 526, "reje": 135, "rejo": 391, "rek": 6, "reke": 5, "reki": 1, "rel": 1917, "rela": 847, "rele": 208, "reli": 778, "rell": 3, "relo": 3, "relu": 52, "rely": 9, "rem": 3232, "rema": 1299, "remb": 4, "reme": 990, "remi": 182, "remm": 2, "remn": 103, "remo": 642, "remp": 2, "remu": 6, "ren": 611, "rena": 54, "renc": 3, "rend": 180, "rene": 109, "renf": 2, "reni": 2, "renn": 1, "reno": 55, "rens": 4, "rent": 42, "renu": 2, "renv": 1, "reo": 42, "reop": 3, "reor": 39, "rep": 3381, "repa": 193, "repe": 664, "reph": 21, "repi": 5, "repl": 862, "repn": 2, "repo": 634, "repr": 709, "rept": 8, "repu": 280, "req": 828, "requ": 828, "rer": 14, "rere": 11, "reru": 3, "res": 5249, "resa": 2, "resc": 61, "rese": 595, "resh": 5, "resi": 500, "resn": 2, "reso": 599, "resp": 1093, "rest": 690, "resu": 784, "ret": 2070, "reta": 175, "retc": 2, "rete": 23, "reth": 3, "reti": 183, "reto": 26, "retr": 163, "retu": 1493, "rety": 2, "reu": 172, "reub": 94, "reue": 43, "reui": 2, "reum": 1, "reun": 18, "reuo": 4, "reup": 1, "reus": 2, "reut": 1, "reuv": 5, "rev": 1221, "reva": 5, "reve": 659, "revi": 250, "revo": 291, "revr": 1, "revu": 12, "revv": 1, "rew": 200, "rewa": 191, "rewr": 8, "rex": 7, "rexr": 7, "rey": 24, "reyd": 1, "reye": 1, "reyn": 22, "rez": 15, "reze": 2, "rezi": 12, "rezo": 1, "rhe": 48, "rhea": 1, "rheg": 1, "rhei": 3, "rhen": 5, "rhes": 1, "rhet": 11, "rheu": 23, "rhew": 1, "rhi": 22, "rhin": 22, "rho": 129, "rhod": 127, "rhom": 1, "rhon": 1, "rhu": 3, "rhub": 3, "rhy": 87, "rhym": 27, "rhyt": 60, "ria": 3, "rib": 125, "riba": 10, "ribb": 55, "ribc": 1, "ribe": 2, "ribl": 11, "ribo": 2, "ric": 734, "rica": 3, "ricc": 5, "rich": 335, "rick": 12, "rico": 1, "rid": 466, "ridd": 65, "ride": 85, "ridg": 54, "ridi": 147, "ridp": 1, "rie": 7, "rief": 3, "rieg": 2, "riem": 1, "ries": 1, "rif": 136, "riff": 1, "rifl": 131, "rift": 1, "rig": 2688, "riga": 1, "rigg": 59, "righ": 2530, "rigi": 68, "rigo": 25, "rigv": 1, "ril": 7, "rilk": 1, "rill": 5, "rim": 37, "rima": 3, "rimb": 1, "rimf": 6, "rimi": 1, "riml": 1, "rimm": 20, "rin": 324, "rina": 4, "ring": 143, "rink": 2, "rinn": 1, "rins": 14, "rio": 41, "riot": 25, "rip": 144, "ripe": 24, "riph": 2, "ripl": 1, "ripo": 5, "ripp": 52, "ripr": 2, "ris": 929, "rise": 173, "risi": 253, "risk": 24, "riss": 2, "rit": 88, "ritc": 4, "rite": 23, "rith": 2, "riti": 1, "rits": 1, "ritt": 11, "ritu": 36, "riu": 3, "riua": 1, "riue": 2, "riv": 746, "riva": 62, "rive": 674, "rivi": 2, "rivu": 8, "riz": 5, "rizp": 4, "rizz": 1, "roa": 805, "roac": 2, "road": 120, "roam": 16, "roan": 4, "roar": 126, "roas": 43, "roat": 1, "rob": 549, "roba": 9, "robb": 122, "robe": 281, "robi": 60, "robo": 7, "robu": 20, "roc": 544, "rocc": 2, "roch": 7, "rock": 273, "roco": 7, "rod": 139, "rodd": 7, "rode": 9, "rodg": 7, "rodm": 1, "rodn": 6, "roe": 20, "roeb": 14, "roem": 1, "rog": 46, "roge": 27, "rogu": 19, "roh": 1, "rohg": 1, "roi": 3, "roil": 3, "rok": 4, "roko": 3, "rol": 629, "rola": 8, "role": 54, "roll": 328, "roln": 1, "rolo": 1, "rom": 467, "roma": 299, "rome": 10, "romi": 3, "romm": 1, "romp": 2, "romu": 1, "ron": 19, "rona": 5, "ronc": 1, "rond": 6, "ronn": 6, "rony": 1, "roo": 1742, "rood": 2, "roof": 33, "rook": 23, "room": 158, "roon": 7, "roos": 43, "root": 132, "rop": 143, "rope": 47, "roq": 2, "roqu": 2, "ror": 91, "rors": 1, "ros": 824, "rosa": 58, "rosb": 4, "rose": 103, "rosi": 61, "rosl": 1, "ross": 73, "rost": 7, "rosw": 1, "rosy": 1, "rot": 106, "rota": 49, "rote": 2, "roth": 1, "roto": 8, "rott": 31, "rotu": 9, "rou": 1766, "roub": 1, "rouc": 1, "roug": 170, "roul": 5, "roun": 1338, "rour": 22, "rous": 95, "rout": 110, "rov": 23, "rove": 10, "rovi": 9, "row": 105, "rowd": 7, "rowe": 11, "rowi": 12, "rowl": 4, "rows": 3, "rowz": 1, "rox": 1, "roy": 190, "roya": 185, "royc": 3, "royl": 1, "roz": 3, "roze": 2, "rozo": 1, "rst": 6, "rsta": 6, "rua": 9, "ruan": 8, "ruar": 1, "rub": 140, "ruba": 1, "rubb": 112, "rubd": 1, "rube": 1, "rubi": 14, "rubr": 1, "ruc": 2, "ruce": 1, "ruck": 1, "rud": 129, "rudd": 24, "rude": 15, "rudi": 9, "rudk": 1, "rudo": 4, "rudy": 1, "rue": 14, "ruef": 12, "ruf": 22, "ruff": 19, "rufu": 3, "rug": 46, "ruge": 5, "rugg": 36, "ruh": 1, "ruha": 1, "rui": 166, "ruid": 1, "ruin": 89, "rul": 630, "rule": 370, "ruli": 38, "rum": 122, "ruma": 4, "rumb": 27, "rumd": 2, "rume": 2, "rumf": 2, "rumi": 10, "rumm": 9, "rumo": 50, "rump": 7, "rums": 1, "rumt": 1, "run": 497, "runa": 15, "runc": 1, "rund": 7, "rune": 1, "runi": 1, "runn": 350, "runo": 3, "runs": 1, "runu": 3, "runw": 8, "runy": 4, "rup": 32, "rupe": 20, "rupp": 1, "rupt": 11, "rur": 68, "rura": 68, "rus": 779, "rush": 161, "rusk": 4, "rusl": 1, "russ": 387, "rust": 90, "rut": 77, "ruta": 2, "ruth": 33, "ruts": 1, "rutt": 1, "ruy": 1, "ruys": 1, "rwa": 1, "rwar": 1, "rya": 34, "ryc": 1, "rych": 1, "ryd": 1, "ryde": 1, "rye": 1, "ryer": 1, "ryl": 1, "ryli": 1, "ryn": 1, "ryr": 1, "ryra": 1, "ryu": 8, "ryus": 8, "saa": 10, "saab": 1, "saad": 1, "saam": 8, "sab": 240, "saba": 4, "sabb": 186, "sabe": 13, "sabi": 7, "sabl": 13, "sabo": 4, "sabr": 8, "sabt": 4, "sac": 676, "saca": 2, "sacc": 1, "sace": 1, "sach": 6, "sack": 69, "sacr": 568, "sad": 179, "sadd": 96, "sadi": 11, "sadl": 52, "sadn": 17, "sado": 3, "saf": 496, "safa": 3, "safe": 257, "saff": 13, "saft": 1, "sag": 65, "saga": 21, "sage": 5, "sagg": 12, "sagi": 4, "sagu": 1, "sah": 4, "saha": 3, "sahj": 1, "sai": 13508, "said": 31, "saie": 3, "saig": 1, "sail": 450, "sain": 179, "sait": 1271, "sak": 395, "sake": 43, "sako": 1, "sal": 1130, "sala": 107, "salc": 4, "sale": 208, "salf": 2, "sali": 57, "sall": 57, "salm": 20, "salo": 34, "salp": 1, "sals": 1, "salt": 53, "salu": 134, "salv": 224, "saly": 3, "sam": 2523, "sama": 136, "samb": 2, "same": 6, "samg": 1, "saml": 4, "samm": 46, "samo": 12, "samp": 123, "sams": 43, "samu": 192, "san": 968, "sana": 3, "sanb": 10, "sanc": 354, "sand": 145, "sane": 10, "sanf": 2, "sang": 28, "sanh": 1, "sani": 42, "sans": 15, "sant": 46, "sap": 40, "saph": 1, "sapi": 7, "sapl": 5, "sapo": 1, "sapp": 24, "sar": 201, "sara": 119, "sarc": 15, "sard": 24, "sare": 1, "sarg": 6, "sari": 2, "sarj": 1, "sark": 2, "sarm": 2, "saro": 1, "sarp": 2, "sarr": 1, "sars": 2, "sart": 10, "saru": 2, "sarv": 2, "sas": 24, "sash": 8, "sask": 1, "sass": 4, "sat": 915, "sata": 149, "satc": 1, "sate": 23, "sati": 614, "satt": 1, "satu": 119, "saty": 4, "sau": 552, "saua": 4, "sauc": 49, "saud": 4, "saue": 4, "saui": 2, "sauk": 1, "saum": 2, "saun": 20, "sauo": 1, "saur": 1, "saus": 12, "saut": 3, "sauv": 1, "sav": 1044, "sava": 173, "save": 231, "savi": 139, "savo": 100, "savv": 1, "saw": 70, "sawa": 2, "sawc": 8, "sawd": 3, "sawe": 34, "sawh": 1, "sawi": 3, "sawm": 1, "sawn": 1, "sawt": 3, "sawy": 2, "sax": 38, "saxo": 35, "saxt": 3, "say": 2390, "saye": 65, "sayi": 1900, "sayl": 5, "sayo": 1, "says": 4, "sba": 2, "sbc": 1, "sbcs": 1, "sbi": 3, "sbir": 3, "sca": 1015, "scab": 19, "scae": 4, "scaf": 24, "scai": 1, "scal": 177, "scam": 13, "scan": 93, "scap": 28, "scar": 394, "scat": 218, "scav": 2, "sce": 485, "sced": 1, "scen": 417, "scep": 66, "scev": 1, "sch": 1466, "scha": 23, "sche": 245, "schi": 22, "schl": 7, "schm": 7, "schn": 16, "scho": 1085, "schr": 6, "schu": 25, "schw": 30, "sci": 473, "scia": 4, "scie": 446, "scil": 2, "scim": 5, "scin": 1, "scio": 2, "scip": 1, "scis": 12, "scl": 3, "scle": 3, "sco": 747, "scob": 1, "scoe": 6, "scof": 9, "scol": 33, "scon": 5, "scoo": 25, "scop": 37, "scor": 339, "scot": 196, "scou": 79, "scow": 15, "scr": 914, "scra": 208, "scre": 328, "scri": 239, "scro": 15, "scru": 124, "scu": 129, "scud": 2, "scuf": 5, "scul": 57, "scum": 1, "scup": 2, "scur": 12, "scus": 1, "scut": 32, "scy": 7, "scyl": 1, "scyt": 6, "sde": 1, "sdei": 1, "sea": 1593, "seab": 10, "seac": 3, "sead": 1, "seaf": 9, "seag": 3, "seah": 2, "seal": 101, "seam": 91, "sean": 1, "seao": 1, "seap": 6, "seaq": 3, "sear": 268, "seas": 334, "seat": 192, "seau": 1, "seav": 1, "seaw": 22, "seb": 15, "seba": 10, "sebo": 1, "sec": 2557, "seca": 29, "secc": 3, "sece": 21, "sech": 2, "secl": 26, "seco": 984, "secr": 803, "sect": 292, "secu": 385, "sed": 93, "seda": 14, "sede": 7, "sedg": 6, "sedi": 20, "sedu": 46, "see": 5701, "seeb": 5, "seed": 95, "seei": 429, "seek": 220, "seel": 3, "seem": 2103, "seen": 34, "seep": 6, "seer": 10, "sees": 58, "seet": 79, "seev": 1, "seg": 66, "sega": 1, "segm": 25, "sego": 4, "segr": 31, "segu": 5, "sei": 236, "seid": 2, "seig": 6, "sein": 4, "seir": 1, "seis": 16, "seiz": 162, "sel": 1383, "sela": 76, "selb": 1, "seld": 110, "sele": 233, "self": 444, "seli": 12, "selk": 17, "sell": 88, "selm": 2, "sels": 1, "selu": 28, "selv": 19, "sem": 128, "sema": 10, "semb": 8, "seme": 16, "semi": 79, "semm": 1, "semp": 2, "semr": 1, "sen": 3383, "sena": 142, "senc": 7, "send": 147, "sene": 7, "seni": 59, "senn": 16, "seno": 7, "sens": 1123, "sent": 313, "senu": 1, "seo": 3, "seor": 1, "seou": 1, "sep": 621, "sepa": 406, "sepe": 1, "seph": 9, "sepi": 1, "sept": 90, "sepu": 76, "seq": 65, "sequ": 65, "ser": 3733, "sera": 51, "serb": 2, "sere": 71, "serf": 3, "serg": 51, "seri": 529, "serj": 5, "serl": 4, "serm": 27, "sero": 2, "serp": 139, "serr": 8, "seru": 69, "serv": 2740, "ses": 116, "sesa": 7, "sess": 109, "set": 711, "setb": 6, "seth": 3, "setl": 1, "seto": 1, "sets": 1, "sett": 593, "setu": 12, "seu": 16, "seue": 15, "seur": 1, "sev": 1801, "seve": 1799, "sevi": 2, "sew": 84, "sewa": 38, "sewe": 28, "sewi": 17, "sex": 116, "sexc": 1, "sexe": 20, "sexm": 1, "sext": 19, "sexu": 73, "sey": 53, "seyc": 1, "seym": 30, "seyn": 2, "seyt": 6, "seyw": 12, "sfo": 2, "sfor": 2, "sha": 16721, "shaa": 10, "shab": 41, "shac": 10, "shad": 550, "shae": 8, "shaf": 37, "shag": 16, "shah": 4, "shak": 397, "shal": 13701, "sham": 315, "shan": 29, "shap": 482, "shar": 860, "shas": 7, "shat": 45, "shau": 8, "shav": 80, "shaw": 30, "shay": 33, "she": 2469, "shea": 143, "sheb": 55, "shec": 76, "shed": 24, "shee": 427, "shef": 1, "sheh": 1, "shei": 6, "shek": 140, "shel": 363, "shem": 66, "shen": 9, "shep": 163, "sher": 118, "shes": 14, "shet": 9, "shev": 3, "shew": 284, "shi": 2186, "shib": 5, "shic": 1, "shie": 121, "shif": 135, "shig": 1, "shih": 3, "shil": 131, "shim": 88, "shin": 263, "ship": 409, "shir": 95, "shis": 9, "shit": 36, "shiv": 53, "shiz": 1, "shk": 1, "shki": 1, "shl": 3, "shli": 1, "shm": 1, "shmo": 1, "shn": 2, "shni": 1, "shnu": 1, "sho": 8261, "shoa": 24, "shob": 19, "shoc": 203, "shod": 1, "shoe": 152, "shoh": 1, "shoj": 1, "shol": 3, "shom": 2, "shon": 57, "shoo": 356, "shop": 96, "shor": 1189, "shot": 51, "shou": 4243, "shov": 54, "show": 812, "shp": 2, "shpi": 1, "shpr": 1, "shr": 365, "shra": 7, "shre": 66, "shri": 170, "shro": 45, "shru": 77, "sht": 10, "shta": 2, "shti": 3, "shto": 3, "shtr": 1, "shu": 576, "shua": 7, "shub": 3, "shuc": 4, "shud": 59, "shuf": 25, "shuh": 8, "shui": 1, "shul": 6, "shum": 1, "shun": 43, "shup": 5, "shur": 7, "shus": 21, "shut": 91, "shy": 23, "shyl": 13, "shyn": 10, "sia": 10, "siah": 1, "siam": 7, "sib": 40, "sibb": 8, "sibe": 12, "sibi": 5, "sibl": 3, "sibm": 5, "sibr": 1, "siby": 6, "sic": 401, "sich": 1, "sici": 31, "sick": 135, "sicu": 1, "sid": 1975, "sidd": 10, "side": 373, "sidi": 6, "sidl": 5, "sidm": 1, "sidn": 13, "sido": 20, "sie": 64, "sieb": 4, "siec": 2, "sied": 1, "sieg": 33, "sien": 3, "siep": 2, "sier": 8, "sies": 2, "sieu": 1, "siev": 8, "sif": 11, "sift": 5, "sig": 2142, "sige": 1, "sigh": 1020, "sigm": 6, "sign": 742, "sigu": 1, "sih": 42, "siha": 2, "siho": 40, "sik": 1, "siko": 1, "sil": 1560, "sila": 14, "sile": 845, "silh": 15, "sili": 8, "silk": 14, "sill": 89, "silo": 8, "silu": 4, "silv": 509, "sim": 1299, "sima": 1, "simb": 1, "simc": 1, "sime": 54, "simi": 293, "simm": 36, "simo": 87, "simp": 738, "simr": 1, "simu": 84, "sin": 3237, "sina": 46, "sinc": 1304, "sind": 1, "sine": 32, "sinf": 25, "sing": 797, "sini": 27, "sink": 60, "sinl": 6, "sinn": 258, "sino": 1, "sint": 4, "sinu": 11, "sio": 24, "siou": 9, "sip": 19, "siph": 3, "sipp": 16, "sir": 68, "sira": 1, "sire": 9, "siri": 5, "sirl": 3, "siro": 1, "sirr": 8, "sis": 855, "sisa": 2, "sise": 21, "sisk": 1, "sist": 829, "sit": 1052, "sitd": 1, "site": 19, "sith": 1, "siti": 2, "sitk": 1, "sitn": 1, "sits": 2, "sitt": 429, "situ": 472, "sitw": 3, "siv": 2, "siva": 1, "six": 335, "sixd": 1, "sixe": 2, "sixf": 3, "sixg": 1, "sixi": 1, "sixm": 2, "sixp": 33, "sixs": 3, "sixt": 285, "siz": 264, "siza": 15, "size": 39, "sizo": 1, "sizz": 5, "ska": 8, "skal": 3, "skar": 1, "skat": 4, "ske": 148, "skee": 2, "skei": 1, "skel": 62, "skep": 17, "sket": 60, "skew": 6, "ski": 667, "skid": 6, "skie": 47, "skif": 19, "skii": 9, "skij": 1, "skil": 190, "skim": 12, "skin": 60, "skip": 34, "skir": 88, "skit": 2, "skiw": 1, "sko": 26, "skol": 11, "skop": 4, "skor": 10, "skou": 1, "skr": 6, "skre": 1, "skri": 5, "sku": 74, "skul": 69, "skun": 4, "skur": 1, "sky": 92, "skyb": 1, "skyc": 1, "skyg": 1, "skyi": 1, "skyj": 2, "skyl": 18, "skyr": 23, "skys": 4, "skyt": 1, "skyw": 35, "sla": 979, "slab": 7, "slac": 59, "slad": 1, "slai": 216, "slak": 3, "slam": 25, "slan": 70, "slap": 31, "slas": 30, "slat": 49, "slau": 108, "slav": 187, "slay": 36, "sle": 1128, "sled": 13, "slee": 723, "slei": 8, "slen": 55, "slep": 115, "sleu": 1, "slew": 6, "sli": 835, "slic": 42, "slid": 78, "slie": 1, "slig": 364, "slil": 5, "slim": 21, "slin": 27, "slip": 154, "slit": 5, "sliu": 2, "sliv": 4, "slo": 720, "sloa": 30, "slob": 2, "sloc": 5, "slof": 1, "slog": 14, "sloo": 13, "slop": 88, "slos": 1, "slot": 28, "slou": 23, "slov": 5, "slow": 334, "slu": 187, "sluc": 1, "slud": 4, "slue": 1, "sluf": 1, "slug": 39, "slui": 14, "slum": 85, "slun": 16, "slur": 2, "slus": 2, "sly": 5, "slyl": 3, "slyn": 2, "sma": 1526, "smac": 20, "smal": 1358, "smar": 98, "smas": 48, "smat": 2, "sme": 215, "smea": 8, "smee": 3, "smel": 203, "smer": 1, "smi": 1256, "smil": 749, "smir": 6, "smit": 499, "smo": 726, "smoa": 3, "smok": 279, "smol": 6, "smoo": 169, "smot": 265, "smou": 2, "smu": 28, "smud": 1, "smug": 10, "smut": 5, "smy": 7, "smyl": 1, "smyr": 2, "smyt": 4, "sna": 407, "snac": 9, "snag": 1, "snai": 18, "snak": 102, "snap": 69, "snar": 97, "snat": 73, "snaz": 1, "sne": 99, "snea": 31, "snee": 59, "snel": 9, "sni": 35, "snic": 4, "snif": 18, "snig": 2, "snip": 7, "sniv": 3, "sno": 351, "snob": 17, "snod": 5, "snoo": 5, "snop": 4, "snor": 34, "snou": 5, "snow": 76, "snu": 73, "snub": 4, "snuc": 1, "snuf": 33, "snug": 15, "sny": 2, "snyd": 2, "soa": 105, "soak": 25, "soal": 1, "soap": 9, "soar": 19, "sob": 134, "sobb": 28, "sobe": 80, "sobi": 1, "sobr": 9, "soc": 1157, "soca": 33, "socc": 3, "soch": 4, "soci": 1011, "sock": 94, "soco": 4, "socr": 4, "sod": 99, "soda": 11, "sodd": 10, "sode": 1, "sodi": 12, "sodo": 57, "soe": 18, "soer": 1, "soev": 17, "sof": 451, "sofa": 8, "soft": 201, "sog": 6, "sogg": 6, "soh": 3, "soi": 155, "soig": 1, "soil": 29, "soir": 5, "soj": 91, "sojo": 91, "sok": 10, "soke": 1, "soko": 9, "sol": 1830, "sola": 47, "sold": 284, "sole": 244, "soli": 458, "soll": 5, "solo": 346, "sols": 2, "solu": 99, "solv": 71, "solw": 1, "som": 7373, "soma": 3, "somb": 13, "some": 2966, "somm": 4, "somn": 6, "somp": 1, "somt": 2, "son": 1874, "sona": 24, "sone": 1, "song": 207, "soni": 6, "sonn": 56, "sono": 18, "sonu": 1, "soo": 1514, "soon": 124, "soot": 101, "sop": 137, "sopa": 1, "soph": 119, "sopp": 1, "sopr": 13, "sops": 1, "sor": 1580, "sora": 1, "sorb": 8, "sorc": 20, "sord": 6, "sore": 21, "sorg": 3, "sori": 1, "soro": 3, "sorp": 2, "sorr": 546, "sort": 72, "sos": 7, "sosi": 1, "sost": 2, "sot": 5, "sota": 2, "sott": 2, "sotu": 1, "sou": 3484, "soub": 1, "souc": 1, "soud": 1, "soue": 8, "souf": 1, "soug": 263, "souk": 1, "soul": 243, "soun": 857, "soup": 1, "sour": 231, "sous": 4, "sout": 848, "souv": 12, "sov": 241, "sove": 76, "sovi": 147, "sovr": 18, "sow": 93, "sowb": 2, "sowe": 44, "sowi": 5, "sowr": 2, "sox": 1, "soxh": 1, "soy": 14, "soya": 1, "soyb": 11, "soyl": 2, "spa": 1779, "spac": 429, "spad": 63, "spag": 2, "spah": 7, "spai": 20, "spak": 667, "spal": 1, "span": 117, "spar": 357, "spas": 27, "spat": 21, "spav": 2, "spaw": 2, "spc": 1, "spe": 4524, "spea": 1917, "spec": 1144, "spee": 592, "speg": 1, "spei": 1, "spel": 72, "spen": 495, "sper": 271, "spes": 1, "spew": 3, "sph": 86, "sphe": 79, "sphi": 3, "sphy": 4, "spi": 2119, "spic": 68, "spid": 10, "spie": 37, "spig": 6, "spik": 30, "spil": 38, "spin": 100, "spio": 1, "spir": 1573, "spit": 211, "spl": 286, "spla": 49, "sple": 112, "spli": 114, "splo": 3, "splu": 8, "spo": 2005, "spoa": 1, "spof": 1, "spoi": 305, "spok": 867, "spol": 2, "spon": 135, "spoo": 54, "spor": 174, "spos": 11, "spot": 112, "spou": 145, "spoy": 3, "spr": 1234, "spra": 207, "spre": 417, "spri": 518, "spro": 28, "spru": 62, "spu": 131, "spue": 1, "spum": 3, "spun": 8, "spur": 57, "sput": 5, "spuy": 1, "spy": 8, "spyc": 1, "spyi": 7, "squ": 640, "squa": 485, "sque": 87, "squi": 68, "sre": 3, "srel": 2, "sres": 1, "sss": 2, "sssa": 1, "ssss": 1, "sta": 8967, "stab": 145, "stac": 54, "stad": 28, "staf": 205, "stag": 394, "stai": 335, "stak": 53, "stal": 165, "stam": 109, "stan": 1811, "stap": 5, "star": 1721, "stas": 7, "stat": 3086, "stau": 10, "stav": 75, "stay": 223, "ste": 2412, "stea": 646, "sted": 25, "stee": 511, "stef": 1, "stei": 55, "stel": 4, "stem": 46, "sten": 16, "steo": 1, "step": 467, "ster": 213, "stet": 9, "steu": 2, "stev": 61, "stew": 62, "sti": 2990, "stic": 273, "stid": 2, "stif": 130, "stig": 7, "stil": 2198, "stim": 70, "stin": 69, "stip": 10, "stir": 147, "stit": 16, "stiv": 1, "sto": 4362, "stob": 1, "stoc": 313, "stod": 1, "stoi": 16, "stok": 7, "stol": 138, "stom": 70, "ston": 701, "stoo": 1257, "stop": 419, "stor": 1003, "stou": 57, "stov": 44, "stow": 18, "stp": 2, "stpo": 2, "str": 7330, "stra": 2005, "stre": 2260, "stri": 1039, "stro": 1330, "stru": 688, "stry": 4, "sts": 1, "stst": 1, "stu": 1940, "stua": 24, "stub": 346, "stuc": 69, "stud": 991, "stuf": 127, "stul": 2, "stum": 143, "stun": 59, "stup": 109, "stur": 51, "stut": 2, "sty": 276, "styg": 5, "styk": 16, "styl": 237, "stym": 1, "styr": 14, "styt": 1, "sua": 8, "suab": 2, "suav": 5, "sub": 2121, "suba": 6, "subb": 2, "subc": 21, "subd": 94, "subf": 2, "subg": 10, "subh": 2, "subi": 11, "subj": 642, "subl": 41, "subm": 240, "subn": 1, "subo": 39, "subp": 7, "subr": 3, "subs": 621, "subt": 165, "subu": 189, "subv": 13, "subw": 8, "subz": 1, "suc": 4664, "succ": 686, "suce": 1, "such": 1, "suck": 82, "suct": 2, "sud": 782, "suda": 1, "sudd": 767, "sudi": 1, "sudr": 1, "suds": 1, "sue": 19, "sued": 1, "suez": 2, "suf": 870, "suff": 869, "sug": 470, "suga": 94, "sugg": 376, "suh": 1, "suht": 1, "sui": 354, "suic": 30, "suin": 1, "suit": 214, "suk": 7, "suka": 5, "sukk": 1, "suku": 1, "sul": 154, "sula": 2, "sulc": 1, "sulf": 3, "suli": 6, "sulk": 34, "sull": 57, "sulp": 18, "sult": 23, "sulz": 5, "sum": 562, "suma": 9, "suml": 1, "summ": 511, "sumn": 2, "sump": 10, "sumt": 2, "sun": 806, "suna": 1, "sunb": 29, "sund": 294, "sunf": 5, "sung": 1, "suni": 1, "sunk": 13, "sunl": 75, "sunm": 1, "sunn": 48, "sunr": 53, "suns": 121, "sunt": 4, "sunw": 4, "suo": 1, "suon": 1, "sup": 2585, "supe": 634, "supi": 4, "supp": 1819, "supr": 123, "sur": 3197, "surc": 9, "sure": 463, "surf": 323, "surg": 89, "surl": 8, "surm": 39, "surn": 21, "surp": 589, "surr": 212, "surt": 4, "suru": 2, "surv": 243, "sus": 959, "susa": 333, "susc": 11, "sush": 2, "susi": 6, "susp": 515, "susq": 1, "suss": 13, "sust": 76, "sut": 16, "sute": 2, "suth": 6, "suto": 4, "sutp": 1, "sutt": 2, "suv": 8, "suvo": 8, "suz": 5, "suza": 1, "suze": 3, "suzu": 1, "sva": 1, "sval": 1, "sve": 3, "svel": 1, "sven": 1, "svev": 1, "swa": 533, "swab": 2, "swac": 1, "swad": 16, "swag": 15, "swah": 1, "swai": 3, "swal": 146, "swam": 32, "swan": 4, "swar": 164, "swas": 5, "swat": 14, "sway": 48, "swe": 1362, "swea": 302, "swed": 27, "swee": 809, "swel": 127, "swen": 1, "swep": 74, "swer": 20, "swi": 759, "swif": 261, "swil": 1, "swim": 115, "swin": 143, "swip": 4, "swir": 15, "swis": 26, "swit": 116, "swiv": 7, "swo": 917, "swol": 20, "swoo": 25, "swor": 871, "swou": 1, "swu": 117, "swun": 111, "syb": 4, "sybe": 1, "sybi": 2, "sybs": 1, "syc": 20, "syca": 5, "sych": 3, "syco": 12, "syd": 6, "sydn": 6, "sye": 2, "syen": 2, "syl": 61, "syll": 50, "sylp": 3, "sylv": 8, "sym": 1035, "symb": 216, "syme": 2, "symi": 2, "symm": 26, "symo": 1, "symp": 269, "syn": 166, "syna": 75, "sync": 11, "synd": 14, "syne": 2, "syno": 19, "synt": 45, "syr": 182, "syra": 3, "syre": 2, "syri": 168, "syro": 1, "syrt": 1, "syru": 7, "sys": 638, "syst": 638, "syu": 1, "sze": 1, "szel": 1, "szo": 17, "szol": 17, "taa": 7, "taan": 7, "tab": 1202, "taba": 1, "tabb": 3, "tabe": 371, "tabi": 3, "tabl": 784, "tabo": 18, "tabr": 10, "tabu": 11, "tac": 144, "tach": 11, "taci": 13, "tack": 54, "tacl": 2, "tact": 49, "tad": 3, "tadm": 2, "tadp": 1, "taf": 16, "taff": 12, "taft": 3, "tag": 11, "tagg": 7, "tagu": 1, "tah": 40, "taha": 10, "tahi": 13, "taho": 5, "tahp": 8, "tahr": 1, "tahs": 2, "taht": 1, "tai": 299, "tail": 110, "tain": 18, "taip": 1, "tais": 1, "taiw": 7, "tak": 4055, "take": 1206, "taki": 435, "taks": 1, "tal": 2023, "talb": 129, "tale": 227, "tali": 16, "talk": 714, "tall": 78, "talm": 15, "talo": 4, "talu": 1, "tam": 101, "tama": 27, "tamb": 13, "tame": 16, "tami": 4, "tamm": 8, "tamo": 1, "tamp": 3, "tan": 218, "tana": 2, "tanc": 1, "tand": 3, "tane": 1, "tang": 102, "tanh": 2, "tani": 1, "tank": 28, "tann": 25, "tans": 1, "tant": 23, "tao": 10, "taoi": 9, "tap": 166, "tapd": 1, "tape": 55, "taph": 1, "tapi": 1, "tapl": 1, "tapo": 1, "tapp": 63, "tar": 402, "tara": 9, "tard": 8, "tare": 11, "targ": 83, "tarh": 1, "tari": 7, "tark": 1, "tarl": 62, "tarn": 5, "tarp": 10, "tarq": 4, "tarr": 100, "tars": 39, "tart": 41, "taru": 1, "tarz": 4, "tas": 593, "tash": 57, "task": 42, "tasm": 3, "tass": 9, "tast": 370, "tat": 98, "tati": 1, "tatl": 1, "tatn": 4, "tatr": 1, "tatt": 89, "tau": 287, "taug": 227, "taun": 34, "taur": 9, "taus": 2, "taut": 2, "tav": 22, "tave": 22, "taw": 22, "tawd": 3, "tawe": 2, "tawn": 15, "tax": 179, "taxa": 22, "taxe": 74, "taxf": 10, "taxi": 19, "taxp": 38, "tay": 78, "tayl": 78, "tch": 3, "tcha": 3, "tcu": 1, "tea": 1111, "teac": 562, "tead": 1, "teag": 1, "teah": 3, "teak": 2, "teal": 1, "team": 50, "teap": 1, "tear": 289, "teas": 30, "teat": 10, "teaz": 8, "teb": 3, "teba": 2, "tebe": 1, "tec": 396, "tech": 385, "tecu": 1, "ted": 32, "tedd": 5, "tedi": 27, "tee": 337, "teem": 27, "teen": 39, "teet": 263, "teew": 2, "tef": 1, "teh": 5, "teha": 1, "tehe": 3, "tehi": 1, "tei": 1, "tek": 23, "teke": 3, "teko": 14, "tekt": 6, "tel": 1958, "tela": 5, "tele": 256, "telh": 2, "tell": 268, "telm": 2, "telo": 1, "tem": 1171, "tema": 19, "teme": 2, "temi": 1, "temp": 1141, "ten": 1187, "tena": 65, "tenb": 1, "tenc": 1, "tend": 397, "tene": 22, "tenf": 10, "teng": 2, "tenh": 1, "teni": 2, "tenm": 2, "tenn": 57, "teno": 25, "tenp": 1, "tens": 114, "tent": 232, "tenu": 21, "teny": 4, "teo": 1, "teok": 1, "tep": 6, "tepe": 1, "tepi": 5, "ter": 1157, "tera": 19, "tere": 3, "terg": 1, "term": 334, "tern": 1, "terp": 2, "terr": 670, "ters": 7, "tert": 18, "terz": 1, "tes": 626, "tess": 8, "test": 475, "tet": 54, "teta": 1, "tete": 3, "teth": 6, "tetr": 30, "tett": 1, "teu": 3, "teut": 3, "tew": 1, "tewf": 1, "tex": 276, "texa": 100, "texe": 2, "texo": 2, "text": 101, "tge": 1, "tget": 1, "tha": 45004, "thac": 3, "thad": 4, "thah": 1, "thai": 4, "thak": 1, "thal": 2, "tham": 25, "than": 607, "thar": 8, "that": 204, "thau": 3, "thaw": 7, "thax": 3, "thay": 14, "thc": 6, "thce": 6, "the": 70010, "thea": 171, "theb": 6, "thee": 3, "thef": 24, "thei": 10558, "thel": 8, "them": 1161, "then": 262, "theo": 339, "ther": 12787, "thes": 4450, "thet": 2, "theu": 1, "thev": 1, "thew": 6, "they": 143, "thi": 24607, "thia": 1, "thib": 2, "thic": 383, "thid": 1, "thie": 152, "thig": 60, "thii": 2, "thil": 1, "thim": 13, "thin": 8495, "thio": 5, "thir": 1078, "this": 17, "thit": 170, "tho": 15322, "thog": 1, "thol": 1, "thom": 183, "thon": 3, "thor": 279, "thos": 2518, "thou": 5550, "thr": 6789, "thra": 19, "thre": 2577, "thri": 132, "thro": 3872, "thru": 170, "ths": 1, "thsu": 1, "thu": 2073, "thud": 2, "thug": 3, "thul": 1, "thum": 84, "thun": 216, "thur": 78, "thut": 1, "thw": 19, "thwa": 18, "thwu": 1, "thy": 380, "thya": 4, "thye": 1, "thyi": 1, "thyn": 4, "thyr": 75, "thys": 295, "tia": 4, "tiar": 2, "tib": 24, "tibe": 18, "tibh": 1, "tibi": 1, "tibn": 3, "tibu": 1, "tic": 72, "tick": 62, "tico": 4, "tict": 1, "tid": 178, "tida": 3, "tidb": 3, "tide": 30, "tidi": 76, "tido": 1, "tidy": 1, "tie": 165, "tiec": 1, "tief": 1, "tiei": 1, "tiek": 1, "tiep": 3, "tier": 14, "tif": 1, "tig": 206, "tiga": 2, "tige": 80, "tigh": 115, "tigl": 3, "tigr": 6, "tij": 1, "tiju": 1, "tik": 4, "tiko": 1, "tikv": 3, "til": 1222, "tilb": 1, "tild": 1, "tile": 23, "tilg": 32, "tili": 1, "till": 35, "tilo": 1, "tilt": 36, "tim": 5381, "tima": 1, "timb": 97, "time": 839, "timi": 64, "timm": 1, "timn": 21, "timo": 49, "tin": 209, "tinc": 5, "tind": 12, "tine": 2, "ting": 29, "tini": 4, "tink": 23, "tinn": 7, "tinp": 1, "tins": 3, "tint": 17, "tip": 55, "tiph": 2, "tipo": 1, "tipp": 22, "tips": 5, "tipt": 9, "tir": 266, "tira": 6, "tire": 197, "tirh": 3, "tiri": 6, "tirs": 5, "tirz": 18, "tis": 68, "tisb": 1, "tish": 6, "tiss": 58, "tist": 2, "tit": 287, "tita": 21, "titc": 1, "tite": 8, "tith": 44, "titi": 33, "titl": 146, "titr": 3, "titt": 6, "titu": 20, "tiv": 1, "tive": 1, "tiz": 2, "tiza": 1, "tizi": 1, "tja": 1, "tjaw": 1, "tjo": 1, "tjok": 1, "tla": 1, "toa": 51, "toad": 3, "toan": 1, "toas": 31, "tob": 64, "toba": 42, "tobi": 22, "toc": 3, "tocc": 1, "toch": 1, "tod": 439, "toda": 366, "todd": 2, "tode": 1, "todh": 33, "todm": 11, "toe": 43, "toet": 1, "tof": 4, "toff": 3, "tog": 1240, "toga": 5, "toge": 1232, "togg": 1, "toh": 1, "toi": 103, "toil": 64, "toj": 1, "tojo": 1, "tok": 86, "toke": 67, "toki": 1, "toky": 18, "tol": 1393, "tola": 3, "tole": 122, "toll": 30, "tols": 11, "tolu": 1, "toly": 1, "tom": 223, "toma": 34, "tomb": 27, "tome": 1, "tomf": 2, "tomk": 2, "tomm": 21, "tomo": 106, "ton": 798, "tona": 11, "tone": 50, "tong": 382, "toni": 60, "tonm": 1, "tonn": 1, "tons": 2, "too": 1891, "toob": 2, "tood": 2, "tooe": 1, "tooh": 1, "took": 18, "tool": 69, "toom": 1, "toon": 4, "toos": 2, "toot": 73, "top": 197, "topa": 6, "topc": 3, "topd": 2, "tope": 3, "topg": 4, "toph": 15, "topi": 39, "topk": 1, "topl": 3, "topm": 10, "topn": 2, "topo": 9, "topp": 22, "topq": 2, "topr": 1, "tops": 10, "topt": 2, "tor": 464, "tora": 1, "torc": 34, "tori": 8, "torm": 84, "torn": 7, "toro": 6, "torp": 10, "torq": 16, "torr": 59, "tors": 14, "tort": 72, "tos": 159, "tosc": 4, "toss": 120, "tot": 355, "tota": 335, "tote": 1, "toth": 2, "toti": 1, "tott": 9, "tou": 888, "touc": 670, "toug": 73, "touj": 1, "toul": 2, "tour": 84, "tous": 5, "tout": 1, "tow": 2329, "towa": 1401, "towb": 1, "towe": 240, "towh": 1, "towi": 14, "town": 177, "towr": 3, "tows": 2, "tox": 4, "toxi": 4, "toy": 34, "toye": 1, "toyi": 2, "toyl": 5, "toyn": 9, "tra": 3407, "trab": 1, "trac": 291, "trad": 581, "traf": 87, "trag": 139, "trai": 623, "traj": 2, "tram": 57, "tran": 1095, "trap": 47, "tras": 11, "trau": 6, "trav": 378, "traw": 1, "trax": 1, "tray": 5, "tre": 2539, "trea": 862, "treb": 21, "trec": 1, "tred": 1, "tree": 484, "tref": 1, "treg": 1, "trek": 1, "trel": 5, "trem": 321, "tren": 108, "trep": 4, "tres": 137, "trev": 29, "tri": 2073, "tria": 291, "trib": 554, "tric": 146, "trid": 4, "trie": 421, "trif": 65, "trig": 31, "trii": 4, "trik": 1, "tril": 23, "trim": 39, "trin": 20, "trio": 4, "trip": 85, "tris": 22, "trit": 4, "triu": 183, "triv": 38, "tro": 1069, "troa": 6, "trob": 1, "trod": 41, "troe": 1, "trog": 1, "troh": 1, "troi": 2, "trol": 8, "trom": 3, "troo": 128, "trop": 74, "trot": 17, "trou": 719, "trov": 2, "trow": 19, "troy": 1, "tru": 2600, "trua": 4, "truc": 128, "trud": 13, "true": 40, "trui": 5, "truj": 16, "trul": 182, "trum": 209, "trun": 79, "trus": 491, "trut": 683, "try": 291, "trya": 3, "tryi": 285, "tryp": 2, "trys": 1, "tsa": 5, "tsar": 4, "tsc": 1, "tsch": 1, "tse": 2, "tsh": 9, "tsho": 8, "tsht": 1, "tsi": 1, "tsit": 1, "tso": 1, "tsu": 22, "tsun": 22, "tsv": 1, "tsve": 1, "tta": 1, "tua": 1, "tual": 1, "tub": 120, "tuba": 10, "tube": 35, "tubi": 6, "tubo": 1, "tubu": 5, "tuc": 33, "tuck": 27, "tucs": 3, "tud": 6, "tudo": 6, "tue": 84, "tues": 84, "tuf": 18, "tuft": 11, "tug": 19, "tuga": 1, "tugg": 14, "tugo": 3, "tuh": 2, "tuhu": 2, "tui": 11, "tuil": 3, "tuit": 8, "tul": 62, "tula": 3, "tuli": 51, "tull": 3, "tuls": 1, "tult": 4, "tum": 173, "tumb": 89, "tume": 1, "tumi": 1, "tumo": 26, "tumu": 56, "tun": 136, "tunb": 2, "tune": 34, "tung": 4, "tuni": 15, "tunn": 24, "tuo": 1, "tuoh": 1, "tup": 3, "tupm": 2, "tupp": 1, "tur": 3261, "tura": 1, "turb": 48, "turc": 1, "ture": 1, "turf": 2, "turi": 3, "turk": 53, "turm": 13, "turn": 2160, "turp": 6, "turq": 4, "turr": 13, "turt": 95, "turv": 2, "tus": 31, "tusc": 6, "tush": 1, "tusi": 1, "tusk": 11, "tuss": 8, "tut": 30, "tute": 1, "tuto": 20, "tutt": 9, "tux": 6, "tuxa": 5, "tuxe": 1, "twa": 67, "twai": 37, "twan": 1, "twe": 1148, "twea": 1, "twee": 20, "twel": 380, "twen": 731, "twer": 14, "twi": 607, "twic": 196, "twig": 19, "twil": 78, "twin": 110, "twir": 15, "twis": 126, "twit": 30, "twix": 8, "two": 126, "twoa": 1, "twob": 5, "twoc": 4, "twod": 11, "twoe": 2, "twof": 10, "twog": 1, "twoh": 5, "twoi": 2, "twol": 2, "twom": 1, "twon": 1, "twop": 18, "twor": 4, "twos": 16, "twot": 18, "twou": 4, "twov": 1, "twow": 3, "twoy": 6, "tyb": 6, "tybe": 5, "tybu": 1, "tyc": 6, "tych": 5, "tyco": 1, "tyd": 4, "tydi": 4, "tye": 2, "tyer": 1, "tyg": 1, "tyga": 1, "tyi": 10, "tyin": 10, "tyl": 3, "tyla": 1, "tyle": 2, "tym": 7, "tymp": 5, "typ": 509, "type": 148, "typh": 19, "typi": 111, "typo": 5, "tyr": 161, "tyra": 91, "tyre": 1, "tyro": 6, "tyrr": 1, "tyru": 22, "tys": 1, "tyso": 1, "tyt": 1, "tyth": 1, "ube": 1, "uber": 1, "ubi": 5, "ubiq": 5, "uca": 1, "ucl": 1, "uda": 7, "udal": 7, "udd": 1, "udde": 1, "udo": 1, "ugl": 70, "ugli": 19, "uhh": 9, "uhhu": 5, "uhl": 1, "uhle": 1, "uhu": 1, "ukr": 4, "ukra": 4, "ula": 9, "ulan": 3, "ulb": 2, "ulbr": 2, "ulc": 11, "ulce": 11, "ull": 3, "ullm": 1, "ullo": 1, "ult": 157, "ulti": 113, "ultr": 44, "uly": 17, "ulya": 15, "ulys": 2, "umb": 39, "umbe": 5, "umbi": 1, "umbr": 33, "umc": 3, "umci": 3, "umm": 1, "umma": 1, "ump": 4, "umpi": 4, "ums": 1, "umsc": 1, "una": 433, "unab": 104, "unac": 71, "unad": 20, "unaf": 25, "unag": 3, "unai": 6, "unal": 15, "unam": 13, "unan": 52, "unap": 13, "unar": 8, "unas": 14, "unat": 18, "unau": 3, "unav": 29, "unaw": 38, "unb": 175, "unba": 16, "unbe": 67, "unbi": 10, "unbl": 15, "unbo": 34, "unbr": 23, "unbu": 10, "unc": 1146, "unca": 18, "unce": 114, "unch": 48, "unci": 73, "unck": 1, "uncl": 456, "unco": 403, "uncr": 14, "unct": 15, "uncu": 4, "und": 3837, "unda": 14, "unde": 3576, "undi": 65, "undo": 91, "undr": 28, "undu": 47, "undy": 6, "une": 339, "unea": 109, "unec": 4, "uned": 3, "unem": 33, "unen": 23, "uneq": 35, "uner": 11, "unes": 3, "unev": 11, "unex": 107, "unf": 459, "unfa": 95, "unfe": 46, "unfi": 31, "unfl": 10, "unfo": 229, "unfr": 31, "unfu": 12, "ung": 114, "unga": 10, "unge": 9, "ungi": 1, "ungl": 3, "ungo": 45, "ungr": 39, "ungu": 7, "unh": 208, "unha": 136, "unhe": 40, "unhi": 10, "unho": 13, "unhu": 9, "uni": 2111, "unic": 20, "unid": 3, "unif": 206, "unil": 5, "unim": 50, "unin": 67, "unio": 252, "uniq": 84, "unis": 7, "unit": 761, "univ": 552, "unj": 73, "unja": 1, "unju": 72, "unk": 220, "unke": 3, "unki": 27, "unkn": 190, "unl": 556, "unla": 15, "unle": 297, "unli": 139, "unlo": 77, "unlu": 28, "unm": 150, "unma": 48, "unme": 25, "unmi": 44, "unmo": 30, "unmu": 3, "unn": 156, "unna": 68, "unne": 67, "unnn": 1, "unno": 13, "unnu": 4, "uno": 69, "unob": 38, "unoc": 7, "unof": 7, "unop": 4, "unor": 9, "unos": 2, "unou": 1, "unp": 272, "unpa": 48, "unpe": 25, "unph": 1, "unpi": 7, "unpl": 67, "unpo": 18, "unpr": 88, "unpu": 18, "unq": 46, "unqu": 46, "unr": 281, "unra": 1, "unre": 212, "unri": 46, "unro": 10, "unru": 12, "uns": 483, "unsa": 41, "unsc": 23, "unse": 119, "unsh": 31, "unsi": 14, "unsk": 6, "unsl": 5, "unsm": 6, "unso": 30, "unsp": 51, "unst": 61, "unsu": 90, "unsw": 2, "unsy": 4, "unt": 10173, "unta": 17, "untc": 1, "unte": 15, "unth": 21, "unti": 1000, "unto": 41, "untr": 40, "untu": 5, "untw": 4, "unty": 3, "unu": 139, "unus": 133, "unut": 6, "unv": 20, "unva": 6, "unve": 9, "unvi": 4, "unvo": 1, "unw": 268, "unwa": 39, "unwe": 57, "unwh": 9, "unwi": 103, "unwo": 53, "unwr": 7, "uny": 2, "unyi": 2, "uom": 1, "uomi": 1, "upa": 1, "upan": 1, "upb": 16, "upbe": 1, "upbo": 3, "upbr": 11, "upbu": 1, "upc": 2, "upca": 1, "upco": 1, "upd": 4, "upda": 4, "upg": 7, "upgr": 7, "uph": 66, "upha": 4, "uphe": 24, "uphi": 3, "upho": 35, "upj": 1, "upju": 1, "upk": 6, "upke": 6, "upl": 39, "upla": 13, "upli": 26, "upo": 5082, "upp": 278, "uppe": 274, "uppo": 3, "upr": 211, "upra": 4, "upre": 1, "upri": 178, "upro": 28, "ups": 132, "upse": 34, "upsh": 2, "upsi": 21, "upso": 1, "upsp": 3, "upst": 66, "upsu": 3, "upsw": 2, "upt": 46, "upta": 5, "upto": 27, "uptr": 1, "uptu": 13, "upw": 156, "upwa": 155, "upwh": 1, "ura": 11, "uran": 11, "urb": 65, "urba": 65, "urc": 3, "urch": 3, "ure": 31, "urem": 1, "uret": 29, "urg": 223, "urge": 145, "urgi": 25, "uri": 67, "uria": 29, "uric": 1, "urie": 14, "urij": 11, "urin": 4, "urn": 4, "urs": 1, "ursu": 1, "uru": 1, "urug": 1, "usa": 51, "usab": 8, "usag": 43, "use": 1219, "usea": 2, "usef": 139, "usel": 60, "user": 9, "uses": 2, "uset": 7, "usg": 1, "ush": 49, "ushe": 49, "usi": 177, "usin": 176, "uso": 1, "usq": 1, "usqu": 1, "uss": 13, "usso": 1, "ussr": 1, "usu": 579, "usua": 535, "usur": 44, "uta": 8, "ute": 6, "uten": 6, "uth": 3, "utha": 2, "uthe": 1, "uti": 91, "util": 91, "utm": 104, "utmo": 104, "uto": 54, "utoa": 2, "utop": 52, "utt": 412, "utte": 410, "utto": 1, "uttu": 1, "uxb": 2, "uxbr": 2, "uxo": 1, "uxor": 1, "uza": 3, "uzz": 73, "uzza": 4, "uzze": 1, "uzzi": 47, "vac": 177, "vaca": 132, "vacc": 4, "vach": 1, "vaci": 1, "vacu": 39, "vad": 4, "vadi": 1, "vads": 1, "vag": 148, "vaga": 16, "vagi": 17, "vagr": 4, "vagu": 111, "vai": 369, "vail": 1, "vain": 20, "vaj": 1, "vaje": 1, "val": 1216, "vald": 1, "vale": 36, "vali": 114, "vall": 322, "valm": 1, "valo": 68, "valp": 2, "valu": 633, "valv": 13, "vam": 6, "vamp": 5, "van": 330, "vanc": 3, "vand": 10, "vang": 4, "vani": 256, "vanq": 13, "vant": 12, "vap": 77, "vapo": 77, "vaq": 2, "vaqu": 2, "var": 809, "vara": 2, "vari": 690, "varl": 6, "varm": 2, "varn": 11, "varr": 3, "varv": 1, "vary": 56, "vas": 321, "vasa": 1, "vasc": 4, "vase": 13, "vash": 11, "vasi": 1, "vask": 1, "vaso": 2, "vass": 4, "vast": 29, "vat": 9, "vati": 5, "vatt": 1, "vau": 65, "vaud": 6, "vaug": 5, "vaul": 37, "vaun": 17, "vbi": 1, "vbiq": 1, "vea": 3, "veb": 1, "vebl": 1, "vec": 38, "vecc": 8, "vect": 30, "ved": 5, "veda": 4, "vee": 14, "veec": 1, "veer": 10, "veg": 59, "vega": 5, "vege": 54, "veh": 136, "vehe": 35, "vehi": 101, "vei": 127, "veil": 17, "vein": 29, "vel": 76, "vela": 2, "veld": 1, "vell": 1, "velo": 48, "velv": 24, "ven": 430, "vena": 1, "vend": 12, "vene": 68, "veng": 100, "veni": 25, "veno": 14, "vent": 175, "venu": 14, "ver": 5555, "vera": 22, "verb": 54, "verd": 51, "verg": 11, "veri": 198, "verl": 3, "verm": 51, "vern": 42, "vero": 1, "verp": 1, "verr": 6, "vers": 188, "vert": 96, "verv": 5, "ves": 413, "vesi": 1, "veso": 5, "vesp": 2, "vess": 343, "vest": 35, "vesu": 18, "vet": 78, "vete": 67, "veto": 1, "vev": 1, "veva": 1, "vex": 98, "vexa": 36, "vexe": 58, "vexi": 3, "vey": 2, "veyl": 1, "vgl": 1, "via": 39, "viab": 8, "vial": 10, "vian": 1, "viar": 1, "viat": 1, "vib": 43, "vibe": 1, "vibr": 42, "vic": 533, "vica": 32, "vice": 35, "vich": 1, "vici": 64, "vick": 10, "vico": 1, "vict": 324, "vid": 9, "vida": 2, "vide": 3, "vido": 1, "vie": 621, "viel": 1, "vien": 35, "viet": 12, "vieu": 2, "view": 193, "vig": 147, "vigi": 40, "vign": 2, "vigo": 104, "vigr": 1, "vii": 13, "viii": 1, "vik": 4, "viki": 3, "viku": 1, "vil": 506, "vila": 1, "vild": 6, "vile": 3, "vili": 2, "vill": 444, "vin": 387, "vinc": 35, "vind": 27, "vine": 222, "vinn": 1, "vino": 1, "vins": 1, "vint": 18, "viny": 4, "vio": 491, "vioi": 1, "viol": 487, "vip": 10, "vipe": 9, "viph": 1, "vir": 533, "vird": 2, "vire": 1, "virg": 268, "viri": 11, "virs": 1, "virt": 231, "viru": 19, "vis": 1257, "visa": 36, "visc": 35, "vise": 1, "vish": 9, "visi": 1090, "viso": 2, "visr": 1, "vist": 20, "visu": 57, "vit": 164, "vita": 142, "viti": 4, "vitr": 8, "vitt": 2, "vitu": 2, "viv": 112, "viva": 26, "vive": 1, "vivi": 79, "viy": 1, "viye": 1, "viz": 2, "viza": 2, "vla": 1, "vlad": 1, "vlc": 2, "vlce": 2, "vna": 4, "vnac": 2, "vnas": 1, "vnat": 1, "vnb": 9, "vnba": 3, "vnbe": 2, "vnbo": 1, "vnbr": 3, "vnc": 10, "vnch": 1, "vnck": 3, "vncl": 3, "vnct": 2, "vncu": 1, "vnd": 52, "vnda": 1, "vnde": 44, "vndi": 2, "vndo": 5, "vne": 2, "vnef": 1, "vneq": 1, "vnf": 14, "vnfe": 1, "vnfi": 3, "vnfl": 1, "vnfo": 9, "vng": 7, "vnga": 2, "vnge": 2, "vngo": 1, "vngr": 1, "vngu": 1, "vnh": 5, "vnha": 3, "vnho": 2, "vni": 10, "vnic": 1, "vnim": 1, "vnio": 2, "vnit": 2, "vniu": 4, "vnk": 19, "vnke": 1, "vnki": 5, "vnkl": 7, "vnkn": 6, "vnl": 9, "vnle": 5, "vnli": 2, "vnlo": 1, "vnlu": 1, "vnm": 10, "vnma": 8, "vnme": 1, "vnmi": 1, "vnn": 10, "vnna": 8, "vnne": 1, "vnnu": 1, "vnp": 10, "vnpa": 1, "vnpe": 1, "vnpo": 1, "vnpr": 6, "vnpu": 1, "vnr": 7, "vnre": 2, "vnri": 2, "vnru": 3, "vns": 22, "vnsa": 4, "vnsc": 2, "vnse": 6, "vnsh": 4, "vnsi": 2, "vnsk": 1, "vnsm": 1, "vnsp": 1, "vnsu": 1, "vnt": 33, "vnti": 7, "vnto": 1, "vntr": 1, "vnty": 2, "vnu": 2, "vnua": 1, "vnus": 1, "vnw": 8, "vnwa": 1, "vnwe": 2, "vnwh": 1, "vnwi": 2, "vnwo": 2, "vny": 1, "vnyo": 1, "voc": 157, "voca": 148, "voci": 8, "voe": 2, "voeg": 2, "vog": 6, "vogu": 6, "voi": 1717, "voic": 1657, "void": 6, "voit": 1, "vol": 488, "vola": 10, "volc": 16, "vole": 1, "volg": 1, "voli": 11, "volk": 4, "voll": 21, "voln": 1, "volp": 1, "vols": 2, "volt": 49, "volu": 367, "vom": 20, "vomi": 20, "von": 2, "vonn": 2, "voo": 6, "vood": 5, "voor": 1, "vop": 2, "voph": 1, "vopo": 1, "vor": 12, "vora": 7, "voro": 1, "vort": 4, "vos": 1, "vosg": 1, "vot": 215, "vote": 80, "voti": 33, "vou": 52, "vouc": 46, "voui": 1, "voul": 1, "voum": 1, "vow": 98, "vowe": 53, "vowi": 3, "voy": 222, "voya": 202, "voyc": 19, "vpb": 1, "vpbr": 1, "vpl": 1, "vpli": 1, "vpm": 1, "vpmo": 1, "vpo": 162, "vpp": 4, "vppe": 1, "vppo": 2, "vpr": 1, "vpro": 1, "vps": 2, "vpsh": 1, "vpsp": 1, "vpw": 3, "vpwa": 3, "vra": 1, "vrg": 3, "vri": 2, "vril": 1, "vrin": 1, "vro": 1, "vrom": 1, "vse": 4, "vset": 1, "vsh": 4, "vsha": 4, "vsi": 1, "vsin": 1, "vsu": 5, "vsua": 2, "vsur": 3, "vtm": 1, "vtmo": 1, "vto": 2, "vtt": 10, "vtte": 10, "vuh": 1, "vuhr": 1, "vul": 94, "vulc": 2, "vulg": 48, "vuln": 22, "vulp": 1, "vult": 21, "vuo": 1, "vyi": 4, "vyin": 4, "waa": 1, "waal": 1, "wab": 5, "waba": 5, "wac": 11, "wach": 1, "wack": 4, "wad": 49, "wadd": 19, "wade": 14, "wadi": 7, "waf": 37, "wafe": 9, "waff": 2, "waft": 24, "wag": 320, "wage": 106, "wagg": 23, "wagi": 1, "wagn": 34, "wago": 97, "wah": 3, "wahs": 2, "waht": 1, "wai": 1106, "waif": 4, "waig": 1, "wail": 46, "wain": 6, "wais": 75, "wait": 565, "waiv": 6, "wak": 214, "wake": 82, "waki": 39, "wal": 2755, "walb": 1, "walc": 1, "wald": 5, "wale": 19, "walf": 2, "wali": 5, "walk": 991, "wall": 348, "waln": 24, "walp": 1, "walr": 9, "wals": 3, "walt": 212, "wam": 1, "wamp": 1, "wan": 1900, "wand": 197, "wane": 6, "wang": 4, "wani": 10, "wann": 5, "wans": 2, "want": 787, "wap": 3, "wapp": 3, "war": 1292, "warb": 27, "ward": 55, "ware": 23, "warf": 55, "warh": 2, "wari": 4, "warl": 34, "warm": 219, "warn": 148, "warp": 12, "warr": 204, "wars": 15, "wart": 15, "warw": 22, "wary": 1, "was": 1172, "wash": 436, "wasn": 154, "wasp": 6, "wass": 3, "wast": 272, "wat": 2791, "watc": 785, "wate": 1937, "wath": 1, "watl": 1, "watr": 2, "wats": 58, "watt": 5, "wau": 5, "waue": 3, "waui": 2, "wav": 471, "wave": 299, "wavi": 50, "wavy": 1, "wax": 76, "waxe": 65, "waxi": 3, "waxw": 3, "way": 487, "waye": 7, "wayf": 6, "wayl": 2, "waym": 2, "wayn": 12, "wayo": 1, "ways": 9, "wayt": 1, "wayw": 8, "wba": 3, "wea": 1393, "weak": 180, "weal": 142, "wean": 15, "weap": 213, "wear": 301, "weas": 7, "weat": 223, "weav": 68, "weaz": 3, "web": 20, "webb": 2, "webe": 2, "webs": 12, "wec": 1, "wech": 1, "wed": 170, "wedd": 93, "wedg": 27, "wedl": 4, "wedn": 46, "wee": 1036, "weed": 46, "week": 329, "weem": 1, "ween": 6, "weep": 109, "weg": 1, "wege": 1, "wei": 383, "weid": 7, "weig": 346, "wein": 4, "weir": 20, "weis": 3, "wel": 4028, "welb": 1, "welc": 267, "weld": 24, "welf": 70, "welk": 1, "well": 169, "welm": 1, "wels": 8, "welt": 9, "wem": 2, "wemm": 2, "wen": 3070, "wenc": 2, "wend": 16, "went": 235, "wep": 108, "wer": 10273, "were": 28, "werg": 1, "wern": 6, "wert": 3, "wes": 1213, "wese": 1, "wesk": 4, "wesl": 6, "wess": 1, "west": 787, "wet": 12, "wetl": 2, "wetn": 1, "wett": 9, "weu": 1, "weun": 1, "wev": 34, "wex": 6, "wexl": 6, "wey": 25, "weya": 3, "weyb": 1, "weym": 18, "weyw": 3, "wha": 10170, "whac": 3, "whad": 2, "whal": 1839, "whan": 2, "whar": 46, "what": 574, "whe": 14470, "whea": 95, "whee": 408, "whel": 26, "when": 325, "wher": 4044, "whet": 895, "wheu": 4, "whi": 16640, "whic": 12354, "whif": 8, "whig": 6, "whil": 2033, "whim": 20, "whin": 20, "whip": 62, "whir": 125, "whis": 397, "whit": 1512, "whiz": 9, "who": 4578, "whod": 1, "whoe": 82, "whol": 1437, "whom": 22, "whoo": 8, "whop": 2, "whor": 105, "whos": 1317, "why": 3, "whyf": 1, "whyn": 1, "wic": 630, "wich": 1, "wick": 624, "wid": 673, "widd": 2, "wide": 166, "wido": 168, "wids": 1, "widt": 26, "wie": 23, "wied": 1, "wiel": 20, "wien": 2, "wif": 1000, "wife": 17, "wig": 28, "wigg": 6, "wigh": 9, "wigl": 1, "wigm": 2, "wigw": 10, "wil": 11764, "wilb": 2, "wilc": 3, "wild": 460, "wile": 18, "wilf": 23, "wilh": 7, "wili": 2, "wilk": 31, "will": 848, "wilm": 10, "wils": 81, "wilt": 3, "wim": 8, "wimp": 7, "wims": 1, "win": 2581, "winc": 29, "wind": 915, "wine": 55, "winf": 1, "wing": 231, "wink": 32, "winl": 2, "winn": 78, "wino": 5, "wins": 59, "wint": 252, "wip": 80, "wipe": 37, "wipi": 16, "wir": 91, "wire": 31, "wiri": 2, "wis": 1942, "wisc": 25, "wisd": 332, "wise": 103, "wish": 415, "wism": 15, "wisp": 5, "wiss": 1, "wist": 17, "wit": 28877, "witc": 49, "with": 3513, "witl": 2, "witn": 351, "wito": 1, "witt": 43, "wiu": 2, "wiue": 2, "wiv": 179, "wive": 179, "wiz": 14, "wiza": 14, "wli": 1, "wob": 10, "wobb": 9, "wobu": 1, "woe": 22, "woeb": 3, "woef": 8, "wof": 2, "wofu": 2, "woh": 4, "woha": 3, "wok": 30, "woke": 2, "wol": 89, "wolc": 2, "wold": 1, "wolf": 21, "woll": 5, "wolp": 2, "wols": 1, "wolu": 1, "wolv": 24, "wom": 1967, "woma": 1233, "womb": 6, "wome": 631, "won": 1097, "wond": 938, "wonl": 1, "wonn": 2, "wons": 1, "wont": 12, "woo": 1196, "wood": 694, "wooe": 3, "wooi": 2, "wool": 38, "woom": 1, "woon": 5, "wooo": 1, "wop": 1, "wor": 9833, "wora": 3, "worc": 7, "word": 1353, "work": 1330, "worl": 2205, "worm": 62, "worn": 5, "worr": 136, "wors": 766, "wort": 492, "wot": 1, "wott": 1, "wou": 7279, "woul": 7006, "woun": 273, "wov": 34, "wove": 27, "woz": 1, "wozz": 1, "wra": 392, "wrac": 10, "wrag": 1, "wrai": 2, "wran": 11, "wrap": 93, "wrat": 261, "wre": 304, "wrea": 47, "wrec": 78, "wreg": 5, "wren": 24, "wres": 38, "wret": 107, "wri": 1596, "wrig": 74, "wrin": 88, "wris": 49, "writ": 1365, "wro": 959, "wron": 443, "wrot": 376, "wrou": 140, "wru": 9, "wrun": 9, "wry": 4, "wryf": 1, "wryl": 3, "wus": 1, "wust": 1, "wwr": 2, "wwrl": 1, "wya": 3, "wyat": 3, "wyc": 5, "wyck": 1, "wycl": 1, "wyco": 3, "wyl": 2, "wyli": 2, "wym": 1, "wyma": 1, "wyn": 5, "wynd": 2, "wynn": 1, "wyns": 1, "wyo": 10, "wyom": 10, "xav": 2, "xavi": 2, "xen": 4, "xeni": 1, "xeno": 3, "xer": 3, "xerx": 3, "xgy": 2, "xgyr": 2, "xii": 7, "xim": 1, "xime": 1, "xra": 20, "xray": 6, "xre": 7, "xreg": 4, "xrel": 2, "xres": 1, "xtr": 1, "xtru": 1, "xvi": 12, "xvii": 6, "xxi": 6, "xxii": 2, "xxv": 3, "xxvi": 2, "xxx": 6, "xxxi": 4, "xyd": 6, "xydi": 6, "xyl": 5, "xyle": 4, "xylo": 1, "yac": 34, "yach": 34, "yad": 1, "yadd": 1, "yah": 1, "yahw": 1, "yak": 3, "yaki": 1, "yako": 1, "yal": 37, "yala": 1, "yale": 2, "yali": 1, "yalt": 14, "yam": 2, "yama": 2, "yan": 106, "yanc": 2, "yand": 2, "yank": 83, "yap": 1, "yapp": 1, "yaq": 1, "yaqu": 1, "yar": 308, "yard": 145, "yarm": 10, "yarn": 11, "yarr": 4, "yas": 2, "yase": 1, "yass": 1, "yau": 1, "yaug": 1, "yaw": 39, "yawe": 1, "yawi": 2, "yawn": 26, "yce": 4, "ycel": 4, "yea": 3498, "yean": 1, "year": 2163, "yeas": 7, "yeat": 1, "yed": 1, "yedi": 1, "yee": 16, "yeel": 11, "yeer": 2, "yeh": 3, "yehh": 2, "yehu": 1, "yel": 296, "yell": 267, "yelp": 3, "yen": 1, "yeo": 4, "yeom": 4, "yer": 2, "yes": 225, "yesi": 1, "yest": 224, "ygg": 1, "yggl": 1, "ygy": 1, "ygyr": 1, "yia": 1, "yian": 1, "yid": 4, "yidd": 4, "yie": 215, "yiel": 215, "yin": 3, "ying": 1, "yiny": 2, "ykn": 2, "ykno": 2, "ymc": 2, "ymh": 1, "ync": 1, "yoa": 4, "yoak": 4, "yod": 3, "yode": 3, "yog": 3, "yoj": 17, "yok": 100, "yoke": 15, "yoki": 1, "yokn": 2, "yoko": 3, "yoku": 7, "yol": 1, "yon": 85, "yond": 52, "yone": 2, "yong": 2, "yonk": 1, "yonn": 4, "yoo": 2, "yooe": 1, "yoor": 1, "yor": 352, "yori": 2, "york": 34, "yos": 7, "yose": 6, "yosh": 1, "you": 9271, "youl": 90, "youn": 1753, "your": 927, "yout": 346, "youu": 1, "youv": 67, "yre": 3, "yreg": 3, "yte": 1, "ytee": 1, "yub": 2, "yuc": 2, "yuca": 1, "yucc": 1, "yug": 12, "yugo": 12, "yuj": 1, "yujo": 1, "yuk": 1, "yum": 1, "yumy": 1, "yur": 7, "yuro": 1, "yus": 1, "yve": 2, "yvet": 2, "ywc": 1, "yyy": 1, "zaa": 4, "zaan": 3, "zaav": 1, "zab": 24, "zaba": 8, "zabb": 3, "zabd": 8, "zabe": 1, "zabu": 4, "zac": 32, "zacc": 14, "zach": 18, "zad": 54, "zade": 1, "zado": 53, "zah": 1, "zaha": 1, "zai": 1, "zal": 18, "zala": 2, "zalm": 16, "zam": 2, "zami": 1, "zamz": 1, "zan": 6, "zano": 5, "zanz": 1, "zap": 4, "zapa": 1, "zaph": 2, "zapo": 1, "zar": 22, "zara": 2, "zare": 8, "zarh": 6, "zaro": 1, "zart": 2, "zat": 4, "zatt": 4, "zav": 1, "zava": 1, "zax": 1, "zaxi": 1, "zaz": 1, "zea": 89, "zeal": 38, "zeb": 100, "zeba": 23, "zebe": 13, "zebi": 1, "zebo": 7, "zebr": 1, "zebu": 55, "zec": 40, "zech": 40, "zed": 64, "zeda": 2, "zede": 62, "zee": 6, "zef": 1, "zeff": 1, "zei": 4, "zeis": 3, "zeit": 1, "zel": 33, "zela": 2, "zele": 2, "zeli": 15, "zelo": 13, "zelz": 1, "zem": 9, "zema": 4, "zemi": 1, "zeml": 3, "zen": 14, "zena": 2, "zend": 3, "zeni": 8, "zenn": 1, "zep": 26, "zeph": 26, "zer": 115, "zera": 24, "zere": 11, "zero": 6, "zeru": 49, "zes": 5, "zet": 4, "zeth": 4, "zeu": 2, "zeug": 1, "zgy": 1, "zgyr": 1, "zhi": 2, "zhit": 2, "zho": 1, "zib": 27, "zibe": 8, "zibi": 3, "zic": 12, "zich": 12, "zid": 33, "zidd": 1, "zidk": 1, "zido": 31, "zie": 2, "zieg": 2, "zif": 2, "ziff": 2, "zig": 7, "zigg": 1, "zigz": 6, "zih": 3, "zik": 15, "zikl": 15, "zil": 12, "zill": 3, "zilp": 7, "zilt": 2, "zim": 24, "zimi": 1, "zimm": 6, "zimr": 17, "zin": 22, "zing": 1, "zinm": 1, "zio": 162, "zion": 2, "zip": 27, "ziph": 5, "zipp": 12, "zir": 1, "zira": 1, "zit": 1, "zith": 1, "ziz": 3, "ziza": 1, "zlo": 1, "zlot": 1, "zmi": 1, "zmit": 1, "zoa": 17, "zob": 14, "zoba": 11, "zobe": 1, "zod": 10, "zodi": 10, "zoe": 2, "zoet": 2, "zog": 1, "zogr": 1, "zoh": 6, "zoha": 4, "zohe": 2, "zol": 1, "zola": 1, "zom": 2, "zomb": 2, "zon": 41, "zone": 14, "zoni": 6, "zoo": 14, "zooe": 1, "zook": 1, "zool": 8, "zoom": 3, "zooo": 1, "zop": 9, "zoph": 9, "zor": 16, "zora": 9, "zore": 1, "zori": 1, "zoro": 4, "zorr": 1, "zou": 2, "zoun": 2, "zua": 5, "zub": 2, "zubk": 2, "zum": 1, "zump": 1, "zup": 3, "zur": 10, "zurc": 2, "zuri": 8, "zuy": 1, "zuyd": 1, "zuz": 1, "zuzi": 1, "zwe": 1, "zwo": 2, "zwor": 2}, {}]
-             ''')
@@ -1,7 +0,0 @@
-import json
-
-def syllables():
-    """Short pronouncable fragments like wump, wroth, or wynd."""
-    return json.loads('''
-        {"a": 76299, "aa": 1, "aaa": 1, "aaaee": 1, "aaaw": 1, "aab": 2, "aac": 145, "aacs": 3, "aah": 1, "aajk": 1, "aan": 175, "aanah": 5, "aaron": 359, "aaroni": 2, "aau": 1, "aaus": 1, "ab": 2112, "aba": 44, "aback": 5, "abad": 1, "abaft": 2, "abagt": 1, "aban": 65, "abando": 8, "abandon": 15, "abas": 9, "abash": 1, "abc": 2, "abe": 4, "abeam": 1, "abed": 19, "abel": 46, "abell": 1, "abels": 1, "aber": 18, "abet": 4, "abeyan": 6, "abez": 1, "abi": 471, "abia": 4, "abiah": 4, "abias": 1, "abib": 6, "abie": 7, "abiel": 3, "abiez": 3, "abij": 25, "abis": 39, "able": 256, "ables": 1, "ably": 17, "abo": 1214, "aboard": 54, "abombs": 1, "aboord": 3, "abor": 17, "aboue": 10, "aboun": 27, "abound": 26, "abounds": 2, "about": 4412, "abr": 1, "abra": 269, "abram": 61, "abrams": 1, "abre": 11, "abrid": 6, "abridg": 2, "abro": 1, "abroa": 1, "abroad": 175, "absten": 5, "abu": 59, "abun": 166, "abus": 1, "abut": 1, "aby": 6, "abys": 3, "abyss": 27, "ac": 6116, "aca": 109, "acan": 1, "accou": 2, "accout": 4, "ace": 30, "acel": 1, "acer": 1, "aces": 4, "acey": 3, "ach": 379, "achaeans": 2, "achai": 1, "achaia": 11, "achan": 6, "achar": 1, "achaz": 2, "ache": 19, "ached": 4, "aches": 9, "achie": 245, "achiev": 2, "achil": 6, "achim": 2, "aching": 16, "achings": 1, "achish": 21, "achor": 5, "achs": 3, "aci": 2, "acid": 15, "acids": 7, "ack": 182, "acks": 1, "aco": 3, "acon": 1, "acorn": 14, "acorns": 2, "acour": 1, "acous": 6, "acrid": 4, "acro": 13, "acros": 2, "across": 520, "acry": 11, "acs": 13, "act": 496, "acth": 1, "acts": 130, "acu": 32, "acus": 1, "ad": 4114, "ada": 56, "adadah": 1, "adah": 8, "adai": 10, "adair": 3, "adairs": 1, "adalia": 1, "adam": 193, "adams": 48, "adamss": 1, "adap": 28, "adapt": 7, "adapta": 18, "adar": 10, "adas": 4, "adc": 8, "add": 179, "addle": 1, "addled": 1, "ade": 114, "adelp": 2, "adept": 4, "ader": 2, "ades": 1, "adi": 47, "adin": 4, "adjoi": 33, "adjoins": 2, "adm": 1, "adn": 1, "ado": 155, "adolf": 4, "adolp": 1, "adop": 95, "adopt": 28, "adopts": 2, "ador": 29, "adorn": 13, "adorns": 2, "adown": 1, "adra": 1, "adram": 3, "adrar": 1, "adre": 3, "adreno": 1, "adri": 9, "adria": 2, "adriel": 2, "adrien": 2, "adrift": 8, "adrin": 1, "adroit": 4, "adroop": 2, "ads": 32, "adth": 121, "adu": 13, "adue": 5, "adui": 3, "adul": 95, "adult": 31, "adults": 23, "adum": 2, "adust": 1, "ae": 125, "aec": 2, "aecs": 1, "ael": 6, "aes": 35, "aet": 1, "af": 7613, "afar": 73, "afear": 1, "afeard": 1, "afer": 1, "aff": 4, "afi": 1, "afield": 1, "afo": 43, "afoam": 1, "afri": 1, "aft": 40, "ag": 226, "aga": 14, "agag": 8, "agai": 74, "again": 2699, "against": 2945, "againsts": 1, "agant": 1, "agar": 2, "agas": 1, "agat": 2, "agay": 1, "age": 461, "aged": 62, "agee": 2, "agen": 73, "agent": 78, "agents": 49, "ageold": 5, "ages": 150, "agh": 4, "agi": 43, "agin": 3, "aging": 4, "agita": 65, "ago": 519, "agoeng": 1, "agra": 11, "agree": 471, "agreed": 166, "agrees": 17, "agreeth": 2, "agri": 70, "agrip": 13, "agro": 1, "aground": 2, "ags": 2, "ague": 6, "ah": 935, "aha": 91, "ahab": 605, "ahabs": 1, "ahah": 2, "ahan": 1, "ahar": 1, "ahas": 1, "ahaz": 44, "ahead": 168, "ahem": 2, "aher": 1, "ahi": 81, "ahiah": 4, "ahie": 6, "ahij": 20, "ahikam": 20, "ahio": 6, "ahis": 2, "ahit": 20, "ahm": 1, "ahmi": 1, "aho": 30, "ahold": 2, "ahoy": 9, "ahr": 5, "ahu": 2, "ahuz": 1, "ai": 225, "aia": 11, "aid": 176, "aids": 29, "aij": 7, "aija": 1, "ail": 16, "ails": 2, "aim": 70, "aims": 22, "ain": 40, "ains": 1, "ainsley": 1, "aint": 51, "air": 1046, "airs": 29, "airth": 2, "airy": 20, "ais": 12, "aj": 118, "aja": 4, "ajah": 1, "ajar": 5, "ajax": 1, "ajb": 1, "ak": 69, "akan": 1, "akc": 1, "ake": 2, "akers": 1, "aki": 1, "akim": 1, "akin": 16, "akrab": 2, "akron": 1, "akrooms": 1, "aks": 1, "aku": 1, "al": 19480, "ala": 99, "alaaris": 1, "alac": 4, "alack": 2, "alad": 3, "aladu": 1, "alah": 2, "alai": 1, "alain": 1, "alam": 14, "alan": 7, "alana": 1, "alang": 1, "alap": 1, "alar": 78, "alarm": 92, "alarms": 6, "alas": 121, "alb": 8, "albs": 1, "ale": 35, "aleak": 1, "alec": 25, "aleck": 2, "alecs": 5, "alei": 1, "alem": 1, "alep": 2, "aler": 8, "alert": 58, "ales": 5, "alex": 30, "alexan": 76, "alexei": 1, "alexey": 1, "alexis": 2, "alexs": 10, "alf": 2, "alfront": 1, "alhr": 1, "ali": 796, "alia": 1, "aliah": 2, "alie": 47, "alien": 34, "aliens": 8, "alig": 7, "aligh": 9, "alight": 5, "alights": 2, "align": 7, "alijs": 1, "alix": 2, "alixs": 1, "alk": 1, "all": 16928, "allg": 1, "alls": 98, "allso": 1, "alm": 42, "alms": 26, "alo": 694, "aloes": 7, "aloft": 87, "alokut": 1, "alone": 2, "along": 808, "alongsi": 44, "aloof": 15, "aloofe": 2, "alors": 2, "aloth": 1, "alou": 71, "alous": 62, "alow": 3, "alowd": 1, "alp": 35, "alps": 7, "als": 541, "alsing": 1, "alt": 377, "alta": 2, "alth": 276, "alu": 18, "alum": 11, "alun": 1, "alus": 3, "alush": 2, "am": 4245, "ama": 356, "amad": 1, "amain": 6, "amal": 4, "amam": 1, "amas": 2, "amass": 2, "amaz": 4, "amb": 1, "ame": 1097, "ameaux": 2, "amed": 5, "amem": 3, "amen": 122, "amend": 53, "amends": 17, "amer": 4, "ami": 34, "amia": 85, "amid": 106, "amidst": 25, "amies": 1, "amis": 7, "amiss": 22, "amit": 3, "amo": 115, "amok": 2, "amon": 19, "among": 1775, "amongst": 97, "amor": 6, "amorp": 7, "amos": 12, "amoun": 15, "amount": 197, "amounts": 45, "amour": 3, "amours": 7, "amoz": 13, "amp": 12, "amphis": 1, "ample": 63, "ampler": 4, "amplest": 5, "ampstead": 1, "ams": 123, "amsons": 1, "amss": 2, "amt": 1, "amu": 174, "amuck": 1, "amuf": 1, "amy": 15, "an": 16541, "ana": 413, "anab": 2, "anae": 1, "anaes": 1, "anah": 13, "anai": 2, "anak": 10, "anam": 1, "anan": 1, "anao": 1, "anapra": 1, "anath": 2, "anc": 1, "and": 124329, "andres": 1, "ands": 4, "andsex": 2, "andt": 1, "ane": 9, "aned": 20, "anek": 10, "anem": 1, "aner": 3, "aneth": 1, "anew": 16, "ang": 12, "angri": 32, "angst": 2, "anh": 1, "ani": 325, "anim": 1, "aning": 28, "anings": 3, "anis": 2, "ann": 33, "ano": 2064, "anoin": 141, "anoint": 37, "anoints": 2, "anon": 35, "anort": 1, "anoyn": 1, "anp": 1, "ans": 1939, "ansley": 1, "anst": 1, "ant": 884, "anth": 1, "antho": 1, "antop": 1, "ants": 91, "anub": 1, "anus": 1, "anxi": 293, "anxie": 4, "any": 5716, "anye": 1, "anyhow": 53, "ao": 5, "aor": 4, "aou": 1, "ap": 4781, "apa": 24, "apala": 1, "apart": 254, "ape": 16, "apea": 6, "apeak": 1, "apel": 1, "apen": 1, "aper": 16, "apes": 6, "apex": 8, "aph": 45, "aphas": 9, "aphrah": 1, "aphro": 1, "aphs": 1, "aphses": 1, "aphy": 2, "api": 1, "apie": 13, "apish": 2, "apla": 1, "aplomb": 3, "aply": 4, "apo": 165, "apol": 26, "apon": 88, "apons": 125, "aport": 4, "aports": 2, "apos": 6, "apost": 104, "apot": 1, "app": 2, "apri": 5, "april": 85, "apro": 2, "apron": 23, "aprons": 6, "aps": 51, "apt": 97, "aqua": 8, "aquam": 1, "aque": 1, "aqueous": 14, "aqui": 13, "aquid": 2, "aquin": 2, "ar": 4451, "ara": 53, "arab": 5, "arabs": 4, "arad": 5, "arah": 4, "arai": 1, "arak": 1, "aram": 11, "aran": 2, "aransas": 1, "arau": 9, "arc": 69, "arch": 77, "ard": 547, "ards": 164, "ardsleys": 1, "are": 11511, "area": 357, "arean": 9, "areg": 1, "aren": 19, "arent": 36, "areo": 2, "ares": 1, "arf": 1, "ari": 338, "aria": 2, "arid": 4, "arieh": 1, "ariel": 7, "aries": 4, "aright": 16, "arim": 19, "aris": 70, "arist": 9, "arith": 22, "ariz": 5, "ark": 253, "arks": 1, "arl": 23, "arleigh": 1, "arls": 16, "arm": 491, "arms": 380, "arn": 10, "arnin": 1, "arning": 21, "arnings": 4, "arns": 3, "aro": 251, "aroar": 1, "arod": 1, "aroe": 1, "aroer": 16, "aroostook": 1, "arou": 46, "around": 785, "arous": 7, "aroynt": 1, "arp": 18, "ars": 2342, "arst": 1, "arstran": 1, "arstrum": 1, "art": 994, "arth": 37, "arthur": 222, "arthurs": 1, "arts": 100, "aru": 2, "arun": 5, "ary": 17, "aryl": 1, "as": 28156, "asa": 81, "asai": 6, "asare": 1, "asareel": 1, "asch": 1, "aschen": 1, "ascrip": 1, "asd": 1, "ase": 3, "asep": 1, "aser": 2, "ash": 49, "asi": 296, "asia": 90, "asiel": 1, "asini": 2, "asit": 1, "ask": 561, "asm": 47, "asnap": 1, "aso": 1, "asp": 18, "aspra": 1, "ass": 115, "asswa": 3, "ast": 519, "asth": 3, "astoop": 1, "astrea": 1, "astri": 8, "astrin": 2, "astrop": 3, "asts": 263, "astu": 2, "asup": 2, "asw": 3, "asylum": 36, "asylums": 4, "asym": 5, "asymp": 2, "asyn": 3, "at": 21995, "ata": 10, "atad": 2, "atall": 1, "ate": 59, "ater": 6, "ath": 1901, "athe": 13, "athearn": 1, "athens": 14, "athero": 1, "athirst": 8, "athle": 60, "atins": 1, "atm": 1, "ato": 149, "atom": 47, "atoo": 2, "atop": 8, "atp": 2, "atreus": 2, "atro": 10, "atrop": 9, "atroth": 1, "ats": 153, "atss": 1, "att": 8, "attu": 1, "atu": 2, "aty": 1, "au": 1530, "auc": 11, "aud": 9, "aueng": 1, "auenth": 1, "auf": 2, "aug": 57, "augh": 11, "aught": 54, "auk": 1, "aul": 2, "aun": 12, "aunt": 114, "aunts": 8, "auoid": 2, "auou": 1, "auouch": 2, "auoy": 2, "auoyd": 3, "aus": 57, "auschwitz": 1, "austins": 2, "aux": 6, "auxi": 13, "av": 12, "ava": 14, "avai": 281, "avail": 23, "avails": 7, "avalan": 2, "avant": 8, "avari": 7, "avast": 22, "avc": 1, "ave": 153, "avec": 1, "aven": 3, "aver": 215, "avers": 1, "avert": 5, "averts": 1, "avi": 14, "avid": 2, "avig": 2, "avim": 1, "avims": 1, "avis": 1, "avith": 2, "aviv": 1, "avo": 26, "avoi": 73, "avoid": 131, "avoids": 5, "avon": 1, "avou": 2, "avow": 3, "avows": 2, "aw": 199, "awa": 387, "awai": 30, "await": 16, "awaits": 8, "awak": 14, "awar": 21, "award": 47, "awards": 17, "awash": 1, "away": 2483, "awaye": 1, "awe": 44, "awed": 11, "awein": 1, "awes": 1, "aweso": 4, "awing": 1, "awl": 1, "awls": 1, "awo": 29, "awoc": 5, "awry": 5, "ax": 26, "axe": 46, "axed": 4, "axes": 25, "axi": 11, "axing": 4, "axis": 48, "ay": 136, "aya": 1, "ayan": 1, "ayd": 1, "aye": 201, "ayear": 1, "ayl": 1, "ays": 2, "ayub": 1, "az": 77, "aza": 67, "azal": 1, "azar": 1, "azaz": 1, "aze": 7, "azel": 6, "azem": 2, "azer": 1, "azi": 2, "aziel": 1, "azo": 8, "azor": 2, "azs": 1, "azu": 14, "azur": 2, "azz": 1, "ba": 4548, "baa": 1, "baaa": 1, "baal": 134, "baali": 1, "baalim": 19, "baalis": 1, "baals": 1, "baalta": 1, "baana": 2, "baanah": 10, "baara": 1, "baas": 29, "bab": 60, "bac": 231, "bach": 18, "bachs": 6, "bacht": 2, "back": 2347, "backs": 84, "backsi": 5, "backt": 1, "bad": 599, "bada": 1, "badg": 1, "bads": 1, "bae": 1, "baer": 5, "baf": 49, "bag": 147, "bagg": 1, "bags": 25, "bah": 83, "bai": 56, "bail": 10, "baim": 2, "baird": 4, "bait": 9, "baits": 2, "bak": 46, "bakh": 1, "bakt": 1, "baku": 1, "bal": 476, "balac": 1, "balaf": 5, "bald": 58, "balipa": 1, "balis": 3, "balk": 9, "balks": 6, "ball": 382, "balls": 70, "bally": 1, "balm": 17, "baloo": 2, "bals": 35, "balt": 3, "bam": 12, "bame": 1, "ban": 511, "banc": 1, "band": 634, "bands": 153, "bang": 50, "bangs": 8, "bank": 189, "bankhead": 1, "bankrupt": 21, "banks": 70, "bankss": 1, "banq": 24, "bans": 9, "banshee": 2, "bao": 1, "bap": 180, "bapt": 1, "bar": 1232, "bara": 3, "barb": 7, "barbs": 14, "bard": 33, "bardall": 1, "bards": 34, "bare": 1, "barf": 1, "barh": 1, "bark": 52, "barks": 1, "barl": 1, "barm": 1, "barn": 66, "barns": 23, "barnsful": 1, "barr": 3, "bars": 108, "barsa": 2, "bart": 20, "barth": 5, "bas": 523, "bash": 20, "bashee": 3, "basins": 1, "bask": 5, "basons": 18, "bass": 20, "bast": 1, "basted": 1, "bat": 262, "batch": 6, "bath": 321, "bats": 16, "batt": 471, "bau": 7, "baud": 2, "baue": 1, "baul": 4, "baulks": 1, "bault": 2, "baum": 5, "baw": 16, "bawd": 1, "bawl": 3, "bay": 154, "baya": 4, "baying": 1, "bayo": 11, "bayou": 3, "bayous": 1, "bays": 10, "baz": 8, "bdel": 2, "bdik": 22, "be": 45758, "bea": 7, "beach": 124, "bead": 13, "beads": 10, "beah": 49, "beaks": 3, "beam": 64, "bean": 23, "beans": 27, "beanstalk": 3, "bear": 689, "beat": 216, "beau": 915, "beaus": 1, "beaux": 10, "beauxarts": 1, "beb": 2, "bec": 29, "beck": 37, "beckoning": 11, "beckonings": 1, "becks": 3, "becs": 1, "bed": 1270, "bedei": 1, "beds": 83, "bee": 90, "beech": 9, "beef": 74, "beefe": 2, "beefed": 1, "beefo": 1, "beefs": 1, "beefy": 1, "beehi": 9, "beehun": 1, "beel": 20, "beeli": 1, "been": 5884, "beene": 31, "beep": 4, "beeps": 3, "beer": 72, "beera": 1, "beerah": 1, "beere": 2, "beeri": 2, "beero": 5, "beeroth": 6, "beers": 36, "bees": 53, "beest": 3, "beet": 39, "beets": 4, "beg": 110, "behe": 16, "behea": 3, "behead": 2, "behring": 3, "bei": 11, "bein": 14, "being": 2374, "beings": 62, "beirut": 1, "beis": 1, "beit": 68, "beits": 1, "bek": 5, "bel": 718, "belch": 4, "bell": 231, "bells": 69, "bels": 60, "belt": 46, "beltdri": 1, "belts": 8, "ben": 622, "bench": 96, "bend": 76, "bends": 12, "bens": 2, "bensons": 1, "bent": 174, "bents": 1, "beowulf": 14, "beowulfs": 1, "bephr": 7, "bephra": 1, "ber": 3658, "berg": 112, "berghs": 1, "bergrie": 1, "bergs": 12, "berk": 4, "bern": 16, "berni": 3, "berp": 1, "bers": 778, "bert": 286, "bertad": 18, "berth": 14, "bertha": 15, "berts": 58, "bertsons": 1, "bes": 413, "bescotch": 1, "besh": 24, "beshrew": 1, "bess": 5, "best": 960, "bestead": 1, "bests": 1, "bestub": 1, "bestuck": 1, "bet": 2929, "beta": 1, "beteene": 1, "beth": 217, "bethe": 1, "bethel": 69, "bethought": 5, "bets": 8, "betts": 1, "beu": 1, "beus": 1, "bexar": 1, "bey": 95, "beying": 4, "beys": 2, "bez": 7, "bezzle": 3, "bezzling": 1, "bhoy": 1, "bi": 2792, "bia": 59, "biah": 47, "bians": 9, "bib": 9, "bibb": 1, "bic": 54, "bich": 1, "bick": 7, "bid": 345, "bidd": 1, "bidex": 1, "bids": 33, "bidst": 1, "bie": 42, "biect": 6, "bied": 2, "bien": 12, "bienp": 1, "bient": 3, "bier": 5, "bies": 48, "biest": 2, "biet": 1, "bif": 1, "big": 709, "biglar": 1, "biglea": 1, "bigshoul": 1, "bigsta": 1, "bigt": 2, "bigthan": 1, "bigui": 19, "bij": 3, "bil": 243, "bildad": 81, "bilg": 3, "bilhan": 4, "bill": 211, "bills": 63, "bils": 2, "bilt": 3, "bim": 28, "bims": 67, "bin": 321, "bind": 74, "binds": 4, "bing": 251, "bingles": 1, "bings": 7, "bins": 32, "bio": 4, "biop": 1, "biophy": 3, "biopsy": 2, "bious": 25, "bir": 353, "birch": 9, "bird": 199, "birth": 165, "bis": 118, "bish": 30, "bism": 11, "bisog": 1, "bisons": 1, "bist": 7, "bists": 1, "bit": 842, "bita": 89, "bitch": 14, "bith": 1, "bithiah": 1, "bithy": 2, "bits": 353, "bitt": 2, "bitts": 2, "bix": 1, "biz": 4, "bjer": 1, "bla": 378, "blab": 4, "blabb": 2, "blac": 102, "black": 799, "blacks": 42, "blad": 5, "blai": 2, "blaim": 1, "blains": 7, "blair": 1, "blam": 2, "blan": 190, "blanc": 3, "blanch": 4, "bland": 14, "blang": 1, "blank": 53, "blanks": 5, "blas": 15, "blasp": 94, "blast": 57, "blasts": 12, "blastus": 1, "blat": 4, "blath": 1, "blatz": 9, "blatzs": 1, "blau": 3, "ble": 8840, "blea": 7, "bleak": 28, "blear": 2, "bleat": 2, "bleau": 4, "bleaus": 5, "bleaux": 1, "blebs": 1, "blechook": 1, "blechooks": 2, "bleckley": 1, "bled": 6, "blee": 3, "bleed": 19, "bleeding": 38, "bleedings": 1, "bleeds": 4, "bleem": 1, "bleen": 2, "bleeps": 1, "blehe": 2, "blei": 3, "blem": 339, "blems": 256, "blen": 35, "blench": 1, "blend": 16, "blends": 3, "blent": 5, "bler": 45, "blers": 10, "bles": 1088, "bleso": 29, "bless": 206, "blest": 50, "blesta": 3, "blet": 14, "bleth": 26, "bletop": 1, "blets": 16, "blew": 64, "bley": 1, "bli": 392, "blic": 642, "blick": 9, "blico": 2, "blics": 15, "blies": 19, "blif": 1, "bligh": 7, "blight": 3, "blights": 2, "blimp": 1, "blin": 95, "blind": 266, "blinds": 17, "bling": 344, "blings": 11, "blink": 5, "blinks": 1, "blio": 2, "bliophi": 1, "blips": 1, "blis": 448, "blish": 235, "blishs": 1, "bliss": 52, "blissful": 15, "blit": 5, "blitz": 3, "bliz": 8, "blo": 88, "blob": 2, "bloc": 17, "bloch": 2, "block": 145, "blocka": 2, "blockhead": 14, "blockheads": 1, "blocks": 51, "blois": 1, "blol": 1, "blom": 2, "blon": 29, "blond": 11, "bloo": 38, "blood": 901, "bloodie": 3, "bloodier": 1, "bloodiest": 3, "bloods": 18, "bloodsoak": 1, "bloody": 88, "bloom": 48, "blooms": 7, "bloon": 21, "bloons": 7, "bloops": 1, "blos": 74, "blot": 45, "blotch": 1, "blots": 5, "blou": 5, "bloud": 4, "blous": 1, "blow": 193, "blown": 52, "blownup": 1, "blows": 58, "blowup": 1, "blu": 16, "blub": 36, "blud": 5, "blue": 458, "bluedra": 1, "blues": 23, "bluest": 1, "bluf": 1, "bluff": 15, "bluffs": 4, "bluing": 1, "bluish": 4, "blum": 5, "blun": 43, "blunt": 38, "blunts": 2, "blur": 18, "blurr": 1, "blurt": 1, "blus": 55, "blush": 41, "blut": 1, "bluth": 1, "bluths": 3, "bly": 1621, "blyth": 1, "bmews": 2, "bo": 3812, "boa": 71, "boad": 1, "boam": 167, "boams": 1, "boaner": 1, "boar": 39, "board": 532, "boards": 116, "boas": 28, "boast": 50, "boasts": 4, "boat": 512, "boats": 231, "boaz": 26, "bob": 117, "bobb": 2, "bobs": 4, "boc": 5, "bock": 3, "bockwurst": 1, "bod": 26, "bods": 1, "boe": 1, "boed": 1, "boehmer": 1, "boei": 3, "boeo": 1, "boes": 1, "bog": 18, "boggs": 1, "bogs": 2, "bohan": 2, "bohlen": 1, "bohm": 7, "bohms": 4, "bohr": 4, "boi": 103, "boia": 2, "boic": 1, "boiim": 2, "boil": 34, "boils": 7, "boim": 5, "bois": 5, "boisbri": 1, "bojum": 1, "bok": 7, "bokh": 1, "bol": 166, "bold": 176, "boldt": 1, "boll": 3, "bols": 45, "bolt": 41, "bolts": 20, "boltz": 1, "bom": 60, "bomack": 1, "bomb": 57, "bombs": 43, "bon": 268, "bond": 114, "bondmaid": 2, "bondmaids": 2, "bonds": 85, "bondwo": 11, "bong": 6, "bongad": 2, "bonn": 6, "bons": 26, "boo": 77, "booar": 1, "bood": 1, "book": 709, "bookies": 3, "bookish": 2, "books": 210, "bookshel": 3, "bookshelf": 1, "bookxxxv": 1, "bool": 1, "boom": 21, "booms": 2, "boon": 10, "boor": 3, "boord": 1, "boors": 1, "boort": 1, "boos": 7, "boost": 15, "boosted": 3, "boosts": 1, "boot": 39, "booth": 11, "booths": 12, "booting": 2, "boots": 71, "booty": 16, "booz": 4, "booze": 4, "boozin": 1, "bop": 4, "bor": 913, "bord": 1, "borg": 3, "born": 638, "borns": 3, "boro": 13, "boron": 1, "borough": 24, "boroughs": 2, "borous": 1, "bors": 79, "borsa": 1, "borun": 1, "bos": 129, "bosc": 14, "boscath": 1, "bosch": 2, "bosh": 3, "boss": 27, "bosss": 3, "bot": 181, "botch": 3, "both": 1832, "bots": 9, "botsons": 1, "bott": 207, "bottom": 231, "botts": 1, "bou": 148, "bouch": 4, "boud": 1, "boue": 1, "bouf": 3, "boug": 2, "bough": 19, "boughs": 37, "bought": 154, "bouis": 1, "boul": 66, "boun": 140, "bouncy": 1, "bound": 307, "bounda": 18, "bounds": 58, "bour": 426, "bourg": 9, "bourn": 1, "bours": 106, "bous": 2, "bout": 27, "bouts": 30, "bow": 347, "bowd": 2, "bowl": 60, "bowls": 31, "bows": 109, "bowsprit": 10, "bowts": 1, "box": 259, "boxe": 2, "boxed": 3, "boxell": 4, "boxer": 1, "boxers": 2, "boxes": 34, "boxing": 2, "boxy": 3, "boy": 911, "boyd": 5, "boyl": 1, "boys": 330, "boz": 10, "bpla": 1, "bra": 839, "brac": 15, "brack": 1, "brad": 20, "brae": 10, "brag": 22, "bragg": 2, "brags": 1, "brah": 7, "brahm": 3, "brahmin": 46, "brahmins": 3, "brahms": 8, "brai": 45, "braic": 2, "braid": 6, "braids": 3, "brail": 1, "brails": 1, "braim": 1, "brain": 145, "brains": 44, "braith": 1, "brak": 2, "bral": 19, "bram": 8, "braman": 1, "bran": 523, "branch": 106, "brand": 39, "brands": 12, "brandt": 12, "brandts": 3, "brant": 7, "brants": 2, "bras": 45, "brash": 1, "brass": 170, "brat": 4, "brats": 1, "brau": 5, "braud": 1, "braue": 10, "braun": 2, "braw": 20, "brawl": 2, "brawn": 7, "bray": 6, "braying": 1, "braz": 1, "bre": 1444, "brea": 195, "breach": 44, "bread": 578, "break": 602, "breaks": 34, "breakup": 3, "breakups": 1, "brec": 1, "bred": 58, "breds": 1, "bree": 119, "breech": 1, "breed": 45, "breeds": 12, "breefe": 8, "breez": 1, "breg": 1, "breit": 1, "brel": 36, "brels": 7, "brems": 1, "bren": 17, "brer": 3, "bres": 16, "bress": 1, "brest": 7, "brests": 1, "bret": 7, "bretag": 2, "brets": 5, "brett": 4, "breu": 1, "breui": 1, "brew": 51, "brews": 27, "breys": 1, "bri": 566, "bria": 5, "briar": 3, "bric": 25, "bricht": 2, "brick": 51, "bricks": 13, "brics": 30, "brid": 243, "brie": 11, "brief": 112, "brieff": 1, "briefly": 51, "briefs": 1, "briel": 59, "briels": 5, "brien": 1, "brier": 9, "briers": 20, "brig": 11, "briggs": 1, "brigh": 67, "brighet": 1, "bright": 337, "brightgreen": 1, "brightloo": 1, "brightly": 9, "brightness": 53, "brights": 5, "brigs": 3, "bril": 105, "brile": 1, "brils": 2, "brim": 42, "brims": 19, "brin": 223, "brind": 7, "bring": 1155, "brings": 82, "brink": 17, "brinsley": 1, "brious": 4, "bris": 70, "brisk": 20, "brist": 24, "brit": 14, "britt": 9, "bro": 1859, "broa": 62, "broad": 389, "broads": 4, "brob": 10, "broc": 5, "brockle": 1, "brod": 2, "broeg": 1, "brog": 1, "broi": 43, "broil": 2, "broils": 5, "brok": 1, "brom": 2, "bromp": 2, "bron": 159, "bronc": 3, "broni": 6, "bronx": 9, "broo": 8, "brooch": 1, "brood": 36, "broodin": 1, "brooding": 27, "broodings": 1, "broods": 7, "broody": 2, "brook": 145, "brooks": 42, "brookss": 1, "broom": 10, "bros": 1, "brot": 4, "broth": 25, "brough": 13, "brought": 1484, "broun": 3, "brous": 16, "brow": 124, "brown": 682, "brownapo": 1, "browns": 24, "browny": 3, "brows": 62, "broxo": 2, "broy": 1, "bru": 540, "bruck": 8, "brue": 1, "brui": 80, "bruing": 1, "bruis": 4, "bruit": 2, "brum": 2, "brun": 11, "bruns": 12, "brunt": 4, "brus": 63, "brush": 80, "brusque": 1, "brut": 37, "bruxel": 1, "bruz": 1, "bry": 24, "bryans": 2, "bryn": 3, "bryo": 4, "btu": 6, "btus": 1, "btusq": 1, "bu": 2636, "bua": 1, "bub": 99, "buc": 60, "buch": 6, "bucha": 3, "buchad": 60, "buchadrez": 31, "buck": 247, "bucka": 1, "buckhead": 1, "buckle": 20, "buckler": 13, "bucklers": 6, "buckles": 3, "buckley": 7, "bucks": 19, "buckshot": 2, "buckskins": 2, "buckwheat": 5, "bucs": 2, "bud": 188, "budd": 5, "buds": 23, "bue": 3, "bued": 5, "buen": 1, "bues": 1, "buf": 88, "buff": 14, "buffs": 2, "bug": 44, "bugs": 11, "buhr": 2, "buick": 3, "buil": 571, "build": 290, "builds": 15, "built": 351, "builtsoap": 1, "buing": 1, "buk": 11, "bul": 403, "bulb": 9, "bulbs": 6, "bulins": 1, "bulk": 69, "bulkhead": 3, "bulkheads": 1, "bulks": 2, "bulky": 17, "bull": 728, "bulls": 17, "bult": 11, "bulun": 45, "bulus": 2, "bum": 50, "bump": 13, "bumpkins": 2, "bumps": 3, "bums": 4, "bun": 73, "bunch": 37, "buncha": 1, "buncle": 17, "buncles": 2, "bund": 59, "bung": 1, "bunk": 21, "bunks": 18, "buns": 21, "bunt": 3, "buoy": 36, "buoyan": 8, "buoying": 1, "buoys": 5, "bur": 697, "burch": 2, "burg": 80, "burgh": 36, "burghley": 1, "burgs": 7, "burl": 2, "burn": 263, "burning": 173, "burnings": 5, "burns": 40, "burnss": 1, "burnt": 416, "burr": 8, "burs": 45, "burst": 183, "burstin": 1, "bursting": 58, "bursts": 16, "burt": 2, "bus": 425, "bush": 80, "busht": 1, "busks": 2, "buss": 2, "bust": 80, "bustard": 2, "busts": 4, "busy": 4, "busying": 1, "but": 18688, "buto": 4, "buts": 1, "butt": 17, "button": 2, "butts": 10, "bux": 2, "buxom": 3, "buy": 239, "buyin": 1, "buying": 39, "buyings": 1, "buys": 12, "buz": 27, "buzz": 21, "by": 15191, "bya": 3, "byans": 2, "bye": 74, "byft": 1, "byin": 1, "byls": 1, "byrth": 1, "bys": 21, "byth": 1, "ca": 14678, "cab": 57, "cabs": 10, "cac": 7, "cad": 11, "cae": 300, "caes": 39, "caf": 3, "cah": 51, "cai": 133, "cail": 1, "cain": 26, "caint": 1, "caip": 1, "cairns": 2, "cairo": 1, "cak": 3, "cal": 5202, "cald": 5, "calf": 50, "calfs": 2, "call": 932, "calli": 3, "callin": 1, "calling": 186, "callings": 1, "callio": 1, "callou": 4, "callous": 13, "callow": 1, "calls": 134, "cally": 761, "calm": 271, "calms": 4, "calp": 15, "cals": 35, "calt": 1, "cam": 310, "camp": 355, "campground": 3, "campgrounds": 2, "camphi": 2, "camps": 43, "cams": 1, "can": 6830, "cand": 183, "cans": 185, "canst": 86, "cant": 363, "canteen": 2, "cantly": 31, "cants": 29, "cao": 2, "cap": 1651, "caph": 3, "capht": 1, "caphtorim": 1, "caphtorims": 1, "capn": 1, "capo": 10, "capons": 1, "caps": 26, "capsi": 9, "capt": 5, "car": 2552, "card": 107, "carda": 1, "cardamum": 3, "cards": 67, "careah": 1, "careers": 15, "carl": 44, "carls": 4, "carnei": 1, "caro": 73, "carob": 1, "caroon": 1, "caroons": 5, "carr": 3, "cars": 136, "carstairs": 16, "cart": 79, "carthur": 3, "carts": 10, "cas": 551, "casa": 2, "casals": 1, "casas": 2, "cash": 47, "cashme": 2, "cask": 50, "caslu": 2, "casm": 3, "cass": 19, "cast": 856, "casts": 36, "casuist": 1, "casuistry": 2, "casuists": 1, "cat": 213, "catch": 184, "catchy": 1, "cath": 3, "cats": 48, "catt": 284, "cau": 4328, "caue": 1, "cauff": 1, "caul": 20, "cauls": 1, "cault": 1, "caust": 5, "caut": 1, "cav": 1, "caw": 44, "cay": 48, "caying": 5, "cays": 1, "cayu": 2, "cdic": 2, "ce": 31834, "cea": 335, "ceac": 7, "ceald": 1, "ceals": 4, "cean": 6, "ceana": 1, "ceans": 2, "ceau": 3, "ceayear": 1, "cechair": 1, "cechan": 1, "ced": 2620, "cede": 1, "cedst": 1, "cee": 224, "ceearnings": 3, "ceecee": 2, "ceed": 172, "ceedin": 121, "ceeding": 145, "ceedings": 30, "ceeds": 51, "cees": 17, "cei": 1810, "ceil": 1, "cein": 2, "ceipt": 11, "ceipts": 7, "ceit": 125, "ceits": 15, "ceiu": 10, "ceiv": 15, "cel": 577, "celess": 1, "cell": 104, "cells": 98, "cels": 25, "celsin": 1, "celt": 2, "celts": 2, "cem": 78, "cement": 2, "cen": 2167, "cend": 116, "cends": 29, "cens": 7, "censt": 1, "cent": 1050, "centre": 1, "cents": 62, "ceous": 2, "cep": 829, "ceps": 5, "cept": 753, "cepta": 8, "ceptress": 1, "cepts": 73, "cer": 2122, "cern": 219, "cerned": 233, "cerner": 1, "cerneth": 3, "cerni": 16, "cerning": 366, "cernings": 1, "cerns": 76, "cerpt": 6, "cerpts": 5, "cers": 327, "cert": 73, "certs": 27, "cerv": 5, "cery": 19, "ces": 5743, "cesa": 4, "ceship": 5, "cesoe": 1, "cess": 522, "cest": 40, "cestors": 15, "cestre": 2, "cestress": 1, "cestry": 12, "cestuous": 8, "cet": 26, "ceth": 32, "cetious": 6, "cetofa": 3, "cetowall": 1, "cetre": 1, "cets": 11, "cett": 1, "ceu": 3, "ceur": 1, "ceurs": 2, "cey": 23, "ceys": 1, "ceyu": 2, "ceyue": 1, "cha": 1101, "chab": 1, "chad": 2, "chae": 23, "chael": 101, "chaels": 3, "chaf": 4, "chaff": 17, "chah": 7, "chai": 82, "chaic": 5, "chain": 98, "chains": 84, "chair": 269, "chairs": 45, "chaism": 1, "chal": 216, "chalk": 14, "chall": 2, "cham": 418, "champ": 2, "champs": 5, "chan": 1826, "chanc": 5, "chand": 37, "chant": 155, "chants": 102, "chap": 483, "chaplain": 9, "chaplains": 1, "chaps": 9, "chapt": 1, "char": 1283, "charac": 590, "chard": 137, "chards": 40, "chardsons": 3, "charg": 3, "charm": 73, "charms": 18, "charr": 1, "chart": 36, "charta": 1, "charts": 19, "chas": 88, "chasm": 4, "chast": 2, "chat": 109, "chats": 1, "chau": 6, "chauf": 22, "chaul": 1, "chaun": 3, "chaw": 2, "chay": 1, "che": 852, "chea": 2, "cheat": 21, "chec": 25, "check": 176, "checks": 19, "ched": 1877, "chedst": 2, "chee": 70, "cheefe": 3, "cheek": 78, "cheeke": 3, "cheeks": 57, "cheer": 243, "cheeriest": 1, "cheering": 12, "cheers": 17, "cheery": 11, "cheetah": 1, "chef": 11, "cheff": 1, "chefou": 1, "chei": 2, "chek": 2, "chel": 110, "chelaus": 1, "chell": 29, "chells": 1, "chelm": 1, "cheln": 1, "chels": 2, "chem": 70, "chems": 3, "chen": 187, "chena": 4, "cheng": 1, "chens": 15, "chep": 1, "chephi": 4, "cher": 575, "chern": 1, "cherous": 60, "chers": 194, "chert": 5, "chery": 28, "ches": 1501, "chess": 50, "chest": 130, "chet": 19, "cheth": 99, "chets": 2, "cheur": 1, "chew": 9, "chews": 2, "chey": 6, "chez": 5, "chi": 1048, "chia": 2, "chiah": 24, "chiang": 4, "chians": 2, "chic": 78, "chick": 34, "chickasaws": 4, "chicks": 1, "chid": 1, "chie": 14, "chief": 658, "chiefe": 3, "chiefs": 16, "chiel": 5, "chien": 9, "chieri": 1, "chies": 6, "chiest": 1, "chig": 2, "chii": 1, "chij": 6, "chil": 84, "child": 3514, "childs": 33, "chill": 277, "chills": 20, "chim": 107, "chin": 115, "ching": 1098, "chings": 16, "chink": 1, "chinks": 1, "chinn": 1, "chins": 9, "chio": 10, "chip": 52, "chips": 12, "chir": 24, "chirp": 2, "chirped": 2, "chis": 13, "chish": 24, "chism": 11, "chist": 45, "chists": 33, "chit": 6, "chitz": 2, "chiuchow": 1, "chka": 1, "chles": 1, "chless": 3, "chley": 1, "chlo": 56, "chloe": 1, "chlor": 2, "cho": 928, "choc": 4, "chock": 2, "chocks": 7, "choh": 3, "choi": 238, "choir": 10, "choirs": 3, "chol": 10, "chols": 1, "chom": 1, "chomp": 1, "chon": 9, "choo": 204, "choosing": 23, "chop": 35, "chopins": 1, "chops": 5, "chopt": 1, "chor": 59, "chord": 10, "chords": 14, "chors": 14, "chort": 4, "chos": 1, "chou": 3, "chouc": 1, "choug": 1, "choui": 1, "chow": 17, "chowgh": 1, "choy": 4, "chral": 2, "chran": 1, "chre": 57, "chred": 1, "chres": 16, "chri": 21, "chris": 374, "christ": 780, "christs": 23, "christsa": 1, "christy": 1, "chrites": 1, "chro": 148, "chromspun": 1, "chry": 7, "chrys": 4, "chu": 115, "chub": 3, "chuc": 21, "chuck": 22, "chuckle": 9, "chuckles": 1, "chucks": 1, "chuf": 1, "chuff": 1, "chug": 5, "chum": 2, "chump": 1, "chums": 1, "chun": 2, "chung": 1, "chunk": 2, "chunks": 5, "chup": 2, "chur": 472, "church": 564, "churl": 3, "churning": 10, "churns": 1, "chus": 16, "chut": 1, "chuth": 1, "chy": 84, "chylus": 2, "chys": 1, "ci": 11610, "cia": 63, "ciad": 1, "cial": 2, "cian": 62, "cians": 134, "ciao": 1, "cic": 5, "cid": 41, "cidi": 2, "cie": 85, "cied": 62, "ciel": 1, "cien": 36, "ciens": 1, "cient": 528, "cients": 15, "cier": 17, "ciers": 4, "cies": 451, "ciest": 2, "cii": 2, "cil": 307, "cili": 8, "cilians": 2, "cils": 21, "cily": 21, "cim": 1, "cimo": 1, "cin": 92, "cinc": 1, "cinch": 3, "cinct": 13, "cincts": 7, "cing": 987, "cings": 14, "cinq": 1, "cinth": 4, "cio": 14, "cious": 670, "cip": 23, "cipri": 1, "cir": 983, "cis": 297, "cism": 127, "cist": 21, "cists": 14, "cit": 94, "cits": 3, "cius": 1, "ckle": 4, "ckley": 1, "cla": 737, "clack": 1, "clad": 55, "clai": 371, "claim": 217, "claims": 134, "clair": 5, "clam": 49, "clamps": 6, "clams": 6, "clan": 22, "clang": 11, "clank": 8, "clans": 2, "clap": 71, "clapp": 2, "claps": 9, "clapt": 1, "clar": 3, "clark": 35, "clarks": 1, "clas": 283, "clash": 10, "clasm": 1, "clasp": 11, "class": 333, "classbia": 1, "classd": 1, "clast": 1, "clat": 22, "clau": 56, "claus": 4, "claw": 4, "claws": 15, "clay": 256, "clays": 1, "cle": 1296, "clea": 260, "clean": 330, "cleans": 2, "cleansed": 43, "cleanseth": 3, "clear": 738, "clearchan": 2, "clearcut": 6, "clears": 1, "cleat": 4, "cleau": 1, "cleaue": 3, "cled": 38, "cleere": 3, "cleets": 1, "clef": 1, "cleft": 11, "clefts": 9, "clei": 14, "cleic": 2, "cleis": 1, "clel": 15, "clen": 16, "clench": 1, "cler": 53, "clerk": 49, "clerks": 17, "clers": 1, "cles": 500, "clet": 1, "clew": 3, "clews": 2, "cli": 551, "clic": 3, "click": 17, "clicks": 2, "clids": 2, "clien": 3, "client": 16, "clients": 18, "clif": 54, "cliff": 34, "cliffs": 22, "clift": 1, "clifts": 1, "clim": 99, "climb": 42, "climbs": 6, "clin": 53, "clinch": 11, "clind": 1, "cling": 41, "clings": 7, "clink": 1, "clint": 4, "clio": 1, "clip": 27, "clipp": 1, "clips": 3, "clipt": 2, "clist": 8, "clit": 6, "clo": 1632, "clob": 3, "cloc": 7, "clock": 134, "clocks": 8, "clockwi": 4, "clod": 7, "clods": 16, "clog": 11, "clogs": 1, "cloi": 5, "cloid": 1, "clom": 1, "clomb": 1, "clootz": 1, "clops": 1, "clos": 20, "clot": 131, "cloth": 154, "clothing": 48, "cloths": 6, "clou": 37, "cloud": 275, "clouds": 199, "clough": 1, "clout": 4, "clouts": 3, "clov": 1, "clow": 9, "clowd": 2, "clowds": 2, "clown": 18, "clowns": 3, "cloy": 3, "cloying": 3, "cloys": 1, "cloyster": 1, "clu": 1025, "club": 181, "clubs": 43, "cluc": 1, "cluck": 7, "clucks": 2, "clue": 24, "clues": 10, "clum": 33, "clump": 8, "clumps": 6, "clung": 27, "clur": 2, "clus": 75, "clut": 49, "cly": 44, "clyf": 1, "clys": 1, "clysm": 1, "cmon": 4, "cni": 1, "co": 12686, "coa": 97, "coach": 82, "coachs": 1, "coanut": 1, "coanuts": 2, "coap": 1, "coar": 48, "coas": 9, "coast": 218, "coasts": 70, "coat": 254, "coats": 66, "cob": 399, "cobb": 32, "cobbs": 1, "cobs": 3, "coc": 22, "cock": 153, "cockle": 2, "cockles": 1, "cocks": 13, "coct": 1, "cocts": 1, "cod": 22, "codd": 1, "coddled": 2, "coddling": 1, "coe": 17, "coed": 3, "coeds": 1, "coedu": 1, "coef": 6, "coen": 1, "coer": 11, "coes": 7, "coeur": 1, "coex": 1, "coexis": 13, "coexist": 1, "cof": 207, "coff": 1, "coffs": 1, "cog": 290, "cogs": 1, "coh": 2, "coi": 37, "coid": 1, "coif": 1, "coig": 1, "coil": 27, "coils": 16, "coin": 92, "coing": 1, "coins": 43, "cois": 2, "col": 1227, "cold": 491, "colds": 8, "colfax": 1, "colh": 1, "coll": 2, "colm": 6, "coln": 51, "cols": 1, "colt": 45, "colts": 14, "com": 10704, "comb": 31, "combs": 10, "comin": 1, "comp": 8, "compar": 1, "compt": 2, "coms": 2, "con": 16287, "cond": 870, "conda": 36, "condo": 1, "conds": 71, "conduit": 12, "cong": 2, "conjoi": 5, "conjoint": 1, "conn": 4, "cons": 15, "conun": 4, "conuo": 1, "conuoy": 1, "conut": 8, "conuts": 3, "coo": 545, "cook": 169, "cool": 163, "coon": 10, "cooned": 1, "coop": 8, "coos": 1, "cooz": 1, "cop": 64, "copho": 2, "copp": 1, "cops": 17, "cor": 2652, "corault": 1, "corch": 1, "cord": 301, "cords": 146, "corel": 2, "cork": 17, "corks": 54, "corky": 1, "cormack": 1, "corn": 213, "corns": 6, "coro": 1, "corous": 7, "corp": 86, "corps": 124, "cort": 16, "corts": 1, "cos": 160, "cosam": 1, "cosm": 3, "cost": 333, "costal": 1, "costeroids": 1, "costfin": 1, "costrai": 2, "costs": 182, "cot": 257, "coth": 18, "cots": 3, "cott": 14, "cotts": 1, "cou": 956, "couch": 30, "coudn": 1, "coug": 8, "cough": 21, "coughlins": 1, "coul": 9, "could": 5373, "coulda": 1, "couldn": 89, "couldst": 6, "coun": 2514, "count": 600, "counts": 101, "coup": 6, "coups": 2, "cour": 1238, "courb": 1, "cours": 2, "courst": 1, "court": 479, "courtroom": 2, "courts": 102, "cous": 13, "cousins": 60, "cout": 2, "couth": 9, "cow": 151, "cowls": 1, "cowr": 1, "cows": 30, "cox": 42, "coxe": 2, "coxes": 5, "coy": 17, "coyings": 1, "coz": 3, "cpla": 8, "cra": 480, "crab": 25, "crabs": 18, "crac": 55, "crack": 89, "cracks": 16, "crad": 31, "craf": 23, "craft": 179, "crafts": 33, "crag": 6, "crags": 6, "craig": 3, "craigs": 1, "cral": 1, "cram": 11, "cramm": 1, "cramp": 3, "cramps": 3, "cran": 17, "crank": 3, "cranks": 2, "crans": 16, "crap": 5, "cras": 39, "crash": 53, "crass": 2, "crat": 25, "crats": 51, "craue": 1, "craues": 2, "crauing": 1, "craw": 70, "crawl": 26, "crawls": 4, "cray": 30, "craz": 1, "cre": 2047, "crea": 746, "creak": 9, "creaks": 1, "cream": 32, "creams": 2, "cred": 109, "cree": 135, "creed": 30, "creeds": 12, "creek": 23, "creeks": 3, "creep": 26, "creepeth": 14, "creeps": 6, "creepy": 3, "crees": 12, "creet": 22, "creigh": 3, "crept": 36, "cres": 25, "cress": 1, "crest": 29, "crests": 11, "cret": 395, "creta": 1, "crets": 59, "crew": 256, "crewk": 2, "crews": 22, "cri": 1229, "crib": 11, "cribs": 3, "cric": 20, "crick": 1, "crie": 1, "cried": 1139, "crier": 3, "cries": 65, "criest": 5, "crieth": 17, "crim": 40, "crimsoned": 3, "crimsoning": 1, "crin": 13, "crink": 1, "crip": 29, "cript": 4, "cripts": 2, "cris": 20, "crish": 1, "crisp": 12, "criss": 1, "crit": 13, "cro": 262, "croaks": 1, "croc": 5, "crock": 2, "croin": 3, "croix": 14, "crom": 35, "cron": 1, "crons": 5, "croo": 85, "crook": 4, "crop": 55, "crops": 36, "cropt": 1, "cros": 219, "cross": 366, "crossstri": 2, "crosswalk": 1, "crossway": 1, "crossways": 1, "crosswi": 5, "crosswri": 1, "crost": 3, "crot": 2, "crotch": 11, "crou": 38, "crouch": 16, "croud": 2, "crous": 6, "crow": 242, "crowd": 168, "crowds": 41, "crown": 198, "crowns": 14, "crows": 11, "croy": 2, "cru": 352, "crue": 3, "crui": 81, "cruing": 8, "cruit": 21, "cruits": 11, "crum": 27, "crumb": 6, "crumbs": 10, "crump": 1, "crun": 5, "crunch": 3, "crunching": 3, "crup": 3, "crus": 89, "crush": 22, "crust": 9, "crut": 15, "crux": 3, "cruz": 8, "cry": 400, "crye": 1, "crying": 93, "cryp": 5, "crypha": 1, "cryphal": 1, "crypt": 1, "crypts": 1, "crystal": 80, "crystals": 10, "cta": 7, "cu": 4543, "cub": 5, "cubs": 7, "cuck": 1, "cuckold": 1, "cuckoo": 2, "cuckow": 2, "cud": 12, "cue": 55, "cued": 18, "cuephra": 1, "cues": 7, "cueth": 1, "cuf": 3, "cuff": 7, "cuffs": 15, "cui": 3, "cuing": 4, "cuit": 55, "cuits": 19, "cuity": 2, "cul": 674, "cull": 1, "culp": 5, "culpa": 2, "cult": 227, "cults": 4, "cum": 656, "cumb": 1, "cums": 2, "cumscri": 6, "cumscrib": 1, "cumscrip": 1, "cun": 119, "cund": 16, "cuous": 43, "cup": 169, "cupp": 1, "cups": 40, "cur": 1416, "curb": 26, "curbs": 5, "curd": 6, "curds": 3, "cure": 21, "curl": 9, "curls": 11, "curs": 39, "curst": 2, "curt": 49, "curts": 8, "curv": 4, "cus": 784, "cusant": 1, "cush": 7, "cusp": 2, "cuss": 35, "cust": 21, "custo": 41, "custom": 4, "custs": 20, "cut": 996, "cuth": 1, "cuthah": 1, "cuts": 48, "cutt": 4, "cuttle": 2, "cuu": 2, "cuum": 27, "cuumed": 1, "cuums": 2, "cy": 2602, "cyg": 1, "cyin": 1, "cying": 26, "cym": 30, "cyn": 7, "cyr": 1, "cyrz": 1, "cys": 1, "cysts": 3, "cyt": 1, "cza": 5, "czar": 13, "czechos": 5, "czer": 1, "c\u00e6sar": 2, "da": 3999, "daah": 2, "dab": 88, "dabs": 3, "dac": 6, "dace": 1, "dachs": 1, "dack": 1, "dad": 83, "dadadum": 1, "dade": 9, "dae": 1, "daea": 45, "daeans": 1, "daer": 5, "daf": 3, "daft": 3, "dag": 136, "dah": 855, "dahl": 2, "dai": 419, "dain": 80, "dains": 4, "dair": 3, "dairy": 30, "dairyoh": 1, "dais": 2, "daism": 3, "daist": 1, "dak": 8, "dako": 12, "daks": 1, "dal": 252, "dall": 2, "dalp": 4, "dals": 28, "dam": 320, "damn": 69, "damp": 51, "damply": 1, "damps": 2, "dams": 6, "dan": 1164, "dana": 3, "danaw": 1, "danchin": 1, "dand": 4, "dandi": 2, "dandies": 2, "dands": 1, "dang": 14, "dange": 138, "danged": 1, "danger": 215, "dangers": 29, "danjaan": 1, "dank": 5, "danke": 1, "danl": 1, "dans": 12, "dant": 154, "dants": 47, "danzig": 1, "dap": 15, "dar": 449, "dara": 1, "dard": 62, "dare": 3, "darins": 1, "dark": 950, "darkhai": 3, "darks": 1, "darksome": 4, "darm": 1, "darn": 4, "dars": 45, "dart": 80, "darts": 18, "das": 179, "dash": 342, "dat": 29, "dath": 2, "dathan": 10, "dau": 24, "daub": 1, "daug": 2, "daugh": 988, "daun": 15, "daunt": 12, "daw": 29, "dawd": 5, "dawn": 79, "dawns": 1, "daws": 1, "day": 5567, "daya": 1, "dayaf": 2, "dayll": 1, "days": 1804, "dazz": 52, "dbit": 1, "dbits": 2, "dding": 2, "ddle": 1, "de": 32663, "dea": 118, "dead": 1026, "deae": 12, "deag": 1, "deal": 487, "deals": 35, "dealt": 87, "deam": 1, "dean": 51, "deans": 69, "dear": 791, "deau": 3, "deauour": 1, "deaux": 4, "deb": 35, "debs": 2, "debt": 38, "debtfree": 1, "debts": 25, "dec": 31, "dech": 6, "deck": 258, "decks": 28, "deckt": 2, "dects": 1, "ded": 5475, "dedst": 2, "dedtf": 1, "dee": 433, "deed": 1118, "deeds": 108, "deef": 1, "deeg": 22, "deegans": 2, "deel": 1, "deem": 78, "deems": 3, "deep": 457, "deeps": 17, "deepsoun": 1, "deer": 35, "deere": 33, "deered": 1, "deerer": 2, "deerest": 2, "deering": 1, "deerskins": 3, "dees": 22, "deey": 1, "def": 1, "deft": 5, "deh": 1, "dehe": 1, "dei": 54, "deiec": 1, "deiect": 1, "deif": 1, "deig": 5, "deign": 3, "deigns": 2, "deists": 2, "dek": 9, "dekar": 1, "del": 216, "delaford": 30, "dell": 34, "dells": 2, "delp": 72, "dels": 56, "dem": 121, "demn": 38, "demns": 4, "demp": 28, "den": 3756, "denan": 1, "dend": 8, "dends": 9, "dened": 16, "dening": 17, "dens": 203, "dent": 1505, "dents": 384, "deo": 6, "deor": 1, "deos": 1, "deous": 51, "deout": 4, "dep": 2, "deph": 1, "dept": 5, "depth": 85, "depths": 54, "der": 8501, "derachie": 5, "derack": 1, "derah": 2, "derb": 1, "derd": 1, "dereth": 28, "dergar": 3, "dern": 315, "derns": 6, "dero": 2, "deroth": 2, "derous": 75, "derpar": 1, "derpins": 1, "ders": 1326, "dery": 9, "derye": 2, "des": 2644, "desh": 48, "deshoul": 1, "deshs": 2, "desi": 681, "desir": 2, "desis": 1, "desist": 5, "desisted": 2, "desk": 91, "desks": 6, "desmaids": 2, "deso": 1, "desorp": 1, "desouf": 1, "despread": 30, "dess": 23, "dest": 490, "destep": 3, "desteps": 1, "deswee": 1, "det": 4, "deth": 358, "detz": 1, "deu": 20, "deui": 3, "deuill": 5, "deuils": 1, "deuis": 1, "deur": 34, "deurs": 4, "deut": 1, "deutsch": 1, "deux": 4, "dew": 94, "dews": 11, "dex": 120, "dexa": 2, "dexe": 1, "dexes": 3, "dey": 11, "deye": 1, "dez": 18, "dfor": 1, "dge": 2, "dgel": 2, "dgell": 1, "dgels": 2, "dger": 2, "dha": 10, "dhar": 1, "dhism": 10, "dhist": 5, "dhists": 2, "dho": 1, "di": 9877, "dia": 527, "diac": 1, "diah": 34, "dial": 9, "dials": 1, "dians": 78, "diaphanous": 2, "diaphrag": 2, "diaphragm": 7, "diaphragms": 1, "diar": 11, "dias": 2, "diat": 1, "diaz": 1, "dib": 1, "dic": 451, "dick": 126, "dicks": 7, "dics": 1, "dict": 67, "dicts": 9, "did": 4669, "didd": 1, "diddled": 2, "diddling": 1, "didn": 182, "dido": 4, "didst": 160, "die": 680, "died": 531, "diego": 5, "diel": 12, "diem": 2, "dien": 270, "dient": 99, "dients": 17, "dier": 133, "diers": 181, "diery": 1, "dies": 644, "diest": 18, "diet": 39, "dieta": 6, "dieth": 32, "diethyl": 4, "diethyla": 2, "diets": 3, "dif": 1803, "dig": 415, "digg": 1, "digm": 6, "digms": 1, "digs": 2, "dii": 9, "dij": 6, "dil": 32, "dill": 12, "dilloes": 1, "dills": 3, "dils": 1, "dilthey": 1, "dim": 169, "dimag": 6, "dimm": 3, "dims": 1, "din": 458, "ding": 6078, "dings": 356, "dinh": 1, "dinn": 2, "dins": 1, "dint": 7, "dio": 213, "dioed": 2, "dios": 2, "diotv": 3, "diours": 3, "dious": 60, "dip": 60, "dips": 1, "dipsas": 1, "dipt": 3, "dir": 94, "dirk": 3, "diron": 1, "dirt": 65, "dis": 5982, "disa": 34, "disan": 7, "disant": 1, "disas": 69, "disc": 9, "discs": 8, "dish": 142, "dishan": 5, "dishear": 7, "disht": 1, "disjoi": 1, "disjoin": 6, "disk": 28, "disks": 5, "disli": 4, "dislike": 65, "disliked": 18, "dislikes": 5, "dism": 7, "diso": 58, "disobli": 2, "disons": 1, "disow": 2, "disown": 1, "dist": 25, "distaff": 2, "dists": 5, "disu": 1, "disus": 2, "dit": 174, "dita": 47, "ditch": 33, "dith": 25, "dits": 20, "diu": 1, "diui": 2, "dix": 13, "dixes": 1, "dixie": 5, "dixon": 48, "dixons": 4, "diz": 21, "djak": 1, "djan": 7, "dko": 1, "dle": 5, "dles": 26, "dlesouth": 3, "dlesticks": 1, "dline": 3, "dmo": 1, "dnie": 2, "dnight": 1, "do": 9972, "doa": 1, "dob": 1, "dobbs": 1, "doc": 471, "dock": 26, "docks": 12, "docksi": 2, "docq": 1, "docs": 1, "doct": 20, "dod": 62, "dodd": 3, "doe": 246, "doed": 3, "doeg": 5, "doem": 1, "doer": 15, "doers": 26, "does": 1133, "doest": 49, "doeth": 96, "doeu": 1, "dof": 4, "doff": 2, "dog": 256, "dogs": 125, "doi": 6, "doin": 4, "dois": 1, "dok": 53, "dol": 196, "dolf": 1, "doll": 12, "dolls": 14, "dolp": 17, "dolph": 3, "dom": 1142, "doms": 110, "don": 1695, "dona": 20, "doned": 13, "doner": 1, "doneth": 1, "dong": 3, "dons": 24, "dont": 490, "doo": 74, "dood": 3, "dookiyoon": 2, "dooks": 1, "doole": 1, "dooley": 1, "dooleys": 1, "doolin": 6, "doolins": 1, "doolitt": 3, "doom": 52, "dooms": 2, "doon": 1, "door": 1179, "doors": 230, "doos": 1, "dop": 3, "dopt": 1, "dor": 262, "dorf": 7, "dorff": 5, "doro": 3, "dorr": 3, "dors": 35, "dorus": 3, "dos": 23, "dosa": 8, "dosh": 1, "dosperm": 1, "dost": 104, "dostoe": 3, "dot": 42, "doth": 288, "dothan": 4, "dots": 15, "dou": 318, "doub": 140, "doubt": 521, "doubtful": 85, "doubtfull": 5, "doubts": 57, "doue": 2, "doug": 2, "dough": 41, "doun": 2, "dound": 3, "dounds": 1, "dour": 44, "dours": 7, "dous": 82, "dout": 11, "doux": 4, "dovers": 1, "dow": 887, "dowex": 6, "down": 4006, "downan": 2, "downs": 42, "downy": 4, "dows": 324, "dowy": 23, "dox": 55, "doxes": 1, "doxi": 17, "doxia": 1, "doxo": 2, "doxy": 4, "doy": 6, "dra": 705, "drab": 18, "drach": 19, "draf": 16, "draff": 1, "draft": 25, "drafts": 4, "drag": 125, "dragg": 1, "drags": 4, "drah": 1, "drai": 32, "drain": 27, "drains": 7, "dral": 40, "drals": 9, "dram": 2, "drams": 6, "dran": 8, "drank": 58, "drant": 8, "drants": 1, "dras": 23, "drat": 2, "drau": 3, "draugh": 1, "draught": 18, "draughts": 12, "draw": 304, "drawl": 5, "drawn": 243, "draws": 32, "dray": 8, "drays": 1, "dre": 219, "drea": 190, "dread": 97, "dream": 279, "dreamnext": 1, "dreampt": 1, "dreams": 105, "dreamt": 8, "drear": 2, "dred": 2, "dregs": 8, "drei": 22, "dreis": 2, "dren": 12, "drench": 5, "dres": 355, "dress": 339, "drest": 13, "drew": 324, "drews": 2, "drexel": 10, "drexels": 1, "drey": 9, "dri": 704, "dria": 9, "driac": 1, "drib": 3, "dribs": 1, "dric": 7, "drich": 3, "drid": 12, "drie": 5, "dried": 96, "driedst": 1, "drier": 3, "driers": 3, "dries": 3, "driest": 1, "drieth": 3, "drif": 41, "driff": 1, "drift": 40, "drifts": 12, "drik": 2, "driks": 1, "dril": 29, "drill": 35, "drills": 6, "drils": 2, "drim": 2, "drin": 182, "dringsar": 1, "drink": 553, "drinks": 39, "drip": 43, "drips": 1, "drizz": 11, "dro": 248, "droe": 1, "drof": 3, "droit": 1, "drol": 2, "droll": 12, "dron": 29, "dronk": 2, "dronks": 1, "drons": 16, "droo": 28, "drool": 1, "droom": 65, "drooms": 7, "droon": 1, "droop": 13, "droope": 1, "droopings": 1, "droops": 2, "drop": 455, "drops": 69, "dropt": 30, "dros": 2, "dross": 14, "drou": 5, "drought": 19, "droughts": 2, "droughtsea": 1, "drow": 79, "drown": 31, "drowns": 2, "droxa": 1, "droxi": 2, "droxy": 2, "droxyl": 2, "dru": 12, "drub": 1, "drud": 5, "druff": 30, "druffs": 2, "drug": 62, "drugg": 5, "druggs": 1, "drugs": 49, "druid": 1, "druids": 3, "drum": 76, "drums": 45, "drun": 107, "drunc": 2, "drunk": 103, "drunks": 3, "drury": 5, "drus": 2, "drusil": 1, "dry": 300, "dryad": 1, "dryads": 3, "dryin": 2, "drying": 31, "dsons": 1, "du": 4082, "dua": 3, "dub": 4, "duc": 546, "duck": 33, "ducks": 13, "duct": 311, "ducting": 20, "ducts": 136, "dud": 3, "duds": 2, "dudsd": 1, "due": 381, "dued": 59, "duedst": 1, "dues": 16, "duf": 14, "duff": 2, "dug": 31, "dugda": 1, "dugout": 7, "duh": 2, "duing": 4, "duism": 2, "duits": 1, "dul": 142, "dull": 98, "dulls": 1, "duls": 1, "dum": 53, "dumb": 79, "dumm": 1, "dump": 6, "dumps": 2, "dums": 2, "dun": 106, "dunca": 3, "duncan": 14, "duncans": 3, "dund": 1, "dune": 3, "dunes": 9, "dung": 35, "dunk": 1, "dunn": 6, "dunov": 1, "duns": 2, "dunt": 1, "duo": 12, "duous": 13, "dup": 28, "dups": 3, "dupt": 1, "dur": 5, "durk": 3, "durst": 31, "dus": 61, "dusk": 33, "dust": 243, "dusts": 1, "dustswir": 1, "dusty": 26, "dut": 53, "dutha": 1, "duthun": 14, "duy": 1, "dvo": 1, "dwar": 10, "dwarf": 8, "dwarfs": 5, "dwei": 1, "dwel": 234, "dwell": 412, "dwells": 9, "dwelt": 243, "dwi": 2, "dwight": 12, "dwind": 13, "dwing": 2, "dwood": 6, "dwoods": 2, "dwor": 1, "dwrap": 1, "dwy": 4, "dy": 5633, "dya": 2, "dyd": 2, "dye": 25, "dying": 188, "dyings": 1, "dyn": 1, "dynafac": 4, "dyou": 1, "dys": 90, "dysta": 1, "dysto": 19, "e": 1745, "ea": 1618, "each": 1688, "eag": 24, "ear": 1415, "eardrums": 1, "earl": 18, "earls": 3, "earn": 46, "earning": 13, "earnings": 20, "earns": 3, "earp": 2, "ears": 292, "earsplit": 2, "eart": 17, "earth": 1939, "earthmo": 1, "earths": 18, "eartht": 1, "eas": 87, "east": 523, "easy": 5, "eat": 910, "eath": 1, "eats": 16, "eau": 1, "eb": 10, "ebal": 8, "ebb": 18, "ebbs": 3, "ebe": 3, "ebed": 12, "eben": 1, "eber": 17, "ebias": 3, "ebo": 8, "ebon": 2, "ebook": 28, "ebooks": 18, "ebronah": 2, "ebul": 4, "ec": 94, "eche": 3, "echo": 40, "echoed": 21, "echoes": 28, "echte": 1, "eck": 1, "eclair": 2, "eclat": 5, "eclip": 18, "eclipsing": 1, "eco": 417, "ecol": 1, "ecrop": 1, "ecs": 27, "ecst": 3, "ecsta": 22, "ecu": 34, "ed": 8892, "edar": 1, "edema": 3, "eden": 82, "edens": 1, "eder": 3, "edg": 3, "edi": 306, "edict": 2, "edin": 2, "edisons": 1, "edit": 2, "edith": 4, "edo": 19, "edom": 86, "edrei": 8, "edst": 24, "edu": 421, "edw": 1, "edy": 16, "ee": 51, "eeae": 1, "eed": 6, "eeds": 4, "eeg": 2, "eeighth": 2, "eel": 17, "eels": 5, "eely": 1, "een": 69, "eene": 1, "eens": 7, "eer": 2, "eerie": 5, "ees": 68, "eeu": 3, "eeue": 26, "eey": 4, "ef": 1287, "efel": 12, "eff": 7, "eg": 58, "ega": 2, "eger": 1, "egg": 29, "eggs": 63, "eggsi": 1, "egi": 1, "egils": 1, "eglah": 2, "eglaim": 1, "ego": 30, "egoadap": 1, "egod": 3, "egon": 1, "egos": 1, "egow": 1, "egows": 1, "egress": 4, "egrets": 1, "egt": 2, "egyp": 153, "egypt": 646, "eh": 38, "ehi": 1, "ehlers": 1, "ehren": 1, "ehud": 10, "ei": 843, "eich": 20, "eie": 1, "eif": 1, "eigh": 170, "eight": 288, "eightan": 1, "eightbar": 1, "eightby": 1, "eightfoot": 1, "eighth": 70, "eightpen": 6, "eightthirty": 1, "eightweek": 1, "eii": 5, "eill": 4, "ein": 14, "einch": 6, "eing": 41, "eis": 2, "eish": 1, "eja": 16, "ejec": 5, "eject": 2, "ek": 2, "eka": 1, "eke": 1, "eked": 2, "eker": 1, "eki": 1, "ekro": 2, "ekron": 22, "eks": 1, "ekstrohm": 26, "ekstrohms": 1, "ekwanok": 1, "el": 2597, "ela": 87, "elad": 1, "elah": 17, "elai": 23, "elam": 28, "elan": 1, "elap": 13, "elas": 29, "elath": 5, "elaus": 1, "eld": 2, "ele": 594, "elea": 86, "elead": 1, "elec": 610, "elecs": 2, "elect": 40, "elee": 1, "eleel": 2, "elel": 1, "elen": 1, "elep": 96, "eleph": 1, "eleu": 4, "elf": 1, "eli": 1161, "eliab": 21, "eliah": 4, "elias": 6, "elie": 16, "eliel": 10, "elij": 86, "elim": 6, "elip": 26, "elis": 26, "elisha": 60, "elixir": 1, "elk": 5, "elks": 2, "ell": 21, "ells": 2, "elm": 8, "elms": 5, "elo": 50, "eloi": 4, "elon": 17, "eloth": 3, "els": 115, "elu": 57, "elues": 1, "elul": 1, "ely": 10, "em": 2159, "ema": 19, "email": 3, "emain": 1, "eman": 19, "eme": 30, "emen": 1, "emer": 181, "emerg": 1, "emerods": 8, "emersons": 2, "emi": 70, "emil": 1, "emims": 2, "emins": 1, "emir": 3, "emis": 36, "emit": 9, "emo": 252, "emp": 426, "empt": 3, "emu": 23, "emul": 2, "en": 9315, "ena": 95, "enam": 1, "enan": 5, "end": 1681, "ends": 178, "ene": 673, "ener": 187, "eng": 7, "engh": 1, "eni": 1, "enig": 14, "enjoi": 15, "enjoin": 3, "enjoins": 2, "enn": 1, "eno": 1, "enor": 121, "enos": 8, "enow": 3, "ens": 7, "ent": 55, "entre": 84, "ents": 16, "entwi": 4, "enu": 8, "enun": 3, "enuy": 3, "eo": 3, "ep": 148, "epa": 1, "epamin": 33, "epaphras": 3, "epaphro": 2, "epau": 12, "eph": 1, "ephlal": 2, "ephp": 1, "ephra": 9, "ephrai": 6, "ephraim": 179, "ephrath": 5, "ephron": 13, "epi": 109, "epic": 22, "epics": 7, "epip": 10, "epis": 10, "epist": 40, "episto": 1, "epit": 1, "epoch": 8, "epoxy": 2, "ept": 9, "eq": 2, "eqn": 3, "eqns": 1, "equ": 5, "equa": 137, "equal": 512, "equall": 3, "equals": 22, "equestri": 2, "equi": 138, "equip": 215, "equipt": 2, "equit": 13, "er": 1324, "era": 70, "eran": 2, "eras": 11, "erastus": 3, "erd": 1, "ere": 203, "erec": 48, "erech": 1, "erect": 51, "erects": 1, "erf": 1, "eri": 3, "eric": 3, "erich": 4, "erick": 1, "erie": 9, "erik": 8, "eriksons": 3, "ern": 16, "ernst": 5, "ero": 31, "eroom": 3, "eros": 2, "err": 34, "ers": 397, "erst": 8, "ert": 14, "erts": 1, "eru": 8, "erup": 26, "erupt": 2, "erupts": 1, "erw": 2, "ery": 62, "es": 4859, "esek": 1, "esh": 4, "eshot": 8, "esi": 1, "esn": 1, "esnards": 1, "eso": 4, "esp": 4, "espa": 1, "espied": 6, "esq": 8, "esqui": 3, "esquim": 2, "ess": 3, "est": 299, "estean": 1, "esti": 204, "estic": 1, "et": 573, "eta": 7, "etait": 1, "etam": 5, "etc": 83, "ete": 1, "eted": 1, "eter": 236, "etes": 1, "etext": 3, "eth": 161, "etha": 2, "ethan": 11, "ethe": 30, "ethel": 12, "ether": 10, "ethers": 1, "ethi": 44, "ethic": 4, "ethics": 21, "ethio": 50, "ethiop": 1, "ethnan": 1, "ethos": 4, "ethyl": 4, "eti": 6, "eto": 1, "eton": 30, "etous": 1, "etre": 1, "ets": 9, "etspo": 1, "ett": 4, "etu": 2, "etv": 2, "ety": 120, "eu": 646, "eue": 1, "eun": 2, "euous": 2, "eup": 5, "eur": 29, "eurs": 3, "eus": 51, "eut": 2, "eux": 4, "ev": 6, "eva": 112, "evad": 3, "evan": 171, "evans": 18, "eve": 5134, "even": 3753, "evens": 1, "event": 174, "events": 154, "ever": 2184, "everest": 2, "evi": 452, "evic": 2, "evil": 902, "evils": 47, "evin": 31, "evo": 63, "evol": 18, "evolv": 1, "evs": 1, "evzo": 1, "ew": 1, "ewc": 2, "ewe": 9, "ewen": 1, "ewer": 1, "ewes": 5, "ex": 8048, "exa": 258, "exac": 14, "exact": 417, "exacts": 3, "exag": 47, "exal": 100, "exalt": 33, "exalta": 8, "example": 358, "exampled": 1, "examples": 64, "exas": 28, "exe": 254, "exeat": 1, "exec": 2, "exem": 10, "exemp": 13, "exempt": 13, "exer": 267, "exert": 29, "exerts": 3, "exeunt": 82, "exg": 1, "exgam": 1, "exi": 74, "exil": 1, "exis": 243, "exist": 94, "exists": 55, "exit": 80, "exits": 5, "exjazz": 1, "exmrs": 2, "exo": 35, "exor": 8, "extrea": 1, "exu": 27, "exul": 19, "exult": 5, "exulta": 19, "exur": 1, "exy": 1, "ey": 2019, "eya": 1, "eyd": 1, "eye": 657, "eyear": 1, "eyeglas": 3, "eying": 3, "eyld": 1, "eys": 3, "ez": 64, "ezar": 1, "eze": 8, "ezel": 1, "ezem": 1, "ezer": 9, "ezeus": 1, "ezi": 7, "fa": 9184, "fab": 2, "fac": 709, "fact": 679, "facts": 128, "fad": 5, "fads": 1, "fae": 3, "fael": 1, "fag": 14, "fah": 1, "fahan": 4, "fai": 407, "fail": 173, "fails": 18, "faim": 1, "fain": 80, "faint": 158, "faints": 1, "fair": 923, "fairpri": 1, "fairs": 140, "fairy": 53, "fait": 1, "faith": 718, "faithless": 8, "faiths": 7, "fak": 3, "fal": 839, "fall": 683, "falls": 71, "faloes": 3, "fals": 2, "false": 1, "falstaff": 1, "fam": 1, "fan": 608, "fana": 1, "fand": 1, "fang": 5, "fangs": 5, "fann": 1, "fans": 60, "fant": 41, "fants": 23, "faqui": 1, "far": 2003, "farc": 1, "farct": 1, "fard": 1, "fardul": 1, "farm": 218, "farms": 45, "farn": 1, "farr": 1, "fart": 1, "farthing": 17, "farthings": 1, "fas": 529, "fash": 3, "fast": 664, "fasts": 2, "fat": 337, "fats": 21, "fatsolub": 1, "fau": 10, "faul": 50, "fault": 132, "faults": 46, "faunt": 1, "fauou": 1, "fauour": 7, "fauours": 2, "faus": 3, "faust": 5, "fausts": 2, "faw": 16, "fawn": 4, "fawns": 1, "faws": 1, "fax": 244, "fay": 12, "fayl": 2, "fayt": 7, "fbi": 10, "fda": 2, "fdas": 1, "fe": 8677, "fea": 670, "feal": 4, "fear": 944, "fears": 119, "fearso": 1, "feas": 16, "feasant": 1, "feast": 167, "feasts": 39, "feat": 80, "feats": 12, "feau": 1, "feb": 21, "fec": 894, "fect": 1067, "fecta": 14, "fects": 190, "fed": 215, "feds": 1, "fee": 1086, "feed": 245, "feeds": 22, "feel": 642, "feels": 89, "feely": 1, "feen": 1, "fees": 32, "feet": 896, "fef": 3, "fei": 13, "feig": 36, "feign": 5, "feint": 2, "feints": 1, "feis": 1, "feit": 19, "feits": 1, "fel": 580, "feld": 5, "felix": 102, "felixs": 2, "fell": 644, "felloes": 1, "fels": 1, "felt": 972, "fem": 8, "fen": 767, "fend": 117, "fends": 7, "fens": 9, "fer": 1612, "ferm": 2, "fern": 3, "ferns": 2, "fero": 16, "ferous": 11, "ferr": 4, "fers": 155, "fery": 1, "fes": 825, "fess": 139, "fest": 82, "fet": 89, "fetch": 97, "fetcht": 1, "feth": 4, "fets": 3, "fett": 1, "feu": 24, "feucht": 2, "feud": 3, "feuds": 3, "feuil": 5, "feur": 20, "feurs": 1, "few": 1266, "fey": 4, "fez": 1, "ffa": 1, "ffor": 1, "ffreind": 1, "fha": 3, "fi": 8417, "fia": 18, "fians": 3, "fic": 567, "fich": 3, "fick": 21, "fics": 3, "fid": 28, "fidd": 5, "fiddler": 2, "fiddling": 1, "fidi": 5, "fie": 21, "fied": 1095, "fiedst": 2, "fief": 1, "fieff": 33, "fieffs": 6, "fiel": 15, "field": 995, "fields": 278, "fien": 3, "fiend": 44, "fiends": 8, "fier": 227, "fiers": 15, "fiery": 97, "fies": 76, "fiest": 3, "fieth": 25, "fif": 361, "fift": 1, "fifteen": 111, "fifteene": 1, "fifteenth": 28, "fifth": 131, "fifths": 2, "fig": 129, "figh": 173, "fight": 420, "fights": 14, "figs": 60, "fij": 1, "fik": 1, "fil": 712, "fill": 267, "fills": 15, "film": 105, "filmed": 4, "films": 32, "filmy": 1, "fils": 1, "filt": 3, "filth": 11, "filthi": 16, "filthy": 31, "fim": 4, "fima": 2, "fin": 803, "finch": 1, "find": 1126, "finds": 90, "fing": 56, "fink": 4, "finks": 1, "finn": 13, "fins": 75, "finsb": 8, "fir": 289, "fire": 1213, "fired": 61, "firel": 1, "fires": 64, "firing": 29, "firkins": 2, "firm": 372, "firms": 64, "firs": 2, "first": 3496, "firstaid": 1, "firth": 1, "fis": 547, "fish": 447, "fishmon": 3, "fisk": 2, "fism": 3, "fist": 40, "fisted": 2, "fists": 23, "fit": 633, "fitc": 3, "fitch": 1, "fith": 19, "fiths": 2, "fits": 120, "fitz": 9, "fix": 81, "fixa": 1, "fixe": 3, "fixed": 304, "fixers": 1, "fixes": 6, "fixi": 7, "fixing": 25, "fixt": 4, "fiz": 3, "fizz": 1, "fjords": 2, "fla": 434, "flab": 2, "flac": 1, "flag": 78, "flagg": 1, "flagon": 3, "flagons": 4, "flags": 28, "flai": 7, "flail": 4, "flair": 8, "flak": 2, "flaky": 4, "flam": 142, "flan": 40, "flana": 1, "flank": 19, "flanks": 13, "flap": 45, "flaps": 2, "flas": 81, "flash": 78, "flask": 117, "flat": 313, "flats": 9, "flau": 2, "flaui": 5, "flauio": 1, "flaun": 7, "flaunt": 9, "flavour": 3, "flaw": 23, "flaws": 3, "flax": 24, "flaxen": 5, "flaxs": 3, "flay": 4, "fle": 616, "flea": 8, "fleans": 9, "fleas": 3, "flec": 257, "fleck": 5, "flect": 42, "flects": 23, "fled": 318, "fledg": 2, "fledst": 1, "flee": 115, "fleece": 21, "fleeced": 1, "fleeces": 2, "fleecy": 5, "fleeing": 17, "flees": 1, "fleet": 50, "fleeth": 9, "fleeting": 12, "fleets": 6, "fleis": 2, "fleisch": 5, "flem": 2, "fler": 3, "flers": 3, "fles": 54, "fless": 2, "flet": 7, "flew": 110, "flex": 11, "flexed": 2, "flexes": 6, "flexi": 60, "flexu": 5, "fli": 1, "flic": 241, "flick": 8, "flicks": 1, "flict": 116, "flicts": 14, "flie": 1, "flier": 2, "flies": 51, "flieth": 4, "fligh": 2, "flight": 125, "flights": 22, "flim": 3, "flin": 26, "flinch": 2, "fling": 47, "flings": 2, "flinks": 1, "flint": 15, "flints": 2, "flip": 23, "flips": 1, "flir": 5, "flirt": 2, "flirta": 6, "flit": 17, "flits": 1, "flo": 770, "floc": 9, "flock": 145, "flocks": 95, "floe": 1, "floes": 4, "flog": 20, "flong": 1, "flood": 133, "flooding": 5, "floods": 35, "floor": 294, "floors": 21, "flop": 9, "flops": 1, "flor": 1, "flot": 2, "flou": 76, "floud": 1, "floun": 21, "flour": 75, "flouts": 1, "flow": 153, "flown": 18, "flows": 21, "flowt": 1, "floyd": 2, "floyds": 2, "flu": 447, "flub": 1, "fluc": 8, "flues": 1, "fluf": 4, "fluff": 1, "flui": 3, "fluid": 46, "fluids": 17, "flum": 3, "flun": 1, "flung": 87, "fluous": 18, "flur": 11, "flus": 29, "flush": 25, "flut": 53, "flute": 6, "flutist": 1, "flux": 41, "fluxes": 4, "fly": 380, "flya": 1, "flye": 25, "flyn": 1, "flynn": 2, "fma": 1, "fo": 8204, "foa": 19, "foam": 78, "foame": 2, "foamed": 11, "foameth": 2, "foamin": 1, "foams": 24, "foamy": 5, "fob": 2, "fod": 2, "foe": 87, "foes": 46, "fog": 57, "fogg": 23, "foggs": 3, "fogs": 2, "foh": 3, "foi": 25, "foie": 2, "foil": 32, "fol": 1707, "fold": 154, "folds": 43, "folk": 64, "folks": 49, "folksy": 3, "fon": 11, "fond": 200, "fonds": 1, "font": 2, "foo": 11, "food": 311, "foods": 51, "fool": 212, "foole": 10, "fooles": 8, "foolis": 22, "foolish": 168, "fools": 66, "foon": 3, "foons": 2, "foorth": 6, "foos": 3, "foot": 602, "foote": 7, "footinch": 1, "footing": 13, "foots": 3, "fop": 5, "for": 35328, "forc": 6, "ford": 327, "fords": 25, "forg": 1, "fork": 37, "forks": 13, "form": 1030, "forms": 265, "fors": 38, "forsa": 160, "fort": 662, "forth": 1432, "forthing": 1, "forts": 185, "fos": 67, "foss": 3, "fou": 38, "fough": 1, "fought": 163, "foul": 65, "fouls": 2, "foun": 518, "found": 1921, "founds": 3, "foundst": 1, "fount": 4, "four": 1079, "fouroclock": 2, "fours": 3, "foursqua": 10, "fourt": 1, "fourteen": 71, "fourteenth": 32, "fourteenye": 1, "fourth": 213, "fourths": 2, "fourw": 1, "fovuh": 1, "fow": 8, "fowl": 58, "fowls": 73, "fox": 83, "foxes": 9, "foxs": 1, "foxx": 1, "foy": 12, "fpla": 6, "fra": 299, "frac": 74, "fraca": 1, "fracas": 1, "frag": 62, "frai": 22, "fraid": 4, "frail": 34, "frain": 35, "frains": 1, "fram": 1, "fran": 550, "franc": 1, "frank": 333, "franklin": 106, "franklins": 1, "frankly": 22, "franks": 9, "frans": 3, "franscis": 2, "franz": 2, "fras": 3, "frau": 15, "fraud": 37, "frauds": 8, "fraught": 8, "fray": 24, "frazz": 1, "fre": 478, "frea": 1, "freak": 9, "freaks": 3, "frec": 5, "freckles": 11, "fred": 119, "freds": 5, "free": 932, "freed": 29, "freefo": 1, "freely": 85, "freeport": 1, "freer": 10, "frees": 3, "freest": 5, "freet": 1, "frei": 1, "freigh": 17, "freight": 34, "freightbums": 1, "freightcar": 1, "freightjum": 1, "freights": 2, "frein": 1, "fren": 50, "french": 257, "frend": 1, "frends": 1, "fres": 103, "fresh": 323, "fresht": 1, "fret": 75, "frets": 3, "freu": 3, "freud": 9, "freuds": 2, "frew": 1, "frey": 27, "freya": 3, "freys": 9, "fri": 168, "fria": 3, "friar": 3, "fric": 22, "frick": 3, "frid": 1, "frie": 22, "fried": 13, "frien": 4, "friend": 1064, "friends": 785, "fries": 2, "frigh": 201, "fright": 41, "frightful": 38, "frights": 5, "fril": 1, "frill": 1, "frills": 3, "frin": 59, "frind": 3, "fring": 1, "frings": 1, "fris": 5, "frist": 1, "frit": 11, "frith": 1, "fritz": 2, "frizz": 3, "fro": 216, "froad": 1, "froc": 1, "frock": 31, "frocks": 2, "frog": 31, "frogs": 23, "froid": 2, "frois": 2, "from": 13455, "fromm": 15, "fromms": 15, "fron": 171, "front": 469, "fronts": 20, "fros": 1, "frost": 43, "frosts": 6, "froth": 3, "frow": 42, "frown": 16, "frowns": 1, "fru": 10, "fruc": 3, "frui": 11, "fruit": 451, "fruits": 127, "frun": 1, "frus": 43, "fry": 10, "frying": 4, "fso": 1, "fsupp": 1, "fu": 1792, "fuc": 6, "fuch": 1, "fuchs": 4, "fuck": 4, "fucks": 1, "fud": 1, "fuddled": 3, "fuddling": 1, "fue": 5, "fuego": 1, "fuh": 1, "fuhr": 2, "fuhrer": 1, "fuis": 1, "fuit": 1, "ful": 4014, "full": 1156, "fulls": 2, "fuls": 25, "fum": 20, "fun": 273, "func": 220, "funct": 4, "fund": 101, "funds": 104, "fungal": 1, "funk": 9, "funs": 2, "fur": 868, "furl": 2, "furls": 1, "furs": 7, "furt": 11, "fus": 26, "fusals": 1, "fuss": 14, "fusty": 1, "fut": 1, "futa": 2, "futt": 1, "fuut": 1, "fuz": 10, "fuzz": 3, "fy": 633, "fye": 3, "fyin": 5, "fying": 172, "fyings": 1, "ga": 5881, "gaafer": 1, "gaal": 9, "gaash": 4, "gab": 10, "gabond": 10, "gabonds": 2, "gad": 103, "gae": 14, "gaean": 1, "gaein": 1, "gael": 3, "gaff": 4, "gaffs": 1, "gag": 26, "gags": 2, "gaham": 1, "gahar": 2, "gahn": 1, "gai": 277, "gail": 19, "gain": 204, "gainpri": 1, "gains": 40, "gainsay": 4, "gainsaying": 3, "gainst": 11, "gait": 25, "gak": 1, "gal": 348, "gall": 38, "galls": 5, "gals": 6, "galt": 2, "gam": 66, "gan": 1555, "gand": 21, "gang": 55, "gangs": 10, "gans": 58, "gant": 136, "gants": 3, "ganu": 1, "gap": 33, "gaps": 6, "gapt": 7, "gar": 1504, "garb": 8, "gard": 365, "gards": 22, "garg": 1, "gars": 21, "garstung": 1, "gart": 3, "garth": 14, "garths": 5, "gas": 208, "gasean": 1, "gaseous": 4, "gases": 9, "gash": 8, "gashmu": 1, "gasi": 1, "gasm": 7, "gaso": 1, "gasp": 13, "gaspee": 1, "gast": 4, "gastric": 1, "gastroc": 4, "gastroin": 2, "gat": 635, "gath": 35, "gathering": 2, "gats": 1, "gau": 44, "gaue": 15, "gaul": 5, "gauls": 1, "gaunt": 20, "gaus": 2, "gauss": 2, "gav": 1, "gaw": 3, "gawk": 1, "gay": 146, "gayan": 1, "gayhead": 2, "gays": 4, "gaz": 3, "ge": 14848, "gea": 1, "gean": 15, "gear": 28, "ged": 2803, "geddes": 1, "gedly": 10, "gee": 30, "geeans": 1, "geearning": 1, "geedu": 1, "geeing": 1, "geely": 7, "geelys": 1, "geered": 1, "gees": 11, "geex": 3, "gehead": 2, "gehee": 1, "gehrig": 5, "gei": 2, "geist": 2, "gel": 386, "gell": 6, "gels": 204, "gem": 13, "gems": 12, "gen": 739, "gend": 46, "gends": 21, "gens": 10, "genshr": 1, "gent": 1184, "gents": 24, "geoi": 2, "geois": 5, "geous": 93, "ger": 3392, "geral": 2, "gerald": 9, "gerd": 1, "germ": 6, "germs": 8, "gers": 788, "gersh": 3, "gerst": 1, "gery": 105, "gerys": 1, "ges": 1721, "geship": 1, "gess": 4, "gest": 382, "gesti": 2, "gests": 31, "get": 2320, "getal": 1, "geth": 153, "gether": 1407, "geto": 1, "getry": 1, "gets": 141, "gett": 2, "getz": 1, "getzs": 1, "geu": 1, "geul": 1, "geurs": 4, "gey": 19, "geys": 2, "gez": 1, "gha": 8, "ghan": 4, "ghans": 1, "ghast": 24, "ghauts": 1, "ghent": 2, "gherkins": 1, "ghet": 17, "ghi": 2, "gho": 12, "ghorm": 1, "ghost": 187, "ghosts": 23, "ghoul": 1, "ghouls": 2, "ghum": 3, "gi": 7881, "gia": 76, "giac": 2, "giah": 2, "gians": 37, "gib": 38, "gibbs": 7, "gic": 193, "gick": 1, "gid": 88, "giddal": 2, "giddel": 4, "giddi": 1, "giddings": 1, "giddy": 11, "gidge": 1, "gids": 1, "gie": 75, "gieil": 1, "giel": 5, "gien": 13, "gier": 2, "giers": 3, "gies": 98, "gif": 38, "gift": 126, "gifts": 97, "gig": 16, "gigs": 1, "gii": 1, "gil": 88, "gild": 1, "gilds": 2, "gilgal": 41, "gilk": 1, "gill": 3, "gills": 6, "gilm": 1, "gils": 1, "gilt": 13, "gim": 8, "gime": 23, "gimes": 2, "gin": 1083, "ging": 1671, "gings": 70, "gink": 1, "ginn": 1, "gins": 116, "gio": 23, "gior": 3, "gious": 253, "gip": 29, "gipsies": 14, "gir": 70, "gird": 90, "girds": 1, "girl": 516, "girls": 246, "girt": 11, "girth": 9, "gis": 244, "gisch": 1, "gish": 22, "gism": 1, "gisors": 1, "gist": 46, "gists": 41, "git": 32, "gita": 5, "gith": 5, "giz": 1, "gla": 152, "glad": 514, "glah": 6, "glaim": 1, "glan": 241, "gland": 10, "glands": 6, "glar": 16, "glars": 3, "glas": 106, "glass": 291, "glassfi": 2, "glau": 1, "glay": 1, "glaz": 1, "gle": 521, "glea": 38, "gleam": 16, "gleams": 7, "glean": 14, "glec": 56, "glect": 40, "glects": 2, "gled": 46, "glee": 12, "gleeful": 3, "gleemen": 1, "glees": 1, "gleeso": 1, "gleey": 2, "gleig": 1, "glen": 32, "glenn": 6, "glens": 2, "gles": 39, "glespa": 1, "gless": 2, "gley": 5, "gli": 123, "glia": 1, "glib": 2, "gliest": 1, "glim": 98, "glin": 8, "gling": 83, "glings": 1, "glint": 7, "glints": 2, "glio": 5, "glis": 55, "glish": 430, "glishs": 1, "glit": 57, "glo": 1108, "glob": 1, "gloje": 1, "glom": 1, "gloo": 1, "gloom": 68, "gloomier": 1, "gloomiest": 3, "glooms": 1, "gloomy": 35, "glos": 15, "gloss": 3, "glot": 5, "glou": 8, "glow": 51, "glows": 3, "glu": 20, "glue": 13, "glued": 26, "glug": 1, "glum": 5, "glut": 22, "gly": 851, "glynn": 1, "gna": 16, "gnar": 3, "gnarl": 2, "gnash": 2, "gnashed": 2, "gnasheth": 3, "gnashing": 11, "gnat": 2, "gnaw": 6, "gneiss": 1, "gnet": 2, "gni": 1, "gno": 43, "gnos": 12, "go": 6547, "goa": 11, "goad": 2, "goads": 2, "goag": 1, "goal": 72, "goalo": 1, "goals": 40, "goan": 1, "goans": 2, "goat": 66, "goath": 1, "goats": 104, "goatskins": 1, "gob": 21, "goblin": 7, "goblins": 2, "god": 5846, "goda": 6, "gods": 439, "goe": 38, "goer": 5, "goers": 6, "goes": 286, "goest": 49, "goet": 5, "goeth": 135, "gog": 29, "gogh": 2, "goi": 8, "goids": 1, "goin": 17, "gol": 301, "gold": 735, "goldp": 1, "golds": 15, "golf": 34, "golfs": 3, "golg": 5, "gols": 1, "gom": 1, "gomas": 4, "gomer": 6, "gomez": 2, "gomor": 27, "gompa": 1, "gon": 245, "gong": 7, "gongs": 4, "gons": 64, "goo": 66, "good": 3968, "goodies": 1, "goodis": 4, "goods": 122, "goody": 13, "gooey": 1, "goofed": 1, "gook": 1, "goolick": 1, "gooned": 1, "goons": 2, "goooolick": 1, "goos": 1, "gop": 15, "gor": 162, "gord": 2, "gordo": 1, "gordons": 2, "gored": 4, "gores": 2, "gorky": 1, "goround": 2, "gorous": 85, "gors": 6, "gorss": 5, "gos": 205, "gosh": 4, "got": 1377, "gots": 15, "gott": 12, "gou": 26, "goul": 10, "gould": 2, "goun": 2, "gound": 1, "gour": 29, "gourd": 12, "gourds": 2, "gous": 20, "gout": 10, "gouts": 2, "gov": 19, "gover": 253, "govern": 584, "governing": 25, "governs": 5, "gow": 16, "gown": 52, "gowns": 8, "goy": 2, "gra": 2271, "graal": 2, "grab": 48, "grabs": 3, "grabskis": 1, "grac": 1, "grad": 4, "grads": 2, "graf": 17, "graff": 2, "graft": 5, "grafts": 1, "grai": 8, "grail": 2, "grain": 72, "grains": 25, "grainstor": 1, "gral": 17, "grals": 3, "gram": 497, "gramed": 2, "gramer": 1, "grammop": 1, "grams": 195, "gran": 216, "grand": 354, "grands": 3, "grandsons": 6, "grant": 181, "grants": 50, "grap": 291, "graph": 80, "graphs": 25, "gras": 100, "grasp": 35, "grass": 281, "grassfed": 1, "grassfire": 1, "grat": 2, "gratt": 8, "graue": 20, "graues": 5, "graui": 1, "graunt": 5, "gray": 155, "grayhe": 2, "graying": 4, "grayt": 1, "gre": 5291, "grea": 25, "gred": 9, "gree": 467, "greec": 1, "greed": 9, "greefe": 14, "greek": 108, "greeke": 2, "greeks": 24, "green": 634, "greenock": 1, "greens": 11, "greer": 6, "grees": 93, "greesc": 22, "greesf": 13, "greesk": 1, "greet": 30, "greets": 2, "greeu": 3, "greeue": 5, "greeuous": 2, "greg": 26, "gregg": 3, "grego": 3, "gregs": 10, "grel": 1, "grels": 1, "gren": 1, "greno": 1, "gres": 379, "gress": 380, "gret": 119, "grets": 19, "greux": 1, "grev": 1, "grew": 248, "grews": 1, "grey": 305, "greyhe": 1, "greying": 1, "greys": 1, "gri": 108, "grid": 1, "grie": 181, "grief": 79, "griefs": 4, "grier": 1, "grif": 31, "griff": 1, "griggs": 3, "gril": 9, "grill": 12, "grim": 98, "grimm": 6, "grimms": 1, "grims": 13, "grin": 139, "grind": 24, "grinds": 1, "grins": 7, "grip": 55, "grips": 10, "gris": 31, "grish": 4, "grist": 4, "grit": 7, "grits": 3, "grizz": 10, "gro": 912, "groans": 5, "groes": 67, "grog": 8, "groid": 1, "groin": 5, "grok": 13, "groms": 2, "gron": 2, "groo": 19, "groom": 10, "grooms": 4, "groot": 2, "grooved": 3, "grop": 1, "gros": 59, "gross": 101, "grosss": 1, "grot": 5, "groth": 4, "grots": 1, "grou": 20, "groue": 1, "groun": 18, "ground": 825, "grounds": 118, "group": 434, "groups": 147, "grow": 274, "growl": 11, "growls": 2, "grown": 211, "grownd": 2, "growns": 1, "grownup": 4, "grownups": 4, "grows": 52, "growth": 196, "growths": 14, "gru": 32, "grub": 9, "grubb": 3, "grubs": 2, "grud": 30, "grudg": 1, "gruf": 10, "gruff": 6, "grug": 1, "grul": 1, "grum": 26, "grun": 22, "grunt": 7, "gruous": 10, "gry": 324, "gryphon": 56, "grze": 1, "gtaxis": 1, "gu": 2127, "gua": 5, "guam": 12, "guard": 2, "gub": 3, "gud": 4, "gue": 840, "gued": 78, "gues": 291, "guess": 171, "guest": 68, "guests": 103, "guet": 3, "guetwis": 1, "guey": 1, "guf": 3, "gug": 2, "guh": 1, "gui": 570, "guid": 63, "guif": 1, "guift": 1, "guifts": 1, "guig": 1, "guil": 140, "guild": 28, "guilt": 85, "guin": 4, "guing": 24, "guis": 174, "guish": 104, "guist": 14, "guists": 12, "gul": 42, "gulch": 1, "gulf": 49, "gulfs": 3, "gull": 7, "gulls": 14, "gulp": 5, "gulps": 1, "gum": 28, "gump": 1, "gums": 10, "gun": 427, "guni": 5, "gunk": 1, "guns": 72, "gunshot": 2, "guous": 37, "gup": 1, "gur": 23, "gure": 1, "gurk": 1, "gurs": 1, "gus": 78, "gush": 8, "gusons": 2, "gust": 98, "gusta": 12, "gustas": 1, "gustav": 1, "gusts": 6, "gusty": 3, "gut": 25, "guth": 1, "guts": 13, "guttman": 1, "guv": 1, "guy": 54, "guys": 23, "guzz": 2, "gwen": 1, "gwi": 1, "gwyn": 1, "gy": 735, "gyar": 1, "gyl": 1, "gyll": 1, "gym": 29, "gyms": 2, "gyp": 9, "gys": 1, "gyues": 1, "ha": 18936, "haa": 2, "haaek": 1, "haahash": 1, "haam": 1, "haar": 1, "haath": 4, "hab": 17, "habsburg": 1, "hac": 18, "hach": 5, "hachmo": 2, "hack": 19, "hacksaw": 1, "hackt": 2, "had": 15592, "hada": 1, "hadd": 1, "hadn": 27, "hadst": 36, "hae": 3, "haea": 4, "haec": 2, "hael": 22, "haels": 2, "haes": 1, "haf": 4, "haft": 3, "hag": 47, "hago": 1, "hags": 2, "hah": 123, "hahi": 4, "hahn": 1, "hai": 204, "hail": 103, "hails": 3, "haim": 18, "haims": 2, "hain": 1, "haint": 2, "hair": 519, "hairdres": 1, "hairs": 39, "hairy": 28, "hak": 13, "hakris": 1, "hakup": 2, "hal": 391, "hald": 1, "half": 1429, "halfa": 1, "halfdres": 1, "halfe": 12, "halfs": 2, "halfsis": 1, "halfsmi": 1, "halfstraigh": 1, "halfswam": 1, "hall": 313, "halls": 14, "hals": 7, "halt": 32, "halts": 1, "ham": 1230, "hamd": 1, "hamm": 8, "hamms": 1, "hamp": 28, "hampstead": 3, "hams": 14, "han": 469, "hanch": 5, "hand": 3528, "handd": 1, "hands": 1301, "handsaw": 1, "handsome": 186, "handsomer": 7, "handsomest": 7, "hang": 105, "hangs": 28, "hank": 19, "hann": 2, "hans": 78, "hant": 121, "hants": 26, "hap": 2014, "haph": 3, "haphraim": 1, "haply": 39, "haps": 942, "haq": 1, "har": 2013, "hara": 5, "hard": 1030, "hards": 30, "hardt": 6, "hardtack": 4, "hark": 31, "harks": 1, "harm": 165, "harms": 1, "harp": 82, "harps": 29, "hars": 6, "harsa": 3, "harsh": 42, "harsha": 2, "hart": 234, "harts": 11, "hartz": 1, "has": 4497, "hasa": 1, "hash": 17, "hashmo": 2, "hasn": 12, "hast": 1238, "hasty": 38, "hat": 609, "hatach": 4, "hatch": 38, "hath": 2604, "hathmo": 6, "hats": 46, "hatt": 5, "hau": 81, "haud": 1, "hauds": 1, "haue": 448, "haued": 1, "haug": 2, "haugh": 52, "haui": 4, "hauing": 8, "haul": 24, "hauls": 2, "haumd": 1, "haumds": 1, "haun": 37, "haunt": 19, "haunts": 10, "hauoc": 2, "haupt": 1, "haupts": 1, "haus": 32, "haust": 13, "hausts": 1, "hautboy": 1, "hautboys": 1, "hav": 5, "haw": 82, "hawk": 56, "hawkins": 23, "hawks": 17, "hawkt": 1, "haws": 3, "hawthor": 7, "hawthorn": 9, "haxad": 10, "haxe": 1, "hay": 102, "haya": 12, "haydn": 3, "haydns": 1, "haying": 1, "hayl": 1, "hays": 6, "haystack": 2, "haystacks": 1, "haz": 77, "hbo": 1, "hche": 16, "hchen": 2, "hchev": 68, "hdrew": 27, "he": 43814, "hea": 1022, "head": 2098, "headin": 1, "heads": 331, "hean": 1, "hear": 1881, "heard": 1878, "heardst": 1, "heark": 1, "hearn": 1, "hears": 35, "hearsay": 2, "hearst": 48, "hearsts": 6, "heart": 1706, "hearth": 26, "hearts": 235, "heat": 206, "heau": 2, "heauen": 68, "heauens": 19, "heaues": 1, "heaui": 2, "heauie": 7, "heauy": 7, "hec": 14, "hech": 8, "heck": 2, "hed": 2938, "hedei": 1, "heds": 4, "hedwig": 4, "hee": 239, "heed": 137, "heeds": 3, "heel": 51, "heeldri": 1, "heels": 51, "heen": 1, "heer": 3, "hees": 5, "heet": 1, "hef": 4, "heft": 1, "hefts": 1, "heg": 4, "hei": 62, "heid": 6, "heig": 1, "heigh": 33, "height": 169, "heights": 35, "heightto": 1, "heil": 2, "heim": 15, "hein": 8, "heinous": 4, "heinz": 1, "heir": 57, "heirs": 18, "heis": 3, "heism": 5, "heist": 40, "heister": 6, "heistic": 6, "heists": 13, "heit": 1, "heits": 1, "hek": 12, "hel": 552, "held": 682, "heldst": 2, "hell": 398, "hells": 6, "helm": 74, "helmed": 21, "helms": 5, "help": 796, "helps": 36, "hels": 6, "helsqiyo": 1, "hem": 116, "hemm": 5, "hemp": 28, "hempstead": 3, "hems": 4, "hen": 982, "hend": 72, "hendl": 3, "hengshan": 1, "henh": 1, "henoch": 2, "hens": 16, "henss": 2, "hent": 1, "hep": 16, "heph": 1, "heptach": 1, "her": 15653, "herb": 41, "herbs": 29, "herd": 179, "herds": 110, "heri": 354, "heric": 14, "heries": 6, "hering": 13, "herit": 72, "herits": 2, "hern": 169, "hero": 12, "herod": 48, "heroes": 76, "heroi": 11, "heroic": 40, "heroick": 9, "heroics": 2, "heroin": 2, "herois": 1, "heroism": 13, "herons": 4, "herpri": 1, "herr": 16, "hers": 182, "herself": 1096, "hersha": 2, "hertford": 2, "hertz": 3, "heru": 1, "hery": 76, "herz": 1, "hes": 1029, "hesce": 2, "hesh": 40, "heshmon": 1, "hespe": 14, "hespot": 1, "hess": 1, "hest": 222, "het": 320, "heth": 101, "heti": 1, "hets": 254, "heu": 4, "heur": 1, "heus": 3, "hev": 2, "hew": 68, "hewn": 24, "hews": 19, "hex": 2, "hexa": 8, "hexen": 1, "hey": 74, "heyear": 1, "heys": 1, "hez": 29, "hi": 2097, "hia": 79, "hiah": 21, "hians": 1, "hib": 17, "hic": 103, "hick": 19, "hicks": 1, "hid": 194, "hie": 19, "hied": 3, "hiel": 23, "hield": 7, "hiell": 3, "hier": 46, "hies": 29, "hiest": 19, "hif": 1, "hift": 7, "hifts": 1, "hig": 511, "high": 2004, "highle": 4, "highleg": 1, "highmin": 4, "highpri": 5, "highre": 1, "highrep": 2, "highroad": 6, "highs": 3, "highsoun": 2, "hight": 1, "hightai": 1, "highth": 16, "hii": 1, "hij": 7, "hik": 8, "hil": 57, "hild": 1, "hill": 420, "hills": 232, "hils": 5, "hilt": 10, "hilts": 3, "him": 15682, "himm": 1, "hims": 2, "himsel": 43, "himself": 2305, "hin": 254, "hind": 751, "hing": 1262, "hings": 22, "hinn": 14, "hins": 9, "hint": 82, "hints": 52, "hinx": 3, "hip": 497, "hipp": 2, "hips": 93, "hir": 3, "hircan": 1, "hirsch": 31, "hirschey": 1, "hirschs": 1, "hirty": 1, "his": 29098, "hish": 3, "hiss": 32, "hist": 10, "hit": 279, "hitch": 8, "hith": 2, "hits": 28, "hitz": 2, "hiuchus": 1, "hiz": 3, "hkad": 1, "hless": 1, "hna": 1, "hnah": 2, "hnan": 2, "hnand": 5, "hnaphta": 1, "hne": 3, "hner": 1, "hni": 6, "hnsons": 10, "ho": 6618, "hoa": 31, "hoag": 21, "hoar": 6, "hob": 43, "hoc": 6, "hock": 3, "hocks": 5, "hod": 83, "hodg": 3, "hods": 1, "hoe": 28, "hoea": 4, "hoeck": 1, "hoed": 2, "hoedown": 1, "hoef": 1, "hoes": 5, "hof": 5, "hofer": 1, "hoff": 3, "hoffs": 1, "hog": 27, "hogmor": 1, "hogs": 12, "hohl": 9, "hoi": 146, "hoia": 11, "hoids": 1, "hoist": 12, "hokan": 1, "hoky": 3, "hol": 654, "hold": 2397, "holds": 154, "holdst": 1, "holdt": 1, "holdts": 1, "holf": 1, "holm": 5, "holo": 2, "holon": 3, "holp": 1, "hols": 2, "holt": 2, "holts": 1, "holz": 1, "hom": 18, "hon": 130, "hond": 1, "hong": 12, "honk": 1, "hons": 3, "hoo": 36, "hooch": 1, "hood": 402, "hoods": 33, "hooey": 1, "hoof": 20, "hoofand": 1, "hoofs": 22, "hoog": 2, "hook": 50, "hooks": 35, "hookup": 2, "hookups": 1, "hoop": 13, "hoops": 15, "hoor": 3, "hoosac": 1, "hoosier": 2, "hoot": 18, "hooting": 2, "hootings": 1, "hoots": 3, "hoover": 8, "hop": 152, "hophra": 1, "hopk": 2, "hopkins": 26, "hops": 21, "hor": 1370, "hora": 6, "hord": 1, "horn": 127, "horns": 104, "hors": 8, "horst": 1, "hort": 18, "horta": 11, "horts": 2, "hos": 389, "hoshea": 11, "hosp": 8, "hoss": 5, "host": 322, "hosts": 314, "hot": 316, "hoth": 2, "hothan": 1, "hots": 1, "hotshot": 2, "hou": 4678, "houe": 1, "houg": 4, "hough": 375, "houghs": 2, "hought": 6, "houk": 3, "houl": 2, "houn": 21, "hound": 13, "hounds": 15, "houns": 1, "hour": 647, "hours": 402, "hous": 38, "hout": 2498, "houts": 1, "houtz": 2, "houzz": 1, "hov": 2, "how": 3687, "howd": 3, "howe": 1237, "howell": 1, "hower": 54, "howers": 11, "howes": 1, "howl": 47, "howls": 7, "hows": 12, "howsam": 1, "hoxa": 1, "hoy": 4, "hoyt": 4, "hoz": 2, "hri": 1, "hriel": 1, "hro": 2, "hrough": 1, "hta": 7, "hu": 1423, "hua": 266, "huah": 3, "hub": 29, "hubah": 1, "hubay": 1, "hubb": 1, "hubs": 2, "huck": 5, "hud": 75, "hudd": 6, "huddled": 13, "huddling": 3, "hudsons": 16, "hue": 27, "hued": 8, "hues": 15, "huey": 1, "huff": 15, "huffs": 1, "hug": 62, "hugg": 1, "hugh": 9, "hugos": 1, "huh": 19, "huhmun": 2, "hui": 2, "huing": 1, "huit": 1, "huk": 1, "hul": 44, "huld": 2, "hulk": 3, "hulks": 3, "hull": 49, "hulls": 8, "hult": 1, "hum": 259, "humh": 1, "humid": 6, "hump": 33, "humph": 7, "humphrey": 6, "humps": 1, "hums": 3, "hun": 492, "hunch": 12, "hund": 1066, "hung": 177, "hungri": 2, "hunk": 2, "hunks": 3, "hunt": 67, "hunts": 6, "hup": 16, "huphan": 1, "hups": 4, "hur": 455, "hurd": 6, "hurl": 5, "hurt": 198, "hurts": 10, "hurty": 1, "hus": 649, "husael": 2, "hush": 44, "hushta": 1, "husk": 4, "husks": 5, "hust": 12, "hut": 54, "huth": 1, "huts": 12, "hux": 8, "huy": 5, "huz": 40, "hval": 1, "hvalt": 2, "hwal": 1, "hwang": 4, "hwas": 1, "hy": 1011, "hye": 2, "hyl": 2, "hylas": 1, "hym": 5, "hymn": 17, "hymns": 23, "hymsel": 1, "hyn": 2, "hynd": 1, "hynx": 3, "hyp": 7, "hyr": 4, "hys": 59, "hytt": 1, "hyxi": 1, "hzi": 3, "i": 36431, "ia": 5, "ian": 1, "iang": 1, "iaw": 2, "ib": 23, "ibe": 1, "ibi": 2, "ibid": 3, "ibis": 1, "ibleam": 3, "ibm": 8, "ibn": 2, "ibra": 4, "ibri": 1, "ica": 1, "icas": 1, "icbm": 3, "icbms": 4, "icc": 1, "ice": 146, "iced": 2, "ich": 1, "icha": 2, "ici": 8, "icing": 1, "ick": 1, "ico": 7, "icy": 25, "id": 282, "ida": 9, "idal": 1, "ide": 359, "idea": 495, "ideaex": 1, "ideals": 20, "ided": 2, "idee": 1, "iden": 287, "ides": 8, "idi": 69, "idie": 1, "ido": 25, "idol": 49, "idoli": 4, "idoll": 1, "idols": 110, "idu": 5, "idyl": 4, "idyll": 2, "idyls": 1, "ie": 60, "ieering": 1, "iel": 1, "iem": 1, "iephta": 3, "iers": 1, "ies": 1, "iest": 7, "iew": 1, "if": 7444, "ifaith": 2, "ifs": 1, "ig": 278, "igal": 2, "ige": 1, "ight": 13, "igle": 1, "igo": 1, "igor": 3, "ihm": 1, "ii": 68, "iig": 3, "iii": 30, "iij": 1, "iim": 2, "iith": 1, "ij": 5, "ije": 2, "ijon": 3, "ik": 7, "ike": 4, "iks": 2, "il": 423, "ilai": 1, "ile": 108, "ilex": 1, "ili": 1, "iliac": 1, "iliad": 17, "ill": 599, "ills": 11, "ilo": 1, "ils": 4, "ilyus": 1, "im": 4389, "ima": 924, "imag": 1, "ime": 1, "imf": 1, "imi": 35, "imita": 35, "imp": 15, "imps": 1, "ims": 1, "in": 81794, "inapt": 1, "inc": 20, "inch": 126, "incht": 1, "ind": 7, "ine": 14, "ing": 2976, "ingame": 3, "ings": 116, "ini": 163, "ink": 30, "inks": 2, "inn": 96, "ino": 3, "ins": 7, "insin": 8, "inss": 1, "int": 42, "inth": 3, "intre": 45, "inui": 1, "io": 96, "iodop": 1, "ion": 197, "ions": 9, "iot": 2, "iou": 1, "ioue": 2, "ioui": 1, "iour": 2, "iow": 1, "ioy": 23, "ioyn": 3, "ioynt": 5, "ip": 2, "iq": 6, "ir": 348, "ira": 13, "irad": 2, "irae": 1, "iraj": 1, "iram": 2, "iran": 2, "iraq": 3, "iras": 1, "ire": 88, "iri": 4, "irij": 2, "iris": 3, "irish": 49, "irksome": 8, "iro": 71, "iron": 332, "ironpoor": 1, "irons": 29, "irs": 3, "irsac": 4, "iru": 1, "irv": 1, "is": 30418, "isa": 95, "isai": 36, "ish": 125, "ishme": 1, "ishtar": 1, "ishtob": 2, "isido": 3, "isin": 3, "isis": 3, "islip": 1, "ism": 5, "isn": 63, "iso": 114, "isol": 1, "ist": 8, "isthmus": 4, "ists": 1, "isuah": 1, "isui": 1, "it": 31129, "ita": 172, "itas": 1, "itch": 8, "itd": 3, "ite": 7, "item": 65, "items": 81, "ith": 6, "ithnan": 1, "ithra": 1, "ithran": 3, "ithrite": 4, "ithrites": 1, "ithu": 3, "iti": 4, "ito": 1, "itoiz": 1, "its": 3451, "itself": 682, "itu": 1, "ity": 1, "iud": 23, "iudi": 2, "iug": 2, "iuli": 5, "ium": 2, "ius": 6, "iust": 11, "iut": 1, "iuva": 1, "iuy": 1, "iv": 21, "ivah": 3, "ivan": 4, "ive": 125, "ives": 2, "ivies": 2, "ivli": 1, "ivo": 93, "ivy": 11, "ix": 12, "ixi": 1, "iz": 16, "izaak": 3, "izaaks": 3, "ize": 2, "ja": 1624, "jaak": 3, "jaako": 1, "jaal": 5, "jaala": 1, "jaan": 1, "jaar": 1, "jaasau": 1, "jaasiel": 1, "jaaza": 4, "jaazer": 2, "jaaziah": 2, "jaaziel": 1, "jab": 19, "jabs": 1, "jac": 108, "jack": 303, "jacks": 16, "jad": 3, "jae": 1, "jael": 8, "jaf": 3, "jag": 21, "jags": 1, "jah": 19, "jahr": 2, "jahs": 2, "jai": 9, "jail": 29, "jails": 5, "jair": 13, "jak": 1, "jam": 28, "jamb": 2, "jambs": 2, "jams": 2, "jan": 34, "jang": 5, "jans": 4, "jap": 17, "japhle": 1, "japhlet": 3, "japho": 1, "japs": 5, "jar": 72, "jars": 7, "jas": 24, "jastrow": 11, "jat": 14, "jath": 1, "jaun": 5, "jav": 1, "jaw": 90, "jaws": 60, "jay": 44, "jaz": 1, "jazz": 105, "je": 2126, "jean": 23, "jeans": 1, "jeb": 1, "jebb": 1, "jec": 636, "ject": 880, "jecta": 1, "jects": 341, "jed": 8, "jeds": 1, "jee": 10, "jeep": 16, "jeer": 3, "jeerin": 1, "jeering": 2, "jeers": 2, "jef": 38, "jeff": 3, "jehdei": 2, "jei": 11, "jelke": 7, "jelli": 1, "jellied": 1, "jellies": 9, "jelly": 9, "jem": 125, "jen": 271, "jenk": 1, "jenkins": 9, "jenks": 6, "jens": 1, "jep": 16, "jepht": 30, "jer": 87, "jerah": 12, "jerk": 11, "jerks": 2, "jerky": 4, "jes": 1212, "jess": 33, "jesss": 14, "jest": 5, "jestic": 33, "jestick": 1, "jesty": 81, "jestys": 1, "jet": 74, "jeth": 1, "jether": 8, "jets": 21, "jetur": 3, "jeu": 5, "jeush": 8, "jeuz": 1, "jew": 100, "jews": 316, "jez": 51, "ji": 23, "jib": 7, "jibs": 3, "jid": 2, "jif": 6, "jiff": 1, "jig": 15, "jigs": 2, "jil": 20, "jim": 61, "jims": 4, "jin": 15, "jing": 2, "jinx": 1, "jipht": 2, "jiphtah": 1, "jist": 13, "jit": 5, "jith": 1, "jiu": 1, "jo": 2147, "joa": 1, "joab": 145, "joans": 2, "joaquin": 1, "joash": 49, "joat": 2, "job": 329, "jobs": 68, "jobste": 1, "joc": 6, "jock": 1, "joe": 174, "joed": 1, "joel": 33, "joels": 2, "joes": 8, "joey": 2, "jog": 5, "jogs": 2, "joi": 254, "joie": 1, "join": 203, "joins": 9, "joint": 76, "joints": 39, "joist": 3, "joists": 3, "jok": 12, "jokshan": 4, "jokt": 2, "joky": 3, "jol": 74, "jold": 16, "jolds": 5, "jolt": 6, "jolts": 1, "jon": 5, "jongg": 1, "joo": 2, "jop": 22, "jor": 500, "jors": 5, "jos": 232, "josap": 2, "josh": 2, "joss": 1, "jost": 5, "jot": 41, "joth": 3, "jou": 6, "jour": 419, "jourd": 1, "journ": 47, "journing": 6, "journs": 1, "jours": 1, "joust": 2, "jow": 1, "jowl": 2, "jowls": 4, "joy": 892, "joying": 42, "joyous": 45, "joys": 86, "ju": 3363, "jub": 2, "juet": 8, "juets": 3, "jug": 24, "juh": 1, "jui": 34, "julep": 2, "jum": 141, "jump": 74, "jumps": 6, "jun": 50, "junc": 61, "junct": 7, "juncts": 2, "juncus": 1, "jung": 5, "junk": 13, "junks": 3, "juns": 2, "junt": 2, "jus": 586, "just": 2403, "justa": 2, "justs": 2, "jut": 5, "jux": 5, "jyj": 1, "jym": 1, "ka": 604, "kaa": 1, "kab": 4, "kad": 1, "kaf": 5, "kaga": 1, "kah": 9, "kahn": 1, "kahns": 1, "kai": 7, "kaishek": 1, "kaisheks": 1, "kak": 1, "kal": 3, "kalmuk": 1, "kam": 1, "kamins": 1, "kamt": 1, "kamu": 3, "kan": 21, "kang": 1, "kanga": 1, "kans": 4, "kansas": 64, "kansasne": 1, "kansaw": 1, "kant": 6, "kap": 9, "kaque": 1, "kar": 18, "kard": 27, "kards": 14, "kareah": 13, "karl": 10, "karns": 8, "karps": 1, "karsner": 2, "kas": 8, "kasa": 5, "kasai": 2, "kashme": 1, "kasov": 3, "kast": 1, "kasy": 1, "kat": 31, "katan": 21, "katangan": 1, "katangans": 2, "kath": 4, "katoa": 1, "kats": 1, "kau": 2, "kauf": 2, "kauff": 1, "kaw": 1, "kawec": 1, "kay": 21, "kaya": 16, "kayo": 1, "kaz": 2, "ke": 16538, "kear": 9, "keb": 1, "ked": 4388, "kedst": 2, "kee": 505, "keeee": 1, "keel": 46, "keels": 9, "keen": 58, "keep": 1000, "keeps": 45, "kees": 38, "keet": 2, "keets": 1, "keg": 6, "kegs": 1, "keh": 19, "kehl": 11, "kei": 45, "keing": 1, "kel": 164, "kell": 2, "kells": 1, "kelp": 2, "kels": 99, "kelsons": 1, "kelt": 2, "kelts": 1, "kem": 17, "kemm": 1, "ken": 3013, "kened": 121, "kenedst": 1, "keneth": 3, "keng": 1, "kening": 14, "kens": 78, "kent": 22, "keo": 4, "kept": 625, "ker": 859, "kera": 2, "keray": 2, "keries": 4, "kern": 8, "kerous": 2, "kerr": 5, "kers": 443, "kersh": 1, "kery": 26, "keryg": 3, "kes": 1322, "kesh": 3, "kespe": 2, "kest": 180, "kestraw": 1, "kestri": 1, "ket": 1010, "keted": 5, "keth": 548, "keting": 1, "kets": 313, "kett": 38, "ketts": 5, "keturah": 4, "keup": 11, "kew": 5, "key": 379, "keye": 1, "keying": 1, "keys": 58, "keyss": 3, "kez": 1, "kezia": 1, "keziz": 1, "kha": 7, "khan": 3, "khart": 1, "khead": 3, "khi": 1, "khmer": 1, "khou": 1, "khrus": 84, "khrush": 1, "ki": 217, "kia": 1, "kiah": 231, "kiang": 1, "kib": 2, "kic": 33, "kick": 102, "kicks": 7, "kid": 163, "kidd": 25, "kidron": 11, "kids": 53, "kie": 34, "kief": 3, "kiel": 6, "kier": 2, "kies": 16, "kij": 2, "kil": 372, "kild": 1, "kill": 363, "kills": 15, "kiln": 7, "kilt": 40, "kilts": 1, "kim": 70, "kimp": 4, "kims": 9, "kin": 276, "kind": 1343, "kinds": 76, "king": 9075, "kingout": 1, "kings": 522, "kingsto": 2, "kink": 2, "kins": 54, "kio": 2, "kip": 8, "kir": 62, "kirk": 22, "kirks": 4, "kirs": 2, "kirts": 6, "kis": 120, "kish": 57, "kiss": 69, "kist": 1, "kit": 201, "kith": 3, "kits": 1, "kitt": 1, "kiy": 1, "kiyus": 1, "kiz": 8, "kla": 1, "klan": 3, "kland": 2, "klash": 1, "klatshoul": 1, "klau": 2, "klaus": 1, "klaxon": 1, "kle": 79, "kled": 59, "kleenex": 1, "klees": 2, "klei": 1, "klein": 1, "kleist": 1, "klem": 1, "kles": 24, "kless": 4, "klet": 1, "kli": 8, "klies": 3, "klimt": 1, "klin": 11, "kling": 76, "klings": 12, "klins": 2, "klo": 31, "kluck": 1, "klux": 3, "kly": 61, "kna": 17, "knack": 8, "knacks": 1, "knackwurst": 1, "knap": 6, "knapp": 1, "knau": 3, "knaue": 9, "knaues": 1, "knauish": 2, "kne": 16, "knea": 2, "knead": 3, "knecht": 1, "knee": 84, "kneel": 13, "kneele": 3, "kneeled": 11, "kneeles": 1, "kneeling": 22, "kneels": 4, "kneepans": 1, "knees": 130, "kneety": 2, "knei": 2, "knell": 4, "knelt": 19, "kneph": 1, "kner": 21, "kners": 9, "knew": 1143, "kney": 1, "kni": 37, "knic": 2, "knick": 1, "knife": 165, "knifeed": 1, "knigh": 4, "knight": 25, "knightfall": 1, "knightley": 389, "knightleys": 7, "knightly": 2, "knights": 23, "knills": 1, "knit": 55, "knite": 1, "knits": 2, "kno": 484, "knob": 13, "knobs": 3, "knoc": 49, "knock": 133, "knocks": 5, "knockt": 1, "knoe": 1, "knoll": 6, "knop": 10, "knops": 9, "knot": 53, "knots": 12, "knott": 1, "know": 4263, "knowl": 3, "known": 1065, "knowns": 1, "knownst": 2, "knows": 283, "knox": 7, "knuc": 3, "knuckle": 4, "knuckles": 12, "ko": 272, "koa": 7, "koam": 1, "kob": 2, "koch": 1, "kod": 2, "koe": 4, "koehler": 3, "koff": 3, "koffs": 1, "kog": 1, "koh": 1, "koi": 8, "kok": 5, "kol": 2, "kolb": 1, "kold": 1, "kolk": 4, "kom": 5, "koma": 1, "kon": 9, "kong": 15, "konk": 2, "koo": 2, "kooks": 1, "kool": 1, "koon": 3, "koop": 1, "kop": 2, "kopf": 7, "kor": 11, "korn": 5, "kos": 14, "kosh": 2, "kous": 4, "kout": 9, "kouts": 4, "kow": 6, "kows": 1, "koy": 1, "koz": 5, "kqed": 1, "kra": 6, "krae": 1, "kraft": 1, "krapps": 1, "krasnik": 1, "krat": 5, "krau": 1, "kraut": 5, "krauts": 1, "kreis": 1, "krem": 14, "kretchmer": 2, "krim": 17, "krims": 9, "kris": 3, "kriss": 1, "krist": 1, "kro": 11, "kroe": 1, "kru": 2, "kruger": 6, "krugers": 2, "krumpp": 1, "krusen": 3, "krut": 5, "krystal": 4, "ksar": 1, "ksuupe": 1, "ku": 13, "kub": 8, "kuk": 3, "kul": 5, "kunkel": 2, "kunkels": 2, "kunst": 1, "kup": 29, "kur": 1, "kurd": 1, "kuri": 1, "kurt": 1, "kus": 4, "kut": 2, "kuts": 8, "kuyu": 3, "kwa": 1, "kwal": 2, "kwan": 1, "kwas": 1, "kwea": 1, "kwell": 3, "kwells": 2, "ky": 419, "kya": 1, "kyo": 1, "kys": 6, "la": 9379, "laad": 7, "laadah": 1, "laam": 67, "laams": 3, "lab": 4, "lac": 93, "lach": 1, "lack": 169, "lacks": 10, "lacs": 2, "lad": 236, "ladeth": 1, "lads": 45, "lae": 10, "laea": 1, "laean": 3, "laeans": 5, "lael": 1, "laend": 1, "laer": 99, "laers": 1, "lafay": 13, "lafon": 1, "lag": 35, "lagg": 1, "lagh": 1, "lagoes": 10, "lagoon": 16, "lagoons": 3, "lagow": 1, "lags": 5, "lah": 228, "lahk": 1, "lahmi": 1, "lahs": 1, "lai": 104, "laic": 12, "laid": 507, "laidst": 1, "laim": 1, "lain": 59, "lains": 25, "lair": 4, "lairs": 1, "lais": 22, "laish": 7, "lak": 47, "lal": 12, "lalau": 21, "lam": 66, "lamb": 198, "lambs": 100, "lamp": 114, "lampoon": 1, "lamps": 66, "lams": 1, "lan": 1159, "lanct": 1, "land": 3734, "landau": 10, "lands": 450, "landsli": 5, "landt": 3, "lane": 10, "lang": 21, "langs": 6, "lanins": 1, "lank": 7, "lanous": 3, "lans": 4, "lant": 90, "lants": 5, "lanx": 9, "lao": 22, "laou": 1, "lap": 148, "laph": 2, "lapp": 2, "lapro": 1, "laps": 9, "lapsi": 1, "lapsing": 7, "lapt": 1, "lar": 3378, "lard": 22, "lards": 2, "larg": 2, "largd": 1, "lark": 20, "larkins": 15, "larks": 18, "larms": 1, "larning": 1, "lars": 368, "larsons": 1, "las": 501, "lasar": 3, "lash": 17, "lashe": 1, "lass": 50, "lasswitzs": 1, "last": 2030, "lastree": 1, "lasts": 7, "lat": 290, "lata": 3, "latch": 12, "late": 1, "lath": 6, "lats": 2, "lau": 125, "laud": 1, "laue": 2, "laug": 396, "laugh": 323, "laugheth": 2, "laughs": 16, "laught": 1, "lauish": 1, "laun": 61, "launch": 28, "launching": 5, "launchings": 1, "laundress": 1, "laus": 1, "lausan": 1, "lautner": 3, "lavoi": 1, "law": 1156, "lawn": 45, "lawns": 10, "laws": 181, "lax": 28, "laxa": 8, "laxed": 19, "laxes": 3, "laxies": 7, "laxing": 6, "laxy": 4, "lay": 937, "layas": 4, "laying": 69, "layings": 1, "layn": 1, "lays": 39, "layup": 1, "laz": 15, "lbday": 1, "lbplus": 1, "le": 25193, "lea": 2363, "leab": 1, "leach": 2, "lead": 425, "leads": 60, "leaf": 68, "leah": 34, "leak": 25, "leaks": 9, "leaky": 8, "leam": 2, "lean": 113, "leans": 66, "lear": 228, "learn": 230, "learning": 98, "learns": 14, "learnt": 32, "lears": 1, "leas": 8, "leash": 7, "least": 859, "leau": 1, "leaue": 60, "leaues": 5, "leauing": 1, "leauy": 1, "leav": 3, "leax": 1, "leb": 118, "lec": 872, "lech": 115, "leck": 3, "leco": 4, "lect": 174, "lecta": 2, "lects": 24, "led": 6424, "ledg": 17, "ledst": 8, "ledu": 4, "lee": 188, "leech": 2, "leed": 2, "leeds": 4, "leefe": 7, "leeks": 1, "leel": 18, "leen": 13, "leep": 99, "leer": 4, "leered": 3, "leering": 8, "leers": 2, "lees": 25, "leet": 1, "leex": 1, "lef": 5, "leff": 1, "left": 1522, "leful": 5, "leg": 314, "legal": 105, "lego": 8, "leground": 2, "legs": 177, "leh": 14, "lehear": 2, "lehs": 2, "lei": 117, "leicht": 1, "leigh": 4, "leil": 2, "leim": 1, "lein": 1, "leis": 1, "leit": 2, "lek": 29, "lekoth": 1, "lel": 56, "leled": 6, "lels": 6, "lem": 951, "lemn": 155, "lems": 3, "len": 1504, "lena": 1, "lenand": 1, "lenc": 1, "lend": 56, "lends": 6, "leng": 27, "lenghet": 1, "length": 422, "lengthi": 1, "lengths": 39, "lengthy": 11, "lenins": 1, "lenk": 1, "leno": 1, "lenoid": 1, "lens": 19, "lenses": 5, "lent": 1183, "lentchoi": 1, "lentils": 2, "lents": 113, "leo": 14, "lep": 116, "leph": 3, "lepi": 8, "leps": 1, "lept": 1, "ler": 993, "lerons": 1, "lerop": 1, "lers": 377, "lery": 101, "lerys": 3, "les": 3647, "lesa": 10, "leship": 6, "leships": 2, "lesi": 2, "lesis": 1, "lesla": 3, "lesna": 10, "leso": 45, "lespie": 3, "lespont": 1, "lesqua": 1, "lesque": 2, "lesques": 1, "less": 2828, "lesssteel": 1, "lesst": 1, "lest": 551, "lesta": 3, "lestick": 50, "lesticks": 14, "let": 4427, "letch": 21, "letchs": 2, "leter": 1, "leth": 114, "lethor": 1, "leths": 3, "leti": 1, "lets": 226, "lett": 14, "letum": 1, "lety": 1, "leu": 8, "leui": 3, "leuie": 1, "leur": 2, "leux": 1, "leuying": 1, "lev": 2, "levers": 1, "lew": 4, "lewd": 29, "lews": 2, "lex": 10, "lexan": 1, "lexi": 15, "ley": 693, "leyn": 1, "leys": 98, "lez": 10, "lfled": 2, "lfles": 1, "lfor": 1, "lfree": 4, "lfriend": 1, "lfrogs": 2, "lhe": 1, "li": 24736, "lia": 382, "liab": 5, "liac": 1, "liah": 73, "lians": 17, "liar": 288, "lib": 29, "lic": 269, "lich": 3, "lick": 60, "licks": 4, "licop": 2, "lics": 63, "lict": 2, "licts": 1, "lid": 342, "lids": 55, "lie": 1947, "liear": 1, "lieb": 10, "lied": 143, "lief": 255, "liefs": 28, "liel": 10, "lien": 6, "liens": 1, "lient": 8, "lier": 222, "liers": 16, "lierthant": 2, "lies": 646, "liest": 112, "liet": 5, "lieth": 59, "liev": 3, "lif": 416, "liff": 8, "lift": 176, "lifts": 6, "lig": 29, "ligh": 416, "light": 1644, "lightco": 2, "lightdu": 1, "lightfla": 1, "lightfoot": 33, "lightful": 131, "lightly": 74, "lightmin": 1, "lightnes": 1, "lightness": 11, "lightning": 89, "lightningoc": 1, "lightnings": 19, "lightre": 1, "lights": 164, "lightso": 2, "lightty": 1, "lightweight": 8, "lign": 8, "lihs": 1, "lik": 1, "lil": 43, "lilac": 23, "lilt": 4, "lim": 66, "limb": 29, "limbs": 62, "limn": 3, "limp": 15, "limpid": 8, "limps": 1, "lims": 2, "lin": 716, "line": 46, "lined": 12, "liners": 1, "lines": 26, "liness": 46, "ling": 3864, "lingame": 1, "linghe": 1, "lingr": 1, "lings": 548, "lingspi": 2, "link": 29, "links": 16, "lins": 42, "lint": 7, "linz": 1, "lio": 33, "liou": 2, "lious": 70, "lioz": 1, "lip": 281, "lipa": 2, "liphs": 1, "lipp": 6, "lipps": 1, "lips": 329, "lir": 2, "lis": 1146, "lisch": 2, "lish": 145, "lisha": 2, "lisk": 7, "lisks": 2, "lism": 285, "lisons": 4, "lisp": 2, "liss": 1, "list": 385, "listhe": 4, "listim": 1, "lists": 154, "lit": 153, "lita": 23, "lith": 2, "litha": 1, "litt": 3922, "litz": 3, "liu": 7, "liv": 2, "liz": 21, "lla": 3, "lle": 3, "lloyd": 11, "lloyds": 3, "lo": 8876, "loa": 56, "load": 86, "loam": 5, "loans": 33, "lob": 55, "loc": 95, "loch": 12, "lock": 362, "locks": 102, "lockt": 1, "lod": 192, "lodg": 4, "loe": 9, "loeb": 1, "loeil": 1, "loen": 1, "loes": 4, "loews": 1, "lof": 66, "loft": 9, "log": 96, "logjam": 1, "logna": 2, "logs": 16, "loh": 39, "loi": 24, "loid": 1, "loids": 2, "loil": 3, "loin": 10, "loins": 76, "lois": 4, "loist": 9, "loists": 6, "lol": 4, "lolu": 1, "lom": 122, "lomb": 1, "lomi": 1, "lomith": 9, "lomoth": 2, "lon": 1632, "lond": 3, "london": 2, "long": 2792, "longli": 3, "longran": 42, "longs": 79, "longshan": 1, "longsho": 2, "longshot": 1, "longslee": 1, "longsought": 2, "longst": 8, "longsuf": 17, "loni": 7, "lonians": 5, "lons": 69, "loo": 2643, "lood": 1, "looed": 1, "look": 1648, "lookin": 1, "lookist": 1, "lookit": 3, "looks": 280, "lookt": 2, "lookup": 8, "looky": 1, "loom": 14, "loomis": 4, "looms": 3, "loon": 54, "loons": 17, "loop": 34, "loops": 17, "loos": 7, "loosing": 10, "loot": 9, "lop": 44, "lops": 2, "lopt": 2, "lor": 581, "lord": 8808, "lords": 127, "lorn": 24, "lors": 210, "lortv": 2, "los": 229, "loses": 22, "loss": 200, "lost": 533, "lot": 596, "loth": 21, "lothing": 1, "lots": 105, "lotts": 1, "lou": 219, "loud": 263, "loudest": 9, "loudons": 1, "loue": 119, "loug": 1, "lough": 226, "loui": 302, "louin": 1, "louing": 4, "louis": 90, "louiss": 2, "loul": 1, "loun": 40, "loup": 5, "lour": 188, "lours": 77, "lous": 359, "lout": 38, "louts": 1, "lov": 16, "lovens": 1, "low": 2332, "lowd": 5, "lowdwarf": 3, "lowground": 2, "lown": 1, "lowpri": 1, "lows": 366, "lowsol": 2, "lowup": 8, "lowups": 1, "lowy": 2, "loxa": 1, "loy": 88, "loys": 3, "lso": 2, "lsu": 2, "ltu": 3, "lu": 2917, "lua": 1, "luang": 2, "lub": 70, "luc": 134, "luch": 6, "luck": 128, "lucki": 36, "luckier": 2, "luckiest": 3, "luckless": 4, "lucks": 1, "luct": 55, "lud": 34, "lue": 312, "lued": 1, "lues": 1, "luff": 3, "luffs": 1, "luft": 1, "lug": 27, "luh": 1, "lui": 3, "luia": 4, "luiah": 1, "luiahs": 2, "luis": 9, "luiss": 1, "lul": 15, "lull": 15, "lulls": 4, "lum": 203, "lumb": 1, "lumn": 81, "lumns": 44, "lump": 25, "lumps": 12, "lums": 4, "lun": 216, "lunch": 52, "lunching": 1, "lund": 2, "lung": 23, "lungs": 49, "luni": 2, "lunion": 2, "luous": 1, "lup": 9, "lur": 45, "lurch": 4, "lure": 4, "lurk": 11, "lurks": 13, "lus": 140, "lush": 9, "lusks": 1, "luso": 2, "luss": 2, "lust": 43, "lusted": 4, "lusts": 28, "lusty": 17, "lut": 2, "luta": 18, "luth": 1, "luthu": 1, "luu": 1, "lux": 3, "luxe": 2, "luxem": 4, "luxer": 1, "luxu": 74, "luyt": 3, "luz": 9, "lvi": 1, "ly": 34788, "lya": 2, "lyans": 12, "lyar": 1, "lydda": 3, "lye": 31, "lyear": 1, "lyground": 1, "lyhe": 1, "lyhead": 1, "lyho": 7, "lyl": 4, "lym": 1, "lymp": 2, "lymph": 2, "lyn": 54, "lynch": 74, "lynee": 1, "lynn": 5, "lyns": 2, "lyo": 2, "lyoa": 1, "lyogh": 2, "lyow": 6, "lyp": 14, "lyphosp": 8, "lys": 30, "lyspun": 1, "lyst": 12, "lysts": 11, "lyt": 6, "lytex": 1, "lytrol": 1, "lyun": 3, "lyup": 2, "ma": 22197, "maa": 1, "maacah": 3, "maacha": 9, "maachah": 24, "maad": 1, "maadiah": 1, "maah": 1, "maai": 1, "maal": 1, "maam": 5, "maar": 1, "maas": 25, "maath": 1, "maaz": 16, "maaziah": 2, "mab": 2, "mable": 2, "mably": 1, "mac": 159, "macb": 137, "macd": 58, "macduf": 19, "macduff": 9, "mach": 64, "machna": 1, "machs": 4, "macht": 1, "mack": 10, "macks": 2, "macn": 7, "macphail": 1, "mad": 270, "mads": 5, "mae": 25, "maea": 1, "maec": 1, "mael": 75, "maeo": 1, "maes": 10, "maf": 2, "mafil": 1, "mag": 438, "magda": 1, "mah": 158, "mahm": 2, "maht": 1, "mai": 250, "maia": 1, "maic": 12, "maid": 236, "maids": 75, "mail": 76, "mails": 10, "maim": 6, "main": 587, "mains": 4, "mais": 7, "maist": 1, "maists": 1, "mait": 2, "maj": 1, "mak": 13, "maks": 2, "maku": 2, "mal": 767, "maladroit": 1, "malc": 15, "mall": 14, "malls": 1, "malm": 1, "mals": 124, "malt": 3, "maltre": 2, "malz": 1, "mam": 143, "man": 12676, "manac": 3, "manack": 1, "mand": 1416, "mands": 106, "mang": 5, "mann": 46, "mans": 389, "manser": 17, "manslaugh": 4, "manslay": 3, "manson": 1, "mansters": 1, "mant": 123, "manthey": 3, "mants": 6, "manx": 16, "mao": 7, "map": 93, "maph": 1, "maphro": 1, "maple": 1, "maps": 17, "mar": 2865, "mara": 1, "marau": 2, "marc": 2, "march": 251, "margins": 7, "mark": 368, "marko": 1, "marks": 175, "marl": 2, "marm": 2, "maroon": 5, "marooned": 1, "marr": 7, "mars": 42, "marsh": 1, "marsk": 22, "mart": 30, "marts": 2, "marv": 3, "marx": 8, "mas": 1326, "masa": 4, "mash": 13, "mashta": 1, "mask": 40, "masons": 1, "mass": 188, "massbuil": 1, "massdis": 1, "mast": 166, "masted": 9, "masti": 2, "masts": 36, "mat": 1189, "match": 140, "matchless": 10, "math": 54, "mathmiz": 1, "matins": 1, "mats": 24, "matsuo": 35, "matsuos": 2, "matt": 3, "mau": 37, "mauch": 2, "maud": 3, "maug": 2, "maul": 11, "mauls": 1, "mauri": 62, "maus": 2, "maw": 11, "mawn": 1, "maws": 1, "max": 43, "maxed": 2, "maxen": 1, "maxes": 1, "maxi": 110, "maxim": 15, "maxims": 3, "maxs": 2, "may": 4395, "maya": 1, "mayans": 1, "maye": 2, "maying": 4, "mayn": 3, "mayo": 1, "mays": 16, "mayst": 3, "maz": 1, "ma\u00ee": 1, "mca": 2, "mcau": 4, "mcda": 2, "mcder": 1, "mce": 2, "mcel": 1, "mcen": 1, "mci": 3, "mcin": 2, "mclau": 1, "mcle": 2, "mclen": 2, "mclish": 3, "mcneil": 1, "mcro": 1, "mdi": 2, "me": 48286, "mea": 15, "mead": 7, "meads": 2, "meah": 6, "meals": 41, "meam": 4, "mean": 775, "means": 603, "meanss": 1, "meat": 384, "meau": 2, "meaus": 4, "mec": 5, "mech": 12, "med": 4119, "medd": 15, "meddled": 2, "meddleth": 2, "meddling": 10, "medst": 2, "mee": 449, "meek": 65, "meeke": 2, "meel": 12, "meersch": 1, "meet": 518, "meets": 56, "meg": 2, "meh": 1, "mehir": 1, "mehow": 199, "mei": 44, "meil": 1, "mein": 3, "meinung": 1, "meir": 1, "meis": 2, "mek": 1, "mekill": 1, "mel": 214, "meld": 1, "mell": 11, "mels": 55, "melt": 54, "melts": 3, "mem": 1583, "mema": 1, "memi": 1, "memp": 2, "memphis": 10, "men": 7053, "mend": 107, "mends": 9, "menof": 1, "menous": 1, "mens": 99, "menser": 3, "menste": 1, "ment": 7837, "ments": 2439, "meo": 8, "meow": 4, "mep": 19, "mephistop": 2, "meq": 2, "mer": 2786, "mera": 1, "merc": 2, "mero": 6, "merous": 100, "mers": 352, "mersaul": 1, "mersault": 5, "mersaults": 4, "mersi": 2, "mert": 2, "merular": 2, "merung": 1, "mery": 26, "merys": 2, "merz": 2, "mes": 3582, "mesa": 2, "meshil": 3, "mespan": 2, "mespi": 1, "mess": 44, "mest": 91, "mesta": 1, "meste": 3, "mestead": 5, "mesteads": 3, "mestic": 111, "mestick": 3, "mestics": 1, "mestown": 1, "met": 434, "metal": 1, "metap": 57, "meth": 68, "methought": 11, "mets": 11, "mett": 22, "metts": 3, "meu": 3, "meup": 1, "mew": 11, "mews": 2, "mexi": 71, "mexit": 1, "mey": 54, "meys": 3, "mez": 1, "mglbod": 1, "mi": 11349, "mia": 31, "miab": 2, "miah": 179, "miam": 1, "mians": 2, "mib": 4, "mibs": 3, "mic": 616, "mich": 17, "mick": 14, "mics": 45, "mid": 289, "midapril": 1, "midd": 302, "middle": 199, "middlea": 10, "middleeas": 1, "middling": 3, "midl": 1, "midrying": 1, "mids": 23, "midst": 469, "midsts": 1, "midt": 6, "midth": 1, "mie": 30, "mied": 2, "miel": 21, "miem": 1, "mien": 2, "mier": 28, "mies": 488, "miest": 1, "mieux": 1, "mif": 1, "mig": 9, "migh": 652, "might": 2635, "mighth": 1, "mightst": 1, "migs": 1, "mij": 11, "mik": 5, "mil": 654, "milch": 3, "mild": 132, "milk": 162, "milks": 2, "mill": 75, "mills": 39, "millss": 2, "milt": 2, "mim": 12, "mims": 1, "min": 620, "mina": 1, "mind": 1148, "minds": 144, "ming": 2038, "mingles": 1, "mings": 20, "minh": 1, "mink": 33, "minks": 1, "minn": 2, "mint": 17, "mints": 3, "mio": 1, "mious": 2, "mip": 1, "mir": 64, "mirs": 1, "mirth": 46, "mirthless": 2, "miry": 4, "mis": 1385, "mischee": 1, "mischeefe": 2, "mischi": 1, "mischie": 17, "mischief": 93, "mischiefe": 2, "mischiefs": 3, "mish": 94, "mishe": 1, "mishrai": 1, "misjoi": 1, "mism": 28, "mispe": 1, "miss": 1482, "misspent": 1, "mist": 102, "mista": 292, "misted": 1, "mistoo": 1, "mistook": 9, "mistres": 2, "mistress": 154, "mistrust": 13, "mistrusted": 2, "mistry": 34, "mists": 42, "misty": 16, "mit": 1305, "mita": 44, "mitch": 2, "mith": 40, "mithing": 1, "miths": 9, "mits": 107, "mitt": 1, "miuchi": 1, "mix": 102, "mixed": 112, "mixer": 2, "mixers": 1, "mixes": 1, "mixin": 1, "mixing": 18, "mixt": 4, "miy": 2, "miz": 59, "mizpar": 1, "mme": 3, "mmes": 5, "mna": 1, "mne": 1, "mo": 17000, "moa": 9, "moans": 6, "mob": 35, "mobs": 9, "moc": 72, "mock": 162, "mocks": 9, "mod": 1, "moe": 4, "moed": 1, "moes": 2, "mof": 3, "moh": 1, "mohrs": 1, "moi": 48, "moil": 13, "moir": 2, "moirs": 7, "mois": 3, "moist": 30, "mol": 98, "mold": 47, "molds": 7, "molie": 8, "moll": 5, "mom": 10, "moms": 1, "mon": 2059, "mona": 5, "mond": 136, "mondon": 1, "monds": 38, "mong": 3, "monk": 39, "monkhmer": 2, "monks": 17, "mons": 71, "monsons": 1, "monsoon": 3, "monsoons": 1, "monsoonshr": 1, "mont": 88, "month": 501, "months": 389, "montre": 4, "moo": 50, "mood": 75, "moodi": 1, "moods": 21, "moody": 20, "mooed": 1, "moon": 352, "moond": 1, "mooned": 3, "mooners": 1, "moons": 30, "moony": 1, "moor": 38, "moors": 5, "moos": 3, "moosilau": 1, "moot": 5, "mooth": 1, "moou": 1, "mooue": 2, "mop": 12, "mops": 1, "mor": 2378, "morg": 1, "morn": 50, "morp": 35, "mors": 26, "mort": 26, "morta": 2, "mortar": 21, "mortars": 3, "mos": 193, "mosai": 1, "mosaic": 5, "mosaick": 1, "mosaics": 2, "mosan": 1, "moses": 873, "mosh": 8, "mosk": 3, "mosque": 14, "mosques": 2, "mosqui": 3, "mosquit": 1, "moss": 29, "most": 4228, "mot": 29, "moth": 68, "mott": 11, "mou": 262, "mouch": 2, "moue": 17, "mough": 2, "mouing": 2, "moul": 27, "mould": 29, "moulds": 1, "moulins": 1, "moult": 1, "moun": 730, "mouncht": 3, "mound": 17, "mounds": 4, "mount": 384, "mounts": 17, "mour": 255, "mourn": 75, "mourning": 79, "mourns": 1, "mours": 18, "mous": 398, "mousque": 1, "mousta": 32, "mout": 36, "mouth": 831, "mouthing": 3, "mouths": 72, "mouts": 1, "mov": 5, "mow": 4, "mown": 3, "mows": 3, "moy": 5, "mrad": 3, "mrads": 1, "msec": 1, "mu": 2628, "mua": 4, "muah": 1, "muc": 3, "much": 3340, "muchco": 1, "muchnee": 1, "mucht": 1, "muck": 2, "mucks": 2, "mud": 95, "mudd": 3, "muddled": 2, "muddlehe": 1, "muddling": 1, "muds": 1, "mueli": 1, "muent": 1, "muf": 43, "muff": 2, "mug": 11, "mugs": 4, "muir": 1, "mul": 713, "mulch": 6, "mull": 8, "mult": 31, "mults": 5, "mum": 218, "mums": 4, "mun": 27, "munch": 1, "munching": 2, "mund": 41, "mundt": 1, "mundts": 1, "mung": 1, "munk": 1, "mup": 3, "mur": 540, "murd": 1, "murdrous": 1, "murk": 7, "murkiest": 1, "murky": 12, "murp": 9, "murs": 9, "murt": 11, "murth": 10, "mus": 580, "mushr": 1, "mushroo": 1, "mushroom": 11, "mushrooms": 2, "musk": 5, "muss": 1, "must": 3359, "mustn": 6, "musts": 1, "musty": 2, "mut": 113, "muta": 7, "muth": 1, "muthmoun": 1, "muz": 3, "muzz": 21, "my": 13933, "myce": 4, "mye": 2, "myjew": 2, "mym": 1, "myn": 4, "myo": 4, "myr": 24, "myra": 2, "myrt": 18, "mys": 339, "myt": 2, "myth": 43, "myum": 1, "na": 13428, "naa": 17, "naah": 3, "naam": 6, "naamah": 5, "naami": 1, "naar": 7, "naas": 4, "nab": 22, "nabb": 1, "nabs": 5, "nac": 20, "nach": 1, "nacht": 2, "nack": 2, "nad": 1, "nado": 2, "nae": 8, "naean": 4, "naebm": 2, "naed": 1, "nael": 7, "naen": 1, "nag": 21, "nah": 249, "nahan": 1, "nahb": 1, "nahs": 9, "nahsha": 1, "nai": 254, "naid": 7, "nail": 32, "nails": 42, "naim": 20, "nain": 1, "nair": 9, "nais": 34, "naists": 1, "nak": 228, "nal": 3973, "nalad": 2, "nald": 30, "nalds": 2, "nall": 12, "nals": 134, "nam": 52, "nams": 1, "nan": 484, "nand": 6, "nans": 3, "nant": 685, "nants": 61, "nao": 23, "nap": 34, "naphish": 2, "napht": 2, "naphta": 51, "napkins": 7, "naps": 2, "napt": 1, "nar": 352, "narch": 14, "nard": 46, "nards": 3, "nark": 1, "narw": 13, "nas": 281, "nast": 1, "nasts": 8, "nasty": 5, "nat": 19, "natch": 1, "nath": 19, "nathan": 56, "nau": 28, "naue": 2, "naugh": 13, "naught": 25, "naui": 1, "naults": 1, "naum": 17, "naut": 2, "nauts": 1, "navo": 4, "naw": 6, "nawt": 1, "nawth": 1, "nax": 2, "naxos": 1, "nay": 203, "ndi": 1, "ndo": 1, "ne": 26289, "nea": 151, "neah": 1, "neam": 4, "nean": 32, "near": 828, "neat": 71, "neau": 3, "neault": 1, "neaut": 1, "nec": 304, "necham": 1, "necho": 5, "nechoh": 4, "neck": 300, "necks": 33, "nect": 19, "nects": 2, "ned": 8435, "nedst": 2, "nee": 334, "need": 759, "needing": 7, "needn": 5, "needs": 225, "needy": 45, "neel": 20, "neem": 1, "neer": 89, "neere": 22, "neered": 4, "neerer": 11, "neerest": 1, "neers": 108, "nees": 2, "negal": 1, "nego": 16, "neh": 23, "nehdan": 1, "nehead": 2, "nehf": 1, "nehower": 1, "nehru": 5, "nehrus": 1, "nei": 1271, "neig": 4, "neigh": 530, "neil": 4, "neill": 6, "neis": 3, "nek": 2, "neks": 2, "nel": 637, "neld": 1, "nell": 32, "nells": 4, "nels": 112, "nem": 5, "nen": 224, "nend": 2, "nenim": 1, "nens": 1, "nent": 355, "nents": 105, "neo": 4, "neous": 200, "nep": 73, "nephis": 1, "nephish": 1, "nepht": 3, "nephtoah": 2, "nepins": 2, "ner": 2776, "nergal": 1, "nernst": 2, "neroth": 3, "nerous": 103, "ners": 857, "nersto": 3, "nerv": 1, "nes": 2812, "nesa": 1, "nesac": 1, "nesaret": 3, "nesim": 1, "nesqua": 1, "nesque": 2, "ness": 6150, "nest": 657, "nested": 6, "nesto": 2, "nests": 14, "net": 402, "neteen": 52, "neteenth": 49, "neteenye": 2, "netel": 1, "neth": 310, "nets": 107, "nett": 39, "netts": 1, "neu": 198, "neuil": 1, "neup": 3, "neur": 8, "neurs": 1, "neus": 1, "nev": 1, "new": 2584, "news": 419, "newt": 9, "newts": 2, "nex": 3, "nexed": 5, "nexi": 61, "next": 961, "ney": 1664, "neye": 1, "neyear": 1, "neyin": 1, "neying": 7, "neyings": 2, "neys": 89, "nez": 67, "ngan": 1, "ngo": 1, "ni": 7302, "nia": 333, "niac": 36, "niack": 1, "niacs": 6, "niah": 121, "nians": 46, "nias": 2, "nib": 20, "nibs": 1, "nic": 432, "nicde": 1, "nich": 8, "nichs": 1, "nick": 54, "nicks": 7, "nico": 1, "nics": 85, "nidad": 1, "nidi": 1, "nie": 128, "niec": 3, "nied": 196, "niel": 119, "niell": 1, "niels": 6, "nien": 87, "nient": 99, "niep": 1, "nier": 10, "niers": 9, "nies": 285, "niest": 11, "nieth": 4, "nietz": 4, "nig": 54, "nigh": 265, "night": 1951, "nightcoach": 1, "nightdress": 1, "nightfall": 12, "nightgown": 2, "nightly": 16, "nightma": 30, "nights": 137, "nightti": 13, "nightwatch": 1, "nign": 5, "nignt": 1, "nigs": 3, "nihan": 1, "nii": 2, "nij": 29, "nik": 15, "nikam": 3, "nikins": 2, "niks": 6, "nil": 27, "nill": 2, "nilmon": 1, "nils": 1, "nim": 47, "nimph": 1, "nims": 25, "nin": 37, "ninch": 1, "ning": 5654, "ningless": 23, "nings": 426, "ningstar": 1, "ninth": 62, "nio": 15, "nion": 36, "nious": 68, "nip": 24, "nips": 3, "nir": 10, "nirs": 4, "nis": 1315, "nischwitz": 4, "nish": 618, "nisht": 2, "nism": 194, "nisn": 1, "nist": 216, "nists": 97, "nit": 4, "nite": 8, "nites": 10, "nith": 12, "nitis": 1, "nitskii": 1, "nitz": 2, "nix": 11, "nixon": 25, "nixons": 1, "niz": 2, "njust": 1, "nkru": 2, "nly": 2, "nnight": 2, "nno": 1, "nnu": 1, "no": 15357, "noa": 2, "noam": 11, "nob": 8, "nobs": 1, "noc": 17, "nochle": 1, "nock": 6, "nod": 148, "noe": 34, "noei": 1, "noel": 8, "noes": 14, "noet": 2, "noeu": 11, "nof": 1, "noff": 4, "nog": 2, "noi": 357, "noiac": 1, "noid": 2, "noint": 1, "noir": 1, "nois": 117, "noit": 1, "nok": 20, "nol": 28, "nold": 22, "nolds": 7, "noli": 2, "noll": 1, "nolp": 5, "nols": 2, "non": 641, "nona": 1, "nondri": 1, "nondrying": 2, "nonexis": 5, "nonob": 1, "nons": 21, "nonskid": 1, "nonso": 1, "noo": 19, "nook": 10, "nooks": 5, "noon": 253, "noons": 24, "noonti": 4, "nooo": 1, "nooski": 4, "nop": 15, "noph": 7, "nophis": 1, "nor": 3557, "nord": 5, "norm": 10, "norms": 24, "norous": 7, "nors": 87, "nort": 7, "north": 537, "norths": 1, "northsouth": 2, "norum": 1, "nos": 88, "not": 23173, "nota": 2, "notch": 12, "noth": 3, "nots": 2, "notso": 1, "nott": 2, "nou": 213, "nough": 1, "nought": 54, "noul": 2, "noun": 391, "nounc": 4, "nouns": 8, "nour": 391, "nourd": 1, "nours": 15, "nous": 162, "nout": 8, "nouts": 2, "nov": 21, "now": 6235, "nown": 2, "nows": 1, "nox": 32, "noxa": 1, "noxi": 15, "noy": 32, "noyan": 14, "noying": 8, "noys": 1, "noz": 2, "nozz": 8, "nra": 1, "nroll": 1, "ntri": 1, "nu": 1992, "nuah": 2, "nub": 1, "nuc": 1, "nuch": 7, "nuchs": 20, "nuck": 4, "nuco": 1, "nud": 7, "nue": 295, "nued": 455, "nues": 91, "nuest": 1, "nuey": 2, "nueyan": 2, "nuf": 1, "nuff": 2, "nufs": 1, "nug": 3, "nui": 54, "nuing": 94, "nuis": 1, "nuisan": 7, "nuit": 3, "nuk": 1, "nul": 14, "null": 15, "nulo": 1, "nuls": 1, "num": 1206, "numb": 10, "nums": 8, "nun": 65, "nuns": 6, "nuo": 2, "nuous": 123, "nup": 13, "nups": 2, "nur": 163, "nurs": 1, "nus": 60, "nut": 80, "nutha": 1, "nuts": 62, "nutt": 9, "nux": 1, "nuy": 1, "nuye": 1, "nuz": 1, "nuzz": 1, "ny": 4885, "nyang": 2, "nye": 2, "nyear": 3, "nygon": 1, "nygons": 1, "nyl": 8, "nylar": 1, "nylp": 1, "nyls": 1, "nylt": 1, "nym": 4, "nymp": 7, "nymph": 5, "nymphs": 1, "nyms": 4, "nys": 46, "nyu": 4, "nyx": 1, "o": 12732, "oa": 40, "oad": 1, "oafs": 1, "oak": 110, "oaks": 13, "oar": 31, "oars": 79, "oas": 3, "oat": 3, "oath": 103, "oats": 11, "oatss": 1, "ob": 2123, "oba": 55, "obal": 1, "obe": 148, "obed": 16, "obei": 10, "ober": 3, "obey": 192, "obeying": 16, "obeys": 7, "obi": 5, "obiect": 1, "obiects": 3, "obil": 1, "obis": 1, "obla": 40, "obli": 446, "oblo": 1, "obo": 1, "oboe": 1, "oboist": 1, "oboth": 4, "obrien": 2, "obsta": 29, "oc": 1168, "oca": 2, "oce": 10, "ocean": 177, "oceans": 28, "oceansi": 1, "ocel": 1, "och": 48, "ocher": 1, "ochotsh": 1, "ochre": 2, "ock": 3, "ocks": 1, "oclock": 42, "oco": 1, "ocon": 6, "ocran": 5, "oct": 30, "ocu": 3, "od": 391, "odd": 147, "oddlot": 17, "oddly": 17, "ode": 2, "oded": 3, "odell": 1, "oder": 6, "oders": 1, "odes": 2, "odi": 4, "odin": 4, "odious": 19, "odo": 5, "odom": 1, "odon": 3, "odor": 38, "odorous": 9, "odors": 11, "odour": 3, "odours": 15, "ods": 54, "odys": 14, "oe": 36, "oec": 1, "oecd": 5, "oecha": 1, "oeco": 6, "oed": 2, "oep": 1, "oer": 22, "oeu": 2, "oex": 1, "of": 111726, "ofall": 1, "off": 2322, "offle": 1, "offs": 12, "offt": 1, "ofs": 1, "oft": 96, "og": 33, "oga": 1, "oge": 1, "ogi": 3, "ogist": 2, "ograp": 1, "ogress": 1, "ogy": 3, "oh": 1475, "oha": 1, "ohad": 2, "ohel": 1, "ohio": 56, "ohmic": 1, "ohn": 1, "oho": 4, "oht": 1, "oi": 24, "oil": 406, "oilhe": 2, "oilman": 1, "oils": 21, "oint": 37, "oints": 1, "oitself": 1, "ok": 14, "oka": 3, "okay": 20, "okeecho": 1, "oki": 1, "okla": 18, "oko": 1, "okotsk": 1, "okous": 2, "oks": 1, "ol": 222, "ola": 2, "olaf": 1, "olas": 1, "old": 2773, "olds": 6, "ole": 13, "oleg": 1, "olet": 1, "olev": 1, "oli": 108, "olic": 2, "olim": 1, "oll": 1, "olmstead": 1, "olo": 1, "olt": 2, "olts": 1, "oly": 1, "olym": 21, "om": 158, "oma": 2, "oman": 10, "omar": 3, "ome": 11, "omen": 11, "omi": 28, "omis": 10, "omit": 38, "omits": 2, "omp": 2, "oms": 159, "omsk": 1, "on": 48885, "ona": 5, "onam": 4, "onan": 8, "onas": 1, "onct": 2, "ond": 2, "one": 9543, "oned": 53, "onei": 1, "oneth": 1, "onex": 1, "ong": 3, "onga": 2, "ongs": 1, "oni": 8, "onics": 1, "onion": 17, "ono": 119, "ons": 7566, "onsee": 1, "onspe": 2, "onsta": 7, "onsto": 1, "ont": 8, "onth": 31, "onts": 3, "onus": 2, "ony": 1, "onyx": 11, "oo": 10, "oobum": 1, "ooga": 4, "ooh": 1, "ook": 28, "oom": 2, "oons": 1, "ooo": 1, "oooo": 1, "oop": 8, "oops": 1, "oor": 1, "oors": 5, "oosh": 1, "oot": 6, "ooti": 4, "ooxa": 1, "ooze": 5, "oozed": 3, "op": 1682, "opa": 2, "opal": 3, "opaque": 11, "ope": 1354, "open": 986, "opens": 27, "ophir": 14, "ophrah": 8, "opht": 2, "opi": 444, "opor": 1, "opos": 1, "ops": 15, "opu": 5, "opus": 3, "or": 14273, "ora": 96, "oral": 30, "oran": 53, "orb": 38, "orbs": 21, "ord": 9, "ordo": 3, "ore": 51, "orean": 1, "oreans": 1, "oreb": 10, "ored": 9, "orees": 2, "oren": 1, "ores": 11, "oress": 1, "oreth": 3, "org": 4, "ori": 370, "orien": 64, "orient": 18, "origin": 1, "orin": 1, "oring": 1, "oris": 1, "orisons": 3, "ork": 2, "orms": 2, "orn": 2, "oro": 3, "orous": 1, "orp": 39, "orphan": 9, "orphean": 1, "ors": 155, "ort": 2, "orth": 2, "orus": 1, "ory": 26, "os": 315, "oshan": 1, "osk": 1, "oso": 7, "osr": 18, "ost": 1, "oswing": 1, "ot": 580, "oth": 35, "other": 4371, "others": 850, "oti": 1, "otic": 14, "otis": 3, "otism": 11, "ots": 142, "ott": 9, "ou": 222, "ouch": 2, "oud": 117, "ouds": 9, "ough": 1244, "ought": 459, "oughta": 2, "oughtn": 2, "oughts": 2, "oui": 4, "ouilh": 1, "ouk": 1, "oul": 8, "ould": 9, "oum": 3, "oun": 53, "ound": 3, "our": 4433, "ourd": 3, "ourown": 1, "ours": 103, "ourself": 5, "ous": 318, "oust": 5, "out": 8966, "outn": 2, "outo": 8, "outs": 26, "outsmar": 2, "ouw": 1, "oux": 9, "ov": 21, "ova": 3, "oval": 13, "ovals": 2, "ovar": 2, "ove": 1, "oven": 28, "ovens": 2, "over": 5150, "overa": 7, "overaw": 1, "overe": 1, "overesti": 4, "overn": 3, "overns": 1, "overoc": 1, "overs": 29, "overstit": 1, "overt": 14, "overun": 3, "overw": 56, "ovi": 1, "ovs": 5, "ovum": 1, "ow": 303, "owe": 40, "owed": 36, "owen": 31, "owens": 1, "owes": 12, "owest": 5, "oweth": 1, "owi": 1, "owing": 39, "owl": 24, "owls": 10, "own": 2995, "owns": 19, "ownself": 1, "owt": 1, "ox": 130, "oxa": 4, "oxen": 124, "oxens": 1, "oxeye": 1, "oxi": 35, "oxon": 1, "oxus": 1, "oxy": 53, "oy": 9, "oya": 1, "oyn": 2, "oynt": 2, "oyst": 2, "oyster": 12, "oysters": 12, "oz": 8, "oza": 5, "ozarks": 1, "ozem": 2, "ozi": 2, "ozo": 4, "ozon": 1, "pa": 8532, "paal": 3, "paar": 1, "pac": 57, "pack": 167, "packs": 6, "pact": 123, "pacts": 6, "pad": 50, "padan": 2, "padana": 10, "padd": 7, "paddled": 4, "paddling": 2, "pads": 9, "paean": 3, "paeans": 1, "pag": 39, "pagens": 1, "pah": 44, "pahan": 1, "pai": 167, "paid": 304, "paie": 3, "paig": 13, "paign": 88, "paigns": 24, "pail": 52, "pails": 6, "paim": 2, "pain": 686, "pains": 80, "paint": 58, "paints": 13, "pair": 269, "pairs": 41, "paix": 1, "pak": 12, "pako": 2, "pal": 580, "pala": 179, "pall": 13, "palls": 1, "pallui": 1, "palm": 83, "palms": 36, "pals": 16, "pam": 17, "pama": 1, "pame": 19, "pamel": 1, "pami": 1, "pamin": 2, "pamp": 6, "pamphlet": 3, "pamphlets": 11, "pams": 1, "pan": 445, "panado": 5, "pand": 55, "pands": 9, "pang": 9, "pangs": 25, "pans": 21, "pant": 33, "pants": 32, "pap": 19, "papa": 8, "papp": 2, "paps": 4, "paquin": 1, "par": 3085, "parch": 2, "pard": 13, "pards": 7, "pareil": 1, "pareill": 1, "park": 194, "parkin": 12, "parks": 25, "parm": 1, "pars": 10, "parso": 14, "parsons": 9, "part": 2139, "parts": 299, "pas": 2143, "pass": 1376, "past": 627, "pasted": 7, "pasti": 8, "pastu": 100, "pasty": 2, "pat": 424, "patch": 78, "patcht": 1, "patchy": 1, "path": 189, "patrol": 25, "pats": 4, "pau": 315, "paul": 290, "paulins": 4, "pauls": 1, "paunch": 4, "paunchy": 2, "paus": 2, "pausl": 1, "pav": 3, "pavle": 1, "paw": 35, "pawn": 11, "paws": 17, "pawtuc": 3, "pawtuxet": 4, "pax": 8, "paxam": 1, "paxordo": 3, "pay": 622, "paya": 6, "paying": 62, "pays": 29, "paz": 7, "pdi": 3, "pe": 13735, "pea": 1072, "peach": 6, "peak": 34, "peaks": 25, "peaky": 1, "peal": 110, "peals": 31, "pean": 79, "peans": 5, "pear": 370, "peasant": 22, "peasants": 24, "peat": 58, "peb": 16, "pec": 823, "peck": 12, "pecks": 5, "pecoro": 1, "pecos": 1, "pecs": 3, "pect": 762, "pecta": 125, "pects": 156, "ped": 2616, "pedd": 1, "peddled": 1, "peddler": 23, "peddlers": 3, "peddlin": 1, "peddling": 4, "peds": 4, "pedst": 1, "pee": 38, "peece": 9, "peeces": 2, "peed": 1, "peek": 2, "peel": 5, "peeled": 14, "peels": 3, "peep": 19, "peeped": 11, "peepy": 1, "peer": 28, "peere": 1, "peered": 31, "peeres": 1, "peeress": 1, "peerin": 2, "peering": 32, "peers": 20, "pees": 16, "peeuish": 2, "peg": 51, "pegle": 1, "pegs": 4, "peh": 25, "pei": 3, "peks": 1, "pel": 371, "pell": 21, "pels": 28, "pelt": 3, "pelts": 10, "peltz": 1, "pem": 11, "pen": 2172, "pend": 132, "pends": 74, "penn": 5, "penob": 1, "pens": 92, "pent": 205, "pents": 28, "pep": 54, "per": 9137, "perad": 34, "perb": 40, "perch": 20, "perk": 1, "perkins": 2, "perky": 2, "perous": 47, "pers": 472, "pert": 69, "perth": 18, "perts": 44, "perui": 1, "pery": 36, "peryear": 2, "pes": 780, "pest": 125, "pestat": 5, "pests": 5, "pet": 246, "peth": 92, "pets": 97, "petu": 1, "peu": 15, "peult": 1, "peup": 1, "peut": 1, "pew": 19, "pews": 2, "pey": 33, "pez": 6, "pfau": 1, "pfen": 1, "pfohl": 3, "pga": 1, "pha": 519, "phae": 1, "phal": 7, "phan": 9, "phant": 20, "phantom": 32, "phar": 13, "pharp": 1, "pharpar": 1, "phe": 140, "pheasan": 1, "pheasant": 5, "pheasants": 3, "phelps": 1, "pher": 7, "phers": 1, "phi": 844, "phic": 5, "phics": 7, "phil": 99, "philmont": 4, "philo": 7, "phils": 2, "phin": 1, "phipps": 2, "phis": 43, "phist": 2, "phists": 1, "phiz": 2, "phle": 2, "phlegon": 1, "phloem": 1, "pho": 237, "phoe": 14, "phoo": 15, "phos": 1, "phosp": 31, "phou": 5, "phra": 139, "phras": 1, "phre": 14, "phren": 6, "phry": 3, "phu": 3, "phus": 3, "phut": 2, "phy": 329, "phyl": 2, "phyla": 1, "phylac": 1, "pi": 3731, "pia": 64, "pic": 647, "pick": 266, "pickins": 1, "picks": 9, "pics": 28, "pict": 5, "pid": 76, "piddling": 1, "pie": 670, "pied": 133, "piedro": 161, "pien": 1, "pient": 11, "pients": 5, "piep": 14, "pier": 194, "pierc": 3, "piero": 2, "piers": 14, "pies": 57, "piest": 41, "pieth": 1, "pig": 59, "pight": 1, "pigs": 12, "pii": 1, "pil": 361, "pilau": 1, "pile": 3, "pill": 17, "pills": 12, "pils": 30, "pim": 17, "pimp": 3, "pimps": 2, "pin": 158, "pina": 1, "pinch": 16, "pind": 3, "pinda": 12, "ping": 1651, "pingout": 1, "pings": 35, "pink": 86, "pinks": 5, "pins": 26, "pinsk": 1, "pint": 20, "pio": 2, "pip": 99, "pips": 13, "pis": 42, "pish": 15, "pism": 1, "piss": 3, "pist": 24, "pisto": 2, "pistol": 60, "pistols": 12, "pists": 10, "pit": 389, "pita": 6, "pitch": 102, "pitchy": 2, "pith": 3, "pito": 2, "pits": 18, "pitt": 2, "pitts": 28, "pixies": 1, "piz": 4, "pla": 4131, "plac": 7, "placa": 10, "placard": 2, "placards": 1, "place": 9, "plag": 3, "plai": 265, "plaid": 7, "plaids": 1, "plain": 626, "plaind": 1, "plains": 105, "plaint": 48, "plaints": 27, "plaist": 1, "plait": 2, "plaits": 1, "plan": 756, "plana": 11, "planar": 2, "plank": 33, "planks": 47, "plann": 1, "plans": 154, "plant": 223, "plants": 113, "plar": 2, "plars": 1, "plas": 136, "plasm": 10, "plat": 115, "plath": 1, "platz": 1, "plau": 77, "plaud": 11, "play": 994, "playa": 2, "playac": 1, "playd": 2, "playground": 9, "playin": 1, "playing": 205, "plays": 121, "plaz": 1, "ple": 2349, "plea": 1481, "plead": 51, "pleads": 1, "pleas": 25, "pleasan": 17, "pleasant": 334, "pleat": 1, "plec": 4, "plechoi": 1, "pled": 153, "plee": 1, "plei": 6, "plen": 202, "pler": 37, "plers": 5, "ples": 628, "pleship": 2, "pless": 57, "plest": 15, "plet": 3, "pleth": 2, "pletho": 1, "plets": 3, "pleu": 12, "plex": 108, "plexed": 16, "plexes": 7, "plexi": 96, "plexy": 3, "pley": 1, "pli": 873, "plia": 2, "plied": 818, "pliedst": 1, "plier": 6, "pliers": 3, "plies": 100, "pliest": 1, "plieth": 5, "pligh": 2, "plight": 20, "plim": 1, "plin": 2, "pling": 83, "plings": 8, "plis": 106, "plish": 92, "plo": 326, "plod": 11, "plods": 1, "ploi": 12, "ploit": 17, "ploita": 6, "ploits": 10, "plop": 1, "plot": 68, "plots": 17, "ploug": 28, "plough": 27, "ploughs": 4, "plow": 29, "plows": 7, "ploy": 453, "ploye": 1, "ploying": 16, "ploys": 12, "ployt": 1, "plu": 44, "pluc": 13, "pluck": 99, "pluckt": 5, "plug": 32, "plugs": 2, "plum": 59, "plumb": 10, "plumbs": 1, "plump": 21, "plums": 35, "plun": 96, "plund": 1, "plus": 106, "plush": 3, "pluso": 3, "ply": 1026, "plye": 1, "plymp": 1, "pneu": 4, "po": 8764, "poa": 1, "poach": 1, "poark": 1, "poc": 234, "pock": 1, "pod": 39, "podo": 1, "pods": 8, "poe": 197, "poem": 79, "poems": 159, "poen": 1, "poeples": 1, "poes": 1, "poet": 192, "poets": 82, "poff": 3, "poh": 2, "pohl": 11, "pohls": 3, "poi": 174, "poig": 13, "poil": 1, "poin": 608, "point": 985, "points": 215, "pois": 8, "poitri": 5, "pok": 4, "poky": 4, "pol": 167, "pold": 4, "polds": 1, "polks": 1, "poll": 16, "polls": 16, "pom": 78, "pomp": 28, "pomps": 1, "pon": 694, "pond": 93, "ponds": 34, "pong": 1, "pono": 1, "pons": 8, "pont": 43, "pontop": 1, "ponts": 15, "poo": 50, "pood": 2, "pooh": 13, "poohed": 4, "pool": 231, "poolequip": 1, "pooles": 2, "pooley": 11, "poolow": 1, "pools": 34, "poon": 90, "pooned": 8, "pooneer": 82, "pooneers": 56, "pooner": 1, "poons": 39, "poop": 2, "poor": 1054, "poors": 1, "poorw": 1, "pop": 46, "pops": 12, "popss": 1, "popt": 2, "por": 2118, "porch": 94, "pork": 28, "porky": 1, "porn": 3, "pors": 5, "port": 889, "porta": 48, "ports": 192, "pos": 2011, "posd": 1, "posh": 1, "post": 311, "postal": 7, "postat": 5, "posted": 21, "postors": 1, "posts": 91, "pot": 211, "pots": 65, "pott": 1, "potts": 1, "pou": 229, "pouch": 5, "pouf": 1, "poug": 2, "pouil": 1, "poul": 24, "poun": 53, "pound": 86, "pounds": 139, "pour": 149, "pours": 22, "pous": 11, "pout": 4, "pouts": 3, "pow": 109, "powr": 1, "pox": 5, "poy": 16, "poyn": 5, "poz": 20, "pra": 56, "prac": 478, "prae": 4, "prag": 7, "prai": 610, "prais": 2, "pram": 1, "prams": 1, "pran": 8, "prandtl": 1, "prank": 2, "pranks": 3, "prat": 2, "pratt": 21, "pratts": 1, "prav": 1, "prawl": 1, "prawns": 1, "pray": 889, "prayin": 2, "praying": 35, "prays": 3, "pre": 7142, "prea": 53, "preach": 66, "pread": 1, "prechlo": 1, "precht": 3, "prechts": 1, "pred": 3, "pree": 7, "preem": 2, "preemp": 2, "preexis": 2, "preg": 35, "pregns": 1, "prein": 1, "pren": 31, "prep": 2, "prer": 2, "pres": 1592, "presa": 3, "press": 401, "prest": 9, "pret": 463, "prets": 3, "preu": 11, "prexy": 1, "prey": 124, "preying": 1, "prez": 1, "pri": 2493, "priams": 1, "pric": 11, "prick": 31, "pricks": 4, "prickt": 2, "prid": 1, "prie": 8, "pried": 1, "priest": 749, "priests": 456, "prig": 4, "prim": 15, "prin": 1112, "prink": 1, "print": 69, "prints": 38, "pris": 12, "priso": 126, "prison": 13, "prisons": 10, "prit": 6, "priu": 1, "prix": 2, "priz": 2, "pro": 11649, "proc": 5, "proch": 2, "proco": 3, "prod": 8, "proem": 1, "proeu": 1, "prof": 14, "prog": 6, "prohearst": 1, "proiect": 1, "prolixi": 2, "promp": 37, "prompt": 62, "prompts": 3, "pron": 3, "prong": 1, "prongs": 1, "proo": 1, "proof": 149, "proofe": 10, "proofs": 20, "prooue": 1, "prop": 992, "props": 8, "propul": 8, "pros": 171, "prosper": 59, "prou": 19, "proud": 270, "proudest": 7, "proue": 7, "proui": 7, "prouin": 1, "prounfp": 1, "prouo": 6, "prous": 6, "proust": 1, "prov": 2, "prow": 41, "prowd": 1, "prowl": 3, "prows": 3, "prox": 1, "proxi": 111, "proxy": 7, "proy": 1, "pru": 163, "prurient": 3, "prus": 20, "pruta": 1, "pry": 28, "prying": 7, "pryn": 2, "psa": 1, "psal": 36, "psalm": 14, "psalms": 17, "psed": 5, "pses": 13, "pseu": 21, "pseudo": 1, "pseudophloem": 6, "psi": 2, "psithy": 5, "psy": 167, "psyl": 3, "pta": 13, "ptery": 1, "pto": 29, "pu": 2747, "pua": 1, "puah": 11, "pub": 7, "pubs": 1, "puc": 6, "puch": 1, "puckish": 1, "pud": 23, "pudd": 3, "puddling": 1, "puf": 28, "puff": 20, "puffs": 9, "puft": 1, "pug": 11, "pugh": 9, "puh": 2, "puis": 8, "puisant": 1, "pul": 612, "pula": 13, "pull": 185, "pulls": 13, "pulp": 6, "pulpit": 28, "pulpits": 5, "puls": 10, "pulsing": 3, "pults": 1, "pum": 22, "pump": 25, "pumps": 22, "pun": 29, "punc": 50, "punch": 18, "punching": 3, "pung": 1, "punk": 2, "punks": 1, "puns": 6, "pup": 41, "pups": 2, "pur": 1442, "purg": 2, "purr": 2, "pus": 265, "pusants": 6, "push": 88, "puss": 1, "put": 2331, "puta": 75, "putains": 1, "pute": 1, "puts": 59, "putt": 7, "putu": 1, "puzz": 126, "pwa": 1, "py": 1098, "pye": 1, "pyg": 1, "pyhr": 1, "pyin": 1, "pying": 20, "pylt": 1, "pyn": 1, "pyo": 1, "pyr": 12, "pys": 2, "pyt": 3, "p\u00e9e": 1, "qlal": 11, "qlals": 2, "qu": 63, "qua": 667, "quac": 6, "quack": 11, "quacks": 9, "quadren": 1, "quaf": 1, "quaff": 2, "quag": 1, "quah": 2, "quai": 1, "quail": 2, "quails": 4, "quain": 364, "quaint": 37, "quak": 3, "qual": 24, "quall": 1, "qualms": 2, "quals": 1, "quam": 1, "quan": 99, "quant": 2, "quar": 499, "quart": 5, "quas": 1, "quay": 18, "que": 410, "qued": 3, "quee": 1, "queen": 247, "queene": 42, "queens": 24, "queequeg": 252, "queer": 114, "queerer": 3, "queerest": 5, "quees": 1, "quein": 1, "quel": 16, "quelch": 1, "quell": 12, "quem": 1, "quen": 392, "quench": 18, "quent": 418, "quents": 5, "queous": 2, "quer": 53, "quera": 11, "querours": 1, "quers": 6, "query": 5, "querying": 1, "ques": 1073, "quess": 1, "quest": 187, "quested": 26, "questra": 2, "quests": 25, "quet": 69, "quets": 10, "queu": 1, "queur": 2, "quez": 2, "qui": 3545, "quib": 1, "quibs": 1, "quic": 82, "quick": 468, "quicks": 7, "quid": 88, "quids": 6, "quig": 1, "quil": 51, "quill": 15, "quills": 2, "quils": 2, "quilt": 2, "quin": 40, "quind": 2, "quins": 4, "quint": 12, "quints": 2, "quious": 7, "quip": 4, "quir": 1, "quirk": 1, "quirks": 1, "quirt": 8, "quiry": 82, "quis": 99, "quish": 14, "quist": 3, "quista": 1, "quit": 161, "quita": 1, "quits": 5, "quitt": 2, "quixo": 7, "quiz": 12, "quo": 143, "quod": 174, "quog": 2, "quoh": 1, "quoi": 4, "quoia": 2, "quoin": 3, "quoins": 1, "quois": 4, "quok": 1, "quor": 56, "quors": 1, "quoth": 2, "quots": 1, "quours": 1, "quy": 9, "ra": 12241, "raal": 1, "raam": 1, "raamah": 5, "raamiah": 1, "rab": 183, "rabb": 2, "rable": 4, "rabs": 3, "rac": 27, "raca": 1, "racas": 1, "raccoon": 2, "rach": 2, "rack": 30, "racks": 6, "ract": 5, "racts": 5, "rad": 50, "radd": 1, "radi": 1, "rads": 4, "rae": 47, "raea": 1, "rael": 2609, "raels": 1, "raesz": 1, "raf": 17, "raff": 1, "raft": 5, "rafts": 6, "rag": 56, "rages": 1, "ragh": 8, "rags": 27, "rah": 221, "rahs": 11, "rai": 809, "raid": 570, "raids": 5, "raig": 11, "raign": 3, "rail": 172, "railhead": 2, "railmo": 1, "rails": 15, "raim": 10, "rain": 308, "rains": 14, "rais": 13, "rait": 43, "raits": 17, "rak": 36, "ral": 2713, "rald": 32, "ralds": 10, "raleigh": 1, "rall": 29, "ralph": 23, "rals": 110, "ram": 297, "ramid": 11, "ramp": 6, "ramps": 1, "rams": 78, "ramsper": 1, "ran": 1977, "rana": 1, "ranch": 28, "rand": 170, "randas": 3, "randolph": 9, "randolphs": 1, "random": 63, "randomstor": 1, "rands": 10, "randy": 1, "rang": 64, "rangs": 1, "rank": 89, "rankins": 1, "rankled": 1, "ranklings": 1, "rankly": 1, "ranks": 63, "ranl": 1, "rans": 29, "ransac": 1, "ransack": 7, "ransomed": 4, "ransomes": 1, "rant": 246, "rants": 28, "rap": 122, "raph": 31, "raphra": 4, "raphs": 14, "raphti": 1, "rapi": 26, "rapid": 215, "rapids": 2, "raps": 3, "rapt": 22, "rar": 14, "rards": 1, "rars": 130, "raru": 1, "ras": 185, "rash": 19, "rasp": 36, "rass": 48, "rasso": 1, "rast": 2, "rastus": 1, "rat": 75, "rata": 1, "rath": 8, "rathaim": 1, "rating": 2, "ratom": 1, "raton": 2, "rats": 12, "ratt": 69, "rattz": 1, "rau": 16, "rauen": 3, "rauens": 1, "raues": 1, "rauin": 1, "rauis": 1, "raulds": 1, "raum": 1, "raun": 6, "raux": 13, "rauxs": 8, "raw": 70, "rawlins": 3, "rax": 1, "raxi": 2, "ray": 223, "rayal": 7, "raying": 4, "rays": 38, "rber": 1, "rbis": 1, "rca": 8, "re": 86111, "rea": 2979, "reac": 3, "reach": 234, "read": 566, "reads": 46, "reah": 1, "reak": 1, "reaks": 1, "reals": 4, "ream": 3, "reams": 2, "reamt": 1, "rean": 25, "reans": 6, "rear": 96, "reau": 62, "reaus": 4, "reb": 26, "rebs": 6, "rec": 750, "recha": 4, "rechab": 13, "rechah": 1, "rechal": 2, "rechar": 1, "rechris": 1, "reck": 86, "reckles": 16, "reckless": 23, "reckoning": 20, "reckonings": 1, "recks": 1, "reco": 1, "rect": 710, "rector": 1, "rects": 5, "red": 11963, "reds": 115, "redst": 7, "redth": 11, "redu": 2, "ree": 89, "reeair": 1, "reecho": 1, "reed": 49, "reeds": 15, "reef": 15, "reefed": 3, "reefs": 3, "reek": 5, "reeke": 1, "reel": 60, "reels": 1, "reemp": 1, "reen": 17, "reer": 82, "reering": 8, "rees": 9, "reex": 2, "reexa": 8, "ref": 4, "reft": 3, "reg": 6, "regal": 18, "rego": 9, "regrou": 2, "reground": 4, "reh": 6, "rehe": 3, "rehea": 1, "rehead": 110, "reheads": 14, "rehear": 30, "rei": 35, "reich": 7, "reid": 3, "reig": 252, "reigh": 1, "reign": 489, "reigns": 26, "reik": 1, "reil": 1, "reim": 10, "reima": 1, "rein": 557, "reins": 31, "reis": 2, "reism": 1, "reiss": 1, "reist": 1, "rej": 5, "rejoi": 384, "rejoin": 7, "rek": 17, "rel": 264, "rell": 25, "rells": 2, "rels": 47, "relso": 7, "rem": 142, "remai": 440, "remain": 320, "remains": 155, "remphan": 2, "rems": 1, "ren": 4180, "renaults": 1, "rench": 3, "rend": 65, "rene": 10, "reness": 3, "renest": 2, "reno": 1, "renoir": 3, "renoon": 20, "renoons": 1, "renoun": 12, "renow": 18, "renown": 17, "rens": 35, "rent": 1448, "renthood": 6, "rents": 223, "renz": 2, "reo": 35, "reof": 1041, "reopho": 1, "reous": 3, "rep": 49, "reph": 2, "rephra": 1, "repn": 2, "reps": 3, "repta": 1, "rer": 576, "rers": 253, "rerun": 13, "res": 4639, "rescin": 1, "rescind": 2, "resh": 20, "resha": 1, "resins": 2, "reskins": 5, "resque": 32, "ress": 77, "rest": 2104, "rested": 170, "resteth": 4, "resti": 6, "rests": 190, "ret": 181, "retch": 1, "reth": 378, "rethought": 5, "retre": 79, "rets": 17, "rett": 2, "reu": 171, "reub": 1, "reue": 1, "reui": 2, "reun": 47, "reuo": 1, "reup": 1, "reupon": 45, "reurs": 1, "reus": 1, "reuth": 4, "rev": 37, "rew": 2, "rewt": 1, "rex": 18, "rexia": 1, "rey": 55, "reyear": 1, "reys": 6, "rez": 24, "rhe": 41, "rhea": 2, "rheims": 1, "rhein": 2, "rheu": 1, "rhew": 1, "rhi": 22, "rho": 127, "rhodo": 1, "rhomb": 1, "rhu": 2, "rhubarb": 1, "rhy": 27, "rhyth": 1, "rhythm": 26, "rhythmi": 3, "rhythmic": 14, "rhythms": 12, "rhythmus": 4, "ri": 13714, "ria": 1136, "riac": 1, "riack": 1, "riad": 18, "riads": 25, "riah": 152, "riams": 2, "rib": 105, "ribb": 2, "riblah": 11, "ribly": 55, "ribs": 43, "ric": 173, "rich": 391, "richmond": 26, "richs": 1, "richt": 1, "rick": 185, "ricks": 10, "rics": 26, "rid": 280, "ridd": 32, "riddled": 4, "riddling": 2, "ridg": 1, "rie": 231, "ried": 1286, "rief": 3, "rieg": 2, "riehea": 1, "riel": 12, "rien": 534, "rient": 2, "rier": 35, "riers": 34, "ries": 1393, "riest": 10, "riet": 657, "rieta": 2, "rieth": 14, "riets": 1, "rif": 4, "riff": 30, "riffs": 11, "rift": 1, "rifts": 1, "rifw": 1, "rig": 80, "riggs": 1, "righ": 628, "right": 1825, "rightan": 1, "rightang": 1, "rightful": 10, "rightlier": 1, "rightly": 31, "rightness": 2, "rightofen": 2, "rights": 117, "rightwing": 1, "rigs": 4, "rihs": 1, "rii": 1, "rij": 11, "rik": 2, "rikam": 6, "rikins": 1, "ril": 84, "rill": 6, "rills": 4, "rim": 113, "rims": 6, "rin": 222, "rinch": 1, "rind": 7, "ring": 5807, "ringaid": 1, "ringaroun": 1, "ringaround": 1, "rings": 494, "rink": 2, "rins": 2, "rinth": 17, "rio": 53, "riou": 4, "rious": 1402, "rip": 63, "riph": 2, "ripi": 3, "rips": 1, "ript": 4, "ris": 609, "rish": 182, "rishs": 1, "risk": 91, "risks": 11, "rism": 17, "riso": 10, "risons": 22, "riss": 6, "rist": 46, "rists": 42, "rit": 1046, "rita": 21, "rith": 8, "rithm": 2, "rithms": 1, "rits": 429, "ritt": 2, "ritz": 14, "riu": 5, "riuce": 1, "riy": 1, "riz": 6, "rner": 1, "ro": 3614, "roa": 4, "road": 496, "roads": 149, "roam": 14, "roar": 75, "rob": 173, "robs": 2, "roc": 121, "roch": 3, "rock": 307, "rocks": 122, "rod": 158, "rods": 39, "rodt": 1, "roe": 40, "roeh": 1, "roes": 6, "roff": 1, "rog": 3, "roga": 1, "roglo": 17, "roh": 1, "roi": 9, "roid": 46, "roids": 2, "roidsti": 4, "rok": 5, "roko": 3, "roks": 1, "rol": 356, "rola": 1, "roland": 8, "rold": 94, "rolds": 3, "role": 125, "roleex": 2, "roles": 34, "rolet": 1, "roll": 176, "rolls": 46, "roloff": 1, "rols": 12, "roly": 1, "rom": 7, "romp": 1, "ron": 200, "rond": 4, "rondack": 2, "rondacks": 2, "rons": 18, "roo": 56, "rood": 2, "roods": 2, "roof": 165, "roofe": 1, "roofed": 5, "roofer": 1, "roofers": 1, "roofs": 24, "rookie": 10, "rookieoft": 1, "rookies": 4, "room": 1210, "rooms": 154, "roomy": 2, "rooney": 7, "roos": 10, "roost": 2, "root": 144, "roote": 3, "rooting": 3, "roots": 98, "rop": 3, "ror": 331, "rors": 139, "ros": 128, "roski": 3, "ross": 30, "rost": 3, "rosta": 6, "rot": 64, "rotc": 1, "roth": 38, "rotha": 1, "rothad": 1, "rots": 14, "rott": 2, "rou": 245, "roug": 22, "rough": 299, "roughs": 4, "roughtough": 1, "rouk": 5, "roun": 173, "round": 1307, "rounds": 26, "rour": 44, "rours": 4, "rous": 451, "rout": 24, "rov": 10, "row": 1054, "rows": 215, "rowy": 1, "roxy": 1, "roy": 910, "roying": 38, "royo": 3, "roys": 10, "roz": 2, "rsta": 6, "rte": 2, "ru": 1191, "ruah": 2, "ruan": 8, "rub": 207, "rubs": 3, "ruby": 7, "ruc": 13, "ruch": 28, "ruck": 3, "rud": 25, "rue": 28, "ruf": 19, "rug": 59, "ruger": 4, "rugers": 1, "rugs": 5, "ruh": 2, "rui": 62, "ruido": 1, "ruin": 75, "ruina": 4, "ruinous": 9, "ruins": 34, "ruiz": 1, "ruk": 1, "rul": 9, "ruli": 1, "rum": 140, "rumi": 11, "rump": 8, "rums": 10, "run": 966, "runcham": 1, "rund": 3, "rung": 16, "runing": 1, "runoff": 2, "runoft": 1, "runs": 92, "runt": 1, "runup": 2, "runups": 1, "ruo": 1, "rup": 308, "rups": 1, "rupt": 221, "rupts": 5, "ruri": 1, "rus": 817, "rusa": 828, "ruses": 5, "rush": 89, "rusha": 1, "rushmo": 1, "rusi": 3, "rusing": 2, "rusk": 10, "rusks": 3, "ruso": 2, "russ": 24, "rust": 77, "rusted": 2, "rusty": 12, "rut": 4, "ruth": 37, "ruthles": 7, "ruthless": 16, "ruths": 8, "ruts": 3, "ruysch": 1, "ruz": 1, "rwar": 1, "ry": 14121, "ryb": 1, "ryc": 1, "rye": 8, "ryear": 4, "ryhear": 1, "ryin": 2, "rying": 356, "ryings": 1, "ryins": 1, "ryk": 4, "ryl": 14, "rym": 32, "ryo": 14, "ryold": 1, "rys": 48, "rytam": 1, "rytre": 2, "ryu": 8, "sa": 9217, "saabye": 1, "saadi": 1, "saami": 2, "saamis": 6, "sab": 190, "sac": 15, "sach": 1, "sack": 86, "sacks": 18, "sacri": 3, "sacs": 2, "sad": 284, "sadd": 43, "saddle": 3, "saddled": 20, "saf": 13, "saft": 1, "sag": 43, "sags": 1, "sah": 21, "sai": 418, "saic": 11, "said": 11402, "saidst": 26, "saig": 3, "sail": 212, "saild": 1, "sails": 85, "sain": 2, "saint": 53, "saints": 123, "saintsaens": 1, "sairs": 1, "saisa": 1, "saith": 1271, "sak": 3, "sakos": 1, "sal": 740, "salk": 1, "sals": 55, "salt": 166, "salts": 9, "sam": 323, "samach": 3, "same": 19, "sams": 6, "samt": 1, "san": 327, "sana": 1, "sanc": 352, "sanct": 1, "sand": 1051, "sands": 207, "sandth": 6, "sandz": 1, "sang": 83, "sanga": 1, "sank": 58, "sans": 11, "sansome": 1, "sant": 71, "sants": 1, "sap": 41, "saph": 1, "sapien": 3, "sapient": 1, "sapio": 3, "saps": 1, "sar": 307, "sards": 1, "sarep": 1, "sarp": 2, "sars": 41, "sart": 2, "sas": 44, "sash": 12, "sat": 715, "satch": 2, "satins": 3, "satis": 4, "satz": 3, "sau": 86, "saud": 1, "sauds": 1, "saue": 9, "saui": 1, "sauing": 1, "sauk": 1, "saul": 447, "sault": 37, "saults": 13, "saun": 20, "saur": 1, "saurs": 1, "saus": 1, "sausa": 12, "sav": 1, "saw": 2006, "sawn": 3, "saws": 9, "sax": 9, "saxo": 1, "saxon": 45, "saxons": 8, "saxop": 5, "say": 3394, "sayd": 1, "sayin": 5, "saying": 1865, "sayings": 36, "says": 428, "sayst": 2, "sba": 25, "sbas": 2, "sbir": 3, "sca": 221, "scab": 24, "scabs": 1, "scae": 4, "scaf": 24, "scairt": 1, "scal": 14, "scald": 1, "scall": 24, "scalp": 11, "scam": 9, "scamp": 3, "scamps": 1, "scan": 92, "scand": 1, "scani": 3, "scann": 1, "scans": 2, "scant": 11, "scap": 2, "scar": 322, "scarf": 25, "scarft": 1, "scars": 16, "scat": 214, "scathe": 1, "sce": 378, "scen": 15, "scent": 32, "scents": 3, "scep": 40, "sceptre": 25, "sceptres": 1, "sces": 3, "scha": 5, "schaack": 3, "schach": 1, "schae": 4, "schaef": 2, "schaf": 9, "schaft": 1, "schai": 1, "schal": 1, "schan": 5, "schang": 1, "schar": 69, "schat": 1, "schatz": 1, "sche": 249, "scheid": 1, "scheidt": 1, "schein": 1, "schel": 4, "scheld": 1, "schen": 3, "schenk": 2, "scher": 2, "schi": 8, "schid": 1, "schie": 7, "schii": 1, "schil": 6, "schis": 1, "schism": 2, "schlag": 1, "schlei": 1, "schlek": 2, "schles": 2, "schley": 1, "schlie": 1, "schme": 1, "schmitt": 2, "schnapps": 1, "schnooks": 1, "scho": 141, "schockler": 1, "schol": 3, "schon": 3, "schoo": 12, "school": 710, "schoole": 5, "schools": 220, "schooner": 9, "schooners": 4, "schott": 1, "schou": 1, "schraffts": 1, "schramm": 2, "schree": 1, "schrunk": 1, "schu": 11, "schultz": 2, "schulz": 1, "schutz": 1, "schuy": 4, "schuyl": 7, "schwa": 1, "schwab": 2, "schwar": 1, "schwartz": 9, "schwarz": 6, "schwei": 1, "schweitzer": 9, "schweitzers": 1, "schylus": 4, "sci": 463, "scien": 175, "scious": 337, "scis": 13, "scle": 6, "sco": 305, "scoe": 6, "scof": 7, "scoff": 2, "scol": 25, "scold": 5, "scolds": 2, "scon": 2, "scoo": 3, "scoop": 13, "scoot": 6, "scooting": 2, "scoots": 2, "scop": 1, "scops": 1, "scor": 85, "scorch": 6, "scorn": 99, "scorns": 1, "scot": 115, "scotch": 51, "scots": 8, "scott": 23, "scotts": 1, "scou": 20, "scound": 7, "scour": 30, "scours": 6, "scout": 13, "scouts": 6, "scow": 59, "scowl": 3, "scowls": 1, "scows": 4, "scra": 63, "scrab": 3, "scrag": 5, "scragg": 1, "scram": 30, "scrap": 18, "scraps": 11, "scrat": 45, "scratch": 20, "scratcht": 1, "scratchy": 1, "scraw": 9, "scrawl": 4, "scrawls": 1, "scre": 33, "screa": 85, "scream": 42, "screams": 10, "scree": 29, "screech": 5, "screen": 65, "screens": 14, "screw": 34, "screws": 13, "scri": 523, "scrib": 7, "scried": 27, "scries": 1, "scrim": 3, "scrimps": 1, "scrip": 265, "scripps": 2, "script": 37, "scripts": 7, "scro": 1, "scrol": 2, "scroll": 8, "scrolls": 1, "scroog": 1, "scros": 6, "scross": 2, "scrou": 1, "scroun": 1, "scru": 114, "scrub": 22, "scrubs": 5, "scrump": 1, "scry": 6, "scrying": 3, "scu": 87, "scud": 8, "scuf": 4, "scuff": 1, "scul": 4, "scull": 7, "sculls": 1, "sculp": 46, "scum": 9, "scup": 2, "scur": 11, "scurf": 1, "scutt": 25, "scuttled": 4, "scuttling": 3, "scy": 6, "scyl": 1, "sdei": 1, "se": 40773, "sea": 2201, "seago": 1, "seah": 4, "seal": 2, "seals": 19, "seam": 19, "seams": 16, "sean": 2, "sear": 16, "search": 340, "searcha": 7, "searched": 41, "searcher": 3, "searchers": 4, "searcheth": 8, "searchin": 2, "searching": 40, "searchings": 2, "searles": 1, "sears": 2, "seas": 214, "seat": 283, "seats": 57, "seatt": 7, "seaus": 3, "sec": 383, "sech": 1, "sect": 44, "sects": 31, "sed": 7287, "sedec": 9, "sedg": 3, "sedo": 14, "sedst": 7, "see": 6691, "seech": 81, "seed": 381, "seek": 416, "seem": 544, "seems": 3, "seen": 1216, "seep": 2, "seer": 36, "seers": 15, "sees": 176, "seest": 57, "seet": 25, "seeth": 56, "sef": 2, "seg": 31, "segre": 1, "seh": 147, "sehead": 1, "sei": 183, "seig": 6, "seil": 5, "sein": 3, "seir": 39, "seis": 4, "seiz": 6, "sejoin": 2, "sel": 2525, "selbs": 1, "seldo": 1, "self": 1640, "selfexi": 1, "selfob": 1, "selfre": 6, "selfres": 5, "selfrigh": 1, "selfs": 2, "sell": 297, "sells": 22, "selms": 1, "selp": 1, "sels": 248, "sem": 445, "sema": 1, "sen": 3844, "send": 510, "sends": 21, "sens": 18, "sent": 2601, "sents": 114, "seous": 4, "sep": 113, "seph": 308, "sephs": 2, "sepia": 1, "sept": 38, "septa": 1, "seq": 1, "sequen": 1, "ser": 4992, "serf": 1, "serfs": 3, "sers": 144, "sert": 159, "serta": 1, "serts": 35, "serv": 9, "sery": 136, "ses": 4189, "seso": 1, "sespous": 1, "sess": 204, "sest": 77, "seste": 1, "set": 2119, "seth": 214, "setop": 7, "setops": 7, "setre": 1, "sets": 120, "setsw": 1, "sett": 443, "setts": 59, "setup": 12, "seu": 19, "seup": 5, "seups": 2, "seur": 13, "seurs": 3, "seus": 15, "seven": 9, "seventh": 2, "sew": 13, "sewn": 1, "sex": 176, "sexa": 1, "sexes": 20, "sexu": 73, "sexy": 2, "sey": 211, "seye": 10, "seying": 1, "seys": 6, "seyt": 1, "seyw": 1, "sez": 7, "sfat": 1, "sfer": 2, "sfor": 1, "sforzt": 1, "sful": 195, "sha": 2159, "shaal": 5, "shaaph": 2, "shaar": 2, "shaash": 1, "shab": 41, "shac": 6, "shach": 16, "shack": 2, "shacks": 1, "shad": 3, "shae": 8, "shaf": 1, "shaft": 22, "shafts": 7, "shag": 16, "shah": 3, "shahn": 1, "shahs": 1, "shak": 6, "shaky": 8, "shakya": 1, "shal": 82, "shall": 11982, "shalls": 1, "shalt": 1673, "sham": 46, "shams": 2, "shan": 38, "shangri": 1, "shank": 5, "shann": 9, "shant": 1, "shantz": 1, "shap": 11, "shaphan": 30, "shar": 177, "shard": 1, "shards": 2, "shark": 38, "sharks": 58, "sharp": 220, "sharps": 1, "shart": 1, "shas": 6, "shastas": 1, "shat": 45, "shau": 1, "shaul": 7, "shaw": 14, "shawl": 19, "shawls": 2, "shaws": 3, "shay": 34, "she": 12691, "shea": 30, "shear": 45, "shearn": 1, "shears": 4, "sheb": 9, "shecha": 8, "sheckleys": 1, "shed": 173, "sheds": 6, "shee": 28, "sheen": 2, "sheeny": 2, "sheep": 251, "sheeps": 5, "sheepshea": 3, "sheepskins": 1, "sheer": 28, "sheering": 1, "sheet": 68, "sheets": 46, "shef": 1, "shei": 1, "sheik": 4, "sheiks": 1, "shel": 187, "sheldra": 1, "shelf": 33, "shell": 57, "shells": 42, "shem": 18, "shen": 3, "shena": 3, "shenan": 1, "shent": 1, "shep": 160, "shepheards": 1, "shepho": 1, "sher": 68, "sherd": 1, "sherds": 1, "shes": 53, "shesh": 4, "sheshan": 5, "shet": 7, "sheth": 2, "shev": 1, "shew": 340, "shewd": 1, "shewn": 26, "shews": 4, "shi": 532, "shiah": 3, "shib": 5, "shied": 3, "shiel": 10, "shield": 69, "shields": 37, "shies": 1, "shietz": 1, "shif": 64, "shift": 52, "shifts": 19, "shih": 1, "shil": 86, "shill": 1, "shills": 1, "shim": 27, "shims": 5, "shin": 19, "shing": 2, "shingles": 5, "ship": 1664, "shiph": 1, "shiphmi": 1, "shiphrah": 1, "shipp": 2, "ships": 275, "shipt": 1, "shir": 20, "shirk": 1, "shirl": 3, "shirr": 4, "shirt": 64, "shirted": 1, "shirts": 8, "shis": 7, "shish": 36, "shisha": 1, "shit": 40, "shitts": 1, "shmo": 1, "sho": 464, "shoa": 1, "shoc": 43, "shock": 147, "shocks": 10, "shockwa": 2, "shod": 12, "shoe": 59, "shoela": 2, "shoes": 125, "shoestring": 2, "shoestrings": 1, "shoett": 2, "shold": 2, "shom": 1, "shoo": 20, "shooes": 4, "shook": 160, "shooks": 1, "shool": 1, "shoon": 1, "shoot": 79, "shoote": 2, "shooteth": 3, "shootin": 2, "shooting": 76, "shootings": 1, "shoots": 12, "shop": 295, "shophan": 1, "shops": 49, "shor": 94, "shorn": 7, "short": 764, "shortof": 2, "shortrun": 3, "shorts": 31, "shot": 257, "shots": 40, "shou": 210, "shoue": 1, "shoul": 431, "should": 3463, "shouldn": 18, "shouldst": 7, "shoup": 4, "shout": 85, "shouts": 24, "show": 554, "showe": 10, "showed": 232, "shower": 47, "showers": 28, "showery": 3, "showes": 1, "showest": 1, "showg": 1, "showin": 1, "showing": 100, "showings": 2, "shown": 205, "shows": 143, "showt": 1, "showts": 2, "showy": 5, "shrank": 5, "shrap": 2, "shre": 5, "shred": 9, "shreds": 15, "shree": 1, "shrew": 3, "shrewd": 24, "shrews": 9, "shri": 36, "shrie": 22, "shriek": 23, "shrieks": 9, "shril": 7, "shrill": 33, "shrim": 3, "shrimp": 3, "shrin": 14, "shrink": 16, "shrinks": 2, "shriuing": 1, "shriver": 5, "shro": 1, "shrop": 3, "shrow": 2, "shrub": 23, "shrubs": 13, "shrug": 28, "shrugs": 3, "shrun": 4, "shrunk": 6, "shu": 65, "shua": 2, "shuah": 5, "shub": 1, "shubael": 3, "shuc": 1, "shucks": 3, "shud": 59, "shuf": 25, "shuiski": 1, "shul": 1, "shuld": 3, "shun": 31, "shunn": 2, "shuns": 2, "shunt": 2, "shunts": 5, "shup": 5, "shur": 23, "shushan": 21, "shut": 332, "shuthal": 1, "shuts": 7, "shutt": 9, "shuttle": 11, "shuttled": 1, "shuttling": 2, "shuz": 1, "shy": 60, "si": 22109, "sia": 157, "siah": 77, "sib": 13, "sic": 650, "sich": 2, "sick": 353, "sicks": 1, "sics": 57, "sid": 30, "siders": 1, "sidi": 6, "sidia": 2, "sidui": 5, "sie": 166, "sied": 72, "sieg": 1, "siel": 1, "sien": 2, "sient": 12, "sients": 1, "sier": 107, "siers": 1, "sies": 92, "siest": 25, "sieth": 7, "sieux": 1, "sif": 1, "sifs": 1, "sift": 6, "sifted": 6, "sifting": 1, "sig": 1015, "sigh": 131, "sigheth": 1, "sighs": 20, "sight": 886, "sightly": 5, "sights": 69, "sightseers": 1, "sign": 575, "signs": 239, "sih": 1, "sil": 641, "silk": 45, "silks": 2, "sill": 10, "sills": 2, "sils": 21, "sim": 755, "simms": 17, "simp": 10, "simpkins": 7, "simpsons": 2, "sims": 3, "sin": 3378, "sind": 2, "sing": 2908, "sings": 114, "sini": 7, "sinia": 1, "sinians": 1, "sink": 82, "sinks": 7, "sinkt": 1, "sinn": 2, "sins": 227, "sinth": 1, "sio": 7, "siopeia": 1, "sip": 118, "siphmoth": 1, "sipi": 4, "sipid": 5, "sips": 1, "sir": 1161, "sires": 1, "sirs": 17, "sis": 2215, "sisa": 2, "sisent": 1, "sisk": 2, "sism": 1, "siso": 1, "sist": 224, "sisted": 180, "sists": 78, "sit": 1260, "sita": 61, "sith": 2, "sithe": 1, "sitins": 1, "sits": 114, "sitst": 2, "six": 760, "sixe": 4, "sixes": 1, "sixeteene": 1, "sixf": 3, "sixg": 3, "sixinch": 1, "sixs": 1, "sixteen": 66, "sixteene": 1, "sixteenth": 21, "sixteenye": 1, "sixth": 88, "siz": 2, "sizz": 5, "ska": 4, "skald": 2, "skalds": 1, "skar": 1, "ske": 53, "skeet": 2, "skein": 1, "skel": 15, "skep": 17, "sket": 34, "sketch": 26, "ski": 50, "skid": 7, "skids": 1, "skie": 2, "skied": 1, "skies": 47, "skiff": 13, "skiffs": 6, "skij": 1, "skil": 67, "skill": 86, "skills": 37, "skim": 12, "skin": 207, "skins": 37, "skip": 42, "skips": 1, "skir": 25, "skirt": 39, "skirts": 24, "skis": 2, "skit": 2, "skits": 1, "sko": 19, "skol": 6, "skou": 1, "skreenes": 1, "skrim": 1, "skrims": 4, "skul": 5, "skulk": 4, "skulks": 1, "skull": 51, "skulls": 8, "skunk": 3, "skunks": 1, "skur": 1, "sky": 389, "skye": 3, "skys": 2, "sla": 263, "slab": 12, "slabs": 7, "slac": 20, "slack": 32, "slacks": 7, "slad": 1, "slag": 2, "slai": 12, "slaid": 1, "slain": 204, "slak": 3, "slam": 31, "slan": 57, "sland": 1, "slang": 5, "slangs": 1, "slant": 5, "slants": 1, "slap": 36, "slaps": 1, "slas": 20, "slash": 7, "slashb": 2, "slashmout": 1, "slat": 4, "slats": 2, "slaue": 9, "slaues": 4, "slaugh": 96, "slaught": 4, "slaughts": 2, "slav": 11, "slay": 153, "slaying": 12, "sle": 11, "sled": 15, "slee": 226, "sleek": 10, "sleeke": 2, "sleekhe": 1, "sleep": 365, "sleepes": 5, "sleepest": 6, "sleepeth": 7, "sleepi": 6, "sleepie": 2, "sleepiest": 1, "sleeples": 3, "sleepless": 13, "sleeps": 31, "sleepy": 29, "sleet": 16, "sleety": 1, "sleeue": 2, "sleg": 2, "sleigh": 2, "sleighs": 1, "sleight": 3, "sleights": 2, "slen": 55, "slept": 114, "sleptst": 1, "slets": 1, "sleuthing": 1, "slew": 206, "slews": 1, "sley": 12, "sleys": 1, "sli": 124, "slic": 4, "slick": 7, "slickhe": 1, "slid": 50, "slie": 1, "sligh": 77, "slight": 145, "slightly": 137, "slights": 5, "slike": 4, "slim": 31, "slime": 12, "slimed": 1, "slimy": 5, "slin": 8, "sling": 15, "slings": 5, "slingshot": 1, "slink": 4, "slip": 190, "slips": 16, "slipt": 2, "slit": 12, "slits": 3, "slo": 179, "sloans": 5, "slob": 6, "sloe": 2, "slof": 1, "slon": 2, "sloop": 10, "sloops": 3, "slop": 10, "slops": 1, "slos": 1, "slot": 26, "sloth": 3, "slots": 5, "slou": 18, "slouch": 3, "slough": 2, "slow": 446, "slu": 1, "slud": 4, "slue": 1, "slues": 1, "sluff": 1, "slug": 44, "slugs": 5, "slui": 13, "sluing": 1, "slum": 78, "slump": 8, "slums": 9, "slung": 10, "slunk": 6, "slur": 3, "slush": 2, "sly": 213, "smac": 6, "smack": 12, "smacks": 2, "smal": 214, "small": 1143, "smalls": 1, "smar": 14, "smart": 83, "smarts": 1, "smas": 38, "smash": 10, "smat": 1, "smatch": 1, "sme": 7, "smear": 4, "smee": 1, "smeer": 2, "smel": 45, "smell": 115, "smells": 30, "smels": 1, "smelt": 11, "smelts": 1, "smer": 1, "smerch": 1, "smi": 909, "smil": 1, "smild": 1, "smir": 5, "smirch": 1, "smirk": 3, "smit": 79, "smith": 246, "smiths": 12, "smithso": 3, "smithtown": 1, "smithy": 1, "smo": 527, "smog": 1, "smoke": 1, "smoky": 10, "smol": 6, "smoo": 1, "smoot": 56, "smooth": 107, "smoothing": 4, "smooths": 1, "smot": 12, "smoul": 2, "smu": 5, "smud": 1, "smug": 17, "smul": 1, "smus": 3, "smut": 8, "smy": 5, "smyr": 2, "sna": 175, "snack": 6, "snacks": 3, "snag": 4, "snags": 1, "snail": 15, "snails": 3, "snak": 3, "snaky": 7, "snap": 101, "snaps": 1, "snar": 15, "snarl": 1, "snarls": 1, "snat": 58, "snatch": 15, "snaz": 1, "sne": 4, "snea": 13, "snead": 2, "sneak": 12, "sneaks": 2, "sneaky": 2, "snee": 39, "sneed": 1, "sneer": 11, "sneered": 5, "sneers": 3, "snel": 12, "sner": 1, "sni": 9, "snic": 3, "snick": 1, "snif": 14, "sniff": 3, "sniffs": 1, "snig": 2, "snik": 2, "snip": 3, "snips": 3, "sno": 29, "snob": 14, "snobs": 3, "snoo": 1, "snook": 1, "snoop": 1, "snooze": 1, "snoozing": 1, "snor": 15, "snoring": 8, "snort": 6, "snorts": 1, "snout": 5, "snow": 224, "snowing": 7, "snows": 23, "snowy": 23, "snu": 6, "snub": 5, "snuck": 1, "snuf": 22, "snuff": 11, "snug": 28, "snut": 1, "sny": 2, "so": 26241, "soa": 28, "soak": 25, "soaks": 1, "soame": 1, "soap": 36, "soaps": 3, "soar": 10, "soars": 2, "sob": 36, "sobs": 15, "soc": 3, "sod": 17, "soda": 1, "soe": 448, "soes": 1, "soeu": 3, "sof": 80, "soff": 6, "soft": 340, "softs": 3, "sog": 7, "soho": 2, "soi": 17, "soid": 1, "soids": 6, "soig": 1, "soil": 125, "soils": 18, "sok": 6, "sokols": 2, "sol": 626, "sold": 190, "soll": 1, "sols": 6, "solv": 4, "som": 228, "some": 1, "soms": 39, "son": 6038, "sond": 1, "song": 336, "songs": 199, "soni": 3, "sonnam": 2, "sons": 1842, "sonu": 1, "soo": 19, "soon": 1280, "sooner": 111, "soons": 1, "soop": 1, "soot": 37, "sooth": 37, "soothin": 4, "soothing": 29, "soothings": 2, "sooty": 5, "sop": 260, "sopa": 1, "sophs": 4, "sopp": 1, "sops": 1, "sor": 1043, "sorb": 28, "sorbs": 4, "sord": 1, "sorgsky": 7, "sorgskys": 1, "sorl": 1, "soro": 1, "sorp": 18, "sors": 140, "sort": 798, "sorts": 60, "sorum": 2, "sos": 13, "sosthe": 2, "sot": 2, "sou": 412, "soud": 1, "souf": 1, "soug": 1, "sough": 1, "sought": 312, "soul": 980, "soula": 1, "soule": 41, "souled": 1, "soules": 14, "souls": 164, "soun": 175, "sound": 560, "sounds": 146, "soup": 39, "sour": 354, "sours": 2, "sout": 1, "south": 513, "sove": 76, "sover": 77, "sovers": 1, "sow": 55, "sown": 40, "sox": 14, "soxer": 1, "soxhlet": 1, "soy": 15, "spa": 1474, "spag": 1, "spah": 1, "spahn": 5, "spahns": 1, "spai": 1, "spain": 19, "spal": 1, "span": 43, "spand": 1, "spang": 7, "spann": 4, "spans": 9, "spar": 53, "spark": 81, "sparks": 18, "sparky": 3, "spars": 18, "spas": 14, "spasm": 13, "spat": 23, "spats": 2, "spaw": 1, "spawn": 1, "spe": 1029, "spea": 656, "speak": 1121, "speaks": 49, "spear": 95, "spec": 379, "speck": 16, "speckle": 1, "speckles": 1, "specks": 6, "specksi": 1, "spect": 114, "spectre": 6, "spects": 44, "sped": 26, "spee": 91, "speech": 251, "speechles": 5, "speechless": 18, "speed": 178, "speeding": 14, "speeds": 20, "speedup": 1, "speedy": 22, "speer": 1, "spei": 1, "spel": 23, "spell": 42, "spells": 4, "spels": 1, "spelt": 2, "spen": 118, "spend": 132, "spends": 11, "speng": 1, "spent": 233, "sper": 26, "sperm": 245, "spes": 1, "spey": 10, "spi": 2167, "spic": 1, "spie": 3, "spied": 15, "spier": 1, "spies": 25, "spight": 3, "spightfull": 1, "spil": 24, "spill": 5, "spills": 2, "spilt": 5, "spin": 59, "spinach": 3, "spind": 12, "spins": 2, "spir": 2, "spirt": 1, "spirts": 1, "spit": 35, "spitt": 5, "spitz": 5, "splas": 25, "splash": 21, "splat": 1, "splay": 2, "sple": 1, "spleen": 5, "spleena": 1, "spleene": 1, "splen": 103, "spleno": 1, "splice": 8, "spliced": 2, "splicing": 1, "splin": 32, "splint": 1, "splints": 1, "split": 68, "splits": 3, "splot": 3, "splur": 1, "splut": 7, "spo": 910, "spoa": 1, "spof": 1, "spoi": 138, "spoil": 145, "spoils": 15, "spoilt": 7, "spon": 143, "spoof": 1, "spooks": 1, "spooky": 2, "spool": 2, "spoon": 43, "spooned": 1, "spoons": 14, "spor": 33, "sport": 52, "sports": 87, "spos": 1, "spot": 255, "spots": 53, "spou": 61, "spout": 64, "spouts": 20, "spoy": 3, "spra": 4, "sprai": 10, "sprain": 2, "sprains": 2, "sprang": 100, "sprat": 1, "spraw": 26, "sprawl": 5, "sprawls": 2, "spray": 48, "spraying": 8, "sprays": 1, "spre": 1, "sprea": 79, "spread": 333, "spreads": 20, "spred": 2, "spree": 4, "spri": 1, "sprig": 3, "sprightly": 4, "sprights": 3, "sprigs": 3, "sprin": 32, "sprind": 1, "spring": 373, "springjoints": 1, "springs": 54, "sprink": 42, "sprinkled": 40, "sprinkling": 13, "sprinklings": 1, "spro": 1, "sprots": 1, "spru": 12, "sprue": 2, "sprung": 50, "spry": 2, "spu": 6, "spud": 4, "spue": 4, "spun": 38, "spund": 3, "spur": 50, "spurd": 3, "spurn": 3, "spurning": 4, "spurns": 2, "spurr": 1, "spurs": 8, "spurt": 3, "spurts": 1, "spurz": 1, "sput": 5, "spuy": 1, "spy": 43, "spying": 7, "squa": 375, "squab": 4, "squad": 18, "squads": 6, "squal": 1, "squall": 28, "squalls": 6, "squan": 2, "squas": 4, "squash": 4, "squat": 17, "squats": 2, "squatting": 8, "squattings": 1, "squaw": 8, "squawk": 1, "sque": 8, "squea": 11, "squeak": 5, "squeaky": 3, "squeals": 1, "squee": 59, "squel": 1, "squi": 24, "squibb": 2, "squid": 7, "squil": 1, "squin": 6, "squint": 4, "squints": 1, "squir": 20, "squirms": 1, "squirt": 1, "squitchy": 1, "sre": 3, "sssah": 1, "sssshoo": 1, "sta": 4210, "stab": 22, "stabb": 2, "stabs": 3, "stac": 12, "stack": 22, "stacks": 7, "stad": 3, "staf": 14, "staff": 185, "staffs": 11, "stag": 93, "stags": 1, "stai": 96, "staid": 33, "stail": 1, "stain": 38, "stains": 14, "stair": 45, "stairs": 216, "stak": 3, "stal": 147, "stalk": 18, "stalks": 7, "stall": 58, "stalls": 9, "stals": 1, "stam": 88, "stamm": 35, "stamp": 16, "stamps": 5, "stampt": 1, "stams": 3, "stan": 2013, "stanch": 3, "stand": 1510, "standar": 6, "standard": 144, "standards": 81, "standins": 3, "stands": 185, "stank": 4, "stans": 4, "stant": 683, "stants": 11, "star": 902, "starch": 4, "stardom": 2, "stark": 19, "starr": 2, "stars": 257, "start": 365, "starts": 40, "starv": 1, "stas": 1, "stash": 3, "stat": 11, "stata": 1, "stats": 1, "staues": 1, "staun": 5, "staunch": 4, "stay": 522, "staying": 69, "stays": 26, "ste": 333, "stea": 289, "stead": 476, "steads": 1, "steak": 27, "steaks": 8, "steals": 4, "steam": 63, "steamed": 6, "steamer": 8, "steamers": 9, "steams": 13, "sted": 977, "steds": 7, "stedst": 1, "stee": 194, "steed": 20, "steeds": 9, "steel": 167, "steels": 4, "steely": 2, "steep": 65, "steeped": 8, "steeps": 2, "steer": 24, "steers": 16, "stei": 13, "stein": 66, "steins": 8, "stel": 28, "stem": 49, "stemm": 1, "stems": 39, "sten": 19, "stench": 2, "stend": 3, "step": 480, "steps": 272, "stept": 5, "ster": 245, "stern": 132, "sterning": 2, "sterns": 4, "steroid": 2, "steroids": 2, "sterous": 13, "sters": 75, "stery": 3, "stet": 6, "steth": 4, "stetsons": 1, "steu": 2, "stew": 8, "stews": 1, "sti": 694, "stic": 55, "stick": 174, "sticks": 55, "stier": 1, "stif": 74, "stiff": 55, "stiffs": 1, "stig": 5, "stiggs": 2, "stil": 20, "still": 2171, "stilldark": 1, "stills": 2, "stilts": 4, "stim": 1, "stin": 24, "stinc": 38, "stinct": 43, "stincts": 9, "sting": 40, "stingles": 1, "stings": 7, "stink": 13, "stint": 7, "stir": 211, "stirr": 3, "stirs": 9, "stit": 8, "stitch": 13, "sto": 1854, "stoc": 27, "stock": 247, "stocks": 39, "stod": 1, "stof": 3, "stoi": 8, "stoic": 5, "stoicks": 1, "stoics": 2, "stol": 3, "stoll": 1, "stom": 3, "ston": 1, "stoo": 25, "stood": 1391, "stoog": 1, "stool": 38, "stoole": 1, "stooles": 1, "stools": 3, "stooooomp": 1, "stoop": 54, "stoope": 2, "stoopin": 1, "stoops": 3, "stop": 704, "stopp": 1, "stops": 19, "stopt": 22, "stor": 79, "stord": 1, "stork": 9, "storm": 127, "storms": 34, "stou": 6, "stout": 50, "stouts": 1, "stow": 46, "stoy": 8, "stoys": 2, "stpol": 2, "stra": 775, "strac": 53, "stract": 44, "stracts": 5, "stradd": 1, "straddled": 2, "straddling": 5, "straf": 3, "strafe": 2, "strafing": 1, "strag": 12, "strah": 1, "strai": 66, "straigh": 42, "straight": 292, "straighta": 3, "straightar": 1, "straightarm": 1, "straightback": 1, "straightfor": 12, "straightline": 1, "straightout": 1, "straightway": 56, "strain": 54, "strains": 17, "strait": 40, "straits": 25, "strakh": 1, "stral": 7, "stram": 4, "strams": 1, "stran": 989, "strand": 32, "strands": 6, "strang": 24, "strant": 5, "strants": 4, "strap": 11, "straps": 10, "strar": 1, "stras": 10, "strat": 11, "strauss": 3, "straw": 100, "straws": 5, "stray": 41, "straying": 4, "strayings": 1, "strays": 8, "stre": 22, "strea": 38, "streak": 22, "streaks": 11, "streaky": 1, "stream": 135, "streams": 57, "stree": 5, "street": 533, "streets": 268, "streigh": 1, "streights": 1, "strel": 8, "strels": 6, "streng": 138, "strength": 521, "strengths": 4, "strep": 1, "stres": 48, "stress": 109, "stressful": 2, "stret": 237, "stretch": 120, "stretcht": 3, "strew": 8, "strewn": 14, "stri": 788, "stria": 4, "stric": 162, "strick": 2, "strict": 131, "stricts": 2, "stries": 40, "strin": 14, "strind": 2, "string": 83, "strings": 39, "strip": 120, "strips": 23, "stript": 7, "stritch": 1, "stro": 196, "strol": 33, "stroll": 14, "strom": 9, "stron": 266, "strong": 838, "strongheart": 1, "stroo": 6, "strook": 1, "stroom": 1, "strop": 41, "strophism": 5, "strophist": 1, "strow": 1, "strown": 3, "strows": 1, "stru": 253, "struc": 777, "struck": 296, "struct": 41, "structing": 11, "structs": 4, "strue": 4, "strug": 194, "struing": 1, "struk": 1, "strum": 3, "strung": 8, "struous": 3, "struse": 1, "strusest": 1, "strust": 1, "strut": 8, "struts": 1, "stry": 252, "strych": 4, "strys": 15, "stu": 1244, "stub": 86, "stubb": 257, "stubbs": 4, "stubs": 2, "stuc": 8, "stuck": 61, "stud": 21, "studs": 6, "stuf": 27, "stuff": 99, "stuffs": 5, "stufft": 1, "stul": 2, "stum": 109, "stump": 24, "stumps": 10, "stun": 46, "stung": 14, "stunk": 1, "stunn": 1, "stunt": 2, "stunts": 2, "stuous": 12, "stur": 52, "sturch": 2, "stuttg": 2, "sty": 418, "stye": 1, "styx": 1, "su": 6588, "sua": 23, "suah": 1, "sual": 1, "sub": 1995, "subgroup": 1, "subgroups": 7, "subs": 3, "subt": 68, "subtle": 12, "subtler": 6, "subtly": 15, "suc": 777, "such": 3863, "sucha": 1, "suck": 49, "suckle": 4, "suckles": 1, "sucks": 1, "sud": 770, "suds": 12, "sue": 370, "sued": 204, "sues": 98, "suest": 1, "suet": 4, "sueth": 8, "suey": 1, "suf": 909, "sug": 376, "suggs": 1, "suh": 2, "suhs": 1, "suht": 1, "sui": 128, "suing": 81, "suit": 190, "suits": 35, "suk": 1, "sul": 363, "sulk": 5, "sulks": 4, "sulp": 18, "suls": 1, "sult": 353, "sulta": 26, "sults": 176, "sulz": 5, "sum": 651, "summ": 3, "sump": 156, "sums": 24, "sun": 1289, "sunay": 1, "sung": 58, "sungshan": 1, "sunk": 66, "sunn": 1, "suns": 62, "sunst": 1, "sunt": 1, "suous": 3, "sup": 1862, "sups": 1, "supt": 4, "sur": 1354, "surd": 56, "sure": 97, "sures": 1, "surf": 11, "surfa": 326, "surfac": 3, "surfaceness": 1, "sursa": 1, "sus": 657, "susan": 331, "susans": 2, "suses": 3, "susque": 1, "sustai": 38, "sustain": 30, "sustains": 2, "sut": 4, "sva": 1, "sve": 1, "svel": 1, "svens": 1, "swa": 106, "swab": 2, "swack": 1, "swaddled": 2, "swaddling": 4, "swag": 13, "swags": 1, "swai": 2, "swain": 1, "swal": 146, "swam": 47, "swamp": 17, "swamps": 8, "swan": 10, "swank": 1, "swans": 1, "swao": 1, "swap": 6, "swar": 31, "swarm": 12, "swarms": 13, "swart": 24, "swartz": 1, "swas": 3, "swash": 2, "swat": 3, "swath": 1, "sway": 62, "swaying": 18, "swayings": 1, "sways": 4, "swe": 28, "swea": 99, "swear": 141, "swears": 9, "sweat": 50, "sweats": 3, "swee": 141, "sween": 7, "sweep": 57, "sweeps": 9, "sweepsta": 32, "sweet": 546, "sweets": 9, "sweetshrub": 1, "sweetsmel": 3, "sweetsoun": 1, "sweetsour": 3, "swel": 65, "swell": 43, "swells": 19, "swept": 74, "swer": 20, "swet": 2, "swi": 37, "swif": 17, "swift": 242, "swifts": 2, "swig": 2, "swil": 1, "swim": 171, "swims": 13, "swin": 58, "swind": 4, "swing": 41, "swings": 14, "swir": 11, "swirl": 3, "swirls": 1, "swis": 9, "swiss": 17, "swit": 66, "switch": 50, "swo": 37, "swol": 20, "swoo": 6, "swoon": 3, "swooned": 2, "swoop": 10, "swoope": 1, "swoops": 3, "swor": 5, "sword": 657, "swords": 102, "sworn": 70, "swound": 1, "swum": 6, "swung": 111, "sy": 2579, "syb": 1, "syd": 6, "sying": 8, "syings": 1, "syl": 118, "sylp": 1, "sylph": 1, "sylphs": 1, "sym": 421, "symp": 60, "sympt": 31, "symptom": 14, "syn": 83, "syr": 1, "syra": 3, "sys": 208, "syth": 1, "syue": 1, "syugo": 1, "syw": 1, "sze": 1, "szold": 11, "szolds": 6, "ta": 12754, "taan": 1, "taanach": 6, "taavah": 5, "tab": 6, "tabb": 1, "tac": 127, "tach": 169, "tachmo": 1, "tack": 198, "tacks": 35, "tact": 115, "tacts": 25, "tad": 3, "taean": 1, "taf": 13, "taft": 4, "tag": 15, "tagh": 1, "tags": 3, "tah": 31, "tahan": 2, "tahm": 1, "tai": 1013, "taic": 7, "taig": 5, "tail": 329, "tailous": 1, "tails": 112, "taim": 2, "tain": 3449, "tains": 660, "taint": 11, "taints": 3, "taishan": 1, "tak": 1, "taksim": 1, "tal": 2624, "talb": 55, "talk": 502, "talks": 40, "tall": 237, "tals": 100, "tam": 33, "tamins": 10, "tamp": 1, "tan": 1873, "tanach": 1, "tanah": 2, "tanaquil": 1, "tand": 5, "tang": 60, "tanga": 1, "tangs": 1, "tank": 13, "tanks": 18, "tann": 5, "tans": 22, "tanschauung": 1, "tant": 933, "tants": 311, "tao": 4, "taoism": 4, "taoist": 3, "taoists": 2, "tap": 109, "taph": 6, "taphs": 1, "tapor": 1, "taps": 8, "tar": 775, "tarc": 8, "tarch": 2, "tard": 60, "tards": 16, "tarea": 1, "tarl": 62, "tarns": 1, "tarous": 1, "tars": 64, "tarsoak": 1, "tarsus": 7, "tart": 13, "tarts": 12, "taruf": 1, "tas": 499, "tash": 62, "task": 102, "tasm": 1, "tass": 4, "tast": 1, "tasty": 2, "tat": 70, "tath": 1, "tatt": 47, "tau": 82, "taught": 227, "taui": 24, "tauio": 2, "tauk": 1, "taun": 21, "taunt": 9, "taunts": 4, "taur": 1, "taurs": 2, "taus": 2, "taut": 12, "tautner": 1, "taw": 20, "tawn": 2, "taws": 3, "tax": 264, "taxa": 24, "taxai": 1, "taxed": 19, "taxer": 15, "taxes": 48, "taxexemp": 2, "taxexempt": 6, "taxi": 20, "taxied": 1, "taxing": 11, "taxis": 4, "tay": 79, "taya": 4, "tays": 1, "tcha": 1, "tchai": 2, "tcu": 1, "tcus": 1, "te": 25237, "tea": 563, "teacart": 2, "teach": 210, "tead": 8, "teads": 3, "teak": 3, "team": 105, "teamed": 3, "teams": 27, "tean": 3, "tear": 80, "tears": 220, "tearsoak": 1, "teas": 2, "teaspoon": 8, "teaspoons": 3, "teats": 9, "teau": 13, "teaus": 4, "tec": 367, "tech": 397, "techa": 1, "techah": 1, "techo": 1, "techs": 2, "tect": 89, "tects": 23, "ted": 15633, "tedst": 7, "tee": 275, "teed": 15, "teeeee": 1, "teeism": 1, "teel": 22, "teem": 90, "teeme": 2, "teemes": 1, "teems": 3, "teen": 159, "teeninch": 1, "teens": 5, "teenth": 65, "teenye": 2, "teer": 15, "teers": 36, "tees": 82, "teet": 3, "teeth": 252, "teeto": 1, "teewo": 2, "teeye": 1, "teff": 1, "teg": 1, "tego": 57, "tehead": 7, "teheads": 2, "tei": 5, "teia": 1, "teil": 1, "tein": 27, "teins": 14, "tek": 7, "tel": 822, "tell": 1438, "tells": 87, "tels": 45, "tem": 1649, "temn": 3, "temns": 1, "temp": 270, "temps": 1, "tempt": 299, "tempta": 71, "tempts": 67, "tems": 153, "ten": 6207, "tena": 3, "tenan": 310, "tend": 389, "tends": 98, "tene": 1, "tener": 1, "teness": 1, "tenin": 1, "tening": 59, "tenings": 3, "tenn": 1, "tens": 69, "tent": 879, "tenta": 5, "tenth": 102, "tents": 180, "tenu": 1, "teo": 2, "teous": 711, "teow": 12, "tep": 11, "tepid": 5, "ter": 21757, "tera": 104, "teran": 32, "terans": 1, "teraxi": 1, "terd": 1, "tere": 3, "tered": 25, "terf": 6, "tergo": 1, "tering": 4, "term": 150, "terms": 242, "tern": 563, "ternr": 1, "terns": 72, "tero": 6, "teroi": 1, "teroid": 1, "teroom": 2, "terous": 32, "ters": 2835, "terspout": 1, "terspouts": 1, "tersprings": 2, "tersti": 2, "terthana": 1, "tertwi": 6, "tertwis": 2, "tery": 387, "teryear": 3, "terys": 2, "tes": 4964, "tescue": 3, "tesh": 1, "tesque": 28, "tesques": 1, "tess": 49, "test": 945, "tested": 69, "testi": 2, "tests": 90, "testuc": 1, "testy": 1, "tesui": 1, "tet": 24, "tetail": 2, "teth": 504, "tetop": 2, "tets": 2, "teu": 17, "teuil": 1, "teur": 33, "teurs": 4, "teus": 2, "tew": 1, "tex": 124, "texan": 6, "texans": 9, "texas": 85, "texel": 2, "texo": 2, "text": 132, "texts": 11, "tey": 13, "tez": 1, "tget": 1, "tha": 187, "thac": 3, "thad": 3, "thah": 5, "thai": 11, "thaim": 5, "thak": 1, "thal": 8, "tham": 3, "than": 5040, "thana": 1, "thandro": 1, "thank": 270, "thanks": 207, "thanor": 1, "thans": 23, "thant": 5, "thar": 24, "tharsus": 1, "thaso": 2, "that": 39416, "thatch": 3, "thatd": 1, "thats": 187, "thatt": 1, "thaw": 10, "thaws": 1, "thax": 3, "thay": 15, "thaz": 1, "thchi": 1, "the": 222017, "thea": 14, "theads": 2, "thean": 1, "thear": 4, "theas": 1, "thed": 91, "thee": 4838, "theefe": 1, "thees": 1, "theeu": 1, "thefin": 1, "theft": 19, "thefts": 4, "thei": 1, "their": 10476, "theirs": 81, "theistic": 1, "thel": 16, "thelm": 1, "thelma": 6, "them": 13104, "thems": 4, "then": 7028, "thens": 8, "ther": 13118, "therin": 1, "thering": 84, "therings": 10, "thern": 92, "thero": 2, "therocks": 1, "therous": 1, "thers": 990, "thery": 5, "thes": 66, "thespi": 1, "thest": 2, "thet": 16, "theth": 5, "thets": 9, "theu": 1, "theus": 22, "thew": 11, "thews": 4, "they": 16808, "theyd": 30, "theyll": 32, "thfin": 1, "thi": 1390, "thia": 2, "thiah": 9, "thians": 10, "thic": 92, "thick": 308, "thicks": 1, "thie": 68, "thief": 84, "thiel": 4, "thier": 1, "thies": 13, "thigh": 44, "thighs": 16, "thiim": 1, "thij": 1, "thills": 1, "thim": 13, "thims": 1, "thin": 737, "thing": 6813, "thingor": 1, "things": 2365, "think": 2142, "thinks": 129, "thinkst": 1, "thinn": 2, "thir": 71, "third": 541, "thirdin": 1, "thirds": 23, "thirst": 50, "thirsts": 2, "thirteen": 45, "thirteenth": 14, "thirty": 370, "thirtyn": 1, "thirtyt": 3, "this": 14061, "thist": 16, "thle": 56, "thles": 5, "thless": 28, "tho": 3617, "thoar": 1, "thod": 169, "thodop": 1, "thods": 149, "thof": 1, "thol": 1, "thom": 27, "thomp": 38, "thompsons": 5, "thoms": 17, "thon": 26, "thong": 1, "thongs": 2, "thop": 2, "thor": 110, "thorn": 32, "thorns": 62, "thorp": 2, "thors": 45, "thos": 6, "thoth": 16, "thou": 7797, "though": 2180, "thought": 1887, "thoughtful": 82, "thoughts": 379, "thould": 1, "thout": 1, "thpaaneah": 1, "thra": 3, "thrab": 1, "thral": 8, "thrall": 5, "thralls": 1, "thrap": 1, "thras": 14, "thrash": 1, "thre": 6, "three": 1914, "threeaxis": 1, "threed": 3, "threefold": 9, "threefourths": 2, "threepen": 5, "threepower": 1, "threer": 1, "threeround": 2, "threes": 12, "threesco": 94, "threeso": 3, "threeyear": 5, "thren": 586, "thres": 84, "thresh": 4, "threw": 171, "thrice": 56, "thrie": 1, "thries": 1, "thrif": 6, "thrift": 19, "thright": 19, "thrightly": 1, "thrightness": 2, "thril": 15, "thrill": 15, "thrills": 4, "thrim": 4, "thritis": 3, "thriue": 2, "thrive": 4, "thrived": 5, "thrives": 2, "thriving": 6, "thro": 603, "throb": 29, "throbb": 1, "throbs": 7, "throes": 14, "throid": 1, "throm": 3, "thron": 12, "throng": 18, "throom": 19, "throoms": 1, "throp": 15, "thros": 5, "thrott": 14, "throu": 1, "throug": 334, "through": 2581, "throughs": 1, "throw": 172, "thrown": 191, "throws": 19, "thru": 19, "thrug": 1, "thrum": 2, "thrus": 31, "thrush": 8, "thrusim": 2, "thrust": 117, "thrusted": 1, "thrusts": 10, "thshan": 3, "thshead": 2, "thshean": 6, "thso": 16, "thu": 105, "thud": 9, "thuds": 1, "thug": 2, "thugs": 2, "thum": 17, "thumb": 46, "thumbs": 8, "thump": 14, "thun": 215, "thunk": 1, "thur": 9, "thurs": 69, "thus": 1682, "thut": 1, "thy": 6263, "thyi": 1, "thyl": 5, "thyla": 1, "thyn": 4, "thyroxi": 9, "thys": 6, "thyst": 3, "ti": 54208, "tia": 72, "tiac": 1, "tiad": 3, "tiah": 18, "tian": 2, "tians": 168, "tiao": 1, "tiar": 1, "tib": 8, "tic": 2121, "ticfrin": 1, "tich": 3, "tick": 30, "ticks": 5, "tics": 417, "tict": 1, "tid": 1, "tie": 222, "tieck": 1, "tied": 179, "tiein": 1, "tiel": 12, "tien": 3, "tiens": 1, "tient": 335, "tients": 63, "tier": 113, "tiers": 57, "ties": 2680, "tiest": 53, "tieth": 100, "tiev": 1, "tif": 9, "tiff": 9, "tiffs": 10, "tifs": 5, "tift": 1, "tig": 5, "tiga": 10, "tigard": 2, "tigh": 31, "tight": 59, "tightly": 25, "tightturn": 1, "tigue": 26, "tigued": 12, "tigues": 7, "tigui": 1, "tiguing": 2, "tiguous": 4, "tii": 1, "tij": 1, "tik": 3, "til": 1163, "tilgh": 29, "till": 1080, "tills": 1, "tilt": 8, "tilth": 3, "tilts": 2, "tim": 252, "timex": 2, "timid": 25, "tims": 29, "tin": 777, "tina": 3, "tinc": 137, "tinch": 2, "tinct": 154, "tind": 1, "ting": 8214, "tingles": 1, "tingli": 1, "tingro": 5, "tings": 218, "tinins": 2, "tink": 3, "tins": 21, "tint": 5, "tints": 8, "tinuum": 7, "tiny": 94, "tio": 80, "tious": 270, "tip": 92, "tiphsah": 2, "tips": 19, "tipt": 1, "tir": 31, "tirh": 1, "tirs": 5, "tis": 1082, "tish": 207, "tism": 129, "tiss": 3, "tist": 202, "tists": 147, "tit": 255, "titch": 2, "tits": 4, "titt": 3, "tiv": 1, "tive": 13, "tiyear": 2, "tiz": 1, "tjawn": 1, "tjokor": 1, "tlah": 1, "to": 98602, "toa": 5, "toad": 16, "toadies": 1, "toady": 1, "toafa": 1, "toas": 3, "toast": 24, "toasts": 1, "toat": 1, "tob": 2, "tobe": 1, "toc": 2, "toch": 1, "tock": 27, "tocks": 6, "tod": 45, "todd": 24, "toddlers": 1, "tods": 1, "toe": 44, "toed": 5, "toei": 2, "toend": 1, "toes": 75, "toeu": 1, "toeye": 1, "tof": 5, "tofi": 1, "tofu": 1, "tog": 2, "togs": 2, "toi": 90, "toia": 1, "toid": 2, "toids": 3, "toil": 39, "toils": 8, "toilso": 8, "toirs": 3, "toism": 1, "tok": 1, "tokyo": 18, "tol": 99, "tolad": 2, "told": 1215, "toll": 49, "tolls": 4, "tolo": 11, "tols": 2, "tom": 200, "tomb": 35, "tombs": 13, "toms": 4, "ton": 2392, "tone": 3, "tong": 4, "tongs": 18, "tonk": 1, "tonks": 1, "tons": 214, "too": 2366, "tood": 2, "tooed": 10, "tooex": 1, "tooff": 1, "toohear": 1, "took": 1720, "tool": 54, "tools": 58, "toom": 1, "toon": 17, "tooned": 1, "toons": 13, "toop": 1, "toos": 1, "toosim": 1, "toot": 22, "tooth": 58, "toothstraigh": 1, "top": 681, "tope": 1, "topers": 1, "topeu": 1, "tophea": 1, "topo": 1, "topran": 1, "tops": 65, "topsy": 1, "topt": 4, "tor": 2171, "tora": 25, "torch": 15, "torm": 1, "torn": 86, "toroon": 2, "toroons": 1, "torous": 2, "torpid": 5, "tors": 871, "tort": 20, "tos": 169, "tosce": 1, "tosei": 1, "tosh": 4, "toshoul": 1, "toss": 28, "tost": 7, "tot": 41, "toth": 5, "tou": 424, "touch": 304, "toucht": 1, "toug": 23, "tough": 46, "toughs": 3, "toun": 15, "tound": 1, "tour": 96, "tours": 28, "tous": 88, "tout": 7, "touta": 1, "touts": 1, "tov": 7, "tow": 24, "town": 1, "toxe": 1, "toxi": 18, "toxic": 4, "toxin": 1, "toy": 25, "toyear": 2, "toying": 2, "toyn": 9, "toyo": 1, "toys": 17, "tra": 2384, "trabb": 1, "trac": 363, "tracan": 1, "trach": 19, "track": 77, "tracks": 24, "tract": 149, "tracts": 50, "tradd": 1, "traef": 1, "traf": 85, "trai": 428, "trail": 49, "trails": 28, "train": 203, "trains": 30, "traint": 43, "traints": 13, "traipsing": 1, "trait": 6, "traits": 10, "tral": 280, "trall": 2, "trals": 2, "tram": 27, "tramp": 15, "trample": 9, "trampled": 10, "tramps": 1, "tran": 396, "trand": 1, "trans": 836, "transa": 1, "transpa": 47, "transpi": 1, "trant": 4, "trap": 102, "trapp": 1, "traps": 15, "trarch": 7, "tras": 35, "trash": 9, "trass": 1, "trast": 109, "trasta": 1, "trasts": 12, "trau": 7, "traught": 2, "traw": 1, "traxel": 1, "tray": 171, "trayal": 8, "traying": 12, "trays": 7, "tre": 1430, "trea": 57, "tread": 59, "treads": 1, "tream": 1, "treb": 6, "trec": 1, "tred": 13, "tree": 570, "trees": 479, "treg": 1, "trek": 3, "trel": 7, "trem": 226, "tren": 43, "trench": 17, "trend": 48, "trends": 21, "trent": 1, "treous": 1, "trep": 1, "trepi": 7, "trepid": 11, "trepie": 1, "tres": 227, "tress": 138, "trest": 4, "tretemps": 2, "treux": 1, "trey": 6, "tri": 2380, "triad": 1, "triam": 4, "tribs": 1, "tric": 216, "trichlo": 1, "trick": 92, "tricks": 43, "trics": 5, "trict": 143, "tricts": 44, "trie": 23, "tried": 396, "trient": 2, "trients": 5, "tries": 287, "triest": 3, "trieth": 5, "triev": 1, "trig": 32, "trigg": 1, "trigs": 1, "trii": 4, "tril": 15, "trill": 5, "trills": 4, "trils": 31, "trim": 55, "trimm": 3, "trims": 3, "trin": 16, "trina": 1, "tring": 7, "trio": 14, "trious": 58, "trip": 107, "trips": 29, "tris": 10, "triser": 2, "trishy": 1, "trist": 6, "trists": 5, "trix": 6, "tro": 807, "trod": 58, "troeltsch": 1, "troen": 1, "trohan": 1, "troi": 1, "troil": 1, "troism": 2, "troit": 21, "troits": 1, "trol": 377, "trola": 1, "troll": 1, "trolls": 1, "trols": 36, "trom": 3, "tron": 62, "trons": 28, "troo": 14, "troon": 3, "troop": 48, "troops": 68, "trop": 49, "trophee": 1, "tropho": 1, "tros": 12, "tross": 9, "trot": 38, "troth": 4, "trots": 2, "trou": 664, "trough": 7, "troughs": 7, "troul": 2, "tround": 1, "troup": 5, "trous": 115, "trout": 42, "trow": 18, "troy": 8, "tru": 311, "truc": 12, "truck": 78, "trucks": 28, "trud": 13, "true": 768, "truis": 2, "truism": 5, "trulie": 1, "trum": 203, "trump": 6, "trumps": 2, "trums": 2, "trun": 2, "trunca": 3, "trund": 15, "trunk": 46, "trunks": 13, "trus": 91, "trusi": 32, "trust": 367, "trusted": 98, "trustedst": 3, "trusts": 10, "trusty": 3, "truth": 667, "truths": 18, "try": 1522, "tryand": 4, "tryin": 2, "trying": 283, "trypho": 1, "trys": 17, "trysqui": 1, "tsa": 2, "tsar": 1, "tsars": 2, "tschil": 1, "tse": 1, "tsem": 2, "tshom": 8, "tshtre": 1, "tsi": 1, "tsou": 1, "tsuna": 22, "ttau": 1, "tu": 10761, "tua": 1, "tub": 53, "tubs": 20, "tuc": 170, "tuck": 20, "tucki": 3, "tuckois": 1, "tucks": 1, "tue": 195, "tuf": 9, "tuft": 7, "tufts": 6, "tug": 31, "tugg": 1, "tugo": 1, "tugof": 2, "tuh": 2, "tui": 27, "tuk": 3, "tul": 13, "tulln": 1, "tum": 146, "tumid": 1, "tumn": 71, "tums": 1, "tun": 54, "tund": 3, "tung": 7, "tuns": 2, "tuo": 2, "tuou": 1, "tuous": 135, "tup": 4, "tups": 1, "tur": 2094, "turb": 37, "turf": 22, "turk": 15, "turks": 9, "turn": 2173, "turni": 1, "turning": 457, "turnings": 2, "turns": 198, "turt": 94, "tus": 459, "tuses": 2, "tush": 2, "tusi": 4, "tusk": 2, "tut": 16, "tutt": 5, "tuxa": 5, "tuxe": 1, "tva": 1, "twad": 1, "twai": 3, "twain": 33, "twains": 1, "twang": 1, "twas": 28, "twe": 20, "twea": 1, "twee": 8, "tweed": 8, "tweeds": 4, "twel": 340, "twelfth": 34, "twen": 731, "twer": 2, "twi": 362, "twig": 9, "twigs": 16, "twill": 9, "twin": 65, "twins": 22, "twir": 13, "twirl": 2, "twis": 32, "twisk": 1, "twist": 34, "twists": 10, "twit": 23, "twitch": 7, "twixt": 35, "two": 3852, "twoan": 1, "twoed": 2, "twohead": 1, "twoin": 1, "twoinch": 1, "twola": 1, "twoli": 1, "twopart": 1, "twopen": 16, "twor": 1, "twos": 12, "twosto": 8, "twould": 4, "twoye": 1, "twoyear": 5, "ty": 15591, "tya": 3, "tych": 2, "tydo": 1, "tydwel": 1, "tye": 3, "tyear": 2, "tyg": 1, "tyin": 1, "tying": 39, "tyl": 1, "tyls": 2, "tym": 5, "tyn": 2, "tyns": 1, "tyow": 1, "typhoe": 1, "typhoid": 2, "typhon": 1, "typhoon": 9, "typhoons": 3, "tyr": 23, "tyran": 39, "tyrant": 36, "tyrants": 16, "tyro": 7, "tyros": 1, "tyrs": 12, "tyrus": 22, "tys": 88, "tysburg": 2, "tyt": 15, "tyukh": 5, "u": 180, "ua": 6, "uals": 1, "ub": 1, "uber": 1, "ubi": 5, "ucal": 1, "ucla": 1, "ud": 5, "udad": 3, "udall": 6, "udalls": 1, "udon": 1, "ue": 244, "ued": 9, "uel": 4, "uell": 10, "uen": 24, "uer": 22, "uers": 4, "ues": 89, "uest": 2, "uet": 1, "uffs": 1, "ug": 16, "ugf": 1, "ugh": 3, "ugli": 4, "ugly": 51, "uh": 15, "uhim": 2, "uhles": 1, "uhuh": 1, "ui": 164, "uij": 1, "uill": 2, "uin": 2, "uing": 20, "uious": 5, "uit": 88, "uitous": 1, "uits": 25, "uk": 6, "ul": 176, "ula": 3, "ulai": 2, "ulam": 4, "uliet": 1, "ull": 1, "ult": 1, "uly": 15, "ulys": 2, "um": 488, "umis": 3, "umm": 1, "ump": 70, "umph": 93, "umphs": 16, "ums": 33, "umt": 1, "un": 18230, "una": 225, "unab": 1, "unack": 3, "unad": 12, "unaggres": 1, "unai": 6, "unal": 14, "unam": 7, "unan": 4, "unans": 12, "unap": 9, "unas": 11, "unat": 18, "unau": 3, "unc": 24, "unca": 3, "uncal": 2, "uncan": 6, "uncap": 3, "uncas": 1, "uncau": 1, "unch": 2, "unchain": 1, "unchal": 3, "unchan": 25, "unchar": 9, "unckle": 1, "unclad": 2, "unclai": 2, "unclaim": 2, "unclas": 1, "uncle": 213, "unclean": 203, "unclear": 2, "unclen": 1, "unclench": 1, "uncles": 13, "unclipt": 1, "unclo": 6, "unclot": 3, "unclou": 4, "uncloy": 1, "uncrack": 1, "uncre": 6, "uncri": 4, "uncropt": 1, "uncros": 1, "uncrown": 1, "uncul": 1, "uncur": 2, "uncut": 1, "und": 12, "undas": 1, "undra": 1, "undraw": 2, "undrawn": 1, "undres": 14, "undress": 3, "une": 163, "unea": 1, "uneco": 4, "uned": 5, "unen": 14, "unend": 4, "unener": 1, "unens": 1, "unenthu": 2, "uner": 11, "unes": 1, "unex": 14, "unexa": 2, "unexag": 2, "unexampled": 4, "unfp": 5, "ung": 7, "ungras": 1, "uni": 1587, "uniden": 1, "unidi": 2, "unim": 1, "unima": 11, "uning": 6, "union": 221, "unit": 104, "units": 88, "unk": 5, "uno": 7, "unob": 37, "unoc": 7, "unor": 6, "unos": 3, "unout": 1, "unp": 1, "unruf": 2, "uns": 115, "unsa": 7, "unsay": 3, "unsays": 1, "unscien": 3, "unseen": 71, "unsel": 5, "unself": 2, "unshe": 5, "unslung": 1, "unspa": 2, "unst": 22, "unstea": 11, "unstuck": 1, "unt": 56, "untag": 1, "untch": 1, "unthe": 1, "unthin": 10, "untre": 1, "unu": 133, "unut": 6, "uo": 8, "up": 7600, "upand": 1, "uphe": 7, "uphea": 2, "upi": 5, "upon": 5082, "uppp": 1, "upre": 1, "upri": 16, "upright": 127, "uprightly": 12, "uprightness": 22, "uprights": 1, "upro": 4, "uproar": 21, "uprol": 1, "uproot": 2, "ups": 61, "upshot": 1, "upshots": 1, "uptrend": 1, "ur": 339, "ura": 19, "uran": 27, "urb": 16, "urbs": 138, "urch": 1, "ure": 158, "urea": 1, "ured": 46, "ures": 10, "ureth": 59, "uri": 13, "uriah": 28, "urich": 1, "urie": 1, "uriel": 13, "urij": 11, "urim": 8, "urin": 1, "uring": 19, "urn": 5, "urns": 4, "urugu": 1, "urun": 1, "ury": 5, "us": 5287, "usa": 55, "usah": 1, "usc": 2, "use": 1094, "usea": 2, "used": 924, "user": 5, "users": 9, "uses": 71, "usest": 2, "useth": 7, "ush": 5, "using": 176, "usis": 1, "usk": 1, "usn": 1, "uso": 1, "usom": 1, "usp": 3, "usque": 1, "uss": 3, "ussr": 11, "ust": 2, "usu": 562, "usur": 13, "usurp": 4, "ut": 518, "utah": 8, "uten": 6, "uth": 7, "uthai": 2, "uther": 1, "uti": 91, "uto": 52, "utoaz": 2, "ux": 2, "uxo": 1, "uy": 1, "uz": 81, "uzai": 1, "uzal": 2, "va": 4188, "vaal": 1, "vac": 4, "vad": 3, "vae": 7, "vag": 2, "vah": 21, "vahs": 3, "vai": 136, "vail": 131, "vails": 12, "vaim": 7, "vain": 326, "vaing": 1, "vair": 1, "vak": 1, "vakia": 5, "val": 934, "valdar": 1, "valho": 2, "vall": 2, "vals": 117, "vam": 7, "vamp": 1, "vamps": 2, "van": 898, "vana": 2, "vaney": 1, "vani": 168, "vania": 56, "vaniah": 1, "vanic": 2, "vans": 15, "vant": 725, "vants": 634, "vanus": 5, "vao": 1, "vap": 1, "vaque": 2, "var": 36, "vard": 52, "vards": 3, "vas": 74, "vash": 10, "vass": 8, "vast": 269, "vasta": 10, "vat": 5, "vath": 2, "vats": 5, "vau": 6, "vaug": 2, "vaughan": 3, "vaul": 13, "vault": 16, "vaults": 11, "vaun": 13, "vaunt": 2, "vaunts": 2, "vaux": 2, "vay": 2, "vaya": 1, "vbi": 1, "vdied": 1, "vdin": 1, "ve": 37817, "vea": 9, "veals": 22, "vean": 1, "vear": 1, "veat": 1, "vec": 39, "vecoor": 1, "vectrol": 2, "ved": 5197, "vedas": 4, "vedst": 5, "vee": 8, "veecks": 1, "veel": 2, "veends": 1, "veer": 3, "veering": 4, "veers": 3, "vees": 1, "veground": 3, "veh": 31, "vei": 22, "veigh": 1, "veil": 58, "veils": 5, "vein": 38, "veinac": 1, "veins": 25, "veit": 85, "vel": 1625, "vela": 1, "veldt": 1, "velhe": 2, "velins": 2, "vell": 1, "vels": 151, "velt": 28, "velts": 5, "vem": 96, "vemen": 2, "ven": 5045, "vena": 1, "venan": 1, "venant": 1, "venants": 4, "venn": 2, "veno": 7, "venous": 10, "venow": 1, "vens": 240, "venses": 1, "venshot": 1, "vensons": 2, "vent": 305, "venth": 197, "vents": 20, "venus": 1, "veo": 1, "veoak": 1, "veow": 1, "ver": 10475, "vera": 2, "veran": 33, "verb": 50, "verbs": 24, "vere": 31, "verell": 1, "veren": 43, "verer": 8, "verers": 1, "verest": 8, "veri": 14, "verie": 12, "veriest": 2, "vern": 26, "verns": 11, "vero": 3, "verous": 4, "vers": 603, "vert": 311, "verts": 7, "very": 4817, "ves": 4868, "veshat": 2, "vest": 287, "vester": 4, "vestry": 1, "vests": 11, "vestu": 13, "vet": 63, "veth": 476, "vetkov": 1, "vetous": 32, "vets": 3, "vett": 1, "vex": 36, "vexa": 36, "vexed": 55, "vexer": 1, "vexes": 2, "vexeth": 1, "vexi": 1, "vext": 1, "vey": 209, "veyan": 6, "veye": 2, "veyear": 5, "veying": 24, "veyl": 1, "veys": 26, "vez": 4, "vgly": 1, "vi": 9277, "via": 84, "viah": 4, "vians": 2, "viar": 1, "vic": 513, "vich": 6, "vicks": 3, "vics": 1, "vict": 26, "victs": 11, "vid": 1241, "vids": 5, "vidsons": 2, "vie": 204, "vied": 28, "viel": 1, "vien": 10, "vient": 5, "vier": 51, "viera": 2, "viers": 1, "vies": 48, "viest": 11, "viet": 164, "vieth": 4, "viets": 15, "viev": 2, "view": 476, "views": 130, "vig": 3, "vii": 15, "viks": 2, "vil": 1115, "vill": 1, "vils": 97, "vin": 514, "ving": 3653, "vingkind": 30, "vingood": 1, "vingroom": 1, "vings": 79, "vins": 22, "vint": 1, "vio": 2, "vioiln": 1, "viols": 2, "vious": 537, "vip": 1, "vir": 480, "virgins": 25, "vis": 160, "vish": 29, "vism": 14, "vist": 10, "vists": 4, "vit": 5, "vita": 138, "vitch": 2, "vith": 1, "vits": 3, "vitt": 10, "vitts": 1, "vitz": 5, "viy": 1, "viz": 1, "vla": 1, "vnac": 2, "vnas": 1, "vnat": 1, "vne": 1, "vni": 8, "vnion": 2, "vnruf": 1, "vnsee": 3, "vnsex": 1, "vnshrin": 1, "vnu": 2, "vo": 1827, "voc": 8, "vock": 4, "voe": 2, "voes": 1, "voi": 1686, "void": 65, "voids": 3, "voir": 15, "voirs": 4, "vol": 540, "volga": 1, "voli": 8, "volks": 2, "volt": 34, "volts": 7, "volv": 1, "vom": 1, "von": 48, "vong": 1, "vons": 1, "voo": 5, "voor": 1, "voort": 7, "voph": 1, "vor": 205, "vorous": 5, "vors": 44, "vort": 1, "vos": 4, "vost": 3, "vot": 20, "vots": 1, "vou": 396, "vouch": 4, "vouil": 1, "vour": 370, "vours": 16, "vous": 165, "vout": 25, "vow": 52, "vows": 42, "voy": 235, "voyan": 1, "voyd": 1, "voys": 3, "vpon": 162, "vpro": 1, "vpshot": 1, "vrai": 1, "vran": 18, "vre": 12, "vred": 2, "vrend": 1, "vres": 9, "vri": 2, "vring": 2, "vro": 9, "vron": 1, "vse": 29, "vses": 3, "vseth": 1, "vsha": 1, "vsing": 1, "vsu": 2, "vsur": 2, "vsurp": 1, "vtol": 2, "vu": 11, "vue": 10, "vuhran": 1, "vul": 151, "vular": 1, "vulet": 5, "vulets": 3, "vulg": 1, "vuls": 5, "vum": 1, "vuoi": 1, "vurtz": 1, "vus": 4, "vved": 1, "vvy": 3, "vy": 537, "vying": 14, "vyings": 2, "vys": 13, "wa": 3461, "waals": 1, "wab": 6, "wac": 7, "wack": 2, "wacs": 1, "wad": 23, "waddling": 1, "wads": 2, "waf": 23, "waft": 2, "wafts": 4, "wag": 70, "wags": 2, "wah": 5, "wai": 637, "waif": 8, "waifs": 1, "waight": 1, "waii": 17, "wail": 18, "wails": 4, "wain": 4, "wains": 6, "waist": 39, "waists": 2, "wait": 385, "waits": 36, "wak": 24, "wake": 18, "wal": 1359, "wald": 4, "walf": 1, "walk": 627, "walks": 81, "walkt": 2, "wall": 545, "walls": 205, "wals": 2, "walsh": 2, "walshs": 1, "walt": 15, "waltz": 7, "walw": 1, "wam": 10, "wams": 1, "wan": 945, "wand": 9, "wands": 2, "wang": 1, "wansley": 1, "want": 878, "wants": 141, "wao": 1, "wap": 3, "war": 1570, "ward": 2937, "wards": 1003, "wark": 15, "warks": 42, "warm": 271, "warmhear": 1, "warms": 2, "warmth": 85, "warn": 42, "warnin": 2, "warning": 82, "warnings": 16, "warns": 3, "warp": 29, "wars": 82, "warsaw": 11, "warsaws": 2, "wart": 47, "warthog": 1, "wartorn": 1, "warts": 8, "was": 29362, "wash": 169, "wasi": 1, "wasn": 58, "wasp": 2, "wast": 79, "wat": 435, "watch": 414, "watcht": 1, "watchtower": 2, "wats": 3, "watsons": 5, "watt": 14, "watts": 4, "wau": 10, "waues": 3, "wauing": 2, "wax": 63, "waxe": 2, "waxed": 43, "waxen": 16, "waxes": 4, "waxeth": 2, "waxing": 3, "waxy": 3, "way": 3370, "ways": 2047, "wayspre": 1, "wbai": 3, "wboats": 1, "we": 19529, "wea": 684, "weak": 239, "weal": 37, "wealt": 4, "wealth": 118, "wear": 101, "wears": 21, "weat": 3, "web": 28, "webb": 2, "webs": 6, "wechs": 1, "wed": 1882, "weds": 3, "wedst": 5, "wee": 254, "weed": 26, "weeds": 30, "week": 493, "weeke": 1, "weekold": 1, "weeks": 251, "weemss": 1, "ween": 1502, "weens": 1, "weeny": 2, "weep": 99, "weeps": 3, "wees": 1, "weet": 3, "weets": 1, "wei": 16, "weid": 1, "weig": 64, "weigh": 53, "weigheth": 2, "weighs": 10, "weight": 221, "weights": 20, "weil": 1, "wein": 4, "weir": 3, "weird": 18, "weirs": 1, "weis": 2, "weiss": 2, "wel": 537, "welch": 16, "weld": 8, "weled": 2, "weler": 2, "welers": 1, "well": 3733, "wellin": 6, "wells": 53, "wellsley": 1, "wellspring": 2, "wellsprings": 1, "wellss": 5, "wels": 123, "welsh": 1, "welts": 1, "wem": 3, "wen": 59, "wench": 1, "wend": 3, "went": 3040, "wept": 112, "wer": 2424, "wera": 14, "werd": 3, "werfu": 1, "werful": 144, "werp": 2, "werplants": 1, "werpri": 1, "wers": 638, "werseek": 1, "werst": 1, "werstar": 1, "wert": 17, "werts": 3, "werv": 1, "wery": 20, "wes": 852, "wess": 11, "west": 847, "westpha": 3, "westry": 1, "wests": 3, "wet": 132, "weth": 236, "wether": 1, "wethers": 1, "wett": 2, "weuns": 1, "wex": 6, "wey": 41, "wha": 2186, "whack": 3, "whad": 2, "whah": 1, "whang": 2, "whar": 26, "wharf": 21, "what": 8144, "whatd": 1, "whats": 54, "whay": 1, "whe": 5513, "whea": 1, "wheat": 97, "whee": 134, "wheed": 8, "wheel": 170, "wheels": 99, "whel": 5, "whelm": 3, "whelmed": 5, "whelp": 3, "whelps": 10, "when": 8832, "wher": 12, "whet": 11, "whets": 1, "wheugh": 4, "whew": 3, "whi": 3443, "which": 12336, "whif": 1, "whiff": 5, "whiffs": 2, "whig": 7, "whigs": 6, "whil": 7, "whilst": 111, "whim": 20, "whims": 7, "whin": 7, "whip": 98, "whips": 14, "whipsa": 1, "whipt": 1, "whir": 97, "whirl": 22, "whirls": 5, "whirr": 5, "whis": 315, "whisk": 1, "whisp": 1, "whist": 81, "whit": 38, "white": 2, "whits": 1, "whitt": 4, "whiz": 9, "whizz": 2, "who": 9242, "whoa": 1, "whod": 9, "whoe": 86, "whoel": 1, "whol": 132, "wholl": 1, "whom": 1592, "whoo": 4, "whoop": 3, "whoosh": 1, "whop": 2, "whor": 1, "whorls": 1, "whos": 18, "whou": 1, "why": 1679, "whyn": 1, "whynt": 1, "wi": 3556, "wic": 23, "wich": 44, "wick": 734, "wicks": 1, "wicz": 2, "wid": 18, "width": 22, "wie": 6, "wiel": 15, "wield": 7, "wields": 1, "wig": 53, "wight": 8, "wights": 1, "wil": 1481, "wild": 456, "wilds": 8, "wildsoun": 1, "wilks": 2, "will": 9652, "willm": 1, "wills": 7, "willt": 1, "wilso": 1, "wilsons": 3, "wilt": 289, "wim": 8, "wims": 1, "win": 1248, "winch": 2, "wind": 526, "winds": 174, "wing": 1821, "wings": 239, "wink": 19, "winks": 3, "wins": 54, "winslow": 11, "winslows": 2, "winso": 3, "winsor": 2, "wint": 4, "wip": 3, "wiry": 10, "wis": 850, "wish": 707, "wisht": 1, "wiso": 4, "wisp": 5, "wiss": 5, "wist": 30, "wit": 3046, "witch": 30, "witchs": 4, "with": 25190, "within": 978, "withs": 3, "witold": 1, "wits": 26, "witt": 4, "witz": 4, "wixt": 1, "wlib": 1, "wne": 9, "wned": 1, "wo": 2097, "wob": 9, "wock": 1, "wod": 1, "woe": 218, "woer": 1, "woes": 11, "wog": 1, "wohd": 1, "wol": 47, "wold": 2, "wole": 1, "wolf": 31, "wolff": 2, "wolffs": 2, "woll": 4, "wolues": 1, "wom": 1, "womb": 97, "wombs": 4, "wombto": 1, "won": 1209, "wond": 85, "wons": 1, "wonst": 1, "wont": 142, "woo": 43, "wood": 1168, "wooden": 104, "woodin": 1, "wooding": 1, "woodoil": 1, "woods": 204, "woodss": 1, "woody": 8, "wooed": 2, "wooes": 1, "woof": 21, "wool": 64, "woolen": 5, "wooll": 2, "woolsack": 1, "woon": 5, "wooooosh": 1, "wop": 1, "wops": 1, "wor": 1518, "wora": 3, "word": 1598, "words": 1334, "work": 1937, "works": 533, "worl": 6, "world": 2135, "worlds": 82, "worm": 62, "worms": 43, "worn": 87, "worst": 125, "wort": 261, "worth": 526, "worthi": 4, "worthing": 1, "worthles": 2, "worthless": 10, "worths": 1, "wot": 13, "woul": 41, "would": 6896, "woulda": 1, "wouldn": 58, "wouldst": 10, "woun": 112, "wound": 119, "wounds": 47, "woven": 35, "wow": 7, "woz": 1, "wpa": 1, "wra": 7, "wrac": 6, "wrack": 5, "wrackt": 1, "wrag": 1, "wraith": 2, "wran": 1, "wrang": 10, "wrap": 86, "wraps": 7, "wrapt": 16, "wrat": 1, "wrath": 254, "wray": 4, "wre": 50, "wreak": 5, "wrec": 6, "wreck": 77, "wrecks": 12, "wren": 138, "wrench": 6, "wrencht": 1, "wres": 1, "wrest": 37, "wret": 97, "wretch": 10, "wri": 856, "wrich": 1, "wrig": 12, "wright": 57, "wrightdi": 1, "wrights": 11, "wrin": 7, "wring": 11, "wrings": 2, "wrink": 31, "wrinkled": 36, "wrinkling": 4, "wrist": 32, "wrists": 17, "writ": 570, "writhe": 2, "writhed": 7, "writhing": 10, "writs": 1, "wro": 326, "wron": 17, "wrong": 409, "wronghe": 1, "wrongs": 16, "wroth": 50, "wrough": 2, "wrought": 138, "wrung": 9, "wry": 13, "wski": 1, "wu": 1, "wuh": 1, "wulf": 3, "wump": 1, "wunt": 1, "wurst": 3, "wus": 1, "wust": 1, "wy": 157, "wyk": 1, "wyn": 3, "wynd": 2, "wynn": 1, "wyns": 1, "xa": 2, "xe": 7, "xes": 19, "xgy": 2, "xi": 19, "xii": 10, "xism": 1, "xist": 4, "xiv": 7, "xix": 4, "xray": 15, "xrays": 5, "xre": 7, "xtru": 1, "xvi": 13, "xvii": 6, "xxi": 4, "xxii": 2, "xxiv": 1, "xxix": 1, "xxxi": 2, "xxxii": 1, "xxxiv": 1, "xxxix": 1, "xy": 11, "y": 277, "ya": 37, "yach": 6, "yacht": 22, "yachts": 6, "yad": 1, "yah": 1, "yak": 1, "yaks": 1, "yal": 14, "yall": 4, "yan": 81, "yang": 12, "yank": 8, "yanks": 5, "yap": 1, "yaqui": 1, "yar": 17, "yard": 113, "yards": 139, "yardu": 1, "yarn": 27, "yarns": 11, "yas": 1, "yaughan": 1, "yaw": 28, "yawl": 1, "yawn": 7, "yaws": 1, "yb": 3, "yc": 8, "ycell": 3, "ycells": 1, "yd": 1, "ye": 6867, "yea": 374, "yeah": 25, "year": 1309, "yee": 6, "yeel": 2, "yeeld": 8, "yeelds": 1, "yees": 3, "yel": 266, "yell": 23, "yells": 3, "yelp": 3, "yelps": 1, "yen": 3, "yeo": 4, "yer": 5, "yes": 1043, "yet": 2653, "yew": 3, "yf": 8, "yff": 2, "yg": 2, "ygy": 1, "yi": 4, "yiang": 1, "yid": 4, "yiel": 85, "yield": 116, "yields": 16, "yin": 10, "ying": 62, "yip": 1, "yis": 1, "yj": 1, "yknow": 2, "yl": 6, "ym": 4, "ymg": 1, "ynch": 1, "yo": 141, "yoa": 4, "yoak": 1, "yok": 2, "yokna": 2, "yolk": 1, "yon": 78, "yond": 536, "yong": 21, "yongst": 1, "yonn": 4, "yooee": 1, "yoor": 1, "yor": 23, "york": 327, "yorks": 7, "yors": 1, "you": 19927, "youd": 36, "youl": 1, "youll": 90, "youn": 175, "young": 1575, "youngs": 3, "your": 6289, "yours": 179, "yourself": 359, "yous": 1, "yout": 33, "youth": 290, "youths": 23, "youuns": 1, "yow": 5, "yp": 2, "yr": 3, "yre": 5, "yrs": 4, "ys": 2, "yt": 4, "yteen": 1, "yu": 7, "yuc": 1, "yugo": 12, "yuh": 2, "yuri": 6, "yuro": 1, "yvet": 2, "ywca": 1, "yyyy": 1, "za": 1158, "zaan": 1, "zaana": 1, "zaanan": 1, "zaar": 7, "zaars": 1, "zaavan": 1, "zab": 12, "zac": 16, "zae": 1, "zael": 23, "zag": 6, "zags": 1, "zah": 36, "zahs": 1, "zai": 9, "zaim": 1, "zaing": 5, "zair": 1, "zak": 3, "zal": 19, "zals": 1, "zam": 5, "zan": 35, "zant": 4, "zants": 1, "zap": 2, "zaphan": 6, "zar": 233, "zard": 76, "zards": 29, "zare": 1, "zareah": 1, "zars": 5, "zarsusim": 1, "zart": 5, "zarthan": 1, "zarts": 1, "zas": 9, "zat": 7, "zath": 1, "zattu": 3, "zaxis": 1, "zay": 3, "ze": 1792, "zec": 1, "zecha": 40, "zed": 1198, "zee": 10, "zeeb": 6, "zeed": 1, "zeel": 6, "zeer": 11, "zeers": 5, "zef": 1, "zeh": 2, "zei": 1, "zeiss": 2, "zeit": 1, "zek": 8, "zel": 29, "zell": 7, "zels": 1, "zem": 4, "zen": 248, "zenan": 1, "zend": 1, "zening": 2, "zens": 122, "zentop": 1, "zep": 28, "zeph": 2, "zepho": 2, "zer": 182, "zers": 27, "zerthaus": 1, "zeruiah": 26, "zes": 160, "zest": 6, "zet": 20, "zeth": 2, "zethan": 1, "zets": 1, "zeug": 1, "zeus": 1, "zey": 1, "zez": 4, "zgy": 1, "zhitkov": 1, "zhitz": 1, "zhok": 1, "zi": 426, "zia": 3, "ziah": 112, "zib": 6, "zid": 2, "zie": 41, "zied": 3, "zieg": 2, "ziel": 26, "zier": 8, "zies": 3, "zif": 4, "zig": 8, "zil": 32, "zilt": 2, "zim": 34, "zims": 1, "zin": 46, "zina": 1, "zinc": 11, "zing": 428, "zinggggo": 1, "zings": 8, "zints": 1, "zio": 6, "zip": 18, "ziph": 10, "ziphron": 1, "zir": 2, "zis": 12, "zism": 1, "zit": 24, "zite": 12, "ziz": 2, "zjo": 1, "zkos": 1, "zlo": 1, "zmi": 1, "zo": 142, "zoa": 12, "zoar": 11, "zoe": 7, "zog": 1, "zoic": 1, "zoid": 1, "zol": 1, "zom": 2, "zon": 124, "zons": 12, "zoo": 14, "zooey": 1, "zooks": 1, "zool": 8, "zooms": 1, "zoooop": 1, "zootic": 1, "zop": 10, "zophr": 6, "zor": 51, "zoro": 4, "zors": 3, "zos": 4, "zot": 1, "zoth": 1, "zounds": 2, "zov": 4, "zows": 1, "zso": 2, "zu": 42, "zubk": 2, "zum": 1, "zumpt": 1, "zur": 26, "zus": 1, "zuy": 1, "zuz": 2, "zwei": 1, "zweig": 1, "zwo": 2, "zy": 208, "zyn": 2}
-     ''')
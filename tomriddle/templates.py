@@ -0,0 +1,136 @@
+"""
+The permutation half of riddler's SAT instance doesn't depend on which
+letters are in the answer, just on how many times each one appears.
+"iamlordvoldemort" and "tommarvoloriddle" have the same letters, but so
+does anything else with one letter three times, four letters twice and
+five letters once.  So build those clauses once per signature and keep
+them around, in memory and (optionally) on disk.
+"""
+
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+import os
+import sys
+
+from tomriddle import cnf, satbridge
+
+# clauses is a tuple of tuples, don't modify it, it's shared
+# top is the highest variable number used, aux variables included
+Template = namedtuple("Template", "clauses top")
+
+# set this to a directory to keep templates between runs
+CACHE_ENV = "TOMRIDDLE_CACHE"
+
+# bump this if the encoding changes, old files will be ignored
+_MAGIC = 0x54524D50
+_VERSION = 1
+
+
+def letter_counts(letters):
+    """
+    Returns [(letter, count), ...] with the most frequent letters first
+    (ties broken by first appearance).  This is the order of the rows in
+    the permutation template.
+    """
+
+    counts = {}
+    for char in letters:
+        counts[char] = counts.get(char, 0) + 1
+    return sorted(counts.items(), key=lambda item: -item[1])
+
+
+def signature(letters):
+    """Like (3, 2, 2, 2, 2, 1, 1, 1, 1, 1) for "iamlordvoldemort"."""
+    return tuple(count for _, count in letter_counts(letters))
+
+
+def grid_var(position, slot, signature):
+    """The variable for "the slot'th letter goes at this position"."""
+    return position * len(signature) + slot + 1
+
+
+def build(signature):
+    """
+    Make the permutation constraints from scratch.  Variables are numbered
+    by grid_var, aux variables come after that.
+    """
+
+    distinct = len(signature)
+    n = sum(signature)
+    pool = satbridge.VarPool(top=n * distinct)
+
+    clauses = []
+
+    # each letter is used as many times as it appears in the answer
+    for slot, count in enumerate(signature):
+        row = [grid_var(pos, slot, signature) for pos in range(n)]
+        clauses.extend(cnf.exactly_n_true(row, count, mapper=pool))
+
+    # each riddle position gets exactly one letter
+    for pos in range(n):
+        column = [grid_var(pos, slot, signature) for slot in range(distinct)]
+        clauses.extend(cnf.exactly_n_true(column, 1, mapper=pool))
+
+    return Template(tuple(map(tuple, clauses)), pool.top)
+
+
+def _path(cache_dir, signature):
+    name = "perm-" + "-".join(map(str, signature)) + ".i32"
+    return Path(cache_dir) / name
+
+
+def _load(path):
+    """Returns a Template, or None if the file is missing or stale"""
+
+    flat = array("i")
+    try:
+        with open(path, "rb") as f:
+            flat.frombytes(f.read())
+    except (OSError, ValueError):
+        return None
+
+    # written by someone else, or by an older version of this
+    if len(flat) < 3 or flat[0] != _MAGIC or flat[1] != _VERSION:
+        return None
+
+    return Template(tuple(satbridge.from_flat(flat[3:])), flat[2])
+
+
+def _store(path, template):
+    flat = array("i", [_MAGIC, _VERSION, template.top])
+    flat.extend(satbridge.to_flat(template.clauses))
+
+    # write then rename, so a concurrent reader never sees half a file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        flat.tofile(f)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=64)
+def permutation(signature, cache_dir=None):
+    """
+    Get the permutation template for a signature.  Checks memory, then
+    cache_dir (or $TOMRIDDLE_CACHE), and builds it if neither has it.
+    """
+
+    cache_dir = cache_dir or os.environ.get(CACHE_ENV)
+
+    if cache_dir:
+        path = _path(cache_dir, signature)
+        template = _load(path)
+        if template is not None:
+            return template
+
+    template = build(signature)
+
+    if cache_dir:
+        try:
+            _store(path, template)
+        except OSError as err:
+            print(f"Couldn't cache template: {err}", file=sys.stderr)
+
+    return template
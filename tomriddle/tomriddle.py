@@ -1,19 +1,16 @@
-from math import floor, log
-from collections import OrderedDict
-from sympy import Symbol
-import sympy.logic.boolalg as form
-from itertools import product, combinations
-from functools import reduce
-from pprint import pprint
-import operator
-import json
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+import shlex
 import sys
 
-from tomriddle import cnf, satbridge
+from tomriddle import cnf, satbridge, templates
+from .budget import Budget
 from .fragments import get_default_fragments, get_fragments_from, clean
-import pycosat
 
-import IPython
+# the clauses for some riddles, the grid ({char: var} for each position)
+# and the Decoder that reads riddles out of solutions
+SatInstance = namedtuple("SatInstance", "clauses grid decoder")
 
 
 def printerr(msg):
@@ -22,17 +19,65 @@ def printerr(msg):
 
 def main(args):
 
-    try:
+    if args.corpus:
         with open(args.corpus, "r") as f:
             fragments = get_fragments_from(f)
-    except AttributeError:
+    else:
         fragments = get_default_fragments()
 
-    for answer in riddler(args.answer, fragments, constraints=args.constraints):
+    backend = None
+    if args.solver:
+        backend = satbridge.SubprocessBackend(shlex.split(args.solver))
+
+    budget = None
+    if any(x is not None for x in (args.deadline, args.timeout, args.memory)):
+        memory = args.memory and args.memory * 2**20
+        budget = Budget(args.limit, args.deadline, args.timeout, memory)
+
+    checkpoint = None
+    if args.checkpoint:
+        from .checkpoint import Checkpoint
+
+        checkpoint = Checkpoint(args.checkpoint, every=args.every)
+
+    riddles = riddler(
+        args.answer,
+        fragments,
+        constraints=args.substr,
+        min_count=args.min_count,
+        top_k=args.top,
+        frontier="auto" if args.frontier is None else args.frontier or None,
+        engine=args.engine,
+        workers=args.workers or None,
+        limit=args.limit,
+        backend=backend,
+        budget=budget,
+        checkpoint=checkpoint,
+    )
+    for answer in riddles:
         print(answer)
 
-
-def riddler(answer, fragments, constraints=[]):
+    if budget is not None and budget.reason is not None:
+        printerr(f"stopped: {budget.reason}")
+
+
+def riddler(
+    answer,
+    fragments,
+    constraints=[],
+    min_count=0,
+    pronounce=None,
+    ranked=False,
+    top_k=None,
+    frontier="auto",
+    engine="sat",
+    workers=1,
+    limit=None,
+    ordered=False,
+    backend=None,
+    budget=None,
+    checkpoint=None,
+):
     """
     Return an interator over pronouncable riddle strings like
     "tommarvoloriddle" given answer strings like "iamlordvoldemort".
@@ -43,27 +88,223 @@ def riddler(answer, fragments, constraints=[]):
     If fragments is None and constraints are unset, iterate over permutations
 
     If fragments is None, iterate over permutations with constraints
+
+    Otherwise every letter of the riddle has to be part of some fragment
+    (fragments may overlap).  Only fragments that can be made from the
+    answer's letters, and that have been seen at least min_count times,
+    are considered.
+
+    pronounce is an optional cnf.Automaton (see automata.py) which the
+    riddle has to be accepted by.
+
+    If ranked (or top_k is given), the riddles come out best first, scored
+    by how much they look like the fragments (see ranking.py), and there
+    are at most top_k of them.  The default fragments do the scoring if
+    fragments is None.  frontier is how many partial riddles to keep
+    looking at, see ranking.ranked, None keeps them all so the order is
+    exact, but that's slow and takes a lot of memory for long answers.
+
+    engine picks how unranked riddles are found: "sat" builds clauses and
+    hands them to pycosat, "search" backtracks over the letters directly
+    (see search.py).  Same riddles, possibly in a different order.
+
+    With more than one worker (None means one per cpu) the riddles are
+    split up by their first few letters, and each engine's share is found
+    in a separate process (see parallel.py).  ordered keeps them in the
+    order of those first letters.  limit stops after that many riddles.
+
+    backend is the sat solver to use, see satbridge.PycosatBackend (the
+    default) and satbridge.SubprocessBackend.
+
+    budget is a budget.Budget, riddler stops when it runs out and its
+    reason says why.  The search engine (and the ranked search) check it
+    while they look, so they stop even in the middle of a long search for
+    the next riddle.  The sat engine checks it between riddles, and if it
+    has a clock, the backend is stopped when the clock runs out: pycosat
+    runs in a child process for that, and a SubprocessBackend gets what's
+    left as its timeout.  With more than one worker it's only checked as
+    the riddles come in.
+
+    checkpoint is a checkpoint.Checkpoint, or a path for one.  It's saved
+    now and then, and when riddler stops, and if it's already there riddler
+    carries on from it: the riddles it already gave aren't given again.
+    ValueError if it was saved for some other riddles.
     """
 
-    # imagine an n*n grid, each row is an input answer letter
+    letters = clean(answer)
+    substrings = [sub for sub in map(clean, constraints) if sub]
+
+    ranked = ranked or top_k is not None
+    if not ranked and engine not in ("sat", "search"):
+        raise ValueError(f"unknown engine: {engine}, try 'sat' or 'search'")
+
+    if checkpoint is not None:
+        # top_k says when ranked riddles are done, so it's part of the instance
+        mode = f"ranked-{top_k}" if ranked else engine
+        if not ranked and workers != 1:
+            mode += "-cubes"
+        checkpoint = _resume(
+            checkpoint, mode, letters, fragments, substrings, min_count, pronounce
+        )
+        if checkpoint.done:
+            return
+
+    if budget is not None:
+        budget.start()
+
+    if ranked:
+        riddles = _ranked(
+            letters,
+            fragments,
+            substrings,
+            min_count,
+            pronounce,
+            top_k,
+            frontier,
+            budget,
+        )
+        if checkpoint is not None:
+            riddles = (r for r in riddles if not checkpoint.emitted(r))
+        yield from _checkpointed(_budgeted(riddles, budget), checkpoint, budget)
+        return
+
+    if workers != 1:
+        from .parallel import conquer
+
+        riddles = conquer(
+            engine,
+            letters,
+            fragments,
+            substrings,
+            min_count,
+            pronounce,
+            workers=workers,
+            limit=limit,
+            ordered=ordered,
+            backend=backend,
+            **_carry_on(checkpoint),
+        )
+        riddles = _budgeted(riddles, budget)
+        yield from _checkpointed(riddles, checkpoint, budget, limit)
+        return
+
+    if engine == "search":
+        after = checkpoint.latest() if checkpoint is not None else None
+        riddles = _search(
+            letters,
+            fragments,
+            substrings,
+            min_count,
+            pronounce,
+            budget=budget,
+            after=after,
+        )
+    else:
+        instance = _sat_instance(letters, fragments, substrings, min_count, pronounce)
+        blocked = checkpoint.riddles if checkpoint is not None else ()
+        riddles = _sat(instance, backend=backend, budget=budget, blocked=blocked)
+
+    riddles = _budgeted(islice(riddles, limit), budget)
+    yield from _checkpointed(riddles, checkpoint, budget, limit)
+    if engine == "sat" and (budget is None or budget.reason is None):
+        printerr("done")
+
+
+def _resume(checkpoint, mode, letters, fragments, substrings, min_count, pronounce):
+    """Open checkpoint (or a Checkpoint at that path) for these riddles"""
+
+    from .checkpoint import Checkpoint, digest
+
+    if not isinstance(checkpoint, Checkpoint):
+        checkpoint = Checkpoint(checkpoint)
+
+    # what riddles there are depends on the fragments that could be used,
+    # not on how many times each one was seen
+    candidates = None
+    if fragments is not None:
+        candidates = sorted(_candidates(letters, fragments, min_count))
+
+    # sets and dicts don't repr in the same order from one run to the next
+    automaton = None
+    if pronounce is not None:
+        automaton = (
+            repr(pronounce.start),
+            sorted(map(repr, pronounce.accepting)),
+            sorted(map(repr, pronounce.transitions.items())),
+        )
+
+    instance = digest(mode, letters, substrings, candidates, automaton)
+    return checkpoint.open(instance, letters, latest_only=mode == "search")
+
+
+def _carry_on(checkpoint):
+    """conquer's arguments for picking up where checkpoint left off"""
+
+    if checkpoint is None:
+        return {}
+    return dict(
+        done=checkpoint.cubes, seen=checkpoint.seen, finished=checkpoint.finish_cube
+    )
+
+
+def _checkpointed(riddles, checkpoint, budget=None, limit=None):
+    """Record riddles in checkpoint as they go by, and save it when they stop"""
+
+    if checkpoint is None:
+        yield from riddles
+        return
+
+    found = 0
+    try:
+        for riddle in riddles:
+            checkpoint.add(riddle)
+            found += 1
+            yield riddle
+
+        # they ran out, rather than being cut off
+        stopped = budget is not None and budget.reason is not None
+        checkpoint.done = not stopped and found != limit
+    finally:
+        checkpoint.save()
+
+
+def _budgeted(riddles, budget):
+    """Stop riddles when the budget runs out"""
+
+    if budget is None:
+        yield from riddles
+        return
+
+    if budget.exhausted():
+        return
+    for riddle in riddles:
+        # found too late
+        if budget.exhausted():
+            return
+
+        budget.spend_solution()
+        yield riddle
+        if budget.exhausted():
+            return
+
+
+def _sat_instance(letters, fragments, substrings, min_count, pronounce):
+    """The clauses for riddler's sat engine"""
+
+    # imagine a grid, each row is a distinct answer letter
     # each column is an output riddle index
-    # if the cell is marked, then that answer-letter is mapped to that riddle-index
+    # if the cell is marked, then that letter goes at that riddle-index
+    # a letter that appears k times in the answer gets k marks in its row
 
     #         i                                  x
     #         a             x
-    #         m          x
-    #         l                                           x
-    #         o                            x
-    #         r                               x
-    # --in--> d                                        X
+    #         m       x  x
+    # --in--> l                         x                 x
+    #         o    x                 x     x
+    #         r                x              x
+    #         d                                     x  x
     #         v                   x
-    #         o                      x
-    #         l                         x
-    #         d                                     x
     #         e                                              x
-    #         m       x
-    #         o    x
-    #         r                x
     #         t x
     #           00 01 02 03 04 05 06 07 08 09 10 11 12 13 14 15
     #                                                  |
@@ -73,81 +314,179 @@ def riddler(answer, fragments, constraints=[]):
     #                                                  v
     #           t  o  m  m  a  r  v  o  l  o  r  i  d  d  l  e
 
-    letters = clean(answer)
-    riddle_positions = list(range(len(letters)))
-    letter_numbers = riddle_positions.copy()
-
-    # display numbers with 0 padding
-    repr_width = floor(log(max(letter_numbers)))
-
-    def numstr(num):
-        template = "{:" + str(repr_width) + "}"
-        return template.format(num)
-
-    # a symbol for each cell in the grid above
-    # and various ways to reference/describe them
-    display_key = {}
-    columns = []
-    symb_num2riddle_letter = {}
-    all_symbols = []
-    i = 1
-    for idx in riddle_positions:
-        column = []
-        for char_idx, char in enumerate(letters):
-
-            symb = Symbol(str(i))
-            all_symbols.append(symb)
-            display_key[i] = f"{numstr(char_idx)}>{char}>{numstr(idx)}"
-            symb_num2riddle_letter[i] = char
-            column.append(symb)
-            i += 1
-        columns.append(column)
-
-    rows = map(
-        list, zip(*columns)
-    )  # transpose: https://stackoverflow.com/a/6473724/1054322
-
-    mapper = satbridge.SymbolMapper(all_symbols)
-
-    print()
-    pprint(display_key)
-
-    # at least one allocation per row
-    permutation_constraints = []
-    for row in rows:
-        permutation_constraints.extend(cnf.min_n_true(row, 1, mapper=mapper))
-
-    print(permutation_constraints)
-
-    # at least one allocation per column
-    for column in columns:
-        permutation_constraints.extend(cnf.min_n_true(column, 1, mapper=mapper))
-
-    permutation_constraints.extend(
-        cnf.max_n_true(all_symbols, len(letters), mapper=mapper)
-    )
+    # one row per distinct letter (rather than per letter instance) means that
+    # swapping identical letters isn't a different solution, so no duplicates
+
+    # the most frequent letters get the first rows, see templates.letter_counts
+    slots = templates.letter_counts(letters)
+    signature = tuple(count for _, count in slots)
+
+    # a variable for each cell in the grid above
+    cells = {}
+    for position in range(len(letters)):
+        for slot, (char, _) in enumerate(slots):
+            cells[templates.grid_var(position, slot, signature)] = (position, char)
+    decoder = satbridge.Decoder(cells)
+
+    # each letter is used as many times as it appears in the answer
+    # and each riddle position gets exactly one letter
+    # (built once per signature, see templates.py)
+    template = templates.permutation(signature)
+    constraints_cnf = list(template.clauses)
+    pool = satbridge.VarPool(top=template.top)
 
     # so far we've just defined a fancy permutation generator
-    if fragments is None and not constraints:
 
-        permute = pycosat.itersolve(permutation_constraints)
+    # the same grid, as cnf likes it: {char: variable} for each position
+    grid = [{} for _ in letters]
+    for var, (position, char) in cells.items():
+        grid[position][char] = var
+
+    if fragments is not None:
+        constraints_cnf.extend(
+            _fragment_layer(letters, fragments, grid, pool, min_count)
+        )
+
+    # required substrings, in order
+    if substrings:
+        constraints_cnf.extend(cnf.in_order(substrings, grid, pool))
+
+    if pronounce is not None:
+        constraints_cnf.extend(cnf.pronounce(pronounce, grid, pool))
+
+    return SatInstance(constraints_cnf, grid, decoder)
+
+
+def _sat(instance, prefix="", backend=None, budget=None, blocked=()):
+    """Riddles that solve a SatInstance, start with prefix, and aren't blocked"""
+
+    clauses, grid, decoder = instance
+    clauses = clauses + [[grid[position][char]] for position, char in enumerate(prefix)]
+
+    # riddles that are already out (see checkpoint.py)
+    blocking = [[-grid[p][char] for p, char in enumerate(r)] for r in blocked]
+    clauses.extend(blocking)
+    if budget is not None:
+        budget.spend_memory(sum(map(len, blocking)))
+
+    # only the grid matters, the aux variables are determined by it
+    # (grid_var numbers it first, so this is a slice of each model)
+
+    # determined=True lets pycosat block each riddle itself, over every
+    # variable, aux ones included.  That's long clauses (~18k literals per
+    # riddle for "iamlordvoldemort" with fragments) but pycosat can't take
+    # new clauses between solutions, so blocking just the grid would mean
+    # solving from scratch for each riddle, which is ~35x slower.  The
+    # budget's memory cap counts those literals, see budget.py.
+    cells = sum(map(len, grid))
+    solutions = satbridge.itersolve_projected(
+        clauses,
+        range(1, cells + 1),
+        onehot=True,
+        determined=True,
+        backend=backend,
+        budget=budget,
+    )
+
+    for solution in solutions:
+        yield decoder.decode(solution)
+
+
+def _fragment_layer(letters, fragments, grid, pool, min_count):
+    """Clauses requiring that the riddle be covered by fragments"""
 
-        while True:
-            try:
+    candidates = _candidates(letters, fragments, min_count)
+    return cnf.cover(candidates, grid, pool)
 
-                # get a solution, treat symbols as integers
-                solution = next(permute)
-                chosen = list(map(lambda x: int(str(x)), solution))
 
-                # translate into a riddle string
-                chosen = filter(lambda x: x > 0, chosen)
-                lookup = symb_num2riddle_letter
-                riddle = "".join([lookup[sn] for sn in chosen])
+def _ranked(
+    letters,
+    fragments,
+    substrings,
+    min_count,
+    pronounce,
+    top_k,
+    frontier="auto",
+    budget=None,
+):
+    """riddler, but best first"""
 
-                yield riddle
+    from .ranking import NgramScorer, ranked
 
-            except StopIteration:
-                printerr("done")
-                return
+    if fragments is None:
+        scorer = _warm(_default_fragments(), NgramScorer)
+        candidates = None
     else:
-        raise NotImplementedError("Hey Matt, write this part")
+        scorer = _warm(fragments, NgramScorer)
+        candidates = _candidates(letters, fragments, min_count)
+
+    stop = budget.exhausted if budget is not None else None
+    riddles = ranked(
+        letters,
+        scorer,
+        top_k,
+        pronounce,
+        frontier=frontier,
+        stop=stop,
+        fragments=candidates,
+        substrings=substrings,
+    )
+    for riddle, _ in riddles:
+        yield riddle
+
+
+@lru_cache(maxsize=None)
+def _default_fragments():
+    return get_default_fragments()
+
+
+def _search(
+    letters,
+    fragments,
+    substrings,
+    min_count,
+    pronounce,
+    prefix="",
+    budget=None,
+    after=None,
+):
+    """riddler, but without the sat solver"""
+
+    from .search import search
+
+    candidates = None
+    if fragments is not None:
+        candidates = _candidates(letters, fragments, min_count)
+
+    stop = budget.exhausted if budget is not None else None
+    yield from search(letters, candidates, substrings, pronounce, prefix, stop, after)
+
+
+def _candidates(letters, fragments, min_count):
+    """The fragments that could be part of a riddle"""
+
+    # only import numpy and build the index if there are fragments
+    from .fragindex import FragmentIndex
+
+    index = _warm(fragments, FragmentIndex.from_fragments)
+    return index.feasible(letters, min_count=min_count)
+
+
+# riddler tends to get the same fragments again and again (see batch.py), so
+# what's built from them is kept: {(builder, id(fragments)): (fragments, built)}
+_built = {}
+WARM_SIZE = 8
+
+
+def _warm(fragments, build):
+    """build(fragments), or what it returned last time"""
+
+    key = (build, id(fragments))
+    hit = _built.get(key)
+
+    # holding on to fragments means its id can't be reused by something else
+    if hit is None or hit[0] is not fragments:
+        if len(_built) >= WARM_SIZE:
+            _built.clear()
+        hit = _built[key] = (fragments, build(fragments))
+    return hit[1]
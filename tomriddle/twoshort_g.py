@@ -1,9 +0,0 @@
-
-        import json
-
-        def syllables():
-            """Three, four, or five letter strings made of two concatenated words like
-isa, iam, goto."""
-            return json.loads('''
-                {"aabor": 2, "aacre": 4, "aaf": 22, "aahgo": 2, "aand": 23, "aare": 2, "aas": 4, "aat": 2, "aauto": 2, "aba": 2, "ababe": 3, "ababy": 27, "abaci": 2, "aback": 16, "abad": 101, "abag": 12, "abald": 6, "aball": 24, "aban": 2, "aband": 22, "abang": 5, "abank": 15, "abar": 13, "abarb": 2, "abare": 8, "abarn": 8, "abase": 13, "abat": 8, "abath": 9, "abawd": 2, "abay": 4, "abbep": 3, "abcvs": 2, "abdys": 2, "abeak": 2, "abeam": 6, "abean": 3, "abear": 19, "abeat": 4, "abeau": 5, "abed": 39, "abee": 4, "abeef": 5, "abeer": 6, "abees": 2, "abela": 2, "abeli": 2, "abell": 15, "abelt": 3, "abend": 6, "abent": 2, "abest": 2, "abete": 2, "abevy": 4, "abfor": 2, "abias": 3, "abich": 2, "abid": 3, "abier": 2, "abig": 131, "abill": 21, "abin": 2, "abind": 3, "abird": 37, "abit": 145, "abite": 3, "ablei": 2, "ablot": 2, "ablow": 24, "ablue": 31, "ablur": 3, "aboa": 2, "aboat": 48, "abod": 2, "abody": 43, "abog": 2, "abogy": 2, "aboil": 6, "abold": 15, "abolt": 4, "abomb": 15, "abond": 11, "abone": 9, "abony": 2, "abook": 82, "aboom": 3, "aboon": 3, "aboot": 3, "abore": 3, "aborn": 3, "aboth": 2, "aboun": 2, "about": 2, "abow": 27, "abowl": 8, "abox": 15, "aboy": 82, "aboyd": 2, "aboys": 5, "abrac": 2, "abrew": 2, "abrow": 2, "abs": 2, "abtu": 3, "abuck": 2, "abulk": 3, "abull": 10, "abun": 3, "abunk": 5, "abunt": 3, "abuoy": 4, "aburn": 2, "aburr": 2, "abus": 5, "abusd": 2, "abush": 8, "abust": 2, "abusy": 5, "abut": 4, "abuy": 2, "abuzz": 6, "abvs": 2, "aby": 5, "abyft": 2, "acab": 7, "acad": 2, "acafe": 10, "acage": 7, "acaip": 2, "acake": 13, "acalf": 13, "acall": 18, "acalm": 19, "acamp": 6, "acan": 5, "acane": 10, "acant": 2, "acap": 7, "acape": 5, "acar": 39, "acard": 11, "acare": 9, "acars": 4, "acart": 7, "acase": 36, "acash": 3, "acask": 2, "acat": 19, "acave": 16, "acd": 3, "acein": 3, "acell": 5, "acent": 10, "aceo": 3, "aceof": 6, "aceor": 2, "achap": 5, "achat": 3, "achaw": 2, "achef": 3, "achei": 2, "achi": 2, "achic": 2, "achin": 3, "achip": 6, "acidr": 2, "acity": 77, "aclam": 4, "aclap": 2, "aclaw": 2, "aclew": 2, "aclot": 3, "aclub": 7, "aclue": 11, "acm": 3, "acoal": 3, "acoat": 13, "acock": 5, "acod": 3, "acode": 3, "acoed": 2, "acoil": 4, "acoin": 10, "acold": 46, "acolt": 9, "acomb": 2, "acome": 3, "acone": 3, "acook": 12, "acool": 11, "acoop": 3, "acop": 10, "acopp": 2, "acopy": 16, "acord": 7, "acorn": 5, "acost": 7, "acosy": 6, "acot": 2, "acow": 23, "acps": 2, "acrab": 7, "acrew": 10, "acrie": 2, "acrop": 3, "acrow": 5, "acry": 36, "acta": 8, "actan": 3, "actas": 24, "actat": 2, "actb": 4, "actbe": 2, "actby": 11, "actea": 2, "actf": 2, "acthe": 3, "acti": 3, "actif": 2, "actin": 22, "actis": 8, "actit": 4, "actof": 87, "acton": 9, "actor": 3, "actqu": 2, "acts": 2, "actsi": 2, "actso": 3, "actto": 9, "actu": 2, "actup": 2, "actwe": 3, "acuba": 2, "acul": 2, "acult": 2, "acup": 23, "acur": 2, "acurb": 2, "acure": 4, "acurl": 3, "acurt": 2, "acut": 10, "acute": 3, "aczar": 2, "ada": 2, "adab": 3, "adale": 2, "adam": 4, "adame": 2, "adami": 3, "adamn": 8, "adamp": 3, "adams": 11, "adane": 2, "adara": 2, "adark": 59, "adarn": 2, "adart": 4, "adash": 9, "adata": 3, "adate": 9, "aday": 249, "adays": 6, "adc": 2, "adcto": 2, "adda": 11, "addan": 3, "addat": 2, "addi": 2, "addin": 4, "addis": 2, "addit": 3, "addmy": 3, "addo": 2, "addof": 2, "addon": 2, "addor": 4, "addsa": 2, "addto": 38, "addup": 6, "addye": 2, "ade": 2, "adead": 58, "adeaf": 2, "adeal": 9, "adean": 2, "adear": 11, "adebt": 3, "adeck": 7, "adeed": 9, "adeep": 61, "adeer": 2, "adeft": 2, "aden": 8, "adesk": 10, "adew": 3, "adewy": 3, "adhoc": 4, "adia": 2, "adial": 2, "adie": 3, "adiet": 2, "adig": 3, "adim": 14, "adime": 6, "adin": 3, "adirt": 3, "adis": 2, "adish": 7, "adisk": 5, "adits": 2, "adiva": 2, "adive": 2, "admen": 2, "admy": 2, "adnow": 3, "adodo": 2, "adoer": 4, "adog": 51, "adogs": 2, "adoll": 2, "adoma": 2, "adome": 5, "adon": 4, "adone": 2, "adoo": 4, "adoor": 39, "adora": 2, "adose": 3, "adot": 4, "adour": 2, "adove": 14, "adoze": 4, "adr": 2, "adrab": 3, "adrag": 2, "adram": 2, "adraw": 5, "adrop": 22, "adrug": 3, "adrum": 6, "adry": 27, "adsas": 2, "adshe": 2, "adsin": 2, "adsis": 2, "adsor": 2, "adual": 5, "aduck": 5, "adud": 2, "adue": 2, "aduel": 17, "aduf": 2, "aduke": 2, "adull": 15, "adumb": 11, "adump": 3, "adune": 2, "adung": 2, "adupe": 3, "adust": 3, "aduty": 11, "advs": 2, "adwe": 2, "aecis": 2, "aem": 2, "aeven": 2, "afa": 4, "aface": 57, "afact": 27, "afad": 2, "afade": 2, "afaf": 12, "afair": 62, "afake": 3, "afall": 10, "afam": 2, "afame": 4, "afan": 10, "afand": 113, "afans": 2, "afar": 49, "afare": 21, "afarm": 20, "afas": 13, "afast": 30, "afat": 25, "afawn": 2, "afb": 3, "afbar": 4, "afbe": 3, "afbut": 9, "afby": 12, "afc": 2, "afcan": 5, "afcm": 2, "afcut": 2, "afdid": 3, "afdue": 2, "afear": 9, "afeat": 3, "afee": 3, "afeed": 3, "afeel": 2, "afell": 2, "afelt": 2, "afetc": 3, "afew": 828, "aff": 2, "affor": 25, "afhad": 2, "afhas": 6, "afie": 5, "afif": 15, "afig": 7, "afile": 9, "afilm": 4, "afin": 34, "afine": 140, "afir": 2, "afire": 83, "afirm": 26, "afis": 85, "afish": 23, "afist": 3, "afit": 17, "afive": 3, "afix": 3, "aflag": 3, "aflap": 3, "aflat": 23, "aflaw": 9, "aflea": 4, "aflem": 2, "aflet": 5, "aflop": 2, "aflow": 7, "aflu": 2, "aflux": 2, "afly": 9, "afmay": 3, "afno": 3, "afnot": 2, "afnow": 4, "afoam": 3, "afoe": 12, "afof": 21, "afog": 6, "afoil": 2, "afold": 2, "afolk": 3, "afon": 7, "afond": 4, "afone": 4, "afont": 2, "afood": 3, "afool": 113, "afoot": 30, "afor": 23, "aforc": 2, "aford": 5, "afore": 2, "afork": 6, "aform": 35, "afort": 5, "afoul": 2, "afour": 6, "afowl": 2, "afox": 7, "afoxs": 2, "afray": 2, "afred": 2, "afree": 26, "afrog": 4, "afsec": 2, "afso": 2, "aftat": 2, "afthe": 73, "afti": 3, "afto": 15, "aftso": 2, "aftto": 3, "afull": 74, "afume": 2, "afun": 3, "afund": 5, "afur": 2, "afury": 6, "afuse": 2, "afuss": 5, "afuzz": 2, "afwas": 12, "afwe": 18, "agag": 2, "again": 4, "agala": 2, "agale": 9, "agam": 3, "agame": 24, "agang": 8, "agaol": 2, "agap": 8, "agas": 8, "agash": 2, "agasp": 2, "agate": 9, "agawk": 2, "agay": 9, "agaze": 2, "agea": 4, "agean": 2, "agear": 2, "ageas": 11, "ageat": 7, "ageay": 2, "ageby": 4, "agedo": 2, "agedr": 2, "agehe": 5, "agei": 8, "ageif": 2, "agein": 8, "ageis": 9, "ageit": 6, "agem": 3, "agemr": 4, "agemy": 2, "ageof": 68, "ageor": 10, "ages": 5, "agesi": 2, "ageso": 4, "ageto": 12, "aghi": 2, "agibe": 2, "agift": 23, "agig": 2, "agill": 2, "agin": 2, "agirl": 65, "agive": 2, "aglad": 5, "aglib": 2, "aglim": 2, "aglow": 9, "agnat": 2, "ago": 3, "agoa": 10, "agoal": 3, "agoan": 6, "agoas": 10, "agoat": 10, "agoby": 8, "agod": 65, "agohe": 18, "agoi": 26, "agoid": 2, "agoif": 2, "agoin": 16, "agois": 2, "agoit": 11, "agold": 11, "agolf": 2, "agome": 2, "agomr": 2, "agomy": 2, "agono": 2, "agood": 699, "agoof": 3, "agoon": 5, "agoor": 3, "agop": 2, "agore": 2, "agory": 2, "agoto": 10, "agous": 2, "agowe": 5, "agown": 8, "agrab": 3, "agray": 9, "agrey": 12, "agrim": 4, "agrin": 8, "agrip": 3, "agulf": 3, "agull": 3, "agulp": 2, "agun": 27, "agush": 2, "agust": 2, "aguy": 7, "aguys": 4, "ahabi": 3, "ahabs": 78, "ahack": 3, "ahah": 2, "ahai": 3, "ahail": 4, "ahair": 14, "ahalf": 104, "ahall": 6, "ahalo": 2, "ahalt": 5, "aham": 2, "ahan": 2, "ahand": 41, "ahang": 2, "ahank": 2, "ahard": 42, "ahare": 4, "aharp": 7, "ahas": 3, "ahat": 14, "ahave": 2, "ahawk": 2, "ahay": 2, "ahaze": 3, "ahazy": 5, "ahbut": 4, "ahby": 2, "ahdid": 2, "ahdo": 2, "ahdr": 2, "ahead": 27, "aheap": 18, "aheat": 3, "aheck": 2, "aheel": 2, "ahell": 11, "ahelm": 2, "ahelp": 2, "ahem": 2, "ahen": 5, "aher": 2, "aherb": 2, "aherd": 7, "ahero": 17, "ahex": 2, "ahgod": 2, "ahha": 2, "ahhe": 8, "ahhev": 2, "ahhim": 2, "ahhis": 2, "ahhow": 4, "ahi": 6, "ahif": 3, "ahigh": 93, "ahill": 22, "ahind": 2, "ahint": 30, "ahip": 2, "ahiss": 3, "ahit": 13, "ahlow": 2, "ahma": 2, "ahme": 2, "ahmr": 3, "ahmy": 18, "ahno": 4, "ahnot": 2, "ahnow": 5, "ahoe": 2, "ahold": 6, "ahole": 33, "aholy": 12, "ahome": 34, "ahook": 2, "ahop": 3, "ahope": 13, "ahorn": 4, "ahose": 4, "ahost": 11, "ahot": 25, "ahour": 4, "ahow": 2, "ahowl": 5, "ahoya": 2, "ahp": 3, "ahr": 4, "ahshe": 4, "ahsir": 2, "ahso": 3, "ahthe": 9, "ahto": 2, "ahub": 3, "ahue": 2, "ahuff": 4, "ahuge": 49, "ahull": 2, "ahump": 6, "ahun": 3, "ahunk": 2, "ahurt": 2, "ahush": 2, "ahut": 3, "ahwho": 2, "ahwhy": 2, "ahye": 2, "ahyes": 2, "ahymn": 3, "ahyou": 10, "ahypo": 2, "aian": 2, "aiand": 15, "aibut": 2, "aida": 3, "aidas": 3, "aidat": 2, "aidhe": 3, "aidi": 4, "aidin": 21, "aidis": 4, "aidit": 2, "aidof": 14, "aidon": 2, "aidor": 2, "aidso": 2, "aidto": 17, "aidus": 3, "aif": 3, "aifor": 3, "aihe": 2, "aiin": 2, "aiis": 2, "aimat": 10, "aimd": 3, "aimhe": 2, "aimin": 3, "aimis": 4, "aimof": 10, "aimt": 2, "aimto": 7, "ain": 5, "ainch": 14, "ainow": 2, "aint": 31, "ainta": 2, "aion": 3, "aior": 2, "aiot": 3, "aira": 10, "airah": 3, "airas": 20, "airat": 4, "airby": 4, "aird": 3, "airdo": 3, "airhe": 14, "airi": 16, "airif": 4, "airin": 21, "airis": 8, "airit": 9, "airmr": 2, "airmy": 2, "airno": 3, "airof": 82, "airon": 8, "airor": 8, "airs": 2, "airso": 9, "airto": 20, "airwe": 3, "airyi": 2, "ais": 9, "aisaw": 2, "aisee": 2, "ait": 3, "aitwo": 2, "aja": 5, "ajack": 6, "ajail": 5, "ajall": 4, "ajam": 2, "ajand": 2, "ajane": 2, "ajar": 8, "ajaw": 2, "ajazz": 4, "ajbut": 3, "ajby": 2, "ajc": 2, "ajcta": 2, "ajdr": 2, "ajeep": 2, "ajerk": 4, "ajest": 2, "ajet": 5, "ajew": 32, "ajfor": 7, "ajhas": 3, "ajher": 3, "aji": 2, "ajif": 3, "ajiff": 2, "ajig": 3, "ajin": 5, "ajinx": 2, "ajit": 3, "ajmr": 2, "ajob": 43, "ajoke": 13, "ajolt": 2, "ajon": 2, "ajoy": 9, "ajthe": 27, "ajug": 3, "ajuly": 5, "ajump": 3, "ajury": 11, "ajuse": 2, "ajust": 22, "ajwe": 5, "ajyou": 2, "akc": 2, "akeel": 3, "akeen": 8, "akeep": 2, "aketo": 2, "akey": 21, "akhan": 2, "akick": 8, "akid": 27, "akids": 2, "akill": 2, "akind": 142, "aking": 89, "akink": 2, "akiss": 9, "akite": 3, "aknee": 8, "aknit": 2, "aknob": 2, "aknop": 11, "aknot": 7, "aknow": 2, "ala": 4, "alaap": 2, "alace": 4, "alack": 11, "alacy": 2, "alad": 13, "alady": 59, "alake": 10, "alamb": 42, "alame": 4, "alamp": 20, "aland": 75, "alane": 7, "alaon": 2, "alap": 2, "alark": 4, "alash": 2, "alasi": 5, "alaso": 3, "alast": 17, "alate": 9, "alaw": 27, "alawn": 2, "alay": 2, "alazy": 6, "alb": 3, "albor": 2, "alead": 10, "aleaf": 13, "aleak": 3, "alean": 10, "aleap": 5, "aleas": 2, "aleat": 2, "alee": 3, "aleft": 2, "aleg": 18, "alehe": 2, "alei": 3, "aleoh": 2, "aleor": 3, "aless": 17, "alevy": 4, "alewd": 2, "alexi": 2, "alhad": 2, "alhas": 2, "aliar": 17, "alid": 2, "alie": 39, "alien": 2, "alier": 2, "alife": 46, "alift": 7, "alike": 5, "alily": 3, "alima": 2, "alimb": 3, "alimp": 3, "aline": 68, "alink": 4, "alion": 59, "alip": 3, "alis": 3, "alist": 29, "alive": 16, "alla": 60, "allah": 3, "allam": 3, "allan": 8, "allas": 42, "allat": 59, "allbe": 43, "allby": 29, "allde": 2, "alldo": 14, "alled": 2, "allgo": 6, "allha": 2, "allhe": 121, "alli": 161, "allif": 19, "allim": 3, "allin": 167, "allis": 55, "allit": 47, "alllo": 2, "allma": 2, "allmr": 4, "allmy": 244, "alln": 2, "allno": 14, "allo": 7, "allof": 346, "alloh": 8, "allon": 41, "allor": 14, "allr": 2, "alls": 8, "allso": 23, "allst": 2, "allth": 3, "allto": 110, "allup": 14, "allus": 3, "allwe": 32, "allye": 63, "almai": 2, "alno": 2, "aload": 3, "aloaf": 5, "aloan": 4, "alobo": 2, "alock": 10, "aloft": 2, "alog": 8, "aloin": 3, "alone": 8, "along": 382, "alook": 94, "aloon": 2, "aloop": 5, "alope": 3, "alord": 8, "alory": 2, "aloss": 24, "alost": 9, "alot": 122, "aloud": 72, "alove": 7, "alow": 106, "alpsi": 2, "alsoa": 73, "alsoi": 44, "alsoo": 6, "althe": 2, "alug": 2, "alull": 3, "alulu": 2, "alump": 14, "alung": 2, "alush": 3, "alust": 2, "alvaw": 2, "alwe": 2, "alwho": 2, "alye": 2, "alyon": 2, "ama": 118, "amace": 2, "amad": 12, "amade": 2, "amaid": 15, "amail": 6, "amain": 5, "amale": 16, "amall": 5, "amam": 2, "aman": 1430, "amand": 48, "amano": 2, "amans": 16, "amany": 2, "amaon": 2, "amap": 8, "amare": 3, "amark": 18, "amarm": 3, "amart": 2, "amary": 2, "amas": 24, "amask": 11, "amass": 18, "amast": 10, "amat": 20, "amate": 2, "amaul": 2, "amay": 4, "amazd": 5, "amaze": 6, "amazy": 2, "ambru": 2, "ambut": 26, "amby": 4, "amc": 2, "amcut": 4, "amdid": 2, "amdo": 4, "amdon": 3, "amdr": 3, "ameal": 11, "amean": 11, "ameat": 46, "ameek": 2, "ameet": 2, "ameni": 12, "amerc": 2, "amere": 75, "amesh": 2, "amess": 8, "amfar": 3, "amfed": 2, "amfit": 2, "amfor": 16, "amgo": 2, "amgod": 13, "amgot": 2, "amha": 2, "amhe": 47, "amher": 2, "amhis": 5, "amhow": 3, "ami": 221, "amica": 2, "amid": 2, "amida": 7, "amif": 7, "amild": 9, "amile": 74, "amilk": 8, "amill": 4, "amin": 49, "amind": 31, "amine": 5, "amink": 2, "amint": 3, "amis": 4, "amiss": 11, "amist": 6, "amit": 6, "amix": 2, "amjoy": 2, "amlet": 3, "amm": 4, "amma": 2, "ammad": 7, "ammar": 2, "ammoa": 2, "ammr": 2, "ammrs": 2, "ammy": 7, "amno": 21, "amnor": 2, "amnot": 236, "amnow": 24, "amo": 2, "amoan": 2, "amob": 7, "amock": 4, "amode": 4, "amof": 24, "amoff": 5, "amold": 10, "amole": 2, "amon": 2, "amone": 11, "amonk": 4, "amood": 10, "amoon": 3, "amoot": 2, "amop": 2, "amor": 5, "amore": 185, "amosc": 3, "amoso": 2, "amoss": 2, "amost": 197, "amoth": 4, "amove": 6, "amput": 3, "amr": 8, "amrs": 12, "amset": 7, "amshe": 10, "amsir": 4, "amso": 41, "amthe": 273, "amthy": 19, "amto": 55, "amtoo": 8, "amtwo": 2, "amuch": 62, "amug": 2, "amule": 6, "amup": 2, "amusk": 2, "amust": 4, "amute": 3, "amv": 2, "amwas": 3, "amwe": 3, "amwho": 3, "amwhy": 2, "amy": 2, "amyas": 2, "amyet": 4, "amyis": 2, "amyou": 6, "amyso": 2, "amyth": 7, "anace": 8, "anact": 19, "anad": 2, "anaf": 4, "anage": 16, "anah": 6, "anaid": 10, "anail": 8, "anair": 43, "anaj": 2, "anale": 2, "anall": 6, "anam": 2, "aname": 51, "anamy": 2, "anan": 2, "anant": 3, "anap": 5, "anape": 4, "anarc": 3, "anark": 10, "anarm": 23, "anarp": 2, "anart": 11, "anash": 6, "anass": 28, "anate": 2, "anaul": 3, "anavy": 7, "anawe": 3, "anax": 5, "anaxe": 6, "anazi": 2, "anda": 1803, "andaf": 82, "andah": 2, "andai": 6, "andaj": 5, "andal": 3, "andam": 55, "andan": 247, "andas": 883, "andat": 394, "andb": 14, "andbd": 2, "andbe": 335, "andby": 439, "andc": 24, "andch": 2, "andcm": 3, "andco": 4, "andd": 8, "anddc": 3, "andde": 5, "anddo": 187, "anddr": 20, "anddu": 3, "anddy": 2, "ande": 10, "anded": 2, "andel": 3, "ander": 5, "andex": 2, "andf": 5, "andft": 2, "andfy": 2, "andg": 3, "andgo": 148, "andh": 5, "andha": 2, "andhe": 4016, "andhi": 2, "andi": 2747, "andid": 4, "andie": 2, "andif": 615, "andim": 16, "andin": 1578, "andio": 2, "andis": 258, "andit": 1542, "andj": 7, "andk": 2, "andl": 2, "andla": 2, "andlb": 3, "andld": 2, "andle": 2, "andlo": 65, "andlt": 2, "andm": 4, "andma": 4, "andme": 73, "andml": 2, "andmm": 2, "andmr": 172, "andmy": 485, "andn": 12, "andno": 213, "ando": 14, "andof": 1002, "andog": 8, "andoh": 10, "andon": 399, "andor": 2, "andox": 2, "andp": 11, "andpm": 2, "andq": 7, "andr": 4, "andre": 9, "andrh": 3, "ands": 9, "andsh": 2, "andso": 587, "andst": 6, "andt": 7, "andth": 9, "andto": 1602, "andtr": 2, "andtv": 3, "anduk": 2, "andun": 2, "andup": 22, "andus": 9, "anduz": 2, "andv": 2, "andvs": 2, "andw": 4, "andwe": 420, "andwh": 2, "andy": 2, "andyb": 3, "andye": 404, "andyr": 2, "anear": 18, "aneat": 12, "aneck": 4, "aneed": 8, "aneel": 3, "anegg": 12, "anell": 2, "anend": 157, "aneon": 2, "anequ": 2, "anera": 4, "anest": 10, "anet": 19, "anew": 457, "anewi": 2, "anews": 7, "anex": 2, "aneye": 32, "anf": 3, "anfbi": 2, "anfox": 3, "anhe": 4, "anhin": 22, "anhis": 2, "ani": 4, "anibm": 2, "anice": 60, "anicy": 4, "anill": 17, "anin": 5, "anine": 3, "anink": 2, "aninn": 13, "anip": 2, "aniq": 5, "anism": 3, "anit": 2, "anivy": 2, "anm": 7, "anmgm": 2, "annaa": 2, "annea": 3, "annei": 12, "annes": 54, "annif": 2, "ano": 6, "anoah": 2, "anoak": 9, "anoar": 6, "anod": 5, "anodd": 34, "anode": 2, "anoff": 2, "anoil": 11, "anold": 255, "anona": 4, "anone": 16, "anoni": 2, "anoon": 3, "anop": 2, "anor": 2, "anorb": 2, "anose": 5, "anot": 8, "anote": 46, "anout": 3, "anov": 3, "anowl": 6, "anox": 24, "anper": 2, "anpit": 2, "anr": 2, "anrdw": 3, "anso": 2, "ansp": 3, "anss": 2, "ant": 10, "antbe": 2, "anthe": 6, "anti": 3, "antif": 2, "antis": 2, "antno": 2, "anto": 2, "antor": 2, "antso": 3, "antuk": 2, "anude": 4, "anull": 2, "anun": 2, "anup": 2, "anurn": 2, "anut": 8, "anwid": 2, "anya": 5, "anyas": 3, "anyat": 2, "anybe": 4, "anyby": 2, "anydo": 2, "anydu": 2, "anyhe": 8, "anyi": 5, "anyif": 2, "anyin": 11, "anyis": 7, "anyit": 5, "anyme": 2, "anymr": 2, "anyno": 2, "anyof": 279, "anyoh": 2, "anyon": 4, "anyor": 2, "anyrs": 2, "anyso": 2, "anyth": 2, "anyto": 11, "anywe": 2, "aoao": 3, "aof": 12, "aoh": 2, "aon": 3, "aonce": 2, "aone": 25, "aones": 2, "aonly": 2, "aor": 8, "aothe": 2, "apace": 5, "apack": 12, "apact": 2, "apad": 2, "apage": 5, "apail": 5, "apain": 5, "apair": 64, "apale": 22, "apall": 2, "apalm": 6, "apan": 9, "apane": 3, "apang": 4, "apar": 5, "apark": 10, "apart": 95, "apaso": 2, "apass": 5, "apast": 4, "apath": 21, "apaul": 2, "apawn": 2, "ape": 2, "apea": 2, "apeak": 2, "apeal": 3, "apear": 4, "apeby": 3, "apeep": 5, "apeg": 10, "apein": 2, "apen": 8, "apeor": 2, "aper": 7, "apert": 2, "apet": 9, "apeto": 2, "apew": 3, "apfc": 2, "aph": 2, "aphi": 2, "aphiz": 2, "apick": 2, "apie": 3, "apier": 2, "apig": 10, "apike": 7, "apile": 10, "apill": 2, "apimp": 2, "apin": 11, "apine": 7, "apink": 11, "apins": 2, "apint": 6, "apipe": 11, "apit": 20, "apity": 42, "aplan": 35, "aplay": 18, "aplea": 4, "aplot": 10, "aplow": 2, "aplug": 2, "aplum": 5, "apod": 2, "apoem": 24, "apoet": 25, "apole": 13, "apoll": 5, "apomp": 2, "apond": 4, "apony": 2, "apool": 24, "apoon": 2, "apoor": 61, "apope": 3, "apork": 2, "aport": 2, "apose": 2, "apost": 12, "apot": 14, "apour": 2, "apow": 2, "appaj": 2, "apre": 2, "aprey": 36, "apro": 2, "aprod": 3, "aprop": 3, "apta": 2, "aptby": 2, "apthe": 5, "aptin": 2, "aptto": 49, "aptwo": 2, "apuff": 4, "apuft": 2, "apull": 5, "apump": 2, "apun": 2, "apuny": 3, "apure": 15, "apush": 4, "aquay": 2, "araal": 2, "arabs": 2, "arace": 21, "arack": 2, "araft": 3, "arag": 8, "arage": 9, "araid": 2, "arain": 5, "arake": 4, "aram": 30, "aramp": 2, "arand": 2, "arank": 6, "arap": 5, "arapt": 2, "arare": 14, "arash": 3, "arat": 13, "arate": 15, "arats": 2, "araw": 4, "arawe": 2, "aray": 3, "arca": 2, "arcan": 2, "arcat": 2, "arcby": 2, "arcde": 2, "archd": 2, "archi": 2, "arcin": 3, "arcis": 2, "arcit": 2, "arcof": 4, "arcto": 3, "ardid": 2, "area": 192, "areaa": 3, "areaf": 4, "areai": 2, "areal": 85, "aream": 2, "arean": 33, "arear": 4, "areas": 89, "areat": 72, "areb": 3, "areby": 27, "ared": 45, "aree": 2, "areed": 12, "arehe": 13, "arei": 26, "areif": 9, "areim": 2, "arein": 295, "areis": 2, "areit": 5, "arem": 2, "aremr": 7, "aremy": 57, "areno": 77, "arent": 18, "areo": 2, "areof": 114, "areon": 48, "areor": 4, "arep": 2, "areps": 2, "arer": 2, "areso": 110, "arest": 5, "areto": 160, "areup": 7, "areus": 2, "arewe": 77, "areye": 67, "arias": 2, "arib": 3, "arich": 33, "aride": 6, "arift": 2, "arill": 2, "arim": 2, "aring": 22, "ariot": 5, "aripa": 2, "aripe": 3, "arise": 3, "arisk": 7, "arite": 3, "arka": 2, "arkas": 2, "arkbe": 2, "arkhe": 2, "arkin": 2, "arkno": 2, "arkof": 150, "arkso": 2, "arkto": 5, "arma": 4, "armah": 2, "armas": 4, "armat": 8, "armbe": 2, "armd": 25, "armgo": 3, "armhe": 13, "armi": 3, "armif": 2, "armin": 15, "armis": 5, "armit": 2, "armmr": 2, "armmy": 2, "armno": 2, "armo": 2, "armof": 29, "armon": 4, "arms": 2, "armsa": 3, "armsi": 5, "armso": 6, "armth": 2, "armto": 9, "armup": 2, "armyi": 4, "armyo": 2, "aroad": 19, "aroar": 12, "arobe": 5, "arock": 44, "arod": 24, "aroe": 5, "arof": 3, "arole": 13, "aroll": 8, "arood": 2, "aroof": 7, "aroom": 33, "aroot": 8, "arope": 18, "arore": 2, "arose": 4, "arout": 4, "arow": 44, "art": 3, "arta": 45, "artan": 9, "artas": 13, "artat": 3, "artby": 2, "arthe": 7, "arti": 3, "artif": 2, "artin": 25, "artis": 10, "artit": 7, "artj": 2, "artmy": 55, "artno": 3, "arto": 2, "artof": 48, "arton": 2, "artor": 4, "artsa": 4, "artso": 5, "artto": 18, "artup": 2, "artwe": 2, "arude": 9, "arug": 4, "aruin": 2, "arule": 22, "arum": 7, "arun": 12, "arunt": 2, "aruse": 2, "arush": 17, "aruss": 2, "arust": 2, "arut": 2, "asa": 1970, "asack": 4, "asad": 25, "asaf": 8, "asafe": 19, "asag": 2, "asaga": 3, "asage": 2, "asahe": 2, "asaid": 2, "asail": 10, "asain": 3, "asair": 6, "asale": 4, "asalf": 2, "asall": 42, "asalt": 5, "asan": 368, "asand": 6, "asane": 3, "asann": 2, "asany": 92, "asare": 43, "asari": 2, "asart": 2, "asas": 2, "asash": 3, "asat": 54, "asax": 2, "asay": 2, "asbad": 16, "asbc": 2, "asbe": 7, "asben": 2, "asbig": 14, "asbut": 2, "asby": 42, "asc": 2, "ascab": 5, "ascan": 12, "ascar": 4, "ascut": 2, "asda": 2, "asdag": 2, "asday": 7, "asde": 2, "asdec": 2, "asdew": 2, "asdid": 32, "asdig": 2, "asdo": 17, "asdoc": 2, "asdog": 2, "asdr": 6, "asdry": 2, "asea": 43, "aseal": 8, "aseam": 4, "aseat": 28, "ased": 2, "asee": 2, "aseed": 7, "aseer": 4, "aself": 6, "asemi": 3, "asere": 4, "aset": 32, "aseve": 2, "asexy": 2, "asfar": 151, "asfat": 4, "asfed": 2, "asfew": 6, "asfit": 2, "asfor": 295, "asgay": 4, "asgo": 2, "asgod": 30, "ash": 2, "ashad": 23, "ashal": 3, "asham": 5, "ashas": 18, "ashaw": 2, "ashay": 2, "ashe": 1309, "ashee": 3, "ashen": 2, "asher": 78, "ashew": 5, "ashhe": 2, "ashim": 2, "ashin": 2, "aship": 94, "ashis": 184, "ashit": 3, "ashod": 2, "ashon": 3, "ashop": 18, "ashot": 16, "ashow": 26, "ashut": 2, "ashy": 4, "asi": 808, "asiai": 2, "asias": 5, "asice": 3, "asick": 18, "asid": 2, "aside": 21, "asif": 771, "asigh": 32, "asign": 83, "asilk": 5, "asill": 3, "asim": 3, "asin": 355, "asing": 3, "asip": 2, "asis": 54, "asit": 689, "asite": 11, "asits": 21, "asix": 3, "asize": 3, "asjar": 2, "asjob": 2, "asjoy": 3, "aska": 14, "askan": 3, "askat": 2, "askby": 3, "askd": 11, "askdo": 2, "askhe": 5, "aski": 3, "askid": 3, "askif": 10, "askin": 12, "askis": 3, "askit": 15, "askme": 20, "askmr": 5, "askmy": 11, "askno": 10, "askof": 17, "askon": 2, "askor": 5, "askt": 2, "askto": 7, "askus": 9, "askwe": 3, "asky": 7, "askye": 6, "asla": 2, "aslab": 2, "aslap": 2, "aslat": 2, "aslaw": 5, "aslay": 2, "asle": 2, "aslim": 3, "aslip": 4, "aslit": 2, "aslob": 4, "aslos": 2, "aslow": 26, "aslug": 5, "asly": 6, "asm": 2, "asmad": 5, "asmae": 2, "asman": 13, "asmay": 33, "asmbf": 2, "asme": 5, "asmen": 19, "asmm": 2, "asmr": 37, "asmrs": 44, "asmt": 2, "asmy": 89, "asnap": 4, "asnec": 2, "asnew": 9, "asno": 27, "asnot": 46, "asnow": 46, "asnug": 4, "aso": 3, "asoap": 2, "asob": 2, "asock": 2, "asodd": 3, "asof": 115, "asofa": 4, "asoft": 38, "asog": 2, "asoil": 2, "asold": 13, "asole": 2, "asolo": 2, "ason": 148, "asone": 178, "asong": 58, "asop": 3, "asor": 3, "asore": 13, "asort": 243, "asoso": 3, "asou": 3, "asoul": 29, "asour": 35, "asout": 7, "aspan": 11, "aspap": 2, "aspar": 4, "aspat": 2, "asper": 3, "aspi": 3, "aspin": 3, "aspip": 2, "aspot": 18, "aspro": 2, "aspto": 3, "aspud": 3, "aspur": 2, "aspy": 9, "asr": 2, "asred": 8, "asrh": 2, "asrob": 2, "asrod": 2, "ass": 6, "assad": 2, "assan": 3, "assay": 5, "assea": 2, "assen": 2, "asseo": 2, "asset": 5, "assex": 5, "asshe": 590, "assin": 4, "assir": 13, "assit": 2, "assix": 3, "asso": 11, "assof": 3, "asson": 2, "assor": 6, "asss": 5, "assso": 2, "asst": 4, "assto": 4, "ast": 4, "astag": 4, "astar": 16, "astay": 4, "astem": 5, "asten": 4, "astep": 33, "astew": 2, "asth": 2, "asthe": 2226, "asthy": 28, "astie": 2, "astir": 3, "astis": 3, "asto": 712, "astom": 3, "astoo": 6, "astop": 15, "astow": 3, "astry": 2, "astud": 2, "astwo": 13, "asu": 2, "asub": 4, "asuch": 3, "asuit": 9, "asulk": 3, "asum": 10, "asun": 8, "asup": 2, "asure": 16, "asurf": 3, "asw": 2, "aswan": 2, "aswap": 2, "aswar": 2, "aswas": 56, "aswax": 3, "aswe": 241, "aswed": 2, "aswet": 2, "aswho": 4, "aswig": 2, "aswim": 2, "aswit": 3, "aswon": 2, "asya": 2, "asye": 80, "asyes": 2, "asyet": 64, "asyme": 3, "asyou": 400, "asyow": 2, "asyue": 2, "ata": 516, "atack": 4, "ataf": 19, "atag": 3, "atage": 2, "atail": 9, "ataj": 4, "atale": 12, "atalk": 7, "atall": 823, "atam": 19, "atame": 2, "atamp": 2, "atan": 74, "atand": 23, "atank": 2, "atany": 187, "atap": 4, "atape": 3, "atarm": 2, "atart": 2, "atas": 7, "atask": 6, "atast": 2, "atax": 14, "ataxi": 9, "atbat": 3, "atbay": 12, "atben": 2, "atbmt": 2, "atbut": 9, "atby": 10, "atcat": 4, "atcm": 8, "atday": 2, "atde": 6, "atdim": 2, "atdog": 2, "atdr": 4, "ate": 2, "atea": 8, "ateam": 14, "atear": 13, "ateas": 2, "atebb": 2, "ateby": 2, "atehe": 2, "ateil": 2, "atein": 2, "ateit": 9, "atel": 3, "atell": 2, "atem": 5, "aten": 3, "ateno": 3, "atent": 11, "ateof": 2, "ateon": 2, "aterm": 10, "atest": 12, "atete": 10, "ateup": 2, "ateve": 2, "atewe": 2, "atext": 5, "ateye": 2, "atf": 3, "atfor": 6, "atfox": 2, "atfps": 2, "atge": 2, "atgob": 2, "atgod": 3, "atguv": 2, "atgyp": 2, "ath": 3, "athal": 3, "athaw": 3, "athe": 18, "athen": 3, "ather": 259, "athim": 233, "athin": 28, "athis": 422, "athow": 2, "athud": 3, "athug": 2, "ati": 4, "atide": 2, "atidy": 5, "atie": 5, "atif": 3, "atile": 3, "atime": 244, "atin": 16, "atint": 2, "atiny": 33, "atip": 5, "atire": 5, "atis": 5, "atit": 145, "atits": 53, "atjem": 2, "atken": 2, "atkey": 2, "atla": 2, "atlas": 2, "atlaw": 2, "atlbs": 2, "atle": 2, "atlee": 2, "atlet": 2, "atlos": 4, "atlow": 12, "atlsu": 2, "atluz": 2, "atm": 3, "atman": 2, "atmay": 2, "atme": 76, "atmg": 2, "atmgl": 2, "atmid": 2, "atmm": 6, "atmph": 4, "atmr": 22, "atmrs": 25, "atmt": 3, "atmy": 121, "atmym": 2, "atn": 2, "atnbc": 2, "atnew": 9, "atno": 19, "atnob": 2, "atnor": 3, "atnot": 7, "atnow": 2, "atnyu": 2, "ato": 10, "atoad": 6, "atodd": 2, "atodo": 2, "atof": 3, "atoil": 5, "atold": 3, "atoll": 3, "atoma": 2, "atomb": 7, "aton": 12, "atone": 163, "atoo": 8, "atool": 4, "atop": 25, "atopa": 3, "ator": 5, "atory": 2, "atour": 34, "atout": 2, "atow": 2, "atown": 19, "atoy": 7, "atp": 6, "atpak": 2, "atper": 4, "atpip": 3, "atpm": 35, "atq": 3, "atram": 2, "atrap": 17, "atrat": 2, "atray": 6, "atred": 3, "atree": 68, "atrim": 2, "atrio": 2, "atrip": 7, "atrot": 4, "atrpm": 5, "atrue": 31, "atsan": 6, "atsaw": 2, "atsea": 54, "atshe": 3, "atsin": 2, "atsir": 3, "atsix": 13, "atso": 9, "atst": 8, "atsun": 4, "att": 6, "atta": 2, "attea": 3, "atten": 8, "atth": 7, "atthe": 3876, "atthy": 49, "attin": 2, "atto": 4, "attom": 2, "attoo": 2, "attop": 6, "attwo": 17, "atub": 4, "atube": 7, "atuft": 2, "atug": 2, "atun": 2, "atunc": 2, "atune": 10, "atup": 4, "aturf": 2, "aturn": 14, "atus": 17, "atv": 3, "atva": 2, "atwar": 6, "atwas": 2, "atwe": 3, "atwig": 4, "atwin": 2, "atwo": 8, "atye": 4, "atyes": 2, "atyet": 2, "atym": 2, "atyon": 2, "atyou": 25, "atype": 16, "atyro": 2, "atze": 2, "aubrf": 2, "auga": 2, "aughe": 2, "augi": 4, "augin": 3, "augis": 2, "augit": 3, "augno": 2, "aulei": 2, "aun": 4, "aunit": 9, "aunta": 2, "aunts": 8, "aus": 3, "ause": 3, "aused": 3, "auso": 2, "ava": 5, "avail": 7, "avain": 11, "avale": 2, "avan": 3, "avap": 2, "avase": 7, "avast": 52, "avat": 2, "aveil": 6, "avein": 2, "aveit": 2, "avene": 2, "averb": 2, "avery": 820, "avest": 3, "aveto": 4, "avewe": 2, "avext": 2, "avial": 2, "avice": 6, "aview": 20, "avile": 7, "avine": 11, "avis": 3, "avisa": 5, "avise": 2, "avlee": 2, "avoid": 5, "avote": 11, "avow": 21, "avowd": 3, "avthe": 2, "awaco": 2, "awad": 2, "awage": 3, "awaif": 4, "awail": 2, "awakd": 3, "awake": 2, "awalk": 25, "awall": 38, "awan": 2, "awand": 3, "awant": 10, "awar": 34, "award": 2, "awarm": 25, "awarp": 3, "awart": 4, "awary": 5, "awas": 3, "awash": 6, "awatt": 2, "awave": 20, "awax": 3, "away": 128, "awaya": 28, "awayc": 2, "awayi": 27, "awayo": 7, "aways": 3, "awea": 2, "aweak": 10, "aweby": 2, "awee": 4, "aweed": 3, "aweek": 140, "awehe": 3, "awei": 2, "awein": 2, "awell": 55, "awen": 2, "aweof": 11, "awest": 7, "awet": 9, "aweto": 2, "awhat": 2, "awhig": 3, "awhip": 9, "awhit": 4, "awhiz": 2, "awho": 2, "awick": 2, "awide": 48, "awife": 90, "awig": 4, "awild": 45, "awill": 5, "awily": 3, "awind": 11, "awine": 6, "awing": 4, "awink": 6, "awire": 7, "awiry": 3, "awise": 57, "awish": 16, "awisp": 4, "awit": 4, "awith": 2, "awoe": 3, "awolf": 10, "awood": 12, "aword": 255, "awork": 30, "aworm": 10, "awrit": 4, "awry": 4, "axand": 2, "axat": 2, "axeat": 2, "axehe": 3, "axein": 4, "axeis": 3, "axemy": 2, "axeof": 2, "axeto": 3, "axor": 3, "aya": 2, "ayain": 2, "ayale": 2, "ayand": 2, "ayank": 3, "ayard": 15, "ayawn": 3, "ayay": 7, "aybut": 3, "aydo": 2, "aydto": 2, "ayea": 4, "ayeah": 2, "ayear": 196, "ayedo": 2, "ayehe": 8, "ayei": 16, "ayein": 3, "ayeit": 4, "ayell": 5, "ayelp": 2, "ayeme": 3, "ayemr": 2, "ayemy": 5, "ayen": 3, "ayeor": 2, "ayes": 4, "ayet": 9, "ayeto": 3, "ayewe": 3, "ayeye": 3, "aygo": 2, "ayhey": 2, "ayi": 3, "ayif": 3, "ayin": 2, "ayit": 3, "ayme": 3, "aymr": 2, "aymy": 3, "ayno": 2, "aynow": 5, "ayoke": 8, "ayong": 2, "ayor": 3, "aysir": 4, "ayso": 4, "ayto": 4, "aywe": 3, "ayyou": 4, "azcap": 2, "azeal": 5, "azero": 2, "azest": 2, "azinc": 3, "azoo": 2, "baala": 2, "baals": 2, "baas": 2, "babby": 2, "babei": 2, "babel": 2, "babes": 3, "babi": 3, "babor": 2, "babs": 2, "babto": 3, "babwe": 2, "babya": 3, "babyi": 6, "babys": 8, "backa": 27, "backd": 3, "backe": 2, "backi": 26, "backs": 2, "bada": 5, "badas": 15, "badat": 2, "badby": 2, "badgd": 2, "badhe": 8, "badi": 12, "badif": 4, "badim": 2, "badin": 3, "badis": 3, "badit": 5, "badme": 5, "badmr": 2, "badno": 5, "badof": 3, "badon": 2, "bador": 4, "badsi": 2, "badto": 6, "badu": 2, "badwe": 2, "baf": 4, "baga": 4, "bagan": 2, "bagas": 4, "baggd": 2, "bagha": 2, "baghe": 6, "bagi": 5, "bagin": 4, "bagno": 2, "bagof": 11, "bags": 2, "bagsi": 2, "bagso": 3, "bagto": 4, "bagup": 2, "bagwe": 2, "baili": 2, "baj": 3, "bakd": 3, "bakea": 2, "bakei": 2, "balkd": 4, "ball": 2, "balla": 2, "balld": 2, "balli": 5, "balma": 2, "balmo": 2, "bamis": 2, "bamld": 4, "banas": 2, "band": 18, "banda": 3, "bandi": 4, "bangd": 2, "bani": 3, "banit": 2, "banka": 3, "banmy": 2, "bano": 2, "banon": 4, "banto": 2, "bapoh": 2, "bapso": 2, "bara": 4, "baras": 2, "barat": 3, "barb": 2, "barbd": 2, "barby": 2, "barc": 2, "bard": 2, "bardr": 2, "bare": 2, "barea": 26, "barei": 2, "barhe": 6, "bari": 2, "baria": 2, "barif": 2, "barin": 6, "baris": 2, "barit": 2, "barme": 2, "barna": 4, "barni": 2, "barof": 11, "baron": 2, "barrd": 3, "barsa": 2, "barso": 2, "barto": 4, "bas": 3, "basea": 4, "basei": 2, "bat": 2, "bata": 2, "batas": 2, "batha": 2, "bathd": 2, "bathe": 2, "bathi": 6, "batin": 2, "batit": 2, "baton": 3, "batsi": 2, "baxes": 2, "baya": 2, "bayan": 2, "bayas": 2, "bayat": 2, "bayby": 2, "bayd": 2, "bayi": 6, "bayin": 2, "bayit": 2, "bayof": 12, "bayon": 4, "bayor": 4, "bayrd": 2, "bayto": 3, "bbut": 2, "bcan": 3, "bcand": 3, "bcbut": 2, "bcby": 2, "bcdvs": 2, "bcit": 2, "bcox": 2, "bcrew": 3, "bcthe": 5, "bcto": 2, "bcwas": 2, "bdied": 2, "bdin": 2, "bea": 994, "beach": 2, "beaf": 3, "beah": 2, "beall": 89, "beamd": 2, "bean": 202, "beand": 100, "beany": 76, "beapt": 5, "beara": 21, "beare": 2, "beari": 5, "bearo": 2, "bears": 8, "beart": 4, "beas": 234, "beat": 144, "beati": 2, "beau": 2, "bebad": 10, "bebe": 2, "bebi": 2, "bebig": 3, "bebut": 49, "beby": 20, "becan": 2, "becin": 2, "becol": 2, "becow": 2, "becut": 77, "beda": 5, "bedas": 2, "bedat": 12, "beday": 2, "bedby": 3, "bedec": 2, "bedew": 3, "bedhe": 21, "bedi": 17, "bedid": 2, "bedif": 3, "bedim": 2, "bedin": 15, "bedis": 6, "bedit": 4, "bedmy": 2, "bedno": 2, "bedo": 4, "bedof": 29, "bedoh": 2, "bedon": 8, "bedor": 5, "bedry": 6, "beds": 2, "bedso": 3, "bedto": 15, "bedue": 8, "bedug": 2, "bedwe": 2, "beefi": 2, "beeis": 2, "beena": 308, "beeni": 10, "beera": 2, "beere": 7, "beeri": 3, "beest": 2, "beet": 2, "befar": 24, "befat": 7, "befed": 11, "befew": 6, "befit": 7, "befor": 137, "befun": 3, "bega": 2, "begas": 2, "begay": 2, "beggd": 2, "begi": 4, "begin": 3, "begmy": 4, "begod": 10, "begor": 4, "begot": 12, "begto": 6, "behad": 23, "behas": 2, "behe": 51, "behee": 2, "beher": 21, "behid": 19, "behim": 3, "behis": 93, "behit": 2, "behot": 6, "behow": 4, "bei": 37, "beif": 27, "beill": 8, "bein": 424, "beind": 3, "beis": 5, "beit": 106, "beits": 11, "beled": 16, "belet": 9, "belin": 2, "belis": 2, "belit": 5, "bella": 2, "belli": 2, "bello": 3, "bells": 7, "below": 6, "bemad": 8, "bemal": 2, "bemay": 4, "beme": 2, "bemen": 5, "bemet": 16, "bemou": 3, "bemr": 11, "bemrs": 10, "bemum": 2, "bemy": 77, "bena": 2, "benas": 2, "benat": 2, "bend": 2, "benda": 2, "bendi": 2, "bendo": 2, "benew": 5, "benhe": 5, "beni": 6, "benif": 2, "benil": 2, "benin": 2, "benit": 2, "benno": 2, "beno": 251, "benor": 3, "benot": 242, "benow": 17, "bens": 5, "benso": 2, "benti": 2, "bento": 2, "beo": 2, "beodd": 2, "beof": 218, "beoff": 18, "beoh": 2, "beoil": 2, "beold": 4, "beon": 89, "beone": 69, "beor": 11, "beour": 33, "beout": 28, "beox": 4, "beper": 3, "bepip": 2, "beput": 132, "bered": 3, "berid": 3, "berul": 3, "berun": 2, "bes": 2, "besad": 4, "besat": 2, "bese": 2, "besea": 2, "beset": 40, "beshe": 19, "beshy": 3, "besin": 6, "besir": 4, "besix": 5, "beso": 277, "beson": 2, "besti": 21, "besto": 2, "beten": 4, "beth": 3, "bethe": 733, "bethy": 45, "beti": 2, "betis": 3, "betit": 2, "beto": 149, "betof": 2, "beton": 3, "betoo": 81, "betso": 2, "bett": 2, "betto": 2, "betwo": 11, "beup": 14, "bew": 2, "bewar": 2, "bewas": 5, "bewe": 6, "bewet": 4, "bewho": 13, "bewhy": 2, "bewon": 8, "beya": 2, "beye": 74, "beyea": 5, "beyes": 3, "beyet": 11, "beyhe": 2, "beyou": 39, "bflat": 2, "bfor": 3, "bgsis": 2, "bgwas": 2, "bhamm": 2, "bhas": 2, "bhave": 2, "bhush": 2, "bidas": 2, "bidby": 2, "biddo": 2, "bidgo": 2, "bidin": 2, "bidit": 2, "bidme": 18, "bidmy": 2, "bidon": 3, "bidto": 3, "bidup": 2, "bidus": 3, "bidvs": 2, "bif": 2, "biga": 4, "bigas": 16, "bigby": 2, "bigto": 3, "bigus": 2, "billd": 2, "billi": 3, "bills": 5, "bin": 2, "bina": 2, "binan": 2, "binas": 2, "binat": 2, "binda": 2, "binis": 2, "binmy": 2, "bino": 2, "binso": 4, "birda": 3, "birdi": 3, "birdo": 2, "birds": 12, "bis": 2, "bisir": 2, "bit": 2, "bita": 2, "bitas": 6, "bitat": 3, "bitby": 4, "bithe": 4, "biti": 3, "bitif": 2, "bitin": 4, "bitis": 2, "bitmr": 2, "bito": 2, "bitof": 107, "biton": 3, "bitor": 2, "bits": 2, "bitto": 5, "bitwe": 2, "bizhe": 2, "bking": 2, "bkyne": 2, "blewa": 7, "blord": 2, "blota": 2, "blowi": 3, "bluei": 3, "blueo": 2, "bmore": 2, "bmost": 2, "boata": 4, "boati": 3, "boats": 40, "bobin": 2, "bodin": 4, "bodof": 5, "bodom": 2, "bodya": 9, "bodyi": 22, "bodyo": 3, "bodys": 37, "bof": 9, "bogon": 2, "bogor": 3, "bohns": 2, "boild": 2, "bol": 2, "bolda": 2, "boldi": 3, "boldo": 2, "bolta": 2, "bombi": 3, "bon": 3, "bondn": 2, "bonea": 2, "bonga": 3, "bonor": 2, "boo": 2, "booka": 4, "bookc": 2, "booki": 15, "booko": 2, "bookv": 3, "bookx": 3, "bor": 6, "borea": 8, "borna": 9, "borni": 3, "botha": 8, "bothc": 3, "bothi": 9, "botho": 2, "bouna": 2, "bowa": 3, "bowas": 2, "bowat": 3, "bowby": 2, "bowd": 6, "bowhe": 7, "bowi": 3, "bowif": 2, "bowin": 3, "bowis": 2, "bowmr": 3, "bowmy": 4, "bowof": 14, "bowor": 2, "bowsa": 2, "bowst": 2, "bowto": 13, "bowup": 2, "bowye": 2, "boxa": 3, "boxas": 2, "boxat": 2, "boxby": 2, "boxdo": 2, "boxha": 2, "boxhe": 4, "boxi": 10, "boxif": 2, "boxin": 12, "boxis": 2, "boxof": 13, "boxon": 6, "boxor": 3, "boxso": 3, "boxto": 3, "boxup": 2, "boxwe": 2, "boya": 8, "boyas": 7, "boyat": 5, "boybe": 2, "boyhe": 21, "boyi": 28, "boyif": 3, "boyin": 22, "boyis": 13, "boyit": 6, "boymr": 3, "boymy": 5, "boyno": 3, "boyo": 2, "boyof": 19, "boyoh": 2, "boyon": 6, "boyor": 9, "boys": 33, "boysa": 3, "boysi": 6, "boyso": 7, "boyto": 13, "boyup": 2, "boywe": 3, "bpeck": 2, "bra": 2, "braud": 2, "braya": 2, "brazd": 2, "bred": 2, "brewd": 3, "brica": 2, "brot": 2, "browi": 2, "brua": 3, "brube": 2, "bruby": 3, "brudo": 2, "brugo": 3, "bruhe": 5, "bruho": 2, "brui": 14, "bruif": 2, "bruit": 3, "brumy": 2, "brunm": 2, "bruno": 6, "bruo": 9, "bruor": 2, "bruti": 4, "bsare": 2, "bsera": 2, "bsin": 2, "bson": 2, "bsuch": 2, "btas": 2, "bthat": 3, "bthe": 9, "bthus": 2, "btis": 2, "bto": 4, "btuin": 2, "btuis": 3, "btuof": 2, "btuto": 2, "bucka": 2, "budda": 2, "budeh": 2, "budi": 2, "budin": 2, "budis": 2, "budof": 3, "buffa": 2, "bugto": 2, "bulli": 8, "bulls": 14, "bumif": 2, "bumit": 2, "bunin": 2, "bunki": 2, "bunsi": 2, "bunwe": 2, "buoya": 2, "buoyd": 4, "burnd": 3, "bursa": 2, "bursi": 3, "busha": 3, "bushi": 2, "busi": 2, "busin": 2, "busor": 2, "busyi": 4, "buta": 445, "butaf": 3, "butah": 4, "butam": 4, "butan": 46, "butas": 329, "butat": 135, "butbe": 42, "butby": 111, "butd": 2, "butde": 4, "butdo": 36, "butdr": 3, "butdy": 2, "buter": 2, "butgo": 26, "buthe": 947, "buti": 1224, "butid": 6, "butif": 390, "butim": 12, "butin": 366, "butis": 58, "butit": 721, "butlo": 6, "butls": 2, "butma": 2, "butme": 15, "butmr": 53, "butmy": 99, "butno": 123, "buto": 9, "butof": 122, "butoh": 12, "buton": 81, "butso": 48, "butth": 2, "butto": 270, "butup": 7, "butus": 3, "butwe": 190, "butye": 98, "buya": 17, "buyan": 3, "buyas": 2, "buyem": 2, "buyin": 2, "buyit": 16, "buyme": 5, "buymy": 4, "buyno": 2, "buyof": 3, "buyon": 2, "buyor": 5, "buysa": 4, "buyso": 2, "buyto": 2, "buyup": 4, "buyus": 4, "buyye": 3, "buzzd": 2, "buzzi": 3, "bwas": 2, "bwe": 2, "bwell": 2, "bwere": 2, "bwfor": 2, "bwhen": 2, "bwith": 2, "bya": 798, "byact": 3, "byaf": 27, "byair": 4, "byaj": 4, "byall": 112, "byam": 3, "byan": 124, "byand": 102, "byany": 151, "byare": 2, "byart": 3, "byas": 7, "byat": 5, "bybc": 2, "byben": 4, "bybig": 2, "bybit": 3, "bybo": 2, "bybob": 3, "bybow": 2, "bybus": 2, "bybut": 9, "byby": 4, "byc": 2, "bycar": 2, "byday": 75, "byde": 2, "bydec": 2, "bydid": 2, "bydoc": 3, "bydr": 11, "bydrs": 4, "bydry": 2, "bydu": 4, "bydue": 2, "bye": 2, "byeat": 2, "byehe": 2, "byei": 5, "byem": 2, "byemy": 8, "byeno": 2, "byeoh": 2, "byeqn": 2, "byeto": 5, "byeve": 3, "byewe": 2, "byexi": 2, "byeye": 2, "byfar": 26, "byfew": 2, "byfig": 2, "byfog": 2, "byfor": 7, "byg": 6, "bygen": 2, "byget": 2, "bygis": 2, "bygod": 45, "bygor": 4, "bygov": 3, "byh": 3, "byhal": 2, "byhe": 21, "byher": 214, "byhim": 139, "byhis": 388, "byhow": 5, "byhw": 2, "byi": 13, "byice": 2, "byif": 2, "byill": 5, "byin": 15, "byis": 5, "byit": 104, "byits": 74, "byj": 4, "byjdh": 2, "byjet": 3, "byjob": 2, "byjoe": 3, "byjon": 2, "byl": 3, "bylaw": 12, "bylay": 2, "byle": 2, "bylen": 2, "byleo": 3, "bylet": 3, "bylog": 2, "bylot": 27, "bylow": 2, "bylt": 2, "bymal": 2, "byman": 19, "bymax": 2, "bymay": 4, "byme": 79, "bymen": 13, "bymid": 3, "bymis": 2, "bymr": 64, "bymrs": 33, "bymy": 108, "byn": 2, "bynbs": 2, "bynet": 2, "bynew": 7, "byno": 120, "bynot": 11, "bynov": 2, "bynow": 28, "byo": 2, "byodd": 2, "byoep": 2, "byof": 4, "byoh": 3, "byoil": 2, "byold": 5, "byon": 7, "byone": 115, "byor": 6, "byour": 45, "bypan": 2, "bypay": 2, "byper": 7, "bypm": 2, "bypq": 2, "byqu": 2, "byr": 3, "byrdp": 2, "byred": 2, "byrev": 3, "byrob": 2, "byrow": 2, "byroy": 2, "byrum": 2, "bys": 2, "bysad": 2, "bysay": 3, "bysba": 2, "bysea": 5, "bysen": 7, "byshe": 7, "bysin": 6, "bysir": 16, "bysix": 4, "bysly": 2, "byso": 23, "byst": 4, "bysun": 2, "byt": 4, "bytax": 3, "byted": 3, "byten": 6, "byth": 5, "bythe": 3605, "bythy": 57, "byto": 26, "bytom": 2, "bytoo": 3, "bytwo": 44, "byus": 24, "byuse": 5, "byv": 2, "byvan": 2, "byw": 5, "bywar": 7, "bywas": 2, "byway": 33, "bywe": 4, "bywho": 5, "bywtv": 2, "byxiv": 2, "byye": 2, "byyou": 41, "cabhe": 4, "cabiv": 2, "cabof": 2, "cabon": 2, "cabso": 2, "cabto": 4, "cadyi": 2, "caesi": 4, "caf": 3, "cafea": 2, "cahas": 2, "caiby": 2, "caii": 2, "cald": 3, "calfa": 4, "calfi": 2, "calfo": 2, "calfs": 4, "calla": 25, "calld": 25, "calli": 7, "callo": 2, "calls": 2, "calma": 2, "calmi": 2, "camea": 84, "camei": 16, "camhe": 2, "campa": 2, "campd": 3, "camst": 2, "can": 2, "cana": 24, "canas": 4, "canat": 10, "canbe": 700, "canby": 4, "cand": 30, "cando": 135, "canea": 3, "cango": 23, "canhe": 31, "cani": 83, "canif": 8, "canin": 11, "canis": 3, "canit": 56, "canme": 2, "canmr": 2, "canmy": 2, "canne": 2, "canno": 12, "canof": 6, "canoh": 2, "canso": 10, "canst": 15, "cant": 301, "canti": 6, "canto": 12, "canwe": 47, "cany": 2, "canye": 11, "capa": 2, "capas": 2, "capat": 7, "capea": 2, "caphe": 2, "capi": 4, "capif": 2, "capin": 2, "capit": 3, "capma": 3, "capmr": 4, "capof": 4, "capon": 2, "capor": 2, "capsi": 2, "capta": 2, "capto": 5, "capup": 2, "capwe": 2, "cara": 4, "caras": 5, "carat": 3, "carby": 4, "care": 5, "carea": 2, "carei": 9, "cares": 2, "carhe": 10, "cari": 9, "carif": 4, "carin": 8, "caris": 10, "carit": 6, "carle": 2, "carlw": 3, "carmy": 2, "carof": 6, "caron": 7, "caror": 3, "cars": 2, "carsa": 3, "carto": 6, "carud": 2, "carwe": 2, "cas": 6, "casea": 10, "casei": 28, "casep": 2, "cases": 5, "casha": 4, "casi": 2, "caska": 3, "caski": 6, "casko": 2, "casmy": 2, "caso": 2, "casof": 2, "cassi": 2, "casta": 26, "casti": 2, "cata": 3, "catas": 2, "catbe": 2, "catdo": 2, "cathe": 2, "cati": 6, "catif": 2, "catin": 3, "catit": 4, "caton": 2, "cator": 5, "catos": 3, "cats": 8, "catso": 2, "catto": 3, "catwe": 2, "caves": 3, "cbach": 2, "cbe": 2, "cburr": 2, "cbut": 6, "cby": 4, "cclub": 2, "ccof": 3, "ccome": 2, "ccone": 2, "cdcis": 2, "cdjob": 2, "cdor": 2, "ceasd": 4, "celli": 2, "centa": 3, "centi": 4, "cerva": 2, "cest": 4, "cfor": 5, "cfrom": 3, "cfst": 2, "cha": 2, "chand": 2, "chapi": 3, "chata": 2, "chefd": 3, "chidi": 2, "chiet": 2, "chiin": 2, "china": 2, "chini": 2, "chipi": 2, "chiva": 2, "chuga": 4, "cif": 3, "cin": 5, "cinbe": 2, "cini": 2, "cino": 2, "cinto": 2, "ciraj": 2, "cis": 9, "cisa": 2, "cit": 2, "citya": 15, "cityb": 2, "cityi": 7, "citys": 9, "cjsis": 2, "cladi": 2, "clapa": 2, "clapt": 3, "clawd": 2, "claya": 2, "clayi": 2, "clays": 10, "clewi": 2, "clito": 2, "cloa": 3, "cloe": 2, "clohe": 2, "cloi": 4, "cloit": 2, "cloof": 2, "closd": 3, "cloyd": 2, "cluba": 4, "clubi": 4, "cmake": 2, "cmand": 6, "cmany": 2, "cmin": 8, "cmis": 2, "cmthe": 2, "coand": 8, "coapd": 2, "coat": 3, "coata": 2, "coati": 2, "coaxa": 2, "cob": 2, "coba": 2, "cocka": 4, "cockd": 2, "cocks": 2, "codor": 3, "cods": 2, "codto": 2, "codya": 2, "coeon": 2, "cof": 12, "cofor": 2, "cohas": 5, "cohe": 2, "coila": 2, "coild": 2, "coin": 2, "coina": 2, "cois": 3, "colda": 3, "coldi": 8, "coldo": 2, "colei": 4, "coles": 13, "colos": 4, "coltd": 2, "colts": 4, "com": 2, "comba": 2, "comea": 23, "comei": 41, "comek": 2, "comeo": 4, "comey": 2, "comst": 6, "comto": 2, "conat": 2, "cond": 2, "connd": 2, "conon": 2, "coof": 5, "cooka": 5, "cookd": 3, "cooki": 2, "cooks": 7, "coold": 3, "cooli": 2, "coon": 2, "coozi": 2, "copin": 3, "copon": 4, "copor": 2, "copto": 2, "copya": 2, "copyi": 2, "cor": 2, "corda": 3, "cordi": 2, "corei": 2, "corna": 2, "corni": 4, "corpa": 2, "cos": 2, "coshe": 2, "costa": 7, "costi": 2, "cosyi": 2, "cothe": 2, "cotin": 3, "coto": 2, "cotor": 2, "cov": 3, "cow": 2, "cowa": 5, "cowat": 2, "cowby": 2, "cowd": 2, "cowhe": 2, "cowi": 3, "cowis": 5, "cowon": 3, "cowor": 5, "cows": 3, "cowsi": 3, "cowto": 3, "coxan": 2, "coxea": 2, "coxhe": 2, "coxi": 3, "coxif": 2, "coxmy": 3, "coxof": 4, "coxs": 4, "craba": 2, "crabi": 2, "cras": 2, "crays": 4, "crazd": 2, "crewa": 2, "crewi": 6, "crews": 4, "cribd": 2, "cropa": 2, "crowi": 2, "crows": 12, "crowx": 2, "crya": 4, "cryan": 2, "cryas": 4, "cryat": 3, "crybe": 2, "cryby": 3, "cryd": 5, "cryde": 2, "crydo": 2, "cryhe": 5, "cryi": 2, "cryid": 2, "cryif": 2, "cryin": 11, "cryis": 7, "cryit": 3, "crymy": 4, "cryno": 4, "cryo": 4, "cryof": 50, "cryoh": 3, "cryor": 2, "cryso": 2, "cryto": 5, "crywe": 2, "cryye": 3, "cset": 2, "csfof": 2, "cshe": 2, "csuch": 2, "ctais": 2, "ctato": 2, "cthe": 6, "cthus": 2, "cto": 6, "cubei": 2, "cubis": 2, "cudhe": 2, "cudit": 2, "cudor": 3, "cueof": 2, "cuffd": 2, "cuffi": 2, "cuft": 7, "culde": 2, "cupan": 2, "cupat": 3, "cupby": 2, "cupi": 2, "cupin": 5, "cupis": 5, "cupit": 2, "cupof": 44, "cupoh": 2, "cupon": 2, "cupso": 2, "cupto": 2, "cupye": 2, "curea": 4, "curei": 2, "curld": 3, "curvd": 5, "cuses": 2, "cuta": 16, "cutan": 2, "cutas": 2, "cutat": 2, "cutby": 11, "cutha": 2, "cuthe": 2, "cutin": 29, "cutit": 46, "cutme": 7, "cutmy": 2, "cutno": 2, "cutof": 8, "cuton": 3, "cutsa": 2, "cutso": 2, "cutto": 14, "cutup": 12, "cutus": 2, "cutwe": 2, "cutye": 2, "cwe": 3, "cwhen": 4, "cwho": 2, "cwill": 2, "cwton": 2, "cynno": 2, "cyou": 2, "daand": 4, "dabof": 4, "dabut": 2, "dadc": 2, "dadhe": 2, "dafe": 2, "dahow": 2, "dall": 14, "daman": 2, "damei": 2, "damg": 2, "damgo": 2, "dami": 3, "damid": 6, "damme": 3, "damnd": 10, "damon": 2, "dan": 2, "dana": 2, "danan": 2, "danas": 2, "danby": 2, "dand": 159, "dande": 2, "danhe": 2, "danis": 2, "danto": 2, "dany": 3, "daor": 2, "darch": 2, "dard": 2, "dardo": 2, "dare": 3, "darea": 3, "darei": 3, "darka": 3, "darki": 8, "darm": 3, "darms": 4, "darst": 5, "dart": 2, "darta": 2, "das": 26, "dashd": 4, "dat": 24, "dataa": 5, "datde": 2, "datdo": 2, "datea": 2, "datei": 4, "datis": 3, "dato": 2, "datop": 2, "datt": 2, "dauk": 2, "davei": 2, "daway": 3, "dawni": 4, "daya": 43, "dayan": 4, "dayas": 45, "dayat": 32, "daybe": 13, "dayby": 32, "daydo": 6, "daygo": 2, "dayhe": 98, "dayi": 85, "dayif": 20, "dayin": 96, "dayis": 57, "dayit": 40, "dayix": 2, "daylo": 2, "daymr": 4, "daymy": 9, "dayno": 6, "dayo": 3, "dayof": 420, "dayoh": 5, "dayon": 22, "dayor": 74, "days": 53, "daysa": 10, "dayse": 2, "daysi": 22, "dayso": 24, "dayto": 101, "dayup": 4, "daywe": 28, "dayye": 17, "dbabe": 2, "dback": 4, "dbad": 2, "dbank": 2, "dbanq": 2, "dbe": 20, "dbeat": 2, "dbeen": 3, "dbent": 2, "dbest": 5, "dblow": 2, "dboat": 2, "dbody": 3, "dboth": 3, "dboy": 3, "dbrew": 2, "dbrig": 2, "dbush": 2, "dbut": 14, "dbuy": 4, "dby": 69, "dca": 2, "dcaes": 2, "dcall": 4, "dcand": 2, "dcarc": 2, "dcare": 2, "dcase": 2, "dcask": 2, "dcdtf": 2, "dcfor": 2, "dcis": 2, "dcity": 2, "dcnew": 2, "dcome": 2, "dcone": 2, "dcor": 2, "dcorn": 4, "dcrib": 2, "dcthe": 2, "dcto": 2, "dcuba": 2, "dcup": 2, "dcut": 2, "dday": 3, "ddead": 3, "ddeep": 2, "ddo": 10, "ddone": 2, "ddown": 2, "ddual": 2, "dduly": 2, "deach": 2, "deada": 7, "deadi": 14, "deado": 2, "deafi": 2, "deala": 3, "deali": 3, "dealo": 2, "deara": 2, "deare": 2, "deari": 34, "deas": 2, "deau": 2, "debta": 2, "deby": 3, "decat": 3, "decii": 2, "decin": 2, "decis": 2, "decit": 2, "decka": 3, "decki": 5, "decp": 2, "dedam": 2, "deedo": 2, "deemd": 2, "deepa": 7, "deepi": 5, "deepo": 4, "def": 2, "defa": 2, "deggs": 2, "degod": 2, "dehis": 2, "deior": 2, "dela": 20, "denby": 2, "dende": 2, "denhe": 3, "denif": 2, "denin": 2, "denof": 15, "densa": 2, "denso": 2, "denwe": 2, "denya": 2, "denyd": 5, "denyt": 2, "des": 2, "desac": 2, "dese": 3, "desey": 2, "deska": 3, "deski": 5, "dest": 5, "deuen": 4, "deve": 2, "dever": 2, "devil": 2, "dewas": 2, "dewbe": 2, "dewhe": 2, "dewin": 3, "dewis": 2, "dewit": 2, "dewmy": 2, "dewo": 2, "dewof": 16, "dewon": 2, "dewor": 2, "dewto": 2, "deydo": 2, "deyes": 3, "deyof": 2, "dfall": 2, "dfame": 3, "dfar": 4, "dfare": 2, "dfarm": 2, "dfast": 2, "dfeel": 2, "dfeet": 3, "dfelt": 2, "dfill": 2, "dfind": 3, "dfire": 2, "dfirm": 2, "dflag": 2, "dfood": 3, "dfor": 41, "dfrom": 30, "dgame": 3, "dgent": 3, "dget": 2, "dginn": 2, "dgive": 7, "dgo": 7, "dgod": 2, "dgone": 2, "dgood": 2, "dguil": 2, "dguns": 3, "dhad": 4, "dhair": 2, "dhalf": 4, "dhalo": 2, "dham": 7, "dhand": 3, "dhath": 2, "dhats": 2, "dhaue": 2, "dhave": 20, "dhe": 11, "dhead": 8, "dhell": 3, "dhelp": 2, "dher": 9, "dhere": 5, "dhill": 2, "dhim": 21, "dhis": 22, "dhow": 8, "dhurt": 2, "dhut": 2, "diade": 2, "dicka": 2, "dicki": 4, "dicks": 4, "dida": 15, "didan": 5, "didas": 30, "didat": 12, "didby": 8, "diddo": 3, "didgo": 3, "didhe": 122, "didi": 109, "didif": 3, "didin": 41, "didis": 3, "didit": 103, "didme": 7, "didmr": 7, "didmy": 15, "didno": 6, "didnt": 181, "didoh": 3, "didon": 8, "didor": 7, "didso": 88, "didst": 17, "didto": 29, "didwe": 13, "didye": 15, "diea": 5, "diean": 2, "dieas": 3, "dieat": 6, "diebe": 2, "dieby": 16, "dieda": 4, "diedi": 5, "diedo": 2, "diehe": 16, "diei": 9, "dieif": 9, "diein": 44, "dieis": 4, "dieit": 7, "dieno": 2, "dieo": 5, "dieof": 12, "dieoh": 2, "dieon": 4, "dieor": 6, "diesi": 2, "dieso": 7, "dieto": 2, "diewe": 5, "dif": 6, "diga": 3, "digd": 2, "diggd": 2, "dighe": 2, "digi": 2, "digin": 3, "digit": 3, "digof": 2, "digsa": 2, "digto": 3, "digup": 3, "diis": 2, "dild": 2, "dima": 2, "dimas": 2, "dimby": 2, "dimin": 2, "dimmd": 2, "dimo": 2, "dimso": 2, "dimto": 2, "din": 86, "dinas": 2, "dinis": 2, "dino": 3, "dinof": 9, "dinto": 3, "dinwe": 2, "dipa": 2, "dipin": 3, "dipit": 3, "dipta": 2, "dirti": 3, "dis": 9, "dishi": 2, "diskb": 2, "diskd": 2, "diske": 2, "dit": 35, "dits": 3, "diuno": 2, "divei": 3, "djack": 2, "djoin": 4, "djoy": 2, "djust": 2, "dking": 2, "dkiss": 3, "dknow": 2, "dlady": 2, "dlaer": 2, "dland": 2, "dlay": 2, "dlee": 3, "dlet": 7, "dlies": 2, "dlife": 2, "dlike": 14, "dlips": 2, "dlog": 2, "dlong": 6, "dlook": 4, "dlord": 4, "dlost": 2, "dloue": 3, "dlove": 6, "dmacb": 4, "dmade": 3, "dmake": 8, "dmal": 6, "dman": 5, "dmany": 3, "dmay": 3, "dme": 41, "dmee": 2, "dmeet": 2, "dmen": 4, "dmind": 2, "dmobs": 2, "dmore": 4, "dmost": 3, "dmrs": 2, "dmuch": 2, "dmur": 2, "dmy": 26, "dname": 2, "dnear": 3, "dneck": 3, "dno": 6, "dnoon": 2, "dnor": 4, "dnot": 16, "dnote": 2, "dnow": 3, "doa": 58, "doaid": 2, "doall": 67, "doan": 2, "doand": 118, "doany": 41, "doare": 2, "doas": 81, "doask": 2, "doat": 15, "dobar": 2, "dobe": 3, "dobeg": 3, "dobru": 4, "dobut": 63, "dobuy": 3, "doby": 7, "docan": 2, "docka": 2, "docno": 2, "docta": 3, "docti": 4, "dodda": 2, "dodo": 10, "dodoa": 3, "doea": 3, "doei": 5, "doeif": 2, "doemy": 2, "doerr": 5, "does": 2, "doesa": 15, "doesi": 11, "doeso": 5, "doet": 2, "doeto": 5, "doewe": 4, "doeye": 2, "dof": 29, "doff": 5, "dofor": 95, "doga": 5, "dogas": 3, "dogby": 2, "doget": 5, "doghe": 6, "dogi": 7, "dogif": 3, "dogin": 7, "dogis": 5, "dogit": 4, "dogno": 2, "dogo": 11, "dogod": 4, "dogof": 2, "dogon": 4, "dogor": 6, "dogr": 2, "dogs": 6, "dogsi": 3, "dogto": 5, "doham": 2, "dohas": 4, "dohe": 35, "doher": 21, "dohes": 2, "dohim": 31, "dohis": 29, "dohow": 11, "doi": 175, "doif": 21, "doill": 3, "doim": 3, "doin": 73, "dois": 28, "doit": 223, "doits": 3, "dold": 6, "doleo": 3, "dolet": 18, "dolie": 3, "dolow": 2, "doma": 2, "doman": 2, "dome": 24, "domei": 2, "domen": 6, "domix": 2, "domr": 12, "domrs": 4, "domy": 29, "don": 39, "donce": 2, "dond": 2, "done": 4, "donea": 16, "donei": 23, "donhe": 2, "donly": 7, "dono": 64, "donor": 2, "donot": 995, "donow": 29, "dont": 831, "donti": 3, "donto": 2, "dooa": 2, "doof": 5, "dooh": 4, "doold": 2, "doomd": 2, "doomi": 2, "doomo": 2, "doon": 9, "doone": 8, "doope": 2, "door": 10, "doora": 10, "doord": 2, "doori": 19, "doors": 3, "dooso": 2, "doot": 9, "doour": 6, "doown": 2, "dopay": 2, "doput": 3, "dor": 19, "dore": 3, "dored": 2, "dorin": 2, "doron": 2, "dorun": 3, "dos": 23, "dosay": 5, "dosee": 5, "doset": 4, "doshe": 20, "dosin": 2, "dosir": 7, "dosit": 2, "dosix": 2, "doso": 131, "dost": 6, "dot": 3, "dotat": 2, "dotea": 2, "doten": 2, "dotha": 8, "dothe": 180, "dothy": 12, "dotin": 4, "doto": 103, "dotof": 4, "dotom": 2, "doton": 4, "dotoo": 5, "dotry": 3, "douer": 2, "dour": 7, "dous": 10, "douse": 3, "dout": 13, "dover": 10, "doves": 2, "dovs": 2, "dowas": 21, "dowe": 52, "dowed": 2, "dowho": 3, "dowhy": 6, "dowid": 2, "downa": 74, "downd": 2, "downi": 12, "downo": 8, "dowor": 2, "doye": 92, "doyes": 4, "doyet": 4, "doyou": 737, "dozei": 2, "dpart": 2, "dpass": 4, "dpell": 2, "dpray": 2, "dput": 2, "dra": 3, "draba": 2, "drace": 4, "draga": 3, "dragd": 2, "drais": 2, "drand": 6, "drawa": 9, "drc": 2, "drear": 2, "dred": 2, "drewa": 17, "drg": 3, "drh": 2, "dri": 2, "drin": 2, "drj": 2, "drn": 2, "drome": 3, "droom": 4, "dropa": 8, "dropb": 2, "drops": 2, "drose": 2, "drp": 2, "drr": 3, "drray": 3, "drsc": 2, "druma": 2, "drun": 2, "drw": 4, "drya": 2, "dryas": 3, "dryhe": 2, "dryif": 2, "dryin": 4, "dryit": 5, "dryme": 2, "dryo": 2, "dryof": 3, "dryon": 2, "dryor": 2, "dryso": 2, "dryto": 4, "dryup": 11, "dsack": 2, "dsafe": 2, "dsage": 2, "dsail": 2, "dsalt": 2, "dsaw": 2, "dsay": 4, "dscum": 2, "dsea": 5, "dsee": 4, "dseen": 3, "dsend": 2, "dsent": 3, "dser": 2, "dset": 2, "dsey": 2, "dshe": 5, "dship": 2, "dshow": 2, "dsing": 3, "dsir": 2, "dsky": 2, "dso": 10, "dsoil": 5, "dsome": 5, "dson": 2, "dsoon": 2, "dsoul": 5, "dsow": 2, "dst": 3, "dsuch": 2, "dsway": 2, "dtake": 5, "dtell": 4, "dtemp": 2, "dtex": 2, "dth": 3, "dthat": 25, "dthe": 127, "dthee": 8, "dthem": 19, "dthen": 7, "dthey": 5, "dthis": 7, "dthou": 4, "dthy": 5, "dtill": 8, "dtime": 2, "dtis": 3, "dto": 90, "dtoo": 8, "dtoth": 2, "dtwas": 2, "dtwo": 2, "ducde": 4, "ducki": 4, "dudsi": 2, "due": 2, "duea": 2, "dueas": 2, "dueat": 3, "dueby": 4, "dueif": 3, "duein": 7, "dueis": 2, "duela": 3, "dueli": 2, "dueno": 3, "dueof": 5, "dueon": 5, "dueor": 2, "dueso": 2, "dueto": 110, "duewe": 2, "duffi": 2, "duga": 2, "dugi": 2, "dugin": 7, "dugto": 2, "dugup": 4, "dukeo": 2, "dukep": 2, "dukes": 8, "dumba": 3, "dumbi": 3, "dumoi": 2, "dup": 15, "dupes": 2, "dupon": 6, "dus": 4, "duse": 2, "duski": 3, "dusta": 2, "dusto": 3, "dutyi": 5, "dvast": 2, "dview": 2, "dvnto": 2, "dvp": 7, "dvpon": 6, "dvs": 2, "dwar": 2, "dward": 5, "dwas": 3, "dwe": 8, "dwell": 4, "dwere": 2, "dwhat": 7, "dwhen": 8, "dwho": 4, "dwhy": 2, "dwide": 2, "dwill": 3, "dwith": 126, "dwolf": 3, "dwomb": 2, "dword": 2, "dyd": 4, "dyde": 6, "dye": 45, "dyear": 3, "dyeby": 2, "dyeda": 2, "dyein": 2, "dyeno": 2, "dyeon": 3, "dyet": 8, "dyeto": 3, "dyewe": 2, "dyou": 26, "dyour": 12, "eacha": 5, "eachi": 4, "eacht": 2, "eand": 10, "eany": 2, "eara": 4, "earas": 6, "earat": 3, "earbe": 5, "earby": 2, "eard": 3, "earea": 2, "eareo": 2, "earhe": 3, "eari": 4, "earin": 6, "earis": 5, "earls": 3, "earmy": 2, "earna": 5, "earnd": 2, "earo": 11, "earof": 20, "earor": 2, "earsa": 2, "earsi": 5, "earso": 4, "earto": 26, "earwe": 3, "easei": 3, "easta": 4, "easti": 2, "easyi": 4, "eata": 12, "eatas": 3, "eatat": 9, "eatby": 3, "eatea": 2, "eathe": 8, "eati": 4, "eatif": 2, "eatin": 15, "eatis": 3, "eatit": 48, "eatma": 2, "eatme": 12, "eatmy": 6, "eatno": 11, "eato": 2, "eatof": 69, "eaton": 2, "eator": 14, "eatso": 4, "eatto": 5, "eatum": 2, "eatup": 19, "eatus": 2, "eatwe": 2, "eatye": 6, "ebbd": 3, "ebbin": 2, "eberl": 2, "ebig": 2, "ebs": 2, "ebut": 2, "ecohn": 2, "ecox": 2, "edam": 2, "edand": 2, "eddow": 2, "edeni": 3, "edens": 2, "edfor": 2, "edgd": 3, "edgei": 2, "edgeo": 2, "edges": 2, "edgre": 2, "edi": 2, "edis": 2, "edita": 2, "edj": 2, "edoh": 2, "edoma": 2, "edthe": 2, "eebe": 2, "eegof": 2, "eehim": 2, "eelin": 2, "eelon": 2, "eeme": 2, "een": 13, "eene": 6, "eer": 6, "eet": 2, "eeven": 2, "eeye": 2, "efish": 3, "efits": 2, "eford": 3, "egdid": 2, "egesn": 2, "egfor": 2, "eggi": 2, "eggin": 2, "eggof": 2, "eggon": 2, "eggor": 2, "eggsi": 3, "eggto": 2, "egif": 2, "egin": 2, "egof": 2, "egois": 2, "egoof": 2, "egthe": 5, "eha": 2, "ehand": 2, "ehare": 2, "ehave": 2, "ehcan": 2, "ehe": 2, "ehere": 2, "ehhe": 2, "ehi": 2, "ehit": 3, "ehla": 2, "ehno": 2, "ehone": 2, "ehour": 2, "ehpip": 2, "ehthe": 2, "ehye": 2, "ein": 5, "eirea": 2, "eis": 3, "eit": 2, "elama": 5, "elee": 2, "elii": 2, "eliin": 2, "elike": 2, "eliof": 2, "elis": 3, "elkhe": 2, "elkin": 2, "elona": 2, "elrev": 2, "elsai": 2, "elsas": 6, "elsea": 7, "elsei": 38, "elseo": 2, "elses": 7, "elwe": 2, "ema": 2, "emaft": 3, "emah": 2, "emall": 3, "emand": 5, "emare": 2, "emaye": 2, "embut": 5, "emdo": 3, "emfor": 4, "emgo": 2, "emhad": 2, "emhe": 3, "emhem": 2, "emhow": 3, "emi": 6, "emif": 2, "emin": 7, "emit": 3, "emlet": 2, "emma": 2, "emmaa": 7, "emmab": 2, "emmai": 33, "emmas": 80, "emmy": 2, "emno": 3, "emnow": 4, "emon": 6, "emor": 2, "emoso": 2, "emout": 6, "emsir": 2, "emso": 2, "emthe": 5, "emtis": 2, "emto": 10, "emup": 5, "emwas": 2, "emwe": 2, "emyou": 3, "enas": 3, "enat": 3, "enda": 17, "endas": 8, "endat": 4, "endbe": 6, "endby": 4, "endhe": 16, "endi": 17, "endif": 7, "endin": 28, "endis": 25, "endit": 21, "endme": 2, "endmy": 6, "endno": 4, "endof": 606, "endoh": 2, "endon": 10, "endor": 5, "endsi": 2, "endso": 6, "endto": 70, "endup": 5, "endus": 3, "endwe": 6, "endye": 2, "ene": 3, "eneso": 3, "enfor": 2, "enin": 2, "ent": 2, "enthe": 2, "enutt": 4, "envya": 2, "eof": 7, "eoh": 2, "eqfor": 2, "eqnaf": 2, "eqnit": 2, "equis": 2, "era": 4, "eraa": 3, "eraas": 2, "eraat": 2, "erai": 2, "eraif": 2, "erain": 3, "erall": 10, "erand": 7, "eraof": 6, "erasa": 2, "eraso": 2, "erbog": 2, "erdo": 2, "erea": 3, "ered": 2, "ereha": 2, "erehe": 12, "erei": 12, "ereit": 7, "eremy": 5, "ereto": 2, "erewe": 6, "ereye": 2, "ergoi": 2, "erhis": 7, "eri": 6, "eris": 2, "erit": 2, "ermen": 2, "ermy": 6, "erour": 2, "errby": 2, "erri": 2, "errin": 7, "errmy": 2, "erron": 2, "errye": 2, "ersea": 2, "erso": 2, "ersof": 2, "erthe": 39, "erus": 2, "eryes": 2, "eryou": 4, "esaid": 3, "esaus": 13, "esims": 2, "eso": 2, "espon": 2, "esqof": 3, "estma": 2, "estor": 2, "etal": 10, "etc": 2, "etca": 4, "etcan": 2, "etcas": 2, "etcb": 2, "etche": 2, "etci": 2, "etcif": 2, "etcin": 3, "etcon": 2, "etcso": 2, "etcto": 2, "etcwe": 2, "etde": 4, "etdu": 2, "ete": 2, "etell": 2, "etfa": 2, "ethat": 3, "ethe": 3, "ethen": 2, "etle": 2, "etona": 2, "etseq": 2, "ettu": 3, "eueri": 4, "evan": 2, "evani": 3, "evans": 12, "evaor": 2, "evea": 2, "eveas": 2, "eveat": 2, "evehe": 5, "evei": 2, "evein": 5, "evena": 105, "evend": 2, "eveni": 32, "eveof": 8, "evera": 12, "everi": 37, "evero": 10, "eveto": 6, "evila": 3, "evili": 7, "evilo": 2, "evn": 2, "ewas": 2, "ewcit": 2, "eweor": 2, "eweye": 2, "ewhat": 2, "ewhen": 2, "ewho": 2, "exex": 2, "exild": 2, "eyea": 8, "eyeas": 10, "eyeat": 12, "eyebe": 5, "eyeby": 4, "eyehe": 14, "eyei": 7, "eyeid": 2, "eyeif": 3, "eyein": 6, "eyeis": 16, "eyeit": 6, "eyemr": 2, "eyemy": 2, "eyeno": 3, "eyeo": 2, "eyeof": 36, "eyeoh": 2, "eyeon": 33, "eyeor": 6, "eyes": 2, "eyesa": 12, "eyesi": 22, "eyeso": 11, "eyeto": 17, "eyewe": 2, "eyo": 2, "eyou": 4, "ezzas": 2, "facd": 5, "facea": 12, "faceg": 2, "facei": 33, "faceo": 2, "facta": 13, "facti": 14, "fadea": 2, "fadei": 2, "fadof": 2, "faild": 9, "faili": 2, "faira": 2, "fairi": 2, "fala": 3, "falla": 6, "falli": 8, "falln": 2, "fallo": 3, "famd": 2, "fana": 2, "fand": 6, "fangd": 4, "fanhe": 2, "fanin": 4, "fanis": 3, "fanit": 2, "fanme": 2, "fannd": 2, "fanof": 3, "fanor": 2, "fany": 2, "fapi": 2, "fara": 2, "faras": 180, "farat": 7, "farbe": 8, "farby": 2, "farhe": 4, "fari": 8, "farif": 4, "farin": 26, "faris": 4, "farit": 12, "farma": 4, "farme": 2, "farmi": 4, "farmo": 2, "farmr": 2, "farmy": 2, "farno": 4, "faro": 2, "farof": 3, "faron": 3, "faror": 9, "farso": 3, "farto": 24, "farup": 5, "farwe": 4, "farye": 2, "fasta": 5, "fasti": 6, "fasto": 3, "fata": 2, "fatas": 5, "fatea": 2, "fathe": 3, "fati": 3, "fatin": 2, "fatis": 3, "fatof": 26, "faton": 2, "fator": 4, "fatso": 2, "fatto": 3, "fatvs": 2, "fawnd": 2, "fayan": 2, "fayld": 3, "fbell": 2, "fcan": 2, "fean": 2, "feand": 2, "feara": 3, "feard": 7, "feari": 15, "fearo": 2, "febat": 2, "febin": 2, "febto": 2, "feda": 4, "fedas": 2, "fedat": 6, "fedby": 5, "fedi": 2, "fedin": 4, "fedit": 2, "fedme": 2, "fedof": 4, "fedon": 3, "fedor": 2, "fedto": 7, "fedup": 2, "feea": 2, "feean": 2, "feeat": 2, "feeda": 3, "feedi": 2, "feehe": 2, "feein": 2, "feela": 32, "feeli": 6, "feeof": 2, "feeor": 2, "feeso": 2, "feeta": 9, "feeti": 9, "feeto": 3, "feg": 2, "fella": 11, "felli": 3, "fello": 2, "felta": 61, "felti": 6, "feon": 2, "fes": 2, "feto": 2, "fewas": 3, "fewat": 3, "fewb": 2, "fewi": 3, "fewif": 8, "fewin": 10, "fewmr": 2, "fewof": 48, "fewon": 3, "fewor": 4, "fewso": 3, "fewto": 3, "fewwe": 2, "fewye": 2, "feyi": 2, "ffig": 2, "fhad": 2, "fhas": 4, "fiea": 2, "fiemy": 2, "fieon": 2, "figa": 2, "figan": 2, "figas": 2, "figif": 2, "figin": 2, "figis": 6, "figit": 2, "figon": 2, "figor": 2, "figp": 2, "figsi": 2, "fild": 2, "filea": 9, "filla": 8, "filld": 36, "filli": 2, "filma": 2, "filmi": 2, "fin": 3, "finda": 93, "findi": 8, "finea": 10, "finee": 2, "finei": 4, "finga": 2, "finin": 4, "finis": 3, "finnd": 2, "finni": 3, "finno": 2, "finns": 4, "finof": 5, "finon": 2, "finor": 2, "finqu": 2, "finsa": 2, "finsi": 4, "finso": 2, "finto": 4, "fird": 2, "firea": 10, "firei": 11, "fireo": 2, "firi": 2, "firma": 3, "firmi": 2, "firmy": 2, "firor": 2, "fis": 4, "fisha": 2, "fishe": 3, "fishi": 5, "fishs": 6, "fisti": 3, "fita": 3, "fitan": 2, "fitas": 2, "fitbe": 2, "fithe": 3, "fiti": 3, "fitif": 2, "fitin": 8, "fitis": 4, "fitit": 2, "fitof": 19, "fitor": 3, "fitsa": 2, "fitso": 3, "fitto": 41, "fitup": 2, "fitvs": 2, "fitwe": 2, "fivei": 3, "fiveo": 5, "fixa": 4, "fixat": 2, "fixd": 8, "fixi": 2, "fixit": 4, "fixme": 2, "fixon": 8, "flagi": 3, "flago": 2, "flait": 2, "flamr": 2, "flata": 4, "flati": 2, "flawi": 2, "fledi": 3, "flee": 2, "flet": 2, "flewo": 3, "flipa": 3, "flowa": 3, "flowi": 5, "fluso": 2, "fluto": 2, "fluxa": 2, "flya": 3, "flyas": 5, "flyat": 2, "flyby": 3, "flyei": 2, "flyhe": 3, "flyif": 2, "flyin": 8, "flyis": 3, "flymy": 2, "flyo": 2, "flyof": 2, "flyon": 3, "flyso": 2, "flyto": 5, "flyup": 7, "flyye": 2, "fmost": 2, "fmust": 2, "fneed": 2, "foamd": 2, "foami": 3, "foamo": 2, "foeas": 5, "foeat": 3, "foeby": 5, "foehe": 3, "foei": 2, "foein": 3, "foeis": 2, "foeit": 2, "foeof": 4, "foeon": 2, "foeor": 2, "foes": 2, "foesa": 2, "foesi": 2, "foeso": 2, "foeto": 6, "fof": 3, "fogas": 2, "fogga": 2, "fogi": 2, "fogin": 3, "fogit": 2, "fogof": 4, "fogon": 3, "foild": 5, "folda": 2, "folkc": 2, "fon": 2, "fooda": 4, "foodi": 3, "foola": 3, "foold": 3, "fooli": 9, "fools": 9, "foota": 2, "footi": 3, "fora": 2064, "foraf": 21, "forai": 2, "foraj": 3, "foral": 2, "foram": 6, "foran": 322, "foras": 120, "forat": 44, "forb": 2, "forbe": 5, "forby": 56, "forcd": 5, "ford": 2, "forda": 2, "fordc": 2, "forde": 3, "fordi": 2, "fordo": 3, "fordr": 2, "fords": 11, "fordu": 4, "forea": 2, "forel": 2, "forem": 2, "forer": 2, "forgd": 2, "forgo": 3, "forhe": 583, "forhr": 7, "fori": 703, "forid": 2, "forif": 109, "forim": 3, "forin": 155, "foris": 7, "forit": 639, "forkd": 2, "forki": 2, "forlo": 29, "forlt": 2, "forma": 39, "formd": 21, "forme": 438, "formi": 2, "formj": 2, "formr": 55, "forms": 2, "formw": 2, "formy": 376, "forn": 2, "forno": 44, "foro": 4, "forof": 35, "foroh": 6, "foron": 20, "foror": 11, "forox": 3, "forpm": 2, "forqu": 2, "fors": 3, "forso": 71, "forst": 4, "fort": 16, "forth": 4, "forto": 124, "forts": 2, "fortv": 2, "forup": 3, "forus": 181, "forvs": 2, "forwe": 159, "forye": 101, "foula": 3, "fould": 2, "foura": 5, "fouri": 10, "fouro": 11, "fowla": 2, "fowls": 2, "foxan": 2, "foxgo": 2, "foxhe": 4, "foxi": 3, "foxis": 3, "foxor": 3, "foxs": 4, "foxso": 3, "foxto": 3, "foxwe": 2, "foyis": 2, "frai": 2, "frani": 2, "fredb": 2, "fredj": 2, "freea": 2, "freei": 3, "freeo": 4, "froa": 2, "froas": 3, "froby": 2, "frof": 2, "frogs": 4, "frohe": 2, "froi": 3, "froin": 7, "from": 3, "froma": 459, "fromc": 4, "frome": 2, "fromi": 6, "fromn": 2, "fromr": 2, "froms": 2, "fromt": 2, "froo": 2, "froof": 3, "froon": 2, "froor": 2, "froto": 4, "frthe": 2, "fryin": 2, "fryit": 2, "fryob": 2, "fryof": 2, "ftare": 2, "ftat": 2, "ftfor": 3, "fthen": 2, "ftims": 2, "ftin": 4, "ftis": 3, "ftof": 2, "fton": 3, "ftthe": 2, "fujii": 2, "fulla": 2, "fulli": 6, "fullo": 2, "funa": 2, "funas": 3, "funat": 3, "funby": 2, "fundo": 2, "funhe": 2, "funin": 2, "funit": 3, "funof": 11, "funor": 2, "funso": 2, "funto": 9, "furat": 2, "furit": 2, "furon": 2, "furya": 2, "furyi": 3, "furyo": 2, "fussi": 2, "fwere": 2, "fwho": 2, "fyemy": 2, "gaat": 2, "gada": 3, "gadat": 2, "gadby": 2, "gadhe": 3, "gadi": 3, "gadto": 2, "gadye": 2, "gagin": 5, "gagof": 2, "gaina": 7, "gaind": 3, "gaing": 2, "gaiti": 2, "gala": 2, "galat": 2, "galea": 3, "galld": 2, "gama": 2, "gamea": 2, "gamei": 6, "games": 3, "gami": 2, "gamwe": 2, "gand": 3, "gangi": 2, "gapif": 2, "gapin": 10, "gapis": 2, "gapno": 2, "gapof": 4, "gapsi": 2, "gapto": 2, "gasa": 2, "gasas": 2, "gasha": 2, "gashd": 3, "gasin": 3, "gasis": 3, "gasit": 3, "gasof": 2, "gasor": 4, "gasto": 4, "gasup": 2, "gaswe": 3, "gatea": 2, "gatei": 3, "gathe": 2, "gatme": 2, "gatno": 2, "gatup": 3, "gaut": 2, "gavea": 66, "gavei": 3, "gavst": 2, "gayas": 6, "gaybe": 2, "gayha": 2, "gayhe": 2, "gayi": 2, "gayin": 3, "gayis": 2, "gayit": 4, "gayor": 3, "gayso": 2, "gayye": 2, "gazas": 2, "gazei": 2, "gazeo": 2, "gbaum": 2, "gbe": 2, "gbeck": 2, "gde": 2, "gemi": 2, "gemof": 3, "genef": 2, "genj": 4, "genti": 3, "geof": 2, "geraa": 4, "geta": 110, "getan": 13, "getas": 5, "getat": 10, "getby": 9, "getem": 7, "geti": 2, "getin": 34, "getis": 3, "getit": 59, "getme": 18, "getmy": 14, "getno": 5, "geton": 21, "getsa": 5, "getso": 7, "getto": 56, "getup": 35, "getus": 7, "gfor": 3, "ghoi": 2, "ghomy": 2, "ghoso": 2, "gifta": 2, "gifti": 2, "gighe": 2, "gigof": 2, "ginco": 4, "ginis": 2, "ginnd": 2, "girla": 4, "girli": 14, "girlo": 2, "girls": 12, "gis": 3, "gitto": 2, "giuea": 3, "giueo": 2, "givea": 79, "givei": 14, "giveo": 2, "glacy": 2, "gladi": 20, "glado": 3, "glazd": 2, "glena": 2, "glenb": 2, "glent": 2, "gmand": 4, "gmbut": 2, "gmby": 2, "gmin": 2, "gmof": 3, "gmon": 2, "gmthe": 2, "gmwas": 2, "gnpdo": 2, "goa": 37, "goaft": 4, "goali": 3, "goall": 8, "goand": 239, "goany": 6, "goas": 19, "goask": 2, "goat": 12, "goats": 2, "gobe": 3, "gobid": 4, "gobof": 2, "gobut": 24, "goby": 35, "gocaw": 2, "gocut": 2, "goda": 12, "godam": 6, "godan": 7, "godas": 40, "godat": 15, "godbe": 39, "godby": 24, "goddo": 14, "godgo": 3, "godhe": 63, "godi": 95, "godif": 23, "godim": 2, "godin": 150, "godis": 189, "godit": 20, "godlo": 3, "godmr": 4, "godmy": 25, "godno": 5, "godo": 21, "godof": 523, "godoh": 2, "godon": 10, "godor": 35, "godr": 2, "gods": 83, "godsi": 3, "godso": 29, "godst": 7, "godto": 108, "godwe": 32, "godye": 31, "goeat": 2, "goein": 2, "goemy": 2, "goeno": 2, "goeon": 3, "goesa": 5, "goeso": 2, "goeto": 5, "gof": 4, "gofar": 10, "gofor": 45, "goga": 2, "goget": 9, "gogo": 9, "gohe": 15, "goher": 4, "gohis": 6, "gohow": 3, "goi": 35, "goif": 5, "goill": 2, "goin": 129, "goina": 2, "gois": 4, "goit": 9, "goits": 2, "gojem": 3, "golda": 3, "goldi": 7, "golet": 5, "golie": 2, "golo": 2, "gomad": 4, "goman": 2, "gomen": 2, "gomr": 2, "gomrs": 2, "gomy": 12, "gon": 2, "gonea": 17, "gonei": 14, "goneo": 2, "gono": 20, "gonor": 3, "gonot": 35, "gonow": 12, "goo": 2, "gooda": 34, "goodi": 24, "goodl": 2, "goodo": 2, "goof": 6, "gooff": 13, "gooh": 3, "goon": 147, "goone": 2, "goor": 3, "goore": 2, "goout": 151, "gopis": 2, "gopop": 2, "goqu": 2, "gorea": 2, "gosay": 4, "gosee": 8, "goset": 2, "goshe": 5, "goshi": 3, "gosir": 2, "gosit": 3, "goso": 17, "gost": 2, "gota": 101, "gotan": 5, "gotas": 5, "gotby": 4, "gotdr": 2, "gotem": 2, "gothe": 38, "gothy": 22, "goti": 4, "gotin": 19, "gotis": 2, "gotit": 35, "gotme": 2, "gotmy": 9, "gotno": 12, "goto": 410, "goton": 18, "gotoo": 15, "gotso": 12, "gotst": 2, "gotto": 116, "gotup": 58, "gotus": 4, "gotwo": 2, "goup": 177, "gouse": 2, "govp": 4, "gowas": 2, "goway": 3, "gowe": 8, "gowho": 3, "gowhy": 4, "gowna": 2, "gownd": 2, "gowni": 5, "gowon": 3, "goye": 46, "goyes": 2, "goyet": 6, "goyou": 11, "gpmen": 2, "graba": 6, "gracd": 2, "grasi": 2, "grayd": 2, "grayj": 2, "grays": 7, "greis": 2, "grewa": 2, "greya": 2, "greyi": 7, "greys": 15, "grima": 2, "grina": 2, "grini": 2, "gripi": 2, "groki": 2, "gropd": 2, "growa": 3, "growi": 3, "grr": 4, "grugd": 2, "gsuch": 2, "gtby": 2, "gthe": 2, "gtin": 2, "gulfa": 2, "gumis": 4, "guna": 3, "gunas": 3, "gunat": 2, "gunby": 2, "gunhe": 7, "guni": 3, "gunin": 9, "gunon": 4, "gunor": 6, "gunsa": 2, "gunso": 3, "gunto": 9, "gunwe": 2, "gusis": 2, "gutit": 2, "guyat": 3, "guyde": 2, "guyhe": 4, "guyif": 2, "guyin": 4, "guyis": 2, "guyit": 2, "guyon": 2, "guysa": 2, "guysi": 2, "haa": 4, "haand": 3, "haare": 2, "haas": 2, "haboy": 3, "habut": 3, "hada": 627, "hadah": 2, "hadan": 82, "hadas": 23, "hadat": 50, "hadbe": 2, "hadby": 18, "haddr": 2, "hadhe": 97, "hadi": 61, "hadin": 96, "hadis": 3, "hadit": 76, "hadme": 4, "hadmr": 7, "hadmy": 25, "hadne": 2, "hadno": 396, "hadnt": 28, "hadof": 23, "hadoh": 2, "hadon": 25, "hador": 3, "hadso": 61, "hadst": 6, "hadto": 422, "hadus": 2, "hadwe": 7, "hadye": 3, "hage": 2, "haha": 53, "hahad": 2, "hahe": 7, "hahem": 2, "hahey": 2, "hahor": 2, "hahow": 2, "hahum": 2, "hai": 3, "haild": 2, "haili": 2, "hailo": 2, "haint": 2, "haion": 2, "haira": 5, "haird": 3, "hairi": 5, "hairo": 3, "hais": 3, "hakes": 2, "hala": 3, "halas": 5, "halb": 2, "halfa": 147, "halhe": 2, "hali": 3, "halin": 3, "halis": 2, "halla": 4, "hallf": 2, "halli": 4, "halls": 2, "halno": 2, "haloh": 2, "hals": 11, "halta": 3, "halto": 5, "hama": 8, "hamah": 2, "hamam": 2, "haman": 2, "hamas": 3, "hamat": 2, "hambe": 2, "hamby": 2, "hamdo": 7, "hamgo": 2, "hamha": 3, "hamhe": 8, "hami": 43, "hamif": 5, "hamin": 4, "hamis": 5, "hamit": 9, "hamme": 2, "hammy": 4, "hamno": 10, "hamo": 7, "hamod": 2, "hamof": 2, "hamoh": 11, "hamon": 2, "hamor": 3, "hamrs": 2, "hamso": 5, "hamto": 4, "hamvp": 2, "hamwe": 3, "hamy": 2, "hand": 8, "handa": 32, "handi": 51, "hando": 8, "hands": 5, "hanga": 5, "hangd": 5, "hano": 2, "hanof": 3, "hanot": 2, "hao": 3, "haold": 2, "hapip": 2, "hapof": 2, "hapto": 3, "harda": 3, "hardi": 9, "harei": 2, "hares": 2, "harka": 2, "harke": 2, "harki": 2, "harma": 2, "harmd": 2, "harmi": 2, "harms": 3, "harpd": 2, "harpi": 3, "harpo": 2, "harta": 2, "harwe": 2, "has": 35, "hasa": 226, "hasan": 34, "hasas": 12, "hasat": 9, "hasde": 3, "hasdo": 2, "hashe": 31, "hasi": 3, "hasin": 13, "hasis": 2, "hasit": 23, "hask": 2, "hasme": 2, "hasmr": 3, "hasmy": 4, "hasno": 91, "hasnt": 13, "hasof": 4, "hason": 3, "hasph": 2, "hasso": 13, "hasta": 10, "hasto": 92, "hasus": 3, "haswe": 2, "hasye": 2, "hat": 3, "hata": 7, "hatas": 5, "hatat": 4, "hatby": 2, "hatdo": 2, "hatea": 2, "hatec": 2, "hatei": 2, "hates": 2, "hatha": 52, "hathe": 9, "hati": 5, "hatif": 3, "hatin": 4, "hatis": 6, "hatit": 6, "hatma": 2, "hatmr": 2, "hatmy": 2, "hatof": 4, "haton": 10, "hator": 4, "hatsi": 2, "hatto": 8, "hatwe": 2, "hauea": 17, "hauei": 20, "haueo": 2, "hauet": 2, "haula": 2, "hauld": 2, "havea": 591, "havei": 311, "haven": 2, "haveo": 3, "havn": 6, "hawe": 2, "hawho": 4, "hawhy": 3, "hawks": 4, "hayin": 2, "hayis": 2, "hayld": 2, "hayof": 2, "hayor": 2, "hayou": 2, "hayto": 2, "hcan": 2, "hdent": 2, "hdodd": 2, "hea": 24, "heada": 31, "headi": 36, "heado": 3, "heads": 4, "heain": 5, "heala": 2, "heall": 7, "hean": 3, "heand": 220, "heany": 4, "heapd": 6, "heara": 29, "heare": 3, "heari": 15, "hearo": 19, "heas": 27, "heask": 5, "heat": 32, "heate": 17, "heati": 2, "heaun": 3, "heavd": 2, "hebad": 3, "hebe": 115, "hebeg": 2, "hebid": 3, "hebin": 2, "hebit": 5, "hebut": 24, "hebuy": 2, "heby": 9, "hecan": 169, "hecap": 2, "heco": 2, "hecry": 3, "hecut": 17, "hed": 32, "hedbe": 5, "hedid": 640, "hedie": 31, "hedo": 27, "hedoe": 3, "hedon": 8, "hedy": 2, "heeat": 10, "heeda": 2, "heedy": 2, "heei": 2, "heeis": 3, "heel": 3, "heere": 3, "hees": 12, "hefan": 3, "hefed": 5, "hefor": 17, "hegat": 2, "heget": 6, "hego": 15, "hegod": 3, "hegot": 100, "heha": 9, "hehad": 2854, "heham": 2, "hehas": 526, "hehe": 21, "heher": 5, "hehid": 8, "hehim": 6, "hehis": 33, "hehit": 14, "hehow": 2, "hei": 44, "heif": 4, "hein": 68, "heira": 2, "heis": 1242, "heisn": 13, "heit": 32, "helay": 34, "helda": 20, "heled": 28, "helet": 43, "heli": 2, "helie": 2, "helit": 3, "hell": 67, "hella": 2, "helli": 10, "hello": 3, "hells": 10, "helma": 3, "helmi": 2, "helo": 2, "helov": 3, "helpa": 6, "helpd": 5, "helpi": 9, "helpo": 3, "hemad": 3, "heman": 3, "hemay": 236, "heme": 8, "hemet": 25, "hemi": 2, "hemmd": 6, "hemof": 13, "hemr": 2, "hemy": 3, "hena": 2, "henhe": 2, "heni": 8, "henin": 3, "henit": 2, "henma": 2, "henmy": 2, "heno": 21, "henof": 4, "henoh": 2, "henon": 2, "henor": 4, "henot": 94, "henow": 56, "hens": 8, "henso": 2, "hento": 3, "heo": 3, "heof": 23, "heoft": 3, "heoh": 3, "heon": 7, "heone": 6, "heor": 22, "heour": 3, "heout": 5, "heow": 2, "hepay": 2, "heput": 149, "hera": 124, "herah": 2, "heran": 98, "heras": 142, "herat": 80, "heray": 2, "herbe": 17, "herbi": 2, "herby": 52, "herdo": 9, "here": 2, "herea": 36, "hereh": 2, "herei": 105, "herem": 2, "hereo": 2, "herep": 2, "heres": 86, "hergo": 14, "herhe": 72, "herho": 2, "heri": 67, "herid": 2, "herif": 39, "herim": 2, "herin": 193, "heris": 13, "herit": 46, "herla": 2, "herma": 2, "hermr": 11, "hermy": 19, "herno": 26, "hero": 3, "heroa": 3, "herof": 45, "heroh": 10, "heroi": 4, "heron": 51, "heror": 17, "heros": 4, "herot": 2, "hers": 18, "hersi": 2, "herso": 56, "herss": 2, "herst": 2, "herto": 391, "herun": 2, "herup": 40, "hervp": 3, "herwe": 10, "herye": 2, "hes": 206, "hesa": 13, "hesan": 3, "hesas": 2, "hesat": 100, "hesaw": 357, "hesay": 13, "hesee": 12, "heset": 78, "hesha": 2, "heshe": 3, "hesi": 2, "hesin": 4, "hesir": 3, "hesit": 2, "hesmy": 2, "heso": 25, "hesso": 2, "heten": 2, "hethe": 52, "hethy": 2, "heto": 91, "hetoo": 29, "hetry": 2, "hetuk": 3, "heup": 4, "heus": 2, "hevas": 2, "hewas": 3131, "hewd": 2, "hewe": 9, "hewho": 69, "hewhy": 3, "hewin": 2, "hewme": 2, "hewod": 2, "hewof": 2, "hewon": 20, "hewye": 2, "hexon": 2, "heyat": 2, "heye": 4, "heyes": 4, "heyet": 23, "heygo": 2, "heyi": 2, "heymr": 2, "heymy": 3, "heyou": 10, "hfay": 2, "hhe": 2, "hida": 2, "hidan": 2, "hidas": 3, "hidby": 2, "hidea": 5, "hidhe": 2, "hidi": 5, "hidin": 23, "hidis": 2, "hidit": 9, "hidme": 4, "hidmy": 4, "hidof": 2, "hidto": 2, "higha": 7, "highi": 13, "higho": 3, "hijay": 2, "hilla": 5, "hilli": 6, "hillo": 2, "hills": 2, "hima": 347, "himah": 3, "himam": 2, "himan": 48, "himas": 294, "himat": 145, "himay": 4, "himbe": 48, "himby": 158, "himdo": 37, "himgo": 77, "himha": 2, "himhe": 407, "himho": 2, "himi": 242, "himif": 112, "himim": 5, "himin": 540, "himis": 46, "himit": 99, "himla": 2, "himlo": 7, "himma": 3, "himme": 4, "himmr": 17, "himmy": 44, "himno": 54, "himo": 13, "himof": 128, "himoh": 20, "himol": 2, "himon": 128, "himor": 78, "himpa": 2, "himso": 127, "himst": 2, "himt": 2, "himto": 875, "himup": 131, "himwe": 52, "himye": 10, "hin": 2, "hinan": 2, "hinof": 16, "hinso": 2, "hinti": 3, "hinto": 2, "hioh": 2, "hiphe": 2, "hipof": 4, "hipon": 2, "hippd": 3, "hipwe": 2, "hirea": 6, "his": 3, "hisa": 4, "hisah": 2, "hisas": 9, "hisat": 4, "hisba": 2, "hisby": 2, "hisco": 2, "hisdo": 2, "hisha": 2, "hishe": 11, "hisi": 11, "hisif": 4, "hisin": 5, "hisis": 6, "hisit": 7, "hismr": 2, "hisno": 3, "hiso": 2, "hisof": 2, "hison": 4, "hisor": 16, "hisox": 7, "hisso": 4, "histh": 5, "histi": 2, "histo": 10, "hisun": 2, "hisv": 2, "hiswe": 3, "hisx": 2, "hita": 17, "hitas": 2, "hitat": 2, "hitby": 8, "hithe": 3, "hitif": 2, "hitin": 4, "hitit": 4, "hitme": 5, "hito": 2, "hiton": 2, "hitor": 3, "hitsa": 2, "hivei": 2, "hlong": 3, "hmno": 2, "hoall": 2, "hoand": 3, "hoboy": 2, "hobru": 3, "hodo": 2, "hoea": 2, "hoeda": 2, "hoei": 2, "hoein": 2, "hoga": 2, "hogas": 2, "hogs": 3, "hohad": 2, "hoho": 10, "hoi": 2, "holda": 29, "holdi": 2, "holdo": 3, "holea": 5, "holes": 2, "holya": 2, "holyi": 2, "holyo": 3, "homea": 11, "homei": 25, "homy": 2, "honhe": 2, "honow": 2, "hoods": 3, "hoofd": 2, "hookd": 4, "hooki": 3, "hoopd": 2, "hoor": 2, "hoowa": 2, "hopat": 2, "hopd": 2, "hopea": 4, "hopei": 39, "hopeo": 3, "hopes": 3, "hopin": 2, "hora": 4, "horai": 2, "horao": 2, "horas": 3, "horat": 2, "horbe": 2, "horby": 3, "hordo": 2, "hore": 3, "horhe": 2, "hori": 8, "horif": 2, "horin": 4, "horit": 7, "hormy": 5, "horna": 2, "horni": 2, "horno": 3, "horo": 2, "horof": 2, "horoh": 3, "horsd": 2, "horso": 3, "horye": 2, "hos": 5, "hoso": 2, "hosta": 2, "hosti": 2, "hota": 3, "hotas": 5, "hotat": 3, "hotbe": 2, "hothe": 5, "hoti": 4, "hotin": 3, "hotit": 2, "hoton": 2, "hotso": 4, "hotto": 3, "hotye": 2, "houra": 9, "houre": 2, "houri": 19, "houro": 2, "hours": 15, "howa": 8, "howam": 11, "howan": 4, "howas": 3, "howat": 5, "howbe": 2, "howby": 3, "howd": 11, "howdo": 82, "howhe": 143, "howi": 86, "howif": 3, "howim": 2, "howin": 14, "howis": 68, "howit": 104, "howj": 2, "howld": 2, "howli": 2, "howlo": 5, "howma": 2, "howmr": 8, "howmy": 8, "howof": 5, "howon": 7, "howor": 4, "hows": 5, "howso": 5, "howto": 226, "howwe": 31, "howya": 2, "howye": 9, "hpthe": 2, "hra": 2, "hrand": 2, "hrat": 2, "hrhp": 3, "hrin": 2, "hth": 2, "hthe": 5, "hthus": 2, "hubbd": 2, "huea": 2, "hueas": 2, "hueby": 2, "huein": 2, "hueis": 2, "hueit": 3, "hueof": 3, "hueto": 2, "hugea": 2, "huggd": 2, "hughg": 2, "hughl": 2, "hughs": 2, "hugi": 2, "hugme": 2, "hugof": 2, "huhhe": 2, "huhit": 2, "huhwe": 2, "hulld": 2, "hulls": 2, "huma": 2, "humhi": 2, "humi": 2, "humof": 13, "hunga": 7, "hungo": 2, "huni": 2, "hunin": 2, "hunta": 2, "hurin": 2, "hurof": 4, "hurta": 6, "hurti": 4, "hushd": 4, "husko": 2, "huthe": 2, "hutin": 2, "huto": 2, "hutof": 3, "hutor": 2, "hutsa": 2, "hutsi": 2, "hutto": 3, "hwere": 2, "hwhen": 2, "hymna": 3, "hyrd": 2, "iabed": 2, "iable": 3, "iact": 3, "iad": 2, "iadd": 4, "iah": 7, "iaim": 3, "iain": 3, "iaint": 12, "iall": 7, "ialso": 68, "iam": 2653, "ian": 4, "iand": 112, "ianne": 3, "ianto": 2, "iany": 6, "iare": 17, "iarst": 2, "ias": 18, "iask": 60, "iaske": 2, "iat": 21, "iate": 5, "iay": 2, "ibare": 5, "ibase": 2, "ibe": 88, "ibear": 17, "ibeat": 7, "ibeen": 28, "ibeg": 59, "ibend": 4, "ibent": 3, "ibest": 2, "ibet": 6, "ibid": 13, "ibill": 2, "ibind": 3, "iblew": 3, "iblot": 2, "iblow": 5, "iborn": 2, "iboth": 4, "ibow": 5, "ibrag": 2, "ibred": 2, "ibum": 2, "ibuoy": 2, "iburn": 3, "iburs": 2, "ibury": 4, "ibut": 42, "ibuy": 3, "iby": 10, "ical": 2, "icall": 55, "icame": 146, "ican": 640, "icant": 48, "icare": 19, "icase": 2, "icast": 18, "iccto": 2, "icea": 2, "iceas": 5, "iceby": 2, "icedo": 2, "icei": 3, "iceif": 2, "icein": 6, "iceis": 3, "iceit": 2, "iceof": 3, "iceon": 3, "iceor": 2, "iceto": 2, "ichi": 2, "icite": 2, "icn": 2, "icome": 125, "iconn": 2, "icook": 3, "icry": 19, "icut": 19, "icyit": 2, "idab": 2, "idala": 2, "idam": 2, "idand": 2, "idare": 139, "idbe": 4, "iddo": 4, "ide": 2, "ideaa": 5, "ideai": 6, "ideal": 2, "ideck": 2, "ideem": 2, "idefy": 10, "ideny": 10, "idget": 2, "idhad": 6, "idid": 325, "ididn": 40, "idie": 30, "idied": 4, "idig": 2, "idive": 2, "idlet": 2, "idmet": 3, "idnot": 2, "ido": 775, "idoe": 16, "idoes": 3, "idoin": 2, "idoli": 2, "idols": 2, "idon": 324, "idone": 28, "idont": 163, "idost": 2, "idote": 2, "idown": 3, "idr": 2, "idrag": 2, "idraw": 8, "idrew": 12, "idrop": 2, "idrun": 2, "idry": 3, "idsat": 2, "idsay": 4, "idug": 4, "iduly": 2, "idust": 2, "idwin": 2, "idwop": 2, "idye": 2, "iea": 2, "ieaf": 5, "iean": 2, "iear": 2, "iearn": 2, "ieas": 2, "ieat": 16, "ieate": 2, "iebb": 3, "ieber": 2, "ieby": 3, "iefor": 2, "iehis": 2, "iein": 2, "ieit": 2, "ielse": 2, "iemit": 2, "iemma": 4, "iend": 5, "ienot": 2, "ienvy": 3, "iere": 2, "ieshe": 2, "iethe": 6, "ieto": 3, "ieven": 28, "iever": 78, "ievil": 2, "ifa": 235, "iface": 2, "ifade": 4, "ifaf": 17, "ifage": 2, "ifail": 3, "ifair": 2, "ifall": 40, "ifan": 13, "ifand": 7, "ifany": 172, "ifarm": 2, "ifart": 4, "ifas": 10, "ifast": 3, "ifat": 19, "ifaz": 2, "ifbut": 4, "ifby": 34, "ifd": 2, "ifdie": 2, "ifdo": 2, "ifdr": 2, "ife": 2, "ifear": 65, "ifed": 6, "ifeed": 3, "ifeel": 91, "ifell": 23, "ifelt": 113, "iff": 4, "iffar": 2, "iffor": 13, "ifgod": 21, "ifhal": 2, "ifhe": 731, "ifhed": 4, "ifhee": 2, "ifher": 28, "ifhes": 3, "ifhim": 2, "ifhis": 52, "ifi": 665, "ifid": 9, "ifif": 2, "ifil": 2, "ifill": 7, "ifin": 41, "ifind": 73, "ifis": 2, "ifit": 508, "ifits": 11, "ifjoe": 2, "ifled": 12, "iflee": 5, "iflet": 3, "iflew": 3, "iflit": 3, "iflow": 2, "ifly": 10, "iflye": 2, "ifman": 4, "ifmen": 5, "ifmr": 18, "ifmrs": 15, "ifmy": 35, "ifn": 3, "ifno": 17, "ifnot": 132, "ifnow": 12, "ifof": 4, "ifold": 5, "ifon": 8, "ifone": 79, "ifor": 20, "iform": 3, "ifour": 24, "ifout": 3, "ifpa": 2, "ifpam": 2, "ifpat": 2, "ifred": 2, "ifrom": 9, "ifsay": 2, "ifsex": 2, "ifshe": 222, "ifsin": 2, "ifsir": 3, "ifso": 48, "ifst": 2, "ift": 9, "ifth": 3, "ifthe": 623, "ifthy": 33, "ifto": 58, "iftoo": 2, "iftwo": 7, "ifull": 2, "ifw": 2, "ifwar": 4, "ifwe": 294, "ifwed": 2, "ifwee": 2, "ifya": 3, "ifye": 183, "ifyou": 869, "igall": 2, "igat": 2, "igaue": 2, "igave": 84, "iget": 37, "igiue": 4, "igive": 158, "igo": 137, "igod": 3, "igoe": 3, "igoes": 3, "igone": 2, "igood": 2, "igot": 80, "igrew": 6, "igrin": 3, "igrok": 2, "igrow": 8, "iha": 5, "ihad": 771, "ihadn": 8, "ihalt": 2, "ihang": 3, "ihate": 54, "ihaue": 131, "ihave": 2604, "ihe": 13, "iheal": 2, "ihear": 158, "iheed": 3, "iheld": 12, "ihelp": 14, "iher": 2, "ihere": 9, "ihid": 8, "ihide": 3, "ihim": 4, "ihis": 3, "ihit": 5, "ihold": 30, "ihop": 2, "ihope": 296, "ihow": 5, "ihowl": 2, "ihung": 2, "ihunt": 3, "ihurt": 3, "iia": 5, "iichi": 2, "iidly": 2, "iiev": 2, "iif": 12, "iihad": 2, "iiia": 3, "iiimr": 2, "iiin": 2, "iim": 2, "iimr": 2, "iin": 42, "iino": 2, "iinto": 2, "iio": 2, "iis": 4, "iit": 12, "iithe": 9, "iive": 2, "ijews": 2, "ijist": 4, "ijohn": 12, "ijoin": 4, "ijoke": 2, "ijoy": 2, "ijump": 3, "ijust": 34, "ikeep": 20, "iken": 2, "ikept": 32, "ikill": 9, "iking": 3, "ikiss": 4, "iklea": 2, "iknew": 183, "iknow": 830, "ilack": 2, "ilady": 2, "ilag": 2, "ilaid": 10, "ilast": 2, "ilay": 36, "ild": 3, "ilead": 6, "ilean": 6, "ileap": 3, "ilebe": 6, "iled": 2, "iledo": 2, "ileft": 30, "ilego": 2, "ilend": 2, "ilene": 2, "ileno": 2, "ilent": 3, "iless": 4, "ilest": 2, "ilet": 20, "ileto": 3, "ilie": 16, "ilied": 2, "ilift": 10, "ilike": 86, "ilist": 3, "iliue": 2, "ilive": 61, "ill": 386, "illa": 3, "illas": 2, "illat": 8, "illbe": 24, "illby": 2, "illdo": 6, "illgo": 7, "illhe": 2, "illi": 12, "illif": 2, "illin": 10, "illit": 3, "illlo": 2, "illmr": 2, "illof": 13, "illor": 4, "illsa": 2, "illso": 6, "illto": 7, "ilo": 5, "iloaf": 2, "ilong": 9, "ilook": 41, "ilord": 2, "ilose": 6, "ilost": 14, "ilou": 6, "iloue": 9, "ilove": 125, "ilull": 2, "ilye": 3, "ima": 13, "imacb": 2, "imade": 97, "imake": 93, "imall": 5, "iman": 4, "imar": 4, "imark": 15, "imay": 312, "imbig": 2, "imdan": 2, "ime": 2, "imean": 180, "imeet": 19, "imet": 25, "imin": 6, "imind": 4, "imine": 4, "imiss": 5, "imix": 2, "immad": 3, "immrs": 2, "imno": 3, "imnot": 39, "imon": 3, "imone": 2, "imore": 9, "imost": 3, "imout": 3, "imove": 7, "impof": 2, "imr": 4, "imrs": 2, "imset": 2, "imso": 4, "imthe": 2, "imto": 4, "imuch": 2, "imuse": 4, "imust": 377, "imy": 40, "ina": 3490, "inact": 3, "inad": 4, "inaf": 27, "inage": 11, "inai": 3, "inaid": 8, "inail": 2, "inair": 15, "inaj": 3, "inall": 734, "inam": 2, "iname": 4, "inan": 481, "inand": 346, "inany": 294, "inar": 2, "inare": 3, "inarm": 9, "inart": 11, "inas": 36, "inasw": 2, "inat": 75, "inawe": 11, "inaye": 2, "inb": 3, "inbad": 11, "inbc": 5, "inbed": 43, "inbig": 4, "inbio": 2, "inbow": 2, "inbut": 37, "inbw": 2, "inby": 50, "inc": 2, "inca": 3, "incap": 2, "incha": 2, "inchi": 2, "incis": 2, "incof": 3, "incut": 2, "indan": 5, "inde": 3, "indel": 2, "indid": 2, "indim": 3, "indo": 4, "indoc": 2, "indon": 2, "indor": 2, "indr": 4, "indry": 2, "indu": 3, "indue": 31, "ine": 4, "ineed": 35, "ineqn": 2, "inext": 3, "inf": 2, "infar": 5, "infat": 2, "infbi": 2, "infee": 3, "infew": 6, "infig": 31, "infit": 2, "infor": 74, "infox": 2, "infun": 2, "inga": 2, "ingas": 3, "ingay": 4, "ingme": 2, "ingo": 3, "ingoa": 2, "ingob": 2, "ingod": 56, "inhad": 5, "inhal": 2, "inham": 3, "inhas": 5, "inhe": 51, "inher": 722, "inhes": 2, "inhim": 292, "inhis": 2386, "inhot": 8, "inhow": 12, "inhue": 4, "inhys": 2, "ini": 42, "inice": 7, "inif": 10, "inill": 5, "inim": 3, "inin": 37, "inis": 13, "init": 382, "inits": 308, "inj": 2, "injim": 2, "injob": 2, "injoy": 10, "ink": 2, "inkhe": 2, "inkin": 2, "inkit": 3, "inkso": 2, "inla": 2, "inlas": 3, "inlaw": 136, "inlid": 2, "inlog": 2, "inlos": 13, "inlow": 7, "inm": 2, "inmae": 2, "inman": 39, "inmay": 19, "inme": 159, "inmea": 2, "inmen": 9, "inmg": 3, "inmid": 16, "inml": 2, "inmob": 2, "inmr": 41, "inmrs": 32, "inmt": 2, "inmud": 2, "inmy": 743, "inmyn": 2, "inn": 5, "innan": 2, "innas": 3, "innat": 9, "innet": 3, "innew": 111, "innhe": 3, "inni": 2, "innin": 2, "innis": 2, "innmy": 2, "inno": 87, "innob": 2, "innof": 2, "innoh": 2, "innon": 2, "innor": 5, "innot": 17, "innow": 11, "innto": 3, "ino": 18, "inod": 5, "inodd": 2, "inof": 33, "inoff": 2, "inoh": 3, "inoil": 9, "inold": 35, "inon": 53, "inone": 365, "inor": 30, "inorb": 2, "inoso": 2, "inot": 103, "inote": 5, "inour": 294, "inout": 5, "inova": 2, "inow": 73, "inp": 2, "inpan": 2, "inpay": 2, "inpbs": 2, "inper": 3, "inpol": 2, "input": 3, "inr": 2, "inre": 2, "inred": 13, "inrow": 2, "ins": 8, "insad": 4, "insag": 2, "insam": 2, "insan": 13, "insaw": 3, "insay": 3, "insba": 3, "insea": 5, "inset": 3, "insex": 5, "inshe": 20, "insin": 7, "insir": 3, "insix": 16, "insky": 2, "inso": 60, "insr": 2, "insrs": 2, "inst": 18, "insum": 4, "insun": 3, "int": 20, "intar": 2, "inten": 21, "inth": 8, "inthe": 16389, "inthy": 322, "intin": 2, "into": 122, "intoa": 570, "intoi": 2, "intoo": 13, "intop": 10, "intow": 3, "intry": 2, "intwo": 92, "inu": 2, "inugf": 2, "inup": 2, "inur": 2, "inus": 33, "inuse": 20, "inuts": 2, "inv": 3, "invan": 2, "invs": 2, "invse": 2, "inwar": 13, "inwas": 18, "inwax": 4, "inway": 2, "inwe": 10, "inwet": 2, "inwho": 7, "inwhy": 3, "inwid": 2, "inwoe": 6, "inwtv": 2, "inye": 9, "inyea": 2, "inyet": 5, "inyon": 4, "inyou": 110, "inze": 2, "inzen": 3, "iobey": 4, "iof": 14, "ioft": 4, "ioh": 3, "iohna": 2, "iold": 2, "iomit": 2, "ion": 5, "ionce": 24, "ione": 3, "ionis": 2, "ionly": 72, "ionse": 2, "ionto": 2, "iopen": 4, "iophe": 2, "ior": 13, "iour": 3, "iout": 2, "iowe": 12, "iowed": 6, "iown": 9, "ioynd": 3, "ioyo": 2, "ioyto": 2, "ipaid": 5, "ipapa": 2, "ipart": 4, "ipass": 33, "ipaul": 7, "ipaus": 2, "ipay": 6, "ipeep": 2, "ipeer": 2, "ipick": 2, "ipine": 2, "ipit": 2, "ipity": 3, "iplan": 2, "iplay": 6, "iply": 2, "ipour": 4, "iprai": 2, "ipray": 245, "ipry": 2, "ipull": 4, "ipush": 2, "iput": 69, "iqfor": 2, "iqof": 5, "iquit": 3, "iraan": 2, "iran": 13, "irand": 2, "irate": 3, "ire": 3, "iread": 24, "ireap": 2, "ireby": 2, "ireck": 2, "irent": 2, "ireof": 2, "ireor": 3, "irest": 2, "irich": 2, "iride": 3, "iring": 2, "irise": 5, "iroam": 3, "irode": 5, "iroll": 3, "irona": 2, "ironi": 5, "irory": 2, "irose": 8, "irot": 2, "irow": 2, "irue": 2, "iruin": 2, "irule": 2, "irun": 4, "irush": 2, "irvon": 2, "isa": 1979, "isab": 2, "isaf": 31, "isaid": 352, "isail": 4, "isaj": 3, "isall": 158, "isan": 323, "isand": 96, "isang": 5, "isany": 37, "isapt": 8, "isart": 2, "isas": 208, "isash": 2, "isask": 2, "isat": 182, "isate": 2, "isave": 6, "isaw": 371, "isawe": 2, "isay": 480, "isb": 2, "isbad": 8, "isbe": 3, "isbed": 2, "isbig": 6, "isbob": 2, "isbut": 122, "isby": 100, "iscan": 6, "iscut": 22, "isday": 6, "isde": 5, "isdid": 3, "isdim": 2, "isdo": 3, "isdon": 2, "isdr": 3, "isdry": 3, "isdue": 35, "ise": 2, "isea": 2, "isee": 498, "iseed": 2, "iseek": 23, "iseem": 15, "iseen": 18, "isees": 2, "iseh": 2, "isell": 2, "isend": 36, "isent": 46, "iset": 48, "iseye": 2, "isez": 2, "isfar": 52, "isfat": 3, "isfed": 6, "isfit": 7, "isfor": 133, "isfro": 2, "isfun": 5, "isgay": 3, "isget": 3, "isgo": 4, "isgod": 39, "isgot": 2, "isha": 6, "ishan": 12, "ishe": 223, "ishee": 3, "isher": 20, "ishew": 6, "ishid": 11, "ishis": 137, "ishit": 2, "ishot": 6, "ishow": 28, "ishun": 2, "ishut": 8, "isi": 98, "isick": 2, "isif": 20, "isigh": 2, "isign": 2, "isill": 6, "isim": 2, "isin": 664, "ising": 60, "isink": 2, "isir": 8, "isis": 9, "isit": 465, "isits": 23, "isjoy": 5, "isla": 2, "islaw": 2, "islax": 2, "islay": 4, "isled": 2, "islet": 6, "islew": 3, "islid": 4, "islow": 9, "ismad": 17, "isman": 16, "ismay": 5, "ismc": 2, "isme": 13, "ismen": 5, "ismet": 4, "ismie": 2, "ismor": 2, "ismr": 22, "ismrs": 13, "ismy": 227, "isnew": 17, "isno": 556, "isnor": 3, "isnot": 1567, "isnow": 156, "isnt": 64, "isnta": 5, "isnti": 2, "iso": 12, "isoar": 2, "isodd": 4, "isof": 182, "isoff": 7, "isoft": 2, "isoh": 5, "isold": 11, "isome": 3, "ison": 91, "isone": 217, "isoon": 5, "isor": 20, "isort": 2, "isour": 63, "isout": 30, "isp": 3, "isped": 4, "isper": 2, "ispit": 2, "ispun": 2, "isput": 15, "israw": 2, "isray": 2, "isred": 7, "isrid": 2, "isrun": 2, "iss": 2, "issee": 2, "isset": 27, "issex": 4, "isshe": 48, "issin": 7, "issir": 5, "issix": 5, "issiz": 2, "isso": 225, "isst": 2, "issun": 3, "ist": 27, "istab": 2, "istax": 2, "istay": 8, "isten": 3, "istep": 2, "isthe": 2177, "isthy": 97, "istir": 2, "istis": 2, "istmy": 2, "isto": 598, "istom": 2, "istoo": 99, "istop": 6, "istum": 2, "istwo": 8, "isuch": 2, "isung": 4, "isup": 14, "isure": 4, "isus": 3, "isvp": 2, "iswam": 2, "iswas": 3, "isway": 2, "iswe": 14, "iswee": 2, "iswho": 6, "iswhy": 37, "iswim": 2, "iswoe": 3, "iswon": 2, "isx": 3, "isye": 2, "isyes": 4, "isyet": 41, "isyme": 2, "isyou": 23, "ita": 246, "itago": 2, "itah": 4, "itain": 2, "itair": 2, "itake": 91, "italb": 2, "italk": 9, "itall": 249, "itan": 25, "itand": 1176, "itany": 20, "itare": 18, "itas": 258, "itask": 2, "itat": 131, "itate": 2, "itaug": 2, "itay": 2, "itaye": 7, "itb": 2, "itbad": 2, "itbe": 382, "itbee": 3, "itben": 4, "itbig": 3, "itboy": 2, "itbru": 3, "itbut": 321, "itby": 131, "itcab": 2, "itcai": 2, "itcan": 128, "itcap": 2, "itclo": 2, "itcry": 2, "itcut": 4, "itd": 2, "itdbe": 2, "itdec": 2, "itdid": 149, "itdie": 5, "itdig": 2, "itdis": 2, "itdo": 31, "itdoe": 3, "itdon": 7, "itdow": 2, "itdr": 3, "itdry": 4, "itdue": 3, "itdug": 2, "ite": 2, "itear": 3, "iteat": 4, "iteh": 6, "itell": 159, "itend": 4, "itere": 3, "itfar": 17, "itfit": 6, "itfor": 356, "itgam": 2, "itgau": 2, "itget": 4, "itgo": 21, "itgot": 10, "ith": 39, "itha": 2, "ithad": 420, "ithal": 3, "itham": 5, "ithas": 307, "ithat": 37, "ithe": 394, "ithee": 12, "ithem": 5, "ithen": 34, "ither": 26, "ithes": 4, "ithey": 2, "ithim": 5, "ithis": 39, "ithit": 4, "itho": 3, "ithor": 8, "ithou": 2, "ithow": 24, "ithus": 5, "ithy": 4, "iti": 334, "itif": 72, "itii": 2, "itill": 3, "itim": 8, "itin": 517, "itis": 4120, "itisn": 18, "itit": 169, "itits": 5, "itive": 5, "itjem": 2, "itjet": 2, "itkin": 2, "itlay": 13, "itle": 2, "itled": 6, "itlet": 30, "itlie": 2, "itlit": 2, "itll": 13, "itlo": 2, "itlow": 3, "itm": 2, "itma": 5, "itmai": 2, "itman": 7, "itmar": 2, "itmay": 313, "itme": 31, "itmen": 2, "itmet": 5, "itmr": 29, "itmrs": 16, "itmy": 46, "itnay": 5, "itnew": 6, "itno": 50, "itnor": 24, "itnot": 267, "itnow": 104, "ito": 83, "itof": 67, "itoff": 66, "itoh": 26, "itold": 137, "itom": 2, "iton": 139, "itone": 19, "itoo": 46, "itook": 81, "itor": 59, "itore": 3, "itosr": 2, "itoss": 2, "itour": 9, "itout": 160, "itown": 2, "itpat": 2, "itpay": 2, "itpip": 2, "itpop": 2, "itput": 8, "itran": 14, "itraw": 3, "itre": 2, "itred": 3, "itrep": 2, "itrig": 2, "itrip": 2, "itrob": 3, "itrod": 3, "itrow": 2, "itrun": 4, "itry": 15, "its": 418, "itsa": 45, "itsad": 2, "itsam": 3, "itsan": 5, "itsat": 6, "itsaw": 4, "itsay": 9, "itsee": 9, "itset": 7, "itsha": 2, "itshe": 116, "itsir": 12, "itsix": 5, "itsmy": 6, "itsno": 4, "itso": 184, "itsok": 2, "itson": 3, "itsso": 6, "itst": 3, "itsth": 3, "itsto": 2, "itsun": 2, "itsup": 2, "ittax": 2, "itten": 3, "itth": 2, "itthe": 370, "itthy": 3, "ittis": 4, "itto": 669, "ittom": 5, "ittoo": 40, "ittry": 4, "ittwo": 7, "ituck": 3, "itum": 2, "itune": 2, "itup": 154, "iturn": 16, "itus": 3, "itvex": 2, "itvic": 2, "itvol": 2, "itvs": 2, "itwas": 4092, "itwe": 34, "itwho": 14, "itwhy": 24, "itwo": 2, "itwoe": 6, "itwon": 18, "ity": 2, "itye": 11, "ityea": 5, "ityer": 2, "ityes": 14, "ityet": 34, "ityis": 2, "ityou": 137, "iue": 3, "iundo": 2, "iunto": 19, "iup": 6, "iupon": 3, "iurge": 3, "iuse": 10, "iused": 40, "iusta": 2, "iva": 5, "ive": 219, "ivery": 2, "iview": 3, "ivo": 2, "ivote": 5, "ivrg": 2, "ivse": 2, "ivthe": 7, "ivum": 2, "ivwe": 2, "iwade": 2, "iwait": 17, "iwake": 5, "iwalk": 34, "iwant": 158, "iwarn": 4, "iwas": 1116, "iwash": 4, "iwasn": 8, "iwe": 3, "iwear": 5, "iween": 3, "iweep": 6, "iwell": 12, "iwend": 3, "iwent": 134, "iwept": 5, "iwere": 66, "iwhat": 15, "iwhen": 6, "iwhet": 2, "iwho": 18, "iwhy": 2, "iwil": 2, "iwill": 2598, "iwin": 3, "iwing": 2, "iwish": 224, "iwist": 3, "iwith": 30, "iwoe": 2, "iwoke": 8, "iwold": 3, "iwon": 54, "iwont": 13, "iwore": 4, "iwork": 10, "iwot": 6, "iwrap": 3, "ixmr": 2, "ixno": 2, "ixp": 2, "ixthe": 5, "iyea": 2, "iyes": 3, "iyet": 12, "iyou": 15, "iyour": 11, "izay": 2, "jacka": 2, "jackd": 2, "jaga": 2, "jagos": 2, "jagsi": 2, "jaira": 2, "jama": 3, "jand": 7, "jandr": 2, "janea": 2, "janei": 10, "janes": 20, "janhe": 2, "jani": 2, "janif": 2, "janla": 2, "janon": 2, "jarby": 2, "jarhe": 2, "jari": 2, "jarif": 2, "jaris": 2, "jarof": 11, "jaroh": 2, "jaron": 3, "jas": 3, "jasw": 2, "javaa": 2, "jawa": 2, "jawif": 2, "jawin": 3, "jawis": 5, "jawit": 2, "jawof": 7, "jawor": 2, "jawsi": 2, "jawso": 2, "jayat": 2, "jayin": 3, "jayor": 2, "jayp": 2, "jbut": 5, "jde": 2, "jebbs": 2, "jedi": 2, "jeepi": 2, "jema": 2, "jemas": 2, "jemi": 9, "jems": 14, "jemso": 2, "jemto": 8, "jene": 2, "jesti": 2, "jeta": 2, "jetis": 5, "jetit": 2, "jetof": 4, "jetsa": 2, "jetsd": 2, "jetto": 2, "jetvs": 2, "jewa": 2, "jewhe": 5, "jewi": 2, "jewin": 3, "jewis": 4, "jewit": 2, "jewof": 5, "jewor": 2, "jews": 7, "jewsa": 5, "jewsi": 4, "jewto": 8, "jfain": 2, "jgo": 2, "jhe": 2, "jhear": 2, "jiand": 2, "jibin": 2, "jibto": 2, "jif": 3, "jiffi": 2, "jigat": 2, "jigi": 2, "jigis": 3, "jigit": 3, "jigor": 2, "jima": 2, "jimgo": 2, "jimhe": 3, "jin": 2, "jis": 2, "jit": 2, "jlafe": 2, "jlee": 2, "jmr": 2, "jmy": 2, "joabi": 2, "joabs": 9, "joba": 4, "joban": 3, "jobas": 9, "jobat": 9, "jobby": 3, "jobdr": 2, "jobhe": 5, "jobi": 3, "jobif": 3, "jobin": 6, "jobis": 7, "jobit": 3, "jobmr": 3, "jobof": 22, "jobon": 8, "jobor": 5, "jobs": 3, "jobso": 3, "jobto": 12, "jobwe": 3, "joeas": 3, "joeby": 2, "joedo": 2, "joehe": 2, "joei": 6, "joein": 2, "joeis": 3, "joeit": 2, "joemy": 2, "joeof": 2, "joes": 5, "joeto": 3, "joewe": 2, "jof": 2, "johna": 20, "johnb": 6, "johnc": 7, "johnd": 2, "johne": 2, "johnf": 10, "johng": 2, "johnh": 4, "johni": 8, "johnj": 5, "johnk": 2, "johnl": 4, "johnm": 4, "johnp": 4, "johns": 26, "johnt": 2, "johnw": 4, "joina": 5, "joinb": 2, "joind": 8, "jokea": 3, "jossa": 2, "jotof": 3, "jotor": 2, "jouri": 2, "jovei": 3, "joves": 3, "jowas": 2, "jowho": 2, "joya": 6, "joyas": 3, "joyat": 6, "joyby": 4, "joyd": 2, "joyhe": 13, "joyi": 14, "joyif": 2, "joyin": 34, "joyis": 6, "joyit": 4, "joymr": 2, "joymy": 2, "joyno": 3, "joyo": 7, "joyof": 66, "joyoh": 3, "joyon": 4, "joyor": 4, "joysi": 2, "joyso": 6, "joyto": 23, "jphoo": 2, "jpray": 2, "jputs": 2, "jra": 4, "jran": 2, "jrand": 3, "jrare": 2, "jras": 2, "jrat": 2, "jrfor": 2, "jrhas": 2, "jris": 2, "jrmr": 2, "jrmrs": 7, "jrmy": 2, "jrof": 7, "jross": 4, "jrsa": 2, "jrthe": 2, "jrto": 2, "jrwas": 2, "jrwho": 3, "jryan": 2, "jsure": 2, "jthat": 2, "jthe": 2, "jthen": 2, "jthey": 2, "juana": 2, "juani": 2, "jubso": 2, "juga": 2, "julys": 2, "junea": 4, "junei": 2, "junew": 2, "junos": 2, "jurea": 2, "justa": 67, "justi": 4, "justo": 2, "jwait": 4, "jwas": 2, "jwell": 2, "jwill": 2, "jye": 2, "jyes": 2, "jyou": 7, "kala": 2, "kanas": 2, "kand": 3, "kants": 2, "kayk": 2, "kayto": 4, "kbut": 2, "kcdog": 2, "kcin": 2, "kcis": 2, "kcjet": 2, "kcof": 2, "kcto": 2, "keela": 2, "keelo": 2, "keena": 3, "keepa": 37, "keepi": 4, "kena": 2, "kenhe": 2, "kenof": 2, "kensa": 2, "kentn": 2, "kento": 2, "kents": 3, "keomr": 2, "kepta": 20, "kepti": 3, "kerra": 2, "keya": 2, "keyas": 3, "keyat": 4, "keyd": 3, "keyhe": 3, "keyi": 2, "keyin": 7, "keyis": 3, "keymr": 3, "keyof": 22, "keyon": 2, "keyor": 3, "keysa": 2, "keyto": 23, "keywe": 2, "kfor": 2, "khess": 2, "kicka": 3, "kickd": 2, "kida": 2, "kidby": 3, "kiddi": 2, "kidds": 3, "kidhe": 4, "kidi": 4, "kidif": 3, "kidin": 4, "kidof": 29, "kidto": 3, "kild": 3, "kildo": 2, "killa": 10, "killd": 15, "kille": 9, "killi": 3, "kilst": 2, "kina": 2, "kinda": 6, "kindi": 6, "kinea": 2, "kinga": 7, "kingi": 23, "kingo": 7, "kings": 317, "kini": 2, "kinif": 2, "kinit": 2, "kinno": 2, "kinto": 6, "kirof": 2, "kisha": 2, "kissd": 4, "kissi": 3, "kisti": 2, "kitin": 2, "kking": 2, "kkkat": 2, "klane": 2, "kneei": 2, "kneeo": 2, "knewa": 11, "knewi": 16, "knita": 2, "knota": 2, "knowa": 34, "knowd": 2, "knowi": 133, "knowo": 6, "knowt": 2, "kof": 2, "kon": 2, "kopin": 2, "kvare": 2, "kwhen": 2, "kythe": 2, "laa": 2, "laand": 2, "labas": 2, "labto": 2, "lacd": 2, "lacei": 3, "lacka": 5, "lackd": 2, "lacki": 2, "lada": 3, "ladas": 3, "ladat": 2, "ladbe": 3, "ladgo": 2, "ladi": 8, "ladid": 2, "ladin": 4, "ladis": 5, "ladof": 2, "lads": 2, "ladsi": 3, "ladso": 2, "ladto": 2, "ladup": 2, "ladwe": 2, "ladya": 6, "ladyi": 18, "ladyo": 2, "ladyp": 12, "ladys": 29, "laera": 4, "laeri": 7, "lafie": 2, "lagd": 2, "laggd": 2, "lagor": 2, "lahe": 2, "lai": 3, "laida": 17, "laif": 3, "laka": 2, "lakea": 3, "lakes": 2, "lakoo": 2, "lala": 3, "lalee": 2, "lama": 3, "lamba": 3, "lambi": 6, "lambs": 5, "lamei": 2, "lampa": 2, "lampi": 2, "lampo": 2, "lamy": 2, "land": 6, "landa": 16, "landi": 14, "lando": 7, "lands": 4, "lanea": 7, "laneb": 3, "lanei": 2, "lano": 2, "lao": 2, "laoa": 2, "laoat": 2, "laone": 2, "laout": 2, "lapa": 2, "lapas": 2, "laphe": 2, "lapof": 6, "lapoh": 2, "lapor": 2, "lapst": 2, "lashd": 2, "lashe": 3, "lasta": 14, "lastd": 2, "lasti": 27, "lasto": 4, "lastt": 2, "lat": 2, "latea": 3, "latei": 13, "later": 3, "lates": 7, "latew": 2, "lathe": 4, "lato": 2, "lawa": 11, "lawam": 2, "lawas": 19, "lawat": 4, "lawbe": 2, "lawby": 10, "lawdo": 5, "lawgo": 2, "lawhe": 9, "lawi": 14, "lawie": 2, "lawif": 5, "lawin": 24, "lawis": 38, "lawit": 8, "lawmr": 3, "lawmy": 3, "lawno": 2, "lawo": 2, "lawof": 161, "lawon": 9, "lawor": 11, "laws": 18, "lawsa": 3, "lawsi": 2, "lawso": 5, "lawth": 2, "lawto": 29, "lawus": 2, "lawwe": 3, "lawye": 3, "laxye": 2, "laya": 25, "layas": 2, "layat": 12, "layby": 5, "layd": 2, "layhe": 2, "layi": 3, "layin": 32, "layit": 25, "layme": 10, "laymr": 2, "laymy": 11, "layno": 4, "layof": 3, "layon": 30, "layor": 2, "layou": 3, "layso": 2, "layto": 4, "layup": 11, "layye": 2, "lbaj": 2, "lband": 2, "lbbod": 2, "lbby": 2, "lbcu": 6, "lbe": 2, "lbfor": 6, "lbin": 2, "lbof": 3, "lbsis": 2, "lbsof": 5, "lbsor": 2, "lbtub": 2, "lbut": 2, "lby": 2, "lcall": 2, "lcan": 2, "ldand": 3, "ldon": 2, "ldy": 2, "ldye": 2, "leach": 2, "leada": 7, "leadi": 4, "leafa": 2, "leahs": 6, "leaki": 2, "leand": 5, "leapi": 2, "leavd": 4, "leda": 4, "ledan": 2, "ledas": 2, "ledby": 24, "ledin": 6, "ledme": 14, "ledof": 3, "ledon": 6, "ledor": 2, "ledth": 2, "ledto": 69, "ledup": 5, "ledus": 3, "leea": 3, "leeas": 2, "leeh": 2, "leeit": 2, "leeof": 4, "lees": 2, "leeto": 2, "lefta": 30, "lefti": 11, "legan": 2, "legas": 2, "legdo": 2, "leghe": 13, "legi": 4, "legin": 3, "legis": 4, "legit": 4, "legof": 4, "legon": 2, "legor": 4, "legsi": 8, "legso": 2, "legto": 5, "legup": 2, "legwe": 2, "lemot": 2, "lenda": 4, "leni": 2, "lenot": 2, "lensi": 2, "leoa": 2, "leois": 2, "leoj": 2, "leom": 2, "leoon": 2, "leoor": 2, "lepi": 2, "lept": 2, "leroi": 2, "lessa": 9, "lessi": 6, "lesta": 5, "lesti": 27, "leta": 24, "letaf": 7, "letan": 2, "letas": 2, "letbe": 2, "letdo": 2, "letem": 4, "letg": 2, "letgo": 28, "leti": 4, "letin": 15, "letit": 141, "letme": 372, "letmr": 3, "letmy": 56, "letn": 3, "letno": 41, "leton": 4, "letp": 2, "letq": 2, "lets": 80, "lett": 3, "letto": 3, "letup": 6, "letus": 463, "letv": 3, "letvs": 31, "letwe": 3, "letye": 2, "letzg": 2, "levan": 2, "levya": 3, "lewi": 2, "lewor": 2, "lfrom": 2, "lha": 2, "lhaue": 3, "lhays": 2, "liara": 2, "lickd": 2, "lidhe": 2, "lidin": 3, "lidis": 4, "lidof": 5, "lidon": 4, "lidso": 2, "lidto": 2, "lieas": 4, "lieat": 3, "lieby": 3, "liehe": 3, "liei": 5, "liein": 46, "lieis": 3, "liemr": 2, "lieno": 4, "lieof": 2, "lieon": 13, "lieor": 3, "liesa": 3, "liesi": 2, "lieso": 4, "lieto": 8, "liewe": 2, "lifea": 19, "lifei": 55, "lifeo": 8, "lifep": 5, "lifes": 19, "lifta": 2, "lifti": 2, "likea": 1138, "likef": 2, "likei": 18, "likej": 2, "likeo": 2, "likep": 2, "lilta": 2, "lilys": 2, "limai": 2, "limbd": 3, "linea": 5, "linei": 5, "linel": 7, "linkd": 6, "lioni": 5, "liono": 2, "lions": 13, "lipa": 2, "lipas": 3, "liphe": 2, "lipin": 2, "lipis": 2, "lipit": 2, "lipm": 2, "lipof": 6, "lipor": 2, "lippd": 7, "lipsa": 5, "lipsi": 8, "lipso": 5, "lipto": 2, "lispd": 2, "lista": 3, "listf": 2, "listi": 2, "lit": 2, "lita": 5, "litan": 2, "litas": 3, "litby": 7, "litin": 2, "litit": 5, "liton": 2, "litup": 25, "liud": 7, "liuea": 4, "liuei": 2, "liueo": 2, "liust": 2, "livd": 2, "livea": 8, "livei": 10, "livst": 2, "ljr": 2, "llall": 5, "llask": 4, "llate": 2, "llbe": 58, "llbuy": 3, "lldie": 3, "lldo": 22, "lleat": 7, "llfit": 2, "llfix": 2, "llget": 19, "llgo": 30, "llhop": 2, "lli": 4, "lllay": 3, "lllet": 6, "llmix": 3, "llne": 2, "llnot": 18, "llout": 2, "llpay": 10, "llput": 4, "llrun": 7, "llsay": 7, "llsee": 23, "llset": 3, "llsit": 3, "llsup": 2, "llten": 2, "lltry": 13, "llyes": 2, "lmake": 2, "lmto": 2, "lnot": 3, "loa": 15, "loada": 2, "loadi": 4, "loadl": 3, "loafd": 2, "loall": 4, "loan": 3, "loand": 3, "loas": 2, "loat": 2, "lobit": 2, "lobla": 2, "locka": 2, "lockd": 5, "locki": 2, "lodgd": 4, "loeli": 2, "lof": 4, "loga": 2, "logah": 2, "logat": 2, "logis": 2, "logod": 3, "logof": 6, "logoh": 2, "logsa": 2, "lohe": 15, "lohow": 3, "loi": 34, "loif": 2, "loin": 6, "loit": 11, "lolam": 2, "lolet": 2, "lolo": 2, "lomid": 2, "lomy": 2, "longa": 29, "longi": 36, "longo": 4, "lono": 2, "lonon": 3, "lonow": 3, "loo": 2, "looka": 13, "lookd": 31, "looke": 2, "looki": 11, "looko": 3, "loone": 2, "loosd": 3, "loour": 2, "loout": 2, "lor": 2, "lord": 2, "lorda": 23, "lordi": 132, "lordj": 55, "lordo": 50, "lords": 141, "losea": 8, "losei": 2, "loshu": 22, "lossi": 2, "losta": 13, "losti": 9, "losto": 2, "lota": 2, "lotas": 3, "lotat": 3, "lotbe": 2, "lotby": 2, "lothe": 34, "lotho": 2, "lothy": 4, "loti": 3, "lotin": 9, "lotis": 5, "lotno": 2, "loto": 4, "lotof": 97, "loton": 3, "lotor": 2, "lots": 3, "lotso": 3, "lotto": 11, "loud": 12, "louda": 3, "loudi": 2, "loudo": 2, "louea": 2, "louei": 4, "loueo": 2, "loumr": 2, "lovd": 4, "lovea": 14, "lovei": 29, "loveo": 14, "loves": 10, "lowa": 2, "lowas": 18, "lowat": 2, "lowe": 7, "lowhe": 4, "lowi": 3, "lowin": 16, "lowis": 2, "lowit": 2, "lowm": 3, "lowof": 2, "lowon": 5, "lowor": 2, "lowth": 2, "lowto": 8, "loye": 3, "loyou": 3, "lpabr": 2, "lper": 2, "lpgas": 2, "lput": 3, "lread": 2, "lrue": 2, "lsend": 2, "lshew": 2, "lstof": 3, "ltax": 2, "ltbe": 2, "ltdoe": 2, "ltdof": 2, "ltell": 2, "ltgov": 4, "lth": 2, "lthe": 2, "lto": 2, "luci": 8, "lucit": 2, "lucki": 3, "lucmy": 4, "lucno": 3, "luco": 2, "lucto": 2, "lucya": 2, "lucyi": 4, "lucys": 27, "luffa": 2, "luisi": 2, "lulla": 3, "lulld": 3, "lulli": 2, "lului": 2, "lumpi": 2, "lunda": 2, "lungd": 3, "lurki": 2, "luzat": 2, "luzin": 2, "luzto": 2, "lwait": 2, "lwith": 2, "lycas": 2, "lyei": 2, "lyein": 8, "lyeis": 2, "lyesi": 2, "lyeso": 3, "lymei": 4, "lynna": 2, "lyrei": 3, "lyst": 2, "maam": 217, "macba": 2, "macbi": 14, "macbo": 3, "macdi": 7, "macdo": 5, "macwe": 2, "macys": 2, "mada": 3, "madas": 10, "madat": 9, "madby": 2, "maddo": 2, "madea": 373, "madei": 7, "madeo": 2, "madhe": 8, "madi": 9, "madif": 3, "madin": 8, "mado": 2, "madof": 2, "madon": 9, "mador": 5, "madso": 2, "madst": 3, "madto": 6, "madwe": 3, "maeat": 2, "maeto": 2, "mafor": 2, "mah": 2, "mahad": 2, "maias": 2, "maida": 3, "maidi": 8, "maids": 5, "maila": 3, "maild": 2, "maimd": 3, "main": 3, "makea": 356, "makei": 5, "makes": 2, "makst": 2, "malbe": 3, "malci": 2, "malei": 4, "mali": 4, "malif": 2, "malit": 2, "mall": 5, "malmy": 2, "maloh": 2, "malwe": 2, "mam": 15, "mamas": 2, "man": 2, "mana": 56, "manam": 2, "manan": 8, "manas": 51, "manat": 36, "manbe": 57, "manby": 34, "mand": 4, "mando": 14, "mandr": 2, "manei": 2, "mango": 6, "manha": 3, "manhe": 99, "mani": 97, "manif": 19, "manim": 2, "manin": 254, "manis": 202, "manit": 32, "manlo": 2, "manm": 2, "manmr": 7, "manmy": 8, "manne": 2, "manno": 7, "mano": 9, "manoa": 2, "manof": 366, "manoh": 2, "manon": 35, "manor": 103, "mans": 342, "manso": 32, "manth": 2, "manto": 180, "manun": 2, "manup": 4, "manwe": 17, "manya": 166, "manye": 2, "manyi": 6, "manyo": 2, "manys": 4, "maoto": 2, "mapat": 2, "mapin": 2, "mapof": 6, "mapsi": 2, "mara": 2, "mardo": 2, "mares": 3, "maris": 2, "marit": 4, "marka": 4, "markd": 9, "marki": 3, "marks": 2, "markv": 2, "marmy": 4, "marno": 2, "maro": 2, "maroh": 2, "marp": 2, "marra": 2, "marrd": 2, "marso": 2, "marya": 4, "maryi": 10, "maryj": 2, "marym": 2, "maryr": 2, "marys": 24, "mas": 4, "mashd": 2, "maska": 2, "maskd": 2, "massa": 4, "masti": 2, "masts": 2, "mat": 2, "matas": 3, "matea": 2, "mateo": 2, "mates": 13, "matis": 3, "matno": 2, "matof": 3, "maton": 2, "matto": 2, "mawas": 2, "maway": 2, "mawof": 4, "maxin": 2, "maya": 7, "mayad": 2, "mayah": 2, "mayap": 4, "mayas": 21, "mayat": 10, "maybe": 1107, "mayby": 4, "maydo": 36, "maygo": 53, "mayhe": 14, "mayi": 62, "mayif": 2, "mayin": 18, "mayis": 2, "mayit": 13, "maymr": 2, "maymy": 2, "maynd": 3, "mayno": 6, "maynt": 4, "mayof": 6, "mayoh": 2, "mayon": 3, "mayor": 17, "mays": 2, "mayso": 8, "mayst": 6, "mayt": 2, "mayth": 10, "mayto": 6, "maywe": 12, "mayye": 4, "mber": 2, "mbert": 3, "mbfon": 2, "mbows": 2, "mbrun": 5, "mbusy": 3, "mbut": 4, "mcand": 2, "mclay": 2, "mde": 2, "mdean": 2, "mdif": 2, "mdmrs": 2, "mdown": 2, "mea": 239, "meadd": 3, "meah": 4, "meaha": 2, "meala": 4, "meall": 64, "meam": 4, "mean": 32, "meana": 13, "meand": 1035, "meani": 30, "meano": 2, "means": 2, "meany": 15, "meare": 16, "meart": 5, "meas": 179, "measa": 2, "meask": 4, "meat": 78, "meata": 2, "meati": 4, "meaw": 2, "mebad": 2, "mebag": 2, "mebe": 27, "mebeg": 3, "meben": 2, "meboy": 3, "mebru": 3, "mebut": 190, "mebuy": 2, "meby": 80, "mecan": 8, "mecas": 3, "mecry": 2, "mecut": 2, "medar": 2, "meday": 4, "mede": 4, "medid": 5, "medie": 6, "medo": 28, "medon": 5, "medry": 2, "mee": 2, "meeas": 3, "meeh": 2, "meehe": 2, "meei": 2, "meere": 2, "meeso": 2, "meeta": 10, "meeti": 3, "meetm": 2, "meeto": 3, "meeve": 2, "mefar": 2, "mefor": 284, "meget": 8, "mego": 47, "megod": 15, "megoe": 2, "meha": 3, "mehad": 4, "meham": 9, "mehas": 5, "mehe": 123, "mehed": 2, "meher": 5, "mehes": 4, "mehew": 2, "mehim": 7, "mehis": 24, "mehor": 3, "mehow": 42, "mehuh": 2, "mei": 525, "meif": 98, "meile": 3, "meill": 2, "meim": 6, "mein": 305, "meis": 60, "meit": 77, "meits": 9, "meive": 4, "mejan": 2, "mejob": 2, "mejoy": 2, "mela": 2, "melet": 41, "melie": 2, "melo": 5, "meloe": 2, "melow": 2, "melta": 2, "mema": 3, "memad": 4, "meman": 8, "memar": 2, "memay": 5, "meme": 8, "memen": 5, "memr": 12, "memrs": 8, "memy": 99, "mena": 23, "menan": 5, "menas": 33, "menat": 24, "menay": 3, "menbe": 10, "menby": 8, "mend": 2, "menda": 2, "mendi": 2, "mendo": 13, "mene": 2, "mengo": 9, "menhe": 31, "meni": 34, "menif": 5, "menin": 112, "menis": 16, "menit": 16, "menmr": 2, "menmy": 6, "menno": 6, "meno": 59, "menof": 472, "menon": 25, "menor": 29, "menot": 134, "menow": 97, "mens": 45, "menso": 8, "mento": 83, "menup": 2, "menwe": 12, "menye": 5, "meo": 103, "meof": 92, "meoff": 15, "meoft": 2, "meoh": 25, "meold": 7, "meon": 62, "meone": 25, "meope": 2, "meor": 37, "meour": 2, "meout": 74, "meowe": 2, "mepat": 2, "mepay": 2, "mepol": 2, "mepub": 2, "meput": 2, "meqof": 2, "mercs": 2, "merig": 2, "merub": 2, "merun": 2, "mesas": 2, "mesaw": 4, "mesay": 16, "mesee": 38, "meser": 2, "meset": 6, "meshe": 40, "mesin": 2, "mesir": 17, "mesix": 2, "meso": 88, "meson": 21, "mesow": 3, "met": 2, "meta": 14, "metan": 2, "metas": 2, "metat": 11, "metby": 16, "meten": 3, "methe": 373, "metho": 2, "methy": 40, "meti": 4, "metin": 21, "metis": 2, "metk": 2, "metme": 2, "metmr": 4, "metmy": 3, "metno": 2, "meto": 607, "metof": 2, "metom": 2, "meton": 3, "metoo": 16, "metor": 2, "metry": 4, "metto": 3, "metup": 2, "metus": 3, "metwe": 4, "metwo": 9, "meup": 71, "mevp": 3, "mewas": 23, "mewat": 2, "mewd": 2, "mewe": 19, "mewee": 2, "mewho": 28, "mewhy": 35, "mewon": 2, "meye": 31, "meyea": 10, "meyes": 8, "meyet": 21, "meyon": 2, "meyou": 91, "mfgco": 2, "mfig": 2, "mfit": 2, "mfor": 6, "mgand": 2, "mgay": 2, "mgl": 3, "mgla": 3, "mglad": 21, "mglaj": 2, "mglof": 2, "mgod": 2, "mgods": 2, "mgof": 7, "mgone": 3, "mhas": 2, "mhe": 2, "mhere": 4, "midby": 2, "mids": 2, "midst": 2, "midto": 2, "mif": 4, "mijas": 2, "mildi": 2, "milee": 2, "milka": 3, "milkf": 2, "mill": 2, "min": 16, "minat": 2, "minda": 14, "mindi": 26, "mindo": 2, "minds": 2, "minea": 5, "minei": 26, "mineo": 3, "mines": 4, "minki": 2, "mioin": 2, "mis": 2, "missa": 9, "missb": 9, "missf": 3, "missi": 4, "missn": 2, "missw": 4, "mista": 2, "mists": 2, "mixd": 2, "mixin": 5, "mixit": 2, "mixup": 2, "mkand": 2, "mlof": 7, "mlor": 3, "mlost": 2, "mlper": 2, "mmad": 7, "mmade": 3, "mmby": 2, "mmesr": 2, "mmgun": 2, "mmid": 4, "mmis": 2, "mmof": 2, "mmr": 2, "mmto": 2, "mmuch": 2, "mmy": 2, "mnay": 2, "mno": 6, "mnot": 51, "moabs": 2, "moba": 2, "mobhe": 3, "mobof": 3, "mobon": 2, "mockd": 2, "mof": 7, "mofeb": 2, "moh": 5, "mohas": 2, "mold": 2, "molda": 2, "molos": 3, "momrs": 2, "mon": 4, "monai": 2, "monce": 2, "mone": 3, "monim": 2, "monka": 2, "monki": 2, "monly": 5, "mooah": 2, "mooda": 3, "moodi": 2, "moona": 4, "mooni": 6, "moono": 2, "moons": 3, "moord": 2, "mooud": 2, "mopof": 3, "mopup": 2, "morea": 38, "morei": 63, "moreo": 7, "mores": 2, "morni": 3, "morto": 2, "mosas": 2, "mossa": 2, "mosta": 6, "mosti": 5, "motor": 2, "moud": 8, "mouei": 2, "mout": 3, "mouti": 2, "movea": 10, "movei": 5, "movst": 2, "mowi": 2, "mphin": 2, "mphis": 2, "mphit": 2, "mra": 7, "mrand": 123, "mrb": 3, "mrcox": 14, "mrde": 5, "mre": 12, "mrfoy": 2, "mrh": 3, "mrhar": 2, "mrike": 2, "mrj": 3, "mrk": 2, "mrkeo": 4, "mrks": 2, "mrlee": 7, "mrlow": 2, "mrmax": 2, "mro": 7, "mror": 2, "mrose": 2, "mrroy": 6, "mrryc": 2, "mrs": 2, "mrsa": 2, "mrsam": 7, "mrsb": 4, "mrsbs": 3, "mrsd": 3, "mrse": 3, "mrseo": 2, "mrsf": 3, "mrsg": 2, "mrsh": 3, "mrsi": 2, "mrsj": 5, "mrsl": 2, "mrsn": 2, "mrsr": 2, "mrsrl": 2, "mrss": 3, "mrst": 8, "mrsun": 7, "mrsw": 2, "mrt": 2, "mrtim": 2, "mruh": 2, "mruno": 2, "mrw": 2, "mrwm": 2, "mrys": 2, "msaid": 2, "msick": 2, "mso": 9, "msor": 2, "mssin": 2, "msuch": 2, "msure": 89, "mthat": 3, "mthe": 12, "mthey": 2, "mto": 8, "mtoo": 2, "mtrue": 3, "mucha": 21, "muchi": 39, "mucht": 2, "muda": 2, "mudat": 4, "mudby": 2, "mudi": 2, "mudin": 4, "mudit": 2, "mudno": 2, "mudon": 3, "mudor": 3, "mudso": 3, "mudto": 2, "mudwe": 2, "mugof": 4, "mulei": 2, "mum": 2, "muma": 2, "mumhe": 2, "mumme": 2, "mumso": 2, "mup": 2, "murhe": 2, "muri": 2, "murmy": 2, "musea": 2, "mused": 3, "musei": 3, "musti": 28, "mvery": 11, "mvpin": 2, "mwell": 2, "mwhy": 4, "mwith": 2, "myage": 10, "myaid": 3, "myaim": 2, "myall": 3, "myand": 2, "myarm": 20, "myart": 2, "mybag": 2, "mybay": 3, "mybed": 23, "mybig": 7, "mybit": 2, "mybow": 10, "mybox": 2, "myboy": 31, "mybut": 4, "mycab": 2, "mycap": 2, "mycar": 7, "myco": 2, "mycow": 6, "mycry": 14, "mycup": 7, "mydad": 2, "myday": 5, "myden": 2, "mydog": 4, "myear": 10, "myeel": 3, "myend": 2, "myes": 2, "myeye": 9, "myfew": 2, "myfey": 2, "myfig": 2, "myfit": 2, "myfoe": 5, "myfog": 2, "myfun": 2, "myfur": 2, "mygab": 2, "mygod": 181, "mygun": 3, "myhat": 17, "myhen": 2, "myhip": 2, "myhow": 2, "myi": 3, "myice": 2, "myill": 2, "myink": 2, "myioy": 2, "myjar": 2, "myjaw": 2, "myjem": 3, "myjob": 6, "myjoy": 8, "mykit": 2, "myl": 2, "mylad": 6, "mylap": 3, "mylaw": 18, "myleg": 7, "mylie": 2, "mylit": 2, "mylot": 6, "mylud": 3, "myman": 12, "mymat": 2, "mymen": 15, "mymin": 2, "mymy": 4, "mynet": 6, "mynew": 9, "myno": 5, "mynot": 3, "myodd": 3, "myode": 2, "myold": 23, "myone": 3, "myor": 3, "myou": 3, "myour": 4, "myown": 287, "mypaw": 5, "mypay": 2, "mypen": 3, "mypet": 2, "mypin": 2, "mypot": 2, "myraa": 2, "myrac": 2, "myred": 4, "mysad": 4, "mysd": 2, "mysea": 2, "mysex": 3, "mysin": 19, "mysky": 2, "myson": 161, "myst": 2, "mysun": 2, "mytan": 2, "mytea": 4, "myth": 3, "mythe": 2, "mytim": 3, "mytoo": 2, "mytwo": 14, "myvow": 2, "mywar": 3, "myway": 60, "mywet": 2, "mywig": 2, "myyes": 2, "myyou": 2, "nab": 2, "naild": 3, "namd": 3, "namea": 12, "named": 2, "namei": 33, "nameo": 13, "names": 38, "namew": 2, "namin": 2, "nand": 3, "napin": 2, "napit": 2, "napof": 2, "napto": 2, "narai": 2, "nare": 4, "narya": 2, "nas": 2, "navyi": 3, "naya": 2, "naydo": 2, "nayhe": 4, "nayi": 14, "nayin": 5, "nayit": 4, "naymy": 11, "nayso": 2, "nayto": 5, "nayup": 2, "naywe": 2, "nayye": 2, "nbe": 3, "nbsto": 2, "nbut": 2, "nca": 2, "ncfor": 2, "nchas": 2, "nchit": 2, "ncin": 2, "ncon": 2, "nctac": 2, "ndas": 3, "ndboy": 3, "ndof": 2, "ndthe": 2, "ndto": 2, "neand": 2, "neara": 12, "neari": 3, "nearo": 2, "nearq": 6, "neat": 2, "neata": 2, "necka": 4, "neckd": 3, "necki": 5, "necko": 2, "nedis": 2, "needa": 21, "needi": 5, "neer": 6, "nere": 7, "nerea": 2, "nesay": 2, "nesta": 2, "nesti": 2, "netas": 2, "netat": 2, "netby": 3, "neth": 2, "nethe": 5, "netin": 2, "netis": 4, "neto": 2, "netof": 2, "neton": 2, "netor": 2, "netpg": 2, "netto": 2, "neur": 2, "newa": 2, "newad": 2, "newan": 2, "newas": 2, "newby": 2, "newco": 3, "newi": 3, "newin": 12, "newis": 2, "newit": 5, "newmr": 2, "newmy": 2, "newof": 3, "newor": 5, "newsa": 2, "newsi": 7, "newto": 16, "newun": 2, "newus": 3, "nexta": 8, "nexti": 6, "nfrom": 2, "ngwas": 2, "nha": 2, "nhard": 3, "nhas": 2, "nhave": 2, "nicea": 2, "nicei": 3, "nigha": 2, "nighi": 2, "nile": 2, "nilei": 2, "nilli": 2, "nin": 3, "ninea": 3, "ninei": 3, "nineo": 4, "nis": 7, "nisea": 2, "njis": 2, "nlas": 2, "nmoss": 2, "nmy": 2, "nno": 2, "nnot": 2, "nnow": 2, "noa": 5, "noaf": 2, "noage": 2, "noahs": 8, "noaid": 4, "noair": 4, "noall": 3, "noand": 23, "noant": 2, "noart": 6, "noas": 4, "noask": 2, "noat": 2, "nobad": 15, "noboy": 2, "nobto": 3, "nobut": 27, "noby": 7, "nocab": 2, "nocan": 2, "nocat": 2, "nocin": 2, "nocow": 3, "nocry": 2, "noday": 2, "nodew": 2, "nodin": 3, "nodmy": 2, "nodo": 5, "nodof": 3, "nodog": 2, "nodon": 4, "nodto": 4, "noear": 2, "noela": 2, "noeli": 2, "noend": 22, "noeso": 2, "noeye": 4, "nof": 4, "nofar": 2, "nofor": 11, "nofox": 2, "nofun": 2, "nogin": 2, "nogo": 3, "nogod": 23, "nogun": 3, "noham": 2, "nohat": 2, "nohe": 46, "nohes": 3, "nohis": 2, "nohor": 2, "nohow": 4, "noi": 113, "noice": 2, "noif": 8, "noill": 7, "noim": 4, "noin": 4, "nois": 2, "noisd": 2, "noit": 38, "noits": 2, "nojew": 3, "nojob": 2, "nojoy": 4, "nokey": 4, "nolaw": 12, "nolet": 7, "nolie": 4, "nolot": 2, "noma": 18, "noman": 310, "nomap": 2, "nomat": 2, "nomay": 2, "nomen": 2, "nomr": 8, "nomrs": 2, "nomud": 2, "nomy": 27, "nonei": 5, "nonew": 7, "nono": 107, "nonof": 3, "nonor": 12, "nonot": 57, "nonow": 4, "nooh": 2, "nooil": 5, "nooki": 2, "noold": 2, "noon": 2, "noona": 2, "noone": 291, "noop": 2, "noor": 5, "noosr": 2, "nopa": 2, "nopay": 2, "nopot": 2, "nopp": 2, "nopun": 2, "noput": 2, "nora": 32, "noraf": 2, "noram": 2, "noran": 5, "noras": 5, "norat": 3, "norbe": 19, "norby": 16, "nordo": 17, "norgo": 5, "norhe": 6, "nori": 19, "norif": 2, "norin": 44, "noris": 30, "norit": 2, "norme": 4, "normr": 4, "normy": 13, "norno": 4, "norof": 36, "noron": 6, "noror": 2, "norox": 2, "nors": 2, "norso": 7, "north": 3, "norto": 45, "norum": 2, "norwe": 2, "norye": 2, "nos": 4, "nosea": 5, "nosee": 2, "nosei": 2, "noset": 2, "nosex": 2, "noshe": 14, "nosin": 12, "nosir": 35, "noso": 2, "noson": 5, "nospy": 2, "nota": 612, "notah": 4, "notam": 2, "notan": 81, "notas": 130, "notat": 168, "notax": 5, "notbe": 1071, "notby": 77, "notdo": 115, "notea": 5, "notei": 3, "noteo": 2, "notgo": 130, "nothe": 102, "noti": 190, "notie": 3, "notif": 23, "notin": 376, "notis": 11, "notit": 77, "notla": 2, "notma": 2, "notme": 32, "notmr": 15, "notmy": 104, "notno": 3, "noto": 26, "notof": 168, "notoh": 6, "noton": 41, "notor": 8, "notp": 2, "notso": 289, "notst": 2, "nott": 2, "notth": 2, "notto": 785, "notup": 30, "notus": 6, "notv": 2, "notvs": 2, "notwe": 29, "notwo": 10, "notx": 2, "notye": 31, "nouna": 2, "noup": 2, "nouse": 55, "novas": 2, "novat": 3, "novby": 3, "novin": 2, "novmy": 2, "novp": 2, "novse": 2, "nowa": 71, "nowaf": 4, "nowah": 3, "nowam": 5, "nowan": 11, "nowar": 7, "nowas": 74, "nowat": 44, "nowax": 2, "noway": 38, "nowbe": 55, "nowby": 22, "nowd": 2, "nowde": 2, "nowdo": 25, "nowdr": 2, "nowe": 8, "nowed": 2, "noweh": 2, "nowex": 2, "nowgo": 14, "nowha": 3, "nowhe": 130, "nowho": 2, "nowhy": 3, "nowi": 307, "nowif": 67, "nowim": 2, "nowin": 129, "nowis": 58, "nowit": 111, "nowlo": 3, "nowma": 7, "nowmr": 14, "nowmy": 37, "nowno": 21, "nowo": 24, "nowof": 27, "nowoh": 3, "nowon": 31, "nowor": 21, "nowqu": 2, "nows": 4, "nowso": 24, "nowst": 2, "nowto": 130, "nowwe": 67, "nowye": 29, "noye": 3, "noyes": 3, "noyou": 31, "nray": 2, "nroll": 2, "nsand": 6, "nso": 4, "nsor": 2, "ntgo": 2, "nthe": 3, "ntto": 2, "ntv": 2, "ntwo": 2, "nudea": 2, "numbd": 2, "numbi": 2, "nuna": 4, "nunin": 2, "nunof": 2, "nursd": 2, "nuthe": 4, "nuti": 2, "nutif": 2, "nutit": 2, "nutno": 2, "nutof": 2, "nuton": 2, "nutor": 2, "nutsi": 2, "nutta": 2, "nwas": 2, "nwhen": 2, "nwill": 2, "nwith": 2, "nya": 2, "nybut": 2, "nydec": 2, "nyin": 2, "nyis": 2, "nymrs": 2, "nythe": 3, "nyuin": 2, "nyuit": 2, "oadam": 2, "oahab": 2, "oair": 2, "oakby": 2, "oakin": 3, "oakis": 2, "oakor": 2, "oall": 4, "oan": 2, "oand": 2, "oara": 3, "oaras": 2, "oarhe": 2, "oarin": 4, "oarm": 2, "oaror": 2, "oarso": 2, "oasas": 2, "oathi": 4, "oaths": 3, "obaal": 2, "obaku": 2, "obard": 3, "obat": 2, "obde": 3, "obeof": 2, "obeya": 2, "obeyd": 2, "obeyi": 4, "obeyn": 2, "obii": 2, "obior": 2, "obo": 2, "obook": 3, "oboy": 2, "obut": 2, "oby": 2, "ocity": 7, "oclap": 2, "ocold": 2, "ocome": 3, "octai": 2, "octap": 2, "octhe": 2, "octin": 2, "octle": 2, "odan": 2, "oday": 3, "odays": 6, "odda": 3, "oddas": 2, "oddi": 4, "oddin": 2, "oddit": 4, "oddto": 4, "oddwe": 2, "odear": 3, "odeed": 2, "odei": 2, "oderi": 2, "odina": 2, "odon": 2, "odori": 2, "odyes": 2, "oelam": 2, "oer": 83, "oermy": 2, "oeve": 3, "ofa": 3469, "ofaab": 2, "ofab": 2, "ofact": 2, "ofadc": 3, "ofads": 3, "ofaf": 110, "ofage": 40, "ofai": 15, "ofaid": 4, "ofain": 2, "ofair": 43, "ofaj": 20, "ofale": 6, "ofall": 1388, "ofam": 6, "ofami": 2, "ofan": 632, "ofand": 102, "ofann": 4, "ofany": 339, "ofar": 2, "ofarc": 3, "ofard": 2, "ofare": 2, "ofart": 36, "ofas": 48, "ofasa": 21, "ofash": 3, "ofask": 2, "ofat": 34, "ofaug": 2, "ofawe": 5, "ofazs": 2, "ofb": 5, "ofbab": 3, "ofbad": 16, "ofbag": 2, "ofbar": 2, "ofbat": 2, "ofbay": 2, "ofbec": 4, "ofbed": 14, "ofbeg": 2, "ofbel": 2, "ofben": 3, "ofbid": 2, "ofbig": 6, "ofbix": 2, "ofbod": 2, "ofbop": 3, "ofbox": 4, "ofboy": 5, "ofbs": 2, "ofbun": 2, "ofbut": 36, "ofbuz": 2, "ofbw": 3, "ofby": 21, "ofc": 15, "ofcal": 2, "ofcan": 2, "ofcap": 2, "ofcar": 3, "ofcis": 2, "ofcm": 2, "ofcow": 2, "ofcox": 2, "ofcps": 2, "ofcr": 2, "ofcry": 2, "ofcut": 2, "ofcwt": 2, "ofd": 3, "ofdag": 3, "ofdan": 42, "ofday": 39, "ofde": 9, "ofdec": 3, "ofdew": 6, "ofdia": 3, "ofdid": 2, "ofdim": 5, "ofdo": 3, "ofdon": 3, "ofdor": 7, "ofdr": 21, "ofdry": 5, "ofdu": 8, "ofdue": 2, "ofe": 4, "ofear": 3, "ofebb": 3, "ofegg": 3, "ofel": 4, "ofeld": 3, "ofeli": 9, "ofely": 2, "ofem": 17, "ofend": 4, "ofeqn": 2, "ofer": 2, "oferi": 2, "ofeve": 17, "ofewe": 2, "ofeye": 3, "off": 8, "offa": 45, "offaf": 2, "offah": 2, "offan": 5, "offar": 10, "offas": 26, "offat": 45, "offby": 26, "offde": 2, "offed": 2, "offew": 3, "offhe": 27, "offi": 22, "offif": 10, "offig": 6, "offin": 75, "offir": 9, "offis": 5, "offit": 16, "offm": 2, "offmr": 3, "offmy": 34, "offno": 3, "offo": 3, "offoe": 2, "offof": 7, "offoh": 4, "offol": 2, "offon": 14, "offor": 34, "offso": 17, "offst": 2, "offt": 7, "offth": 2, "offto": 99, "offun": 9, "offup": 2, "offwe": 8, "ofg": 4, "ofgad": 53, "ofgas": 5, "ofgay": 7, "ofgel": 2, "ofgen": 2, "ofget": 2, "ofgin": 6, "ofgnp": 6, "ofgoa": 2, "ofgod": 1235, "ofgov": 2, "ofgum": 2, "ofgun": 3, "ofguy": 4, "ofh": 6, "ofha": 2, "ofhad": 5, "ofhal": 4, "ofham": 9, "ofhar": 5, "ofhas": 4, "ofhay": 6, "ofhe": 14, "ofhen": 2, "ofher": 1357, "ofhes": 2, "ofhim": 664, "ofhis": 3500, "ofhms": 2, "ofho": 2, "ofhon": 5, "ofhot": 15, "ofhow": 48, "ofhur": 9, "ofhys": 2, "ofi": 28, "ofice": 16, "oficy": 2, "ofie": 2, "ofif": 6, "ofii": 2, "ofile": 2, "ofill": 14, "ofin": 44, "ofind": 2, "ofink": 2, "ofioy": 3, "ofir": 2, "ofis": 15, "ofit": 1177, "ofits": 425, "ofj": 3, "ofja": 2, "ofjar": 2, "ofjaw": 2, "ofje": 2, "ofjed": 2, "ofjem": 4, "ofjh": 2, "ofjim": 2, "ofjob": 10, "ofjoe": 2, "ofjoy": 52, "ofk": 2, "ofkew": 2, "ofkey": 5, "ofkg": 2, "ofkin": 5, "ofkoz": 5, "ofkv": 2, "ofl": 8, "ofla": 3, "oflag": 2, "oflao": 3, "oflaw": 36, "oflay": 4, "oflb": 5, "ofle": 2, "oflet": 3, "oflex": 2, "oflid": 2, "oflie": 2, "oflod": 3, "oflon": 2, "oflos": 7, "oflot": 7, "oflow": 26, "oflt": 2, "oflud": 2, "ofluz": 3, "ofm": 4, "ofma": 3, "ofmad": 3, "ofman": 423, "ofmap": 2, "ofmay": 17, "ofme": 258, "ofmea": 2, "ofmee": 3, "ofmen": 368, "ofmg": 3, "ofmgl": 2, "ofml": 2, "ofmm": 3, "ofmme": 2, "ofmne": 2, "ofmph": 3, "ofmr": 198, "ofmrs": 150, "ofmt": 2, "ofmud": 5, "ofmy": 1096, "ofn": 4, "ofnbc": 2, "ofneo": 2, "ofner": 13, "ofnet": 2, "ofnew": 157, "ofng": 2, "ofno": 98, "ofnod": 3, "ofnoe": 4, "ofnor": 3, "ofnot": 33, "ofnow": 3, "ofns": 2, "ofnun": 30, "ofnyu": 2, "ofo": 4, "ofoak": 5, "ofodd": 5, "ofof": 7, "ofog": 12, "ofoh": 5, "ofoil": 59, "ofold": 174, "ofon": 16, "ofone": 322, "ofono": 2, "ofop": 2, "ofor": 26, "ofore": 3, "ofoul": 2, "ofour": 643, "ofout": 2, "ofox": 3, "ofp": 9, "ofpan": 2, "ofpas": 3, "ofpay": 4, "ofpbs": 2, "ofpea": 2, "ofpeg": 2, "ofper": 17, "ofphi": 2, "ofpie": 3, "ofpig": 2, "ofpop": 2, "ofpre": 2, "ofpsa": 2, "ofpsi": 2, "ofpua": 2, "ofpul": 2, "ofpur": 2, "ofq": 6, "ofr": 3, "ofram": 3, "ofrat": 2, "ofraw": 7, "ofred": 41, "ofrev": 4, "ofrex": 2, "ofrh": 2, "ofrom": 2, "ofrot": 3, "ofrow": 2, "ofroy": 2, "ofrpm": 2, "ofrte": 2, "ofrum": 3, "ofs": 5, "ofsad": 3, "ofsam": 4, "ofsan": 8, "ofsap": 2, "ofsay": 2, "ofsba": 2, "ofsd": 2, "ofsea": 21, "ofsec": 2, "ofsee": 2, "ofsem": 2, "ofsen": 4, "ofset": 2, "ofsex": 11, "ofshe": 9, "ofsi": 2, "ofsia": 2, "ofsin": 41, "ofsir": 33, "ofsix": 21, "ofsky": 4, "ofsmu": 2, "ofso": 61, "ofsob": 2, "ofsr": 3, "ofss": 2, "ofst": 47, "ofsun": 13, "ofsur": 2, "ofsx": 2, "oft": 9, "oftam": 2, "oftas": 9, "oftax": 13, "oftbe": 2, "oftea": 6, "often": 42, "ofth": 3, "ofthe": 28911, "ofthy": 709, "oftic": 2, "oftin": 8, "oftis": 2, "oftit": 2, "oftmy": 2, "oftnt": 3, "ofto": 49, "oftob": 3, "oftof": 3, "oftom": 4, "ofton": 2, "oftoo": 4, "oftop": 2, "oftow": 5, "oftsh": 6, "oftso": 2, "oftto": 2, "oftv": 5, "oftwe": 2, "oftwo": 143, "ofu": 5, "ofuh": 2, "ofull": 3, "ofun": 2, "ofuna": 2, "ofup": 3, "ofups": 2, "ofur": 4, "ofuri": 5, "ofus": 258, "ofuse": 23, "ofuz": 5, "ofv": 3, "ofva": 2, "ofvan": 3, "ofvia": 2, "ofvs": 16, "ofvse": 3, "ofw": 4, "ofwar": 156, "ofwas": 12, "ofwax": 6, "ofway": 15, "ofwe": 2, "ofwet": 5, "ofwho": 8, "ofwhy": 7, "ofwit": 7, "ofwoe": 24, "ofwtv": 7, "ofyc": 2, "ofye": 30, "ofyes": 4, "ofyet": 4, "ofyew": 2, "ofyon": 2, "ofyou": 395, "ofzen": 5, "ofzg": 17, "ofzin": 9, "ofziz": 2, "ofzur": 2, "ogate": 2, "ogin": 5, "ogive": 12, "oglad": 2, "ogod": 122, "ogog": 4, "ogot": 2, "ogres": 2, "ogthe": 6, "oha": 6, "ohad": 2, "ohah": 2, "ohall": 3, "ohand": 6, "ohare": 2, "ohas": 10, "ohat": 2, "ohay": 4, "ohben": 2, "ohboy": 2, "ohbut": 15, "ohby": 2, "ohcut": 2, "ohday": 2, "ohdid": 2, "ohdo": 13, "ohdon": 13, "ohe": 3, "ohead": 2, "ohell": 2, "ohelp": 2, "ohere": 2, "ohfie": 5, "ohfor": 7, "ohget": 2, "ohgo": 4, "ohgod": 14, "ohha": 2, "ohhad": 3, "ohhe": 20, "ohhed": 2, "ohhes": 3, "ohhis": 2, "ohho": 3, "ohhow": 23, "ohi": 74, "ohid": 3, "ohif": 13, "ohim": 4, "ohin": 3, "ohios": 7, "ohis": 2, "ohisn": 3, "ohit": 15, "ohits": 2, "ohive": 2, "ohjem": 2, "ohla": 6, "ohlet": 7, "ohm": 2, "ohma": 6, "ohman": 2, "ohmay": 3, "ohme": 2, "ohmr": 12, "ohmrs": 6, "ohmy": 55, "ohno": 86, "ohnoo": 2, "ohnot": 4, "ohnow": 4, "ohof": 2, "ohoh": 16, "ohohe": 3, "ohope": 2, "ohow": 11, "ohpip": 2, "ohput": 2, "ohsam": 2, "ohsay": 4, "ohsee": 2, "ohshe": 11, "ohsir": 11, "ohso": 6, "ohthe": 32, "ohtis": 4, "ohto": 2, "ohtry": 2, "ohwe": 6, "ohwho": 5, "ohwhy": 5, "ohwoe": 4, "ohwon": 3, "ohye": 9, "ohyes": 71, "ohyet": 2, "ohyou": 42, "oif": 4, "oilan": 4, "oilas": 2, "oilat": 2, "oilby": 3, "oilco": 2, "oild": 2, "oilhe": 3, "oili": 3, "oilin": 13, "oilis": 10, "oilit": 2, "oilmy": 4, "oilno": 2, "oilof": 12, "oilon": 7, "oilor": 5, "oiloz": 2, "oilso": 2, "oilto": 6, "oilwe": 2, "oilye": 2, "oin": 3, "oit": 7, "ojob": 3, "ojoy": 2, "okayi": 3, "okeep": 2, "okhe": 2, "oki": 3, "okim": 2, "oking": 49, "okshe": 2, "okso": 3, "oland": 5, "olda": 9, "oldan": 2, "oldas": 19, "oldat": 2, "oldaz": 2, "oldby": 4, "olddo": 3, "oldhe": 7, "oldi": 11, "oldif": 3, "oldin": 9, "oldis": 11, "oldit": 8, "oldlo": 2, "oldm": 28, "oldme": 2, "oldmr": 13, "oldno": 2, "oldo": 3, "oldon": 3, "oldor": 9, "oldso": 2, "oldst": 2, "oldto": 10, "oldwe": 3, "oldye": 2, "olet": 6, "olife": 7, "olord": 355, "oloss": 2, "olove": 10, "omaid": 2, "oman": 14, "omans": 2, "omany": 2, "omate": 2, "ome": 9, "omen": 3, "omeni": 2, "omeof": 2, "omine": 4, "omoab": 2, "omoon": 3, "omost": 5, "omuch": 2, "omurd": 2, "omuse": 2, "omy": 114, "ona": 826, "onaf": 11, "onage": 2, "onair": 2, "onall": 98, "oname": 3, "onan": 88, "onand": 171, "onany": 46, "onare": 2, "onart": 3, "onas": 36, "onask": 2, "onat": 22, "onath": 2, "onaug": 2, "onaye": 2, "onbbc": 2, "onbe": 4, "onbig": 6, "onbow": 2, "onbox": 3, "onboy": 2, "onbut": 28, "onby": 47, "onc": 10, "oncea": 47, "onced": 2, "oncei": 35, "onceo": 3, "oncet": 2, "onch": 2, "onde": 4, "ondec": 3, "ondid": 2, "ondo": 2, "ondr": 2, "ondry": 11, "ondu": 2, "onea": 30, "oneam": 6, "onean": 6, "oneas": 37, "oneat": 35, "oneb": 2, "onebe": 9, "oneby": 43, "onedo": 5, "onego": 4, "onehe": 53, "onei": 68, "oneid": 2, "oneif": 12, "oneim": 2, "onein": 101, "oneis": 113, "oneit": 22, "onem": 5, "oneme": 2, "onemr": 4, "onemy": 3, "onenc": 2, "onend": 11, "oneno": 8, "oneo": 4, "oneof": 1761, "oneoh": 7, "oneon": 44, "oneor": 118, "oneox": 2, "onepa": 2, "ones": 87, "onesa": 5, "onesi": 9, "oneso": 24, "oneto": 184, "oneup": 2, "oneus": 3, "oneve": 2, "onew": 2, "onewe": 17, "onfar": 2, "onfeb": 9, "onfor": 39, "ongen": 2, "ongo": 4, "ongod": 7, "onhal": 2, "onham": 2, "onhas": 2, "onhe": 35, "onhed": 2, "onher": 320, "onhim": 222, "onhis": 749, "onhot": 3, "onhow": 18, "onhr": 2, "oni": 48, "onif": 6, "onile": 3, "onin": 77, "onion": 2, "onis": 10, "onit": 174, "onits": 97, "onive": 2, "onjan": 5, "onjar": 3, "onjed": 2, "onjob": 3, "onkc": 2, "onkey": 3, "onla": 3, "onlay": 2, "onled": 2, "onlet": 3, "onlid": 2, "onlya": 276, "onlyi": 28, "onlyo": 5, "onma": 2, "onmad": 2, "onman": 14, "onmay": 30, "onme": 102, "onmen": 7, "onmid": 2, "onmr": 18, "onmrs": 27, "onmud": 2, "onmy": 201, "onnet": 3, "onnew": 11, "onno": 18, "onnod": 2, "onnor": 4, "onnot": 5, "onnov": 4, "onnow": 14, "ono": 5, "onoct": 6, "onof": 12, "onoff": 3, "onoh": 2, "onol": 2, "onold": 6, "onon": 8, "onone": 147, "onor": 20, "onour": 84, "onout": 5, "onow": 5, "onp": 4, "onpay": 2, "onpp": 2, "onq": 8, "onr": 2, "onre": 2, "onred": 2, "onrob": 2, "ons": 3, "onsan": 3, "onsax": 2, "onsea": 7, "onsee": 3, "onsex": 3, "onshe": 13, "onsir": 8, "onsix": 3, "onsky": 2, "onso": 37, "ont": 14, "ontap": 3, "ontax": 3, "ontby": 2, "onth": 10, "onthe": 5253, "onthy": 45, "ontis": 3, "onto": 215, "ontoa": 12, "ontoo": 2, "ontop": 51, "ontry": 2, "ontv": 7, "ontwo": 19, "onu": 2, "onumt": 2, "onup": 5, "onus": 40, "onv": 2, "onvan": 2, "onvs": 5, "onwar": 2, "onwas": 6, "onwe": 7, "onwee": 2, "onwet": 2, "onwho": 5, "onwhy": 3, "onwoe": 2, "onwon": 2, "onye": 3, "onyes": 2, "onyet": 6, "onyl": 2, "onyon": 2, "onyou": 59, "onzg": 3, "oon": 2, "oone": 2, "oopof": 4, "oos": 2, "oour": 5, "opa": 2, "opand": 3, "opast": 2, "opd": 2, "opeck": 2, "opemy": 2, "opena": 14, "opend": 8, "openi": 4, "opfor": 2, "ophei": 9, "opheo": 4, "opin": 2, "opity": 2, "opno": 2, "opoor": 3, "opusa": 2, "ora": 355, "orab": 2, "orabe": 2, "oract": 4, "orad": 2, "oraf": 6, "orage": 4, "orah": 3, "oraim": 2, "orain": 2, "orair": 4, "oraj": 2, "orall": 18, "oram": 9, "oran": 68, "orand": 2, "orany": 139, "orare": 15, "orarm": 4, "orarp": 2, "orart": 5, "oras": 59, "orass": 2, "orat": 102, "oraya": 2, "orb": 4, "orba": 2, "orbad": 26, "orbag": 2, "orbas": 2, "orbd": 2, "orbe": 25, "orbee": 2, "orbeg": 2, "orbhe": 2, "orbin": 2, "orbis": 2, "orblo": 2, "orbo": 2, "orbof": 5, "orbon": 2, "orboo": 2, "orbor": 2, "orbsi": 2, "orbut": 4, "orbuy": 2, "orby": 87, "orc": 2, "orcab": 2, "orcan": 11, "orcod": 4, "orcon": 2, "orcow": 2, "orcry": 4, "orcut": 4, "ord": 2, "ordam": 2, "orday": 6, "ordc": 2, "orden": 3, "ordid": 13, "ordie": 6, "ordim": 2, "ordis": 2, "ordo": 19, "ordog": 2, "ordos": 2, "ordry": 4, "ordu": 2, "ordye": 2, "ore": 30, "orebb": 2, "oregg": 2, "orego": 2, "orehe": 2, "orein": 2, "orend": 4, "orere": 4, "oreto": 3, "orewe": 2, "oreye": 3, "orfan": 2, "orfar": 4, "orfat": 2, "orfig": 2, "orfin": 2, "orfir": 2, "orfit": 4, "orfly": 2, "orfoe": 2, "orfor": 87, "orftp": 2, "orgas": 4, "orgay": 4, "orget": 9, "orgo": 8, "orgod": 3, "orgya": 2, "orhad": 9, "orhas": 6, "orhay": 2, "orhe": 28, "orhee": 2, "orher": 48, "orhid": 2, "orhim": 4, "orhip": 2, "orhis": 88, "orhit": 2, "orhog": 2, "orhot": 2, "orhow": 22, "ori": 57, "orif": 108, "orill": 11, "orin": 210, "orini": 2, "orioy": 2, "oris": 36, "orit": 24, "orits": 12, "orjam": 2, "orjaw": 2, "orjew": 2, "orjoe": 2, "orjoy": 4, "orken": 2, "orkid": 3, "orkwe": 2, "orlaw": 2, "orlay": 2, "orlbs": 2, "orleo": 2, "orlet": 5, "orlie": 2, "orlo": 3, "orlow": 5, "orlp": 2, "ormad": 2, "orman": 10, "ormax": 2, "ormay": 20, "orme": 3, "ormen": 4, "ormid": 2, "ormr": 9, "ormrs": 4, "ormy": 24, "ornay": 2, "ornew": 7, "orno": 58, "ornot": 140, "ornow": 2, "orns": 2, "ornut": 2, "oro": 2, "orof": 132, "oroff": 4, "oroil": 4, "orold": 10, "oroly": 2, "orome": 2, "oron": 46, "orone": 27, "oror": 5, "orork": 2, "orory": 2, "orose": 2, "orour": 8, "orout": 15, "orowt": 2, "orper": 7, "orpit": 2, "orpm": 2, "orpot": 2, "orput": 5, "orr": 2, "orran": 2, "orred": 5, "orrio": 2, "orrum": 2, "orrun": 4, "ors": 2, "orsad": 2, "orsat": 6, "orsaw": 4, "orsay": 12, "orsea": 5, "orsee": 8, "orset": 4, "orsex": 3, "orshe": 30, "orsir": 2, "orsit": 6, "orsix": 19, "orsky": 2, "orsly": 2, "orso": 65, "orson": 4, "orst": 2, "orsun": 3, "ort": 2, "ortax": 4, "ortea": 2, "orted": 2, "orten": 22, "orth": 4, "orthe": 478, "orthy": 8, "orto": 207, "ortoo": 13, "ortop": 3, "ortoy": 2, "ortry": 2, "ortwo": 248, "orup": 4, "oruse": 3, "orvex": 2, "orvia": 2, "orvse": 2, "orwar": 2, "orwas": 22, "orwe": 11, "orwet": 2, "orwho": 41, "orwhy": 11, "orwit": 3, "orwoe": 7, "orwon": 2, "oryan": 20, "orye": 2, "oryet": 2, "oryj": 2, "oryou": 40, "oryr": 2, "osane": 2, "osave": 2, "osay": 2, "osea": 7, "oseei": 2, "osend": 2, "osent": 2, "oship": 6, "oshow": 2, "osin": 2, "osing": 4, "osir": 2, "oso": 2, "osoil": 2, "osole": 3, "oson": 10, "osons": 2, "osoul": 41, "ospan": 2, "osra": 2, "osri": 4, "osrit": 2, "ostar": 4, "ostay": 2, "ostep": 2, "osuch": 4, "osumm": 2, "osun": 5, "osuns": 2, "otake": 2, "otan": 3, "oth": 16, "othat": 21, "othe": 48, "othem": 2, "othen": 6, "othis": 5, "othou": 46, "otis": 2, "otisg": 2, "otism": 2, "oto": 25, "otoo": 2, "oturn": 3, "otyre": 2, "ouest": 2, "ouic": 2, "oumof": 2, "oupon": 2, "ourbs": 2, "ourmr": 5, "ouro": 2, "ours": 7, "ourso": 2, "ousor": 2, "outa": 169, "outan": 12, "outas": 52, "outat": 81, "outby": 65, "outdo": 4, "outdr": 3, "outhe": 53, "outi": 48, "outif": 26, "outin": 224, "outis": 5, "outit": 30, "outjo": 2, "outma": 2, "outme": 2, "outmr": 9, "outmy": 57, "outno": 9, "outo": 11, "outof": 3172, "outoh": 7, "outon": 90, "outor": 12, "outpa": 2, "outso": 23, "outt": 2, "outto": 321, "outup": 3, "outus": 2, "outv": 2, "outwe": 8, "outye": 3, "ovain": 2, "ovast": 3, "oveni": 3, "overa": 132, "overf": 4, "overi": 16, "overo": 2, "ovine": 2, "owall": 2, "oware": 2, "owas": 3, "owd": 3, "owe": 2, "oweda": 4, "owei": 2, "owein": 2, "oweit": 6, "owell": 4, "oweme": 2, "owemo": 2, "oweno": 3, "oweon": 2, "owere": 2, "owesa": 2, "oweto": 4, "oweus": 2, "owhat": 8, "owhen": 3, "owho": 3, "owhy": 4, "owife": 3, "owild": 4, "owith": 2, "owito": 2, "owlas": 2, "owlof": 2, "owlor": 2, "owls": 4, "owna": 9, "ownan": 2, "ownas": 5, "ownat": 6, "ownb": 2, "ownbe": 2, "ownby": 4, "ownd": 2, "ownhe": 15, "owni": 23, "ownif": 4, "ownin": 12, "ownis": 6, "ownit": 14, "ownme": 2, "ownmr": 6, "ownmy": 3, "ownno": 3, "owno": 4, "ownof": 2, "ownon": 2, "ownor": 8, "ownsa": 5, "ownso": 7, "ownto": 15, "ownwe": 3, "oxa": 2, "oxand": 17, "oxena": 2, "oxfor": 5, "oxin": 3, "oxis": 2, "oxlo": 2, "oxnor": 4, "oxof": 2, "oxon": 2, "oxor": 15, "oxthe": 4, "oxwas": 2, "oxyou": 2, "oye": 68, "oyear": 4, "oyes": 5, "oyet": 5, "oyong": 2, "oyork": 2, "oyou": 27, "ozbut": 2, "ozcan": 2, "ozion": 7, "ozthe": 2, "paand": 2, "pacea": 2, "pacei": 3, "packd": 5, "padan": 3, "padin": 2, "padon": 2, "pagei": 2, "pahad": 3, "pahe": 4, "paho": 2, "pahto": 2, "pai": 2, "paida": 8, "paidi": 4, "paidl": 2, "paili": 2, "pain": 2, "paina": 5, "paini": 4, "pait": 2, "paits": 2, "palei": 3, "palla": 2, "palma": 2, "palmi": 2, "pamrs": 2, "pana": 2, "panat": 2, "pand": 17, "panin": 2, "panis": 2, "panit": 3, "panof": 5, "panor": 3, "paoti": 2, "papa": 2, "papai": 11, "papas": 3, "paray": 2, "pare": 2, "parka": 3, "parki": 4, "paron": 3, "parta": 5, "partb": 2, "partc": 2, "partd": 2, "parte": 2, "partf": 2, "partg": 2, "parti": 32, "parto": 3, "pas": 3, "pasde": 6, "passa": 5, "passd": 35, "passi": 6, "passo": 2, "pasta": 6, "pasti": 11, "pasto": 2, "pat": 3, "patea": 2, "patei": 2, "pathe": 3, "pathi": 2, "pati": 2, "paton": 2, "paula": 5, "pauli": 8, "paulr": 3, "pauls": 24, "paulw": 2, "pausd": 3, "pawas": 4, "pawhe": 2, "pawi": 2, "pawin": 6, "pawof": 5, "pawto": 2, "pawwe": 2, "paya": 18, "payan": 2, "payas": 5, "payat": 2, "payhe": 2, "payi": 6, "payif": 2, "payim": 2, "payin": 3, "payis": 3, "payit": 11, "payl": 2, "payme": 6, "paymy": 11, "payof": 4, "payor": 3, "payox": 2, "paysa": 3, "payso": 2, "payto": 7, "payup": 2, "payus": 2, "payye": 2, "pbe": 3, "pbut": 2, "pby": 6, "pcan": 2, "pdiin": 2, "pdo": 2, "peakd": 2, "peepd": 3, "peghe": 3, "pegin": 2, "pegor": 2, "pena": 2, "penby": 2, "peni": 2, "penin": 8, "penof": 8, "penor": 2, "penso": 2, "peors": 2, "peraf": 2, "peraj": 2, "perhr": 2, "perml": 3, "peros": 2, "peroz": 4, "perse": 9, "petit": 2, "petof": 2, "pfish": 2, "pfor": 6, "pgets": 2, "pha": 2, "phas": 5, "phave": 4, "phe": 2, "phfor": 2, "philg": 2, "phili": 4, "phooi": 2, "phwas": 2, "piat": 2, "picka": 5, "pickd": 5, "pieas": 3, "pieif": 2, "pieis": 4, "pieit": 3, "piemy": 2, "pieor": 2, "piesi": 3, "pieup": 2, "pigi": 2, "pigin": 2, "pigmr": 2, "pigmy": 2, "pigor": 4, "pigs": 2, "pigto": 2, "piis": 2, "pikea": 3, "pilli": 2, "pinhe": 3, "pini": 3, "pinin": 3, "pinis": 3, "pinof": 3, "pinon": 2, "pinor": 2, "pinso": 2, "pinti": 2, "pinto": 2, "pipa": 2, "pipat": 2, "pipby": 2, "pipea": 2, "pipei": 4, "pipes": 2, "piphe": 5, "pipi": 2, "pipin": 4, "pipon": 3, "pipor": 2, "pips": 8, "pipwe": 2, "pipye": 2, "pis": 7, "pit": 4, "pitas": 3, "pitbe": 2, "pitby": 3, "pithe": 6, "piti": 5, "pitin": 6, "pitit": 2, "pitof": 10, "piton": 4, "pitor": 4, "pitto": 3, "pitwe": 2, "pitya": 5, "pitye": 2, "pityi": 7, "placd": 6, "plact": 2, "plana": 5, "playa": 23, "playd": 3, "playi": 10, "plays": 2, "plcan": 2, "plego": 2, "plei": 2, "pleo": 2, "plewe": 2, "plota": 2, "plusa": 13, "plymy": 2, "pma": 3, "pmand": 9, "pmat": 3, "pmbe": 2, "pmfor": 3, "pmi": 2, "pmin": 3, "pmon": 4, "pmor": 2, "pmris": 2, "pmshe": 2, "pmthe": 7, "pmto": 3, "pmwe": 2, "pocoe": 2, "podin": 2, "podmr": 2, "podof": 2, "poein": 2, "poeit": 2, "poema": 2, "poemi": 7, "poeof": 2, "poeta": 4, "poeti": 5, "poeto": 2, "poets": 2, "pof": 4, "poi": 2, "poisd": 9, "pokea": 2, "pokit": 3, "polat": 2, "poldo": 2, "polea": 2, "polei": 2, "poles": 2, "polhe": 3, "poli": 6, "polit": 2, "polmy": 4, "poloh": 3, "polth": 2, "pon": 2, "ponda": 2, "pondo": 2, "ponyi": 2, "poola": 4, "pooli": 5, "poora": 2, "poori": 5, "popea": 2, "popei": 2, "pophe": 2, "popin": 3, "popup": 2, "por": 2, "pori": 5, "porif": 2, "poris": 3, "porka": 2, "porki": 2, "porta": 3, "posea": 2, "posei": 2, "posta": 3, "posti": 3, "pota": 3, "potby": 2, "pothe": 4, "poti": 2, "potin": 6, "potis": 2, "potit": 2, "potmr": 2, "poto": 2, "potof": 20, "poton": 4, "potor": 2, "potso": 2, "potts": 2, "pourd": 9, "powrd": 2, "pozgo": 2, "ppa": 2, "ppb": 2, "ppc": 2, "ppet": 2, "ppin": 2, "ppthe": 3, "pqas": 2, "pqp": 2, "praya": 2, "prayi": 3, "preyi": 2, "preys": 2, "profc": 2, "profj": 2, "proof": 2, "proor": 3, "proud": 6, "prowi": 2, "prowo": 2, "pryin": 2, "pryit": 3, "pryso": 2, "pryup": 2, "pshe": 2, "psnow": 3, "psuch": 2, "ptake": 2, "ptand": 2, "ptaor": 2, "ptcas": 2, "ptch": 2, "ptcis": 2, "pthe": 7, "pthey": 2, "pthus": 2, "pto": 4, "puffd": 2, "pukei": 2, "pula": 2, "puld": 3, "pulla": 2, "pulld": 3, "pulli": 2, "pullt": 2, "punsi": 2, "purea": 2, "purei": 2, "pureo": 2, "purgd": 3, "pusha": 4, "pushd": 3, "puta": 95, "putaf": 2, "putan": 35, "putat": 3, "putby": 12, "putem": 3, "puthe": 7, "puti": 4, "putif": 2, "putin": 96, "putit": 173, "putme": 33, "putmy": 52, "putno": 8, "putof": 4, "puton": 144, "putpa": 2, "putsa": 4, "putso": 4, "putth": 2, "putto": 130, "putup": 45, "putus": 7, "putvp": 3, "putwe": 2, "putye": 5, "pwe": 2, "pwhat": 2, "pwhen": 2, "pyes": 3, "pyeto": 2, "qand": 3, "qare": 2, "qas": 2, "qat": 6, "qbe": 2, "qboth": 2, "qbut": 2, "qeach": 2, "qfor": 3, "qhad": 2, "qhas": 2, "qin": 10, "qis": 3, "qit": 2, "qnear": 2, "qthe": 4, "qthis": 2, "quah": 2, "quas": 2, "quaye": 2, "qube": 2, "qubut": 3, "qudid": 3, "qufor": 2, "quhe": 2, "quhow": 4, "qui": 5, "quile": 2, "quit": 2, "qulet": 2, "qumad": 2, "qunay": 3, "quno": 4, "quo": 2, "quoa": 2, "quoh": 6, "quoin": 2, "quso": 2, "quthe": 2, "quto": 3, "quun": 2, "quwhy": 2, "qwe": 2, "racd": 2, "racea": 4, "racei": 7, "raceo": 2, "racka": 2, "rackd": 3, "rads": 2, "rafdo": 2, "ragea": 2, "rageh": 2, "ragei": 4, "raghe": 3, "ragof": 3, "ragor": 2, "ragsi": 3, "ragto": 3, "raina": 3, "raini": 5, "raisd": 14, "raj": 2, "raki": 2, "rama": 5, "ramin": 2, "ramof": 13, "ramon": 3, "ramor": 2, "rams": 2, "ramsi": 2, "ramto": 2, "rana": 16, "ranas": 9, "ranat": 3, "ranby": 5, "rand": 7, "ranga": 3, "rangi": 2, "ranhe": 7, "rani": 4, "ranin": 7, "ranit": 3, "ranki": 2, "ranon": 13, "ranso": 3, "ranto": 46, "ranup": 21, "rapat": 5, "rapea": 2, "rapgo": 2, "raphe": 2, "rare": 2, "rasd": 2, "rat": 2, "rata": 2, "ratas": 2, "ratea": 5, "ratee": 2, "ratei": 7, "ratof": 2, "ratwe": 2, "rayat": 2, "rayd": 2, "rayif": 2, "rayis": 2, "rayof": 6, "raysa": 2, "rayto": 3, "rbe": 2, "rby": 2, "rcaby": 2, "rcan": 2, "rcash": 2, "rcell": 2, "rcobb": 2, "rdaj": 2, "rdare": 2, "rdas": 2, "rdboy": 3, "rdin": 2, "rdof": 2, "rdthe": 2, "rdto": 2, "rdunn": 2, "rea": 10, "reada": 18, "readg": 2, "readi": 2, "reala": 2, "reali": 3, "reall": 6, "rean": 3, "reapd": 2, "rearo": 2, "reas": 3, "reat": 2, "rebe": 2, "reckd": 2, "redas": 9, "redat": 2, "redby": 2, "redgo": 2, "redi": 2, "redin": 4, "redit": 4, "redmr": 5, "redo": 2, "redof": 3, "redor": 6, "redto": 2, "redup": 2, "redv": 2, "redwe": 2, "reeld": 3, "reere": 2, "rehis": 4, "rei": 2, "rein": 2, "reis": 2, "remad": 4, "reme": 2, "remem": 2, "remi": 2, "renot": 11, "renta": 8, "reon": 3, "reour": 2, "repb": 2, "repsv": 2, "reso": 6, "resow": 2, "resta": 4, "resti": 17, "resto": 5, "rethe": 9, "reto": 3, "retoo": 2, "retop": 2, "revas": 2, "revdr": 2, "revj": 3, "revmr": 6, "revr": 2, "revt": 4, "rfrom": 2, "rhas": 2, "rheas": 3, "ribbd": 3, "ribhe": 2, "ribit": 2, "ribof": 3, "ribor": 2, "ribsa": 2, "ribsi": 2, "ricea": 2, "ricem": 2, "richi": 5, "ridea": 4, "ridme": 3, "ridof": 43, "ridon": 2, "ridus": 2, "riein": 2, "riga": 4, "rigas": 2, "rigit": 4, "rimd": 2, "rimof": 9, "ringa": 4, "ringi": 2, "ringo": 2, "riode": 3, "ripat": 3, "ripor": 2, "ripsa": 2, "ripup": 2, "ris": 3, "risea": 4, "risei": 3, "riseo": 3, "riska": 3, "riskd": 2, "riud": 3, "rmole": 2, "rno": 2, "roada": 8, "roadi": 7, "roado": 2, "roamd": 4, "roard": 2, "robei": 2, "robit": 2, "robmy": 2, "robus": 2, "rocka": 5, "rockd": 2, "rocki": 3, "rockn": 2, "rodas": 2, "rodat": 2, "rodea": 3, "rodhe": 4, "rodi": 2, "rodin": 5, "rodis": 2, "rodit": 2, "rodof": 33, "rodon": 2, "rodor": 4, "rodto": 4, "roeor": 4, "rof": 4, "roh": 2, "rolla": 3, "rolld": 3, "romas": 2, "romea": 2, "romec": 3, "romei": 5, "romes": 5, "roofd": 5, "roofi": 2, "rooma": 20, "roomi": 18, "rooms": 3, "roota": 2, "ropes": 4, "roryi": 3, "roryo": 14, "rorys": 3, "rosea": 5, "roseo": 2, "roses": 4, "rota": 2, "rothe": 2, "rotin": 2, "rotit": 2, "rotof": 2, "rousd": 5, "rowa": 9, "rowan": 2, "rowas": 2, "rowat": 3, "rowby": 2, "rowi": 2, "rowin": 6, "rowit": 3, "rowof": 40, "rowon": 4, "rowor": 3, "royhe": 2, "royis": 3, "royor": 2, "royp": 2, "rpma": 2, "rsand": 2, "rsso": 2, "rsuch": 2, "rthat": 2, "rthe": 2, "rtmad": 2, "rubmy": 2, "rubto": 3, "rudea": 2, "rudei": 3, "ruede": 3, "ruehe": 2, "rugno": 2, "rugof": 2, "rugon": 2, "rugto": 2, "ruina": 4, "ruind": 3, "ruld": 6, "rulea": 3, "rulei": 3, "rumhe": 2, "rumit": 2, "rumum": 2, "runa": 17, "runan": 2, "runas": 11, "runat": 4, "runby": 5, "runem": 2, "runga": 2, "runhe": 2, "runi": 2, "runin": 21, "runis": 2, "runit": 3, "runma": 2, "runmy": 2, "runno": 4, "runof": 6, "runon": 8, "runor": 3, "runsa": 5, "runsi": 2, "runso": 4, "runto": 29, "runup": 15, "runus": 2, "runwe": 3, "runye": 2, "rusha": 2, "rushc": 2, "ruska": 2, "rutha": 2, "rutof": 2, "rwill": 2, "ryco": 2, "ryeas": 2, "ryehe": 2, "ryein": 2, "sacat": 2, "sacks": 4, "sada": 2, "sadah": 2, "sadas": 2, "sadat": 2, "sadin": 3, "sadit": 3, "sadmr": 2, "sado": 3, "sadof": 2, "sador": 3, "sadto": 5, "safea": 2, "safei": 6, "sage": 8, "sages": 2, "sagon": 2, "sah": 2, "sahab": 3, "said": 3, "saida": 70, "saidc": 2, "saidi": 500, "saidl": 2, "saido": 37, "saidt": 2, "saila": 5, "saild": 11, "saili": 2, "sailo": 3, "saim": 2, "saint": 3, "sair": 3, "sakea": 3, "sakei": 19, "sakeo": 8, "salas": 2, "salei": 2, "sall": 80, "salso": 6, "salta": 3, "salti": 2, "salua": 2, "samea": 5, "samee": 2, "samef": 2, "samei": 13, "samel": 2, "sameo": 3, "samf": 2, "samgo": 2, "samhe": 2, "sami": 2, "samin": 3, "samis": 2, "samit": 2, "samno": 2, "samp": 2, "san": 24, "sand": 159, "sandi": 3, "sanga": 7, "sanka": 2, "sanki": 2, "sanne": 2, "sanoe": 2, "sany": 4, "sape": 2, "sapin": 2, "sapof": 3, "sapt": 2, "sare": 4, "sark": 4, "sarm": 13, "sarms": 5, "sarmy": 12, "sart": 2, "sas": 23, "sashi": 2, "sass": 3, "sat": 22, "sata": 10, "satan": 3, "satas": 4, "satat": 28, "satby": 19, "sathe": 2, "satin": 61, "satme": 2, "satof": 2, "saton": 52, "sator": 5, "satso": 3, "satst": 4, "satto": 3, "satup": 23, "sauei": 2, "saula": 3, "sauli": 7, "sauls": 34, "savd": 2, "savea": 9, "sawa": 115, "sawak": 2, "sawan": 14, "sawas": 12, "sawat": 8, "saway": 4, "sawby": 8, "sawd": 2, "sawhe": 8, "sawi": 11, "sawin": 51, "sawit": 88, "sawma": 2, "sawme": 15, "sawmr": 3, "sawmy": 7, "sawno": 30, "sawof": 2, "sawon": 10, "sawor": 6, "sawso": 3, "sawst": 8, "sawt": 2, "sawto": 7, "sawus": 4, "sawwe": 5, "sawye": 2, "saxe": 2, "saxin": 2, "saxle": 2, "saya": 50, "sayaf": 2, "sayam": 2, "sayan": 8, "sayas": 15, "sayat": 11, "saybe": 4, "sayby": 10, "sayde": 3, "saydo": 8, "saydr": 3, "sayeh": 2, "sayen": 2, "saygo": 3, "sayhe": 56, "sayi": 129, "sayif": 23, "sayim": 2, "sayin": 50, "sayis": 28, "sayit": 91, "saylb": 2, "saylo": 2, "sayma": 3, "sayme": 2, "saymr": 3, "saymy": 19, "sayno": 50, "sayo": 5, "sayof": 37, "sayoh": 10, "sayon": 20, "sayor": 10, "saysa": 5, "saysi": 22, "sayso": 49, "sayst": 7, "sayt": 2, "sayto": 170, "sayus": 2, "saywe": 40, "sayye": 33, "sback": 15, "sbad": 3, "sbag": 7, "sbait": 2, "sbald": 3, "sball": 4, "sbare": 4, "sbark": 2, "sbath": 2, "sbato": 2, "sbay": 4, "sbays": 2, "sbe": 5, "sbeak": 3, "sbeam": 7, "sbeau": 2, "sbed": 14, "sbeen": 14, "sbees": 2, "sbell": 4, "sbelt": 2, "sben": 2, "sbene": 2, "sbent": 2, "sbest": 7, "sbig": 5, "sbill": 3, "sblue": 4, "sboat": 20, "sbody": 19, "sbone": 2, "sbook": 5, "sboth": 2, "sbow": 15, "sbows": 6, "sbox": 3, "sboy": 99, "sbrim": 2, "sbrow": 6, "sbuff": 3, "sbun": 2, "sbusy": 2, "sbut": 36, "sby": 2, "scalf": 2, "scall": 5, "scalm": 5, "scamp": 2, "scan": 3, "scand": 2, "scap": 4, "scapd": 3, "scaps": 2, "scard": 3, "scare": 8, "scari": 2, "scart": 2, "scase": 6, "scast": 3, "scat": 3, "scell": 3, "sclam": 2, "sclay": 2, "sclub": 3, "scoat": 8, "scock": 3, "scold": 5, "scolt": 4, "scome": 12, "scook": 2, "scool": 2, "scord": 2, "scost": 2, "scot": 2, "screw": 19, "scrib": 2, "scrow": 3, "scry": 4, "scup": 5, "scure": 2, "scut": 2, "sdak": 2, "sdale": 3, "sdana": 2, "sdark": 6, "sday": 7, "sdays": 7, "sdead": 7, "sdeaf": 2, "sdear": 2, "sdeck": 9, "sdeep": 3, "sdept": 2, "sdesk": 5, "sdid": 4, "sdire": 2, "sdo": 2, "sdoe": 2, "sdog": 5, "sdogs": 2, "sdon": 2, "sdone": 14, "sdoom": 2, "sdoor": 18, "sdown": 3, "sdrop": 2, "sdry": 3, "sdu": 2, "sdue": 5, "sdung": 4, "sduty": 2, "seaa": 14, "seaas": 31, "seaat": 13, "seabe": 3, "seaby": 10, "seago": 2, "seahe": 20, "seai": 24, "seaif": 4, "seain": 30, "seais": 19, "seait": 12, "seald": 6, "seali": 5, "seamd": 2, "seame": 2, "sean": 2, "seano": 3, "seao": 6, "seaof": 60, "seaoh": 2, "seaon": 16, "seaor": 14, "sear": 11, "sears": 9, "seas": 4, "seasa": 2, "sease": 2, "seasi": 6, "seaso": 15, "seasy": 5, "seata": 3, "seati": 4, "seato": 25, "seawe": 5, "seax": 2, "seaye": 2, "sebon": 2, "seca": 7, "secin": 3, "secof": 3, "sedge": 8, "sedhe": 2, "sedin": 2, "seea": 96, "seean": 10, "seeas": 16, "seeat": 15, "seeby": 7, "seeda": 2, "seedi": 4, "seedo": 2, "seeds": 2, "seeem": 3, "seehe": 25, "seei": 51, "seeif": 59, "seeim": 2, "seein": 44, "seeis": 10, "seeit": 142, "seeka": 12, "seeki": 3, "seela": 2, "seels": 2, "seema": 13, "seemd": 11, "seeme": 57, "seemi": 4, "seemr": 11, "seemy": 58, "seena": 59, "seeni": 8, "seeno": 39, "seeo": 5, "seeof": 4, "seeoh": 2, "seeon": 8, "seeor": 11, "seep": 4, "seepp": 2, "seers": 2, "sees": 2, "seesa": 4, "seesk": 2, "seeso": 10, "seest": 5, "seet": 2, "seeto": 31, "seeup": 2, "seeus": 15, "seevs": 2, "seewe": 10, "seeye": 13, "segg": 2, "seggs": 4, "sein": 2, "seiri": 2, "seis": 3, "seizd": 7, "selfa": 3, "selfi": 9, "sella": 4, "semma": 2, "sena": 3, "send": 15, "senda": 33, "sendi": 4, "seno": 2, "senta": 36, "senti": 3, "sentr": 2, "seons": 2, "seqc": 2, "serhe": 4, "seri": 4, "sermy": 2, "serud": 6, "servd": 5, "seta": 49, "setan": 9, "setas": 5, "setat": 15, "setby": 16, "setem": 2, "sethe": 2, "seti": 6, "setif": 2, "setin": 69, "setis": 2, "setit": 53, "setme": 29, "setmr": 2, "setmy": 43, "setno": 2, "setof": 86, "seton": 34, "setor": 2, "sets": 2, "setsi": 2, "setso": 3, "setto": 36, "setup": 155, "setus": 3, "setye": 3, "seve": 2, "seven": 3, "sever": 5, "sevil": 3, "sewa": 4, "sewin": 3, "sewon": 2, "sex": 2, "sexas": 5, "sexhe": 2, "sexi": 2, "sexin": 3, "sexis": 7, "sexit": 3, "sexof": 3, "sexon": 2, "sexor": 3, "sexso": 2, "sexto": 3, "seye": 32, "seyes": 70, "seyhe": 2, "seyit": 2, "seyno": 2, "seze": 2, "sezi": 2, "sface": 63, "sfair": 6, "sfall": 2, "sfame": 2, "sfan": 2, "sfar": 2, "sfarm": 3, "sfat": 4, "sfate": 2, "sfear": 3, "sfeet": 17, "sfife": 2, "sfig": 2, "sfine": 4, "sfire": 6, "sfish": 3, "sfit": 3, "sfive": 3, "sfled": 2, "sflye": 2, "sfoal": 2, "sfoes": 2, "sfogg": 2, "sfoil": 3, "sfold": 2, "sfond": 2, "sfood": 4, "sfoot": 8, "sfor": 34, "sford": 2, "sfork": 2, "sfoss": 2, "sfree": 6, "sfrom": 6, "sfull": 6, "sfury": 2, "sgait": 2, "sgarb": 2, "sgasp": 2, "sgate": 17, "sgave": 2, "sget": 3, "sgift": 5, "sgig": 2, "sgo": 8, "sgod": 2, "sgoe": 2, "sgold": 3, "sgone": 15, "sgood": 27, "sgot": 19, "sgray": 2, "sgrey": 2, "sgrim": 2, "shad": 13, "shair": 13, "shalf": 10, "shall": 2, "shamd": 2, "shan": 10, "shand": 95, "shant": 22, "shard": 3, "sharp": 5, "shart": 4, "shas": 2, "shaso": 2, "shat": 20, "shath": 2, "shats": 2, "shaue": 2, "shave": 14, "she": 31, "shea": 6, "sheaa": 2, "shead": 111, "shean": 3, "shear": 6, "sheas": 8, "sheat": 9, "shebe": 29, "sheby": 6, "shed": 7, "sheda": 2, "shedi": 2, "shedo": 6, "shee": 2, "sheel": 9, "shees": 2, "sheet": 2, "shego": 7, "sheha": 5, "shehe": 6, "shei": 25, "sheif": 4, "sheim": 2, "shein": 21, "sheir": 4, "sheis": 370, "sheit": 8, "shell": 18, "shelm": 3, "shelp": 4, "shemi": 2, "shemy": 2, "sheno": 3, "sheo": 2, "sheof": 5, "sheoh": 3, "sheon": 4, "sheor": 2, "sher": 6, "shere": 13, "shero": 2, "shes": 37, "shesa": 4, "sheso": 9, "sheto": 42, "shewa": 5, "shewd": 6, "shewe": 4, "shewi": 2, "sheye": 2, "shh": 2, "shigh": 22, "shim": 3, "shint": 2, "shipa": 4, "shipi": 8, "shipo": 4, "ships": 87, "shis": 18, "shodi": 2, "shoei": 2, "shoes": 2, "shold": 3, "shole": 2, "shome": 4, "shoof": 2, "shook": 3, "shoot": 2, "shopa": 4, "shope": 5, "shopi": 4, "shorn": 4, "shost": 6, "shot": 2, "shota": 4, "shoti": 2, "shour": 2, "show": 4, "showa": 22, "showd": 3, "showh": 2, "showi": 2, "shsh": 2, "shsih": 2, "shtsa": 2, "shue": 2, "shuge": 2, "shuis": 2, "shull": 2, "shum": 2, "shump": 2, "shut": 2, "shuta": 2, "shuti": 2, "shyhe": 2, "shyon": 2, "shyto": 2, "sicka": 2, "sicki": 5, "sidea": 22, "sidei": 18, "sideo": 3, "sif": 7, "sigha": 3, "sighi": 9, "signa": 6, "signd": 5, "signi": 2, "silki": 2, "sill": 3, "sin": 40, "sina": 3, "sinas": 7, "sinbe": 3, "sinby": 9, "sincf": 2, "singa": 9, "singi": 4, "singo": 7, "sinhe": 11, "sini": 4, "sinif": 3, "sinin": 10, "sinis": 15, "sinit": 2, "sinka": 3, "sinki": 2, "sinmy": 2, "sinnd": 3, "sinno": 7, "sino": 2, "sinof": 31, "sinon": 2, "sinor": 3, "sinsi": 5, "sinso": 2, "sinst": 2, "sinto": 15, "sinwe": 4, "sinye": 3, "siona": 3, "sions": 2, "sipof": 2, "sira": 8, "siran": 4, "siras": 8, "sirat": 3, "siray": 2, "sirbe": 3, "sirby": 3, "sirdo": 5, "sire": 3, "sired": 3, "sirex": 2, "sirha": 2, "sirhe": 19, "siri": 66, "sirif": 13, "sirin": 9, "siris": 5, "sirit": 16, "sirmr": 5, "sirmy": 5, "sirno": 3, "siro": 2, "siroh": 8, "siron": 3, "siror": 6, "sirsi": 2, "sirso": 4, "sirt": 4, "sirto": 9, "sirum": 2, "sirup": 2, "sirw": 2, "sirwe": 13, "sis": 14, "sit": 37, "sita": 3, "sitan": 2, "sitas": 3, "sitat": 13, "sitby": 10, "sitea": 2, "sithe": 2, "siti": 2, "sitin": 38, "sitis": 2, "sitit": 3, "siton": 33, "sitor": 2, "sits": 2, "sitsa": 3, "sitso": 3, "sitst": 2, "sitto": 5, "situp": 15, "sitwe": 6, "sitye": 6, "sixat": 2, "sixhe": 4, "sixin": 7, "sixis": 2, "sixit": 2, "sixo": 13, "sixof": 12, "sixon": 4, "sixor": 15, "sixto": 6, "sizd": 2, "sizea": 5, "sizei": 2, "sjack": 2, "sjaw": 10, "sjaws": 2, "sjib": 2, "sjob": 2, "sjoy": 5, "sjoys": 9, "sjust": 12, "skbut": 2, "skdid": 2, "skeel": 2, "skill": 3, "skin": 2, "skina": 2, "skind": 6, "sking": 6, "skini": 3, "skiss": 3, "skite": 3, "sknee": 5, "sknot": 2, "sknow": 2, "skso": 2, "skwas": 2, "skya": 3, "skyah": 2, "skyas": 4, "skyat": 3, "skybe": 2, "skyby": 3, "skyhe": 7, "skyi": 3, "skyin": 13, "skyis": 9, "skyit": 4, "skyo": 2, "skyof": 7, "skyoh": 2, "skyon": 2, "skyor": 5, "skys": 2, "skyso": 5, "skyto": 5, "skyup": 4, "sla": 2, "slad": 2, "slaid": 3, "slake": 2, "slamb": 12, "slamp": 5, "sland": 5, "slane": 2, "slap": 7, "slard": 2, "slast": 17, "slaw": 5, "slaws": 2, "slead": 2, "sleak": 2, "sled": 2, "slee": 4, "sleft": 7, "sleg": 7, "slegs": 2, "slest": 2, "slet": 4, "slewa": 7, "slidi": 2, "slife": 23, "slike": 11, "slima": 3, "sline": 4, "slipa": 2, "slipi": 3, "slips": 6, "slive": 2, "slone": 2, "slong": 8, "slook": 6, "sloom": 3, "slord": 5, "slore": 2, "sloss": 6, "slost": 6, "slot": 4, "sloud": 3, "sloue": 2, "slove": 10, "slowi": 4, "slucy": 2, "slull": 2, "slyun": 2, "sma": 4, "smac": 2, "smacb": 2, "smad": 9, "smade": 4, "smaid": 12, "smaim": 2, "smain": 5, "smake": 6, "sman": 3, "smany": 3, "smap": 2, "smark": 2, "smast": 5, "smaul": 2, "sme": 2, "smead": 2, "smeat": 8, "smen": 10, "smere": 2, "smess": 2, "smid": 2, "smild": 2, "smilk": 5, "smind": 31, "smine": 6, "smiss": 2, "smood": 2, "smore": 16, "smorn": 2, "smost": 7, "smout": 2, "smr": 4, "smrs": 5, "smuch": 2, "smud": 2, "smule": 3, "smute": 2, "smy": 36, "sname": 95, "snapi": 2, "snavy": 2, "snear": 7, "sneck": 15, "snere": 2, "snest": 14, "snew": 4, "snews": 3, "snext": 5, "snigh": 2, "snine": 3, "sno": 73, "snone": 6, "snor": 4, "snose": 5, "snot": 67, "snote": 3, "snow": 8, "snowa": 3, "snowi": 2, "snows": 2, "soa": 18, "soaf": 4, "soago": 3, "soah": 3, "soak": 2, "soall": 27, "soam": 11, "soan": 5, "soand": 98, "soapa": 2, "soapi": 2, "soapt": 3, "soar": 2, "soare": 23, "soart": 3, "soas": 121, "soat": 22, "soath": 2, "soaye": 3, "soba": 2, "sobad": 16, "sobe": 42, "sobi": 3, "sobig": 11, "sobof": 2, "sobru": 4, "sobsi": 2, "sobut": 43, "soby": 24, "socan": 4, "socap": 2, "socas": 2, "soclo": 2, "socry": 2, "sodat": 2, "soday": 2, "sodd": 2, "sodid": 52, "sodim": 2, "sodno": 2, "sodo": 39, "sodoe": 2, "sodof": 2, "sodon": 3, "soeer": 2, "soeg": 2, "soere": 2, "sof": 11, "sofar": 177, "sofat": 7, "sofew": 17, "soff": 3, "sofit": 4, "sofor": 37, "softd": 2, "softi": 2, "sogad": 3, "sogay": 7, "soget": 3, "sogo": 4, "sogod": 12, "soh": 2, "sohad": 13, "soham": 5, "sohas": 5, "sohe": 249, "sohed": 2, "sohee": 2, "soher": 3, "sohis": 11, "sohot": 4, "sohow": 8, "sohum": 2, "soi": 251, "soid": 2, "soif": 22, "soil": 2, "soila": 2, "soild": 4, "soill": 17, "soilo": 2, "soim": 2, "soin": 59, "sois": 75, "soit": 143, "soive": 2, "sojob": 2, "sojoe": 2, "solaw": 2, "sold": 9, "solda": 5, "soldi": 2, "solet": 21, "solov": 2, "solow": 9, "solvd": 2, "solye": 2, "soma": 3, "somac": 2, "somad": 8, "soman": 5, "somay": 6, "somea": 3, "somei": 4, "somel": 3, "someo": 2, "somes": 2, "somr": 8, "somrs": 2, "somy": 22, "son": 11, "sona": 9, "sonas": 10, "sonat": 7, "sonay": 2, "sonbe": 11, "sonby": 9, "sondo": 2, "sone": 15, "sonet": 3, "sonew": 2, "sonf": 2, "songa": 7, "songi": 5, "songo": 7, "sonhe": 22, "soni": 10, "sonif": 11, "sonin": 50, "sonis": 22, "sonit": 4, "sonlo": 2, "sonly": 29, "sonmr": 3, "sonmy": 6, "sono": 12, "sonof": 1683, "sonoh": 2, "sonon": 5, "sonor": 17, "sonot": 5, "sonow": 35, "sons": 31, "sonsa": 3, "sonsi": 5, "sonso": 9, "sonto": 34, "sonwe": 3, "soo": 9, "soodd": 6, "soof": 10, "sooff": 4, "sooft": 6, "sooh": 5, "soold": 7, "soon": 46, "soona": 6, "soone": 12, "sooni": 19, "soor": 6, "sooti": 2, "soour": 11, "soout": 4, "sopen": 5, "sophe": 2, "soppd": 2, "sopto": 2, "sopuh": 2, "soput": 2, "sor": 16, "sorb": 2, "sored": 3, "sorei": 2, "soreo": 2, "sorod": 2, "sorta": 3, "sorti": 6, "sorto": 2, "sorun": 3, "sosad": 10, "sosay": 4, "sosee": 2, "soshe": 95, "soshy": 3, "sosi": 3, "sosir": 6, "sosly": 5, "soso": 17, "sotan": 2, "soth": 2, "sothe": 278, "sotis": 4, "soto": 80, "sotom": 2, "sotoo": 16, "sotop": 2, "sotwo": 3, "soula": 10, "sould": 2, "souli": 28, "soulo": 15, "souls": 12, "soup": 4, "sour": 9, "sout": 6, "sover": 7, "sowa": 3, "sowas": 25, "sowby": 2, "sowe": 59, "sowet": 2, "sowho": 3, "sowhy": 6, "sowin": 2, "sown": 27, "sowna": 2, "sowne": 2, "sowoe": 2, "sows": 2, "sowto": 2, "sowye": 3, "sox": 5, "soxa": 2, "soxit": 2, "soye": 10, "soyes": 5, "soyet": 7, "soyou": 97, "space": 3, "spaid": 2, "spail": 4, "spain": 2, "spale": 2, "spall": 2, "spang": 2, "spanv": 2, "spara": 3, "spard": 2, "spark": 2, "spart": 11, "spast": 5, "spat": 2, "spath": 2, "spaws": 2, "spbig": 2, "speak": 2, "spen": 3, "sphiz": 2, "spi": 2, "spink": 2, "spip": 2, "spipe": 2, "spit": 2, "splan": 3, "splay": 6, "splea": 2, "spoem": 3, "spond": 10, "spony": 2, "spool": 2, "spose": 3, "spost": 5, "spota": 4, "spoti": 7, "spoz": 13, "sprow": 2, "spthe": 3, "spuns": 2, "sput": 3, "spyem": 2, "spyhe": 4, "spyin": 3, "spyit": 2, "spyo": 2, "spyon": 2, "spyor": 2, "spywe": 2, "sqon": 2, "srace": 2, "srapt": 2, "srat": 2, "sray": 2, "srays": 3, "srdid": 2, "sre": 2, "sreal": 8, "srear": 2, "sred": 5, "sredw": 2, "srest": 3, "srew": 2, "srfeb": 2, "srfor": 2, "srib": 2, "srich": 3, "sride": 2, "srig": 2, "srim": 3, "sring": 6, "srise": 2, "srmar": 3, "srobe": 2, "srod": 5, "sroll": 2, "sroma": 2, "sroom": 19, "sroot": 2, "srope": 2, "srose": 2, "srte": 2, "srthe": 2, "srule": 6, "srun": 4, "ssack": 2, "ssafe": 2, "ssaid": 7, "ssail": 2, "ssake": 144, "ssand": 2, "ssea": 3, "sseat": 6, "ssee": 7, "sseed": 14, "sseem": 2, "sseen": 3, "sseer": 6, "sself": 18, "sshe": 9, "sship": 8, "sshop": 16, "sshot": 3, "sshow": 2, "ssick": 2, "sside": 55, "ssigh": 2, "ssign": 2, "ssilk": 2, "ssims": 2, "ssins": 4, "ssix": 2, "sskin": 5, "ssno": 2, "ssnow": 4, "sso": 23, "ssoil": 2, "ssold": 2, "ssome": 7, "sson": 104, "ssong": 10, "ssons": 53, "ssort": 2, "ssoul": 16, "ssour": 2, "sstay": 3, "sstep": 3, "ssuch": 9, "ssuit": 2, "ssun": 3, "ssure": 3, "ssyme": 2, "sta": 2, "stabd": 2, "stabo": 2, "stail": 12, "staj": 2, "stale": 2, "stalk": 5, "stall": 3, "stand": 6, "stane": 2, "stara": 2, "stard": 3, "staro": 5, "starp": 2, "stat": 3, "statu": 2, "staya": 17, "stayd": 4, "stayi": 6, "stayo": 2, "stbe": 5, "stboy": 3, "stcyr": 2, "stday": 4, "stdid": 2, "stdo": 2, "stea": 2, "stear": 3, "stema": 2, "stemb": 2, "sten": 5, "stent": 8, "stepa": 4, "stepi": 3, "stewa": 2, "stewd": 2, "stext": 2, "stfar": 2, "stfor": 3, "stgo": 2, "sthan": 4, "sthat": 60, "sthe": 265, "sthen": 7, "sthey": 11, "sthim": 3, "sthis": 25, "sthit": 2, "sthow": 2, "sthus": 2, "sthy": 4, "stie": 3, "still": 2, "stime": 21, "stin": 3, "stiny": 2, "stira": 4, "stiri": 2, "stit": 5, "stman": 2, "stme": 6, "stmy": 6, "stnod": 2, "stnot": 9, "stnw": 5, "sto": 38, "stof": 4, "stomb": 2, "stone": 2, "stoo": 18, "stopa": 7, "stopi": 3, "stour": 3, "stoy": 2, "strai": 3, "strue": 10, "stry": 8, "stse": 2, "stsee": 2, "stshe": 2, "stso": 2, "stst": 2, "stthe": 9, "stthy": 4, "sttis": 2, "stto": 5, "stub": 2, "stuna": 2, "sturn": 8, "stwag": 2, "stwas": 2, "stwe": 3, "stwo": 10, "sty": 2, "styet": 2, "stype": 2, "sucha": 1088, "suchi": 7, "suckd": 3, "suckt": 2, "sueon": 3, "sueus": 2, "suita": 4, "sumi": 2, "sumin": 3, "sumis": 4, "sumit": 2, "summd": 4, "summy": 2, "sumof": 53, "sumon": 2, "sumup": 3, "sumwe": 2, "suna": 5, "sunah": 2, "sunas": 7, "sunat": 9, "sunbe": 7, "sunby": 2, "sundo": 2, "sunga": 4, "sungo": 4, "sunhe": 8, "sunho": 2, "suni": 11, "sunif": 4, "sunin": 18, "sunis": 21, "sunit": 4, "sunka": 2, "sunmy": 2, "sunnd": 2, "sunno": 2, "suno": 2, "sunof": 11, "sunoh": 2, "sunon": 8, "sunor": 10, "sunp": 4, "suns": 16, "sunsi": 3, "sunso": 6, "sunto": 15, "sunup": 2, "sunwe": 2, "sup": 2, "supas": 2, "supof": 2, "supon": 2, "supup": 2, "surea": 9, "surei": 121, "surla": 2, "surle": 2, "sus": 2, "suse": 3, "svast": 4, "sveil": 2, "svery": 36, "sview": 2, "svis": 2, "svote": 2, "svpon": 2, "swag": 2, "swait": 2, "swake": 2, "swalk": 2, "swalw": 2, "swama": 3, "swand": 4, "swant": 3, "swaoa": 2, "swar": 2, "sward": 2, "swarm": 2, "swars": 2, "swas": 21, "sway": 15, "swayd": 4, "sways": 4, "swe": 4, "sweb": 3, "swee": 2, "sweek": 2, "swell": 15, "swere": 10, "swhat": 28, "swhen": 5, "swho": 10, "swhy": 8, "swick": 2, "swide": 5, "swife": 93, "swig": 3, "swild": 2, "swill": 12, "swimi": 2, "swind": 2, "swine": 2, "swing": 3, "swise": 2, "swish": 3, "swit": 2, "swith": 3, "swoe": 4, "swoes": 2, "swomb": 17, "sword": 10, "swork": 37, "swth": 2, "sxto": 2, "syard": 3, "sye": 2, "syes": 2, "syet": 4, "symea": 3, "symei": 21, "symes": 32, "syou": 3, "syour": 29, "sywwe": 2, "table": 2, "tackd": 2, "taen": 2, "taf": 2, "tagin": 2, "tagof": 2, "tagor": 2, "taila": 6, "taild": 4, "taili": 2, "takea": 160, "takei": 5, "taket": 2, "takey": 2, "talbi": 9, "talbo": 3, "talea": 2, "talka": 7, "talkd": 4, "talki": 6, "tall": 3, "talli": 2, "tamea": 2, "tamo": 3, "tan": 5, "tand": 23, "tanhe": 2, "tannd": 4, "tanor": 2, "tany": 7, "tapat": 4, "tapin": 2, "tapof": 4, "tapon": 4, "tapto": 3, "taras": 2, "tarin": 2, "taron": 2, "tarta": 2, "tas": 4, "task": 5, "taska": 3, "taski": 3, "tator": 2, "tatso": 2, "tauti": 2, "tave": 2, "taxa": 2, "taxat": 3, "taxby": 3, "taxi": 2, "taxif": 3, "taxin": 5, "taxis": 5, "taxit": 2, "taxof": 3, "taxon": 8, "taxor": 2, "taxto": 4, "tbad": 2, "tban": 2, "tbawl": 2, "tbe": 128, "tbear": 8, "tbeat": 2, "tbeen": 9, "tbite": 2, "tblow": 2, "tbt": 2, "tbut": 7, "tbuy": 2, "tby": 3, "tcall": 4, "tcame": 2, "tcare": 13, "tchop": 3, "tclap": 2, "tclo": 3, "tcome": 12, "tcook": 2, "tcry": 3, "tcut": 5, "tdare": 5, "tday": 3, "tdeny": 4, "tdid": 2, "tdo": 42, "tdon": 5, "tdone": 2, "tdost": 2, "tdraw": 3, "teaa": 2, "teaas": 3, "teaat": 4, "teaby": 3, "teahe": 2, "teai": 2, "teaif": 2, "teain": 2, "teais": 2, "teait": 3, "teaki": 2, "teama": 2, "teami": 2, "teamr": 3, "teaof": 2, "teaoh": 2, "teaor": 2, "teara": 2, "teat": 2, "teato": 2, "teebe": 2, "teehe": 2, "tein": 2, "tella": 22, "telli": 7, "tena": 2, "tenam": 2, "tenas": 2, "teni": 2, "tenin": 6, "tenis": 3, "tenmr": 2, "teno": 6, "tenof": 11, "tenon": 2, "tenor": 14, "tens": 2, "tenta": 3, "tenti": 3, "tento": 11, "tenwe": 2, "testa": 3, "teste": 2, "testi": 2, "tetea": 8, "teven": 6, "tever": 2, "texas": 2, "texti": 2, "tfar": 2, "tfeel": 2, "tfind": 11, "tfine": 2, "tfit": 4, "tfoh": 2, "tfool": 3, "tfor": 9, "tfrom": 3, "tget": 31, "tgive": 11, "tgo": 25, "tgone": 3, "tgood": 3, "tgot": 21, "tgr": 2, "tgrow": 3, "tha": 3, "thad": 3, "thalf": 3, "tham": 4, "thana": 257, "thand": 16, "thani": 152, "thank": 2, "thanl": 3, "thanr": 2, "thanv": 2, "tharm": 2, "thart": 3, "thas": 6, "that": 2, "thata": 434, "thatb": 2, "thatc": 2, "thatd": 2, "thate": 2, "thati": 1796, "thatl": 3, "thatn": 3, "thato": 4, "thatp": 2, "thats": 372, "thatt": 2, "thatu": 2, "thaue": 3, "thave": 44, "thawd": 2, "thboy": 5, "thby": 3, "thcav": 2, "thcut": 2, "thday": 12, "the": 31, "thea": 6, "theaa": 2, "theab": 3, "thead": 3, "theaf": 39, "theaj": 18, "theam": 3, "thean": 2, "thear": 7, "theas": 7, "theat": 2, "theax": 2, "theaz": 2, "theb": 18, "thebe": 2, "thebh": 2, "theby": 6, "thec": 7, "thecd": 2, "thecm": 5, "theco": 2, "thed": 11, "theda": 5, "thedc": 2, "thede": 6, "thedo": 3, "thedr": 2, "thedu": 3, "thee": 4, "theea": 102, "theei": 93, "theel": 4, "theeo": 137, "theet": 3, "theex": 5, "thef": 4, "thefm": 2, "theft": 2, "theg": 2, "thege": 2, "thego": 9, "theh": 3, "thehe": 11, "thehp": 2, "thehr": 5, "thei": 5, "theie": 2, "thein": 9, "theiq": 2, "theis": 3, "thej": 2, "thek": 2, "theku": 2, "thel": 4, "thela": 3, "thelb": 3, "theli": 2, "thell": 2, "thelo": 23, "thelp": 16, "thels": 2, "them": 4, "thema": 120, "themc": 2, "themd": 2, "theme": 4, "themi": 200, "theml": 2, "themm": 3, "themo": 19, "themp": 2, "themr": 11, "thems": 2, "themt": 2, "themv": 2, "themy": 2, "then": 2, "thena": 57, "thend": 8, "thenf": 2, "theni": 279, "theno": 12, "thenu": 2, "thenv": 2, "theo": 5, "theof": 2, "theoh": 4, "theon": 2, "theop": 2, "theor": 2, "theox": 22, "thep": 3, "thepm": 4, "thepo": 3, "theps": 2, "ther": 4, "therd": 4, "there": 6, "therf": 2, "therh": 2, "thers": 3, "thes": 48, "theso": 4, "thesq": 2, "thess": 3, "thest": 28, "thet": 9, "theth": 104, "theto": 4, "thetr": 5, "thetv": 8, "theu": 43, "theun": 45, "theup": 3, "theus": 87, "thev": 2, "theva": 4, "thex": 5, "they": 2, "theya": 3, "theyd": 9, "theyf": 3, "theyi": 13, "theyl": 4, "thez": 3, "thfor": 2, "thhe": 4, "thher": 2, "thi": 3, "thina": 2, "this": 3, "thisa": 34, "thisd": 2, "thise": 2, "thisi": 113, "thiso": 12, "thit": 2, "thlay": 4, "thman": 2, "thmid": 2, "thof": 13, "thoit": 2, "thold": 5, "thon": 2, "thor": 6, "thoua": 23, "thoui": 4, "thouo": 56, "thrua": 2, "thso": 2, "thst": 3, "thsun": 2, "thtee": 2, "thter": 2, "thth": 3, "ththe": 6, "thto": 5, "thult": 2, "thurt": 5, "thus": 2, "thusa": 11, "thusd": 2, "thusf": 2, "thusi": 24, "thuso": 5, "thust": 2, "thyet": 2, "thyso": 3, "ticki": 2, "tie": 2, "tiea": 4, "tieat": 2, "tieda": 7, "tieem": 2, "tiehe": 4, "tiein": 4, "tieit": 3, "tieme": 2, "tieno": 2, "tiesa": 2, "tieso": 2, "tieup": 4, "tiewe": 2, "tif": 8, "tilit": 2, "tilla": 14, "tilld": 2, "tilli": 81, "tillo": 2, "timea": 47, "timei": 118, "timeo": 8, "timeq": 2, "times": 6, "timi": 2, "timis": 3, "tin": 10, "tinki": 2, "tinof": 4, "tinor": 2, "tinto": 2, "tipaf": 2, "tipas": 2, "tipi": 2, "tipof": 24, "tipus": 2, "tis": 10, "tisa": 21, "tisan": 5, "tisas": 2, "tisee": 2, "tisin": 4, "tisit": 2, "tismy": 4, "tisno": 4, "tisso": 6, "tisto": 2, "tit": 31, "titi": 2, "tjump": 2, "tjust": 2, "tkast": 2, "tkeep": 17, "tkick": 2, "tkill": 2, "tkin": 2, "tknow": 148, "tlady": 2, "tlaer": 2, "tlast": 2, "tlet": 32, "tlie": 2, "tlift": 2, "tlike": 34, "tliue": 2, "tlive": 2, "tlock": 2, "tlook": 12, "tlose": 2, "tlove": 3, "tmacb": 3, "tmake": 19, "tmalc": 2, "tmay": 2, "tme": 2, "tmean": 24, "tmind": 25, "tmine": 2, "tmiss": 3, "tmore": 2, "tmove": 5, "tmr": 2, "tmuch": 7, "tmust": 3, "tmy": 6, "tmyou": 2, "tname": 2, "tneed": 2, "tnice": 2, "tno": 2, "tnor": 6, "tnot": 6, "tnow": 3, "tntor": 2, "tntto": 3, "toa": 1276, "toact": 57, "toad": 2, "toadc": 2, "toadd": 46, "toaf": 25, "toage": 2, "toai": 7, "toaid": 16, "toaim": 3, "toain": 2, "toair": 6, "toaj": 7, "toal": 2, "toall": 485, "toan": 211, "toand": 133, "toani": 2, "toann": 3, "toany": 190, "toare": 3, "toarm": 2, "toart": 4, "toas": 36, "toasa": 4, "toask": 163, "toasw": 2, "toat": 14, "toatm": 2, "toaux": 2, "toawe": 3, "toaye": 2, "toaz": 2, "tobab": 2, "tobad": 3, "toban": 2, "tobar": 3, "tobat": 6, "tobay": 3, "tobc": 3, "tobe": 5188, "tobed": 98, "tobee": 4, "tobeg": 15, "toben": 3, "tobet": 3, "tobid": 10, "tobig": 4, "tobit": 2, "tobob": 4, "tobow": 11, "tobox": 11, "tobud": 3, "tobut": 26, "tobuy": 100, "tobw": 2, "toby": 24, "tobye": 2, "toc": 6, "tocan": 4, "tocap": 2, "tocm": 8, "tocod": 2, "tocox": 2, "tocry": 27, "tocup": 2, "tocut": 77, "todad": 2, "todan": 4, "todat": 3, "today": 267, "todds": 6, "tode": 6, "todel": 2, "todew": 2, "todid": 2, "todie": 78, "todig": 6, "todip": 4, "todo": 1144, "todoe": 8, "todoo": 4, "todr": 13, "todry": 16, "todu": 5, "todye": 7, "toe": 3, "toear": 4, "toeat": 186, "toebb": 2, "toeg": 2, "toei": 3, "toein": 3, "toeke": 2, "toel": 2, "toeli": 4, "toem": 8, "toend": 41, "toeof": 10, "toeoh": 2, "toeq": 2, "toer": 2, "toerr": 12, "toesa": 2, "toeve": 9, "toeye": 5, "tof": 4, "tofan": 4, "tofar": 4, "tofat": 2, "tofee": 2, "tofew": 3, "toff": 2, "tofit": 26, "tofix": 21, "tofly": 26, "tofor": 16, "toft": 3, "togag": 2, "togas": 2, "togay": 2, "toget": 520, "togm": 2, "togo": 701, "togod": 118, "togoe": 2, "togop": 2, "togun": 5, "togur": 2, "toh": 6, "toha": 2, "tohad": 3, "tohal": 4, "tohas": 2, "tohat": 2, "tohe": 19, "tohem": 2, "tohen": 2, "toher": 990, "tohew": 5, "tohez": 2, "tohim": 1094, "tohis": 1354, "tohit": 17, "tohms": 2, "tohop": 3, "tohot": 4, "tohow": 16, "tohub": 2, "tohug": 3, "tohuh": 2, "toi": 26, "toice": 3, "toif": 6, "toild": 3, "toill": 2, "toin": 27, "tois": 6, "toit": 350, "toits": 128, "toive": 2, "toj": 2, "tojam": 3, "tojaw": 2, "tojem": 5, "tojet": 2, "tojig": 2, "tojoy": 3, "tokc": 2, "token": 2, "tokey": 3, "tokid": 3, "tokir": 2, "tolas": 2, "tolaw": 12, "tolay": 60, "tolb": 4, "tolda": 13, "toldi": 2, "toleo": 2, "tolet": 160, "tolew": 2, "tolie": 47, "tolip": 2, "tolob": 2, "tolop": 2, "tolos": 2, "tolow": 3, "tolt": 2, "tolug": 3, "toluz": 3, "toly": 2, "tolye": 4, "tom": 2, "toma": 2, "tomad": 2, "tomae": 2, "toman": 26, "tomar": 2, "tomat": 2, "tomay": 4, "tomba": 3, "tombf": 2, "tombg": 2, "tomdo": 2, "tome": 1095, "tomee": 2, "tomen": 38, "tomg": 3, "tomgl": 3, "tomi": 3, "tomid": 2, "tomif": 2, "tomil": 2, "tomin": 3, "tomit": 2, "tomix": 17, "toml": 2, "tomme": 2, "tomno": 2, "tomof": 2, "tomop": 2, "tomr": 144, "tomrs": 124, "tomud": 3, "tomy": 456, "ton": 6, "tonab": 2, "tonas": 2, "tonc": 2, "tonce": 2, "tone": 5, "tonei": 13, "tonew": 48, "tonhe": 2, "tonip": 2, "tono": 51, "tonob": 3, "tonod": 4, "tonof": 5, "tonot": 5, "tonow": 14, "tonsa": 2, "tonto": 2, "too": 2, "tooa": 9, "tooak": 2, "tooam": 7, "tooan": 5, "tooas": 13, "tooat": 5, "tooby": 6, "tooct": 3, "toodo": 2, "toof": 8, "toog": 3, "toogo": 3, "tooh": 3, "toohe": 20, "tooi": 32, "tooif": 13, "tooin": 14, "toois": 20, "tooit": 20, "tooka": 121, "tooki": 2, "toold": 19, "toomr": 4, "toomy": 3, "toon": 8, "toone": 166, "toono": 2, "tooo": 3, "tooof": 11, "toooh": 4, "tooon": 4, "tooor": 3, "toor": 15, "toore": 2, "tooro": 2, "tooso": 6, "toot": 10, "tooto": 9, "tooup": 2, "toour": 183, "toout": 2, "toowe": 6, "toown": 18, "top": 3, "topa": 4, "topad": 2, "topak": 2, "topan": 5, "topas": 3, "topat": 3, "topaw": 2, "topay": 153, "topby": 4, "topdo": 2, "topeh": 2, "topen": 2, "toper": 18, "tophe": 5, "topi": 3, "topin": 6, "topip": 4, "topis": 4, "topit": 4, "toply": 2, "topm": 8, "topoe": 2, "topof": 261, "topon": 2, "topop": 2, "topor": 4, "topot": 2, "topry": 12, "topsi": 2, "topsl": 2, "topso": 2, "topto": 12, "toput": 211, "toq": 6, "tor": 2, "toram": 3, "tore": 7, "torea": 2, "tored": 6, "torid": 3, "torig": 3, "torob": 6, "torot": 4, "torow": 2, "torub": 4, "torun": 84, "tos": 2, "tosam": 4, "tosan": 6, "tosay": 700, "tosea": 44, "tosee": 981, "tosen": 2, "toset": 129, "tosew": 8, "tosex": 3, "toshe": 10, "toshy": 2, "tosin": 34, "tosir": 22, "tosit": 107, "tosix": 7, "toso": 19, "tosow": 7, "tospy": 16, "tossa": 3, "tossd": 4, "tost": 11, "tosue": 9, "tosum": 3, "tosun": 2, "tosup": 4, "tot": 4, "totap": 4, "totax": 3, "totea": 6, "toten": 6, "toth": 18, "tothe": 8928, "tothy": 178, "totie": 8, "totip": 2, "toto": 18, "totoe": 6, "totom": 2, "totoo": 4, "totop": 4, "totow": 2, "totry": 97, "totwo": 23, "tou": 2, "toup": 2, "tour": 2, "tous": 185, "touse": 113, "tout": 2, "tova": 2, "tover": 2, "tovex": 6, "tovow": 3, "tovs": 10, "tovse": 4, "tow": 3, "towar": 44, "towas": 7, "towax": 4, "towd": 2, "towe": 3, "towed": 3, "towet": 5, "towho": 7, "towhy": 8, "towin": 48, "towis": 2, "towit": 26, "towna": 6, "townc": 2, "towni": 13, "towoe": 2, "towof": 2, "towoo": 3, "towto": 2, "towtv": 2, "toyaw": 2, "toyd": 2, "toye": 17, "toyes": 4, "toyet": 3, "toyhe": 2, "toyin": 2, "toyof": 2, "toyon": 3, "toyou": 650, "toz": 2, "tozen": 2, "tozg": 3, "tozin": 3, "tozip": 2, "tpalm": 2, "tpay": 5, "tpick": 2, "tplus": 2, "tpol": 3, "tpoor": 2, "tpull": 2, "tput": 6, "traya": 2, "tread": 4, "treea": 10, "treeh": 2, "treei": 6, "trigi": 2, "tripi": 3, "trota": 2, "troyn": 2, "truea": 6, "truei": 15, "trueo": 3, "trule": 2, "trun": 6, "trya": 3, "tryan": 2, "tryas": 3, "tryem": 4, "tryi": 2, "tryif": 5, "tryin": 3, "tryit": 22, "tryme": 4, "trymy": 8, "tryto": 142, "tryus": 2, "tsaid": 14, "tsay": 25, "tsee": 48, "tseem": 16, "tseen": 6, "tsell": 6, "tsend": 4, "tset": 2, "tshas": 2, "tshe": 4, "tshif": 2, "tshin": 4, "tshis": 2, "tshor": 2, "tshow": 6, "tshut": 2, "tsick": 2, "tsign": 2, "tsir": 2, "tsit": 2, "tso": 6, "tsome": 2, "tstay": 14, "tstop": 7, "tsuit": 3, "tsup": 2, "tsure": 2, "tswim": 2, "tsyme": 2, "ttake": 27, "ttalk": 20, "ttell": 21, "ttest": 2, "tth": 2, "tthat": 18, "tthe": 37, "tthen": 13, "tthey": 6, "tthis": 2, "tthou": 2, "tthus": 4, "ttie": 3, "ttime": 2, "ttis": 2, "tto": 12, "ttry": 4, "ttthe": 2, "tturn": 4, "tuba": 2, "tubaf": 2, "tubhe": 2, "tubis": 2, "tubon": 2, "tubso": 2, "tuckd": 2, "tugat": 3, "tuggd": 2, "tughe": 2, "tugis": 2, "tugit": 2, "tugof": 2, "tugup": 2, "tuka": 2, "tukit": 2, "tund": 2, "tunei": 3, "tuneo": 2, "tunhe": 2, "tunin": 2, "tunis": 2, "tunof": 5, "tunor": 2, "tup": 2, "tupon": 2, "turfa": 2, "turks": 3, "turna": 9, "turnd": 20, "turni": 6, "turno": 5, "tuse": 4, "tuti": 2, "tvand": 4, "tvery": 4, "tvshe": 2, "tvthe": 2, "tvyou": 2, "twait": 9, "twake": 2, "twalk": 2, "twant": 43, "twasa": 5, "twash": 2, "twe": 6, "twear": 3, "twell": 5, "twhat": 5, "twhen": 3, "twhom": 3, "twhy": 2, "twill": 3, "twish": 8, "twith": 6, "twoa": 5, "twoaf": 2, "twoas": 6, "twoat": 8, "twob": 2, "twobe": 3, "twodo": 4, "twof": 2, "twohe": 10, "twoi": 8, "twoif": 2, "twoin": 21, "twois": 5, "twoit": 4, "twomr": 2, "twono": 2, "twoo": 5, "twoof": 134, "twoon": 6, "twoor": 129, "twopm": 2, "twork": 3, "twos": 2, "twoso": 5, "twoto": 23, "twoun": 2, "twowe": 4, "txtor": 2, "tye": 19, "tyet": 2, "tyou": 187, "tyour": 4, "typea": 2, "typeb": 2, "typei": 2, "tyrea": 2, "uhhuh": 3, "uhmr": 2, "uin": 3, "uis": 2, "ukhad": 2, "ultas": 2, "umgo": 2, "umi": 2, "umm": 6, "umthe": 2, "umum": 8, "umund": 2, "umwe": 2, "unand": 4, "unby": 2, "undid": 2, "unfor": 2, "uni": 2, "unif": 2, "unin": 2, "unis": 4, "unita": 3, "unitu": 2, "unoff": 2, "unor": 2, "unto": 4, "untoa": 68, "unuse": 2, "upa": 243, "upaf": 2, "upah": 2, "upair": 2, "upall": 57, "upan": 35, "upand": 683, "upany": 16, "upare": 2, "uparm": 2, "upart": 2, "upas": 82, "upat": 93, "upbe": 3, "upbig": 2, "upbut": 35, "upby": 92, "upcdc": 2, "upcry": 2, "upde": 2, "updo": 4, "upeat": 2, "upfar": 2, "upfer": 2, "upfor": 158, "upget": 2, "uphad": 5, "uphe": 55, "upher": 64, "uphes": 3, "uphim": 5, "uphis": 240, "uphow": 5, "upi": 34, "upif": 10, "upill": 3, "upin": 375, "upis": 7, "upit": 27, "upits": 14, "upive": 2, "upled": 3, "uplet": 6, "upmen": 4, "upmr": 4, "upmrs": 2, "upmy": 63, "upnew": 5, "upno": 9, "upnor": 12, "upnot": 3, "upnow": 16, "upo": 10, "upof": 58, "upoff": 2, "upoh": 3, "upold": 5, "upon": 98, "upona": 156, "upone": 28, "uponi": 3, "upor": 25, "upour": 13, "upout": 89, "upper": 5, "upput": 2, "upran": 2, "uprow": 2, "upsal": 2, "upsaw": 4, "upsay": 3, "upsea": 2, "upshe": 15, "upsin": 3, "upso": 27, "upsub": 2, "upten": 5, "upthe": 791, "upthy": 46, "upto": 705, "uptoo": 6, "uptwo": 8, "upup": 5, "upus": 3, "upwas": 8, "upwe": 7, "upwho": 5, "upwhy": 3, "upwoe": 2, "upye": 7, "upyea": 2, "upyes": 2, "upyet": 8, "upyou": 12, "urgea": 3, "urna": 2, "urnof": 2, "urof": 6, "usa": 85, "usact": 2, "usadd": 2, "usaid": 5, "usair": 3, "usall": 91, "usan": 13, "usand": 279, "usani": 2, "usany": 9, "usare": 9, "usas": 50, "usask": 2, "usat": 24, "usaye": 2, "usbe": 18, "usbut": 61, "usbuy": 2, "usby": 23, "uscan": 6, "uscis": 2, "uscop": 2, "uscut": 5, "usd": 4, "usday": 2, "usdid": 5, "usdie": 3, "usdo": 13, "usdon": 3, "usdr": 3, "usdry": 2, "usea": 22, "usean": 7, "useas": 4, "useat": 10, "useby": 6, "useda": 18, "usedi": 4, "useem": 2, "usehe": 4, "usei": 6, "useif": 2, "usein": 44, "useis": 8, "useit": 35, "useme": 3, "usemr": 2, "usemy": 3, "usend": 2, "useo": 2, "useof": 268, "useon": 10, "useor": 5, "usesa": 5, "useso": 4, "useto": 50, "useup": 2, "useye": 2, "usfly": 4, "usfor": 107, "usg": 2, "usget": 5, "usgo": 63, "usgod": 5, "ushad": 4, "ushas": 8, "ushe": 38, "usher": 2, "ushis": 10, "ushoe": 2, "ushow": 20, "usi": 39, "usif": 26, "usin": 110, "usis": 28, "usit": 27, "usits": 5, "usjoy": 2, "usla": 2, "uslag": 2, "uslay": 3, "uslet": 10, "uslo": 2, "usmad": 2, "usman": 2, "usmay": 3, "usmen": 2, "usmr": 3, "usmrs": 3, "usmy": 11, "usno": 14, "usnor": 6, "usnot": 47, "usnow": 29, "uso": 14, "usof": 32, "usoff": 8, "usoft": 2, "usoh": 5, "usold": 3, "uson": 12, "usone": 9, "usor": 19, "usour": 16, "usout": 37, "usput": 6, "usrun": 2, "ussaw": 2, "ussay": 10, "ussee": 25, "usset": 3, "usshe": 5, "ussir": 5, "ussit": 2, "usso": 23, "ussri": 2, "ustax": 2, "usten": 2, "usthe": 94, "usthy": 5, "usto": 182, "ustoo": 5, "ustry": 7, "ustwo": 10, "usu": 2, "usup": 28, "uswas": 9, "uswe": 54, "uswho": 34, "uswhy": 6, "uswoe": 3, "uswow": 2, "usye": 6, "usyea": 3, "usyes": 2, "usyet": 6, "usyou": 16, "uwas": 2, "uzand": 6, "uzthe": 2, "vaina": 4, "vaini": 4, "vaino": 3, "vand": 4, "vande": 3, "vanea": 2, "vanei": 2, "vani": 2, "vanof": 2, "vanon": 2, "vanwe": 2, "vare": 2, "varmy": 2, "varno": 2, "varso": 2, "vasan": 3, "vasei": 2, "vasta": 3, "vasti": 2, "vat": 2, "vathe": 2, "vawe": 2, "vbe": 4, "vby": 2, "vcan": 2, "vea": 19, "veall": 4, "veany": 2, "vecut": 3, "vedug": 2, "vegot": 38, "vehad": 6, "vehit": 2, "veild": 10, "veina": 2, "veind": 2, "vemet": 4, "vemy": 2, "veno": 20, "venot": 5, "verya": 2, "veryi": 5, "veset": 2, "veso": 2, "vethe": 2, "vexa": 2, "vexd": 2, "vexit": 2, "vexme": 8, "vexmy": 2, "vexus": 2, "veyld": 2, "vfor": 3, "viaa": 2, "viad": 6, "viade": 2, "viadi": 5, "viaim": 2, "viall": 2, "viamr": 2, "viewa": 5, "viewd": 2, "viewi": 6, "viia": 2, "viiat": 2, "viiby": 2, "viihe": 2, "vilea": 4, "vin": 2, "vinaa": 2, "vipig": 2, "vis": 3, "visa": 3, "vithe": 6, "viwho": 2, "vizin": 2, "vnow": 2, "vntoa": 3, "vof": 3, "voidi": 2, "voleo": 2, "volhe": 2, "voli": 2, "volix": 3, "votea": 3, "votei": 3, "vover": 3, "vowa": 6, "vowbe": 2, "vowd": 2, "vowi": 2, "vowit": 3, "vowof": 4, "vowon": 2, "vowor": 5, "vpa": 4, "vpand": 12, "vpant": 2, "vpeak": 2, "vpfit": 2, "vpgm": 3, "vpham": 2, "vphe": 2, "vphis": 5, "vpin": 4, "vpit": 2, "vpmy": 9, "vpona": 13, "vponi": 2, "vpons": 4, "vpont": 5, "vpour": 3, "vpth": 2, "vpthe": 14, "vpthy": 3, "vpto": 7, "vpvp": 2, "vpwho": 2, "vrgd": 3, "vrice": 3, "vsa": 6, "vsall": 6, "vsan": 2, "vsand": 6, "vsany": 2, "vsas": 3, "vsat": 2, "vsbe": 6, "vsbru": 2, "vsbut": 2, "vsby": 4, "vscb": 2, "vscd": 2, "vsd": 7, "vsdo": 2, "vseif": 2, "vseme": 2, "vseno": 3, "vseof": 4, "vsetc": 2, "vseto": 3, "vsewe": 2, "vsfor": 3, "vsgo": 2, "vsgoe": 4, "vshad": 2, "vshis": 2, "vsin": 3, "vsis": 2, "vslet": 3, "vsmad": 2, "vsmed": 2, "vsnot": 7, "vsnow": 2, "vso": 3, "vsof": 3, "vsone": 2, "vsour": 2, "vsput": 2, "vssey": 2, "vssir": 2, "vsso": 3, "vsthe": 5, "vsto": 11, "vstoo": 2, "vsuch": 2, "vsvse": 2, "vswas": 2, "vswe": 2, "vswho": 2, "vsyet": 2, "vthe": 7, "vthen": 2, "vthis": 2, "vuein": 2, "vueis": 2, "vueor": 2, "vumit": 2, "vwe": 3, "vwith": 2, "waca": 2, "wadme": 2, "wadof": 3, "wagd": 2, "wagea": 2, "wagmy": 2, "wagqu": 2, "wahee": 2, "waita": 23, "waiti": 9, "waito": 2, "wakea": 2, "wakei": 2, "walka": 7, "walkd": 20, "walki": 8, "walko": 2, "walla": 2, "walld": 2, "walli": 6, "wallt": 2, "wand": 3, "wandi": 2, "wanta": 38, "wanti": 6, "wara": 9, "waran": 2, "waras": 9, "warat": 10, "warax": 2, "warbe": 4, "warby": 6, "warhe": 18, "wari": 11, "warif": 6, "warim": 2, "warin": 40, "waris": 18, "warit": 10, "warma": 5, "warmd": 3, "warmi": 2, "warmy": 2, "warnd": 2, "warno": 3, "waro": 4, "warof": 18, "waron": 10, "waror": 9, "wars": 8, "warso": 7, "warst": 2, "warto": 14, "warwe": 8, "warye": 3, "was": 2, "wasa": 2047, "wasaf": 8, "wasam": 2, "wasan": 275, "wasas": 199, "wasat": 253, "wasby": 95, "wasde": 2, "wasdr": 2, "wasdw": 2, "wased": 2, "wasgm": 4, "wasgo": 4, "washa": 2, "washd": 10, "washe": 115, "wasi": 68, "wasid": 3, "wasif": 3, "wasin": 732, "wasis": 4, "wasit": 158, "waslb": 2, "wasm": 2, "wasme": 4, "wasmg": 2, "wasmr": 27, "wasmy": 62, "wasnd": 2, "wasne": 3, "wasno": 462, "wasnt": 59, "waso": 2, "wasof": 151, "wasoh": 5, "wasok": 2, "wason": 151, "wasor": 13, "wasrd": 2, "wasse": 2, "wasso": 372, "wasst": 2, "wast": 10, "wasta": 8, "wasth": 2, "wasto": 565, "wasup": 27, "wasw": 2, "waswe": 6, "waxat": 2, "waxhe": 2, "waxit": 2, "waxor": 2, "waxto": 2, "waya": 27, "wayan": 3, "wayas": 36, "wayat": 14, "waybe": 8, "wayby": 32, "waydo": 6, "waygo": 3, "wayhe": 68, "wayi": 75, "wayif": 7, "wayin": 80, "wayis": 24, "wayit": 31, "waymr": 4, "waymy": 5, "wayno": 6, "wayo": 7, "wayof": 372, "wayoh": 2, "wayon": 4, "wayor": 31, "wayp": 2, "ways": 2, "waysa": 4, "waysi": 9, "wayso": 18, "wayto": 299, "wayuh": 2, "wayup": 25, "waywe": 16, "wayye": 5, "wball": 2, "wdorr": 2, "wea": 4, "weact": 2, "weadd": 4, "weaim": 2, "weaki": 4, "weako": 2, "weall": 89, "wean": 2, "weand": 22, "weany": 9, "weara": 10, "weare": 714, "weart": 2, "weary": 2, "weas": 7, "weask": 7, "weat": 7, "weate": 2, "webbd": 2, "webe": 50, "webeg": 2, "webhe": 3, "webof": 4, "webow": 2, "webto": 2, "webut": 6, "webuy": 3, "weby": 5, "wecan": 216, "wecry": 2, "wecut": 2, "wed": 13, "wedbe": 4, "wedid": 51, "wedie": 15, "wedig": 4, "wedin": 2, "wedo": 156, "wedoe": 4, "wedon": 20, "wedso": 2, "weeat": 8, "weeda": 2, "weeka": 7, "weeki": 15, "weeks": 10, "weel": 36, "weeld": 2, "weele": 3, "weend": 4, "weepa": 3, "weepi": 2, "weere": 2, "weeto": 3, "wefat": 3, "wefew": 2, "wefly": 3, "wefor": 6, "wegat": 2, "weget": 33, "wegit": 2, "wego": 62, "wegod": 3, "wegot": 23, "wehad": 179, "weham": 2, "wehav": 2, "wehid": 3, "wehim": 3, "wehis": 4, "wehow": 2, "wei": 2, "weif": 2, "wein": 24, "weit": 2, "wejoy": 3, "welat": 2, "welay": 8, "weled": 2, "welet": 8, "welie": 4, "well": 51, "wella": 11, "welli": 142, "wello": 4, "wells": 7, "welly": 2, "welmy": 2, "wemay": 228, "wemen": 3, "wemet": 16, "wemy": 2, "weno": 7, "wenor": 3, "wenot": 38, "wenow": 34, "wenta": 27, "wenti": 9, "weof": 10, "weold": 2, "weon": 4, "weor": 6, "weore": 2, "weour": 7, "weout": 2, "weowe": 6, "weown": 4, "wepta": 2, "weput": 9, "weran": 9, "were": 17, "werea": 180, "weree": 2, "wereh": 2, "werei": 23, "werem": 2, "wereo": 2, "weret": 2, "werow": 4, "wert": 3, "werta": 2, "werun": 8, "wesat": 12, "wesaw": 35, "wesay": 44, "wesee": 43, "weset": 10, "wesha": 3, "wesin": 3, "wesit": 7, "wesix": 2, "weso": 5, "westa": 7, "westi": 3, "westo": 2, "weta": 3, "wetas": 3, "wethe": 25, "wethy": 2, "weti": 4, "wetit": 2, "wetmr": 2, "wetmy": 2, "weto": 22, "wetof": 4, "wetoo": 11, "wetry": 6, "wetto": 2, "wetwe": 3, "wetwo": 16, "weuse": 9, "weve": 24, "wevp": 2, "wewar": 2, "wewas": 4, "wewe": 4, "wewho": 12, "wewin": 2, "wewon": 10, "wewot": 4, "wewuh": 2, "weye": 2, "whara": 2, "whata": 224, "whatd": 8, "whati": 462, "whato": 3, "whats": 152, "whena": 190, "whenc": 2, "wheni": 717, "whenr": 2, "whind": 2, "whipa": 2, "whirr": 2, "whoa": 2, "whoam": 18, "whoas": 22, "whoat": 19, "whobe": 2, "whoby": 28, "whod": 3, "whodo": 19, "whoe": 2, "whoee": 2, "whoei": 2, "whogo": 4, "whohe": 26, "whoi": 23, "whoif": 6, "whoin": 75, "whois": 372, "whoit": 24, "whole": 2, "wholl": 4, "whoma": 10, "whomi": 176, "whono": 2, "whoo": 2, "whoof": 9, "whoon": 7, "whoor": 3, "whord": 2, "whos": 46, "whosa": 3, "whoso": 15, "whoto": 16, "whove": 4, "whowe": 3, "whoye": 3, "whya": 12, "whyam": 4, "whyan": 2, "whyas": 8, "whyat": 2, "whybe": 2, "whyby": 4, "whydo": 85, "whydr": 2, "whye": 2, "whyee": 2, "whyer": 2, "whygo": 5, "whyhe": 48, "whyi": 76, "whyif": 7, "whyim": 2, "whyin": 15, "whyis": 36, "whyit": 48, "whyma": 5, "whyme": 2, "whymr": 3, "whymy": 7, "whyno": 4, "whyof": 5, "whyoh": 2, "whyon": 7, "whyor": 3, "whyso": 12, "whyto": 13, "whywe": 15, "wida": 2, "widde": 2, "widea": 8, "widei": 2, "wif": 2, "wifea": 12, "wifei": 14, "wifes": 30, "wighe": 3, "wigi": 2, "wigit": 2, "wigmr": 2, "wigon": 2, "wigor": 2, "wigto": 3, "wilbe": 3, "wilda": 3, "wildo": 2, "willa": 13, "willi": 450, "willo": 8, "wilti": 2, "win": 3, "wina": 10, "winat": 3, "winda": 4, "windi": 6, "windn": 2, "windo": 2, "winds": 4, "winea": 4, "winei": 6, "winga": 2, "wingd": 2, "wingi": 3, "winif": 2, "winin": 3, "winit": 5, "winkd": 2, "winme": 3, "winon": 4, "winor": 5, "winqu": 2, "winsa": 2, "wipd": 3, "wis": 2, "wisea": 4, "wisee": 2, "wisei": 3, "wishd": 4, "wishi": 60, "witan": 2, "witha": 2670, "withc": 2, "withd": 2, "withh": 3, "withi": 15, "withj": 2, "withn": 3, "withp": 2, "withq": 2, "withr": 3, "withs": 2, "witht": 3, "withy": 2, "withz": 2, "witi": 4, "witif": 3, "witin": 4, "witis": 3, "witit": 2, "witof": 6, "wits": 3, "witsi": 2, "witto": 5, "witts": 2, "wkern": 2, "wlay": 2, "wms": 2, "wmsha": 2, "woeas": 2, "woebe": 4, "woehe": 3, "woeif": 2, "woein": 5, "woeis": 14, "woeme": 2, "woeo": 2, "woeoh": 2, "woeon": 2, "woeor": 3, "woeso": 3, "woeto": 40, "wolfi": 2, "womba": 2, "wombi": 4, "wona": 7, "wonan": 4, "wonas": 2, "wonby": 9, "woni": 2, "wonif": 2, "wonin": 3, "wonis": 2, "wonit": 2, "wonme": 2, "wonon": 2, "wonor": 4, "wont": 220, "wonth": 2, "wonti": 2, "wonto": 3, "wooa": 2, "woodi": 3, "wooli": 2, "woot": 5, "worda": 9, "wordi": 45, "words": 4, "worea": 40, "worka": 18, "workd": 4, "worki": 13, "worko": 2, "works": 2, "worma": 2, "wormi": 4, "worna": 6, "wotye": 3, "wrapa": 3, "wrens": 2, "wroos": 2, "wtas": 2, "wto": 2, "wtvin": 2, "wusto": 2, "wuti": 2, "wva": 2, "wws": 2, "wyna": 2, "xand": 2, "xgyro": 3, "xia": 3, "xiias": 2, "xiimr": 2, "xiit": 2, "ximr": 2, "xis": 3, "xithe": 3, "xiva": 3, "xiwho": 2, "xixif": 2, "xmark": 2, "xmean": 2, "xone": 2, "xour": 2, "xray": 2, "xthe": 8, "xva": 2, "xvia": 2, "xviit": 2, "xviof": 2, "xvmr": 2, "xvthe": 3, "xxby": 2, "yais": 5, "yand": 2, "yardi": 2, "yare": 3, "yarni": 2, "yasay": 2, "yaup": 2, "yawnd": 2, "yawni": 2, "yawso": 2, "ybis": 3, "ybit": 2, "ybut": 2, "ycand": 2, "ycare": 2, "ycfor": 2, "ycis": 4, "ycof": 2, "ycthe": 2, "ydin": 2, "yea": 13, "yeaa": 5, "yeaan": 2, "yeaas": 3, "yeabe": 4, "yeado": 2, "yeaha": 2, "yeahe": 19, "yeahi": 4, "yeai": 39, "yeaif": 2, "yeain": 7, "yeais": 2, "yeait": 5, "yeall": 21, "yeamy": 5, "yeand": 65, "yeany": 4, "yeara": 19, "yearb": 2, "yeare": 190, "yeari": 14, "yearo": 2, "years": 9, "yeas": 5, "yeask": 7, "yeaso": 2, "yeat": 4, "yeato": 2, "yeawe": 3, "yeaye": 6, "yebe": 82, "yebut": 9, "yebuy": 4, "yeby": 4, "yecan": 14, "yecup": 2, "yecut": 2, "yed": 2, "yedid": 25, "yedie": 13, "yedig": 2, "yedo": 73, "yedon": 2, "yedry": 2, "yeear": 3, "yeeat": 27, "yeeif": 2, "yefar": 2, "yefly": 2, "yefor": 17, "yeget": 3, "yego": 35, "yegod": 3, "yegoe": 2, "yegot": 2, "yehad": 21, "yehav": 3, "yehe": 9, "yeher": 2, "yehim": 12, "yehis": 8, "yeho": 2, "yehow": 3, "yei": 9, "yeif": 7, "yein": 31, "yeis": 2, "yeit": 7, "yejoy": 2, "yelad": 3, "yelay": 2, "yeled": 2, "yelet": 3, "yell": 4, "yelld": 2, "yelow": 2, "yeman": 4, "yemay": 116, "yeme": 12, "yemen": 20, "yemr": 4, "yemy": 16, "yeno": 4, "yenor": 5, "yenot": 142, "yenow": 28, "yento": 3, "yeo": 5, "yeof": 22, "yeoh": 2, "yeold": 2, "yeon": 7, "yeone": 5, "yeor": 2, "yeour": 2, "yeout": 16, "yepay": 2, "yepip": 2, "yepit": 2, "yeput": 9, "yere": 3, "yerun": 3, "yesa": 7, "yesas": 5, "yesat": 3, "yesaw": 7, "yesay": 62, "yesby": 5, "yesdo": 3, "yesee": 72, "yeset": 3, "yeshe": 43, "yesi": 90, "yesif": 7, "yesim": 4, "yesin": 10, "yesir": 4, "yesis": 2, "yesit": 27, "yesma": 10, "yesmr": 10, "yesmy": 16, "yesno": 5, "yeso": 12, "yesof": 4, "yesoh": 4, "yeson": 2, "yesor": 5, "yesso": 3, "yesto": 6, "yesun": 2, "yeswe": 19, "yeta": 56, "yetam": 4, "yetan": 3, "yetas": 14, "yetat": 10, "yetbe": 24, "yetby": 12, "yetdo": 10, "yetgo": 4, "yethe": 180, "yeti": 100, "yetif": 25, "yetin": 73, "yetis": 20, "yetit": 67, "yetlo": 2, "yetmr": 4, "yetmy": 16, "yetno": 15, "yeto": 37, "yetof": 13, "yetoh": 5, "yeton": 4, "yetor": 3, "yetso": 24, "yetto": 54, "yetup": 2, "yetus": 2, "yetwe": 20, "yetwo": 3, "yetye": 16, "yeup": 16, "yeuse": 4, "yeve": 5, "yevex": 2, "yevow": 2, "yewar": 2, "yewas": 2, "yewe": 4, "yewho": 9, "yewhy": 6, "yewoe": 2, "yeye": 12, "yeyea": 2, "yeyes": 2, "yeyet": 4, "yeyou": 3, "yfcan": 2, "yfis": 4, "yge": 2, "ygis": 2, "yhaue": 2, "yhe": 2, "yinor": 2, "yinso": 2, "yipin": 2, "yjune": 2, "yland": 4, "ylis": 2, "ylof": 2, "ymin": 2, "yoare": 2, "yoat": 2, "yof": 2, "yojes": 2, "yojos": 3, "yokei": 2, "yoof": 2, "yorka": 3, "yorki": 3, "yorkj": 3, "yorkn": 3, "youa": 191, "youah": 2, "youam": 4, "youan": 21, "youas": 118, "youat": 50, "youay": 2, "yoube": 103, "youby": 64, "youd": 64, "youde": 3, "youdo": 253, "youdr": 2, "youee": 2, "youeh": 3, "youer": 2, "yougo": 92, "youha": 2, "youhe": 91, "youi": 336, "youid": 2, "youif": 72, "youim": 4, "youin": 215, "youis": 33, "youit": 75, "youl": 9, "yould": 2, "youle": 2, "youll": 117, "youlo": 4, "youm": 2, "youma": 16, "youme": 6, "youmr": 42, "youmy": 100, "youno": 48, "youo": 52, "youof": 69, "youoh": 15, "youon": 41, "youor": 65, "youqu": 2, "youre": 77, "youri": 2, "yourr": 2, "yours": 11, "youso": 67, "yousr": 2, "youto": 470, "youup": 49, "youve": 52, "youvp": 3, "youwe": 23, "youxi": 2, "youye": 56, "ypany": 2, "yque": 2, "yrdam": 2, "yris": 2, "ysey": 5, "ythe": 3, "ythy": 2, "ytis": 2, "yusei": 2, "zan": 2, "zaxis": 2, "zayto": 2, "zeeor": 2, "zento": 4, "zgand": 8, "zgare": 2, "zgas": 2, "zgat": 3, "zgbe": 2, "zgcan": 2, "zgfor": 2, "zghas": 2, "zgin": 6, "zgis": 4, "zgit": 2, "zgyro": 2, "zingi": 2, "zinin": 3, "zioni": 3, "zions": 2, "zipup": 2, "zooa": 2, "zooas": 2, "zooto": 2, "zqis": 2, "zsohe": 2, "zthat": 2, "zurhe": 2, "zwere": 2, "zwhom": 2}
-             ''')